@@ -0,0 +1,38 @@
+# pylint: skip-file
+
+"""Add the Merkle inclusion proofs of anchored certificates
+
+Revision ID: a8b6c5d7e9f0
+Revises: f7a5b4c6d8e9
+Create Date: 2026-10-17 19:36:08.527193
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a8b6c5d7e9f0"
+down_revision: Union[str, Sequence[str], None] = "f7a5b4c6d8e9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("certificates", sa.Column("merkle_root", sa.String, nullable=True))
+    op.add_column("certificates", sa.Column("merkle_leaf_index", sa.Integer, nullable=True))
+    op.add_column("certificates", sa.Column("merkle_path", postgresql.ARRAY(sa.String), nullable=True))
+    op.add_column("certificates", sa.Column("merkle_epoch_id", sa.String, nullable=True))
+    op.add_column("certificate_issuance_tasks", sa.Column("merkle_root", sa.String, nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("certificate_issuance_tasks", "merkle_root")
+    op.drop_column("certificates", "merkle_epoch_id")
+    op.drop_column("certificates", "merkle_path")
+    op.drop_column("certificates", "merkle_leaf_index")
+    op.drop_column("certificates", "merkle_root")
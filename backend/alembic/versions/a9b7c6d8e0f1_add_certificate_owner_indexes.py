@@ -0,0 +1,33 @@
+# pylint: skip-file
+
+"""Index certificates by product, producer and certifier for keyset pagination
+
+Revision ID: a9b7c6d8e0f1
+Revises: a8b6c5d7e9f0
+Create Date: 2026-10-17 21:06:37.512044
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a9b7c6d8e0f1"
+down_revision: Union[str, Sequence[str], None] = "a8b6c5d7e9f0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+OWNER_COLUMNS = ("product_id", "producer_id", "certifier_id")
+
+
+def upgrade() -> None:
+    # The certificates of an owner are paged by ID: (owner, id) seeks the start of a page and returns it in order,
+    # whatever the number of certificates of that owner or in the table
+    for column in OWNER_COLUMNS:
+        op.create_index(f"ix_certificates_{column}_id", "certificates", [column, "id"])
+
+
+def downgrade() -> None:
+    for column in OWNER_COLUMNS:
+        op.drop_index(f"ix_certificates_{column}_id", table_name="certificates")
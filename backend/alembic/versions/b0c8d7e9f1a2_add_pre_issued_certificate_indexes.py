@@ -0,0 +1,41 @@
+# pylint: skip-file
+
+"""Index the pre-issued certificates with partial indexes
+
+Revision ID: b0c8d7e9f1a2
+Revises: a9b7c6d8e0f1
+Create Date: 2026-10-17 22:14:51.730218
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b0c8d7e9f1a2"
+down_revision: Union[str, Sequence[str], None] = "a9b7c6d8e0f1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match the predicate of SqlCertificateRepository.list_pre_issued for the planner to use the indexes
+PRE_ISSUED = sa.text("status IN ('pre_issued', 'failed')")
+
+
+def upgrade() -> None:
+    # Only the certificates not issued yet are indexed: the indexes stay as small as the pre-certificate queue,
+    # however many certificates were issued
+    op.create_index("ix_certificates_pre_issued_id", "certificates", ["id"], postgresql_where=PRE_ISSUED)
+    op.create_index(
+        "ix_certificates_pre_issued_certifier_id_id",
+        "certificates",
+        ["certifier_id", "id"],
+        postgresql_where=PRE_ISSUED,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_certificates_pre_issued_certifier_id_id", table_name="certificates")
+    op.drop_index("ix_certificates_pre_issued_id", table_name="certificates")
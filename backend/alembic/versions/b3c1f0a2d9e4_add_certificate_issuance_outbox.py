@@ -0,0 +1,76 @@
+# pylint: skip-file
+
+"""Add certificate issuance status and the issuance outbox table
+
+Revision ID: b3c1f0a2d9e4
+Revises: 745091662d3a
+Create Date: 2026-10-17 10:12:41.208315
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b3c1f0a2d9e4"
+down_revision: Union[str, Sequence[str], None] = "745091662d3a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "certificates",
+        sa.Column("status", sa.String(20), nullable=False, server_default="pre_issued"),
+    )
+    op.add_column("certificates", sa.Column("issuance_error", sa.Text, nullable=True))
+    # Certificates recorded before the outbox existed are already on chain
+    op.execute("UPDATE certificates SET status = 'issued' WHERE blockchain_id IS NOT NULL")
+
+    op.create_table(
+        "certificate_issuance_tasks",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("certificate_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("certificates.id"), nullable=False),
+        sa.Column("canonical_hash", sa.String, nullable=False),
+        sa.Column("certifier_address", sa.String, nullable=False),
+        sa.Column("status", sa.String(20), nullable=False),
+        sa.Column("attempts", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("transaction_hash", sa.String, nullable=True),
+        sa.Column("last_error", sa.Text, nullable=True),
+        sa.Column("submitted_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.Column("available_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+    )
+
+    # Workers poll open tasks by status and due date
+    op.create_index(
+        "ix_certificate_issuance_tasks_status_available_at",
+        "certificate_issuance_tasks",
+        ["status", "available_at"],
+    )
+    op.create_index(
+        "ix_certificate_issuance_tasks_certificate_id",
+        "certificate_issuance_tasks",
+        ["certificate_id"],
+    )
+    # At most one open task per certificate, so a certificate is never recorded twice
+    op.create_index(
+        "ux_certificate_issuance_tasks_open_certificate_id",
+        "certificate_issuance_tasks",
+        ["certificate_id"],
+        unique=True,
+        postgresql_where=sa.text("status IN ('pending', 'submitted')"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ux_certificate_issuance_tasks_open_certificate_id", table_name="certificate_issuance_tasks")
+    op.drop_index("ix_certificate_issuance_tasks_certificate_id", table_name="certificate_issuance_tasks")
+    op.drop_index("ix_certificate_issuance_tasks_status_available_at", table_name="certificate_issuance_tasks")
+    op.drop_table("certificate_issuance_tasks")
+    op.drop_column("certificates", "issuance_error")
+    op.drop_column("certificates", "status")
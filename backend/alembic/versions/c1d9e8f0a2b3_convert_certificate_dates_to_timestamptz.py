@@ -0,0 +1,131 @@
+# pylint: skip-file
+
+"""Store the certificate lifecycle dates as timestamptz and index them for range queries
+
+Revision ID: c1d9e8f0a2b3
+Revises: b0c8d7e9f1a2
+Create Date: 2026-10-17 23:41:08.362915
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c1d9e8f0a2b3"
+down_revision: Union[str, Sequence[str], None] = "b0c8d7e9f1a2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+DATE_COLUMNS = ("issued_at", "valid_until", "last_audited_at")
+# Blocks of the table rewritten per backfill statement, each committed on its own (8 MiB with 8 KiB blocks)
+BACKFILL_BLOCKS = 1024
+SYNC_FUNCTION = "certificates_sync_timestamptz_dates"
+SYNC_TRIGGER = "certificates_sync_timestamptz_dates"
+HISTORY_TRIGGER = "certificates_history_trigger"
+# Set by the backfill on its own connection: its updates only fill in derived columns, not history worth keeping
+BACKFILL_SETTING = "certificates.backfill"
+# ISO strings ending with a UTC offset; the others, naive, are taken as UTC as the application always wrote them
+WITH_OFFSET = r"'[0-9]:[0-9]{2}(:[0-9]{2}(\.[0-9]+)?)?(Z|[+-][0-9]{2}(:?[0-9]{2})?)$'"
+
+
+def _to_timestamptz(value: str) -> str:
+    return (
+        f"CASE WHEN NULLIF({value}, '') IS NULL THEN NULL "
+        f"WHEN {value} ~ {WITH_OFFSET} THEN CAST({value} AS timestamptz) "
+        f"ELSE CAST({value} AS timestamp) AT TIME ZONE 'UTC' END"
+    )
+
+
+def _create_history_trigger(when: str = "") -> None:
+    op.execute(f"DROP TRIGGER {HISTORY_TRIGGER} ON certificates")
+    op.execute(
+        f"CREATE TRIGGER {HISTORY_TRIGGER} AFTER INSERT OR UPDATE OR DELETE ON certificates "
+        f"FOR EACH ROW {when}EXECUTE FUNCTION certificates_history_trigger_fn()"
+    )
+
+
+def upgrade() -> None:
+    # The columns are converted online: a new timestamptz column is added next to each text one, kept in step by
+    # a trigger while the existing rows are backfilled a few blocks at a time, and swapped in at the end. Only
+    # the ADD COLUMN and the swap take an exclusive lock, both without rewriting the table
+    for column in DATE_COLUMNS:
+        op.add_column("certificates", sa.Column(f"{column}_tz", sa.DateTime(timezone=True), nullable=True))
+    assignments = "\n".join(f"    NEW.{column}_tz := {_to_timestamptz(f'NEW.{column}')};" for column in DATE_COLUMNS)
+    op.execute(
+        f"CREATE FUNCTION {SYNC_FUNCTION}() RETURNS trigger LANGUAGE plpgsql AS $$\n"
+        f"BEGIN\n{assignments}\n    RETURN NEW;\nEND;\n$$"
+    )
+    op.execute(
+        f"CREATE TRIGGER {SYNC_TRIGGER} BEFORE INSERT OR UPDATE ON certificates "
+        f"FOR EACH ROW EXECUTE FUNCTION {SYNC_FUNCTION}()"
+    )
+    _create_history_trigger(f"WHEN (current_setting('{BACKFILL_SETTING}', true) IS DISTINCT FROM 'on') ")
+
+    with op.get_context().autocommit_block():
+        # Every write from now on goes through the trigger: only the rows written before need a backfill, a
+        # no-op update for the trigger to fill their new columns in
+        pending = " OR ".join(f"({column} IS NOT NULL AND {column}_tz IS NULL)" for column in DATE_COLUMNS)
+        backfill = f"UPDATE certificates SET issued_at = issued_at WHERE ({pending})"
+        op.execute(f"SET {BACKFILL_SETTING} = 'on'")
+        if op.get_context().as_sql:
+            op.execute(backfill)
+        else:
+            # Rewritten by block range (a TID range scan), so each statement reads and locks a bounded slice
+            blocks = op.get_bind().scalar(
+                sa.text("SELECT pg_relation_size('certificates') / current_setting('block_size')::bigint")
+            )
+            for first_block in range(0, blocks or 0, BACKFILL_BLOCKS):
+                op.execute(
+                    f"{backfill} AND ctid >= '({first_block},0)'::tid "
+                    f"AND ctid < '({first_block + BACKFILL_BLOCKS},0)'::tid"
+                )
+        # Built without blocking writes, on the new columns, under the names they keep once swapped in.
+        # Expiry windows: a B-tree, without the pre-certificates not issued yet. Issuance windows: a BRIN index.
+        # Both are replaced by (date, id) B-trees in f4a2b1c3d5e6
+        op.create_index(
+            "ix_certificates_valid_until",
+            "certificates",
+            ["valid_until_tz"],
+            postgresql_where=sa.text("valid_until_tz IS NOT NULL"),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_certificates_issued_at_brin",
+            "certificates",
+            ["issued_at_tz"],
+            postgresql_using="brin",
+            postgresql_concurrently=True,
+        )
+        op.execute(f"RESET {BACKFILL_SETTING}")
+        op.execute("ANALYZE certificates")
+
+    # The swap is a catalog change: fail fast rather than queue writes behind a long query holding the table
+    op.execute("SET LOCAL lock_timeout = '5s'")
+    op.execute(f"DROP TRIGGER {SYNC_TRIGGER} ON certificates")
+    op.execute(f"DROP FUNCTION {SYNC_FUNCTION}()")
+    _create_history_trigger()
+    for column in DATE_COLUMNS:
+        op.drop_column("certificates", column)
+        op.alter_column("certificates", f"{column}_tz", new_column_name=column)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_certificates_issued_at_brin", table_name="certificates")
+    op.drop_index("ix_certificates_valid_until", table_name="certificates")
+    # Back to the ISO strings datetime.isoformat() writes for UTC dates; this rewrites the table under lock
+    for column in DATE_COLUMNS:
+        op.alter_column(
+            "certificates",
+            column,
+            type_=sa.String(),
+            existing_type=sa.DateTime(timezone=True),
+            existing_nullable=True,
+            postgresql_using=(
+                f"replace(to_char({column} AT TIME ZONE 'UTC', 'YYYY-MM-DD\"T\"HH24:MI:SS.US'), '.000000', '') "
+                "|| '+00:00'"
+            ),
+        )
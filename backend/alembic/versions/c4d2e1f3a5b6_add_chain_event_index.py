@@ -0,0 +1,87 @@
+# pylint: skip-file
+
+"""Add the chain event index tables
+
+Revision ID: c4d2e1f3a5b6
+Revises: b3c1f0a2d9e4
+Create Date: 2026-10-17 14:03:27.551902
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4d2e1f3a5b6"
+down_revision: Union[str, Sequence[str], None] = "b3c1f0a2d9e4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "chain_events",
+        sa.Column("block_number", sa.BigInteger, primary_key=True),
+        sa.Column("log_index", sa.Integer, primary_key=True),
+        sa.Column("block_hash", sa.String(66), nullable=False),
+        sa.Column("transaction_hash", sa.String(66), nullable=False),
+        sa.Column("event_type", sa.String(32), nullable=False),
+        sa.Column("blockchain_id", sa.String, nullable=False),
+        sa.Column("timestamp", sa.BigInteger, nullable=False),
+        sa.Column("data_hash", sa.String, nullable=True),
+        sa.Column("issuer", sa.String(42), nullable=True),
+        sa.Column("owner", sa.String(42), nullable=True),
+    )
+    op.create_index("ix_chain_events_blockchain_id", "chain_events", ["blockchain_id"])
+
+    op.create_table(
+        "chain_certificates",
+        sa.Column("blockchain_id", sa.String, primary_key=True),
+        sa.Column("data_hash", sa.String, nullable=False),
+        sa.Column("issuer", sa.String(42), nullable=False),
+        sa.Column("owner", sa.String(42), nullable=False),
+        sa.Column("issued_at", sa.BigInteger, nullable=False),
+        sa.Column("block_number", sa.BigInteger, nullable=False),
+        sa.Column("transaction_hash", sa.String(66), nullable=False),
+        sa.Column("revoked", sa.Boolean, nullable=False, server_default=sa.false()),
+        sa.Column("revoked_at", sa.BigInteger, nullable=True),
+        sa.Column("revoked_block_number", sa.BigInteger, nullable=True),
+    )
+    op.create_index("ix_chain_certificates_data_hash", "chain_certificates", ["data_hash"])
+    # Rollbacks delete and restore rows by block number
+    op.create_index("ix_chain_certificates_block_number", "chain_certificates", ["block_number"])
+    op.create_index(
+        "ix_chain_certificates_revoked_block_number",
+        "chain_certificates",
+        ["revoked_block_number"],
+        postgresql_where=sa.text("revoked_block_number IS NOT NULL"),
+    )
+
+    op.create_table(
+        "chain_cursors",
+        sa.Column("name", sa.String, primary_key=True),
+        sa.Column("block_number", sa.BigInteger, nullable=False),
+        sa.Column("block_hash", sa.String(66), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+    )
+
+    op.create_table(
+        "chain_blocks",
+        sa.Column("cursor_name", sa.String, sa.ForeignKey("chain_cursors.name"), primary_key=True),
+        sa.Column("block_number", sa.BigInteger, primary_key=True),
+        sa.Column("block_hash", sa.String(66), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("chain_blocks")
+    op.drop_table("chain_cursors")
+    op.drop_index("ix_chain_certificates_revoked_block_number", table_name="chain_certificates")
+    op.drop_index("ix_chain_certificates_block_number", table_name="chain_certificates")
+    op.drop_index("ix_chain_certificates_data_hash", table_name="chain_certificates")
+    op.drop_table("chain_certificates")
+    op.drop_index("ix_chain_events_blockchain_id", table_name="chain_events")
+    op.drop_table("chain_events")
@@ -0,0 +1,42 @@
+# pylint: skip-file
+
+"""Add the anchored Merkle roots projected from RootAnchored events
+
+Revision ID: d2e0f9a1b3c4
+Revises: c1d9e8f0a2b3
+Create Date: 2026-10-18 10:12:44.903127
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d2e0f9a1b3c4"
+down_revision: Union[str, Sequence[str], None] = "c1d9e8f0a2b3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "chain_anchored_roots",
+        sa.Column("epoch_id", sa.String, primary_key=True),
+        sa.Column("root", sa.String(66), nullable=False),
+        sa.Column("block_number", sa.BigInteger, nullable=False),
+        sa.Column("transaction_hash", sa.String(66), nullable=False),
+    )
+    # Rollbacks delete rows by block number
+    op.create_index("ix_chain_anchored_roots_block_number", "chain_anchored_roots", ["block_number"])
+    # The indexers skipped the RootAnchored events of the blocks they already read: they start over from their
+    # start block, and the events and certificates they stored are kept, as saving them again has no effect
+    op.execute("DELETE FROM chain_blocks")
+    op.execute("DELETE FROM chain_cursors")
+
+
+def downgrade() -> None:
+    op.drop_index("ix_chain_anchored_roots_block_number", table_name="chain_anchored_roots")
+    op.drop_table("chain_anchored_roots")
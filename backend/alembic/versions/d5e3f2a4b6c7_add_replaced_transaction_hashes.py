@@ -0,0 +1,38 @@
+# pylint: skip-file
+
+"""Track the transactions replaced with higher fees in the issuance outbox
+
+Revision ID: d5e3f2a4b6c7
+Revises: c4d2e1f3a5b6
+Create Date: 2026-10-17 16:41:09.318226
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d5e3f2a4b6c7"
+down_revision: Union[str, Sequence[str], None] = "c4d2e1f3a5b6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "certificate_issuance_tasks",
+        sa.Column(
+            "replaced_transaction_hashes",
+            postgresql.ARRAY(sa.String),
+            nullable=False,
+            server_default="{}",
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("certificate_issuance_tasks", "replaced_transaction_hashes")
@@ -0,0 +1,40 @@
+# pylint: skip-file
+
+"""Record the registry deployment holding the blockchain ID of each certificate
+
+Revision ID: e3f1a0b2c4d5
+Revises: d2e0f9a1b3c4
+Create Date: 2026-10-18 14:27:51.640318
+
+"""
+
+import os
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from eth_utils import to_checksum_address
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e3f1a0b2c4d5"
+down_revision: Union[str, Sequence[str], None] = "d2e0f9a1b3c4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("certificates", sa.Column("registry_address", sa.String(42), nullable=True))
+    # The certificates recorded so far all hold an ID of the deployment configured until now; without it, they
+    # are taken as belonging to whichever deployment BLOCKCHAIN_CONTRACT names when they are revoked
+    contract = os.environ.get("BLOCKCHAIN_CONTRACT")
+    if contract:
+        op.execute(
+            sa.text("UPDATE certificates SET registry_address = :address WHERE blockchain_id IS NOT NULL").bindparams(
+                address=to_checksum_address(contract)
+            )
+        )
+
+
+def downgrade() -> None:
+    op.drop_column("certificates", "registry_address")
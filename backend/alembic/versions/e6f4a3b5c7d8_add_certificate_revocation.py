@@ -0,0 +1,31 @@
+# pylint: skip-file
+
+"""Add the revocation date of certificates
+
+Revision ID: e6f4a3b5c7d8
+Revises: d5e3f2a4b6c7
+Create Date: 2026-10-17 17:22:54.904117
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e6f4a3b5c7d8"
+down_revision: Union[str, Sequence[str], None] = "d5e3f2a4b6c7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The status column gains the "revoking" and "revoked" values, no schema change needed there
+    op.add_column("certificates", sa.Column("revoked_at", sa.String, nullable=True))
+
+
+def downgrade() -> None:
+    op.execute("UPDATE certificates SET status = 'issued' WHERE status IN ('revoking', 'revoked')")
+    op.drop_column("certificates", "revoked_at")
@@ -0,0 +1,64 @@
+# pylint: skip-file
+
+"""Index the certificate validity and issuance dates together with the ID for keyset pagination
+
+Revision ID: f4a2b1c3d5e6
+Revises: e3f1a0b2c4d5
+Create Date: 2026-10-18 16:05:37.218846
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f4a2b1c3d5e6"
+down_revision: Union[str, Sequence[str], None] = "e3f1a0b2c4d5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Date windows are paged by (date, id): each page seeks the B-tree right after the last certificate of the
+    # previous one. They replace the index on valid_until alone and the BRIN index on issued_at, which only
+    # pays off while the table is in issuance order; the dates are set by updates long after a row is written
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_certificates_valid_until_id",
+            "certificates",
+            ["valid_until", "id"],
+            postgresql_where=sa.text("valid_until IS NOT NULL"),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_certificates_issued_at_id",
+            "certificates",
+            ["issued_at", "id"],
+            postgresql_where=sa.text("issued_at IS NOT NULL"),
+            postgresql_concurrently=True,
+        )
+        op.drop_index("ix_certificates_valid_until", table_name="certificates", postgresql_concurrently=True)
+        op.drop_index("ix_certificates_issued_at_brin", table_name="certificates", postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_certificates_valid_until",
+            "certificates",
+            ["valid_until"],
+            postgresql_where=sa.text("valid_until IS NOT NULL"),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_certificates_issued_at_brin",
+            "certificates",
+            ["issued_at"],
+            postgresql_using="brin",
+            postgresql_concurrently=True,
+        )
+        op.drop_index("ix_certificates_issued_at_id", table_name="certificates", postgresql_concurrently=True)
+        op.drop_index("ix_certificates_valid_until_id", table_name="certificates", postgresql_concurrently=True)
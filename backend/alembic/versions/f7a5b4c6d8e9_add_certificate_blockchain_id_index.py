@@ -0,0 +1,35 @@
+# pylint: skip-file
+
+"""Index certificates by their numeric blockchain ID
+
+Revision ID: f7a5b4c6d8e9
+Revises: e6f4a3b5c7d8
+Create Date: 2026-10-17 18:41:12.318604
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f7a5b4c6d8e9"
+down_revision: Union[str, Sequence[str], None] = "e6f4a3b5c7d8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The reconciliation job reads certificates by ranges of blockchain IDs, which are stored as strings
+    op.create_index(
+        "ix_certificates_blockchain_id",
+        "certificates",
+        [sa.text("CAST(blockchain_id AS BIGINT)")],
+        postgresql_where=sa.text("blockchain_id IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_certificates_blockchain_id", table_name="certificates")
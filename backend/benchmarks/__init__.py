@@ -0,0 +1,4 @@
+"""Load and throughput scripts for the backend, meant to be run against local services.
+
+Each module is runnable with `python -m benchmarks.<module>` from the backend directory.
+"""
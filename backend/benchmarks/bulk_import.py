@@ -0,0 +1,193 @@
+"""Compares registering products and producers one request at a time with importing them in bulk.
+
+`--rows` products and as many producers (100k by default) are generated, with one row in `--invalid-every`
+made invalid, and imported as `POST /products/import` and `POST /producers/import` run them: the upload is
+streamed into `read_records` in 64 KiB chunks and the rows validated by `ImportProductsHandler` and
+`ImportProducersHandler`, which load the valid ones with `COPY` and insert them set-wise. Each format
+(NDJSON, CSV) imports its own rows.
+
+For comparison, `--legacy-rows` products and producers are registered the way `POST /products/` and
+`POST /producers/` do, one handler call, `merge()` and commit each, and their rate is extrapolated to `--rows`.
+The imported rows are deleted at the end unless `--keep` is given. Requires PostgreSQL with the migrations
+applied and the `DATABASE_*` variables set.
+
+Usage:
+    python -m benchmarks.bulk_import --rows 100000 --legacy-rows 2000
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, Type
+
+import sqlalchemy as sa
+from dotenv import load_dotenv
+from miraveja_di import DIContainer
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncEngine as DatabaseEngine
+from sqlalchemy.ext.asyncio import AsyncSession as DatabaseSession
+from starlette.requests import Request
+
+from certificado_verde_blockchain.producers.application import (
+    ImportProducersHandler,
+    RegisterProducerCommand,
+    RegisterProducerHandler,
+)
+from certificado_verde_blockchain.products.application import (
+    ImportProductsHandler,
+    RegisterProductCommand,
+    RegisterProductHandler,
+)
+from certificado_verde_blockchain.shared.enums import ExportFormat
+from certificado_verde_blockchain.shared.http import export_response, read_records, record_columns
+from tests.support.container import build_container
+from tests.support.seeding import ORIGIN
+
+UPLOAD_CHUNK_SIZE = 64 * 1024
+MEDIA_TYPES = {ExportFormat.NDJSON: "application/x-ndjson", ExportFormat.CSV: "text/csv"}
+
+
+def product_row(run_id: str, index: int) -> Dict[str, Any]:
+    return {
+        "name": f"Castanha {run_id}-{index}",
+        "description": "Benchmark product",
+        "category": "FRUIT",
+        "quantity": {"value": 100 + index % 1000, "unit": "KG"},
+        "origin": ORIGIN.model_dump(),
+        "lot_number": f"LOT-{run_id}-{index}",
+        "carbon_emission": 1.5,
+        "metadata": {"benchmark": run_id},
+        "tags": ["benchmark"],
+    }
+
+
+def producer_row(run_id: str, index: int) -> Dict[str, Any]:
+    return {
+        "name": f"Produtor {run_id}-{index}",
+        "document": {"document_type": "CPF", "number": f"{run_id}-{index:07d}"},
+        "address": ORIGIN.model_dump(),
+        "car_code": f"AM-{run_id}-{index}",
+        "contact": {"phone": None, "email": f"produtor{index}@example.com", "website": None},
+        "metadata": {"benchmark": run_id},
+    }
+
+
+def rows(build: Callable[[str, int], Dict[str, Any]], run_id: str, count: int, invalid_every: int) -> Iterator[Any]:
+    for index in range(count):
+        row = build(run_id, index)
+        if invalid_every and index % invalid_every == invalid_every - 1:
+            row["name"] = ""
+        yield row
+
+
+async def encode(records: Iterator[Dict[str, Any]], export_format: ExportFormat, record_type: Type[BaseModel]) -> bytes:
+    """The upload of the records, encoded as the exports are."""
+
+    async def generated() -> AsyncIterator[Dict[str, Any]]:
+        for record in records:
+            yield record
+
+    response = export_response(generated(), export_format, "upload", record_columns(record_type))
+    return b"".join([chunk.encode() async for chunk in response.body_iterator])  # type: ignore[union-attr]
+
+
+def upload_request(body: bytes, export_format: ExportFormat) -> Request:
+    """A request streaming `body` in chunks, as uvicorn passes an upload to the application."""
+    chunks = [body[start : start + UPLOAD_CHUNK_SIZE] for start in range(0, len(body), UPLOAD_CHUNK_SIZE)] or [b""]
+
+    async def receive() -> Dict[str, Any]:
+        chunk = chunks.pop(0)
+        return {"type": "http.request", "body": chunk, "more_body": bool(chunks)}
+
+    headers = [(b"content-type", MEDIA_TYPES[export_format].encode())]
+    return Request({"type": "http", "method": "POST", "headers": headers}, receive)
+
+
+async def bulk_import(
+    container: DIContainer, handler_type: Type[Any], record_type: Type[BaseModel], upload: bytes, fmt: ExportFormat
+) -> Dict[str, Any]:
+    with container.create_scope() as scope:
+        try:
+            start = time.perf_counter()
+            report = await scope.resolve(handler_type).handle(read_records(upload_request(upload, fmt), record_type))
+            report["seconds"] = time.perf_counter() - start
+            return report
+        finally:
+            await scope.resolve(DatabaseSession).close()
+
+
+async def register_one_by_one(
+    container: DIContainer, handler_type: Type[Any], record_type: Type[BaseModel], records: Iterator[Any]
+) -> float:
+    start = time.perf_counter()
+    for record in records:
+        with container.create_scope() as scope:
+            try:
+                await scope.resolve(handler_type).handle(record_type.model_validate(record))
+            finally:
+                await scope.resolve(DatabaseSession).close()
+    return time.perf_counter() - start
+
+
+def report(kind: str, method: str, rows_count: int, seconds: float, detail: str = "") -> None:
+    print(f"{kind:<9} {method:<7} rows={rows_count:<8} {seconds:8.2f}s {rows_count / seconds:9.0f} rows/s {detail}")
+
+
+async def run(container: DIContainer, rows_count: int, legacy_rows: int, invalid_every: int, keep: bool) -> None:
+    run_id = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
+    kinds = [
+        ("products", product_row, RegisterProductCommand, ImportProductsHandler, RegisterProductHandler),
+        ("producers", producer_row, RegisterProducerCommand, ImportProducersHandler, RegisterProducerHandler),
+    ]
+    try:
+        for kind, build, record_type, import_handler, register_handler in kinds:
+            for export_format in ExportFormat:
+                batch_id = f"{run_id}-{export_format}"
+                upload = await encode(rows(build, batch_id, rows_count, invalid_every), export_format, record_type)
+                result = await bulk_import(container, import_handler, record_type, upload, export_format)
+                report(
+                    kind,
+                    str(export_format),
+                    result["received"],
+                    result["seconds"],
+                    f"imported={result['imported']} rejected={len(result['rejected'])} "
+                    f"upload={len(upload) / 2**20:.1f}MiB",
+                )
+
+            seconds = await register_one_by_one(
+                container, register_handler, record_type, rows(build, f"{run_id}-legacy", legacy_rows, 0)
+            )
+            report(
+                kind,
+                "legacy",
+                legacy_rows,
+                seconds,
+                f"~{seconds * rows_count / legacy_rows:.0f}s extrapolated to {rows_count} rows",
+            )
+    finally:
+        if not keep:
+            print("Deleting the imported products and producers...")
+            async with container.resolve(DatabaseEngine).begin() as connection:
+                for table in ("products", "producers"):
+                    await connection.execute(
+                        sa.text(f"DELETE FROM {table} WHERE metadata ->> 'benchmark' LIKE :pattern"),
+                        {"pattern": f"{run_id}-%"},
+                    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000, help="Products and producers imported per format")
+    parser.add_argument("--legacy-rows", type=int, default=2_000, help="Products and producers registered one by one")
+    parser.add_argument("--invalid-every", type=int, default=1_000, help="One row in this many is invalid (0: none)")
+    parser.add_argument("--keep", action="store_true", help="Keep the imported products and producers")
+    args = parser.parse_args()
+
+    load_dotenv()
+    container = build_container()
+    asyncio.run(run(container, args.rows, args.legacy_rows, args.invalid_every, args.keep))
+
+
+if __name__ == "__main__":
+    main()
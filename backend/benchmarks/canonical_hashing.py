@@ -0,0 +1,120 @@
+"""Compares the canonical hashing engine with the original `json.dumps(...).replace(" ", "")` + keccak path.
+
+Payloads are realistic `CanonicalCertificate` documents (product, producer, certifier, norms and criteria),
+certificate signable payloads and a base64 PDF like the ones sent to `/certificates/validate/pdf`.
+The legacy encoding is checked to produce exactly the original hashes before timing.
+
+Usage:
+    python -m benchmarks.canonical_hashing --iterations 20000
+"""
+
+import argparse
+import base64
+import json
+import os
+import timeit
+from typing import Any, Callable, Dict
+from uuid import uuid4
+
+from web3 import Web3
+
+from certificado_verde_blockchain.certificates.domain import (
+    CanonicalCertificate,
+    Certificate,
+    Norm,
+    SustainabilityCriteria,
+)
+from certificado_verde_blockchain.shared.canonical import CanonicalEncoder, CanonicalEncoding
+
+
+def original_hash(data: Any) -> str:
+    return Web3.keccak(text=json.dumps(data, sort_keys=True).replace(" ", "")).hex()
+
+
+def canonical_certificate() -> CanonicalCertificate:
+    return {
+        "id": str(uuid4()),
+        "version": "1.0",
+        "product": {
+            "id": str(uuid4()),
+            "name": "Café Arábica Especial Torrado em Grãos",
+            "category": "Agricultura",
+            "quantity_value": 1250.75,
+            "quantity_unit": "kg",
+            "origin_country": "Brasil",
+            "origin_state": "Minas Gerais",
+            "origin_city": "São Sebastião do Paraíso",
+            "origin_latitude": -20.9167,
+            "origin_longitude": -46.9833,
+            "lot_number": "LOT-2025-000123",
+        },
+        "producer": {
+            "id": str(uuid4()),
+            "name": "Fazenda Boa Esperança Agropecuária Ltda",
+            "document_type": "CNPJ",
+            "document_number": "12.345.678/0001-90",
+            "car_code": "MG-3164704-A1B2C3D4E5F6A7B8C9D0E1F2A3B4C5D6",
+            "address_country": "Brasil",
+            "address_state": "Minas Gerais",
+            "address_city": "São Sebastião do Paraíso",
+            "address_latitude": -20.9172,
+            "address_longitude": -46.9911,
+        },
+        "certifier": {
+            "id": str(uuid4()),
+            "name": "Instituto Verde de Certificação",
+            "document_type": "CNPJ",
+            "document_number": "98.765.432/0001-10",
+            "auditors_names": ["Maria da Silva", "João Pereira", "Ana Costa"],
+        },
+        "norms_complied": [str(Norm.ISO_14001), str(Norm.RAINFOREST_ALLIANCE), str(Norm.FSC)],
+        "sustainability_criteria": [str(criteria) for criteria in list(SustainabilityCriteria)[:4]],
+        "issued_at": "2025-11-21T14:03:27.551902+00:00",
+        "valid_until": "2030-11-21T14:03:27.551902+00:00",
+        "serial_code": "CVB-7F3A-92KD-11QX",
+    }
+
+
+def signable_payload() -> Dict[str, Any]:
+    certificate = Certificate(
+        version="1.0",
+        product_id=uuid4(),
+        producer_id=uuid4(),
+        certifier_id=uuid4(),
+        norms_complied=[Norm.ISO_14001, Norm.FSC],
+        sustainability_criteria=list(SustainabilityCriteria)[:3],
+        notes="Certificado emitido após auditoria presencial na propriedade.",
+    )
+    return certificate.signable_payload()
+
+
+def report(name: str, function: Callable[[], Any], iterations: int, baseline: float = 0) -> float:
+    seconds = min(timeit.repeat(function, number=iterations, repeat=3))
+    per_call = seconds / iterations * 1e6
+    speedup = f" ({baseline / per_call:.2f}x)" if baseline else ""
+    print(f"  {name:<10} {per_call:10.2f} us/hash{speedup}")
+    return per_call
+
+
+def main(iterations: int) -> None:
+    payloads = {
+        "canonical certificate": (canonical_certificate(), iterations),
+        "signable payload": (signable_payload(), iterations),
+        "pdf (2 MiB base64)": ({"pdf_file": base64.b64encode(os.urandom(2 * 1024 * 1024)).decode()}, 20),
+    }
+
+    for name, (payload, count) in payloads.items():
+        expected = original_hash(payload)
+        assert CanonicalEncoder.hash(payload, CanonicalEncoding.LEGACY) == expected, f"legacy mismatch on {name}"
+
+        print(f"{name} ({len(json.dumps(payload))} bytes, {count} iterations):")
+        baseline = report("original", lambda: original_hash(payload), count)
+        report("legacy", lambda: CanonicalEncoder.hash(payload, CanonicalEncoding.LEGACY), count, baseline)
+        report("v2", lambda: CanonicalEncoder.hash(payload, CanonicalEncoding.V2), count, baseline)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20000, help="Hashes per payload and implementation")
+    args = parser.parse_args()
+    main(args.iterations)
@@ -0,0 +1,198 @@
+"""Measures finding the certificates expiring soon, or issued recently, in a table of millions of certificates.
+
+`--rows` issued certificates (5M by default) are inserted server-side over `--owners` products, producers and
+certifiers, issued one after the other over the last `--years` years and valid for 5 years each. Two windows
+are then queried through `SqlCertificateRepository`, `--repeats` times each:
+
+- `expiry`: the certificates expiring in the next `--expiry-days` days, `find_by_expiry_window`, served by the
+  B-tree index `ix_certificates_valid_until_id`;
+- `issuance`: the certificates issued in the last `--issuance-days` days, `find_by_issuance_window`, served by
+  the B-tree index `ix_certificates_issued_at_id`;
+- `legacy`: the only way to answer either before the dates were typed, every certificate loaded and its
+  validity compared in Python, measured only when the table holds at most `--legacy-max-rows` certificates.
+
+For each window the p50/p99 latencies of its first page of `--page-size` certificates are reported, then the
+time to walk every page of it through the (date, ID) cursors of `PageRequest`. The synthetic certificates are
+deleted at the end unless `--keep` is given. Requires PostgreSQL with the migrations applied and the `DATABASE_*`
+variables set.
+
+Usage:
+    python -m benchmarks.certificate_date_windows --rows 5000000 --page-size 500
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, List, Optional, Tuple
+from uuid import UUID
+
+import sqlalchemy as sa
+from dotenv import load_dotenv
+from miraveja_di import DIContainer
+from sqlalchemy.ext.asyncio import AsyncSession as DatabaseSession
+
+from certificado_verde_blockchain.certificates.domain import Certificate, CertificateStatus, ICertificateRepository
+from certificado_verde_blockchain.certificates.infrastructure import CertificatesDependencies
+from certificado_verde_blockchain.certificates.infrastructure.sql.certificate_entity import CertificateEntity
+from certificado_verde_blockchain.shared.models import PageRequest
+from tests.support.container import build_container
+from tests.support.seeding import delete_synthetic_certificates, insert_synthetic_certificates, seed_entities
+
+from .issuance_pipeline.instrumentation import percentile
+from .keyset_pagination import in_scope
+
+Window = Tuple[datetime, datetime]
+FindPage = Callable[[ICertificateRepository, Optional[Tuple[datetime, UUID]], int], Awaitable[List[Certificate]]]
+DateOf = Callable[[Certificate], datetime]
+
+
+def report(query: str, samples: List[float], detail: str = "") -> None:
+    ordered = sorted(samples)
+    print(
+        f"{query:<9} samples={len(ordered):<4} "
+        f"p50={percentile(ordered, 0.5):9.2f}ms p99={percentile(ordered, 0.99):9.2f}ms {detail}"
+    )
+
+
+async def walk(container: DIContainer, find_page: FindPage, date_of: DateOf, page_size: int) -> Tuple[int, int, float]:
+    """Fetch every page of a window, each in its own scope as `?cursor=` requests would.
+
+    Returns:
+        Tuple[int, int, float]: The certificates found, the pages fetched and the milliseconds taken.
+    """
+    found, pages, cursor = 0, 0, None
+    start = time.perf_counter()
+    while True:
+        page = PageRequest.from_cursor(cursor, page_size)
+        with container.create_scope() as scope:
+            try:
+                certificates = await find_page(scope.resolve(ICertificateRepository), page.after, page.fetch_limit)
+            finally:
+                await scope.resolve(DatabaseSession).close()
+        certificates, cursor = page.page(certificates, date_of)
+        found, pages = found + len(certificates), pages + 1
+        if cursor is None:
+            return found, pages, (time.perf_counter() - start) * 1000
+
+
+async def run(
+    container: DIContainer,
+    rows: int,
+    owners: int,
+    years: int,
+    expiry_days: int,
+    issuance_days: int,
+    page_size: int,
+    repeats: int,
+    legacy_max_rows: int,
+    keep: bool,
+) -> None:
+    now = datetime.now(timezone.utc)
+    run_id = now.strftime("%Y%m%d%H%M%S")
+    version = f"benchmark-{run_id}"
+    print(f"Registering {owners} products, producers and certifiers...")
+    entities = await seed_entities(container, run_id, owners)
+    print(f"Inserting {rows} issued certificates over the last {years} years...")
+    start = time.perf_counter()
+    await insert_synthetic_certificates(
+        container,
+        entities,
+        rows,
+        version,
+        (CertificateStatus.ISSUED,),
+        issued_between=(now - timedelta(days=365 * years), now),
+    )
+    print(f"Inserted in {time.perf_counter() - start:.1f}s")
+
+    expiry: Window = (now, now + timedelta(days=expiry_days))
+    issuance: Window = (now - timedelta(days=issuance_days), now)
+    windows: List[Tuple[str, FindPage, DateOf, Window]] = [
+        (
+            "expiry",
+            lambda repository, after, limit: repository.find_by_expiry_window(
+                *expiry, after, limit, CertificateStatus.ISSUED
+            ),
+            lambda certificate: certificate.valid_until,
+            expiry,
+        ),
+        (
+            "issuance",
+            lambda repository, after, limit: repository.find_by_issuance_window(
+                *issuance, after, limit, CertificateStatus.ISSUED
+            ),
+            lambda certificate: certificate.issued_at,
+            issuance,
+        ),
+    ]
+
+    try:
+        for query, find_page, date_of, (window_from, window_until) in windows:
+
+            async def first_page(scope: DIContainer, find_page: FindPage = find_page) -> None:
+                await find_page(scope.resolve(ICertificateRepository), None, page_size)
+
+            report(
+                query,
+                [await in_scope(container, first_page) for _ in range(repeats)],
+                f"window={window_from:%Y-%m-%d}..{window_until:%Y-%m-%d}",
+            )
+            found, pages, milliseconds = await walk(container, find_page, date_of, page_size)
+            print(f"{query:<9} every page: certificates={found} pages={pages} {milliseconds:9.2f}ms")
+
+        if rows <= legacy_max_rows:
+
+            async def legacy(scope: DIContainer) -> None:
+                certificate_entities = (
+                    await scope.resolve(DatabaseSession).scalars(sa.select(CertificateEntity))
+                ).all()
+                certificates = [entity.to_domain() for entity in certificate_entities]
+                [
+                    certificate
+                    for certificate in certificates
+                    if certificate.valid_until is not None and expiry[0] <= certificate.valid_until < expiry[1]
+                ]
+
+            report("legacy", [await in_scope(container, legacy) for _ in range(max(1, repeats // 10))])
+    finally:
+        if not keep:
+            print("Deleting the synthetic certificates...")
+            await delete_synthetic_certificates(container, version)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=5_000_000, help="Issued certificates to insert")
+    parser.add_argument("--owners", type=int, default=10, help="Products, producers and certifiers they spread over")
+    parser.add_argument("--years", type=int, default=5, help="Years the certificates were issued over, up to now")
+    parser.add_argument("--expiry-days", type=int, default=30, help="Days ahead of the expiry window")
+    parser.add_argument("--issuance-days", type=int, default=90, help="Days back of the issuance window")
+    parser.add_argument("--page-size", type=int, default=500, help="Certificates per page")
+    parser.add_argument("--repeats", type=int, default=50, help="Fetches of the first page of each window")
+    parser.add_argument(
+        "--legacy-max-rows", type=int, default=1_000_000, help="Certificates above which legacy is skipped"
+    )
+    parser.add_argument("--keep", action="store_true", help="Keep the synthetic certificates")
+    args = parser.parse_args()
+
+    load_dotenv()
+    container = build_container()
+    CertificatesDependencies.register_dependencies(container)
+    asyncio.run(
+        run(
+            container,
+            args.rows,
+            args.owners,
+            args.years,
+            args.expiry_days,
+            args.issuance_days,
+            args.page_size,
+            args.repeats,
+            args.legacy_max_rows,
+            args.keep,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
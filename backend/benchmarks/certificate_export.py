@@ -0,0 +1,79 @@
+"""Checks that exporting a million certificates streams them in flat memory, in NDJSON and in CSV.
+
+`--rows` synthetic issued certificates (1M by default) are inserted server-side over `--owners` products,
+producers and certifiers. Each format is then exported as `GET /certificates/export?status=issued&norm=FSC`
+builds its response: `ExportCertificatesHandler` reading a server-side cursor, encoded by `export_response`.
+The body is consumed straight from the response iterator, as uvicorn would send it, and discarded.
+
+The resident memory of the process (from `/proc/self/statm`, so Linux only) is sampled after every body chunk.
+The rows, duration, throughput and bytes of each export are reported with the growth of the memory over its
+baseline; the benchmark fails when the peak growth of an export exceeds `--rss-budget-mb`. The synthetic
+certificates are deleted at the end unless `--keep` is given. Requires PostgreSQL with the migrations applied
+and the `DATABASE_*` variables set.
+
+Usage:
+    python -m benchmarks.certificate_export --rows 1000000 --rss-budget-mb 100
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from datetime import datetime, timezone
+
+from dotenv import load_dotenv
+from miraveja_di import DIContainer
+
+from certificado_verde_blockchain.certificates.infrastructure import CertificatesDependencies
+from certificado_verde_blockchain.shared.enums import ExportFormat
+from tests.support.container import build_container
+from tests.support.export import export
+from tests.support.seeding import delete_synthetic_certificates, insert_synthetic_certificates, seed_entities
+
+
+async def run(container: DIContainer, rows: int, owners: int, rss_budget_mb: float, keep: bool) -> bool:
+    run_id = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
+    version = f"benchmark-{run_id}"
+    print(f"Registering {owners} products, producers and certifiers...")
+    entities = await seed_entities(container, run_id, owners)
+    print(f"Inserting {rows} certificates...")
+    start = time.perf_counter()
+    await insert_synthetic_certificates(container, entities, rows, version)
+    print(f"Inserted in {time.perf_counter() - start:.1f}s")
+
+    within_budget = True
+    try:
+        for export_format in ExportFormat:
+            result = await export(container, export_format)
+            within_budget = within_budget and result["growth_mb"] <= rss_budget_mb
+            print(
+                f"{export_format!s:<7} rows={result['rows']:<9.0f} {result['seconds']:7.1f}s "
+                f"{result['rows'] / result['seconds']:9.0f} rows/s {result['megabytes']:8.1f}MiB sent "
+                f"rss={result['baseline_mb']:.1f}MiB +{result['growth_mb']:.1f}MiB (budget {rss_budget_mb:.0f}MiB)"
+            )
+    finally:
+        if not keep:
+            print("Deleting the synthetic certificates...")
+            await delete_synthetic_certificates(container, version)
+    return within_budget
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Synthetic certificates inserted and exported")
+    parser.add_argument("--owners", type=int, default=20, help="Products, producers and certifiers they spread over")
+    parser.add_argument(
+        "--rss-budget-mb", type=float, default=100, help="Resident memory an export may grow by, in MiB"
+    )
+    parser.add_argument("--keep", action="store_true", help="Keep the synthetic certificates")
+    args = parser.parse_args()
+
+    load_dotenv()
+    container = build_container()
+    CertificatesDependencies.register_dependencies(container)
+    if not asyncio.run(run(container, args.rows, args.owners, args.rss_budget_mb, args.keep)):
+        sys.exit("An export grew the resident memory beyond the budget.")
+
+
+if __name__ == "__main__":
+    main()
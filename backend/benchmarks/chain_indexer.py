@@ -0,0 +1,106 @@
+"""Measures how fast the chain event indexer backfills a CertificateRegistry full of events.
+
+Seed a local Hardhat node first (`npm run seed-events` in `blockchain/`, 100k issuances by default) and point
+`BLOCKCHAIN_CONTRACT` at the seeded registry. The `DATABASE_*` variables must reach a database migrated to the
+latest revision. Each run rolls the index back and backfills it from `INDEXER_START_BLOCK` to the chain head,
+then a sample of indexed hashes is looked up locally and through `getCertificate` on the node for comparison.
+
+Usage:
+    python -m benchmarks.chain_indexer --concurrency 1,2,4,8 --lookups 1000
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from typing import List
+
+import sqlalchemy as sa
+from dotenv import load_dotenv
+from miraveja_di import DIContainer
+from sqlalchemy.ext.asyncio import AsyncSession as DatabaseSession
+from web3 import AsyncWeb3
+
+from certificado_verde_blockchain.certificates.domain import IChainCertificateRepository
+from certificado_verde_blockchain.certificates.infrastructure import CertificatesDependencies
+from certificado_verde_blockchain.certificates.infrastructure.indexer import ChainEventIndexer, ChainLogReader
+from certificado_verde_blockchain.certificates.infrastructure.sql.chain_event_entity import ChainEventEntity
+from certificado_verde_blockchain.certificates.infrastructure.web3 import ContractRegistry, Web3BlockchainService
+from certificado_verde_blockchain.configuration import IndexerConfig
+from certificado_verde_blockchain.dependencies import AppDependencies
+from miraveja_log import IAsyncLogger
+
+
+async def backfill(container: DIContainer, config: IndexerConfig, concurrency: int) -> None:
+    indexer_config = config.model_copy(update={"confirmations": 0, "backfill_concurrency": concurrency})
+    reader = ChainLogReader(container.resolve(ContractRegistry).default, indexer_config, container.resolve(AsyncWeb3))
+    indexer = ChainEventIndexer(container, indexer_config, reader, container.resolve(IAsyncLogger))
+
+    with container.create_scope() as scope:
+        await scope.resolve(IChainCertificateRepository).rollback(indexer.cursor_name, indexer_config.start_block)
+        await scope.resolve(DatabaseSession).close()
+
+    events = 0
+    start = time.perf_counter()
+    caught_up = False
+    while not caught_up:
+        indexed, caught_up = await indexer.sync_once()
+        events += indexed
+    seconds = time.perf_counter() - start
+    print(
+        f"concurrency={concurrency:<3} events={events} time={seconds:.2f}s "
+        f"events/s={events / seconds:.0f} final_range={reader.block_range}"
+    )
+
+
+async def compare_lookups(container: DIContainer, count: int) -> None:
+    with container.create_scope() as scope:
+        database_session = scope.resolve(DatabaseSession)
+        repository = scope.resolve(IChainCertificateRepository)
+        rows = (
+            await database_session.execute(
+                sa.select(ChainEventEntity.data_hash, ChainEventEntity.blockchain_id)
+                .where(ChainEventEntity.data_hash.isnot(None))
+                .limit(count * 10)
+            )
+        ).all()
+        sample = random.sample(rows, min(count, len(rows)))
+
+        start = time.perf_counter()
+        for data_hash, _ in sample:
+            await repository.find_by_data_hash(data_hash)
+        local_seconds = time.perf_counter() - start
+        await database_session.close()
+
+    contract = container.resolve(Web3BlockchainService).contract
+    assert contract is not None
+    start = time.perf_counter()
+    for _, blockchain_id in sample:
+        await contract.functions.getCertificate(int(blockchain_id)).call()
+    node_seconds = time.perf_counter() - start
+
+    print(
+        f"lookups={len(sample)} indexed={local_seconds / len(sample) * 1000:.3f}ms "
+        f"node={node_seconds / len(sample) * 1000:.3f}ms per lookup"
+    )
+
+
+async def main(concurrency_levels: List[int], lookups: int) -> None:
+    load_dotenv()
+    container = DIContainer()
+    AppDependencies.register_dependencies(container)
+    CertificatesDependencies.register_dependencies(container)
+    config = container.resolve(IndexerConfig)
+
+    for concurrency in concurrency_levels:
+        await backfill(container, config, concurrency)
+    if lookups > 0:
+        await compare_lookups(container, lookups)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", default="1,2,4,8", help="Comma separated backfill concurrency levels")
+    parser.add_argument("--lookups", type=int, default=1000, help="Number of hashes looked up after the backfill")
+    args = parser.parse_args()
+    asyncio.run(main([int(level) for level in args.concurrency.split(",")], args.lookups))
@@ -0,0 +1,118 @@
+"""Measures how fast the whole CertificateRegistry is read back for the DB-vs-chain reconciliation job.
+
+Seed a local Hardhat node first (`npm run seed-events` in `blockchain/`, tens of thousands of issuances) and point
+`BLOCKCHAIN_CONTRACT` at the seeded registry. Every combination of page size and read-ahead concurrency reads
+all certificates through `getCertificates`, and a sample read one `getCertificate` call at a time (with the
+highest concurrency level) is extrapolated to the full registry for comparison.
+
+With `--reconcile`, the reconciliation job then runs end to end through the DI container; the `DATABASE_*`
+variables must reach a database migrated to the latest revision. Certificates seeded directly on chain have
+no row in the database, so each of them is reported as `missing_in_database`.
+
+Usage:
+    python -m benchmarks.chain_reconciliation --page-sizes 100,500,1000 --concurrency 1,4,8 --single-reads 2000
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Dict, List
+
+from dotenv import load_dotenv
+from miraveja_di import DIContainer
+from sqlalchemy.ext.asyncio import AsyncSession as DatabaseSession
+
+from certificado_verde_blockchain.certificates.application import ReconcileChainCertificatesHandler
+from certificado_verde_blockchain.certificates.infrastructure import CertificatesDependencies
+from certificado_verde_blockchain.configuration import BlockchainConfig
+from certificado_verde_blockchain.dependencies import AppDependencies
+
+from .concurrent_issuance import build_service
+
+
+async def bulk_read(config: BlockchainConfig, page_size: int, concurrency: int) -> None:
+    service, _ = build_service(
+        config.model_copy(update={"bulk_read_page_size": page_size, "bulk_read_concurrency": concurrency})
+    )
+    count = await service.count_certificates()
+
+    read = 0
+    start = time.perf_counter()
+    async for page in service.read_certificates(1, count):
+        read += len(page)
+    seconds = time.perf_counter() - start
+    await service.web3_client.provider.disconnect()
+
+    print(
+        f"page_size={page_size:<5} concurrency={concurrency:<3} certificates={read} "
+        f"time={seconds:.2f}s certificates/s={read / seconds:.0f}"
+    )
+
+
+async def single_reads(config: BlockchainConfig, sample: int, concurrency: int) -> None:
+    service, _ = build_service(config)
+    contract = service.contract
+    assert contract is not None
+    count = await service.count_certificates()
+    sample = min(sample, count)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def read(blockchain_id: int) -> None:
+        async with semaphore:
+            await contract.functions.getCertificate(blockchain_id).call()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(read(blockchain_id) for blockchain_id in range(1, sample + 1)))
+    seconds = time.perf_counter() - start
+    await service.web3_client.provider.disconnect()
+
+    print(
+        f"getCertificate concurrency={concurrency:<3} certificates={sample} time={seconds:.2f}s "
+        f"certificates/s={sample / seconds:.0f} (full registry ~{seconds / sample * count:.0f}s)"
+    )
+
+
+async def reconcile() -> None:
+    container = DIContainer()
+    AppDependencies.register_dependencies(container)
+    CertificatesDependencies.register_dependencies(container)
+
+    kinds: Dict[str, int] = {}
+    start = time.perf_counter()
+    with container.create_scope() as scope:
+        async for drift in scope.resolve(ReconcileChainCertificatesHandler).handle():
+            kinds[drift["kind"]] = kinds.get(drift["kind"], 0) + 1
+        await scope.resolve(DatabaseSession).close()
+    seconds = time.perf_counter() - start
+    kinds.pop("summary", None)
+    print(f"reconciliation time={seconds:.2f}s drifts={kinds}")
+
+
+async def main(page_sizes: List[int], concurrency_levels: List[int], sample: int, run_reconcile: bool) -> None:
+    load_dotenv()
+    config = BlockchainConfig.from_env()
+
+    for page_size in page_sizes:
+        for concurrency in concurrency_levels:
+            await bulk_read(config, page_size, concurrency)
+    if sample > 0:
+        await single_reads(config, sample, max(concurrency_levels))
+    if run_reconcile:
+        await reconcile()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--page-sizes", default="100,500,1000", help="Comma separated getCertificates page sizes")
+    parser.add_argument("--concurrency", default="1,4,8", help="Comma separated read-ahead concurrency levels")
+    parser.add_argument("--single-reads", type=int, default=2000, help="Certificates read one call at a time")
+    parser.add_argument("--reconcile", action="store_true", help="Also run the reconciliation job end to end")
+    args = parser.parse_args()
+    asyncio.run(
+        main(
+            [int(size) for size in args.page_sizes.split(",")],
+            [int(level) for level in args.concurrency.split(",")],
+            args.single_reads,
+            args.reconcile,
+        )
+    )
@@ -0,0 +1,145 @@
+"""Compares how long the Hardhat node and the in-process chain take to get a backend ready to issue.
+
+For each backend, three steps are timed:
+
+- start: until the chain answers JSON-RPC requests (`npx hardhat node`), or creating the in-process chain;
+- deploy: deploying the registry and authorizing the extra signers (`scripts/deploy.js` then `setIssuer`), or
+  `ContractRegistry.deploy_in_process`, timed together with the start for the in-process chain;
+- first round trip: issuing, reading back and revoking one certificate through the blockchain service.
+
+Then `--count` certificates are issued concurrently to compare the throughput once started.
+
+The in-process chain needs the `in-process` extra and the compiled artifact at `BLOCKCHAIN_ABI_PATH`. The Hardhat
+flow runs only with `--hardhat-dir` (the `blockchain/` directory, with its dependencies installed); the node
+listens on 8545, the port of its `localhost` network, which must be free.
+
+Usage:
+    python -m benchmarks.chain_startup --count 100 --hardhat-dir ../blockchain
+"""
+
+import argparse
+import asyncio
+import os
+import re
+import subprocess
+import time
+from typing import Dict, Optional
+
+from aiohttp import ClientError, ClientSession
+from dotenv import load_dotenv
+from web3 import Web3
+
+from certificado_verde_blockchain.certificates.infrastructure.web3 import Web3BlockchainService
+from certificado_verde_blockchain.configuration import BlockchainConfig
+
+from .concurrent_issuance import authorize_signers, build_service, issue_certificates
+
+HARDHAT_URL = "http://127.0.0.1:8545"
+DEPLOYED_AT = re.compile(r"Deployed at: (0x[0-9a-fA-F]{40})")
+
+
+async def round_trip(service: Web3BlockchainService, owner: str) -> None:
+    certificate_hash = Web3.keccak(text=f"startup-{time.time_ns()}").hex()
+    blockchain_id = (await issue_certificates(service, [(certificate_hash, owner)]))[0]
+    async for _ in service.read_certificates(int(blockchain_id), int(blockchain_id)):
+        pass
+    receipt = (await service.revoke_certificates([blockchain_id]))[blockchain_id]
+    if not receipt.revoked:
+        raise SystemExit(f"Revocation of certificate {blockchain_id} failed: {receipt.error}")
+
+
+async def issue(service: Web3BlockchainService, owner: str, count: int) -> float:
+    start = time.perf_counter()
+    hashes = [Web3.keccak(text=f"load-{index}").hex() for index in range(count)]
+    size = service.config.issuance_batch_max_size
+    await asyncio.gather(
+        *(
+            issue_certificates(
+                service, [(certificate_hash, owner) for certificate_hash in hashes[first : first + size]]
+            )
+            for first in range(0, count, size)
+        )
+    )
+    return count / (time.perf_counter() - start)
+
+
+async def measure(label: str, config: BlockchainConfig, timings: Dict[str, float], count: int) -> None:
+    start = time.perf_counter()
+    service, signer_pool = build_service(config)
+    if config.backend == "in_process":
+        # build_service creates the chain, deploys the registry and authorizes the signers
+        timings["start and deploy"] = time.perf_counter() - start
+    else:
+        await authorize_signers(service, signer_pool, config)
+        timings["deploy"] += time.perf_counter() - start
+    owner = signer_pool.signers[0].address
+
+    start = time.perf_counter()
+    await round_trip(service, owner)
+    timings["first round trip"] = time.perf_counter() - start
+    throughput = await issue(service, owner, count)
+    await service.web3_client.provider.disconnect()
+
+    steps = " ".join(f"{step}={seconds:.2f}s" for step, seconds in timings.items())
+    print(f"{label:<12} {steps} total={sum(timings.values()):.2f}s issuance={throughput:.1f}/s")
+
+
+async def wait_for_node(node: subprocess.Popen, timeout_seconds: float) -> None:
+    deadline = time.monotonic() + timeout_seconds
+    async with ClientSession() as session:
+        while time.monotonic() < deadline:
+            if node.poll() is not None:
+                raise SystemExit("The Hardhat node exited before answering.")
+            try:
+                async with session.post(HARDHAT_URL, json={"jsonrpc": "2.0", "id": 1, "method": "eth_blockNumber"}):
+                    return
+            except ClientError:
+                await asyncio.sleep(0.1)
+    raise SystemExit(f"The Hardhat node did not answer within {timeout_seconds}s.")
+
+
+async def hardhat(config: BlockchainConfig, hardhat_dir: str, count: int) -> None:
+    timings: Dict[str, float] = {}
+    start = time.perf_counter()
+    node = subprocess.Popen(["npx", "hardhat", "node"], cwd=hardhat_dir, stdout=subprocess.DEVNULL)
+    try:
+        await wait_for_node(node, 120)
+        timings["start"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        deploy = subprocess.run(
+            ["npx", "hardhat", "run", "scripts/deploy.js", "--network", "localhost"],
+            cwd=hardhat_dir,
+            env={**os.environ, "REGISTRY_CONTRACT": os.path.splitext(os.path.basename(config.abi_path))[0]},
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        timings["deploy"] = time.perf_counter() - start
+        match = DEPLOYED_AT.search(deploy.stdout)
+        if match is None:
+            raise SystemExit(f"Could not find the deployed address in:\n{deploy.stdout}")
+
+        node_config = config.model_copy(
+            update={"backend": "node", "contract": match.group(1), "provider_url": HARDHAT_URL, "provider_urls": []}
+        )
+        await measure("hardhat", node_config, timings, count)
+    finally:
+        node.terminate()
+        node.wait()
+
+
+async def main(config: BlockchainConfig, hardhat_dir: Optional[str], count: int) -> None:
+    await measure("in-process", config.model_copy(update={"backend": "in_process"}), {}, count)
+    if hardhat_dir:
+        await hardhat(config, hardhat_dir, count)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=100, help="Number of concurrent issuances once started")
+    parser.add_argument("--hardhat-dir", help="The blockchain/ directory, to time the Hardhat flow as well")
+    args = parser.parse_args()
+
+    load_dotenv()
+    asyncio.run(main(BlockchainConfig.from_env(), args.hardhat_dir, args.count))
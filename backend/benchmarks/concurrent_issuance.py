@@ -0,0 +1,205 @@
+"""Issues hundreds of certificates at a local Hardhat node or the in-process chain, as the issuance workers do.
+
+The certificates are split into batches of `BLOCKCHAIN_ISSUANCE_BATCH_MAX_SIZE`, each signed, sent and polled
+for its receipt concurrently. Checks that every certificate gets a distinct ID and that no signer was left with
+a nonce gap, then reports the throughput. The contract must be deployed and the `BLOCKCHAIN_*` variables set (see
+`.env_example`); extra signers in `BLOCKCHAIN_SIGNER_PRIVATE_KEYS` are authorized with `setIssuer` first.
+With `BLOCKCHAIN_BACKEND=in_process`, no node is needed: the registry is deployed from its artifact at startup.
+
+Usage:
+    python -m benchmarks.concurrent_issuance --count 500 --batch-max-size 1
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Callable, List, Optional, Tuple
+
+from dotenv import load_dotenv
+from web3 import AsyncWeb3, Web3
+from web3.manager import RequestManager
+from web3.providers.async_base import AsyncBaseProvider
+
+from certificado_verde_blockchain.certificates.infrastructure.web3 import (
+    ContractRegistry,
+    Eip1559FeeStrategy,
+    FeeStrategy,
+    NonceManager,
+    SignatureVerifier,
+    SignerPool,
+    Web3BlockchainService,
+)
+from certificado_verde_blockchain.configuration import BlockchainConfig
+from certificado_verde_blockchain.shared.web3 import (
+    InProcessChain,
+    RequestBatchingMiddleware,
+    ResponseCacheMiddleware,
+    RoutingAsyncProvider,
+)
+
+
+async def authorize_signers(service: Web3BlockchainService, signer_pool: SignerPool, config: BlockchainConfig) -> None:
+    contract = service.contract
+    assert contract is not None
+    web3_client = service.web3_client
+    admin = web3_client.eth.account.from_key(config.private_key)
+
+    for signer in signer_pool.signers:
+        if signer.address == admin.address or await contract.functions.issuers(signer.address).call():
+            continue
+        txn = await contract.functions.setIssuer(signer.address, True).build_transaction(
+            {"from": admin.address, "nonce": await web3_client.eth.get_transaction_count(admin.address, "pending")}
+        )
+        tx_hash = await web3_client.eth.send_raw_transaction(admin.sign_transaction(txn).raw_transaction)
+        await web3_client.eth.wait_for_transaction_receipt(tx_hash)
+        print(f"Authorized issuer {signer.address}")
+
+
+def build_service(
+    config: BlockchainConfig, fee_strategy: Callable[[BlockchainConfig, AsyncWeb3], FeeStrategy] = Eip1559FeeStrategy
+) -> Tuple[Web3BlockchainService, SignerPool]:
+    chain: Optional[InProcessChain] = None
+    provider: AsyncBaseProvider
+    if config.backend == "in_process":
+        chain = InProcessChain(config.all_private_keys)
+        provider = chain.provider
+    else:
+        provider = RoutingAsyncProvider.from_urls(
+            config.all_provider_urls,
+            pool_size=config.http_pool_size,
+            keepalive_seconds=config.http_keepalive_seconds,
+            timeout_seconds=config.http_timeout_seconds,
+            health_interval_seconds=config.provider_health_interval_seconds,
+            max_block_lag=config.provider_max_block_lag,
+            hedge_delay_ms=config.provider_hedge_delay_ms,
+        )
+    web3_client = AsyncWeb3(
+        provider,
+        middleware=[
+            *RequestManager.get_default_middleware(),
+            (ResponseCacheMiddleware.build(config.rpc_cache_size, config.rpc_cache_confirmations), "response_cache"),
+            (
+                RequestBatchingMiddleware.build(config.rpc_batch_window_ms, config.rpc_batch_max_size),
+                "request_batching",
+            ),
+        ],
+    )
+    if chain is not None:
+        contract_registry = ContractRegistry.deploy_in_process(config, web3_client, chain)
+    else:
+        contract_registry = ContractRegistry(config, web3_client)
+    signer_pool = SignerPool(config)
+    service = Web3BlockchainService(
+        config,
+        web3_client,
+        contract_registry,
+        signer_pool,
+        NonceManager(web3_client),
+        SignatureVerifier(config.signature_workers, config.signature_cache_size, config.signature_chunk_size),
+        fee_strategy(config, web3_client),
+    )
+    return service, signer_pool
+
+
+async def issue_certificates(
+    service: Web3BlockchainService, certificates: List[Tuple[str, str]], poll_seconds: float = 0.05
+) -> List[str]:
+    """Record certificates in one transaction the way `ProcessIssuanceTasksHandler` does: sign it, send it,
+    then poll its receipt, replacing it with higher fees every `replacement_after_seconds` it stays unmined.
+
+    Args:
+        service (Web3BlockchainService): The blockchain service.
+        certificates (List[Tuple[str, str]]): Pairs of certificate hash and certifier address.
+        poll_seconds (float): Seconds between two receipt requests.
+    Returns:
+        List[str]: The blockchain IDs of the certificates, in input order.
+    """
+    transaction = await service.prepare_certificates(certificates)
+    await service.broadcast_transaction(transaction)
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + service.config.transaction_timeout_seconds
+    replace_at = loop.time() + service.config.replacement_after_seconds
+    transaction_hashes = [transaction.transaction_hash]
+    while True:
+        receipts = await service.get_issuance_receipts(transaction_hashes)
+        receipt = next((receipts[tx_hash] for tx_hash in transaction_hashes if tx_hash in receipts), None)
+        if receipt is not None:
+            break
+        now = loop.time()
+        if now >= deadline:
+            raise RuntimeError(f"Transaction {transaction_hashes[-1]} was not mined in time.")
+        if now >= replace_at:
+            replacement = await service.replace_transaction(transaction_hashes[-1])
+            if replacement is not None:
+                transaction_hashes.append(replacement)
+            replace_at = now + service.config.replacement_after_seconds
+        await asyncio.sleep(poll_seconds)
+
+    if not receipt.success:
+        raise RuntimeError(f"Transaction {receipt.transaction_hash} failed on the blockchain.")
+    return [receipt.certificate_ids[certificate_hash] for certificate_hash, _ in certificates]
+
+
+async def run(count: int, config: BlockchainConfig) -> None:
+    service, signer_pool = build_service(config)
+    web3_client = service.web3_client
+    await authorize_signers(service, signer_pool, config)
+
+    owner = signer_pool.signers[0].address
+    run_id = time.time_ns()
+    hashes = [Web3.keccak(text=f"benchmark-{run_id}-{index}").hex() for index in range(count)]
+
+    size = config.issuance_batch_max_size
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *(
+            issue_certificates(
+                service, [(certificate_hash, owner) for certificate_hash in hashes[first : first + size]]
+            )
+            for first in range(0, count, size)
+        ),
+        return_exceptions=True,
+    )
+    elapsed = time.perf_counter() - start
+
+    failures = [result for result in results if isinstance(result, BaseException)]
+    certificate_ids = [
+        certificate_id for result in results if not isinstance(result, BaseException) for certificate_id in result
+    ]
+    print(
+        f"Issued {len(certificate_ids)}/{count} certificates in {elapsed:.2f}s ({len(certificate_ids) / elapsed:.2f}/s)"
+    )
+    print(f"Signers: {len(signer_pool.signers)}, batch max size: {config.issuance_batch_max_size}")
+
+    for failure in failures[:5]:
+        print(f"Failure: {failure}")
+    if len(set(certificate_ids)) != len(certificate_ids):
+        raise SystemExit("Duplicate certificate IDs were returned.")
+
+    for signer in signer_pool.signers:
+        latest = await web3_client.eth.get_transaction_count(signer.address, "latest")
+        pending = await web3_client.eth.get_transaction_count(signer.address, "pending")
+        if latest != pending:
+            raise SystemExit(f"Signer {signer.address} has {pending - latest} transactions stuck in the mempool.")
+
+    await web3_client.provider.disconnect()
+    if failures:
+        raise SystemExit(f"{len(failures)} issuance transactions failed.")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=500, help="Number of certificates issued")
+    parser.add_argument("--batch-max-size", type=int, help="Overrides BLOCKCHAIN_ISSUANCE_BATCH_MAX_SIZE")
+    args = parser.parse_args()
+
+    load_dotenv()
+    config = BlockchainConfig.from_env()
+    if args.batch_max_size is not None:
+        config = config.model_copy(update={"issuance_batch_max_size": args.batch_max_size})
+    asyncio.run(run(args.count, config))
+
+
+if __name__ == "__main__":
+    main()
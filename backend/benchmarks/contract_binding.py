@@ -0,0 +1,149 @@
+"""Measures what the process-wide contract registry saves when the blockchain service is resolved.
+
+Three costs are compared, all without a blockchain node or database:
+
+- startup: building the `ContractRegistry` (reading and validating the ABI, binding the configured
+  deployment, precomputing selectors and event decoders), paid once per process;
+- resolution: building a `Web3BlockchainService`, as the DI container does several times per request,
+  against the ABI file read and contract object built by every resolution before the registry existed;
+- receipts: decoding the CertificateIssued logs of a batch issuance receipt with the precomputed
+  decoders against web3's `process_receipt`.
+
+`BLOCKCHAIN_ABI_PATH` (or `--abi-path`) must point to the Hardhat artifact of the registry; the other
+`BLOCKCHAIN_*` variables are only read, never used to reach a node.
+
+Usage:
+    python -m benchmarks.contract_binding --resolutions 2000 --batch-size 200
+"""
+
+import argparse
+import json
+import os
+import time
+from typing import Any, Callable, Dict, List
+
+from dotenv import load_dotenv
+from eth_abi import encode as abi_encode
+from hexbytes import HexBytes
+from web3 import AsyncWeb3, Web3
+from web3.datastructures import AttributeDict
+
+from certificado_verde_blockchain.certificates.infrastructure.web3 import (
+    ContractRegistry,
+    Eip1559FeeStrategy,
+    NonceManager,
+    SignatureVerifier,
+    SignerPool,
+    Web3BlockchainService,
+)
+from certificado_verde_blockchain.configuration import BlockchainConfig
+from certificado_verde_blockchain.shared.web3 import PooledAsyncHTTPProvider
+
+
+def timed(label: str, repeats: int, function: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    for _ in range(repeats):
+        function()
+    per_call = (time.perf_counter() - start) / repeats
+    print(f"{label:<44} {per_call * 1e6:>10.1f}us")
+    return per_call
+
+
+def legacy_contract(config: BlockchainConfig, web3_client: AsyncWeb3) -> Any:
+    """What every `Web3BlockchainService` resolution did before the registry: read the ABI, build the contract."""
+    with open(config.abi_path, "r", encoding="utf-8") as abi_file:
+        abi = json.loads(abi_file.read()).get("abi")
+    return web3_client.eth.contract(address=Web3.to_checksum_address(config.contract), abi=json.dumps(abi))
+
+
+def issued_receipt(registry: ContractRegistry, batch_size: int) -> AttributeDict:
+    """A synthetic receipt of a batch issuance, with logs laid out as the deployed registry version emits them."""
+    binding = registry.default
+    event_abi = next(
+        entry for entry in binding.abi if entry.get("type") == "event" and entry["name"] == "CertificateIssued"
+    )
+    owner = Web3.to_checksum_address("0x" + "11" * 20)
+
+    def value(abi_type: str, index: int) -> Any:
+        if abi_type.startswith("uint"):
+            return index + 1
+        if abi_type == "address":
+            return owner
+        certificate_hash = Web3.keccak(text=f"certificate-{index}")
+        return certificate_hash if abi_type == "bytes32" else certificate_hash.hex()
+
+    logs: List[AttributeDict] = []
+    for index in range(batch_size):
+        inputs = event_abi["inputs"]
+        indexed = [item for item in inputs if item.get("indexed")]
+        data = [item for item in inputs if not item.get("indexed")]
+        topics = [HexBytes(binding.events["CertificateIssued"].topic)]
+        topics += [HexBytes(abi_encode([item["type"]], [value(item["type"], index)])) for item in indexed]
+        log: Dict[str, Any] = {
+            "address": binding.address,
+            "topics": topics,
+            "data": HexBytes(
+                abi_encode([item["type"] for item in data], [value(item["type"], index) for item in data])
+            ),
+            "blockNumber": 1,
+            "blockHash": HexBytes(b"\x01" * 32),
+            "transactionHash": HexBytes(b"\x02" * 32),
+            "transactionIndex": 0,
+            "logIndex": index,
+            "removed": False,
+        }
+        logs.append(AttributeDict(log))
+    return AttributeDict({"logs": logs, "status": 1})
+
+
+def main(config: BlockchainConfig, resolutions: int, batch_size: int) -> None:
+    web3_client = AsyncWeb3(
+        PooledAsyncHTTPProvider(
+            config.provider_url,
+            pool_size=config.http_pool_size,
+            keepalive_seconds=config.http_keepalive_seconds,
+            timeout_seconds=config.http_timeout_seconds,
+        )
+    )
+
+    print("startup (once per process)")
+    timed("ContractRegistry", 20, lambda: ContractRegistry(config, web3_client))
+
+    registry = ContractRegistry(config, web3_client)
+    singletons = (
+        SignerPool(config),
+        NonceManager(web3_client),
+        SignatureVerifier(config.signature_workers, config.signature_cache_size, config.signature_chunk_size),
+        Eip1559FeeStrategy(config, web3_client),
+    )
+    signer_pool, nonce_manager, signature_verifier, fee_strategy = singletons
+
+    def resolve() -> Web3BlockchainService:
+        return Web3BlockchainService(
+            config, web3_client, registry, signer_pool, nonce_manager, signature_verifier, fee_strategy
+        )
+
+    print(f"\nresolution (several times per request, {resolutions} repeats)")
+    legacy = timed("ABI read + contract build (before)", resolutions, lambda: legacy_contract(config, web3_client))
+    current = timed("Web3BlockchainService with the registry", resolutions, resolve)
+    print(f"{'saved per resolution':<44} {(legacy - current) * 1e6:>10.1f}us")
+
+    receipt = issued_receipt(registry, batch_size)
+    contract = registry.default.contract
+    print(f"\nreceipt decoding ({batch_size} CertificateIssued logs)")
+    processed = timed("process_receipt", 20, lambda: contract.events.CertificateIssued().process_receipt(receipt))
+    decoded = timed("precomputed decoder", 20, lambda: registry.default.decode_receipt(receipt, "CertificateIssued"))
+    print(f"{'speedup':<44} {processed / decoded:>10.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--abi-path", help="Overrides BLOCKCHAIN_ABI_PATH")
+    parser.add_argument("--resolutions", type=int, default=2000, help="Number of service resolutions timed")
+    parser.add_argument("--batch-size", type=int, default=200, help="Number of logs in the decoded receipt")
+    args = parser.parse_args()
+
+    load_dotenv()
+    if args.abi_path:
+        os.environ["BLOCKCHAIN_ABI_PATH"] = args.abi_path
+    main(BlockchainConfig.from_env(), args.resolutions, args.batch_size)
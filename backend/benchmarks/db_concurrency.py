@@ -0,0 +1,195 @@
+"""Compares the requests per second of a database-backed endpoint on the synchronous and the asyncio database layers.
+
+A small FastAPI app is served by uvicorn in a background thread, with two routes looking up a product by ID:
+
+- `GET /sync/products/{id}`: the repository as it was before the asyncio layer, a psycopg2 `Session` queried
+  from the `async def` endpoint, which blocks the event loop for the duration of every query;
+- `GET /async/products/{id}`: `SqlProductRepository` on the `AsyncSession` of a request scope over asyncpg,
+  as the API resolves it.
+
+Both engines get the pool size and overflow of the `DATABASE_*` settings, as the application does.
+`--clients` concurrent clients hit each route in turn for `--duration` seconds, then the requests per second,
+p50/p99 latencies and errors of both layers are reported, with the checkout waits and peak utilization of the
+asyncio pool. `--query-delay-ms` adds a `pg_sleep` to every
+lookup, standing in for a slower query or a remote database.
+
+Products are registered first through the application handlers. Requires PostgreSQL with the migrations
+applied and the `DATABASE_*` variables set.
+
+Usage:
+    python -m benchmarks.db_concurrency --clients 200 --duration 20
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import threading
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import AsyncIterator, Dict, List, Optional
+from uuid import UUID
+
+import sqlalchemy as sa
+import uvicorn
+from aiohttp import ClientSession, TCPConnector
+from dotenv import load_dotenv
+from fastapi import Depends, FastAPI, Response
+from miraveja_di import DIContainer
+from sqlalchemy.ext.asyncio import AsyncEngine as DatabaseEngine
+from sqlalchemy.ext.asyncio import AsyncSession as DatabaseSession
+from sqlalchemy.orm import Session, sessionmaker
+
+from certificado_verde_blockchain.configuration import DatabaseConfig
+from certificado_verde_blockchain.products.domain import Product
+from certificado_verde_blockchain.products.infrastructure.sql import SqlProductRepository
+from certificado_verde_blockchain.products.infrastructure.sql.product_entity import ProductEntity
+from certificado_verde_blockchain.shared.http import request_scoped
+from certificado_verde_blockchain.shared.sql import DatabaseRouter, SqlUnitOfWork
+from tests.support.container import build_container
+from tests.support.seeding import seed_entities
+
+from .issuance_pipeline.instrumentation import percentile
+
+
+def legacy_find_product(session: Session, product_id: str) -> Optional[Product]:
+    """What `SqlProductRepository.find_by_id` ran before the asyncio layer."""
+    product_entity = session.query(ProductEntity).filter_by(id=product_id).first()
+    return product_entity.to_domain() if product_entity else None
+
+
+def product_response(product: Optional[Product]) -> Response:
+    return Response(
+        content=json.dumps(product.model_dump() if product else None),
+        status_code=200 if product else 404,
+        media_type="application/json",
+    )
+
+
+def create_app(container: DIContainer, query_delay_seconds: float) -> FastAPI:
+    config = container.resolve(DatabaseConfig)
+    legacy_engine = sa.create_engine(
+        config.database_url, pool_size=config.max_connections, max_overflow=config.max_overflow
+    )
+    legacy_sessions = sessionmaker(bind=legacy_engine, autoflush=False, autocommit=False)
+    delay = sa.select(sa.func.pg_sleep(query_delay_seconds))
+
+    @asynccontextmanager
+    async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+        yield
+        legacy_engine.dispose()
+        await container.resolve(DatabaseEngine).dispose()
+
+    app = FastAPI(lifespan=lifespan)
+
+    @app.get("/sync/products/{product_id}")
+    async def find_product_sync(product_id: str):
+        session = legacy_sessions()
+        try:
+            if query_delay_seconds:
+                session.execute(delay)
+            return product_response(legacy_find_product(session, product_id))
+        finally:
+            session.close()
+
+    @app.get("/async/products/{product_id}")
+    async def find_product_async(
+        product_id: str, session: DatabaseSession = Depends(request_scoped(container, DatabaseSession))
+    ):
+        if query_delay_seconds:
+            await session.execute(delay)
+        return product_response(
+            await SqlProductRepository(session, SqlUnitOfWork(session)).find_by_id(UUID(product_id))
+        )
+
+    return app
+
+
+async def seed(container: DIContainer, count: int) -> List[UUID]:
+    run_id = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
+    entities = await seed_entities(container, run_id, count)
+    # The asyncpg connections belong to this event loop, the server runs on another one
+    await container.resolve(DatabaseEngine).dispose()
+    return entities["products"]
+
+
+async def load(base_url: str, product_ids: List[UUID], clients: int, duration: float) -> Dict[str, float]:
+    latencies: List[float] = []
+    errors = [0]
+    deadline = time.perf_counter() + duration
+
+    async def client(session: ClientSession) -> None:
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            async with session.get(f"{base_url}/{random.choice(product_ids)}") as response:
+                await response.read()
+                if response.status != 200:
+                    errors[0] += 1
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    # The default connector opens at most 100 connections, fewer than the clients
+    async with ClientSession(connector=TCPConnector(limit=clients)) as session:
+        start = time.perf_counter()
+        await asyncio.gather(*(client(session) for _ in range(clients)))
+        seconds = time.perf_counter() - start
+
+    ordered = sorted(latencies)
+    return {
+        "requests": len(ordered),
+        "errors": errors[0],
+        "rps": len(ordered) / seconds,
+        "p50": percentile(ordered, 0.5),
+        "p99": percentile(ordered, 0.99),
+    }
+
+
+async def run(container: DIContainer, base_url: str, product_ids: List[UUID], clients: int, duration: float) -> None:
+    results: Dict[str, Dict[str, float]] = {}
+    for layer in ("sync", "async"):
+        results[layer] = await load(f"{base_url}/{layer}/products", product_ids, clients, duration)
+        result = results[layer]
+        print(
+            f"{layer:<6} clients={clients} requests={result['requests']:<7} errors={result['errors']:<5} "
+            f"rps={result['rps']:8.1f} p50={result['p50']:8.2f}ms p99={result['p99']:8.2f}ms"
+        )
+    print(f"async/sync throughput: {results['async']['rps'] / max(results['sync']['rps'], 1e-9):.2f}x")
+    pool = container.resolve(DatabaseRouter).metrics()["primary"]
+    print(
+        f"async pool: capacity={pool['capacity']} peak_utilization={pool['peak_utilization']:.0%} "
+        f"checkout_wait p50={pool['checkout_wait_p50_ms']:.2f}ms p99={pool['checkout_wait_p99_ms']:.2f}ms "
+        f"timeouts={pool['timeouts']}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=200, help="Concurrent HTTP clients")
+    parser.add_argument("--duration", type=float, default=20, help="Seconds of load on each layer")
+    parser.add_argument("--products", type=int, default=50, help="Products registered and looked up")
+    parser.add_argument("--query-delay-ms", type=float, default=0, help="pg_sleep added to every lookup")
+    parser.add_argument("--port", type=int, default=8766, help="Port of the benchmark server")
+    args = parser.parse_args()
+
+    load_dotenv()
+    container = build_container()
+    print(f"Registering {args.products} products...")
+    product_ids = asyncio.run(seed(container, args.products))
+
+    server = uvicorn.Server(
+        uvicorn.Config(create_app(container, args.query_delay_ms / 1000), port=args.port, log_level="warning")
+    )
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.1)
+
+    try:
+        asyncio.run(run(container, f"http://127.0.0.1:{args.port}", product_ids, args.clients, args.duration))
+    finally:
+        server.should_exit = True
+        thread.join()
+
+
+if __name__ == "__main__":
+    main()
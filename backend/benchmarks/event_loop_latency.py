@@ -0,0 +1,134 @@
+"""Measures the latency of an unrelated GET endpoint while certificates are being issued.
+
+A small FastAPI app exposing `GET /health` and `POST /issue` (backed by the real `Web3BlockchainService`)
+is served by uvicorn in a background thread. The client first probes `/health` on an idle server, then
+keeps issuing certificates while probing again, and reports p50/p95/p99 for both phases. Blocking calls
+on the server's event loop show up directly as a higher p99 under load.
+
+Requires a local Hardhat node with the contract deployed and the `BLOCKCHAIN_*` variables set.
+
+Usage:
+    python -m benchmarks.event_loop_latency --duration 20 --issuers 50
+"""
+
+import argparse
+import asyncio
+import statistics
+import threading
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List
+
+import uvicorn
+from aiohttp import ClientSession
+from dotenv import load_dotenv
+from fastapi import FastAPI
+from web3 import Web3
+
+from certificado_verde_blockchain.configuration import BlockchainConfig
+
+from .concurrent_issuance import authorize_signers, build_service, issue_certificates
+
+
+def create_app(config: BlockchainConfig) -> FastAPI:
+    service, signer_pool = build_service(config)
+    owner = signer_pool.signers[0].address
+
+    @asynccontextmanager
+    async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+        await authorize_signers(service, signer_pool, config)
+        yield
+        await service.web3_client.provider.disconnect()
+
+    app = FastAPI(lifespan=lifespan)
+
+    @app.get("/health")
+    async def health():
+        return {"status": "healthy"}
+
+    @app.post("/issue")
+    async def issue():
+        certificate_hash = Web3.keccak(text=f"latency-{time.time_ns()}").hex()
+        return {"id": (await issue_certificates(service, [(certificate_hash, owner)]))[0]}
+
+    return app
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def report(label: str, samples: List[float]) -> None:
+    if not samples:
+        print(f"{label:<10} no samples")
+        return
+    print(
+        f"{label:<10} n={len(samples):<6} mean={statistics.mean(samples):7.2f}ms "
+        f"p50={percentile(samples, 0.50):7.2f}ms p95={percentile(samples, 0.95):7.2f}ms "
+        f"p99={percentile(samples, 0.99):7.2f}ms max={max(samples):7.2f}ms"
+    )
+
+
+async def probe(session: ClientSession, base_url: str, duration: float, interval: float) -> List[float]:
+    samples: List[float] = []
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        async with session.get(f"{base_url}/health") as response:
+            await response.read()
+        samples.append((time.perf_counter() - start) * 1000)
+        await asyncio.sleep(interval)
+    return samples
+
+
+async def issue_forever(session: ClientSession, base_url: str, stop: asyncio.Event, issued: List[int]) -> None:
+    while not stop.is_set():
+        async with session.post(f"{base_url}/issue") as response:
+            await response.read()
+            if response.status == 200:
+                issued[0] += 1
+
+
+async def run(base_url: str, duration: float, issuers: int, interval: float) -> None:
+    async with ClientSession() as session:
+        idle = await probe(session, base_url, duration, interval)
+
+        stop = asyncio.Event()
+        issued = [0]
+        workers = [asyncio.create_task(issue_forever(session, base_url, stop, issued)) for _ in range(issuers)]
+        loaded = await probe(session, base_url, duration, interval)
+        stop.set()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+    report("idle", idle)
+    report("issuing", loaded)
+    print(f"Issued {issued[0]} certificates with {issuers} concurrent clients in {duration:.0f}s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--duration", type=float, default=20, help="Seconds of probing for each phase")
+    parser.add_argument("--issuers", type=int, default=50, help="Concurrent clients issuing certificates")
+    parser.add_argument("--interval-ms", type=float, default=10, help="Pause between two GET probes")
+    parser.add_argument("--port", type=int, default=8765, help="Port of the benchmark server")
+    args = parser.parse_args()
+
+    load_dotenv()
+    server = uvicorn.Server(
+        uvicorn.Config(create_app(BlockchainConfig.from_env()), port=args.port, log_level="warning")
+    )
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.1)
+
+    try:
+        asyncio.run(run(f"http://127.0.0.1:{args.port}", args.duration, args.issuers, args.interval_ms / 1000))
+    finally:
+        server.should_exit = True
+        thread.join()
+
+
+if __name__ == "__main__":
+    main()
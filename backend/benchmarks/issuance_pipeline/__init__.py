@@ -0,0 +1,28 @@
+"""Measures certificate issuance end to end and where its time goes, stage by stage.
+
+Runs against a local Hardhat node (or `BLOCKCHAIN_BACKEND=in_process`), a stand-in S3 (MinIO) and Postgres
+migrated to the latest revision, configured through the usual variables (see `.env_example`):
+
+    npx hardhat node && npx hardhat run scripts/deploy.js --network localhost   # in blockchain/
+    docker compose up -d database minio
+
+Products, producers and certifiers are registered through their handlers, then pre-certificates; each is
+signed with one of `--keys` generated certifier keys, as `examples/sign_certificate.js` does. The signed
+pre-certificates are issued through `IssueCertificateHandler` with `--concurrency` requests at a time, while
+the issuance workers drain the outbox, until every certificate is confirmed on chain.
+
+The handler and workers run unchanged: the dependencies of each stage are replaced in the DI container by
+timed wrappers. The JSON report holds the settings and commit, the sustained certificates per second (first
+request to last confirmation) and, for every stage, the count, mean, p50/p90/p99, max and a histogram:
+
+- issue_request: the whole `IssueCertificateHandler.handle` call;
+- hashing, signature_check, canonical_build, qr_render, upload: its steps;
+- db_commit: the unit of work committed by the request, writing the outbox, and by every worker round;
+- db_claim, chain_sign, chain_send: the workers claiming tasks, signing and sending the transactions;
+- receipt_poll: the receipt requests;
+- receipt_wait: from a certificate's transaction being sent to its confirmation;
+- end_to_end: from the issuance request to the confirmation.
+
+Usage:
+    python -m benchmarks.issuance_pipeline --count 500 --concurrency 32 --output issuance.json
+"""
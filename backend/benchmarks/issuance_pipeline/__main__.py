@@ -0,0 +1,174 @@
+import argparse
+import asyncio
+import json
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from dotenv import load_dotenv
+from miraveja_di import DIContainer
+from sqlalchemy.ext.asyncio import AsyncSession as DatabaseSession
+from web3 import AsyncWeb3
+
+from certificado_verde_blockchain.auditors_and_certifiers.infrastructure import AuditorsAndCertifiersDependencies
+from certificado_verde_blockchain.certificates.application import IssueCertificateCommand, IssueCertificateHandler
+from certificado_verde_blockchain.certificates.infrastructure import CertificatesDependencies
+from certificado_verde_blockchain.certificates.infrastructure.web3 import SignatureVerifier, Web3BlockchainService
+from certificado_verde_blockchain.certificates.infrastructure.workers import IssuanceWorkerPool
+from certificado_verde_blockchain.configuration import BlockchainConfig
+from certificado_verde_blockchain.dependencies import AppDependencies
+from certificado_verde_blockchain.producers.infrastructure import ProducerDependencies
+from certificado_verde_blockchain.products.infrastructure import ProductDependencies
+from tests.support.seeding import SignedPreCertificate, seed_entities, seed_pre_certificates, sign_pre_certificates
+
+from ..concurrent_issuance import authorize_signers
+from . import __doc__ as DESCRIPTION
+from .instrumentation import StageRecorder, register_timed_dependencies, sustained_throughput
+
+
+def build_container(recorder: StageRecorder) -> DIContainer:
+    container = DIContainer()
+    register_timed_dependencies(container, recorder)
+    AppDependencies.register_dependencies(container)
+    ProductDependencies.register_dependencies(container)
+    ProducerDependencies.register_dependencies(container)
+    AuditorsAndCertifiersDependencies.register_dependencies(container)
+    CertificatesDependencies.register_dependencies(container)
+    return container
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def issue(
+    container: DIContainer, recorder: StageRecorder, signed: List[SignedPreCertificate], concurrency: int
+) -> List[str]:
+    """Issue every signed pre-certificate as `POST /certificates/{id}/issue` does, `concurrency` at a time."""
+    semaphore = asyncio.Semaphore(concurrency)
+    errors: List[str] = []
+
+    async def issue_one(pre_certificate: SignedPreCertificate) -> None:
+        async with semaphore:
+            with container.create_scope() as scope:
+                recorder.start(pre_certificate.certificate_id)
+                try:
+                    with recorder.time("issue_request"):
+                        await scope.resolve(IssueCertificateHandler).handle(
+                            pre_certificate.certificate_id,
+                            IssueCertificateCommand(
+                                certifier_address=pre_certificate.certifier_address,
+                                certifier_signature=pre_certificate.certifier_signature,
+                            ),
+                        )
+                except Exception as e:
+                    errors.append(f"{pre_certificate.certificate_id}: {e}")
+                finally:
+                    await scope.resolve(DatabaseSession).close()
+
+    await asyncio.gather(*(issue_one(pre_certificate) for pre_certificate in signed))
+    return errors
+
+
+async def wait_for_confirmations(recorder: StageRecorder, expected: int, timeout_seconds: float) -> bool:
+    deadline = time.monotonic() + timeout_seconds
+    while len(recorder.confirmed) + len(recorder.failed) < expected:
+        if time.monotonic() > deadline:
+            return False
+        await asyncio.sleep(0.1)
+    return True
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    recorder = StageRecorder()
+    container = build_container(recorder)
+    config = container.resolve(BlockchainConfig)
+    service = container.resolve(Web3BlockchainService)
+    await authorize_signers(service, service.signer_pool, config)
+
+    run_at = datetime.now(timezone.utc)
+    run_id = run_at.strftime("%Y%m%d%H%M%S")
+    print(
+        f"Seeding {args.entities} products, producers and certifiers and {args.count} pre-certificates...",
+        file=sys.stderr,
+    )
+    entities = await seed_entities(container, run_id, args.entities)
+    pre_certificate_ids = await seed_pre_certificates(container, entities, args.count, args.version)
+    signed = await sign_pre_certificates(container, pre_certificate_ids, args.keys)
+
+    # Only the issuance itself is measured, not the seeding
+    recorder.samples.clear()
+    worker_pool = container.resolve(IssuanceWorkerPool)
+    worker_pool.start()
+    print(f"Issuing {len(signed)} certificates with concurrency {args.concurrency}...", file=sys.stderr)
+    started_at = time.perf_counter()
+    errors = await issue(container, recorder, signed, args.concurrency)
+    accepted_seconds = time.perf_counter() - started_at
+    completed = await wait_for_confirmations(recorder, len(signed) - len(errors), args.timeout)
+    await worker_pool.stop()
+    container.resolve(SignatureVerifier).shutdown()
+    await container.resolve(AsyncWeb3).provider.disconnect()
+
+    return {
+        "commit": git_commit(),
+        "run_at": run_at.isoformat(),
+        "python": platform.python_version(),
+        "settings": {
+            "count": args.count,
+            "concurrency": args.concurrency,
+            "certifier_keys": args.keys,
+            "schema_version": args.version,
+            "backend": config.backend,
+            "anchoring_mode": config.anchoring_mode,
+            "issuance_workers": config.issuance_workers,
+            "issuance_batch_max_size": config.issuance_batch_max_size,
+            "issuance_poll_interval_ms": config.issuance_poll_interval_ms,
+            "signers": len(config.all_private_keys),
+        },
+        "results": {
+            "accepted": len(signed) - len(errors),
+            "confirmed": len(recorder.confirmed),
+            "failed": len(recorder.failed),
+            "timed_out": not completed,
+            "accepted_per_second": round((len(signed) - len(errors)) / accepted_seconds, 3),
+            "certificates_per_second": round(sustained_throughput(recorder, started_at), 3),
+            "errors": errors[:10] + list(recorder.failed.values())[:10],
+        },
+        "stages": recorder.report(),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=DESCRIPTION, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=200, help="Number of certificates issued")
+    parser.add_argument("--concurrency", type=int, default=16, help="Issuance requests handled at the same time")
+    parser.add_argument("--entities", type=int, default=10, help="Products, producers and certifiers seeded")
+    parser.add_argument("--keys", type=int, default=10, help="Generated certifier signing keys")
+    parser.add_argument("--version", default="2.0", help="Schema version of the pre-certificates")
+    parser.add_argument("--timeout", type=float, default=600, help="Seconds to wait for the confirmations")
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout")
+    args = parser.parse_args()
+
+    load_dotenv()
+    report = asyncio.run(run(args))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            json.dump(report, output_file, indent=2)
+        print(f"Report written to {args.output}", file=sys.stderr)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    if report["results"]["timed_out"] or report["results"]["failed"]:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
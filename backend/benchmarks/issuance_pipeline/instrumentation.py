@@ -0,0 +1,188 @@
+import inspect
+import math
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Mapping
+from uuid import UUID
+
+from miraveja_di import DIContainer
+
+from certificado_verde_blockchain.certificates.domain import (
+    CanonicalCertificateService,
+    Certificate,
+    IBlockchainService,
+    ICertifierService,
+    IFileService,
+    IIssuanceTaskRepository,
+    IProducerService,
+    IProductService,
+    IssuanceTask,
+    IssuanceTaskStatus,
+    IStorageService,
+)
+from certificado_verde_blockchain.certificates.infrastructure.minio import MinioStorageService
+from certificado_verde_blockchain.certificates.infrastructure.pillow import PillowFileService
+from certificado_verde_blockchain.certificates.infrastructure.sql import SqlIssuanceTaskRepository
+from certificado_verde_blockchain.certificates.infrastructure.web3 import Web3BlockchainService
+from certificado_verde_blockchain.shared.domain import IUnitOfWork
+from certificado_verde_blockchain.shared.sql import SqlUnitOfWork
+
+# Upper bounds of the latency histogram buckets, in milliseconds (the last bucket is unbounded)
+HISTOGRAM_BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 30000)
+
+
+def percentile(ordered: List[float], fraction: float) -> float:
+    return ordered[min(len(ordered) - 1, math.ceil(fraction * len(ordered)) - 1)]
+
+
+class StageRecorder:
+    """Collects the latency samples of every issuance stage and the lifecycle of each certificate."""
+
+    def __init__(self) -> None:
+        self.samples: Dict[str, List[float]] = defaultdict(list)
+        self.started: Dict[UUID, float] = {}
+        self.submitted: Dict[UUID, float] = {}
+        self.confirmed: Dict[UUID, float] = {}
+        self.failed: Dict[UUID, str] = {}
+
+    @contextmanager
+    def time(self, stage: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.samples[stage].append(time.perf_counter() - start)
+
+    def start(self, certificate_id: UUID) -> None:
+        self.started[certificate_id] = time.perf_counter()
+
+    def observe_tasks(self, tasks: List[IssuanceTask]) -> None:
+        """Follow the outbox tasks saved by the issuance handler and the workers."""
+        now = time.perf_counter()
+        for task in tasks:
+            certificate_id = task.certificate_id
+            if task.status == IssuanceTaskStatus.SUBMITTED and certificate_id not in self.submitted:
+                self.submitted[certificate_id] = now
+            elif task.status == IssuanceTaskStatus.CONFIRMED and certificate_id not in self.confirmed:
+                self.confirmed[certificate_id] = now
+                if certificate_id in self.submitted:
+                    self.samples["receipt_wait"].append(now - self.submitted[certificate_id])
+                if certificate_id in self.started:
+                    self.samples["end_to_end"].append(now - self.started[certificate_id])
+            elif task.status == IssuanceTaskStatus.FAILED:
+                self.failed[certificate_id] = task.last_error or "failed"
+
+    def report(self) -> Dict[str, Dict[str, Any]]:
+        """Count, mean, percentiles and histogram of every stage, in milliseconds."""
+        stages: Dict[str, Dict[str, Any]] = {}
+        for stage, samples in sorted(self.samples.items()):
+            ordered = sorted(seconds * 1000 for seconds in samples)
+            buckets = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+            for milliseconds in ordered:
+                buckets[next((i for i, b in enumerate(HISTOGRAM_BOUNDS_MS) if milliseconds <= b), -1)] += 1
+            stages[stage] = {
+                "count": len(ordered),
+                "mean_ms": round(sum(ordered) / len(ordered), 3),
+                "p50_ms": round(percentile(ordered, 0.5), 3),
+                "p90_ms": round(percentile(ordered, 0.9), 3),
+                "p99_ms": round(percentile(ordered, 0.99), 3),
+                "max_ms": round(ordered[-1], 3),
+                "histogram": {
+                    **{f"le_{bound}ms": count for bound, count in zip(HISTOGRAM_BOUNDS_MS, buckets)},
+                    "inf": buckets[-1],
+                },
+            }
+        return stages
+
+
+class Timed:
+    """Delegates to a dependency, recording the latency of the listed methods under their stage name."""
+
+    def __init__(self, target: Any, recorder: StageRecorder, stages: Mapping[str, str]) -> None:
+        self._target = target
+        self._recorder = recorder
+        self._stages = stages
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._target, name)
+        stage = self._stages.get(name)
+        if stage is None:
+            return attribute
+        recorder = self._recorder
+
+        if inspect.iscoroutinefunction(attribute):
+
+            async def timed_coroutine(*args: Any, **kwargs: Any) -> Any:
+                with recorder.time(stage):
+                    return await attribute(*args, **kwargs)
+
+            return timed_coroutine
+
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            with recorder.time(stage):
+                return attribute(*args, **kwargs)
+
+        return timed
+
+
+class TimedTaskRepository(Timed):
+    """Reports every saved task to the recorder; the writes are timed when the unit of work commits them."""
+
+    async def save(self, tasks: List[IssuanceTask], certificates: List[Certificate], delay_seconds: float = 0) -> None:
+        await self._target.save(tasks, certificates, delay_seconds=delay_seconds)
+        self._recorder.observe_tasks(tasks)
+
+
+def register_timed_dependencies(container: DIContainer, recorder: StageRecorder) -> None:
+    """Register timed wrappers of the dependencies of every issuance stage.
+
+    The container keeps the first registration of a type, so this must run before the bounded contexts
+    register their own dependencies; the handlers and workers then resolve the wrappers unchanged.
+    """
+    container.register_transients(
+        {
+            IBlockchainService: lambda container: Timed(
+                container.resolve(Web3BlockchainService),
+                recorder,
+                {
+                    "hash_data": "hashing",
+                    "verify_signature": "signature_check",
+                    "prepare_certificates": "chain_sign",
+                    "prepare_anchor": "chain_sign",
+                    "broadcast_transaction": "chain_send",
+                    "get_issuance_receipts": "receipt_poll",
+                },
+            ),
+            CanonicalCertificateService: lambda container: Timed(
+                CanonicalCertificateService(
+                    container.resolve(ICertifierService),
+                    container.resolve(IProducerService),
+                    container.resolve(IProductService),
+                ),
+                recorder,
+                {"build_canonical": "canonical_build"},
+            ),
+            IFileService: lambda container: Timed(
+                container.resolve(PillowFileService), recorder, {"generate_qr_code_file": "qr_render"}
+            ),
+            IStorageService: lambda container: Timed(
+                container.resolve(MinioStorageService), recorder, {"upload_qr_code": "upload"}
+            ),
+            IIssuanceTaskRepository: lambda container: TimedTaskRepository(
+                container.resolve(SqlIssuanceTaskRepository), recorder, {"claim": "db_claim"}
+            ),
+        }
+    )
+    container.register_scoped(
+        {
+            IUnitOfWork: lambda container: Timed(container.resolve(SqlUnitOfWork), recorder, {"commit": "db_commit"}),
+        }
+    )
+
+
+def sustained_throughput(recorder: StageRecorder, started_at: float) -> float:
+    """Certificates confirmed on chain per second, from the first issuance request to the last confirmation."""
+    if not recorder.confirmed:
+        return 0.0
+    return len(recorder.confirmed) / max(max(recorder.confirmed.values()) - started_at, 1e-9)
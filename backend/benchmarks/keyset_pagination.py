@@ -0,0 +1,139 @@
+"""Measures the latency of fetching one page of certificates by keyset and by offset, deep into a large table.
+
+`--rows` synthetic certificates (1M by default) are inserted server-side over `--owners` products, producers and
+certifiers, so each product owns `rows / owners` certificates. Pages of `--page-size` certificates of one product
+are then fetched at several depths of its list (first page, middle, end), `--repeats` times each:
+
+- `keyset`: `ListCertificatesByOwnerHandler`, as `GET /products/{id}/certificates?cursor=...` runs it, seeking
+  `ix_certificates_product_id_id` right after the ID of the cursor;
+- `offset`: the same page with `ORDER BY id OFFSET n`, which reads and discards every row before it;
+- `unpaginated`: every certificate of the product at once, as `find_by_product_id` returned them before.
+
+The p50/p99 latencies of each are reported per depth. The synthetic certificates are deleted at the end unless
+`--keep` is given. Requires PostgreSQL with the migrations applied and the `DATABASE_*` variables set.
+
+Usage:
+    python -m benchmarks.keyset_pagination --rows 1000000 --owners 20 --page-size 50 --repeats 50
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, List, Optional
+from uuid import UUID
+
+import sqlalchemy as sa
+from dotenv import load_dotenv
+from miraveja_di import DIContainer
+from sqlalchemy.ext.asyncio import AsyncSession as DatabaseSession
+
+from certificado_verde_blockchain.certificates.application import ListCertificatesByOwnerHandler
+from certificado_verde_blockchain.certificates.infrastructure import CertificatesDependencies
+from certificado_verde_blockchain.certificates.infrastructure.sql.certificate_entity import CertificateEntity
+from certificado_verde_blockchain.shared.models import PageRequest
+from tests.support.container import build_container
+from tests.support.seeding import delete_synthetic_certificates, insert_synthetic_certificates, seed_entities
+
+from .issuance_pipeline.instrumentation import percentile
+
+DEPTHS = (0.0, 0.5, 0.99)
+
+
+async def in_scope(container: DIContainer, run: Callable[[DIContainer], Awaitable[None]]) -> float:
+    """Run `run` in a new request scope, as a request would, and return its duration in milliseconds."""
+    with container.create_scope() as scope:
+        try:
+            start = time.perf_counter()
+            await run(scope)
+            return (time.perf_counter() - start) * 1000
+        finally:
+            await scope.resolve(DatabaseSession).close()
+
+
+def owner_query(product_id: UUID) -> sa.Select:
+    return sa.select(CertificateEntity).where(CertificateEntity.product_id == str(product_id))
+
+
+async def cursor_at(container: DIContainer, product_id: UUID, offset: int) -> Optional[UUID]:
+    """The ID the cursor of the page starting at `offset` carries."""
+    if offset == 0:
+        return None
+    after_ids: List[Optional[UUID]] = []
+
+    async def find(scope: DIContainer) -> None:
+        query = sa.select(CertificateEntity.id).where(CertificateEntity.product_id == str(product_id))
+        after_id = await scope.resolve(DatabaseSession).scalar(
+            query.order_by(CertificateEntity.id).offset(offset - 1).limit(1)
+        )
+        after_ids.append(UUID(after_id))
+
+    await in_scope(container, find)
+    return after_ids[0]
+
+
+def report(query: str, depth: float, samples: List[float]) -> None:
+    ordered = sorted(samples)
+    print(
+        f"{query:<12} depth={depth:>4.0%} samples={len(ordered):<4} "
+        f"p50={percentile(ordered, 0.5):9.2f}ms p99={percentile(ordered, 0.99):9.2f}ms"
+    )
+
+
+async def run(container: DIContainer, rows: int, owners: int, page_size: int, repeats: int, keep: bool) -> None:
+    run_id = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
+    version = f"benchmark-{run_id}"
+    print(f"Registering {owners} products, producers and certifiers...")
+    entities = await seed_entities(container, run_id, owners)
+    print(f"Inserting {rows} certificates...")
+    start = time.perf_counter()
+    await insert_synthetic_certificates(container, entities, rows, version)
+    print(f"Inserted in {time.perf_counter() - start:.1f}s")
+
+    product_id = entities["products"][0]
+    owned = rows // owners
+    try:
+        for depth in DEPTHS:
+            offset = int(owned * depth)
+            after_id = await cursor_at(container, product_id, offset)
+            page = PageRequest(after_id=after_id, limit=page_size)
+
+            async def keyset(scope: DIContainer) -> None:
+                await scope.resolve(ListCertificatesByOwnerHandler).handle("product", product_id, None, page)
+
+            async def by_offset(scope: DIContainer) -> None:
+                query = owner_query(product_id).order_by(CertificateEntity.id).offset(offset).limit(page_size + 1)
+                certificate_entities = (await scope.resolve(DatabaseSession).scalars(query)).all()
+                [entity.to_domain().model_dump() for entity in certificate_entities[:page_size]]
+
+            report("keyset", depth, [await in_scope(container, keyset) for _ in range(repeats)])
+            report("offset", depth, [await in_scope(container, by_offset) for _ in range(repeats)])
+
+        async def unpaginated(scope: DIContainer) -> None:
+            certificate_entities = (await scope.resolve(DatabaseSession).scalars(owner_query(product_id))).all()
+            [entity.to_domain().model_dump() for entity in certificate_entities]
+
+        report("unpaginated", 1.0, [await in_scope(container, unpaginated) for _ in range(max(1, repeats // 10))])
+    finally:
+        if not keep:
+            print("Deleting the synthetic certificates...")
+            await delete_synthetic_certificates(container, version)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Synthetic certificates inserted")
+    parser.add_argument("--owners", type=int, default=20, help="Products, producers and certifiers they spread over")
+    parser.add_argument("--page-size", type=int, default=50, help="Certificates per page")
+    parser.add_argument("--repeats", type=int, default=50, help="Fetches of each page")
+    parser.add_argument("--keep", action="store_true", help="Keep the synthetic certificates")
+    args = parser.parse_args()
+
+    load_dotenv()
+    container = build_container()
+    CertificatesDependencies.register_dependencies(container)
+    asyncio.run(run(container, args.rows, args.owners, args.page_size, args.repeats, args.keep))
+
+
+if __name__ == "__main__":
+    main()
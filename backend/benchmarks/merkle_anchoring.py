@@ -0,0 +1,76 @@
+"""Measures the Merkle tree behind the epoch anchoring mode (`BLOCKCHAIN_ANCHORING_MODE=merkle`).
+
+A tree is built over random 32-byte canonical hashes (1M by default), timing the leaf hashing and the tree
+levels separately. Inclusion proofs are then built for every leaf, as the issuance workers do for an epoch,
+and a sample is verified both on raw bytes (`MerkleTree.verify`) and through the hex encoded proofs stored
+with each certificate (`MerkleInclusionProof.includes`, as used by the certificate validation).
+
+No blockchain node or database is needed.
+
+Usage:
+    python -m benchmarks.merkle_anchoring --leaves 1000000 --verifications 100000
+"""
+
+import argparse
+import os
+import random
+import time
+
+from certificado_verde_blockchain.certificates.domain import MerkleInclusionProof
+from certificado_verde_blockchain.shared.merkle import MerkleTree
+
+
+def main(leaves: int, verifications: int) -> None:
+    certificate_hashes = [os.urandom(32).hex() for _ in range(leaves)]
+
+    start = time.perf_counter()
+    leaf_nodes = [MerkleTree.leaf(certificate_hash) for certificate_hash in certificate_hashes]
+    leaf_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    tree = MerkleTree(leaf_nodes)
+    tree_seconds = time.perf_counter() - start
+    print(
+        f"leaves={leaves} hash_leaves={leaf_seconds:.2f}s build_tree={tree_seconds:.2f}s "
+        f"total={leaf_seconds + tree_seconds:.2f}s root=0x{tree.root.hex()}"
+    )
+
+    start = time.perf_counter()
+    proof_length = 0
+    for index in range(leaves):
+        proof_length = max(proof_length, len(tree.proof(index)))
+    proof_seconds = time.perf_counter() - start
+    print(
+        f"proofs={leaves} time={proof_seconds:.2f}s per_proof={proof_seconds / leaves * 1e6:.1f}us "
+        f"max_length={proof_length} hashes ({proof_length * 32} bytes)"
+    )
+
+    sample = random.sample(range(leaves), min(verifications, leaves))
+    proofs = [(index, tree.proof(index)) for index in sample]
+    start = time.perf_counter()
+    assert all(MerkleTree.verify(leaf_nodes[index], proof, tree.root) for index, proof in proofs)
+    raw_seconds = time.perf_counter() - start
+
+    root = "0x" + tree.root.hex()
+    stored = [
+        (
+            certificate_hashes[index],
+            MerkleInclusionProof(root=root, leaf_index=index, path=["0x" + node.hex() for node in proof], epoch_id="1"),
+        )
+        for index, proof in proofs
+    ]
+    start = time.perf_counter()
+    assert all(merkle_proof.includes(certificate_hash) for certificate_hash, merkle_proof in stored)
+    stored_seconds = time.perf_counter() - start
+    print(
+        f"verifications={len(sample)} raw={raw_seconds / len(sample) * 1e6:.1f}us "
+        f"stored_proof={stored_seconds / len(sample) * 1e6:.1f}us per certificate"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--leaves", type=int, default=1_000_000, help="Number of certificate hashes in the tree")
+    parser.add_argument("--verifications", type=int, default=100_000, help="Number of proofs verified")
+    args = parser.parse_args()
+    main(args.leaves, args.verifications)
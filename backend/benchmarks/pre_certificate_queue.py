@@ -0,0 +1,140 @@
+"""Shows that listing the pre-certificate queue costs the same however many certificates were already issued.
+
+`--pending` pre-issued and failed certificates are inserted over `--owners` products, producers and certifiers,
+then issued certificates are added step by step until the table holds each count of `--issued` (10k to 5M by
+default). At every step, pages of `--page-size` pre-certificates are fetched `--repeats` times:
+
+- `queue`: the first page of `GET /certificates/pre/`, through `ListPreCertificatesHandler`, served by the
+  partial index `ix_certificates_pre_issued_id`;
+- `certifier`: the first page of one certifier (`?certifier_id=`), served by
+  `ix_certificates_pre_issued_certifier_id_id`;
+- `legacy`: what the handler did before, every certificate loaded and filtered on `is_pre_issued` in Python,
+  measured only while there are at most `--legacy-max-rows` issued certificates.
+
+The p50/p99 latencies are reported per step. The synthetic certificates are deleted at the end unless `--keep`
+is given. Requires PostgreSQL with the migrations applied and the `DATABASE_*` variables set.
+
+Usage:
+    python -m benchmarks.pre_certificate_queue --issued 10000,100000,1000000,5000000 --pending 500
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import List
+
+import sqlalchemy as sa
+from dotenv import load_dotenv
+from miraveja_di import DIContainer
+from sqlalchemy.ext.asyncio import AsyncSession as DatabaseSession
+
+from certificado_verde_blockchain.certificates.application import ListPreCertificatesHandler
+from certificado_verde_blockchain.certificates.domain import PRE_ISSUED_STATUSES, CertificateStatus
+from certificado_verde_blockchain.certificates.infrastructure import CertificatesDependencies
+from certificado_verde_blockchain.certificates.infrastructure.sql.certificate_entity import CertificateEntity
+from certificado_verde_blockchain.shared.models import PageRequest
+from tests.support.container import build_container
+from tests.support.seeding import delete_synthetic_certificates, insert_synthetic_certificates, seed_entities
+
+from .issuance_pipeline.instrumentation import percentile
+from .keyset_pagination import in_scope
+
+
+def report(query: str, issued: int, samples: List[float]) -> None:
+    ordered = sorted(samples)
+    print(
+        f"{query:<10} issued={issued:<9} samples={len(ordered):<4} "
+        f"p50={percentile(ordered, 0.5):9.2f}ms p99={percentile(ordered, 0.99):9.2f}ms"
+    )
+
+
+async def run(
+    container: DIContainer,
+    steps: List[int],
+    pending: int,
+    owners: int,
+    page_size: int,
+    repeats: int,
+    legacy_max_rows: int,
+    keep: bool,
+) -> None:
+    run_id = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
+    version = f"benchmark-{run_id}"
+    print(f"Registering {owners} products, producers and certifiers...")
+    entities = await seed_entities(container, run_id, owners)
+    print(f"Inserting {pending} pending certificates...")
+    await insert_synthetic_certificates(container, entities, pending, version, PRE_ISSUED_STATUSES)
+
+    certifier_id = entities["certifiers"][0]
+    page = PageRequest(limit=page_size)
+
+    async def queue(scope: DIContainer) -> None:
+        await scope.resolve(ListPreCertificatesHandler).handle(None, page)
+
+    async def certifier(scope: DIContainer) -> None:
+        await scope.resolve(ListPreCertificatesHandler).handle(certifier_id, page)
+
+    async def legacy(scope: DIContainer) -> None:
+        certificate_entities = (await scope.resolve(DatabaseSession).scalars(sa.select(CertificateEntity))).all()
+        certificates = [entity.to_domain() for entity in certificate_entities]
+        [certificate.model_dump() for certificate in certificates if certificate.is_pre_issued]
+
+    issued = 0
+    try:
+        for step in sorted(steps):
+            print(f"Inserting {step - issued} issued certificates...")
+            start = time.perf_counter()
+            await insert_synthetic_certificates(
+                container, entities, step - issued, version, (CertificateStatus.ISSUED,)
+            )
+            print(f"Inserted in {time.perf_counter() - start:.1f}s")
+            issued = step
+
+            report("queue", issued, [await in_scope(container, queue) for _ in range(repeats)])
+            report("certifier", issued, [await in_scope(container, certifier) for _ in range(repeats)])
+            if issued <= legacy_max_rows:
+                report("legacy", issued, [await in_scope(container, legacy) for _ in range(max(1, repeats // 10))])
+    finally:
+        if not keep:
+            print("Deleting the synthetic certificates...")
+            await delete_synthetic_certificates(container, version)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--issued",
+        type=lambda value: [int(step) for step in value.split(",")],
+        default=[10_000, 100_000, 1_000_000, 5_000_000],
+        help="Comma separated counts of issued certificates to measure at",
+    )
+    parser.add_argument("--pending", type=int, default=500, help="Pre-issued and failed certificates in the queue")
+    parser.add_argument("--owners", type=int, default=10, help="Products, producers and certifiers they spread over")
+    parser.add_argument("--page-size", type=int, default=50, help="Pre-certificates per page")
+    parser.add_argument("--repeats", type=int, default=50, help="Fetches of each page per step")
+    parser.add_argument(
+        "--legacy-max-rows", type=int, default=100_000, help="Issued certificates above which legacy is skipped"
+    )
+    parser.add_argument("--keep", action="store_true", help="Keep the synthetic certificates")
+    args = parser.parse_args()
+
+    load_dotenv()
+    container = build_container()
+    CertificatesDependencies.register_dependencies(container)
+    asyncio.run(
+        run(
+            container,
+            args.issued,
+            args.pending,
+            args.owners,
+            args.page_size,
+            args.repeats,
+            args.legacy_max_rows,
+            args.keep,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""Exercises the multi-endpoint routing of the blockchain provider with two local Hardhat nodes.
+
+Start two nodes and deploy the registry on both with the same account, so it gets the same address:
+
+    npx hardhat node --port 8545
+    npx hardhat node --port 8546
+    npx hardhat run scripts/deploy.js --network localhost   # and again against the node on 8546
+
+Each node is reached through a local proxy that can add latency, add latency spikes to a share of the
+requests, or answer 503 as if the node were down. The `--upstreams` are the node URLs (by default the
+configured `BLOCKCHAIN_PROVIDER_URL` and `BLOCKCHAIN_PROVIDER_URLS`). Reads go through the service
+(`count_certificates`) and nonce queries through the pinned endpoint. For every scenario, the share of
+requests each node served, the read latency percentiles and the failed calls are reported:
+
+- baseline: both nodes as they are;
+- slow: the first node gets `--latency-ms` more, so reads should move to the second;
+- spikes: both nodes answer `--spike-ratio` of the requests `--latency-ms` late, with and without hedged
+  reads (`BLOCKCHAIN_PROVIDER_HEDGE_DELAY_MS` must be below `--latency-ms`);
+- outage: the first node, which holds the write pin, answers 503, so reads and nonce queries fail over.
+
+Usage:
+    python -m benchmarks.rpc_failover --reads 500 --latency-ms 200 --spike-ratio 0.1
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from contextlib import nullcontext
+from typing import Any, ContextManager, List, Optional
+
+from aiohttp import ClientSession, web
+from dotenv import load_dotenv
+
+from certificado_verde_blockchain.configuration import BlockchainConfig
+from certificado_verde_blockchain.shared.web3 import RoutingAsyncProvider, hedged_reads
+
+from .concurrent_issuance import build_service
+
+
+class LatencyProxy:
+    """Forwards JSON-RPC requests to a node, with induced latency, spikes or outage."""
+
+    def __init__(self, upstream: str, port: int) -> None:
+        self.upstream = upstream
+        self.port = port
+        self.latency_seconds = 0.0
+        self.spike_ratio = 0.0
+        self.spike_seconds = 0.0
+        self.down = False
+        self.requests = 0
+        self._session: Optional[ClientSession] = None
+        self._runner: Optional[web.AppRunner] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    async def start(self) -> None:
+        self._session = ClientSession()
+        app = web.Application()
+        app.router.add_post("/", self._forward)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, "127.0.0.1", self.port).start()
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+        if self._session is not None:
+            await self._session.close()
+
+    async def _forward(self, request: web.Request) -> web.Response:
+        if self.down:
+            return web.Response(status=503)
+        self.requests += 1
+        body = await request.read()
+        delay = self.latency_seconds
+        if random.random() < self.spike_ratio:
+            delay += self.spike_seconds
+        await asyncio.sleep(delay)
+        assert self._session is not None
+        async with self._session.post(
+            self.upstream, data=body, headers={"Content-Type": "application/json"}
+        ) as response:
+            return web.Response(body=await response.read(), status=response.status, content_type="application/json")
+
+
+async def scenario(
+    name: str, config: BlockchainConfig, proxies: List[LatencyProxy], reads: int, routing: ContextManager[Any]
+) -> None:
+    service, signer_pool = build_service(config)
+    provider = service.web3_client.provider
+    assert isinstance(provider, RoutingAsyncProvider)
+    address = signer_pool.signers[0].address
+    for proxy in proxies:
+        proxy.requests = 0
+
+    latencies: List[float] = []
+    failures = 0
+    with routing:
+        for index in range(reads):
+            start = time.perf_counter()
+            try:
+                if index % 10 == 0:
+                    await service.web3_client.eth.get_transaction_count(address, "pending")
+                else:
+                    await service.count_certificates()
+            except Exception:
+                failures += 1
+                continue
+            latencies.append(time.perf_counter() - start)
+    await provider.disconnect()
+
+    total = sum(proxy.requests for proxy in proxies) or 1
+    shares = " ".join(f"node{index}={proxy.requests / total:.0%}" for index, proxy in enumerate(proxies, 1))
+    percentiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else [0.0] * 99
+    print(
+        f"{name:<18} {shares} p50={percentiles[49] * 1000:.1f}ms p95={percentiles[94] * 1000:.1f}ms p99={percentiles[98] * 1000:.1f}ms "
+        f"failures={failures} write_pin={provider.write_endpoint.url}"
+    )
+
+
+async def main(upstreams: List[str], reads: int, latency_ms: float, spike_ratio: float, base_port: int) -> None:
+    proxies = [LatencyProxy(upstream, base_port + index) for index, upstream in enumerate(upstreams)]
+    for proxy in proxies:
+        await proxy.start()
+    config = BlockchainConfig.from_env().model_copy(
+        update={"provider_url": proxies[0].url, "provider_urls": [proxy.url for proxy in proxies[1:]]}
+    )
+    first = proxies[0]
+
+    try:
+        await scenario("baseline", config, proxies, reads, nullcontext())
+
+        first.latency_seconds = latency_ms / 1000
+        await scenario("slow first node", config, proxies, reads, nullcontext())
+        first.latency_seconds = 0
+
+        for proxy in proxies:
+            proxy.spike_ratio, proxy.spike_seconds = spike_ratio, latency_ms / 1000
+        await scenario("spikes", config, proxies, reads, nullcontext())
+        await scenario("spikes, hedged", config, proxies, reads, hedged_reads())
+        for proxy in proxies:
+            proxy.spike_ratio = 0
+
+        first.down = True
+        await scenario("first node down", config, proxies, reads, nullcontext())
+    finally:
+        for proxy in proxies:
+            await proxy.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--upstreams", help="Comma separated URLs of the two nodes (defaults to the configuration)")
+    parser.add_argument("--reads", type=int, default=500, help="Number of calls per scenario")
+    parser.add_argument("--latency-ms", type=float, default=200, help="Induced latency and spike duration")
+    parser.add_argument("--spike-ratio", type=float, default=0.1, help="Share of the requests delayed by a spike")
+    parser.add_argument("--base-port", type=int, default=18545, help="Port of the first proxy")
+    args = parser.parse_args()
+
+    load_dotenv()
+    if args.upstreams:
+        upstreams = [url.strip() for url in args.upstreams.split(",") if url.strip()]
+    else:
+        upstreams = BlockchainConfig.from_env().all_provider_urls
+    if len(upstreams) < 2:
+        raise SystemExit("Two nodes are needed: pass --upstreams or set BLOCKCHAIN_PROVIDER_URLS.")
+    asyncio.run(main(upstreams, args.reads, args.latency_ms, args.spike_ratio, args.base_port))
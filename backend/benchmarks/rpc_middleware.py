@@ -0,0 +1,98 @@
+"""Measures what JSON-RPC batching and response caching save on the reads of a reconciliation run.
+
+Seed a local Hardhat node first (`npm run seed-events` in `blockchain/`) and point `BLOCKCHAIN_CONTRACT` at the
+seeded registry. The first `--count` certificates are read twice in each mode, with the provider middleware
+disabled (`rpc_batch_max_size=1`, `rpc_cache_size=0`) and enabled with the configured settings:
+
+- bulk: the reconciliation read, `getCertificates` pages with read-ahead, at the latest block;
+- single: one `getCertificate` call per certificate, at a block `rpc_cache_confirmations` below the head
+  so the second pass can be answered by the cache.
+
+For every pass the HTTP requests sent to the node, the JSON-RPC calls they carried and the wall time are
+reported.
+
+Usage:
+    python -m benchmarks.rpc_middleware --count 1000 --page-size 100 --concurrency 8
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Awaitable
+
+from dotenv import load_dotenv
+
+from certificado_verde_blockchain.certificates.infrastructure.web3 import Web3BlockchainService
+from certificado_verde_blockchain.configuration import BlockchainConfig
+
+from .concurrent_issuance import build_service
+
+
+async def measure(label: str, service: Web3BlockchainService, read: Awaitable[int]) -> None:
+    provider = service.web3_client.provider
+    http_requests, rpc_calls = provider.http_requests, provider.rpc_calls
+    start = time.perf_counter()
+    certificates = await read
+    seconds = time.perf_counter() - start
+    print(
+        f"{label:<28} certificates={certificates:<6} http_requests={provider.http_requests - http_requests:<6} "
+        f"rpc_calls={provider.rpc_calls - rpc_calls:<6} time={seconds:.2f}s"
+    )
+
+
+async def bulk_read(service: Web3BlockchainService, count: int) -> int:
+    read = 0
+    async for page in service.read_certificates(1, count):
+        read += len(page)
+    return read
+
+
+async def single_reads(service: Web3BlockchainService, count: int, concurrency: int, block_number: int) -> int:
+    contract = service.contract
+    assert contract is not None
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def read(blockchain_id: int) -> None:
+        async with semaphore:
+            await contract.functions.getCertificate(blockchain_id).call(block_identifier=block_number)
+
+    await asyncio.gather(*(read(blockchain_id) for blockchain_id in range(1, count + 1)))
+    return count
+
+
+async def run(config: BlockchainConfig, count: int, concurrency: int) -> None:
+    modes = {
+        "without middleware": config.model_copy(update={"rpc_batch_max_size": 1, "rpc_cache_size": 0}),
+        "with middleware": config,
+    }
+    for mode, mode_config in modes.items():
+        print(mode)
+        service, _ = build_service(mode_config)
+        count = min(count, await service.count_certificates())
+        block_number = max(await service.web3_client.eth.block_number - config.rpc_cache_confirmations, 0)
+
+        for attempt in ("first", "second"):
+            await measure(f"bulk {attempt} pass", service, bulk_read(service, count))
+        for attempt in ("first", "second"):
+            await measure(
+                f"single {attempt} pass",
+                service,
+                single_reads(service, count, concurrency, block_number),
+            )
+        await service.web3_client.provider.disconnect()
+        print()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=1000, help="Number of certificates read per pass")
+    parser.add_argument("--page-size", type=int, help="Overrides BLOCKCHAIN_BULK_READ_PAGE_SIZE")
+    parser.add_argument("--concurrency", type=int, default=8, help="Read-ahead pages and concurrent single reads")
+    args = parser.parse_args()
+
+    load_dotenv()
+    overrides = {"bulk_read_page_size": args.page_size, "bulk_read_concurrency": args.concurrency}
+    config = BlockchainConfig.from_env().model_copy(
+        update={key: value for key, value in overrides.items() if value is not None}
+    )
+    asyncio.run(run(config, args.count, args.concurrency))
@@ -0,0 +1,93 @@
+"""Measures batch certifier signature verification throughput as worker processes are added.
+
+Generates signatures over random certificate hashes from a few certifier keys (in parallel, as signing is as
+slow as recovering without coincurve), then verifies all of them through `SignatureVerifier` with an
+increasing number of worker processes and a cold cache. A final pass over the same signatures shows the
+throughput of cache hits. Installing `coincurve` switches eth-keys to its native backend for every setting.
+
+Usage:
+    python -m benchmarks.signature_verification --count 50000 --workers 1,2,4,8
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+from eth_account import Account
+from eth_account.messages import encode_defunct
+from web3 import Web3
+
+from certificado_verde_blockchain.certificates.infrastructure.web3 import SignatureVerifier
+
+CERTIFIERS = 16
+CHUNK_SIZE = 128
+
+
+def sign_range(start: int, stop: int) -> List[Tuple[str, str, str]]:
+    signed: List[Tuple[str, str, str]] = []
+    for index in range(start, stop):
+        account = Account.from_key(Web3.keccak(text=f"certifier-{index % CERTIFIERS}"))
+        message_hash = Web3.keccak(text=f"certificate-{index}").hex()
+        signature = account.sign_message(encode_defunct(hexstr=message_hash)).signature.to_0x_hex()
+        signed.append((message_hash, signature, account.address))
+    return signed
+
+
+def generate(count: int) -> List[Tuple[str, str, str]]:
+    step = 1000
+    with ProcessPoolExecutor() as executor:
+        batches = executor.map(
+            sign_range, range(0, count, step), [min(start + step, count) for start in range(0, count, step)]
+        )
+        return [signed for batch in batches for signed in batch]
+
+
+async def verify(verifier: SignatureVerifier, signed: List[Tuple[str, str, str]]) -> Tuple[float, int]:
+    messages = [(message_hash, signature) for message_hash, signature, _ in signed]
+    invalid = 0
+    start = time.perf_counter()
+    async for index, (address, error) in verifier.recover_many(messages):
+        invalid += error is not None or address != signed[index][2]
+    return time.perf_counter() - start, invalid
+
+
+async def main(count: int, worker_levels: List[int]) -> None:
+    print(f"Signing {count} certificate hashes...")
+    signed = generate(count)
+    print(f"{os.cpu_count()} cores available")
+
+    baseline: Optional[float] = None
+    verifier: Optional[SignatureVerifier] = None
+    for workers in worker_levels:
+        verifier = SignatureVerifier(workers=workers, cache_size=count, chunk_size=CHUNK_SIZE)
+        # Start the worker processes before timing
+        await verifier.recover(*signed[0][:2])
+        seconds, invalid = await verify(verifier, signed[1:])
+        per_second = (count - 1) / seconds
+        baseline = baseline or per_second
+        print(
+            f"workers={workers:<3} time={seconds:.2f}s signatures/s={per_second:.0f} "
+            f"speedup={per_second / baseline:.2f}x invalid={invalid}"
+        )
+        if workers != worker_levels[-1]:
+            verifier.shutdown()
+
+    assert verifier is not None
+    seconds, _ = await verify(verifier, signed)
+    print(f"cached     time={seconds:.2f}s signatures/s={count / seconds:.0f}")
+    verifier.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=50000, help="Number of signatures to verify")
+    parser.add_argument(
+        "--workers",
+        default=",".join(str(2**power) for power in range(0, (os.cpu_count() or 1).bit_length())),
+        help="Comma separated worker process counts",
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.count, [int(workers) for workers in args.workers.split(",")]))
@@ -0,0 +1,134 @@
+"""Measures the time-to-inclusion of issuance transactions on a local Hardhat node with interval mining.
+
+Certificates are issued one transaction each at a steady rate while the base fee is periodically spiked with
+`hardhat_setNextBlockBaseFeePerGas`, simulating congestion. Every strategy is run in turn:
+
+- `static`: the original pricing, a fixed 2,000,000 gas limit and a 50 gwei legacy gas price, never replaced;
+- `eip1559`: `Eip1559FeeStrategy`, with stalled transactions replaced after `--replacement-after` seconds.
+
+For each strategy the distribution of the time from submission to receipt is reported, along with the
+average fee paid per certificate. The contract must be deployed and the `BLOCKCHAIN_*` variables set (see
+`.env_example`).
+
+Usage:
+    python -m benchmarks.transaction_inclusion --count 200 --rate 5 --block-time-ms 1000 --spike-gwei 200
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Dict, List, Optional
+
+from dotenv import load_dotenv
+from web3 import AsyncWeb3, Web3
+from web3.contract.async_contract import AsyncContractFunction
+from web3.types import RPCEndpoint, TxData, TxParams
+
+from certificado_verde_blockchain.certificates.infrastructure.web3 import Eip1559FeeStrategy, FeeStrategy
+from certificado_verde_blockchain.configuration import BlockchainConfig
+
+from .concurrent_issuance import authorize_signers, build_service, issue_certificates
+
+
+class StaticFeeStrategy(FeeStrategy):
+    """The pricing used before the fee strategy existed: fixed gas limit and gas price, no replacement."""
+
+    def __init__(self, config: BlockchainConfig, web3_client: AsyncWeb3) -> None:
+        self.web3_client = web3_client
+
+    async def transaction_fields(self, contract_function: AsyncContractFunction, sender: str) -> TxParams:
+        return {"gas": 2000000, "gasPrice": self.web3_client.to_wei(50, "gwei")}
+
+    async def replacement_fields(self, transaction: TxData) -> Optional[TxParams]:
+        return None
+
+
+STRATEGIES = {"static": StaticFeeStrategy, "eip1559": Eip1559FeeStrategy}
+
+
+async def rpc(web3_client: AsyncWeb3, method: str, params: List) -> None:
+    response = await web3_client.provider.make_request(RPCEndpoint(method), params)
+    if "error" in response:
+        raise SystemExit(f"{method} failed: {response['error']}")
+
+
+async def spike_base_fee(web3_client: AsyncWeb3, spike_gwei: int, every_seconds: float) -> None:
+    while True:
+        await asyncio.sleep(every_seconds)
+        await rpc(web3_client, "hardhat_setNextBlockBaseFeePerGas", [hex(Web3.to_wei(spike_gwei, "gwei"))])
+
+
+async def run_strategy(name: str, config: BlockchainConfig, args: argparse.Namespace) -> None:
+    service, signer_pool = build_service(config, STRATEGIES[name])
+    web3_client = service.web3_client
+    await authorize_signers(service, signer_pool, config)
+
+    owner = signer_pool.signers[0].address
+    run_id = time.time_ns()
+    balances: Dict[str, int] = {
+        signer.address: await web3_client.eth.get_balance(signer.address) for signer in signer_pool.signers
+    }
+
+    await rpc(web3_client, "evm_setAutomine", [False])
+    await rpc(web3_client, "evm_setIntervalMining", [args.block_time_ms])
+    spikes = asyncio.create_task(spike_base_fee(web3_client, args.spike_gwei, args.spike_every))
+
+    async def issue(index: int) -> float:
+        await asyncio.sleep(index / args.rate)
+        start = time.perf_counter()
+        await issue_certificates(service, [(Web3.keccak(text=f"inclusion-{run_id}-{index}").hex(), owner)])
+        return time.perf_counter() - start
+
+    try:
+        results = await asyncio.gather(*(issue(index) for index in range(args.count)), return_exceptions=True)
+    finally:
+        spikes.cancel()
+        await rpc(web3_client, "evm_setIntervalMining", [0])
+        await rpc(web3_client, "evm_setAutomine", [True])
+
+    spent = sum(balances[address] - await web3_client.eth.get_balance(address) for address in balances)
+    await web3_client.provider.disconnect()
+
+    timings = sorted(result for result in results if isinstance(result, float))
+    failures = [result for result in results if isinstance(result, BaseException)]
+    if len(timings) < 2:
+        print(f"{name:<8} included={len(timings)}/{args.count} (not enough samples)")
+    else:
+        percentiles = statistics.quantiles(timings, n=100)
+        print(
+            f"{name:<8} included={len(timings)}/{args.count} p50={percentiles[49]:.2f}s p90={percentiles[89]:.2f}s "
+            f"p99={percentiles[98]:.2f}s max={timings[-1]:.2f}s "
+            f"fee/cert={Web3.from_wei(spent // max(len(timings), 1), 'gwei'):.0f} gwei"
+        )
+    for failure in failures[:3]:
+        print(f"  failure: {failure}")
+
+
+async def main(args: argparse.Namespace) -> None:
+    load_dotenv()
+    config = BlockchainConfig.from_env().model_copy(
+        update={
+            "replacement_after_seconds": args.replacement_after,
+            "transaction_timeout_seconds": args.timeout,
+        }
+    )
+    print(
+        f"{args.count} issuances at {args.rate}/s, {args.block_time_ms}ms blocks, "
+        f"base fee spiked to {args.spike_gwei} gwei every {args.spike_every}s"
+    )
+    for name in args.strategies.split(","):
+        await run_strategy(name, config, args)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=200, help="Number of issuances per strategy")
+    parser.add_argument("--rate", type=float, default=5, help="Issuances submitted per second")
+    parser.add_argument("--block-time-ms", type=int, default=1000, help="Interval mining block time")
+    parser.add_argument("--spike-gwei", type=int, default=200, help="Base fee set by each congestion spike")
+    parser.add_argument("--spike-every", type=float, default=15, help="Seconds between congestion spikes")
+    parser.add_argument("--replacement-after", type=int, default=3, help="Overrides REPLACEMENT_AFTER_SECONDS")
+    parser.add_argument("--timeout", type=int, default=120, help="Overrides TRANSACTION_TIMEOUT_SECONDS")
+    parser.add_argument("--strategies", default="static,eip1559", help=f"Comma separated: {', '.join(STRATEGIES)}")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,214 @@
+"""Counts the SQL statements of registering a pre-certificate and of issuing it, one request at a time.
+
+`--count` pre-certificates are registered over `--entities` products, producers and certifiers through
+`RegisterPreCertificateHandler`, signed, and issued through `IssueCertificateHandler`, each in its own scope as a
+request is. Every statement sent to the database is counted, by its first keyword, with a
+`before_cursor_execute` listener, and every commit with a `commit` listener. Both handlers run twice:
+
+- `unit_of_work`: finds served from the identity map of the scope, and the saved rows written on commit with
+  one `INSERT ... ON CONFLICT DO UPDATE` per table;
+- `legacy`: what saving did before, no identity map and every saved entity `merge()`d (a SELECT of its row,
+  then an INSERT or UPDATE) and committed. Each measured request saves once, so one commit per save is
+  one commit per request, as before.
+
+The mean statements per request are reported for each, with the p50 latency. The certificates and their
+issuance tasks are deleted at the end unless `--keep` is given. Requires PostgreSQL with the migrations applied
+and MinIO, configured through the usual variables (see `.env_example`); no blockchain transaction is sent.
+
+Usage:
+    python -m benchmarks.unit_of_work --count 50
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Type
+from uuid import UUID
+
+import sqlalchemy as sa
+from dotenv import load_dotenv
+from miraveja_di import DIContainer
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncEngine as DatabaseEngine
+from sqlalchemy.ext.asyncio import AsyncSession as DatabaseSession
+
+from certificado_verde_blockchain.auditors_and_certifiers.infrastructure import AuditorsAndCertifiersDependencies
+from certificado_verde_blockchain.certificates.application import (
+    IssueCertificateCommand,
+    IssueCertificateHandler,
+    RegisterPreCertificateCommand,
+    RegisterPreCertificateHandler,
+)
+from certificado_verde_blockchain.certificates.domain import Norm, SustainabilityCriteria
+from certificado_verde_blockchain.certificates.infrastructure import CertificatesDependencies
+from certificado_verde_blockchain.certificates.infrastructure.web3 import SignatureVerifier
+from certificado_verde_blockchain.dependencies import AppDependencies
+from certificado_verde_blockchain.producers.infrastructure import ProducerDependencies
+from certificado_verde_blockchain.products.infrastructure import ProductDependencies
+from certificado_verde_blockchain.shared.sql import Base, DatabaseRouter, SqlUnitOfWork
+from tests.support.seeding import delete_synthetic_certificates, seed_entities, sign_pre_certificates
+
+from .issuance_pipeline.instrumentation import percentile
+
+
+class MergeUnitOfWork(SqlUnitOfWork):
+    """What the repositories did before the unit of work: no identity map, every saved entity merged."""
+
+    def __init__(self, database_session: DatabaseSession):
+        super().__init__(database_session)
+        self._session = database_session
+        self._entities: List[Base] = []
+
+    def find(self, domain_type: Type[Any], object_id: UUID) -> Optional[Any]:
+        return None
+
+    def track(self, domain_object: BaseModel) -> None:
+        pass
+
+    def stage(self, entity: Base, conflict_message: str) -> None:
+        self._entities.append(entity)
+
+    async def commit(self) -> None:
+        entities, self._entities = self._entities, []
+        try:
+            for entity in entities:
+                await self._session.merge(entity)
+            await self._session.commit()
+        except:
+            await self._session.rollback()
+            raise
+
+
+class StatementCounter:
+    """Counts the statements sent through the engines of a container, by first keyword, and the commits."""
+
+    def __init__(self, router: DatabaseRouter) -> None:
+        self.counts: Counter = Counter()
+        for engine in [router.primary, *(replica.engine for replica in router.replicas)]:
+            sa.event.listen(engine.sync_engine, "before_cursor_execute", self._on_execute)
+            sa.event.listen(engine.sync_engine, "commit", self._on_commit)
+
+    def _on_execute(self, connection: Any, cursor: Any, statement: str, *args: Any) -> None:
+        self.counts[statement.split(None, 1)[0].upper()] += 1
+
+    def _on_commit(self, connection: Any) -> None:
+        self.counts["COMMIT"] += 1
+
+
+def build_container(legacy: bool) -> DIContainer:
+    container = DIContainer()
+    if legacy:
+        # Registered first, the container keeps it over the unit of work of AppDependencies
+        container.register_scoped(
+            {SqlUnitOfWork: lambda container: MergeUnitOfWork(container.resolve(DatabaseSession))}
+        )
+    AppDependencies.register_dependencies(container)
+    ProductDependencies.register_dependencies(container)
+    ProducerDependencies.register_dependencies(container)
+    AuditorsAndCertifiersDependencies.register_dependencies(container)
+    CertificatesDependencies.register_dependencies(container)
+    return container
+
+
+async def counted(
+    container: DIContainer, counter: StatementCounter, run: Callable[[DIContainer], Awaitable[Any]]
+) -> Tuple[Any, Counter, float]:
+    """Run `run` in a new request scope, returning its result, the statements it sent and its milliseconds."""
+    with container.create_scope() as scope:
+        try:
+            before = counter.counts.copy()
+            start = time.perf_counter()
+            result = await run(scope)
+            return result, counter.counts - before, (time.perf_counter() - start) * 1000
+        finally:
+            await scope.resolve(DatabaseSession).close()
+
+
+def report(mode: str, request: str, samples: List[Tuple[Counter, float]]) -> None:
+    total: Counter = sum((statements for statements, _ in samples), Counter())
+    statements = sum(count for keyword, count in total.items() if keyword != "COMMIT")
+    detail = ", ".join(f"{keyword} {count / len(samples):.2f}" for keyword, count in sorted(total.items()))
+    latencies = sorted(milliseconds for _, milliseconds in samples)
+    print(
+        f"{mode:<12} {request:<9} requests={len(samples):<5} statements={statements / len(samples):6.2f} "
+        f"p50={percentile(latencies, 0.5):8.2f}ms ({detail})"
+    )
+
+
+async def measure(mode: str, container: DIContainer, entities: Dict[str, List[UUID]], count: int, version: str) -> None:
+    counter = StatementCounter(container.resolve(DatabaseRouter))
+
+    registrations: List[Tuple[Counter, float]] = []
+    pre_certificate_ids: List[UUID] = []
+    for _ in range(count):
+        command = RegisterPreCertificateCommand(
+            product_id=random.choice(entities["products"]),
+            version=version,
+            producer_id=random.choice(entities["producers"]),
+            certifier_id=random.choice(entities["certifiers"]),
+            norms_complied=[Norm.FSC],
+            sustainability_criteria=[SustainabilityCriteria.LEGAL_ORIGIN],
+            notes="Benchmark pre-certificate",
+        )
+        registered, statements, milliseconds = await counted(
+            container, counter, lambda scope: scope.resolve(RegisterPreCertificateHandler).handle(command)
+        )
+        pre_certificate_ids.append(UUID(registered["pre_certificate"]["id"]))
+        registrations.append((statements, milliseconds))
+    report(mode, "register", registrations)
+
+    issuances: List[Tuple[Counter, float]] = []
+    for signed in await sign_pre_certificates(container, pre_certificate_ids, 1):
+        command = IssueCertificateCommand(
+            certifier_address=signed.certifier_address, certifier_signature=signed.certifier_signature
+        )
+        _, statements, milliseconds = await counted(
+            container,
+            counter,
+            lambda scope: scope.resolve(IssueCertificateHandler).handle(signed.certificate_id, command),
+        )
+        issuances.append((statements, milliseconds))
+    report(mode, "issue", issuances)
+
+
+async def run(count: int, entities_count: int, keep: bool) -> None:
+    run_id = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
+    version = f"uow-{run_id}"
+    containers = {"legacy": build_container(legacy=True), "unit_of_work": build_container(legacy=False)}
+    entities = await seed_entities(containers["unit_of_work"], run_id, entities_count)
+    try:
+        for mode, container in containers.items():
+            await measure(mode, container, entities, count, version)
+    finally:
+        if not keep:
+            print("Deleting the benchmark certificates and their issuance tasks...")
+            async with containers["unit_of_work"].resolve(DatabaseEngine).begin() as connection:
+                await connection.execute(
+                    sa.text(
+                        "DELETE FROM certificate_issuance_tasks WHERE certificate_id IN "
+                        "(SELECT id FROM certificates WHERE version = :version)"
+                    ),
+                    {"version": version},
+                )
+            await delete_synthetic_certificates(containers["unit_of_work"], version)
+        for container in containers.values():
+            container.resolve(SignatureVerifier).shutdown()
+            await container.resolve(DatabaseRouter).dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=50, help="Pre-certificates registered and issued per mode")
+    parser.add_argument("--entities", type=int, default=5, help="Products, producers and certifiers to seed")
+    parser.add_argument("--keep", action="store_true", help="Keep the certificates and issuance tasks")
+    args = parser.parse_args()
+
+    load_dotenv()
+    asyncio.run(run(args.count, args.entities, args.keep))
+
+
+if __name__ == "__main__":
+    main()
@@ -15,7 +15,7 @@ class FindAuditorByIdHandler:
     async def handle(self, auditor_id: UUID) -> Dict[str, Any]:
         await self._logger.info(f"Finding auditor with ID: {auditor_id}")
 
-        auditor: Optional[Auditor] = self._repository.find_by_id(auditor_id)
+        auditor: Optional[Auditor] = await self._repository.find_by_id(auditor_id)
 
         if auditor:
             await self._logger.info(f"Auditor found: {auditor}")
@@ -15,7 +15,7 @@ class FindCertifierByIdHandler:
     async def handle(self, certifier_id: UUID) -> Dict[str, Any]:
         await self._logger.info(f"Finding certifier with ID: {certifier_id}")
 
-        certifier: Optional[Certifier] = self._repository.find_by_id(certifier_id)
+        certifier: Optional[Certifier] = await self._repository.find_by_id(certifier_id)
 
         if certifier:
             await self._logger.info(f"Certifier found: {certifier}")
@@ -1,8 +1,9 @@
-from typing import Any, Dict, List
+from typing import Any, Dict
 
 from miraveja_log import IAsyncLogger
 
-from ..domain import Auditor, IAuditorRepository
+from ...shared.models import PageRequest
+from ..domain import IAuditorRepository
 
 
 class ListAllAuditorsHandler:
@@ -10,11 +11,11 @@ class ListAllAuditorsHandler:
         self._repository = repository
         self._logger = logger
 
-    async def handle(self) -> Dict[str, Any]:
-        await self._logger.info("Listing all auditors")
+    async def handle(self, page: PageRequest) -> Dict[str, Any]:
+        await self._logger.info(f"Listing auditors after {page.after_id}")
 
-        auditors: List[Auditor] = self._repository.list_all()
+        auditors, next_cursor = page.page(await self._repository.list_page(page.after_id, page.fetch_limit))
 
-        await self._logger.info(f"Found {len(auditors)} auditors")
+        await self._logger.info(f"Found {len(auditors)} auditors in the page")
 
-        return {"auditors": [auditor.model_dump() for auditor in auditors]}
+        return {"auditors": [auditor.model_dump() for auditor in auditors], "next_cursor": next_cursor}
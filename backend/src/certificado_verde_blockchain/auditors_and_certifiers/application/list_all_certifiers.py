@@ -1,8 +1,9 @@
-from typing import Any, Dict, List
+from typing import Any, Dict
 
 from miraveja_log import IAsyncLogger
 
-from ..domain import Certifier, ICertifierRepository
+from ...shared.models import PageRequest
+from ..domain import ICertifierRepository
 
 
 class ListAllCertifiersHandler:
@@ -10,11 +11,11 @@ class ListAllCertifiersHandler:
         self._repository = repository
         self._logger = logger
 
-    async def handle(self) -> Dict[str, Any]:
-        await self._logger.info("Listing all certifiers")
+    async def handle(self, page: PageRequest) -> Dict[str, Any]:
+        await self._logger.info(f"Listing certifiers after {page.after_id}")
 
-        certifiers: List[Certifier] = self._repository.list_all()
+        certifiers, next_cursor = page.page(await self._repository.list_page(page.after_id, page.fetch_limit))
 
-        await self._logger.info(f"Found {len(certifiers)} certifiers")
+        await self._logger.info(f"Found {len(certifiers)} certifiers in the page")
 
-        return {"certifiers": [certifier.model_dump() for certifier in certifiers]}
+        return {"certifiers": [certifier.model_dump() for certifier in certifiers], "next_cursor": next_cursor}
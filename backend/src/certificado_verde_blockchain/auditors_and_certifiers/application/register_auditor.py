@@ -5,6 +5,7 @@ from pydantic import BaseModel, Field
 
 from miraveja_log import IAsyncLogger
 
+from ...shared.domain import IUnitOfWork
 from ...shared.models import Document
 from ..domain import Auditor, IAuditorRepository
 
@@ -15,8 +16,9 @@ class RegisterAuditorCommand(BaseModel):
 
 
 class RegisterAuditorHandler:
-    def __init__(self, repository: IAuditorRepository, logger: IAsyncLogger):
+    def __init__(self, repository: IAuditorRepository, unit_of_work: IUnitOfWork, logger: IAsyncLogger):
         self._repository = repository
+        self._unit_of_work = unit_of_work
         self._logger = logger
 
     async def handle(self, command: RegisterAuditorCommand) -> Dict[str, Any]:
@@ -28,7 +30,8 @@ class RegisterAuditorHandler:
             document=command.document,
         )
 
-        self._repository.save(auditor)
+        await self._repository.save(auditor)
+        await self._unit_of_work.commit()
 
         await self._logger.info(f"Auditor registered with ID: {auditor.id}")
 
@@ -5,6 +5,7 @@ from pydantic import BaseModel, Field
 
 from miraveja_log import IAsyncLogger
 
+from ...shared.domain import IUnitOfWork
 from ...shared.models import Document
 from ..domain import Auditor, Certifier, ICertifierRepository
 
@@ -16,8 +17,9 @@ class RegisterCertifierCommand(BaseModel):
 
 
 class RegisterCertifierHandler:
-    def __init__(self, repository: ICertifierRepository, logger: IAsyncLogger):
+    def __init__(self, repository: ICertifierRepository, unit_of_work: IUnitOfWork, logger: IAsyncLogger):
         self._repository = repository
+        self._unit_of_work = unit_of_work
         self._logger = logger
 
     async def handle(self, command: RegisterCertifierCommand) -> Dict[str, Any]:
@@ -30,7 +32,8 @@ class RegisterCertifierHandler:
             auditors=command.auditors,
         )
 
-        self._repository.save(certifier)
+        await self._repository.save(certifier)
+        await self._unit_of_work.commit()
 
         await self._logger.info(f"Certifier registered with ID: {certifier.id}")
 
@@ -7,13 +7,13 @@ from .auditor import Auditor
 
 class IAuditorRepository(ABC):
     @abstractmethod
-    def list_all(self) -> List[Auditor]:
+    async def list_page(self, after_id: Optional[UUID], limit: int) -> List[Auditor]:
         pass
 
     @abstractmethod
-    def find_by_id(self, auditor_id: UUID) -> Optional[Auditor]:
+    async def find_by_id(self, auditor_id: UUID) -> Optional[Auditor]:
         pass
 
     @abstractmethod
-    def save(self, auditor: Auditor) -> None:
+    async def save(self, auditor: Auditor) -> None:
         pass
@@ -7,13 +7,13 @@ from .certifier import Certifier
 
 class ICertifierRepository(ABC):
     @abstractmethod
-    def list_all(self) -> List[Certifier]:
+    async def list_page(self, after_id: Optional[UUID], limit: int) -> List[Certifier]:
         pass
 
     @abstractmethod
-    def find_by_id(self, certifier_id: UUID) -> Optional[Certifier]:
+    async def find_by_id(self, certifier_id: UUID) -> Optional[Certifier]:
         pass
 
     @abstractmethod
-    def save(self, certifier: Certifier) -> None:
+    async def save(self, certifier: Certifier) -> None:
         pass
@@ -1,8 +1,10 @@
 import json
+from typing import Optional
 from uuid import UUID
 
 from fastapi import Response, status
 
+from ....shared.models import PageRequest
 from ...application import (
     FindAuditorByIdHandler,
     FindCertifierByIdHandler,
@@ -32,8 +34,8 @@ class AuditorsAndCertifiersController:
         self._find_certifier_by_id_handler = find_certifier_by_id_handler
         self._register_certifier_handler = register_certifier_handler
 
-    async def list_all_auditors(self) -> Response:
-        auditors = await self._list_all_auditors_handler.handle()
+    async def list_all_auditors(self, cursor: Optional[str], limit: int) -> Response:
+        auditors = await self._list_all_auditors_handler.handle(PageRequest.from_cursor(cursor, limit))
         return Response(content=json.dumps(auditors), media_type="application/json")
 
     async def find_auditor_by_id(self, auditor_id: str) -> Response:
@@ -44,8 +46,8 @@ class AuditorsAndCertifiersController:
         auditor = await self._register_auditor_handler.handle(command)
         return Response(content=json.dumps(auditor), media_type="application/json", status_code=status.HTTP_201_CREATED)
 
-    async def list_all_certifiers(self) -> Response:
-        certifiers = await self._list_all_certifiers_handler.handle()
+    async def list_all_certifiers(self, cursor: Optional[str], limit: int) -> Response:
+        certifiers = await self._list_all_certifiers_handler.handle(PageRequest.from_cursor(cursor, limit))
         return Response(content=json.dumps(certifiers), media_type="application/json")
 
     async def find_certifier_by_id(self, certifier_id: str) -> Response:
@@ -1,6 +1,10 @@
-from fastapi import APIRouter
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
 from miraveja_di import DIContainer
 
+from ....shared.http import request_scoped
+from ....shared.models import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from ...application import RegisterAuditorCommand, RegisterCertifierCommand
 from .auditors_and_certifiers_controller import AuditorsAndCertifiersController
 
@@ -14,28 +18,44 @@ class AuditorsAndCertifiersRoutes:
             router (APIRouter): The FastAPI router to register routes on.
             container (DIContainer): The dependency injection container.
         """
-        controller = container.resolve(AuditorsAndCertifiersController)
+        get_controller = request_scoped(container, AuditorsAndCertifiersController)
 
         @router.get("/auditors/")
-        async def list_all_auditors():
-            return await controller.list_all_auditors()
+        async def list_all_auditors(
+            cursor: Optional[str] = None,
+            limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+            controller: AuditorsAndCertifiersController = Depends(get_controller),
+        ):
+            return await controller.list_all_auditors(cursor, limit)
 
         @router.get("/auditors/{auditor_id}")
-        async def find_auditor_by_id(auditor_id: str):
+        async def find_auditor_by_id(
+            auditor_id: str, controller: AuditorsAndCertifiersController = Depends(get_controller)
+        ):
             return await controller.find_auditor_by_id(auditor_id)
 
         @router.post("/auditors/", status_code=201)
-        async def register_auditor(command: RegisterAuditorCommand):
+        async def register_auditor(
+            command: RegisterAuditorCommand, controller: AuditorsAndCertifiersController = Depends(get_controller)
+        ):
             return await controller.register_auditor(command)
 
         @router.get("/certifiers/")
-        async def list_all_certifiers():
-            return await controller.list_all_certifiers()
+        async def list_all_certifiers(
+            cursor: Optional[str] = None,
+            limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+            controller: AuditorsAndCertifiersController = Depends(get_controller),
+        ):
+            return await controller.list_all_certifiers(cursor, limit)
 
         @router.get("/certifiers/{certifier_id}")
-        async def find_certifier_by_id(certifier_id: str):
+        async def find_certifier_by_id(
+            certifier_id: str, controller: AuditorsAndCertifiersController = Depends(get_controller)
+        ):
             return await controller.find_certifier_by_id(certifier_id)
 
         @router.post("/certifiers/", status_code=201)
-        async def register_certifier(command: RegisterCertifierCommand):
+        async def register_certifier(
+            command: RegisterCertifierCommand, controller: AuditorsAndCertifiersController = Depends(get_controller)
+        ):
             return await controller.register_certifier(command)
@@ -1,51 +1,53 @@
 from typing import List, Optional
 from uuid import UUID
 
-from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session as DatabaseSession
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession as DatabaseSession
 
-from ....shared.errors import DomainException
+from ....shared.sql import SqlUnitOfWork
 from ...domain import Auditor, IAuditorRepository
 from .auditor_entity import AuditorEntity
 
 
 class SqlAuditorRepository(IAuditorRepository):
-    def __init__(self, database_session: DatabaseSession):
+    def __init__(self, database_session: DatabaseSession, unit_of_work: SqlUnitOfWork):
         self._db_session = database_session
+        self._unit_of_work = unit_of_work
 
-    def list_all(self) -> List[Auditor]:
+    async def list_page(self, after_id: Optional[UUID], limit: int) -> List[Auditor]:
         try:
-            auditor_entities = self._db_session.query(AuditorEntity).all()
+            query = sa.select(AuditorEntity)
+            if after_id is not None:
+                query = query.where(AuditorEntity.id > str(after_id))
+            auditor_entities = (await self._db_session.scalars(query.order_by(AuditorEntity.id).limit(limit))).all()
             return [entity.to_domain() for entity in auditor_entities]
         except:
-            self._db_session.rollback()
+            await self._db_session.rollback()
             raise
 
-    def find_by_id(self, auditor_id: UUID) -> Optional[Auditor]:
+    async def find_by_id(self, auditor_id: UUID) -> Optional[Auditor]:
+        auditor = self._unit_of_work.find(Auditor, auditor_id)
+        if auditor is not None:
+            return auditor
         try:
-            auditor_entity = self._db_session.query(AuditorEntity).filter_by(id=str(auditor_id)).first()
+            auditor_entity: Optional[AuditorEntity] = await self._db_session.scalar(
+                sa.select(AuditorEntity).filter_by(id=str(auditor_id))
+            )
             if auditor_entity:
-                return auditor_entity.to_domain()
+                auditor = auditor_entity.to_domain()
+                self._unit_of_work.track(auditor)
+                return auditor
             return None
         except:
-            self._db_session.rollback()
+            await self._db_session.rollback()
             raise
 
-    def save(self, auditor: Auditor) -> None:
-        auditor_entity = AuditorEntity.from_domain(auditor)
-        try:
-            self._db_session.merge(auditor_entity)  # Use merge to handle both insert and update
-            self._db_session.commit()
-        except IntegrityError as integrity_error:
-            self._db_session.rollback()
-            raise DomainException(
-                (
-                    f"Cannot save duplicate auditor with document {auditor.document.document_type}, "
-                    f"number {auditor.document.number}"
-                ),
-                code=409,  # Conflict
-            ) from integrity_error
-        except:
-            # In case of an error, rollback the session
-            self._db_session.rollback()
-            raise
+    async def save(self, auditor: Auditor) -> None:
+        self._unit_of_work.stage(
+            AuditorEntity.from_domain(auditor),
+            (
+                f"Cannot save duplicate auditor with document {auditor.document.document_type}, "
+                f"number {auditor.document.number}"
+            ),
+        )
+        self._unit_of_work.track(auditor)
@@ -1,51 +1,60 @@
 from typing import List, Optional
 from uuid import UUID
 
-from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session as DatabaseSession
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession as DatabaseSession
 
-from ....shared.errors import DomainException
+from ....shared.sql import SqlUnitOfWork
 from ...domain import Certifier, ICertifierRepository
-from .certifier_entity import CertifierEntity
+from .auditor_entity import AuditorEntity
+from .certifier_entity import CertifierEntity, certifier_auditors
 
 
 class SqlCertifierRepository(ICertifierRepository):
-    def __init__(self, database_session: DatabaseSession):
+    def __init__(self, database_session: DatabaseSession, unit_of_work: SqlUnitOfWork):
         self._db_session = database_session
+        self._unit_of_work = unit_of_work
 
-    def list_all(self) -> List[Certifier]:
+    async def list_page(self, after_id: Optional[UUID], limit: int) -> List[Certifier]:
         try:
-            certifier_entities = self._db_session.query(CertifierEntity).all()
+            query = sa.select(CertifierEntity)
+            if after_id is not None:
+                query = query.where(CertifierEntity.id > str(after_id))
+            certifier_entities = (await self._db_session.scalars(query.order_by(CertifierEntity.id).limit(limit))).all()
             return [entity.to_domain() for entity in certifier_entities]
         except:
-            self._db_session.rollback()
+            await self._db_session.rollback()
             raise
 
-    def find_by_id(self, certifier_id: UUID) -> Optional[Certifier]:
+    async def find_by_id(self, certifier_id: UUID) -> Optional[Certifier]:
+        certifier = self._unit_of_work.find(Certifier, certifier_id)
+        if certifier is not None:
+            return certifier
         try:
-            certifier_entity = self._db_session.query(CertifierEntity).filter_by(id=str(certifier_id)).first()
+            certifier_entity: Optional[CertifierEntity] = await self._db_session.scalar(
+                sa.select(CertifierEntity).filter_by(id=str(certifier_id))
+            )
             if certifier_entity:
-                return certifier_entity.to_domain()
+                certifier = certifier_entity.to_domain()
+                self._unit_of_work.track(certifier)
+                return certifier
             return None
         except:
-            self._db_session.rollback()
+            await self._db_session.rollback()
             raise
 
-    def save(self, certifier: Certifier) -> None:
-        certifier_entity = CertifierEntity.from_domain(certifier)
-        try:
-            self._db_session.merge(certifier_entity)  # Use merge to handle both insert and update
-            self._db_session.commit()
-        except IntegrityError as integrity_error:
-            self._db_session.rollback()
-            raise DomainException(
-                (
-                    f"Cannot save duplicate certifier with document {certifier.document.document_type}, "
-                    f"number {certifier.document.number}"
-                ),
-                code=409,  # Conflict
-            ) from integrity_error
-        except:
-            # In case of an error, rollback the session
-            self._db_session.rollback()
-            raise
+    async def save(self, certifier: Certifier) -> None:
+        conflict_message = (
+            f"Cannot save duplicate certifier with document {certifier.document.document_type}, "
+            f"number {certifier.document.number}"
+        )
+        # Auditors first, then the certifier and their links, in the order the foreign keys need them written
+        for auditor in certifier.auditors:
+            self._unit_of_work.stage(AuditorEntity.from_domain(auditor), conflict_message)
+        self._unit_of_work.stage(CertifierEntity.from_domain(certifier), conflict_message)
+        # Certifiers are registered with their auditors and never edited, so links are only ever added
+        for auditor in certifier.auditors:
+            self._unit_of_work.stage_row(
+                certifier_auditors, {"certifier_id": certifier.id, "auditor_id": auditor.id}, conflict_message
+            )
+        self._unit_of_work.track(certifier)
@@ -1,22 +1,40 @@
+from .audit_certifier_signatures import AuditCertifierSignaturesHandler
+from .export_certificates import ExportCertificatesHandler
 from .find_certificate_by_id import FindCertificateByIdHandler
+from .find_chain_certificate import FindChainCertificateHandler
+from .find_issuance_status import FindIssuanceStatusHandler
 from .find_qr_code_by_key import FindQrCodeByKeyHandler
 from .issue_certificate import IssueCertificateCommand, IssueCertificateHandler
+from .list_certificates_by_owner import CertificateOwner, ListCertificatesByOwnerHandler
 from .list_pre_certificates import ListPreCertificatesHandler
+from .process_issuance_tasks import ProcessIssuanceTasksHandler
+from .reconcile_chain_certificates import ReconcileChainCertificatesHandler
 from .register_pdf_hash import RegisterPDFHashCommand, RegisterPDFHashHandler
 from .register_pre_certificate import RegisterPreCertificateCommand, RegisterPreCertificateHandler
+from .revoke_certificates import RevokeCertificatesCommand, RevokeCertificatesHandler
 from .validate_certificate import ValidateCertificateHandler
 from .validate_pdf_file import ValidatePDFFileCommand, ValidatePDFFileHandler
 
 __all__ = [
+    "AuditCertifierSignaturesHandler",
+    "ExportCertificatesHandler",
     "FindCertificateByIdHandler",
+    "FindChainCertificateHandler",
+    "FindIssuanceStatusHandler",
     "IssueCertificateCommand",
     "IssueCertificateHandler",
+    "CertificateOwner",
+    "ListCertificatesByOwnerHandler",
     "ListPreCertificatesHandler",
+    "ProcessIssuanceTasksHandler",
+    "ReconcileChainCertificatesHandler",
     "RegisterPreCertificateCommand",
     "RegisterPreCertificateHandler",
     "FindQrCodeByKeyHandler",
     "RegisterPDFHashCommand",
     "RegisterPDFHashHandler",
+    "RevokeCertificatesCommand",
+    "RevokeCertificatesHandler",
     "ValidateCertificateHandler",
     "ValidatePDFFileCommand",
     "ValidatePDFFileHandler",
@@ -0,0 +1,67 @@
+from typing import Any, AsyncIterator, Dict, List, Optional
+from uuid import UUID
+
+from miraveja_log import IAsyncLogger
+
+from ..domain import Certificate, IBlockchainService, ICertificateRepository, SignatureCheck
+
+# Certificates loaded, hashed and verified at a time
+AUDIT_PAGE_SIZE = 1000
+
+
+class AuditCertifierSignaturesHandler:
+    def __init__(
+        self,
+        repository: ICertificateRepository,
+        blockchain_service: IBlockchainService,
+        logger: IAsyncLogger,
+    ):
+        self._repository = repository
+        self._blockchain_service = blockchain_service
+        self._logger = logger
+
+    async def handle(self) -> AsyncIterator[Dict[str, Any]]:
+        """Handles the re-verification of every stored certifier signature against the recomputed
+        hash of the data the certifier signed.
+
+        Returns:
+            AsyncIterator[Dict[str, Any]]: One result per signed certificate, as soon as it is verified.
+        """
+        await self._logger.info("Auditing certifier signatures.")
+
+        audited = 0
+        invalid = 0
+        after_id: Optional[UUID] = None
+        while True:
+            certificates: List[Certificate] = await self._repository.list_signed(after_id, AUDIT_PAGE_SIZE)
+            if not certificates:
+                break
+            after_id = certificates[-1].id
+
+            checks: List[SignatureCheck] = []
+            for certificate in certificates:
+                assert certificate.authenticity_proof is not None
+                checks.append(
+                    SignatureCheck(
+                        key=str(certificate.id),
+                        message_hash=await self._blockchain_service.hash_data(
+                            certificate.signed_payload(), certificate.canonical_encoding
+                        ),
+                        signature=certificate.authenticity_proof.certifier_signature,
+                        address=certificate.authenticity_proof.certifier_address,
+                    )
+                )
+
+            addresses = {check.key: check.address for check in checks}
+            async for verification in self._blockchain_service.verify_signatures(checks):
+                audited += 1
+                invalid += not verification.valid
+                yield {
+                    "certificate_id": verification.key,
+                    "valid": verification.valid,
+                    "certifier_address": addresses[verification.key],
+                    "recovered_address": verification.recovered_address,
+                    "error": verification.error,
+                }
+
+        await self._logger.info(f"Audited {audited} certifier signatures, {invalid} invalid.")
@@ -0,0 +1,71 @@
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Optional
+from uuid import UUID
+
+from miraveja_log import IAsyncLogger
+
+from ..domain import CertificateStatus, ICertificateRepository, IProducerService, IProductService, Norm
+
+# Certificates loaded from the database cursor, and whose products and producers are looked up, at a time
+EXPORT_CHUNK_SIZE = 1000
+
+
+class ExportCertificatesHandler:
+    def __init__(
+        self,
+        repository: ICertificateRepository,
+        product_service: IProductService,
+        producer_service: IProducerService,
+        logger: IAsyncLogger,
+    ):
+        self._repository = repository
+        self._product_service = product_service
+        self._producer_service = producer_service
+        self._logger = logger
+
+    async def handle(
+        self,
+        status: Optional[CertificateStatus],
+        certifier_id: Optional[UUID],
+        norm: Optional[Norm],
+        issued_from: Optional[datetime],
+        issued_until: Optional[datetime],
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Handles the export of the certificates matching the filters, streamed from the database along
+        with the canonical forms of their products and producers.
+
+        Only one chunk of certificates is held in memory at a time: the products and producers of each
+        chunk are found with one query each, rather than one per certificate.
+
+        Args:
+            status (Optional[CertificateStatus]): Only certificates in this status are exported; None exports all.
+            certifier_id (Optional[UUID]): Only the certificates of this certifier are exported.
+            norm (Optional[Norm]): Only the certificates complying with this norm are exported.
+            issued_from (Optional[datetime]): Only certificates issued at or after this instant are exported.
+            issued_until (Optional[datetime]): Only certificates issued before this instant are exported.
+        Returns:
+            AsyncIterator[Dict[str, Any]]: The certificates, ordered by ID, each with its product and producer.
+        """
+        await self._logger.info(
+            f"Exporting certificates (status: {status}, certifier: {certifier_id}, norm: {norm}, "
+            f"issued from {issued_from} until {issued_until})."
+        )
+
+        exported = 0
+        chunks = self._repository.stream(EXPORT_CHUNK_SIZE, status, certifier_id, norm, issued_from, issued_until)
+        async for certificates in chunks:
+            products = await self._product_service.find_canonical_by_ids(
+                list({certificate.product_id for certificate in certificates})
+            )
+            producers = await self._producer_service.find_canonical_by_ids(
+                list({certificate.producer_id for certificate in certificates})
+            )
+            for certificate in certificates:
+                exported += 1
+                yield {
+                    **certificate.model_dump(),
+                    "product": products.get(certificate.product_id),
+                    "producer": producers.get(certificate.producer_id),
+                }
+
+        await self._logger.info(f"Exported {exported} certificates.")
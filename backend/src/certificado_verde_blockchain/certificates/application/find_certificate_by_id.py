@@ -18,7 +18,7 @@ class FindCertificateByIdHandler:
     async def handle(self, certificate_id: UUID) -> Dict[str, Any]:
         await self._logger.info(f"Finding certificate with ID: {certificate_id}")
 
-        certificate: Optional[Certificate] = self._repository.find_by_id(certificate_id)
+        certificate: Optional[Certificate] = await self._repository.find_by_id(certificate_id)
 
         if certificate:
             await self._logger.info(f"Certificate found: {certificate}")
@@ -29,7 +29,9 @@ class FindCertificateByIdHandler:
         certificate_dict = certificate.model_dump()
         if certificate.is_pre_issued:
             await self._logger.info(f"Certificate {certificate_id} is pre-issued, computing hash.")
-            certificate_hash = await self._blockchain_service.hash_data(certificate_dict)
+            certificate_hash = await self._blockchain_service.hash_data(
+                certificate.signable_payload(), certificate.canonical_encoding
+            )
             certificate_dict["pre_issued_hash"] = certificate_hash
 
         return certificate_dict
@@ -0,0 +1,30 @@
+from typing import Any, Dict, Optional
+
+from miraveja_log import IAsyncLogger
+
+from ..domain import ChainCertificate, IChainCertificateRepository
+
+
+class FindChainCertificateHandler:
+    def __init__(self, repository: IChainCertificateRepository, logger: IAsyncLogger):
+        self._repository = repository
+        self._logger = logger
+
+    async def handle(self, data_hash: str) -> Dict[str, Any]:
+        """Handles the lookup of a data hash in the indexed CertificateRegistry events.
+        No blockchain node is queried; the answer reflects the chain up to the indexer cursor.
+
+        Args:
+            data_hash (str): The data hash anchored on chain.
+        Returns:
+            Dict[str, Any]: Whether the hash is anchored and, if so, by whom and whether it was revoked.
+        """
+        await self._logger.info(f"Finding on-chain certificate for data hash: {data_hash}")
+
+        certificate: Optional[ChainCertificate] = await self._repository.find_by_data_hash(data_hash)
+
+        return {
+            "data_hash": data_hash,
+            "anchored": certificate is not None,
+            "certificate": certificate.model_dump() if certificate else None,
+        }
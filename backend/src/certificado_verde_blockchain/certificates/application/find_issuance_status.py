@@ -0,0 +1,46 @@
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from miraveja_log import IAsyncLogger
+
+from ...shared.errors import DomainException
+from ..domain import Certificate, ICertificateRepository, IIssuanceTaskRepository, IssuanceTask
+
+
+class FindIssuanceStatusHandler:
+    def __init__(
+        self,
+        repository: ICertificateRepository,
+        task_repository: IIssuanceTaskRepository,
+        logger: IAsyncLogger,
+    ):
+        self._repository = repository
+        self._task_repository = task_repository
+        self._logger = logger
+
+    async def handle(self, certificate_id: UUID) -> Dict[str, Any]:
+        """Handles the lookup of the issuance progress of a certificate.
+
+        Args:
+            certificate_id (UUID): The unique identifier of the certificate.
+        Returns:
+            Dict[str, Any]: The certificate status and the details of its latest issuance task.
+        """
+        await self._logger.info(f"Finding issuance status of certificate with ID: {certificate_id}")
+
+        certificate: Optional[Certificate] = await self._repository.find_by_id(certificate_id)
+        if not certificate:
+            await self._logger.warning(f"Certificate with ID {certificate_id} not found")
+            raise DomainException(f"Certificate with ID {certificate_id} not found", 404)
+
+        issuance_task: Optional[IssuanceTask] = await self._task_repository.find_latest_by_certificate_id(
+            certificate_id
+        )
+
+        return {
+            "certificate_id": str(certificate.id),
+            "status": str(certificate.status),
+            "blockchain_id": certificate.blockchain_id,
+            "issuance_error": certificate.issuance_error,
+            "issuance_task": issuance_task.model_dump() if issuance_task else None,
+        }
@@ -1,12 +1,13 @@
 from datetime import datetime, timezone
 from typing import Any, Dict
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from pydantic import BaseModel, Field
 
 from miraveja_log import IAsyncLogger
 
 from ...configuration import AppConfig
+from ...shared.domain import IUnitOfWork
 from ...shared.errors import DomainException
 from ..domain import (
     AuthenticityProof,
@@ -15,7 +16,9 @@ from ..domain import (
     IBlockchainService,
     ICertificateRepository,
     IFileService,
+    IIssuanceTaskRepository,
     ISerialCodeService,
+    IssuanceTask,
     IStorageService,
 )
 
@@ -30,26 +33,41 @@ class IssueCertificateHandler:
         self,
         app_config: AppConfig,
         repository: ICertificateRepository,
+        task_repository: IIssuanceTaskRepository,
         blockchain_service: IBlockchainService,
         serial_code_service: ISerialCodeService,
         canonical_certificate_service: CanonicalCertificateService,
         file_service: IFileService,
         storage_service: IStorageService,
+        unit_of_work: IUnitOfWork,
         logger: IAsyncLogger,
     ):
         self._app_config = app_config
         self._repository = repository
+        self._task_repository = task_repository
         self._blockchain_service = blockchain_service
         self._serial_code_service = serial_code_service
         self._canonical_certificate_service = canonical_certificate_service
         self._file_service = file_service
         self._storage_service = storage_service
+        self._unit_of_work = unit_of_work
         self._logger = logger
 
     async def handle(self, certificate_id: UUID, command: IssueCertificateCommand) -> Dict[str, Any]:
+        """Validates the certifier's signature and queues the certificate to be recorded on the blockchain.
+
+        The certificate moves to the issuing state and an issuance task is stored in the same database
+        transaction; background workers record it on the blockchain and complete the issuance.
+
+        Args:
+            certificate_id (UUID): The unique identifier of the pre-issued certificate.
+            command (IssueCertificateCommand): The command containing the certifier's signature.
+        Returns:
+            Dict[str, Any]: The certificate in the issuing state and its issuance task.
+        """
         await self._logger.info(f"Issuing certificate with ID {certificate_id}.")
         # Retrieve the certificate to be issued
-        certificate = self._repository.find_by_id(certificate_id)
+        certificate = await self._repository.find_by_id(certificate_id)
         if not certificate:
             await self._logger.error(f"Certificate with ID {certificate_id} not found.")
             raise DomainException(f"Certificate with ID {certificate_id} not found.", 404)
@@ -59,8 +77,10 @@ class IssueCertificateHandler:
             raise DomainException(f"Certificate with ID {certificate_id} has already been issued.", 400)
 
         # Pre canonicalization checks
-        await self._logger.info(f"Pre canonicalization sign payload:\n{certificate.model_dump()}")
-        pre_canonic_hash = await self._blockchain_service.hash_data(certificate.model_dump())
+        await self._logger.info(f"Pre canonicalization sign payload:\n{certificate.signable_payload()}")
+        pre_canonic_hash = await self._blockchain_service.hash_data(
+            certificate.signable_payload(), certificate.canonical_encoding
+        )
         # Validate the certifier's signature
         await self._logger.info(f"Verifying certifier signature for certificate {certificate.id}.")
         await self._blockchain_service.verify_signature(
@@ -78,7 +98,7 @@ class IssueCertificateHandler:
         canonical_certificate: CanonicalCertificate = await self._canonical_certificate_service.build_canonical(
             certificate, issued_at.isoformat(), valid_until.isoformat(), serial_code
         )
-        canonical_hash = await self._blockchain_service.hash_data(canonical_certificate)
+        canonical_hash = await self._blockchain_service.hash_data(canonical_certificate, certificate.canonical_encoding)
         await self._logger.debug(f"Canonical hash for certificate {certificate.id}: {canonical_hash}")
 
         # Generate the QR code for the certificate and store it
@@ -97,23 +117,23 @@ class IssueCertificateHandler:
             certifier_address=command.certifier_address,
         )
 
-        # Record the certificate on the blockchain
-        blockchain_id = await self._blockchain_service.record_certificate(
-            certificate_hash=canonical_hash,
-            certifier_address=command.certifier_address,
-        )
-        await self._logger.info(f"Certificate {certificate.id} recorded on blockchain with ID {blockchain_id}.")
-
-        # Issue the certificate
-        certificate.issue(
+        # Start the issuance and queue the blockchain record in the same transaction
+        certificate.start_issuance(
             issued_at=issued_at,
             valid_until=valid_until,
             authenticity_proof=authenticity_proof,
             canonical_hash=canonical_hash,
-            blockchain_id=blockchain_id,
+        )
+        issuance_task = IssuanceTask(
+            id=uuid4(),
+            certificate_id=certificate.id,
+            canonical_hash=canonical_hash,
+            certifier_address=command.certifier_address,
+            created_at=issued_at,
         )
 
-        self._repository.save(certificate)
-        await self._logger.info(f"Successfully issued certificate {certificate.id}.")
+        await self._task_repository.save([issuance_task], [certificate])
+        await self._unit_of_work.commit()
+        await self._logger.info(f"Certificate {certificate.id} queued for blockchain issuance.")
 
-        return {"certificate": certificate.model_dump()}
+        return {"certificate": certificate.model_dump(), "issuance_task": issuance_task.model_dump()}
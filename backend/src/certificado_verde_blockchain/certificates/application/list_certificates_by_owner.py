@@ -0,0 +1,46 @@
+from typing import Any, Dict, Literal, Optional
+from uuid import UUID
+
+from miraveja_log import IAsyncLogger
+
+from ...shared.models import PageRequest
+from ..domain import CertificateStatus, ICertificateRepository
+
+CertificateOwner = Literal["product", "producer", "certifier"]
+
+
+class ListCertificatesByOwnerHandler:
+    def __init__(
+        self,
+        repository: ICertificateRepository,
+        logger: IAsyncLogger,
+    ):
+        self._repository = repository
+        self._logger = logger
+
+    async def handle(
+        self,
+        owner: CertificateOwner,
+        owner_id: UUID,
+        status: Optional[CertificateStatus],
+        page: PageRequest,
+    ) -> Dict[str, Any]:
+        """Handles the listing of a page of the certificates of a product, a producer or a certifier.
+
+        Args:
+            owner (CertificateOwner): What `owner_id` identifies.
+            owner_id (UUID): The unique identifier of the product, producer or certifier.
+            status (Optional[CertificateStatus]): Only certificates in this status are listed; None lists all.
+            page (PageRequest): The page to list.
+        Returns:
+            Dict[str, Any]: The certificates of the page and the cursor of the next page.
+        """
+        await self._logger.info(f"Listing certificates of {owner} {owner_id} after {page.after_id}.")
+        find_by_owner_id = {
+            "product": self._repository.find_by_product_id,
+            "producer": self._repository.find_by_producer_id,
+            "certifier": self._repository.find_by_certifier_id,
+        }[owner]
+        certificates, next_cursor = page.page(await find_by_owner_id(owner_id, page.after_id, page.fetch_limit, status))
+        await self._logger.info(f"Found {len(certificates)} certificates of {owner} {owner_id} in the page.")
+        return {"certificates": [cert.model_dump() for cert in certificates], "next_cursor": next_cursor}
@@ -1,8 +1,10 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, Optional
+from uuid import UUID
 
 from miraveja_log import IAsyncLogger
 
-from ..domain import Certificate, ICertificateRepository
+from ...shared.models import PageRequest
+from ..domain import ICertificateRepository
 
 
 class ListPreCertificatesHandler:
@@ -14,14 +16,18 @@ class ListPreCertificatesHandler:
         self._repository = repository
         self._logger = logger
 
-    async def handle(self) -> Dict[str, Any]:
-        """Handles the listing of all pre-certificates.
+    async def handle(self, certifier_id: Optional[UUID], page: PageRequest) -> Dict[str, Any]:
+        """Handles the listing of a page of pre-certificates.
 
+        Args:
+            certifier_id (Optional[UUID]): Only the pre-certificates of this certifier are listed; None lists all.
+            page (PageRequest): The page to list.
         Returns:
-            List[Dict[str, Any]]: A list of all pre-certificates.
+            Dict[str, Any]: The pre-certificates of the page and the cursor of the next page.
         """
-        await self._logger.info("Listing all pre-certificates.")
-        all_certificates: List[Certificate] = self._repository.list_all()
-        pre_certificates = [cert for cert in all_certificates if cert.is_pre_issued]
-        await self._logger.info(f"Found {len(pre_certificates)} pre-certificates.")
-        return {"pre_certificates": [cert.model_dump() for cert in pre_certificates]}
+        await self._logger.info(f"Listing pre-certificates of certifier {certifier_id} after {page.after_id}.")
+        pre_certificates, next_cursor = page.page(
+            await self._repository.list_pre_issued(certifier_id, page.after_id, page.fetch_limit)
+        )
+        await self._logger.info(f"Found {len(pre_certificates)} pre-certificates in the page.")
+        return {"pre_certificates": [cert.model_dump() for cert in pre_certificates], "next_cursor": next_cursor}
@@ -0,0 +1,359 @@
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from miraveja_log import IAsyncLogger
+
+from ...configuration import BlockchainConfig
+from ...shared.domain import IUnitOfWork
+from ...shared.merkle import MerkleTree
+from ..domain import (
+    AnchoredRoot,
+    Certificate,
+    IBlockchainService,
+    ICertificateRepository,
+    IChainCertificateRepository,
+    IIssuanceTaskRepository,
+    IssuanceTask,
+    IssuanceTaskStatus,
+    MerkleInclusionProof,
+    PreparedTransaction,
+)
+
+# Upper bound of the backoff between two attempts of the same task
+MAX_RETRY_DELAY_SECONDS = 60
+
+
+class ProcessIssuanceTasksHandler:
+    """Drives the issuance outbox: submits pending certificates to the blockchain and confirms the
+    submitted transactions, updating the certificates once they are mined.
+
+    In `merkle` anchoring mode pending certificates are gathered into epochs instead, and only the
+    Merkle root of each epoch is written to the registry, every certificate keeping its inclusion proof.
+
+    Transactions are signed first and their hash committed with the tasks before they are sent, so a
+    worker dying at any point leaves tasks whose outcome is found by hash, never a transaction sent twice.
+    """
+
+    def __init__(
+        self,
+        config: BlockchainConfig,
+        task_repository: IIssuanceTaskRepository,
+        certificate_repository: ICertificateRepository,
+        chain_certificate_repository: IChainCertificateRepository,
+        blockchain_service: IBlockchainService,
+        unit_of_work: IUnitOfWork,
+        logger: IAsyncLogger,
+    ):
+        self._config = config
+        self._task_repository = task_repository
+        self._certificate_repository = certificate_repository
+        self._chain_certificate_repository = chain_certificate_repository
+        self._blockchain_service = blockchain_service
+        self._unit_of_work = unit_of_work
+        self._logger = logger
+
+    async def submit_pending(self) -> int:
+        """Claims a batch of pending tasks and records them on the blockchain in a single transaction.
+
+        Returns:
+            int: The number of tasks processed.
+        """
+        if self._config.anchoring_mode == "merkle":
+            return await self.anchor_pending()
+
+        tasks = await self._task_repository.claim(
+            IssuanceTaskStatus.PENDING, self._config.issuance_batch_max_size, self._config.issuance_lease_seconds
+        )
+        if not tasks:
+            return 0
+        processed = len(tasks)
+
+        tasks = await self._settle_issued(tasks)
+        if not tasks:
+            await self._unit_of_work.commit()
+            return processed
+
+        try:
+            transaction = await self._blockchain_service.prepare_certificates(
+                [(task.canonical_hash, task.certifier_address) for task in tasks]
+            )
+        except Exception as e:
+            await self._logger.error(f"Failed to submit {len(tasks)} certificates: {e}")
+            await self._retry(tasks, str(e))
+            await self._unit_of_work.commit()
+            return processed
+
+        for task in tasks:
+            task.mark_submitted(transaction.transaction_hash)
+        await self._task_repository.save(tasks, [], delay_seconds=self._poll_interval_seconds)
+        await self._unit_of_work.commit()
+        if await self._broadcast(transaction, tasks):
+            await self._logger.info(
+                f"Submitted {len(tasks)} certificates in transaction {transaction.transaction_hash}."
+            )
+        return processed
+
+    async def anchor_pending(self) -> int:
+        """Gathers pending tasks into an epoch and anchors the Merkle root of their canonical hashes.
+
+        An epoch is anchored once `anchoring_epoch_max_size` certificates are pending, or once the oldest
+        of them has waited `anchoring_flush_interval_ms`. Each certificate gets its inclusion proof before
+        the root is confirmed on chain; the proof is only final once the epoch identifier is known.
+
+        Returns:
+            int: The number of tasks processed.
+        """
+        epoch_size = self._config.anchoring_epoch_max_size
+        pending, oldest = await self._task_repository.due_backlog(IssuanceTaskStatus.PENDING, epoch_size)
+        if pending == 0 or (pending < epoch_size and not self._is_flush_due(oldest)):
+            return 0
+
+        tasks = await self._task_repository.claim(
+            IssuanceTaskStatus.PENDING, epoch_size, self._config.issuance_lease_seconds
+        )
+        if not tasks:
+            return 0
+
+        tree = MerkleTree.from_hashes(task.canonical_hash for task in tasks)
+        root = "0x" + tree.root.hex()
+        try:
+            transaction = await self._blockchain_service.prepare_anchor(root, len(tasks))
+        except Exception as e:
+            await self._logger.error(f"Failed to anchor an epoch of {len(tasks)} certificates: {e}")
+            await self._retry(tasks, str(e))
+            await self._unit_of_work.commit()
+            return len(tasks)
+
+        certificates = {
+            certificate.id: certificate
+            for certificate in await self._certificate_repository.find_by_ids([task.certificate_id for task in tasks])
+        }
+        anchored: List[Certificate] = []
+        for index, task in enumerate(tasks):
+            task.mark_submitted(transaction.transaction_hash, merkle_root=root)
+            certificate = certificates.get(task.certificate_id)
+            if certificate is not None and certificate.is_issuing:
+                certificate.attach_merkle_proof(
+                    MerkleInclusionProof(
+                        root=root, leaf_index=index, path=["0x" + node.hex() for node in tree.proof(index)]
+                    )
+                )
+                anchored.append(certificate)
+        await self._task_repository.save(tasks, anchored, delay_seconds=self._poll_interval_seconds)
+        await self._unit_of_work.commit()
+        if await self._broadcast(transaction, tasks):
+            await self._logger.info(
+                f"Anchored an epoch of {len(tasks)} certificates with root {root} "
+                f"in transaction {transaction.transaction_hash}."
+            )
+        return len(tasks)
+
+    async def confirm_submitted(self) -> int:
+        """Claims submitted tasks and checks their transactions with one batched receipt request.
+        Transactions left unmined for `replacement_after_seconds` are resent with higher fees.
+
+        Returns:
+            int: The number of tasks confirmed or sent back for another attempt.
+        """
+        tasks = await self._task_repository.claim(
+            IssuanceTaskStatus.SUBMITTED,
+            self._config.issuance_batch_max_size * 4,
+            self._config.issuance_lease_seconds,
+        )
+        if not tasks:
+            return 0
+
+        # A replaced transaction may still be the one mined, so every hash of the current attempt is checked
+        transaction_hashes = list(dict.fromkeys(tx_hash for task in tasks for tx_hash in task.transaction_hashes))
+        receipts = await self._blockchain_service.get_issuance_receipts(transaction_hashes)
+
+        confirmed: List[IssuanceTask] = []
+        certificates: List[Certificate] = []
+        anchored_roots: Dict[str, AnchoredRoot] = {}
+        waiting: List[IssuanceTask] = []
+        dropped: Dict[str, List[IssuanceTask]] = {}
+        stalled: Dict[str, List[IssuanceTask]] = {}
+        reverted: List[IssuanceTask] = []
+
+        for task in tasks:
+            receipt = next((receipts[tx_hash] for tx_hash in task.transaction_hashes if tx_hash in receipts), None)
+            if receipt is None:
+                if self._is_overdue(task):
+                    dropped.setdefault(task.transaction_hash or "", []).append(task)
+                elif self._is_stalled(task):
+                    stalled.setdefault(task.transaction_hash or "", []).append(task)
+                else:
+                    waiting.append(task)
+            elif receipt.success and task.merkle_root is not None and task.merkle_root in receipt.anchored_epochs:
+                epoch_id = receipt.anchored_epochs[task.merkle_root]
+                if receipt.block_number is not None:
+                    # What validation checks inclusion proofs against, rather than the root stored with them
+                    anchored_roots[epoch_id] = AnchoredRoot(
+                        epoch_id=epoch_id,
+                        root=task.merkle_root,
+                        block_number=receipt.block_number,
+                        transaction_hash=receipt.transaction_hash,
+                    )
+                certificate = await self._certificate_repository.find_by_id(task.certificate_id)
+                task.mark_confirmed()
+                if certificate is not None and certificate.is_issuing and certificate.merkle_proof is not None:
+                    certificate.confirm_anchoring(epoch_id)
+                    certificates.append(certificate)
+                confirmed.append(task)
+            elif receipt.success and task.canonical_hash in receipt.certificate_ids:
+                certificate = await self._certificate_repository.find_by_id(task.certificate_id)
+                task.mark_confirmed()
+                if certificate is not None and certificate.is_issuing:
+                    certificate.confirm_issuance(
+                        receipt.certificate_ids[task.canonical_hash], self._blockchain_service.registry_address
+                    )
+                    certificates.append(certificate)
+                confirmed.append(task)
+            else:
+                reverted.append(task)
+
+        for transaction_hash, dropped_tasks in dropped.items():
+            if await self._blockchain_service.is_transaction_pending(transaction_hash):
+                waiting.extend(dropped_tasks)
+            else:
+                await self._retry(dropped_tasks, f"Transaction {transaction_hash} was dropped by the node.")
+
+        for transaction_hash, stalled_tasks in stalled.items():
+            replacement = await self._replace(transaction_hash)
+            if replacement is not None:
+                for task in stalled_tasks:
+                    task.mark_replaced(replacement)
+                await self._logger.info(f"Replaced stalled transaction {transaction_hash} with {replacement}.")
+            waiting.extend(stalled_tasks)
+
+        if reverted:
+            await self._retry(reverted, "Issuance transaction failed on the blockchain.")
+        if confirmed:
+            await self._task_repository.save(confirmed, certificates)
+        if anchored_roots:
+            await self._chain_certificate_repository.save_anchored_roots(list(anchored_roots.values()))
+        if waiting:
+            await self._task_repository.save(waiting, [], delay_seconds=self._poll_interval_seconds)
+        # Retried, confirmed and waiting tasks are all written in one transaction
+        await self._unit_of_work.commit()
+        if confirmed:
+            await self._logger.info(f"Confirmed the issuance of {len(confirmed)} certificates.")
+
+        return len(tasks) - len(waiting)
+
+    async def _settle_issued(self, tasks: List[IssuanceTask]) -> List[IssuanceTask]:
+        """Confirm the claimed tasks whose certificate an earlier transaction recorded after all, and set aside
+        those that cannot be checked, so that no certificate is sent to the registry twice.
+
+        Only tasks with an earlier transaction are looked up: the others were never sent.
+
+        Returns:
+            List[IssuanceTask]: The tasks to send.
+        """
+        resent = [task for task in tasks if task.transaction_hash is not None]
+        if not resent:
+            return tasks
+
+        try:
+            certificate_hashes = [task.canonical_hash for task in resent]
+            issued = await self._blockchain_service.find_issued_certificates(certificate_hashes)
+            if issued is None:
+                # The registry has no lookup by hash: use the CertificateIssued events indexed so far
+                issued = {}
+                for certificate_hash in certificate_hashes:
+                    chain_certificate = await self._chain_certificate_repository.find_by_data_hash(certificate_hash)
+                    if chain_certificate is not None:
+                        issued[certificate_hash] = chain_certificate.blockchain_id
+        except Exception as e:
+            await self._logger.warning(f"Failed to check {len(resent)} certificates on chain before resending: {e}")
+            await self._task_repository.save(resent, [], delay_seconds=self._poll_interval_seconds)
+            return [task for task in tasks if task.transaction_hash is None]
+
+        confirmed: List[IssuanceTask] = []
+        certificates: List[Certificate] = []
+        for task in resent:
+            blockchain_id = issued.get(task.canonical_hash)
+            if blockchain_id is None:
+                continue
+            certificate = await self._certificate_repository.find_by_id(task.certificate_id)
+            task.mark_confirmed()
+            if certificate is not None and certificate.is_issuing:
+                certificate.confirm_issuance(blockchain_id, self._blockchain_service.registry_address)
+                certificates.append(certificate)
+            confirmed.append(task)
+        if confirmed:
+            await self._task_repository.save(confirmed, certificates)
+            await self._logger.info(f"Found {len(confirmed)} certificates already recorded by an earlier attempt.")
+        return [task for task in tasks if task.is_open]
+
+    async def _broadcast(self, transaction: PreparedTransaction, tasks: List[IssuanceTask]) -> bool:
+        """Send a transaction whose tasks are committed as submitted.
+
+        A failed send sends the tasks back to the queue only if the node does not know the transaction: the
+        send may have failed after the node took it. If that cannot be checked either, the tasks are left
+        submitted and `confirm_submitted` finds out once the transaction is overdue.
+
+        Returns:
+            bool: True if the node took the transaction.
+        """
+        try:
+            await self._blockchain_service.broadcast_transaction(transaction)
+            return True
+        except Exception as e:
+            error = e
+
+        try:
+            if await self._blockchain_service.is_transaction_pending(transaction.transaction_hash):
+                return True
+        except Exception as e:
+            await self._logger.warning(f"Failed to check transaction {transaction.transaction_hash}: {e}")
+            return False
+
+        await self._logger.error(f"Failed to send transaction {transaction.transaction_hash}: {error}")
+        await self._retry(tasks, str(error))
+        await self._unit_of_work.commit()
+        return False
+
+    async def _retry(self, tasks: List[IssuanceTask], error: str) -> None:
+        failed_certificates: List[Certificate] = []
+        for task in tasks:
+            if task.retry(error, self._config.issuance_max_attempts):
+                continue
+            certificate = await self._certificate_repository.find_by_id(task.certificate_id)
+            if certificate is not None and certificate.is_issuing:
+                certificate.fail_issuance(error)
+                failed_certificates.append(certificate)
+
+        attempts = max(task.attempts for task in tasks)
+        delay_seconds = min(self._poll_interval_seconds * 2**attempts, MAX_RETRY_DELAY_SECONDS)
+        await self._task_repository.save(tasks, failed_certificates, delay_seconds=delay_seconds)
+
+    async def _replace(self, transaction_hash: str) -> Optional[str]:
+        try:
+            return await self._blockchain_service.replace_transaction(transaction_hash)
+        except Exception as e:
+            # The original transaction is still pending, so there is nothing to retry: check it again later
+            await self._logger.warning(f"Failed to replace stalled transaction {transaction_hash}: {e}")
+            return None
+
+    def _is_flush_due(self, oldest: Optional[datetime]) -> bool:
+        if oldest is None:
+            return False
+        elapsed = (datetime.now(timezone.utc) - oldest).total_seconds()
+        return elapsed * 1000 >= self._config.anchoring_flush_interval_ms
+
+    def _is_stalled(self, task: IssuanceTask) -> bool:
+        if task.submitted_at is None:
+            return False
+        elapsed = (datetime.now(timezone.utc) - task.submitted_at).total_seconds()
+        return elapsed >= self._config.replacement_after_seconds
+
+    def _is_overdue(self, task: IssuanceTask) -> bool:
+        if task.submitted_at is None:
+            return True
+        elapsed = (datetime.now(timezone.utc) - task.submitted_at).total_seconds()
+        return elapsed > self._config.transaction_timeout_seconds
+
+    @property
+    def _poll_interval_seconds(self) -> float:
+        return self._config.issuance_poll_interval_ms / 1000
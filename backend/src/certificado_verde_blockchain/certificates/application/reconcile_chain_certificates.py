@@ -0,0 +1,106 @@
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from miraveja_log import IAsyncLogger
+
+from ..domain import Certificate, IBlockchainService, ICertificateRepository, RegistryCertificate
+
+
+class ReconcileChainCertificatesHandler:
+    def __init__(
+        self,
+        repository: ICertificateRepository,
+        blockchain_service: IBlockchainService,
+        logger: IAsyncLogger,
+    ):
+        self._repository = repository
+        self._blockchain_service = blockchain_service
+        self._logger = logger
+
+    async def handle(self) -> AsyncIterator[Dict[str, Any]]:
+        """Handles the comparison of every certificate recorded in the contract with the certificates table,
+        reporting each drift found between the two.
+
+        The contract is read page by page with its bulk view, and every page is matched against the
+        certificates stored with the same range of blockchain IDs on the same registry deployment; certificates
+        recorded on earlier deployments are left out. Drifts are reported as:
+
+        - `missing_in_database`: the contract holds a certificate no stored certificate points to;
+        - `duplicate_in_database`: several stored certificates point to the same on-chain certificate;
+        - `hash_mismatch`: the canonical hash differs from the data hash anchored on chain;
+        - `revocation_mismatch`: the certificate is revoked (or being revoked) on one side only;
+        - `missing_on_chain`: a stored certificate points to a blockchain ID the contract never issued.
+
+        Returns:
+            AsyncIterator[Dict[str, Any]]: One item per drift, followed by a summary of the reconciliation.
+        """
+        registry_address = self._blockchain_service.registry_address
+        count = await self._blockchain_service.count_certificates()
+        await self._logger.info(f"Reconciling {count} on-chain certificates with the database.")
+
+        checked = 0
+        drifts: Dict[str, int] = {}
+        async for page in self._blockchain_service.read_certificates(1, count):
+            stored = self._by_blockchain_id(
+                await self._repository.find_by_blockchain_id_range(
+                    int(page[0].blockchain_id), int(page[-1].blockchain_id), registry_address
+                )
+            )
+            for chain_certificate in page:
+                checked += 1
+                for drift in self._compare(chain_certificate, stored.get(chain_certificate.blockchain_id, [])):
+                    drifts[drift["kind"]] = drifts.get(drift["kind"], 0) + 1
+                    yield drift
+
+        for certificate in await self._repository.find_by_blockchain_id_range(count + 1, None, registry_address):
+            drifts["missing_on_chain"] = drifts.get("missing_on_chain", 0) + 1
+            yield self._drift("missing_on_chain", certificate.blockchain_id, certificate)
+
+        total = sum(drifts.values())
+        if total:
+            await self._logger.warning(f"Found {total} drifts between the blockchain and the database: {drifts}.")
+        await self._logger.info(f"Reconciled {checked} on-chain certificates.")
+
+        yield {"kind": "summary", "checked": checked, "drifts": drifts}
+
+    def _compare(self, chain_certificate: RegistryCertificate, certificates: List[Certificate]) -> List[Dict[str, Any]]:
+        blockchain_id = chain_certificate.blockchain_id
+        if not certificates:
+            return [self._drift("missing_in_database", blockchain_id, chain=chain_certificate)]
+        if len(certificates) > 1:
+            return [
+                self._drift("duplicate_in_database", blockchain_id, certificate, chain_certificate)
+                for certificate in certificates
+            ]
+
+        certificate = certificates[0]
+        drifts: List[Dict[str, Any]] = []
+        if certificate.canonical_hash != chain_certificate.data_hash:
+            drifts.append(self._drift("hash_mismatch", blockchain_id, certificate, chain_certificate))
+        # A revoking certificate is already invalid, its chain write is only waiting to be retried
+        if (certificate.is_revoked or certificate.is_revoking) != chain_certificate.revoked:
+            drifts.append(self._drift("revocation_mismatch", blockchain_id, certificate, chain_certificate))
+        return drifts
+
+    @staticmethod
+    def _by_blockchain_id(certificates: List[Certificate]) -> Dict[str, List[Certificate]]:
+        grouped: Dict[str, List[Certificate]] = {}
+        for certificate in certificates:
+            grouped.setdefault(certificate.blockchain_id or "", []).append(certificate)
+        return grouped
+
+    @staticmethod
+    def _drift(
+        kind: str,
+        blockchain_id: Optional[str],
+        certificate: Optional[Certificate] = None,
+        chain: Optional[RegistryCertificate] = None,
+    ) -> Dict[str, Any]:
+        return {
+            "kind": kind,
+            "blockchain_id": blockchain_id,
+            "certificate_id": str(certificate.id) if certificate is not None else None,
+            "status": str(certificate.status) if certificate is not None else None,
+            "canonical_hash": certificate.canonical_hash if certificate is not None else None,
+            "chain_data_hash": chain.data_hash if chain is not None else None,
+            "chain_revoked": chain.revoked if chain is not None else None,
+        }
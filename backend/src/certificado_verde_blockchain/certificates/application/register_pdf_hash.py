@@ -5,6 +5,7 @@ from pydantic import BaseModel, Field
 
 from miraveja_log import IAsyncLogger
 
+from ...shared.domain import IUnitOfWork
 from ...shared.errors import DomainException
 from ..domain import Certificate, IBlockchainService, ICertificateRepository
 
@@ -24,10 +25,12 @@ class RegisterPDFHashHandler:
         self,
         repository: ICertificateRepository,
         blockchain_service: IBlockchainService,
+        unit_of_work: IUnitOfWork,
         logger: IAsyncLogger,
     ):
         self._repository = repository
         self._blockchain_service = blockchain_service
+        self._unit_of_work = unit_of_work
         self._logger = logger
 
     async def handle(self, certificate_id: UUID, command: RegisterPDFHashCommand) -> Dict[str, Any]:
@@ -38,7 +41,7 @@ class RegisterPDFHashHandler:
         Returns:
             Dict[str, Any]: A dictionary containing the result of the operation.
         """
-        certificate: Optional[Certificate] = self._repository.find_by_id(certificate_id)
+        certificate: Optional[Certificate] = await self._repository.find_by_id(certificate_id)
         if not certificate:
             raise DomainException(f"Certificate with ID {certificate_id} not found.")
 
@@ -56,7 +59,8 @@ class RegisterPDFHashHandler:
 
         certificate.set_pdf_hash(pdf_hash)  # Doesn't change the canonical representation
 
-        self._repository.save(certificate)
+        await self._repository.save(certificate)
+        await self._unit_of_work.commit()
 
         return {
             "certificate_id": str(certificate.id),
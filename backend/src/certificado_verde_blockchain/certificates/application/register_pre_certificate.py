@@ -5,6 +5,7 @@ from pydantic import BaseModel, Field
 
 from miraveja_log import IAsyncLogger
 
+from ...shared.domain import IUnitOfWork
 from ..domain import (
     Certificate,
     ICertificateRepository,
@@ -47,12 +48,14 @@ class RegisterPreCertificateHandler:
         certifier_service: ICertifierService,
         producer_service: IProducerService,
         product_service: IProductService,
+        unit_of_work: IUnitOfWork,
         logger: IAsyncLogger,
     ):
         self._repository = repository
         self._certifier_service = certifier_service
         self._producer_service = producer_service
         self._product_service = product_service
+        self._unit_of_work = unit_of_work
         self._logger = logger
 
     async def handle(self, command: RegisterPreCertificateCommand) -> Dict[str, Any]:
@@ -76,6 +79,7 @@ class RegisterPreCertificateHandler:
             notes=command.notes,
         )
 
-        self._repository.save(pre_certificate)
+        await self._repository.save(pre_certificate)
+        await self._unit_of_work.commit()
         await self._logger.info(f"Pre-certificate {pre_certificate.id} registered successfully.")
         return {"pre_certificate": pre_certificate.model_dump()}
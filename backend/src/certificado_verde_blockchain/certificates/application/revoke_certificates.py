@@ -0,0 +1,159 @@
+import asyncio
+from typing import Annotated, Any, Dict, List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from miraveja_log import IAsyncLogger
+
+from ...shared.domain import IUnitOfWork
+from ..domain import Certificate, IBlockchainService, ICertificateRepository, RevocationReceipt
+
+
+class RevokeCertificatesCommand(BaseModel):
+    """Command to revoke several certificates at once.
+
+    Attributes:
+        certificate_ids (List[UUID]): The unique identifiers of the certificates to revoke.
+    """
+
+    certificate_ids: Annotated[
+        List[UUID],
+        Field(description="The unique identifiers of the certificates to revoke.", min_length=1, max_length=5000),
+    ]
+
+
+class RevokeCertificatesHandler:
+    def __init__(
+        self,
+        repository: ICertificateRepository,
+        blockchain_service: IBlockchainService,
+        unit_of_work: IUnitOfWork,
+        logger: IAsyncLogger,
+    ):
+        self._repository = repository
+        self._blockchain_service = blockchain_service
+        self._unit_of_work = unit_of_work
+        self._logger = logger
+
+    async def handle(self, command: RevokeCertificatesCommand) -> Dict[str, Any]:
+        """Handles the revocation of several certificates, recorded on the blockchain in batch transactions.
+
+        The certificates are moved to the revoking state before anything is sent, and only confirmed as
+        revoked once the chain reports them revoked. A certificate whose chain write failed stays in the
+        revoking state and is sent again by the next request that includes it; the contract skips
+        certificates that are already revoked, so nothing is revoked twice.
+
+        Certificates recorded through the Merkle root of their epoch have no identifier of their own on the
+        blockchain, and the anchored root cannot be changed: they are revoked in the database alone, without a
+        transaction. Any other certificate without a blockchain identifier is rejected before it is touched.
+        Blockchain identifiers are only unique within a registry deployment: the certificates are revoked on
+        the deployment that recorded them, one call per deployment.
+
+        Args:
+            command (RevokeCertificatesCommand): The command containing the certificate IDs.
+        Returns:
+            Dict[str, Any]: The outcome of every requested certificate, in the order of the request.
+        """
+        certificate_ids = list(dict.fromkeys(command.certificate_ids))
+        await self._logger.info(f"Revoking {len(certificate_ids)} certificates.")
+
+        certificates = {
+            certificate.id: certificate for certificate in await self._repository.find_by_ids(certificate_ids)
+        }
+        results: Dict[UUID, Dict[str, Any]] = {}
+        to_revoke: List[Certificate] = []
+        anchored: List[Certificate] = []
+
+        for certificate_id in certificate_ids:
+            certificate = certificates.get(certificate_id)
+            if certificate is None:
+                results[certificate_id] = self._result(certificate_id, "not_found", error="Certificate not found.")
+            elif certificate.is_revoked:
+                results[certificate_id] = self._result(certificate_id, "already_revoked", certificate)
+            elif not (certificate.is_issued or certificate.is_revoking):
+                results[certificate_id] = self._result(
+                    certificate_id, "failed", certificate, error="Cannot revoke a certificate that has not been issued."
+                )
+            elif certificate.blockchain_id is not None:
+                to_revoke.append(certificate)
+            elif certificate.is_anchored:
+                anchored.append(certificate)
+            else:
+                results[certificate_id] = self._result(
+                    certificate_id, "failed", certificate, error="Certificate has no blockchain identifier."
+                )
+
+        started = [certificate for certificate in to_revoke if certificate.is_issued]
+        for certificate in started:
+            certificate.start_revocation()
+        # Nothing to send for the anchored certificates: revoked as soon as their revocation is persisted
+        for certificate in anchored:
+            if certificate.is_issued:
+                certificate.start_revocation()
+            certificate.confirm_revocation()
+            results[certificate.id] = self._result(certificate.id, "revoked", certificate)
+        # Persist the intent first: from now on the certificates are no longer valid, whatever the chain says
+        await self._repository.save_all(started + anchored)
+        await self._unit_of_work.commit()
+
+        receipts = await self._revoke_on_chain(to_revoke)
+
+        confirmed: List[Certificate] = []
+        for certificate in to_revoke:
+            receipt = receipts[certificate.registry_address].get(certificate.blockchain_id or "")
+            if receipt is not None and receipt.revoked:
+                certificate.confirm_revocation()
+                confirmed.append(certificate)
+                results[certificate.id] = self._result(
+                    certificate.id, "revoked", certificate, transaction_hash=receipt.transaction_hash
+                )
+            else:
+                error = receipt.error if receipt is not None else "The blockchain did not report the revocation."
+                results[certificate.id] = self._result(certificate.id, "failed", certificate, error=error)
+        await self._repository.save_all(confirmed)
+        await self._unit_of_work.commit()
+
+        failed = sum(1 for result in results.values() if result["status"] in ("failed", "not_found"))
+        if failed:
+            await self._logger.warning(f"Could not revoke {failed} of {len(certificate_ids)} certificates.")
+        await self._logger.info(
+            f"Revoked {len(confirmed)} certificates on the blockchain and {len(anchored)} anchored certificates."
+        )
+
+        return {"results": [results[certificate_id] for certificate_id in certificate_ids]}
+
+    async def _revoke_on_chain(
+        self, certificates: List[Certificate]
+    ) -> Dict[Optional[str], Dict[str, RevocationReceipt]]:
+        """Revoke certificates on the registry deployments that recorded them, one call per deployment.
+
+        Returns:
+            Dict[Optional[str], Dict[str, RevocationReceipt]]: The receipts by blockchain ID, keyed by deployment.
+        """
+        by_registry: Dict[Optional[str], List[str]] = {}
+        for certificate in certificates:
+            by_registry.setdefault(certificate.registry_address, []).append(certificate.blockchain_id or "")
+        receipts = await asyncio.gather(
+            *(
+                self._blockchain_service.revoke_certificates(blockchain_ids, registry_address)
+                for registry_address, blockchain_ids in by_registry.items()
+            )
+        )
+        return dict(zip(by_registry, receipts))
+
+    @staticmethod
+    def _result(
+        certificate_id: UUID,
+        status: str,
+        certificate: Optional[Certificate] = None,
+        transaction_hash: Optional[str] = None,
+        error: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        return {
+            "certificate_id": str(certificate_id),
+            "status": status,
+            "blockchain_id": certificate.blockchain_id if certificate is not None else None,
+            "transaction_hash": transaction_hash,
+            "error": error,
+        }
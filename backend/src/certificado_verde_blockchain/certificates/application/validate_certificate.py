@@ -3,7 +3,7 @@ from typing import Any, Dict, Optional
 from miraveja_log import IAsyncLogger
 
 from ...shared.errors import DomainException
-from ..domain import Certificate, IBlockchainService, ICertificateRepository
+from ..domain import Certificate, IBlockchainService, ICertificateRepository, IChainCertificateRepository
 
 
 class ValidateCertificateHandler:
@@ -11,26 +11,65 @@ class ValidateCertificateHandler:
         self,
         repository: ICertificateRepository,
         blockchain_service: IBlockchainService,
+        chain_certificate_repository: IChainCertificateRepository,
         logger: IAsyncLogger,
     ):
         self._repository = repository
         self._blockchain_service = blockchain_service
+        self._chain_certificate_repository = chain_certificate_repository
         self._logger = logger
 
     async def handle(self, certificate_hash: str) -> Dict[str, Any]:
         """Handles the validation of a certificate.
 
+        Certificates anchored through the Merkle root of their epoch are also checked against their
+        stored inclusion proof, without calling a blockchain node. The proof must lead to the root recorded
+        from the confirmed RootAnchored event of the epoch, not merely to the root stored along with it.
+
+        An invalid certificate comes with the reason it is not valid: `revoked` (revocation requested or
+        recorded), `not_issued`, `expired` or `proof_mismatch`.
+
         Args:
             certificate_hash (str): The canonical hash of the certificate.
         Returns:
             Dict[str, Any]: A dictionary containing the result of the operation.
         """
 
-        certificate: Optional[Certificate] = self._repository.find_by_canonical_hash(certificate_hash)
+        certificate: Optional[Certificate] = await self._repository.find_by_canonical_hash(certificate_hash)
         if not certificate:
             raise DomainException("No certificate found matching the provided canonical hash.", code=404)
 
-        return {
-            "certificate": certificate.model_dump(),
-            "is_valid": True,
-        }
+        invalid_reason: Optional[str] = None
+        if certificate.is_revoking or certificate.is_revoked:
+            invalid_reason = "revoked"
+        elif not certificate.is_issued:
+            invalid_reason = "not_issued"
+        elif certificate.has_expired():
+            invalid_reason = "expired"
+
+        result: Dict[str, Any] = {"certificate": certificate.model_dump()}
+        if certificate.is_anchored and certificate.merkle_proof is not None:
+            epoch_id = certificate.merkle_proof.epoch_id or ""
+            anchored_root = await self._chain_certificate_repository.find_anchored_root(epoch_id)
+            if anchored_root is None:
+                included = False
+                await self._logger.warning(f"No anchored root recorded for epoch {epoch_id} of {certificate.id}.")
+            else:
+                included = certificate.merkle_proof.includes(certificate_hash, anchored_root.root)
+                if not included:
+                    await self._logger.warning(
+                        f"Inclusion proof of certificate {certificate.id} does not match the root anchored "
+                        f"for epoch {epoch_id}."
+                    )
+            if not included and invalid_reason is None:
+                invalid_reason = "proof_mismatch"
+            result["merkle_anchor"] = {
+                "epoch_id": epoch_id,
+                "root": anchored_root.root if anchored_root is not None else None,
+                "transaction_hash": anchored_root.transaction_hash if anchored_root is not None else None,
+                "included": included,
+            }
+
+        result["is_valid"] = invalid_reason is None
+        result["invalid_reason"] = invalid_reason
+        return result
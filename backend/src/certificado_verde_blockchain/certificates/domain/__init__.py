@@ -1,3 +1,4 @@
+from .anchored_root import AnchoredRoot
 from .authenticity_proof import AuthenticityProof
 from .canonical_certificate import CanonicalCertificate
 from .canonical_certificate_service import CanonicalCertificateService
@@ -5,19 +6,34 @@ from .canonical_certifier import CanonicalCertifier
 from .canonical_producer import CanonicalProducer
 from .canonical_product import CanonicalProduct
 from .certificate import Certificate
+from .certificate_status import PRE_ISSUED_STATUSES, CertificateStatus
+from .chain_certificate import ChainCertificate
+from .chain_cursor import ChainCursor
+from .chain_event import ChainEvent, ChainEventType
 from .i_blockchain_service import IBlockchainService
 from .i_certificate_repository import ICertificateRepository
 from .i_certifier_service import ICertifierService
+from .i_chain_certificate_repository import IChainCertificateRepository
 from .i_file_service import IFileService
+from .i_issuance_task_repository import IIssuanceTaskRepository
 from .i_producer_service import IProducerService
 from .i_product_service import IProductService
 from .i_qr_code_service import IQRCodeService
 from .i_serial_code_service import ISerialCodeService
 from .i_storage_service import IStorageService
+from .issuance_receipt import IssuanceReceipt
+from .issuance_task import IssuanceTask, IssuanceTaskStatus
+from .merkle_inclusion_proof import MerkleInclusionProof
 from .norm import Norm
+from .prepared_transaction import PreparedTransaction
+from .registry_certificate import RegistryCertificate
+from .revocation_receipt import RevocationReceipt
+from .signature_check import SignatureCheck
+from .signature_verification import SignatureVerification
 from .sustainability_criteria import SustainabilityCriteria
 
 __all__ = [
+    "AnchoredRoot",
     "AuthenticityProof",
     "CanonicalCertificate",
     "CanonicalCertificateService",
@@ -28,10 +44,27 @@ __all__ = [
     "CanonicalProduct",
     "IProductService",
     "Certificate",
+    "CertificateStatus",
+    "PRE_ISSUED_STATUSES",
+    "ChainCertificate",
+    "ChainCursor",
+    "ChainEvent",
+    "ChainEventType",
     "IBlockchainService",
     "ICertificateRepository",
+    "IChainCertificateRepository",
+    "IIssuanceTaskRepository",
+    "IssuanceReceipt",
+    "IssuanceTask",
+    "IssuanceTaskStatus",
     "ISerialCodeService",
+    "MerkleInclusionProof",
     "Norm",
+    "PreparedTransaction",
+    "RegistryCertificate",
+    "RevocationReceipt",
+    "SignatureCheck",
+    "SignatureVerification",
     "SustainabilityCriteria",
     "IFileService",
     "IQRCodeService",
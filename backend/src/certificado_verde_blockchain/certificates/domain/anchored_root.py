@@ -0,0 +1,20 @@
+from typing import Annotated
+
+from pydantic import BaseModel, Field
+
+
+class AnchoredRoot(BaseModel):
+    """Read model of a Merkle root anchored in the CertificateRegistry contract, recorded from the RootAnchored
+    event of a confirmed anchoring transaction, by the issuance worker or the chain event indexer.
+
+    Attributes:
+        epoch_id (str): Identifier of the epoch in the contract.
+        root (str): Hex encoded Merkle root of the epoch, as anchored on chain.
+        block_number (int): Block where the root was anchored.
+        transaction_hash (str): Transaction that anchored the root.
+    """
+
+    epoch_id: Annotated[str, Field(description="Identifier of the epoch in the contract.")]
+    root: Annotated[str, Field(description="Hex encoded Merkle root of the epoch, as anchored on chain.")]
+    block_number: Annotated[int, Field(description="Block where the root was anchored.")]
+    transaction_hash: Annotated[str, Field(description="Transaction that anchored the root.")]
@@ -1,11 +1,14 @@
 from datetime import datetime, timezone
-from typing import Annotated, ClassVar, List, Optional
+from typing import Annotated, Any, ClassVar, Dict, List, Optional, Set
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, ConfigDict, Field, field_serializer
+from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
 
+from ...shared.canonical import CanonicalEncoding
 from ...shared.errors import DomainException
 from .authenticity_proof import AuthenticityProof
+from .certificate_status import PRE_ISSUED_STATUSES, CertificateStatus
+from .merkle_inclusion_proof import MerkleInclusionProof
 from .norm import Norm
 from .sustainability_criteria import SustainabilityCriteria
 
@@ -29,13 +32,31 @@ class Certificate(BaseModel):
         norms_complied (List[Norm]): List of norms that the product complies with.
         sustainability_criteria (List[SustainabilityCriteria]): List of sustainability criteria met by the product.
         notes (Optional[str]): Additional notes about the certificate.
-        issued_at (Optional[str]): ISO formatted date when the certificate was issued.
-        valid_until (Optional[str]): ISO formatted date when the certificate expires.
-        last_audited_at (Optional[str]): ISO formatted date of the last audit.
+        issued_at (Optional[datetime]): Date when the certificate was issued, serialized in ISO format.
+        valid_until (Optional[datetime]): Date when the certificate expires, serialized in ISO format.
+        last_audited_at (Optional[datetime]): Date of the last audit, serialized in ISO format.
         authenticity_proof (Optional[AuthenticityProof]): Proof of authenticity of the certificate.
         canonical_hash (Optional[str]): Canonical hash of the certificate data for integrity verification.
+        blockchain_id (Optional[str]): Identifier of the certificate in the blockchain.
+        registry_address (Optional[str]): Address of the registry deployment the blockchain ID belongs to.
+        status (CertificateStatus): Stage of the certificate in the issuance lifecycle.
+        issuance_error (Optional[str]): Reason of the last failed issuance, if any.
+        revoked_at (Optional[str]): ISO formatted date when the revocation was requested.
+        merkle_proof (Optional[MerkleInclusionProof]): Inclusion proof of the certificate in an anchored epoch,
+            when it is recorded on the blockchain through a Merkle root instead of its own registry entry.
     """
 
+    # Issuance and revocation bookkeeping fields, not part of the data signed by the certifier
+    ISSUANCE_FIELDS: ClassVar[Set[str]] = {"status", "issuance_error", "revoked_at", "merkle_proof", "registry_address"}
+    # Fields filled in by the issuance after the certifier signed the certificate
+    ISSUED_FIELDS: ClassVar[Set[str]] = {
+        "issued_at",
+        "valid_until",
+        "authenticity_proof",
+        "canonical_hash",
+        "blockchain_id",
+    }
+
     model_config: ClassVar[ConfigDict] = ConfigDict(use_enum_values=True)
 
     id: Annotated[UUID, Field(default_factory=uuid4, description="Unique identifier of the certificate.")]
@@ -54,14 +75,12 @@ class Certificate(BaseModel):
 
     # Issued certificate details
     issued_at: Annotated[
-        Optional[str], Field(default=None, description="ISO formatted date when the certificate was issued.")
+        Optional[datetime], Field(default=None, description="Date when the certificate was issued.")
     ] = None
     valid_until: Annotated[
-        Optional[str], Field(default=None, description="ISO formatted date when the certificate expires.")
-    ] = None
-    last_audited_at: Annotated[
-        Optional[str], Field(default=None, description="ISO formatted date of the last audit.")
+        Optional[datetime], Field(default=None, description="Date when the certificate expires.")
     ] = None
+    last_audited_at: Annotated[Optional[datetime], Field(default=None, description="Date of the last audit.")] = None
     authenticity_proof: Annotated[
         Optional[AuthenticityProof], Field(default=None, description="Proof of authenticity of the certificate.")
     ] = None
@@ -72,68 +91,255 @@ class Certificate(BaseModel):
     blockchain_id: Annotated[Optional[str], Field(description="Identifier of the certificate in the blockchain.")] = (
         None
     )
+    registry_address: Annotated[
+        Optional[str], Field(description="Address of the registry deployment the blockchain ID belongs to.")
+    ] = None
+    status: Annotated[CertificateStatus, Field(description="Stage of the certificate in the issuance lifecycle.")] = (
+        CertificateStatus.PRE_ISSUED
+    )
+    issuance_error: Annotated[Optional[str], Field(description="Reason of the last failed issuance, if any.")] = None
+    revoked_at: Annotated[
+        Optional[str], Field(default=None, description="ISO formatted date when the revocation was requested.")
+    ] = None
+    merkle_proof: Annotated[
+        Optional[MerkleInclusionProof],
+        Field(default=None, description="Inclusion proof of the certificate in an epoch anchored on the blockchain."),
+    ] = None
 
     @field_serializer("id", "product_id", "producer_id", "certifier_id")
     def serialize_id(self, id: UUID) -> str:
         """Serialize the UUID id to a string."""
         return str(id)
 
+    @field_validator("issued_at", "valid_until", "last_audited_at")
+    @classmethod
+    def validate_timezone(cls, value: Optional[datetime]) -> Optional[datetime]:
+        """Take a date without timezone as UTC, so that the dates can always be compared."""
+        if value is not None and value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value
+
+    @field_serializer("issued_at", "valid_until", "last_audited_at")
+    def serialize_datetime(self, value: Optional[datetime]) -> Optional[str]:
+        """Serialize the dates to ISO format, as they are signed and hashed."""
+        return value.isoformat() if value is not None else None
+
     @property
     def is_pre_issued(self) -> bool:
-        """Check if the certificate is in a pre-issued state (i.e., not yet issued).
+        """Check if the certificate is in a pre-issued state (i.e., not yet issued and not being issued).
+        A certificate whose issuance failed is pre-issued again and can be resubmitted.
 
         Returns:
             bool: True if the certificate is pre-issued, False otherwise.
         """
-        return (
-            self.issued_at is None
-            or self.valid_until is None
-            or self.authenticity_proof is None
-            or self.canonical_hash is None
-            or self.blockchain_id is None
-        )
+        return self.status in PRE_ISSUED_STATUSES
 
-    def issue(
+    @property
+    def is_issuing(self) -> bool:
+        """Check if the certificate is waiting to be recorded on the blockchain.
+
+        Returns:
+            bool: True if the certificate issuance is in progress, False otherwise.
+        """
+        return self.status == CertificateStatus.ISSUING
+
+    @property
+    def is_issued(self) -> bool:
+        """Check if the certificate has been recorded on the blockchain.
+
+        Returns:
+            bool: True if the certificate is issued, False otherwise.
+        """
+        return self.status == CertificateStatus.ISSUED
+
+    @property
+    def is_revoking(self) -> bool:
+        """Check if the certificate revocation is waiting to be recorded on the blockchain.
+
+        Returns:
+            bool: True if the certificate revocation is in progress, False otherwise.
+        """
+        return self.status == CertificateStatus.REVOKING
+
+    @property
+    def is_revoked(self) -> bool:
+        """Check if the certificate revocation has been recorded on the blockchain.
+
+        Returns:
+            bool: True if the certificate is revoked, False otherwise.
+        """
+        return self.status == CertificateStatus.REVOKED
+
+    @property
+    def is_anchored(self) -> bool:
+        """Check if the certificate is recorded on the blockchain through the Merkle root of its epoch.
+
+        Returns:
+            bool: True if the epoch of the certificate has been anchored, False otherwise.
+        """
+        return self.merkle_proof is not None and self.merkle_proof.epoch_id is not None
+
+    @property
+    def canonical_encoding(self) -> CanonicalEncoding:
+        """Get the canonical encoding used to hash this certificate, selected by its schema version.
+
+        Returns:
+            CanonicalEncoding: LEGACY for schema versions below 2, V2 otherwise.
+        """
+        return CanonicalEncoding.for_schema_version(self.version)
+
+    def signable_payload(self) -> Dict[str, Any]:
+        """Get the certificate data signed by the certifier, without the issuance bookkeeping fields.
+
+        Returns:
+            Dict[str, Any]: The serialized certificate data to be hashed and signed.
+        """
+        return self.model_dump(exclude=self.ISSUANCE_FIELDS)
+
+    def signed_payload(self) -> Dict[str, Any]:
+        """Get the certificate data as it was when the certifier signed it, with the fields filled in
+        by the issuance reset to their pre-issued values. Used to re-verify stored signatures.
+
+        Returns:
+            Dict[str, Any]: The serialized certificate data that was hashed and signed.
+        """
+        return self.model_copy(update={field: None for field in self.ISSUED_FIELDS}).signable_payload()
+
+    def start_issuance(
         self,
         issued_at: datetime,
         valid_until: datetime,
         authenticity_proof: AuthenticityProof,
         canonical_hash: str,
-        blockchain_id: str,
     ) -> None:
-        """Issue the certificate by setting its issued date, validity date,
-        authenticity proof, canonical hash, and blockchain ID.
+        """Move the certificate to the issuing state, setting its issued date, validity date,
+        authenticity proof and canonical hash while it waits to be recorded on the blockchain.
 
         Args:
             issued_at (datetime): The date and time when the certificate is issued.
             valid_until (datetime): The date and time when the certificate expires.
             authenticity_proof (AuthenticityProof): The authenticity proof of the certificate.
             canonical_hash (str): The canonical hash of the certificate data.
-            blockchain_id (str): The identifier of the certificate in the blockchain.
 
         Raises:
-            DomainException: If the certificate has already been issued.
+            DomainException: If the certificate has already been issued or is being issued.
         """
         if not self.is_pre_issued:
             raise DomainException("Certificate has already been issued.", 400)
 
-        self.issued_at = issued_at.isoformat()
-        self.valid_until = valid_until.isoformat()
+        self.issued_at = issued_at
+        self.valid_until = valid_until
         self.authenticity_proof = authenticity_proof
         self.canonical_hash = canonical_hash
+        self.blockchain_id = None
+        self.registry_address = None
+        self.merkle_proof = None
+        self.issuance_error = None
+        self.status = CertificateStatus.ISSUING
+
+    def confirm_issuance(self, blockchain_id: str, registry_address: Optional[str] = None) -> None:
+        """Complete the issuance once the certificate has been recorded on the blockchain.
+
+        Args:
+            blockchain_id (str): The identifier of the certificate in the blockchain.
+            registry_address (Optional[str]): The address of the registry deployment that recorded it.
+
+        Raises:
+            DomainException: If the certificate is not being issued.
+        """
+        if not self.is_issuing:
+            raise DomainException("Certificate is not being issued.", 400)
+
         self.blockchain_id = blockchain_id
+        self.registry_address = registry_address
+        self.status = CertificateStatus.ISSUED
+
+    def attach_merkle_proof(self, merkle_proof: MerkleInclusionProof) -> None:
+        """Attach the inclusion proof of the epoch the certificate was gathered into, while the root
+        of the epoch waits to be anchored on the blockchain.
+
+        Args:
+            merkle_proof (MerkleInclusionProof): The inclusion proof, without epoch identifier yet.
+
+        Raises:
+            DomainException: If the certificate is not being issued.
+        """
+        if not self.is_issuing:
+            raise DomainException("Certificate is not being issued.", 400)
+
+        self.merkle_proof = merkle_proof
+
+    def confirm_anchoring(self, epoch_id: str) -> None:
+        """Complete the issuance once the Merkle root of the certificate's epoch has been anchored.
+
+        Args:
+            epoch_id (str): The identifier of the epoch in the blockchain.
+
+        Raises:
+            DomainException: If the certificate is not being issued or has no inclusion proof.
+        """
+        if not self.is_issuing or self.merkle_proof is None:
+            raise DomainException("Certificate is not being anchored.", 400)
+
+        self.merkle_proof = self.merkle_proof.model_copy(update={"epoch_id": epoch_id})
+        self.status = CertificateStatus.ISSUED
+
+    def fail_issuance(self, reason: str) -> None:
+        """Abort the issuance, returning the certificate to a state where it can be issued again.
+
+        Args:
+            reason (str): Why the certificate could not be recorded on the blockchain.
+
+        Raises:
+            DomainException: If the certificate is not being issued.
+        """
+        if not self.is_issuing:
+            raise DomainException("Certificate is not being issued.", 400)
+
+        self.issued_at = None
+        self.valid_until = None
+        self.authenticity_proof = None
+        self.canonical_hash = None
+        self.merkle_proof = None
+        self.issuance_error = reason
+        self.status = CertificateStatus.FAILED
+
+    def issue(
+        self,
+        issued_at: datetime,
+        valid_until: datetime,
+        authenticity_proof: AuthenticityProof,
+        canonical_hash: str,
+        blockchain_id: str,
+        registry_address: Optional[str] = None,
+    ) -> None:
+        """Issue the certificate by setting its issued date, validity date,
+        authenticity proof, canonical hash, and blockchain ID.
+
+        Args:
+            issued_at (datetime): The date and time when the certificate is issued.
+            valid_until (datetime): The date and time when the certificate expires.
+            authenticity_proof (AuthenticityProof): The authenticity proof of the certificate.
+            canonical_hash (str): The canonical hash of the certificate data.
+            blockchain_id (str): The identifier of the certificate in the blockchain.
+            registry_address (Optional[str]): The address of the registry deployment that recorded it.
+
+        Raises:
+            DomainException: If the certificate has already been issued.
+        """
+        self.start_issuance(issued_at, valid_until, authenticity_proof, canonical_hash)
+        self.confirm_issuance(blockchain_id, registry_address)
 
     def has_expired(self) -> bool:
         """Check if the certificate has expired based on the current date and the valid_until date.
+        Revoking or revoked certificates keep their validity period, so they can have expired as well.
 
         Returns:
             bool: True if the certificate has expired, False otherwise.
         """
-        if self.is_pre_issued or self.valid_until is None:
+        if not (self.is_issued or self.is_revoking or self.is_revoked) or self.valid_until is None:
             return False
-        current_time = datetime.now(timezone.utc)
-        valid_until_time = datetime.fromisoformat(self.valid_until)
-        return current_time > valid_until_time
+        return datetime.now(timezone.utc) > self.valid_until
 
     def is_audited(self) -> bool:
         """Check if the certificate has been audited at least once.
@@ -144,14 +350,33 @@ class Certificate(BaseModel):
         return self.last_audited_at is not None
 
     def audit(self) -> None:
-        """Update the last_audited_at attribute to the current date and time in ISO format."""
-        self.last_audited_at = datetime.now(timezone.utc).isoformat()
+        """Update the last_audited_at attribute to the current date and time."""
+        self.last_audited_at = datetime.now(timezone.utc)
+
+    def start_revocation(self) -> None:
+        """Move the certificate to the revoking state while its revocation is recorded on the blockchain.
+        The certificate stops being valid right away. The issued data (`valid_until` included) is kept
+        untouched, so the canonical hash recorded on chain can still be recomputed.
+
+        Raises:
+            DomainException: If the certificate is not issued.
+        """
+        if not self.is_issued:
+            raise DomainException("Cannot revoke a certificate that has not been issued.", 400)
+
+        self.revoked_at = datetime.now(timezone.utc).isoformat()
+        self.status = CertificateStatus.REVOKING
+
+    def confirm_revocation(self) -> None:
+        """Complete the revocation once it has been recorded on the blockchain.
+
+        Raises:
+            DomainException: If the certificate is not being revoked.
+        """
+        if not self.is_revoking:
+            raise DomainException("Certificate is not being revoked.", 400)
 
-    def revoke(self) -> None:
-        """Revoke the certificate by setting its valid_until date to the current date and time."""
-        if self.is_pre_issued:
-            raise DomainException("Cannot revoke a pre-issued certificate.", 400)
-        self.valid_until = datetime.now(timezone.utc).isoformat()
+        self.status = CertificateStatus.REVOKED
 
     def set_pdf_hash(self, pdf_hash: str) -> None:
         """Set the PDF hash in the authenticity proof.
@@ -159,6 +384,6 @@ class Certificate(BaseModel):
         Args:
             pdf_hash (str): The hash of the PDF document associated with the certificate.
         """
-        if self.authenticity_proof is None:
-            raise DomainException("Cannot set PDF hash on a pre-issued certificate.", 400)
+        if not self.is_issued or self.authenticity_proof is None:
+            raise DomainException("Cannot set PDF hash on a certificate that has not been issued.", 400)
         self.authenticity_proof.pdf_hash = pdf_hash
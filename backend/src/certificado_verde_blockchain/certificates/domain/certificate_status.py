@@ -0,0 +1,18 @@
+from enum import Enum
+from typing import Tuple
+
+
+class CertificateStatus(str, Enum):
+    PRE_ISSUED = "pre_issued"
+    ISSUING = "issuing"
+    ISSUED = "issued"
+    FAILED = "failed"
+    REVOKING = "revoking"
+    REVOKED = "revoked"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+# A certificate whose issuance failed is pre-issued again and can be resubmitted
+PRE_ISSUED_STATUSES: Tuple[CertificateStatus, ...] = (CertificateStatus.PRE_ISSUED, CertificateStatus.FAILED)
@@ -0,0 +1,32 @@
+from typing import Annotated, Optional
+
+from pydantic import BaseModel, Field
+
+
+class ChainCertificate(BaseModel):
+    """Read model mirroring a certificate as recorded in the CertificateRegistry contract,
+    built by the chain event indexer from CertificateIssued and CertificateRevoked events.
+
+    Attributes:
+        blockchain_id (str): Identifier of the certificate in the contract.
+        data_hash (str): Hash of the off-chain certificate data anchored on chain.
+        issuer (str): Address that issued the certificate.
+        owner (str): Address that owns the certificate.
+        issued_at (int): Block timestamp of the issuance.
+        block_number (int): Block where the certificate was issued.
+        transaction_hash (str): Transaction that issued the certificate.
+        revoked (bool): Whether the certificate has been revoked.
+        revoked_at (Optional[int]): Block timestamp of the revocation.
+        revoked_block_number (Optional[int]): Block where the certificate was revoked.
+    """
+
+    blockchain_id: Annotated[str, Field(description="Identifier of the certificate in the contract.")]
+    data_hash: Annotated[str, Field(description="Hash of the off-chain certificate data anchored on chain.")]
+    issuer: Annotated[str, Field(description="Address that issued the certificate.")]
+    owner: Annotated[str, Field(description="Address that owns the certificate.")]
+    issued_at: Annotated[int, Field(description="Block timestamp of the issuance.")]
+    block_number: Annotated[int, Field(description="Block where the certificate was issued.")]
+    transaction_hash: Annotated[str, Field(description="Transaction that issued the certificate.")]
+    revoked: Annotated[bool, Field(description="Whether the certificate has been revoked.")] = False
+    revoked_at: Annotated[Optional[int], Field(description="Block timestamp of the revocation.")] = None
+    revoked_block_number: Annotated[Optional[int], Field(description="Block where the certificate was revoked.")] = None
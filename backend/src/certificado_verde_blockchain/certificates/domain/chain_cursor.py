@@ -0,0 +1,15 @@
+from typing import Annotated
+
+from pydantic import BaseModel, Field
+
+
+class ChainCursor(BaseModel):
+    """Last block processed by the chain event indexer.
+
+    Attributes:
+        block_number (int): Number of the last indexed block.
+        block_hash (str): Hash of the last indexed block, used to detect reorgs.
+    """
+
+    block_number: Annotated[int, Field(description="Number of the last indexed block.")]
+    block_hash: Annotated[str, Field(description="Hash of the last indexed block, used to detect reorgs.")]
@@ -0,0 +1,47 @@
+from enum import Enum
+from typing import Annotated, ClassVar, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class ChainEventType(str, Enum):
+    CERTIFICATE_ISSUED = "CertificateIssued"
+    CERTIFICATE_REVOKED = "CertificateRevoked"
+    ROOT_ANCHORED = "RootAnchored"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+class ChainEvent(BaseModel):
+    """Decoded CertificateRegistry event, identified by its position in the chain.
+
+    Attributes:
+        event_type (ChainEventType): Name of the contract event.
+        blockchain_id (str): Identifier of the certificate the event refers to (of the epoch for RootAnchored).
+        block_number (int): Block containing the event.
+        block_hash (str): Hash of the block containing the event.
+        transaction_hash (str): Transaction that emitted the event.
+        log_index (int): Position of the event in the block.
+        timestamp (int): Timestamp carried by the event.
+        data_hash (Optional[str]): Anchored data hash (issuance only), or Merkle root (anchoring only).
+        issuer (Optional[str]): Issuer address (issuance and anchoring only).
+        owner (Optional[str]): Owner address (issuance only).
+    """
+
+    model_config: ClassVar[ConfigDict] = ConfigDict(use_enum_values=True)
+
+    event_type: Annotated[ChainEventType, Field(description="Name of the contract event.")]
+    blockchain_id: Annotated[
+        str, Field(description="Identifier of the certificate the event refers to (of the epoch for RootAnchored).")
+    ]
+    block_number: Annotated[int, Field(description="Block containing the event.")]
+    block_hash: Annotated[str, Field(description="Hash of the block containing the event.")]
+    transaction_hash: Annotated[str, Field(description="Transaction that emitted the event.")]
+    log_index: Annotated[int, Field(description="Position of the event in the block.")]
+    timestamp: Annotated[int, Field(description="Timestamp carried by the event.")]
+    data_hash: Annotated[
+        Optional[str], Field(description="Anchored data hash (issuance only), or Merkle root (anchoring only).")
+    ] = None
+    issuer: Annotated[Optional[str], Field(description="Issuer address (issuance and anchoring only).")] = None
+    owner: Annotated[Optional[str], Field(description="Owner address (issuance only).")] = None
@@ -1,20 +1,144 @@
 from abc import ABC, abstractmethod
-from typing import Any, Mapping
+from typing import Any, AsyncIterator, Dict, List, Mapping, Optional, Tuple
+
+from ...shared.canonical import CanonicalEncoding
+from .issuance_receipt import IssuanceReceipt
+from .prepared_transaction import PreparedTransaction
+from .registry_certificate import RegistryCertificate
+from .revocation_receipt import RevocationReceipt
+from .signature_check import SignatureCheck
+from .signature_verification import SignatureVerification
 
 
 class IBlockchainService(ABC):
     @abstractmethod
-    async def record_certificate(self, certificate_hash: str, certifier_address: str) -> str:
-        """Record the certificate data on the blockchain.
+    async def prepare_certificates(self, certificates: List[Tuple[str, str]]) -> PreparedTransaction:
+        """Sign a transaction recording the given certificates, without sending it.
+
+        Args:
+            certificates (List[Tuple[str, str]]): Pairs of certificate hash and certifier address.
+
+        Returns:
+            PreparedTransaction: The signed transaction, to be sent with `broadcast_transaction`.
+        """
+
+    @abstractmethod
+    async def prepare_anchor(self, root: str, leaf_count: int) -> PreparedTransaction:
+        """Sign a transaction anchoring the Merkle root of an epoch of certificates, without sending it.
+
+        Args:
+            root (str): The hex encoded Merkle root of the epoch.
+            leaf_count (int): The number of certificates in the epoch.
+
+        Returns:
+            PreparedTransaction: The signed transaction, to be sent with `broadcast_transaction`.
+        """
+
+    @abstractmethod
+    async def broadcast_transaction(self, transaction: PreparedTransaction) -> None:
+        """Send a prepared transaction to the blockchain without waiting for it to be mined.
+
+        Args:
+            transaction (PreparedTransaction): The transaction returned by one of the `prepare_*` methods.
+
+        Raises:
+            DomainException: If the node did not confirm it took the transaction; it may still have.
+        """
+
+    @abstractmethod
+    async def find_issued_certificates(self, certificate_hashes: List[str]) -> Optional[Dict[str, str]]:
+        """Look up which of the given certificate hashes are already recorded in the registry.
+
+        Args:
+            certificate_hashes (List[str]): The canonical hashes to look up.
+
+        Returns:
+            Optional[Dict[str, str]]: The blockchain IDs of the recorded hashes, keyed by hash, or None if the
+                registry cannot look certificates up by hash (v1 registries).
+        """
+
+    @abstractmethod
+    async def get_issuance_receipts(self, transaction_hashes: List[str]) -> Dict[str, IssuanceReceipt]:
+        """Fetch the outcome of several issuance transactions at once.
+
+        Args:
+            transaction_hashes (List[str]): The hashes of the transactions to check.
+
+        Returns:
+            Dict[str, IssuanceReceipt]: The receipts of the mined transactions, keyed by transaction hash,
+                covering both registry issuances and anchored Merkle roots. Transactions that are not mined
+                yet are left out.
+        """
+
+    @abstractmethod
+    async def is_transaction_pending(self, transaction_hash: str) -> bool:
+        """Check if a transaction is still known by the node (mined or waiting in the mempool).
 
         Args:
-            certificate_hash (str): The hash of the certificate to be recorded.
-            certifier_address (str): The blockchain address of the certifier.
+            transaction_hash (str): The hash of the transaction.
 
         Returns:
-            str: The id of the recorded certificate.
+            bool: False if the node has dropped the transaction, True otherwise.
         """
 
+    @property
+    @abstractmethod
+    def registry_address(self) -> str:
+        """The address of the registry deployment new certificates are recorded on."""
+
+    @abstractmethod
+    async def revoke_certificates(
+        self, blockchain_ids: List[str], registry_address: Optional[str] = None
+    ) -> Dict[str, RevocationReceipt]:
+        """Revoke certificates on the blockchain, in as few transactions as the gas limit allows,
+        and wait for them to be mined. Certificates already revoked on chain are reported as revoked.
+
+        Args:
+            blockchain_ids (List[str]): The blockchain identifiers of the certificates to revoke.
+            registry_address (Optional[str]): The registry deployment that recorded them; defaults to the one
+                new certificates are recorded on.
+
+        Returns:
+            Dict[str, RevocationReceipt]: The outcome of every certificate, keyed by blockchain identifier.
+        """
+
+    @abstractmethod
+    async def replace_transaction(self, transaction_hash: str) -> Optional[str]:
+        """Resend a stalled transaction with higher fees under the same nonce, so it replaces the original.
+
+        Only one of the two can be mined, so callers must keep checking both hashes.
+
+        Args:
+            transaction_hash (str): The hash of the pending transaction.
+
+        Returns:
+            Optional[str]: The hash of the replacement transaction, or None if the transaction is no longer
+                pending or its fees cannot be raised any further.
+        """
+
+    @abstractmethod
+    async def count_certificates(self) -> int:
+        """Count the certificates recorded in the contract; their identifiers go from 1 to the count.
+
+        Returns:
+            int: The number of certificates ever issued, revoked ones included.
+        """
+
+    @abstractmethod
+    async def read_certificates(self, first_id: int, last_id: int) -> AsyncIterator[List[RegistryCertificate]]:
+        """Read a range of certificates from contract storage in pages, fetching several pages concurrently.
+
+        Args:
+            first_id (int): The identifier of the first certificate to read.
+            last_id (int): The identifier of the last certificate to read, inclusive.
+
+        Returns:
+            AsyncIterator[List[RegistryCertificate]]: Consecutive pages of certificates, in identifier order.
+                Identifiers past the last issued certificate are left out.
+        """
+        raise NotImplementedError
+        yield  # pylint: disable=unreachable
+
     @abstractmethod
     async def verify_signature(self, certificate_hash: str, signature: str, address: str) -> None:
         """Verify the digital signature of the certificate hash.
@@ -29,11 +153,26 @@ class IBlockchainService(ABC):
         """
 
     @abstractmethod
-    async def hash_data(self, data: Mapping[str, Any]) -> str:
+    async def verify_signatures(self, checks: List[SignatureCheck]) -> AsyncIterator[SignatureVerification]:
+        """Verify a batch of signatures, yielding each outcome as soon as it is known.
+        Outcomes are not necessarily yielded in the order of the checks; use `SignatureVerification.key`.
+
+        Args:
+            checks (List[SignatureCheck]): The signatures to verify.
+
+        Returns:
+            AsyncIterator[SignatureVerification]: The outcome of every check, invalid signatures included.
+        """
+        raise NotImplementedError
+        yield  # pylint: disable=unreachable
+
+    @abstractmethod
+    async def hash_data(self, data: Mapping[str, Any], encoding: CanonicalEncoding = CanonicalEncoding.LEGACY) -> str:
         """Generate a hash for the given mapping data.
 
         Args:
             data (Mapping[str, Any]): The data to be hashed.
+            encoding (CanonicalEncoding): The canonical encoding the data is serialized with before hashing.
         Returns:
             str: The generated hash of the data.
         """
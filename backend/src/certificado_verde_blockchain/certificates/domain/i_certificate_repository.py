@@ -1,21 +1,31 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Tuple
 from uuid import UUID
 
 from .certificate import Certificate
+from .certificate_status import CertificateStatus
+from .norm import Norm
 
 
 class ICertificateRepository(ABC):
     @abstractmethod
-    def list_all(self) -> List[Certificate]:
-        """Retrieve all certificates from the repository.
+    async def list_pre_issued(
+        self, certifier_id: Optional[UUID], after_id: Optional[UUID], limit: int
+    ) -> List[Certificate]:
+        """List the pre-issued certificates (see `Certificate.is_pre_issued`), ordered by ID.
+
+        Args:
+            certifier_id (Optional[UUID]): Only the certificates of this certifier are listed; None lists all.
+            after_id (Optional[UUID]): Only certificates with a greater ID are listed; None starts from the first.
+            limit (int): Maximum number of certificates to return.
 
         Returns:
-            List[Certificate]: A list of all certificates.
+            List[Certificate]: The next page of pre-issued certificates.
         """
 
     @abstractmethod
-    def find_by_id(self, certificate_id: UUID) -> Optional[Certificate]:
+    async def find_by_id(self, certificate_id: UUID) -> Optional[Certificate]:
         """Find a certificate by its unique identifier.
 
         Args:
@@ -26,7 +36,18 @@ class ICertificateRepository(ABC):
         """
 
     @abstractmethod
-    def find_by_canonical_hash(self, canonical_hash: str) -> Optional[Certificate]:
+    async def find_by_ids(self, certificate_ids: List[UUID]) -> List[Certificate]:
+        """Find several certificates by their unique identifiers in a single query.
+
+        Args:
+            certificate_ids (List[UUID]): The unique identifiers of the certificates.
+
+        Returns:
+            List[Certificate]: The certificates found, in no particular order; unknown IDs are left out.
+        """
+
+    @abstractmethod
+    async def find_by_canonical_hash(self, canonical_hash: str) -> Optional[Certificate]:
         """Find a certificate by its canonical hash.
 
         Args:
@@ -37,40 +58,55 @@ class ICertificateRepository(ABC):
         """
 
     @abstractmethod
-    def find_by_product_id(self, product_id: UUID) -> List[Certificate]:
-        """Find certificates by the associated product ID.
+    async def find_by_product_id(
+        self, product_id: UUID, after_id: Optional[UUID], limit: int, status: Optional[CertificateStatus] = None
+    ) -> List[Certificate]:
+        """Find certificates by the associated product ID, ordered by ID.
 
         Args:
             product_id (UUID): The unique identifier of the product.
+            after_id (Optional[UUID]): Only certificates with a greater ID are listed; None starts from the first.
+            limit (int): Maximum number of certificates to return.
+            status (Optional[CertificateStatus]): Only certificates in this status are listed; None lists all.
 
         Returns:
-            List[Certificate]: A list of certificates associated with the product.
+            List[Certificate]: The next page of certificates associated with the product.
         """
 
     @abstractmethod
-    def find_by_producer_id(self, producer_id: UUID) -> List[Certificate]:
-        """Find certificates by the associated producer ID.
+    async def find_by_producer_id(
+        self, producer_id: UUID, after_id: Optional[UUID], limit: int, status: Optional[CertificateStatus] = None
+    ) -> List[Certificate]:
+        """Find certificates by the associated producer ID, ordered by ID.
 
         Args:
             producer_id (UUID): The unique identifier of the producer.
+            after_id (Optional[UUID]): Only certificates with a greater ID are listed; None starts from the first.
+            limit (int): Maximum number of certificates to return.
+            status (Optional[CertificateStatus]): Only certificates in this status are listed; None lists all.
 
         Returns:
-            List[Certificate]: A list of certificates associated with the producer.
+            List[Certificate]: The next page of certificates associated with the producer.
         """
 
     @abstractmethod
-    def find_by_certifier_id(self, certifier_id: UUID) -> List[Certificate]:
-        """Find certificates by the associated certifier ID.
+    async def find_by_certifier_id(
+        self, certifier_id: UUID, after_id: Optional[UUID], limit: int, status: Optional[CertificateStatus] = None
+    ) -> List[Certificate]:
+        """Find certificates by the associated certifier ID, ordered by ID.
 
         Args:
             certifier_id (UUID): The unique identifier of the certifier.
+            after_id (Optional[UUID]): Only certificates with a greater ID are listed; None starts from the first.
+            limit (int): Maximum number of certificates to return.
+            status (Optional[CertificateStatus]): Only certificates in this status are listed; None lists all.
 
         Returns:
-            List[Certificate]: A list of certificates associated with the certifier.
+            List[Certificate]: The next page of certificates associated with the certifier.
         """
 
     @abstractmethod
-    def find_by_pdf_hash(self, pdf_hash: str) -> Optional[Certificate]:
+    async def find_by_pdf_hash(self, pdf_hash: str) -> Optional[Certificate]:
         """Find a certificate by its PDF hash.
 
         Args:
@@ -81,9 +117,117 @@ class ICertificateRepository(ABC):
         """
 
     @abstractmethod
-    def save(self, certificate: Certificate) -> None:
-        """Save or update a certificate in the repository.
+    async def list_signed(self, after_id: Optional[UUID], limit: int) -> List[Certificate]:
+        """List certificates that carry a certifier signature, ordered by ID.
+
+        Args:
+            after_id (Optional[UUID]): Only certificates with a greater ID are listed; None starts from the first.
+            limit (int): Maximum number of certificates to return.
+
+        Returns:
+            List[Certificate]: The next page of signed certificates.
+        """
+
+    @abstractmethod
+    async def stream(
+        self,
+        chunk_size: int,
+        status: Optional[CertificateStatus] = None,
+        certifier_id: Optional[UUID] = None,
+        norm: Optional[Norm] = None,
+        issued_from: Optional[datetime] = None,
+        issued_until: Optional[datetime] = None,
+    ) -> AsyncIterator[List[Certificate]]:
+        """Stream the certificates matching every filter given, ordered by ID, from a server-side cursor.
+
+        Args:
+            chunk_size (int): Number of certificates fetched from the cursor and yielded at a time.
+            status (Optional[CertificateStatus]): Only certificates in this status are streamed; None streams all.
+            certifier_id (Optional[UUID]): Only the certificates of this certifier are streamed.
+            norm (Optional[Norm]): Only the certificates complying with this norm are streamed.
+            issued_from (Optional[datetime]): Only certificates issued at or after this instant are streamed.
+            issued_until (Optional[datetime]): Only certificates issued before this instant are streamed.
+
+        Returns:
+            AsyncIterator[List[Certificate]]: The certificates, one chunk at a time.
+        """
+        raise NotImplementedError
+        yield  # pylint: disable=unreachable
+
+    @abstractmethod
+    async def find_by_expiry_window(
+        self,
+        expires_from: datetime,
+        expires_until: datetime,
+        after: Optional[Tuple[datetime, UUID]],
+        limit: int,
+        status: Optional[CertificateStatus] = None,
+    ) -> List[Certificate]:
+        """Find the certificates whose validity ends within a window, ordered by validity date, then by ID.
+
+        Args:
+            expires_from (datetime): Only certificates valid until this instant or later are listed.
+            expires_until (datetime): Only certificates valid until before this instant are listed.
+            after (Optional[Tuple[datetime, UUID]]): The validity date and ID of the last certificate of the
+                previous page; None starts from the first.
+            limit (int): Maximum number of certificates to return.
+            status (Optional[CertificateStatus]): Only certificates in this status are listed; None lists all.
+
+        Returns:
+            List[Certificate]: The next page of certificates expiring within the window.
+        """
+
+    @abstractmethod
+    async def find_by_issuance_window(
+        self,
+        issued_from: datetime,
+        issued_until: datetime,
+        after: Optional[Tuple[datetime, UUID]],
+        limit: int,
+        status: Optional[CertificateStatus] = None,
+    ) -> List[Certificate]:
+        """Find the certificates issued within a window, ordered by issuance date, then by ID.
+
+        Args:
+            issued_from (datetime): Only certificates issued at or after this instant are listed.
+            issued_until (datetime): Only certificates issued before this instant are listed.
+            after (Optional[Tuple[datetime, UUID]]): The issuance date and ID of the last certificate of the
+                previous page; None starts from the first.
+            limit (int): Maximum number of certificates to return.
+            status (Optional[CertificateStatus]): Only certificates in this status are listed; None lists all.
+
+        Returns:
+            List[Certificate]: The next page of certificates issued within the window.
+        """
+
+    @abstractmethod
+    async def find_by_blockchain_id_range(
+        self, first_id: int, last_id: Optional[int], registry_address: str
+    ) -> List[Certificate]:
+        """Find the certificates recorded on a registry deployment within a range of blockchain identifiers.
+
+        Args:
+            first_id (int): The smallest blockchain identifier to include.
+            last_id (Optional[int]): The largest blockchain identifier to include; None leaves the range open.
+            registry_address (str): The registry deployment; certificates without a recorded deployment are
+                taken as recorded on it.
+
+        Returns:
+            List[Certificate]: The certificates found, ordered by blockchain identifier.
+        """
+
+    @abstractmethod
+    async def save(self, certificate: Certificate) -> None:
+        """Save or update a certificate in the repository, when the unit of work of the scope commits.
 
         Args:
             certificate (Certificate): The certificate to be saved or updated.
         """
+
+    @abstractmethod
+    async def save_all(self, certificates: List[Certificate]) -> None:
+        """Save or update several certificates, in the transaction of the unit of work of the scope.
+
+        Args:
+            certificates (List[Certificate]): The certificates to be saved or updated.
+        """
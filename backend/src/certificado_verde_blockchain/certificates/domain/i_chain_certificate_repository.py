@@ -0,0 +1,94 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from .anchored_root import AnchoredRoot
+from .chain_certificate import ChainCertificate
+from .chain_cursor import ChainCursor
+from .chain_event import ChainEvent
+
+
+class IChainCertificateRepository(ABC):
+    @abstractmethod
+    async def find_by_data_hash(self, data_hash: str) -> Optional[ChainCertificate]:
+        """Find the on-chain certificate that anchors the given data hash.
+
+        Args:
+            data_hash (str): The anchored data hash.
+
+        Returns:
+            Optional[ChainCertificate]: The indexed certificate if found, otherwise None.
+        """
+
+    @abstractmethod
+    async def find_by_blockchain_id(self, blockchain_id: str) -> Optional[ChainCertificate]:
+        """Find an on-chain certificate by its contract identifier.
+
+        Args:
+            blockchain_id (str): The identifier of the certificate in the contract.
+
+        Returns:
+            Optional[ChainCertificate]: The indexed certificate if found, otherwise None.
+        """
+
+    @abstractmethod
+    async def find_anchored_root(self, epoch_id: str) -> Optional[AnchoredRoot]:
+        """Find the Merkle root anchored on chain for an epoch.
+
+        Args:
+            epoch_id (str): The identifier of the epoch in the contract.
+
+        Returns:
+            Optional[AnchoredRoot]: The recorded root if its anchoring was confirmed, otherwise None.
+        """
+
+    @abstractmethod
+    async def save_anchored_roots(self, anchored_roots: List[AnchoredRoot]) -> None:
+        """Record the roots of confirmed anchoring transactions, written when the unit of work commits.
+        Recording a root the indexer already stored has no effect.
+
+        Args:
+            anchored_roots (List[AnchoredRoot]): The anchored roots, read from the receipts of their transactions.
+        """
+
+    @abstractmethod
+    async def get_cursor(self, name: str) -> Optional[ChainCursor]:
+        """Get the last block processed by an indexer.
+
+        Args:
+            name (str): The name of the indexer cursor.
+
+        Returns:
+            Optional[ChainCursor]: The cursor if the indexer has run before, otherwise None.
+        """
+
+    @abstractmethod
+    async def list_recent_blocks(self, name: str, limit: int) -> List[ChainCursor]:
+        """List the most recent indexed blocks with their hashes, newest first.
+
+        Args:
+            name (str): The name of the indexer cursor.
+            limit (int): Maximum number of blocks to return.
+
+        Returns:
+            List[ChainCursor]: The recorded blocks, newest first.
+        """
+
+    @abstractmethod
+    async def save_events(self, name: str, events: List[ChainEvent], cursor: ChainCursor) -> None:
+        """Persist a range of decoded events, update the projections and advance the cursor atomically.
+        Saving events that are already stored has no effect.
+
+        Args:
+            name (str): The name of the indexer cursor.
+            events (List[ChainEvent]): The events of the range, in chain order.
+            cursor (ChainCursor): The last block of the range.
+        """
+
+    @abstractmethod
+    async def rollback(self, name: str, from_block: int) -> None:
+        """Undo everything indexed from the given block onwards, after a chain reorganization.
+
+        Args:
+            name (str): The name of the indexer cursor.
+            from_block (int): The first block to be discarded.
+        """
@@ -0,0 +1,62 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from .certificate import Certificate
+from .issuance_task import IssuanceTask, IssuanceTaskStatus
+
+
+class IIssuanceTaskRepository(ABC):
+    @abstractmethod
+    async def claim(self, status: IssuanceTaskStatus, limit: int, lease_seconds: int) -> List[IssuanceTask]:
+        """Claim due tasks in the given status for exclusive processing.
+
+        Claimed tasks are hidden from other workers for `lease_seconds`. If the worker dies before saving
+        them, they become due again once the lease expires.
+
+        Args:
+            status (IssuanceTaskStatus): The status of the tasks to claim.
+            limit (int): Maximum number of tasks to claim.
+            lease_seconds (int): How long the tasks stay reserved for the caller.
+
+        Returns:
+            List[IssuanceTask]: The claimed tasks, oldest first.
+        """
+
+    @abstractmethod
+    async def due_backlog(self, status: IssuanceTaskStatus, limit: int) -> Tuple[int, Optional[datetime]]:
+        """Measure the due tasks in the given status without claiming them.
+
+        Args:
+            status (IssuanceTaskStatus): The status of the tasks to measure.
+            limit (int): Counting stops at this number of tasks.
+
+        Returns:
+            Tuple[int, Optional[datetime]]: The number of due tasks (at most `limit`) and the creation date
+                of the oldest counted one, or None when there is none.
+        """
+
+    @abstractmethod
+    async def find_latest_by_certificate_id(self, certificate_id: UUID) -> Optional[IssuanceTask]:
+        """Find the most recent issuance task of a certificate.
+
+        Args:
+            certificate_id (UUID): The unique identifier of the certificate.
+
+        Returns:
+            Optional[IssuanceTask]: The most recent task if any, otherwise None.
+        """
+
+    @abstractmethod
+    async def save(self, tasks: List[IssuanceTask], certificates: List[Certificate], delay_seconds: float = 0) -> None:
+        """Save tasks and the certificates they affect, in the transaction of the unit of work of the scope.
+
+        Args:
+            tasks (List[IssuanceTask]): The tasks to be saved or updated.
+            certificates (List[Certificate]): The certificates to be saved or updated alongside the tasks.
+            delay_seconds (float): Seconds before open tasks are due to be claimed again.
+
+        Raises:
+            DomainException: When the unit of work commits, if a certificate already has an open issuance task.
+        """
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Dict, List, Optional
 from uuid import UUID
 
 from .canonical_producer import CanonicalProducer
@@ -16,6 +16,16 @@ class IProducerService(ABC):
             Optional[CanonicalProducer]: The canonical form of the producer if found, otherwise None.
         """
 
+    @abstractmethod
+    async def find_canonical_by_ids(self, producer_ids: List[UUID]) -> Dict[UUID, CanonicalProducer]:
+        """Find several producers by their unique identifiers in a single query and return their canonical forms.
+
+        Args:
+            producer_ids (List[UUID]): The unique identifiers of the producers.
+        Returns:
+            Dict[UUID, CanonicalProducer]: The canonical forms of the producers found, by ID; unknown IDs are left out.
+        """
+
     @abstractmethod
     async def producer_exists(self, producer_id: UUID) -> bool:
         """Check if a producer exists by its unique identifier.
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Dict, List, Optional
 from uuid import UUID
 
 from .canonical_product import CanonicalProduct
@@ -16,6 +16,16 @@ class IProductService(ABC):
             Optional[CanonicalProduct]: The canonical form of the product if found, otherwise None.
         """
 
+    @abstractmethod
+    async def find_canonical_by_ids(self, product_ids: List[UUID]) -> Dict[UUID, CanonicalProduct]:
+        """Find several products by their unique identifiers in a single query and return their canonical forms.
+
+        Args:
+            product_ids (List[UUID]): The unique identifiers of the products.
+        Returns:
+            Dict[UUID, CanonicalProduct]: The canonical forms of the products found, by ID; unknown IDs are left out.
+        """
+
     @abstractmethod
     async def product_exists(self, product_id: UUID) -> bool:
         """Check if a product exists by its unique identifier.
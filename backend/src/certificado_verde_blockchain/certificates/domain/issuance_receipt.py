@@ -0,0 +1,25 @@
+from typing import Annotated, Dict, Optional
+
+from pydantic import BaseModel, Field
+
+
+class IssuanceReceipt(BaseModel):
+    """Outcome of a mined issuance transaction.
+
+    Attributes:
+        transaction_hash (str): Hash of the mined transaction.
+        success (bool): Whether the transaction executed successfully.
+        block_number (Optional[int]): Block that included the transaction.
+        certificate_ids (Dict[str, str]): Blockchain IDs of the recorded certificates, keyed by canonical hash.
+        anchored_epochs (Dict[str, str]): Epoch IDs of the anchored Merkle roots, keyed by hex encoded root.
+    """
+
+    transaction_hash: Annotated[str, Field(description="Hash of the mined transaction.")]
+    success: Annotated[bool, Field(description="Whether the transaction executed successfully.")]
+    block_number: Annotated[Optional[int], Field(description="Block that included the transaction.")] = None
+    certificate_ids: Annotated[
+        Dict[str, str], Field(description="Blockchain IDs of the recorded certificates, keyed by canonical hash.")
+    ] = {}
+    anchored_epochs: Annotated[
+        Dict[str, str], Field(description="Epoch IDs of the anchored Merkle roots, keyed by hex encoded root.")
+    ] = {}
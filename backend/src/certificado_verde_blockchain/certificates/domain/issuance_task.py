@@ -0,0 +1,144 @@
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Annotated, ClassVar, List, Optional
+from uuid import UUID, uuid4
+
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
+
+from ...shared.errors import DomainException
+
+
+class IssuanceTaskStatus(str, Enum):
+    PENDING = "pending"
+    SUBMITTED = "submitted"
+    CONFIRMED = "confirmed"
+    FAILED = "failed"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+class IssuanceTask(BaseModel):
+    """Outbox entry that records a certificate waiting to be written on the blockchain.
+
+    It is saved in the same database transaction that moves the certificate to the issuing state,
+    so a certificate is never recorded on chain without its database counterpart (and vice versa).
+    Background workers pick the task up, submit the transaction and confirm its receipt.
+
+    Attributes:
+        id (UUID): Unique identifier of the task.
+        certificate_id (UUID): Identifier of the certificate being issued.
+        canonical_hash (str): Canonical hash recorded on the blockchain.
+        certifier_address (str): Blockchain address of the certifier (certificate owner on chain).
+        status (IssuanceTaskStatus): Current stage of the task.
+        attempts (int): Number of times the transaction was submitted.
+        transaction_hash (Optional[str]): Hash of the last submitted transaction.
+        replaced_transaction_hashes (List[str]): Hashes of the earlier transactions of the current attempt,
+            replaced with higher fees under the same nonce (any of them may still be the one mined).
+        merkle_root (Optional[str]): Merkle root anchored by the current attempt, when the certificate was
+            gathered into an epoch instead of getting its own registry entry.
+        last_error (Optional[str]): Error of the last failed attempt.
+        submitted_at (Optional[datetime]): When the last transaction was submitted.
+        created_at (datetime): When the task was created.
+    """
+
+    model_config: ClassVar[ConfigDict] = ConfigDict(use_enum_values=True)
+
+    id: Annotated[UUID, Field(default_factory=uuid4, description="Unique identifier of the task.")]
+    certificate_id: Annotated[UUID, Field(description="Identifier of the certificate being issued.")]
+    canonical_hash: Annotated[str, Field(description="Canonical hash recorded on the blockchain.")]
+    certifier_address: Annotated[str, Field(description="Blockchain address of the certifier.")]
+    status: Annotated[IssuanceTaskStatus, Field(description="Current stage of the task.")] = IssuanceTaskStatus.PENDING
+    attempts: Annotated[int, Field(description="Number of times the transaction was submitted.", ge=0)] = 0
+    transaction_hash: Annotated[Optional[str], Field(description="Hash of the last submitted transaction.")] = None
+    replaced_transaction_hashes: Annotated[
+        List[str], Field(description="Hashes of the transactions replaced with higher fees in the current attempt.")
+    ] = []
+    merkle_root: Annotated[
+        Optional[str], Field(description="Merkle root anchored by the current attempt, for epoch anchoring.")
+    ] = None
+    last_error: Annotated[Optional[str], Field(description="Error of the last failed attempt.")] = None
+    submitted_at: Annotated[Optional[datetime], Field(description="When the last transaction was submitted.")] = None
+    created_at: Annotated[
+        datetime, Field(default_factory=lambda: datetime.now(timezone.utc), description="When the task was created.")
+    ]
+
+    @field_serializer("id", "certificate_id")
+    def serialize_id(self, id: UUID) -> str:
+        """Serialize the UUID id to a string."""
+        return str(id)
+
+    @field_serializer("submitted_at", "created_at")
+    def serialize_datetime(self, value: Optional[datetime]) -> Optional[str]:
+        """Serialize the dates to ISO format."""
+        return value.isoformat() if value is not None else None
+
+    @property
+    def is_open(self) -> bool:
+        """Check if the task still has work to do (pending or waiting for confirmation)."""
+        return self.status in (IssuanceTaskStatus.PENDING, IssuanceTaskStatus.SUBMITTED)
+
+    @property
+    def transaction_hashes(self) -> List[str]:
+        """Every transaction of the current attempt that may get mined, the latest first."""
+        if self.transaction_hash is None:
+            return []
+        return [self.transaction_hash, *reversed(self.replaced_transaction_hashes)]
+
+    def mark_submitted(self, transaction_hash: str, merkle_root: Optional[str] = None) -> None:
+        """Record that the certificate was sent to the blockchain in the given transaction.
+
+        Args:
+            transaction_hash (str): Hash of the submitted transaction.
+            merkle_root (Optional[str]): Root of the epoch anchored by the transaction, if the certificate
+                was gathered into an epoch.
+        """
+        if self.status != IssuanceTaskStatus.PENDING:
+            raise DomainException(f"Cannot submit an issuance task in status {self.status}.", 400)
+        self.status = IssuanceTaskStatus.SUBMITTED
+        self.transaction_hash = transaction_hash
+        self.replaced_transaction_hashes = []
+        self.merkle_root = merkle_root
+        self.submitted_at = datetime.now(timezone.utc)
+        self.attempts += 1
+        self.last_error = None
+
+    def mark_replaced(self, transaction_hash: str) -> None:
+        """Record that the submitted transaction was resent with higher fees under the same nonce.
+
+        Args:
+            transaction_hash (str): Hash of the replacement transaction.
+        """
+        if self.status != IssuanceTaskStatus.SUBMITTED or self.transaction_hash is None:
+            raise DomainException(f"Cannot replace the transaction of an issuance task in status {self.status}.", 400)
+        self.replaced_transaction_hashes = [*self.replaced_transaction_hashes, self.transaction_hash]
+        self.transaction_hash = transaction_hash
+        self.submitted_at = datetime.now(timezone.utc)
+
+    def mark_confirmed(self) -> None:
+        """Record that the certificate is on the blockchain: the submitted transaction was mined successfully,
+        or a pending task about to be resent turned out to be recorded by an earlier attempt."""
+        if not self.is_open:
+            raise DomainException(f"Cannot confirm an issuance task in status {self.status}.", 400)
+        self.status = IssuanceTaskStatus.CONFIRMED
+
+    def retry(self, error: str, max_attempts: int) -> bool:
+        """Send the task back to the queue after a failed attempt, or fail it when out of attempts.
+
+        Args:
+            error (str): Description of the failure.
+            max_attempts (int): Maximum number of submissions allowed for the task.
+        Returns:
+            bool: True if the task will be retried, False if it has failed for good.
+        """
+        if not self.is_open:
+            raise DomainException(f"Cannot retry an issuance task in status {self.status}.", 400)
+        self.last_error = error
+        if self.status == IssuanceTaskStatus.PENDING:
+            # Failed before reaching the blockchain
+            self.attempts += 1
+        if self.attempts >= max_attempts:
+            self.status = IssuanceTaskStatus.FAILED
+            return False
+        self.status = IssuanceTaskStatus.PENDING
+        return True
@@ -0,0 +1,44 @@
+from typing import Annotated, List, Optional
+
+from pydantic import BaseModel, Field
+
+from ...shared.merkle import MerkleTree
+
+
+class MerkleInclusionProof(BaseModel):
+    """Value object that proves a certificate belongs to an epoch of certificates whose Merkle root
+    was anchored on the blockchain, so the certificate can be checked without calling a node.
+
+    Attributes:
+        root (str): Hex encoded Merkle root of the epoch.
+        leaf_index (int): Position of the certificate in the epoch.
+        path (List[str]): Hex encoded sibling hashes from the certificate leaf up to the root.
+        epoch_id (Optional[str]): Identifier of the epoch in the blockchain, once the root is anchored.
+    """
+
+    root: Annotated[str, Field(description="Hex encoded Merkle root of the epoch.")]
+    leaf_index: Annotated[int, Field(description="Position of the certificate in the epoch.", ge=0)]
+    path: Annotated[
+        List[str], Field(description="Hex encoded sibling hashes from the certificate leaf up to the root.")
+    ] = []
+    epoch_id: Annotated[
+        Optional[str], Field(default=None, description="Identifier of the epoch in the blockchain.")
+    ] = None
+
+    def includes(self, canonical_hash: str, root: Optional[str] = None) -> bool:
+        """Check that the proof leads from the given canonical hash to the root of the epoch.
+
+        Args:
+            canonical_hash (str): The canonical hash of the certificate.
+            root (Optional[str]): Hex encoded root to reach, such as the one anchored on chain. Defaults to the
+                root stored with the proof.
+        Returns:
+            bool: True if the certificate belongs to the epoch, False otherwise.
+        """
+        try:
+            leaf = MerkleTree.leaf(canonical_hash)
+            path = [bytes.fromhex(node.removeprefix("0x")) for node in self.path]
+            root_bytes = bytes.fromhex((root if root is not None else self.root).removeprefix("0x"))
+        except ValueError:
+            return False
+        return MerkleTree.verify(leaf, path, root_bytes)
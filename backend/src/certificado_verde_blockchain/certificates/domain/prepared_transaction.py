@@ -0,0 +1,20 @@
+from typing import Annotated
+
+from pydantic import BaseModel, Field
+
+
+class PreparedTransaction(BaseModel):
+    """A transaction signed by the backend but not sent to the blockchain yet.
+
+    Its hash is known before it is sent, so it can be recorded first: whatever happens while it is sent,
+    the outcome is then found by hash instead of sending the same certificates again.
+
+    Attributes:
+        transaction_hash (str): Hash of the signed transaction.
+        raw_transaction (str): Hex encoded signed transaction, as sent to the node.
+        sender (str): Address of the account that signed the transaction.
+    """
+
+    transaction_hash: Annotated[str, Field(description="Hash of the signed transaction.")]
+    raw_transaction: Annotated[str, Field(description="Hex encoded signed transaction, as sent to the node.")]
+    sender: Annotated[str, Field(description="Address of the account that signed the transaction.")]
@@ -0,0 +1,24 @@
+from typing import Annotated
+
+from pydantic import BaseModel, Field
+
+
+class RegistryCertificate(BaseModel):
+    """A certificate as currently stored in the CertificateRegistry contract, read directly from
+    contract storage rather than rebuilt from events.
+
+    Attributes:
+        blockchain_id (str): Identifier of the certificate in the contract.
+        data_hash (str): Hash of the off-chain certificate data anchored on chain.
+        issuer (str): Address that issued the certificate.
+        owner (str): Address that owns the certificate.
+        issued_at (int): Block timestamp of the issuance.
+        revoked (bool): Whether the certificate has been revoked.
+    """
+
+    blockchain_id: Annotated[str, Field(description="Identifier of the certificate in the contract.")]
+    data_hash: Annotated[str, Field(description="Hash of the off-chain certificate data anchored on chain.")]
+    issuer: Annotated[str, Field(description="Address that issued the certificate.")]
+    owner: Annotated[str, Field(description="Address that owns the certificate.")]
+    issued_at: Annotated[int, Field(description="Block timestamp of the issuance.")]
+    revoked: Annotated[bool, Field(description="Whether the certificate has been revoked.")] = False
@@ -0,0 +1,23 @@
+from typing import Annotated, Optional
+
+from pydantic import BaseModel, Field
+
+
+class RevocationReceipt(BaseModel):
+    """Outcome of the on-chain revocation of a single certificate.
+
+    Attributes:
+        blockchain_id (str): Identifier of the certificate in the blockchain.
+        revoked (bool): Whether the certificate is revoked on chain (by this call or an earlier one).
+        transaction_hash (Optional[str]): Hash of the revocation transaction that included the certificate.
+        error (Optional[str]): Why the certificate could not be revoked, if it was not.
+    """
+
+    blockchain_id: Annotated[str, Field(description="Identifier of the certificate in the blockchain.")]
+    revoked: Annotated[bool, Field(description="Whether the certificate is revoked on chain.")]
+    transaction_hash: Annotated[
+        Optional[str], Field(description="Hash of the revocation transaction that included the certificate.")
+    ] = None
+    error: Annotated[Optional[str], Field(description="Why the certificate could not be revoked, if it was not.")] = (
+        None
+    )
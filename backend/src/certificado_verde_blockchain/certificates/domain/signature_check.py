@@ -0,0 +1,19 @@
+from typing import Annotated
+
+from pydantic import BaseModel, Field
+
+
+class SignatureCheck(BaseModel):
+    """A signature to be verified against the hash it signs and the address expected to have signed it.
+
+    Attributes:
+        key (str): Identifier of the check chosen by the caller, echoed in its verification.
+        message_hash (str): The keccak256 hash that was signed (hex, with or without 0x prefix).
+        signature (str): The signature over the hash as an EIP-191 personal message (hex).
+        address (str): The blockchain address expected to have signed the hash.
+    """
+
+    key: Annotated[str, Field(description="Identifier of the check chosen by the caller, echoed in its verification.")]
+    message_hash: Annotated[str, Field(description="The keccak256 hash that was signed.")]
+    signature: Annotated[str, Field(description="The signature over the hash as an EIP-191 personal message.")]
+    address: Annotated[str, Field(description="The blockchain address expected to have signed the hash.")]
@@ -0,0 +1,23 @@
+from typing import Annotated, Optional
+
+from pydantic import BaseModel, Field
+
+
+class SignatureVerification(BaseModel):
+    """Outcome of a signature check.
+
+    Attributes:
+        key (str): Identifier of the check.
+        valid (bool): Whether the signature was made by the expected address.
+        recovered_address (Optional[str]): Address recovered from the signature, if it could be recovered.
+        error (Optional[str]): Why the signature could not be recovered, if it could not.
+    """
+
+    key: Annotated[str, Field(description="Identifier of the check.")]
+    valid: Annotated[bool, Field(description="Whether the signature was made by the expected address.")]
+    recovered_address: Annotated[
+        Optional[str], Field(description="Address recovered from the signature, if it could be recovered.")
+    ] = None
+    error: Annotated[Optional[str], Field(description="Why the signature could not be recovered, if it could not.")] = (
+        None
+    )
@@ -1,25 +1,52 @@
 from miraveja_di import DIContainer
+from web3 import AsyncWeb3
 
+from miraveja_log import IAsyncLogger
+
+from ...configuration import BlockchainConfig, IndexerConfig
+from ...shared.web3 import InProcessChain
 from ..domain import (
     IBlockchainService,
     ICertificateRepository,
     ICertifierService,
+    IChainCertificateRepository,
     IFileService,
+    IIssuanceTaskRepository,
     IProducerService,
     IProductService,
     IQRCodeService,
     ISerialCodeService,
     IStorageService,
 )
+from .indexer import ChainEventIndexer, ChainLogReader
 from .internal import InternalCertifierService, InternalProducerService, InternalProductService
 from .minio import MinioStorageService
 from .pillow import PillowFileService, QRCodeService
 from .serial_code_service import SerialCodeService
-from .sql import SqlCertificateRepository
-from .web3_blockchain_service import Web3BlockchainService
+from .sql import SqlCertificateRepository, SqlChainCertificateRepository, SqlIssuanceTaskRepository
+from .web3 import (
+    ContractRegistry,
+    Eip1559FeeStrategy,
+    FeeStrategy,
+    NonceManager,
+    SignatureVerifier,
+    SignerPool,
+    Web3BlockchainService,
+)
+from .workers import IssuanceWorkerPool
 
 
 class CertificatesDependencies:
+    @staticmethod
+    def _contract_registry(container: DIContainer) -> ContractRegistry:
+        config = container.resolve(BlockchainConfig)
+        if config.backend == "in_process":
+            # The in-process chain starts empty on every run
+            return ContractRegistry.deploy_in_process(
+                config, container.resolve(AsyncWeb3), container.resolve(InProcessChain)
+            )
+        return ContractRegistry(config, container.resolve(AsyncWeb3))
+
     @staticmethod
     def register_dependencies(container: DIContainer) -> None:
         """Register certificate-related dependencies in the DI container.
@@ -27,10 +54,42 @@ class CertificatesDependencies:
         Args:
             container (DIContainer): The dependency injection container.
         """
+        container.register_singletons(
+            {
+                ContractRegistry: CertificatesDependencies._contract_registry,
+                SignerPool: lambda container: SignerPool(container.resolve(BlockchainConfig)),
+                NonceManager: lambda container: NonceManager(container.resolve(AsyncWeb3)),
+                FeeStrategy: lambda container: Eip1559FeeStrategy(
+                    container.resolve(BlockchainConfig), container.resolve(AsyncWeb3)
+                ),
+                SignatureVerifier: lambda container: SignatureVerifier(
+                    workers=container.resolve(BlockchainConfig).signature_workers,
+                    cache_size=container.resolve(BlockchainConfig).signature_cache_size,
+                    chunk_size=container.resolve(BlockchainConfig).signature_chunk_size,
+                ),
+                IssuanceWorkerPool: lambda container: IssuanceWorkerPool(
+                    container, container.resolve(BlockchainConfig), container.resolve(IAsyncLogger)
+                ),
+                ChainLogReader: lambda container: ChainLogReader(
+                    container.resolve(ContractRegistry).default,
+                    container.resolve(IndexerConfig),
+                    container.resolve(AsyncWeb3),
+                ),
+                ChainEventIndexer: lambda container: ChainEventIndexer(
+                    container,
+                    container.resolve(IndexerConfig),
+                    container.resolve(ChainLogReader),
+                    container.resolve(IAsyncLogger),
+                ),
+            }
+        )
+
         container.register_transients(
             {
                 IBlockchainService: lambda container: container.resolve(Web3BlockchainService),
                 ICertificateRepository: lambda container: container.resolve(SqlCertificateRepository),
+                IIssuanceTaskRepository: lambda container: container.resolve(SqlIssuanceTaskRepository),
+                IChainCertificateRepository: lambda container: container.resolve(SqlChainCertificateRepository),
                 ICertifierService: lambda container: container.resolve(InternalCertifierService),
                 IProducerService: lambda container: container.resolve(InternalProducerService),
                 IProductService: lambda container: container.resolve(InternalProductService),
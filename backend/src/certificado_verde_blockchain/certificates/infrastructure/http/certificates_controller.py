@@ -1,22 +1,44 @@
 import json
+from datetime import datetime
+from typing import Optional
 from uuid import UUID
 
 from fastapi import Response, status
+from fastapi.responses import StreamingResponse
 
+from ....shared.enums import ExportFormat
+from ....shared.http import export_response, record_columns
+from ....shared.models import PageRequest
 from ...application import (
+    AuditCertifierSignaturesHandler,
+    CertificateOwner,
+    ExportCertificatesHandler,
     FindCertificateByIdHandler,
+    FindChainCertificateHandler,
+    FindIssuanceStatusHandler,
     FindQrCodeByKeyHandler,
     IssueCertificateCommand,
     IssueCertificateHandler,
+    ListCertificatesByOwnerHandler,
     ListPreCertificatesHandler,
+    ReconcileChainCertificatesHandler,
     RegisterPDFHashCommand,
     RegisterPDFHashHandler,
     RegisterPreCertificateCommand,
     RegisterPreCertificateHandler,
+    RevokeCertificatesCommand,
+    RevokeCertificatesHandler,
     ValidateCertificateHandler,
     ValidatePDFFileCommand,
     ValidatePDFFileHandler,
 )
+from ...domain import CanonicalProducer, CanonicalProduct, Certificate, CertificateStatus, Norm
+
+CERTIFICATE_EXPORT_COLUMNS = [
+    *record_columns(Certificate),
+    *record_columns(CanonicalProduct, "product."),
+    *record_columns(CanonicalProducer, "producer."),
+]
 
 
 class CertificatesController:
@@ -30,6 +52,13 @@ class CertificatesController:
         register_pdf_hash_handler: RegisterPDFHashHandler,
         validate_certificate_handler: ValidateCertificateHandler,
         validate_pdf_file_handler: ValidatePDFFileHandler,
+        find_issuance_status_handler: FindIssuanceStatusHandler,
+        find_chain_certificate_handler: FindChainCertificateHandler,
+        audit_certifier_signatures_handler: AuditCertifierSignaturesHandler,
+        revoke_certificates_handler: RevokeCertificatesHandler,
+        reconcile_chain_certificates_handler: ReconcileChainCertificatesHandler,
+        list_certificates_by_owner_handler: ListCertificatesByOwnerHandler,
+        export_certificates_handler: ExportCertificatesHandler,
     ) -> None:
         self._list_pre_certificates_handler = list_pre_certificates_handler
         self._find_certificate_by_id_handler = find_certificate_by_id_handler
@@ -39,11 +68,33 @@ class CertificatesController:
         self._register_pdf_hash_handler = register_pdf_hash_handler
         self._validate_certificate_handler = validate_certificate_handler
         self._validate_pdf_file_handler = validate_pdf_file_handler
+        self._find_issuance_status_handler = find_issuance_status_handler
+        self._find_chain_certificate_handler = find_chain_certificate_handler
+        self._audit_certifier_signatures_handler = audit_certifier_signatures_handler
+        self._revoke_certificates_handler = revoke_certificates_handler
+        self._reconcile_chain_certificates_handler = reconcile_chain_certificates_handler
+        self._list_certificates_by_owner_handler = list_certificates_by_owner_handler
+        self._export_certificates_handler = export_certificates_handler
 
-    async def list_pre_certificates(self) -> Response:
-        pre_certificates = await self._list_pre_certificates_handler.handle()
+    async def list_pre_certificates(self, certifier_id: Optional[str], cursor: Optional[str], limit: int) -> Response:
+        pre_certificates = await self._list_pre_certificates_handler.handle(
+            UUID(certifier_id) if certifier_id else None, PageRequest.from_cursor(cursor, limit)
+        )
         return Response(content=json.dumps(pre_certificates), media_type="application/json")
 
+    async def list_certificates_by_owner(
+        self,
+        owner: CertificateOwner,
+        owner_id: str,
+        status: Optional[CertificateStatus],
+        cursor: Optional[str],
+        limit: int,
+    ) -> Response:
+        certificates = await self._list_certificates_by_owner_handler.handle(
+            owner, UUID(owner_id), status, PageRequest.from_cursor(cursor, limit)
+        )
+        return Response(content=json.dumps(certificates), media_type="application/json")
+
     async def find_certificate_by_id(self, certificate_id: str) -> Response:
         certificate = await self._find_certificate_by_id_handler.handle(UUID(certificate_id))
         return Response(content=json.dumps(certificate), media_type="application/json")
@@ -57,9 +108,17 @@ class CertificatesController:
     async def issue_certificate(self, certificate_id: str, command: IssueCertificateCommand) -> Response:
         certificate = await self._issue_certificate_handler.handle(UUID(certificate_id), command)
         return Response(
-            content=json.dumps(certificate), media_type="application/json", status_code=status.HTTP_201_CREATED
+            content=json.dumps(certificate), media_type="application/json", status_code=status.HTTP_202_ACCEPTED
         )
 
+    async def find_issuance_status(self, certificate_id: str) -> Response:
+        issuance_status = await self._find_issuance_status_handler.handle(UUID(certificate_id))
+        return Response(content=json.dumps(issuance_status), media_type="application/json")
+
+    async def find_chain_certificate(self, data_hash: str) -> Response:
+        chain_certificate = await self._find_chain_certificate_handler.handle(data_hash)
+        return Response(content=json.dumps(chain_certificate), media_type="application/json")
+
     async def find_qr_code_by_key(self, qr_code_key: str) -> Response:
         qr_code, mime_type = await self._find_qr_code_by_key_handler.handle(qr_code_key)
         return Response(content=qr_code, media_type=mime_type)
@@ -75,3 +134,33 @@ class CertificatesController:
     async def validate_pdf_file(self, command: ValidatePDFFileCommand) -> Response:
         result = await self._validate_pdf_file_handler.handle(command)
         return Response(content=json.dumps(result), media_type="application/json")
+
+    async def audit_certifier_signatures(self) -> StreamingResponse:
+        results = self._audit_certifier_signatures_handler.handle()
+        return StreamingResponse(
+            (json.dumps(result) + "\n" async for result in results), media_type="application/x-ndjson"
+        )
+
+    async def export_certificates(
+        self,
+        export_format: ExportFormat,
+        status: Optional[CertificateStatus],
+        certifier_id: Optional[str],
+        norm: Optional[Norm],
+        issued_from: Optional[datetime],
+        issued_until: Optional[datetime],
+    ) -> StreamingResponse:
+        certificates = self._export_certificates_handler.handle(
+            status, UUID(certifier_id) if certifier_id else None, norm, issued_from, issued_until
+        )
+        return export_response(certificates, export_format, "certificates", CERTIFICATE_EXPORT_COLUMNS)
+
+    async def revoke_certificates(self, command: RevokeCertificatesCommand) -> Response:
+        revocation = await self._revoke_certificates_handler.handle(command)
+        return Response(content=json.dumps(revocation), media_type="application/json")
+
+    async def reconcile_chain_certificates(self) -> StreamingResponse:
+        drifts = self._reconcile_chain_certificates_handler.handle()
+        return StreamingResponse(
+            (json.dumps(drift) + "\n" async for drift in drifts), media_type="application/x-ndjson"
+        )
@@ -1,12 +1,21 @@
-from fastapi import APIRouter
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, Response
+from fastapi.responses import StreamingResponse
 from miraveja_di import DIContainer
 
+from ....shared.enums import ExportFormat
+from ....shared.http import request_scoped
+from ....shared.models import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from ...application import (
     IssueCertificateCommand,
     RegisterPDFHashCommand,
     RegisterPreCertificateCommand,
+    RevokeCertificatesCommand,
     ValidatePDFFileCommand,
 )
+from ...domain import CertificateStatus, Norm
 from .certificates_controller import CertificatesController
 
 
@@ -19,36 +28,143 @@ class CertificatesRoutes:
             router (APIRouter): The FastAPI router to register routes on.
             container (DIContainer): The dependency injection container.
         """
-        certificates_controller = container.resolve(CertificatesController)
+        get_certificates_controller = request_scoped(container, CertificatesController)
 
         @router.get("/certificates/pre/")
-        async def list_pre_certificates():
-            return await certificates_controller.list_pre_certificates()
+        async def list_pre_certificates(
+            certifier_id: Optional[str] = None,
+            cursor: Optional[str] = None,
+            limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+            certificates_controller: CertificatesController = Depends(get_certificates_controller),
+        ):
+            return await certificates_controller.list_pre_certificates(certifier_id, cursor, limit)
+
+        @router.get("/products/{product_id}/certificates")
+        async def list_certificates_by_product(
+            product_id: str,
+            status: Optional[CertificateStatus] = None,
+            cursor: Optional[str] = None,
+            limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+            certificates_controller: CertificatesController = Depends(get_certificates_controller),
+        ) -> Response:
+            return await certificates_controller.list_certificates_by_owner(
+                "product", product_id, status, cursor, limit
+            )
+
+        @router.get("/producers/{producer_id}/certificates")
+        async def list_certificates_by_producer(
+            producer_id: str,
+            status: Optional[CertificateStatus] = None,
+            cursor: Optional[str] = None,
+            limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+            certificates_controller: CertificatesController = Depends(get_certificates_controller),
+        ) -> Response:
+            return await certificates_controller.list_certificates_by_owner(
+                "producer", producer_id, status, cursor, limit
+            )
+
+        @router.get("/certifiers/{certifier_id}/certificates")
+        async def list_certificates_by_certifier(
+            certifier_id: str,
+            status: Optional[CertificateStatus] = None,
+            cursor: Optional[str] = None,
+            limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+            certificates_controller: CertificatesController = Depends(get_certificates_controller),
+        ) -> Response:
+            return await certificates_controller.list_certificates_by_owner(
+                "certifier", certifier_id, status, cursor, limit
+            )
+
+        @router.get("/certificates/export")
+        async def export_certificates(
+            export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
+            status: Optional[CertificateStatus] = None,
+            certifier_id: Optional[str] = None,
+            norm: Optional[Norm] = None,
+            issued_from: Optional[datetime] = None,
+            issued_until: Optional[datetime] = None,
+            certificates_controller: CertificatesController = Depends(get_certificates_controller),
+        ) -> StreamingResponse:
+            return await certificates_controller.export_certificates(
+                export_format, status, certifier_id, norm, issued_from, issued_until
+            )
 
         @router.get("/certificates/{certificate_id}")
-        async def find_certificate_by_id(certificate_id: str):
+        async def find_certificate_by_id(
+            certificate_id: str, certificates_controller: CertificatesController = Depends(get_certificates_controller)
+        ):
             return await certificates_controller.find_certificate_by_id(certificate_id)
 
         @router.post("/certificates/pre/", status_code=201)
-        async def register_pre_certificate(command: RegisterPreCertificateCommand):
+        async def register_pre_certificate(
+            command: RegisterPreCertificateCommand,
+            certificates_controller: CertificatesController = Depends(get_certificates_controller),
+        ):
             return await certificates_controller.register_pre_certificate(command)
 
-        @router.post("/certificates/{certificate_id}", status_code=201)
-        async def issue_certificate(certificate_id: str, command: IssueCertificateCommand):
+        @router.post("/certificates/revocations")
+        async def revoke_certificates(
+            command: RevokeCertificatesCommand,
+            certificates_controller: CertificatesController = Depends(get_certificates_controller),
+        ) -> Response:
+            return await certificates_controller.revoke_certificates(command)
+
+        @router.get("/certificates/{certificate_id}/status")
+        async def find_issuance_status(
+            certificate_id: str, certificates_controller: CertificatesController = Depends(get_certificates_controller)
+        ) -> Response:
+            return await certificates_controller.find_issuance_status(certificate_id)
+
+        @router.post("/certificates/{certificate_id}", status_code=202)
+        async def issue_certificate(
+            certificate_id: str,
+            command: IssueCertificateCommand,
+            certificates_controller: CertificatesController = Depends(get_certificates_controller),
+        ):
             return await certificates_controller.issue_certificate(certificate_id, command)
 
+        @router.get("/certificates/signatures/audit")
+        async def audit_certifier_signatures(
+            certificates_controller: CertificatesController = Depends(get_certificates_controller),
+        ) -> StreamingResponse:
+            return await certificates_controller.audit_certifier_signatures()
+
+        @router.get("/certificates/chain/reconciliation")
+        async def reconcile_chain_certificates(
+            certificates_controller: CertificatesController = Depends(get_certificates_controller),
+        ) -> StreamingResponse:
+            return await certificates_controller.reconcile_chain_certificates()
+
+        @router.get("/certificates/chain/{data_hash}")
+        async def find_chain_certificate(
+            data_hash: str, certificates_controller: CertificatesController = Depends(get_certificates_controller)
+        ) -> Response:
+            return await certificates_controller.find_chain_certificate(data_hash)
+
         @router.get("/certificates/qr_codes/{qr_code_key}")
-        async def find_qr_code_by_key(qr_code_key: str):
+        async def find_qr_code_by_key(
+            qr_code_key: str, certificates_controller: CertificatesController = Depends(get_certificates_controller)
+        ):
             return await certificates_controller.find_qr_code_by_key(qr_code_key)
 
         @router.post("/certificates/{certificate_id}/pdf_hash", status_code=201)
-        async def register_pdf_hash(certificate_id: str, command: RegisterPDFHashCommand):
+        async def register_pdf_hash(
+            certificate_id: str,
+            command: RegisterPDFHashCommand,
+            certificates_controller: CertificatesController = Depends(get_certificates_controller),
+        ):
             return await certificates_controller.register_pdf_hash(certificate_id, command)
 
         @router.get("/certificates/validate/{certificate_hash}")
-        async def validate_certificate(certificate_hash: str):
+        async def validate_certificate(
+            certificate_hash: str,
+            certificates_controller: CertificatesController = Depends(get_certificates_controller),
+        ):
             return await certificates_controller.validate_certificate(certificate_hash)
 
         @router.post("/certificates/validate/pdf")
-        async def validate_pdf_file(command: ValidatePDFFileCommand):
+        async def validate_pdf_file(
+            command: ValidatePDFFileCommand,
+            certificates_controller: CertificatesController = Depends(get_certificates_controller),
+        ):
             return await certificates_controller.validate_pdf_file(command)
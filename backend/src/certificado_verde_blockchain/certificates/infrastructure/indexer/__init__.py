@@ -0,0 +1,4 @@
+from .chain_event_indexer import ChainEventIndexer
+from .chain_log_reader import ChainLogReader
+
+__all__ = ["ChainEventIndexer", "ChainLogReader"]
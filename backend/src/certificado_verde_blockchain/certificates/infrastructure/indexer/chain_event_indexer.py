@@ -0,0 +1,177 @@
+import asyncio
+from typing import List, Optional, Tuple
+
+from miraveja_di import DIContainer
+from sqlalchemy.ext.asyncio import AsyncSession as DatabaseSession
+from web3 import AsyncWeb3, WebSocketProvider
+
+from miraveja_log import IAsyncLogger
+
+from ....configuration import IndexerConfig
+from ....shared.errors import DomainException
+from ...domain import ChainCursor, ChainEvent, IChainCertificateRepository
+from .chain_log_reader import ChainLogReader
+
+
+class ChainEventIndexer:
+    """Tails the CertificateRegistry logs into the local chain_* tables.
+
+    Events are indexed once they are `confirmations` blocks deep. While far behind the chain head the
+    indexer backfills `backfill_concurrency` block ranges in parallel, persisting them in order so the
+    cursor only ever moves forward over fully indexed blocks. Once caught up it waits for the next
+    block, either polling or, when a WebSocket endpoint is configured, woken by a `newHeads` subscription.
+
+    Before each step the hash of the cursor block is compared with the canonical chain. On mismatch the
+    recently indexed blocks are walked back to the fork point and everything after it is rolled back.
+    A range is only persisted when the hash of its last block is the same before and after its logs are
+    read, so the cursor always records the fork the indexed events came from.
+    """
+
+    def __init__(
+        self, container: DIContainer, config: IndexerConfig, reader: ChainLogReader, logger: IAsyncLogger
+    ) -> None:
+        self._container = container
+        self._config = config
+        self._reader = reader
+        self._logger = logger
+        self.cursor_name = f"CertificateRegistry:{reader.contract_address.lower()}"
+        self._stop_event: Optional[asyncio.Event] = None
+        self._new_head = asyncio.Event()
+        self._tasks: List["asyncio.Task[None]"] = []
+
+    def start(self) -> None:
+        """Start indexing on the running event loop, when the indexer is enabled."""
+        if self._tasks or not self._config.enabled:
+            return
+        self._stop_event = asyncio.Event()
+        self._tasks = [asyncio.create_task(self._run(), name="chain-event-indexer")]
+        if self._config.websocket_url:
+            self._tasks.append(asyncio.create_task(self._watch_new_heads(), name="chain-event-indexer-heads"))
+
+    async def stop(self) -> None:
+        """Stop indexing and wait for the step in progress to finish."""
+        if self._stop_event is None:
+            return
+        self._stop_event.set()
+        for task in self._tasks[1:]:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._stop_event = None
+
+    async def sync_once(self) -> Tuple[int, bool]:
+        """Index the next confirmed block ranges.
+
+        Returns:
+            Tuple[int, bool]: The number of events indexed and whether the indexer reached the confirmed head.
+        """
+        with self._container.create_scope() as scope:
+            database_session = scope.resolve(DatabaseSession)
+            try:
+                repository = scope.resolve(IChainCertificateRepository)
+                return await self._sync(repository)
+            finally:
+                await database_session.close()
+
+    async def _sync(self, repository: IChainCertificateRepository) -> Tuple[int, bool]:
+        await self._handle_reorg(repository)
+
+        cursor = await repository.get_cursor(self.cursor_name)
+        from_block = cursor.block_number + 1 if cursor else self._config.start_block
+        confirmed_head = await self._reader.head() - self._config.confirmations
+        if confirmed_head < from_block:
+            return 0, True
+
+        ranges: List[Tuple[int, int]] = []
+        start = from_block
+        while start <= confirmed_head and len(ranges) < self._config.backfill_concurrency:
+            end = min(start + self._reader.block_range - 1, confirmed_head)
+            ranges.append((start, end))
+            start = end + 1
+
+        fetches = [asyncio.ensure_future(self._fetch_range(*block_range)) for block_range in ranges]
+        indexed = 0
+        try:
+            for fetch in fetches:
+                events, range_cursor = await fetch
+                await repository.save_events(self.cursor_name, events, range_cursor)
+                indexed += len(events)
+        finally:
+            for fetch in fetches:
+                fetch.cancel()
+
+        return indexed, ranges[-1][1] == confirmed_head
+
+    async def _fetch_range(self, from_block: int, to_block: int) -> Tuple[List[ChainEvent], ChainCursor]:
+        # The hash of the last block commits to every block before it: unchanged around the logs, they were
+        # all read from the chain the cursor records. A reorg in between fails the step, retried next time
+        to_block_hash = await self._reader.block_hash(to_block)
+        events = await self._reader.get_events(from_block, to_block)
+        if await self._reader.block_hash(to_block) != to_block_hash or any(
+            event.block_number == to_block and event.block_hash != to_block_hash for event in events
+        ):
+            raise DomainException(f"Chain reorganization while reading blocks {from_block} to {to_block}.")
+        return events, ChainCursor(block_number=to_block, block_hash=to_block_hash)
+
+    async def _handle_reorg(self, repository: IChainCertificateRepository) -> None:
+        cursor = await repository.get_cursor(self.cursor_name)
+        if cursor is None or await self._reader.block_hash(cursor.block_number) == cursor.block_hash:
+            return
+
+        fork_block: Optional[int] = None
+        for block in await repository.list_recent_blocks(self.cursor_name, self._config.reorg_lookback_blocks):
+            if await self._reader.block_hash(block.block_number) == block.block_hash:
+                fork_block = block.block_number
+                break
+
+        if fork_block is None:
+            await self._logger.error(
+                f"Chain reorganization deeper than {self._config.reorg_lookback_blocks} indexed blocks; "
+                f"reindexing from block {self._config.start_block}."
+            )
+            await repository.rollback(self.cursor_name, self._config.start_block)
+            return
+
+        await self._logger.warning(
+            f"Chain reorganization detected at block {cursor.block_number}; rolling back to block {fork_block}."
+        )
+        await repository.rollback(self.cursor_name, fork_block + 1)
+
+    async def _run(self) -> None:
+        assert self._stop_event is not None
+        await self._logger.info(f"Chain event indexer started ({self.cursor_name}).")
+        while not self._stop_event.is_set():
+            try:
+                _, caught_up = await self.sync_once()
+            except Exception as e:
+                await self._logger.error(f"Chain event indexer failed: {e}")
+                caught_up = True
+
+            if caught_up:
+                await self._wait_for_new_block()
+        await self._logger.info("Chain event indexer stopped.")
+
+    async def _wait_for_new_block(self) -> None:
+        assert self._stop_event is not None
+        self._new_head.clear()
+        waiters = [asyncio.ensure_future(self._stop_event.wait()), asyncio.ensure_future(self._new_head.wait())]
+        try:
+            await asyncio.wait(
+                waiters, timeout=self._config.poll_interval_ms / 1000, return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+
+    async def _watch_new_heads(self) -> None:
+        assert self._config.websocket_url is not None
+        while True:
+            try:
+                async with AsyncWeb3(WebSocketProvider(self._config.websocket_url)) as web3_client:
+                    await web3_client.eth.subscribe("newHeads")
+                    async for _ in web3_client.socket.process_subscriptions():
+                        self._new_head.set()
+            except Exception as e:
+                # Polling keeps the indexer going while the subscription reconnects
+                await self._logger.warning(f"Chain event indexer subscription failed: {e}")
+                await asyncio.sleep(self._config.poll_interval_ms / 1000)
@@ -0,0 +1,121 @@
+from typing import Dict, List, Optional
+
+from hexbytes import HexBytes
+from web3 import AsyncWeb3, Web3
+from web3.types import LogReceipt
+
+from ....configuration import IndexerConfig
+from ....shared.errors import DomainException
+from ...domain import ChainEvent, ChainEventType
+from ..web3 import ContractBinding, EventDecoder
+
+# Ranges returning fewer logs than this let the block range grow again after it was shrunk
+LOGS_PER_RANGE_TARGET = 5000
+RANGE_GROWTH_FACTOR = 2
+
+
+class ChainLogReader:
+    """Reads CertificateRegistry events with `eth_getLogs` over adaptive block ranges.
+
+    The block range starts at the configured maximum. When the node rejects a request (too many results,
+    response too large, timeout) the range is split in half and both halves are retried, and the smaller
+    size is remembered for the next requests. Ranges that come back well under the target number of logs
+    let the size grow back towards the maximum.
+
+    Logs are decoded straight from their topics and data instead of going through the contract event
+    processor, which is the bottleneck when backfilling hundreds of thousands of events. The decoders are
+    precomputed by the contract binding, which also knows the layout of CertificateIssued in each
+    registry version. RootAnchored is only read from registries whose ABI declares it.
+    """
+
+    def __init__(self, binding: ContractBinding, indexer_config: IndexerConfig, web3_client: AsyncWeb3) -> None:
+        self.web3_client = web3_client
+        self.binding = binding
+        self.contract_address = binding.address
+        self._max_block_range = indexer_config.max_block_range
+        self._block_range = indexer_config.max_block_range
+
+        self._decoders: Dict[bytes, EventDecoder] = {}
+        for event_type in ChainEventType:
+            decoder = binding.events.get(event_type.value)
+            if decoder is None and event_type == ChainEventType.ROOT_ANCHORED:
+                continue  # Registries before v2 do not anchor Merkle roots
+            if decoder is None:
+                raise DomainException(f"Event {event_type.value} not found in the contract ABI.")
+            self._decoders[decoder.topic] = decoder
+
+    @property
+    def block_range(self) -> int:
+        """Current number of blocks requested per `eth_getLogs` call."""
+        return self._block_range
+
+    async def head(self) -> int:
+        """Get the number of the latest block."""
+        return await self.web3_client.eth.block_number
+
+    async def block_hash(self, block_number: int) -> str:
+        """Get the hash of a block of the canonical chain.
+
+        Args:
+            block_number (int): The number of the block.
+        Returns:
+            str: The 0x-prefixed block hash.
+        """
+        block = await self.web3_client.eth.get_block(block_number)
+        return HexBytes(block["hash"]).to_0x_hex()
+
+    async def get_events(self, from_block: int, to_block: int) -> List[ChainEvent]:
+        """Fetch and decode the registry events of a block range, in chain order.
+
+        Args:
+            from_block (int): First block of the range (inclusive).
+            to_block (int): Last block of the range (inclusive).
+        Returns:
+            List[ChainEvent]: The decoded events.
+        """
+        try:
+            logs = await self.web3_client.eth.get_logs(
+                {
+                    "address": self.contract_address,
+                    "fromBlock": from_block,
+                    "toBlock": to_block,
+                    "topics": [[HexBytes(topic) for topic in self._decoders]],
+                }
+            )
+        except Exception as e:
+            if from_block >= to_block:
+                raise DomainException(f"Failed to fetch logs of block {from_block}: {str(e)}") from e
+            middle = (from_block + to_block) // 2
+            self._block_range = max(1, min(self._block_range, middle - from_block + 1))
+            return await self.get_events(from_block, middle) + await self.get_events(middle + 1, to_block)
+
+        if len(logs) < LOGS_PER_RANGE_TARGET and to_block - from_block + 1 >= self._block_range:
+            self._block_range = min(self._max_block_range, self._block_range * RANGE_GROWTH_FACTOR)
+        return [self._decode(log) for log in logs]
+
+    def _decode(self, log: LogReceipt) -> ChainEvent:
+        decoder = self._decoders[bytes(log["topics"][0])]
+        args = decoder.decode(log)
+        event_type = ChainEventType(decoder.name)
+
+        data_hash: Optional[str] = None
+        issuer: Optional[str] = None
+        owner: Optional[str] = None
+        if event_type == ChainEventType.ROOT_ANCHORED:
+            data_hash, issuer = Web3.to_hex(args["root"]), args["issuer"]
+        elif event_type == ChainEventType.CERTIFICATE_ISSUED:
+            data_hash = self.binding.registry.decode_hash(args["dataHash"])
+            issuer, owner = args["issuer"], args["owner"]
+
+        return ChainEvent(
+            event_type=event_type,
+            blockchain_id=str(args["epochId"] if event_type == ChainEventType.ROOT_ANCHORED else args["id"]),
+            block_number=log["blockNumber"],
+            block_hash=HexBytes(log["blockHash"]).to_0x_hex(),
+            transaction_hash=HexBytes(log["transactionHash"]).to_0x_hex(),
+            log_index=log["logIndex"],
+            timestamp=args["timestamp"],
+            data_hash=data_hash,
+            issuer=issuer,
+            owner=owner,
+        )
@@ -1,18 +1,30 @@
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from ....producers import FindProducerByIdHandler
+from ....producers import FindProducerByIdHandler, FindProducersByIdsHandler
 from ....shared.errors import DomainException
 from ...domain import CanonicalProducer, IProducerService
 
 
 class InternalProducerService(IProducerService):
-    def __init__(self, find_producer_by_id_handler: FindProducerByIdHandler):
+    def __init__(
+        self,
+        find_producer_by_id_handler: FindProducerByIdHandler,
+        find_producers_by_ids_handler: FindProducersByIdsHandler,
+    ):
         self._find_producer_by_id_handler = find_producer_by_id_handler
+        self._find_producers_by_ids_handler = find_producers_by_ids_handler
 
     async def find_canonical_by_id(self, producer_id: UUID) -> Optional[CanonicalProducer]:
-        producer = await self._find_producer_by_id_handler.handle(producer_id)
+        return self._to_canonical(await self._find_producer_by_id_handler.handle(producer_id))
 
+    async def find_canonical_by_ids(self, producer_ids: List[UUID]) -> Dict[UUID, CanonicalProducer]:
+        found = await self._find_producers_by_ids_handler.handle(producer_ids)
+        canonical_producers = [self._to_canonical(producer) for producer in found["producers"]]
+        return {UUID(canonical_producer["id"]): canonical_producer for canonical_producer in canonical_producers}
+
+    @staticmethod
+    def _to_canonical(producer: Any) -> CanonicalProducer:
         if not isinstance(producer, dict):
             raise DomainException("Invalid producer data format.")
 
@@ -1,18 +1,30 @@
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from ....products import FindProductByIdHandler
+from ....products import FindProductByIdHandler, FindProductsByIdsHandler
 from ....shared.errors import DomainException
 from ...domain import CanonicalProduct, IProductService
 
 
 class InternalProductService(IProductService):
-    def __init__(self, find_product_by_id_handler: FindProductByIdHandler):
+    def __init__(
+        self,
+        find_product_by_id_handler: FindProductByIdHandler,
+        find_products_by_ids_handler: FindProductsByIdsHandler,
+    ):
         self._find_product_by_id_handler = find_product_by_id_handler
+        self._find_products_by_ids_handler = find_products_by_ids_handler
 
     async def find_canonical_by_id(self, product_id: UUID) -> Optional[CanonicalProduct]:
-        product = await self._find_product_by_id_handler.handle(product_id)
+        return self._to_canonical(await self._find_product_by_id_handler.handle(product_id))
 
+    async def find_canonical_by_ids(self, product_ids: List[UUID]) -> Dict[UUID, CanonicalProduct]:
+        found = await self._find_products_by_ids_handler.handle(product_ids)
+        canonical_products = [self._to_canonical(product) for product in found["products"]]
+        return {UUID(canonical_product["id"]): canonical_product for canonical_product in canonical_products}
+
+    @staticmethod
+    def _to_canonical(product: Any) -> CanonicalProduct:
         if not isinstance(product, dict):
             raise DomainException("Invalid product data format.")
 
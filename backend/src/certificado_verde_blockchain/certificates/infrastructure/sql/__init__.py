@@ -1,3 +1,5 @@
 from .sql_certificate_repository import SqlCertificateRepository
+from .sql_chain_certificate_repository import SqlChainCertificateRepository
+from .sql_issuance_task_repository import SqlIssuanceTaskRepository
 
-__all__ = ["SqlCertificateRepository"]
+__all__ = ["SqlCertificateRepository", "SqlChainCertificateRepository", "SqlIssuanceTaskRepository"]
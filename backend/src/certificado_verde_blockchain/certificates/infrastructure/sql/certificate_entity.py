@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 
@@ -7,7 +8,14 @@ from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from ....shared.sql import Base
-from ...domain import AuthenticityProof, Certificate, Norm, SustainabilityCriteria
+from ...domain import (
+    AuthenticityProof,
+    Certificate,
+    CertificateStatus,
+    MerkleInclusionProof,
+    Norm,
+    SustainabilityCriteria,
+)
 
 
 class CertificateEntity(Base):
@@ -23,9 +31,9 @@ class CertificateEntity(Base):
         norms_complied (List[str]): List of norms that the product complies with.
         sustainability_criteria (List[str]): List of sustainability criteria met by the product.
         notes (Optional[str]): Additional notes about the certificate.
-        issued_at (Optional[str]): ISO formatted date when the certificate was issued.
-        valid_until (Optional[str]): ISO formatted date when the certificate expires.
-        last_audited_at (Optional[str]): ISO formatted date of the last audit.
+        issued_at (Optional[datetime]): Date when the certificate was issued (timestamptz).
+        valid_until (Optional[datetime]): Date when the certificate expires (timestamptz).
+        last_audited_at (Optional[datetime]): Date of the last audit (timestamptz).
         authenticity_serial_code (Optional[str]): Serial code for the authenticity proof of the certificate.
         authenticity_qr_code_url (Optional[str]): URL of the QR code for the authenticity proof.
         authenticity_certifier_signature (Optional[str]): Digital signature for the authenticity proof.
@@ -33,6 +41,14 @@ class CertificateEntity(Base):
         authenticity_pdf_hash (Optional[str]): Hash of the PDF document associated with the certificate.
         canonical_hash (Optional[str]): Canonical hash of the certificate data for integrity verification.
         blockchain_id (Optional[str]): Identifier of the certificate in the blockchain.
+        registry_address (Optional[str]): Address of the registry deployment the blockchain ID belongs to.
+        status (str): Stage of the certificate in the issuance lifecycle.
+        issuance_error (Optional[str]): Reason of the last failed issuance, if any.
+        revoked_at (Optional[str]): ISO formatted date when the revocation was requested.
+        merkle_root (Optional[str]): Merkle root of the epoch the certificate was anchored in.
+        merkle_leaf_index (Optional[int]): Position of the certificate in its epoch.
+        merkle_path (Optional[List[str]]): Sibling hashes proving the certificate belongs to the epoch.
+        merkle_epoch_id (Optional[str]): Identifier of the anchored epoch in the blockchain.
     """
 
     __tablename__ = "certificates"
@@ -47,9 +63,9 @@ class CertificateEntity(Base):
         ARRAY(sa.String), nullable=False, name="sustainability_criteria"
     )
     notes: Mapped[Optional[str]] = mapped_column(sa.Text, nullable=True)
-    issued_at: Mapped[Optional[str]] = mapped_column(sa.String, nullable=True)
-    valid_until: Mapped[Optional[str]] = mapped_column(sa.String, nullable=True)
-    last_audited_at: Mapped[Optional[str]] = mapped_column(sa.String, nullable=True)
+    issued_at: Mapped[Optional[datetime]] = mapped_column(sa.DateTime(timezone=True), nullable=True)
+    valid_until: Mapped[Optional[datetime]] = mapped_column(sa.DateTime(timezone=True), nullable=True)
+    last_audited_at: Mapped[Optional[datetime]] = mapped_column(sa.DateTime(timezone=True), nullable=True)
     authenticity_serial_code: Mapped[Optional[str]] = mapped_column(sa.String, nullable=True)
     authenticity_qr_code_url: Mapped[Optional[str]] = mapped_column(sa.String, nullable=True)
     authenticity_certifier_signature: Mapped[Optional[str]] = mapped_column(sa.Text, nullable=True)
@@ -57,6 +73,14 @@ class CertificateEntity(Base):
     authenticity_pdf_hash: Mapped[Optional[str]] = mapped_column(sa.String, nullable=True)
     canonical_hash: Mapped[Optional[str]] = mapped_column(sa.String, nullable=True)
     blockchain_id: Mapped[Optional[str]] = mapped_column(sa.String, nullable=True)
+    registry_address: Mapped[Optional[str]] = mapped_column(sa.String(42), nullable=True)
+    status: Mapped[str] = mapped_column(sa.String(20), nullable=False, default=str(CertificateStatus.PRE_ISSUED))
+    issuance_error: Mapped[Optional[str]] = mapped_column(sa.Text, nullable=True)
+    revoked_at: Mapped[Optional[str]] = mapped_column(sa.String, nullable=True)
+    merkle_root: Mapped[Optional[str]] = mapped_column(sa.String, nullable=True)
+    merkle_leaf_index: Mapped[Optional[int]] = mapped_column(sa.Integer, nullable=True)
+    merkle_path: Mapped[Optional[List[str]]] = mapped_column(ARRAY(sa.String), nullable=True)
+    merkle_epoch_id: Mapped[Optional[str]] = mapped_column(sa.String, nullable=True)
 
     @classmethod
     def from_domain(cls, certificate: Certificate) -> "CertificateEntity":
@@ -94,6 +118,14 @@ class CertificateEntity(Base):
             authenticity_pdf_hash=(certificate.authenticity_proof.pdf_hash if certificate.authenticity_proof else None),
             canonical_hash=certificate.canonical_hash,
             blockchain_id=certificate.blockchain_id,
+            registry_address=certificate.registry_address,
+            status=str(certificate.status),
+            issuance_error=certificate.issuance_error,
+            revoked_at=certificate.revoked_at,
+            merkle_root=certificate.merkle_proof.root if certificate.merkle_proof else None,
+            merkle_leaf_index=certificate.merkle_proof.leaf_index if certificate.merkle_proof else None,
+            merkle_path=list(certificate.merkle_proof.path) if certificate.merkle_proof else None,
+            merkle_epoch_id=certificate.merkle_proof.epoch_id if certificate.merkle_proof else None,
         )
 
     def to_domain(self) -> Certificate:
@@ -117,6 +149,15 @@ class CertificateEntity(Base):
                 pdf_hash=self.authenticity_pdf_hash,
             )
 
+        merkle_proof = None
+        if self.merkle_root is not None and self.merkle_leaf_index is not None:
+            merkle_proof = MerkleInclusionProof(
+                root=self.merkle_root,
+                leaf_index=self.merkle_leaf_index,
+                path=list(self.merkle_path or []),
+                epoch_id=self.merkle_epoch_id,
+            )
+
         return Certificate(
             id=UUID(self.id),
             version=self.version,
@@ -132,4 +173,9 @@ class CertificateEntity(Base):
             authenticity_proof=authenticity_proof,
             canonical_hash=self.canonical_hash,
             blockchain_id=self.blockchain_id,
+            registry_address=self.registry_address,
+            status=CertificateStatus(self.status),
+            issuance_error=self.issuance_error,
+            revoked_at=self.revoked_at,
+            merkle_proof=merkle_proof,
         )
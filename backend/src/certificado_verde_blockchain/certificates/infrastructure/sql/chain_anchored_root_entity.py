@@ -0,0 +1,53 @@
+import sqlalchemy as sa
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ....shared.sql import Base
+from ...domain import AnchoredRoot
+
+
+class ChainAnchoredRootEntity(Base):
+    """SQLAlchemy entity that maps to the chain_anchored_roots table in the database.
+    It holds the Merkle root anchored on chain for each epoch, projected from the RootAnchored events.
+
+    Attributes:
+        epoch_id (str): Identifier of the epoch in the contract.
+        root (str): Hex encoded Merkle root of the epoch, as anchored on chain.
+        block_number (int): Block where the root was anchored.
+        transaction_hash (str): Transaction that anchored the root.
+    """
+
+    __tablename__ = "chain_anchored_roots"
+
+    epoch_id: Mapped[str] = mapped_column(sa.String, primary_key=True)
+    root: Mapped[str] = mapped_column(sa.String(66), nullable=False)
+    block_number: Mapped[int] = mapped_column(sa.BigInteger, nullable=False, index=True)
+    transaction_hash: Mapped[str] = mapped_column(sa.String(66), nullable=False)
+
+    @staticmethod
+    def from_domain(anchored_root: AnchoredRoot) -> "ChainAnchoredRootEntity":
+        """Converts a domain AnchoredRoot model to a ChainAnchoredRootEntity.
+
+        Args:
+            anchored_root (AnchoredRoot): The domain AnchoredRoot model.
+        Returns:
+            ChainAnchoredRootEntity: The corresponding entity.
+        """
+        return ChainAnchoredRootEntity(
+            epoch_id=anchored_root.epoch_id,
+            root=anchored_root.root,
+            block_number=anchored_root.block_number,
+            transaction_hash=anchored_root.transaction_hash,
+        )
+
+    def to_domain(self) -> AnchoredRoot:
+        """Converts the ChainAnchoredRootEntity to a domain AnchoredRoot model.
+
+        Returns:
+            AnchoredRoot: The corresponding domain AnchoredRoot model.
+        """
+        return AnchoredRoot(
+            epoch_id=self.epoch_id,
+            root=self.root,
+            block_number=self.block_number,
+            transaction_hash=self.transaction_hash,
+        )
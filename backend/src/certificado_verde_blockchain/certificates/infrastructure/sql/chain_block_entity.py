@@ -0,0 +1,30 @@
+import sqlalchemy as sa
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ....shared.sql import Base
+from ...domain import ChainCursor
+
+
+class ChainBlockEntity(Base):
+    """SQLAlchemy entity that maps to the chain_blocks table in the database.
+    It keeps the hashes of recently indexed blocks so the indexer can find the fork point of a reorg.
+
+    Attributes:
+        cursor_name (str): Name of the indexer that processed the block. fk chain_cursors.name
+        block_number (int): Number of the block.
+        block_hash (str): Hash of the block when it was indexed.
+    """
+
+    __tablename__ = "chain_blocks"
+
+    cursor_name: Mapped[str] = mapped_column(sa.String, sa.ForeignKey("chain_cursors.name"), primary_key=True)
+    block_number: Mapped[int] = mapped_column(sa.BigInteger, primary_key=True)
+    block_hash: Mapped[str] = mapped_column(sa.String(66), nullable=False)
+
+    def to_domain(self) -> ChainCursor:
+        """Converts the ChainBlockEntity to a domain ChainCursor model.
+
+        Returns:
+            ChainCursor: The block as a cursor position.
+        """
+        return ChainCursor(block_number=self.block_number, block_hash=self.block_hash)
@@ -0,0 +1,57 @@
+from typing import Optional
+
+import sqlalchemy as sa
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ....shared.sql import Base
+from ...domain import ChainCertificate
+
+
+class ChainCertificateEntity(Base):
+    """SQLAlchemy entity that maps to the chain_certificates table in the database.
+    It holds the current on-chain state of each certificate, projected from the indexed events.
+
+    Attributes:
+        blockchain_id (str): Identifier of the certificate in the contract.
+        data_hash (str): Hash of the off-chain certificate data anchored on chain.
+        issuer (str): Address that issued the certificate.
+        owner (str): Address that owns the certificate.
+        issued_at (int): Block timestamp of the issuance.
+        block_number (int): Block where the certificate was issued.
+        transaction_hash (str): Transaction that issued the certificate.
+        revoked (bool): Whether the certificate has been revoked.
+        revoked_at (Optional[int]): Block timestamp of the revocation.
+        revoked_block_number (Optional[int]): Block where the certificate was revoked.
+    """
+
+    __tablename__ = "chain_certificates"
+
+    blockchain_id: Mapped[str] = mapped_column(sa.String, primary_key=True)
+    data_hash: Mapped[str] = mapped_column(sa.String, nullable=False, index=True)
+    issuer: Mapped[str] = mapped_column(sa.String(42), nullable=False)
+    owner: Mapped[str] = mapped_column(sa.String(42), nullable=False)
+    issued_at: Mapped[int] = mapped_column(sa.BigInteger, nullable=False)
+    block_number: Mapped[int] = mapped_column(sa.BigInteger, nullable=False, index=True)
+    transaction_hash: Mapped[str] = mapped_column(sa.String(66), nullable=False)
+    revoked: Mapped[bool] = mapped_column(sa.Boolean, nullable=False, default=False)
+    revoked_at: Mapped[Optional[int]] = mapped_column(sa.BigInteger, nullable=True)
+    revoked_block_number: Mapped[Optional[int]] = mapped_column(sa.BigInteger, nullable=True)
+
+    def to_domain(self) -> ChainCertificate:
+        """Converts the ChainCertificateEntity to a domain ChainCertificate model.
+
+        Returns:
+            ChainCertificate: The corresponding domain ChainCertificate model.
+        """
+        return ChainCertificate(
+            blockchain_id=self.blockchain_id,
+            data_hash=self.data_hash,
+            issuer=self.issuer,
+            owner=self.owner,
+            issued_at=self.issued_at,
+            block_number=self.block_number,
+            transaction_hash=self.transaction_hash,
+            revoked=self.revoked,
+            revoked_at=self.revoked_at,
+            revoked_block_number=self.revoked_block_number,
+        )
@@ -0,0 +1,34 @@
+from datetime import datetime
+
+import sqlalchemy as sa
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ....shared.sql import Base
+from ...domain import ChainCursor
+
+
+class ChainCursorEntity(Base):
+    """SQLAlchemy entity that maps to the chain_cursors table in the database.
+    It records the last block processed by each indexer.
+
+    Attributes:
+        name (str): Name of the indexer.
+        block_number (int): Number of the last indexed block.
+        block_hash (str): Hash of the last indexed block.
+        updated_at (datetime): When the cursor last moved.
+    """
+
+    __tablename__ = "chain_cursors"
+
+    name: Mapped[str] = mapped_column(sa.String, primary_key=True)
+    block_number: Mapped[int] = mapped_column(sa.BigInteger, nullable=False)
+    block_hash: Mapped[str] = mapped_column(sa.String(66), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(sa.DateTime(timezone=True), nullable=False)
+
+    def to_domain(self) -> ChainCursor:
+        """Converts the ChainCursorEntity to a domain ChainCursor model.
+
+        Returns:
+            ChainCursor: The corresponding domain ChainCursor model.
+        """
+        return ChainCursor(block_number=self.block_number, block_hash=self.block_hash)
@@ -0,0 +1,79 @@
+from typing import Optional
+
+import sqlalchemy as sa
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ....shared.sql import Base
+from ...domain import ChainEvent, ChainEventType
+
+
+class ChainEventEntity(Base):
+    """SQLAlchemy entity that maps to the chain_events table in the database.
+    It stores every decoded CertificateRegistry event, keyed by its position in the chain.
+
+    Attributes:
+        block_number (int): Block containing the event.
+        log_index (int): Position of the event in the block.
+        block_hash (str): Hash of the block containing the event.
+        transaction_hash (str): Transaction that emitted the event.
+        event_type (str): Name of the contract event.
+        blockchain_id (str): Identifier of the certificate the event refers to.
+        timestamp (int): Timestamp carried by the event.
+        data_hash (Optional[str]): Anchored data hash (issuance only).
+        issuer (Optional[str]): Issuer address (issuance only).
+        owner (Optional[str]): Owner address (issuance only).
+    """
+
+    __tablename__ = "chain_events"
+
+    block_number: Mapped[int] = mapped_column(sa.BigInteger, primary_key=True)
+    log_index: Mapped[int] = mapped_column(sa.Integer, primary_key=True)
+    block_hash: Mapped[str] = mapped_column(sa.String(66), nullable=False)
+    transaction_hash: Mapped[str] = mapped_column(sa.String(66), nullable=False)
+    event_type: Mapped[str] = mapped_column(sa.String(32), nullable=False)
+    blockchain_id: Mapped[str] = mapped_column(sa.String, nullable=False, index=True)
+    timestamp: Mapped[int] = mapped_column(sa.BigInteger, nullable=False)
+    data_hash: Mapped[Optional[str]] = mapped_column(sa.String, nullable=True)
+    issuer: Mapped[Optional[str]] = mapped_column(sa.String(42), nullable=True)
+    owner: Mapped[Optional[str]] = mapped_column(sa.String(42), nullable=True)
+
+    @staticmethod
+    def values_from_domain(event: ChainEvent) -> dict:
+        """Builds the column values of a domain ChainEvent, for bulk inserts.
+
+        Args:
+            event (ChainEvent): The domain ChainEvent model.
+        Returns:
+            dict: The column values of the event.
+        """
+        return {
+            "block_number": event.block_number,
+            "log_index": event.log_index,
+            "block_hash": event.block_hash,
+            "transaction_hash": event.transaction_hash,
+            "event_type": str(event.event_type),
+            "blockchain_id": event.blockchain_id,
+            "timestamp": event.timestamp,
+            "data_hash": event.data_hash,
+            "issuer": event.issuer,
+            "owner": event.owner,
+        }
+
+    def to_domain(self) -> ChainEvent:
+        """Converts the ChainEventEntity to a domain ChainEvent model.
+
+        Returns:
+            ChainEvent: The corresponding domain ChainEvent model.
+        """
+        return ChainEvent(
+            event_type=ChainEventType(self.event_type),
+            blockchain_id=self.blockchain_id,
+            block_number=self.block_number,
+            block_hash=self.block_hash,
+            transaction_hash=self.transaction_hash,
+            log_index=self.log_index,
+            timestamp=self.timestamp,
+            data_hash=self.data_hash,
+            issuer=self.issuer,
+            owner=self.owner,
+        )
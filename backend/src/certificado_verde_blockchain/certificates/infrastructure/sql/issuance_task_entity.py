@@ -0,0 +1,95 @@
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ....shared.sql import Base
+from ...domain import IssuanceTask, IssuanceTaskStatus
+
+
+class IssuanceTaskEntity(Base):
+    """SQLAlchemy entity that maps to the certificate_issuance_tasks (issuance outbox) table in the database.
+    It provides methods to convert between the domain IssuanceTask model and the database representation.
+
+    Attributes:
+        id (str): Unique identifier of the task.
+        certificate_id (str): Identifier of the certificate being issued. fk certificates.id
+        canonical_hash (str): Canonical hash recorded on the blockchain.
+        certifier_address (str): Blockchain address of the certifier.
+        status (str): Current stage of the task.
+        attempts (int): Number of times the transaction was submitted.
+        transaction_hash (Optional[str]): Hash of the last submitted transaction.
+        replaced_transaction_hashes (List[str]): Hashes of the transactions replaced with higher fees.
+        merkle_root (Optional[str]): Merkle root anchored by the last transaction, for epoch anchoring.
+        last_error (Optional[str]): Error of the last failed attempt.
+        submitted_at (Optional[datetime]): When the last transaction was submitted.
+        created_at (datetime): When the task was created.
+        available_at (datetime): When the task can be claimed by a worker (lease or retry backoff).
+    """
+
+    __tablename__ = "certificate_issuance_tasks"
+
+    id: Mapped[str] = mapped_column(PGUUID(as_uuid=False), primary_key=True)
+    certificate_id: Mapped[str] = mapped_column(PGUUID(as_uuid=False), sa.ForeignKey("certificates.id"), nullable=False)
+    canonical_hash: Mapped[str] = mapped_column(sa.String, nullable=False)
+    certifier_address: Mapped[str] = mapped_column(sa.String, nullable=False)
+    status: Mapped[str] = mapped_column(sa.String(20), nullable=False)
+    attempts: Mapped[int] = mapped_column(sa.Integer, nullable=False, default=0)
+    transaction_hash: Mapped[Optional[str]] = mapped_column(sa.String, nullable=True)
+    replaced_transaction_hashes: Mapped[List[str]] = mapped_column(ARRAY(sa.String), nullable=False, default=list)
+    merkle_root: Mapped[Optional[str]] = mapped_column(sa.String, nullable=True)
+    last_error: Mapped[Optional[str]] = mapped_column(sa.Text, nullable=True)
+    submitted_at: Mapped[Optional[datetime]] = mapped_column(sa.DateTime(timezone=True), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(sa.DateTime(timezone=True), nullable=False)
+    available_at: Mapped[datetime] = mapped_column(sa.DateTime(timezone=True), nullable=False)
+
+    @classmethod
+    def from_domain(cls, task: IssuanceTask, available_at: datetime) -> "IssuanceTaskEntity":
+        """Creates an IssuanceTaskEntity from a domain IssuanceTask model.
+
+        Args:
+            task (IssuanceTask): The domain IssuanceTask model.
+            available_at (datetime): When the task can be claimed by a worker.
+        Returns:
+            IssuanceTaskEntity: The corresponding IssuanceTaskEntity.
+        """
+        return cls(
+            id=str(task.id),
+            certificate_id=str(task.certificate_id),
+            canonical_hash=task.canonical_hash,
+            certifier_address=task.certifier_address,
+            status=str(task.status),
+            attempts=task.attempts,
+            transaction_hash=task.transaction_hash,
+            replaced_transaction_hashes=list(task.replaced_transaction_hashes),
+            merkle_root=task.merkle_root,
+            last_error=task.last_error,
+            submitted_at=task.submitted_at,
+            created_at=task.created_at,
+            available_at=available_at,
+        )
+
+    def to_domain(self) -> IssuanceTask:
+        """Converts the IssuanceTaskEntity to a domain IssuanceTask model.
+
+        Returns:
+            IssuanceTask: The corresponding domain IssuanceTask model.
+        """
+        return IssuanceTask(
+            id=UUID(self.id),
+            certificate_id=UUID(self.certificate_id),
+            canonical_hash=self.canonical_hash,
+            certifier_address=self.certifier_address,
+            status=IssuanceTaskStatus(self.status),
+            attempts=self.attempts,
+            transaction_hash=self.transaction_hash,
+            replaced_transaction_hashes=list(self.replaced_transaction_hashes or []),
+            merkle_root=self.merkle_root,
+            last_error=self.last_error,
+            submitted_at=self.submitted_at,
+            created_at=self.created_at,
+        )
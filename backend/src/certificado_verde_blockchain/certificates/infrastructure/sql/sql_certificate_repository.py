@@ -1,103 +1,293 @@
-from typing import List, Optional
+from datetime import datetime, timezone
+from typing import AsyncIterator, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session as DatabaseSession
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession as DatabaseSession
+from sqlalchemy.orm import InstrumentedAttribute
 
-from ....shared.errors import DomainException
-from ...domain import Certificate, ICertificateRepository
+from ....shared.sql import SqlUnitOfWork
+from ...domain import PRE_ISSUED_STATUSES, Certificate, CertificateStatus, ICertificateRepository, Norm
 from .certificate_entity import CertificateEntity
 
 
 class SqlCertificateRepository(ICertificateRepository):
-    def __init__(self, database_session: DatabaseSession):
+    def __init__(self, database_session: DatabaseSession, unit_of_work: SqlUnitOfWork):
         self._db_session = database_session
+        self._unit_of_work = unit_of_work
 
-    def list_all(self) -> List[Certificate]:
+    async def list_pre_issued(
+        self, certifier_id: Optional[UUID], after_id: Optional[UUID], limit: int
+    ) -> List[Certificate]:
+        # Inlined rather than bound, so that even a generic plan of the prepared statement matches the predicate
+        # of the partial indexes ix_certificates_pre_issued_*, which only hold the certificates not issued yet
+        criteria: List[sa.ColumnElement[bool]] = [
+            CertificateEntity.status.in_(
+                [sa.literal(str(status), literal_execute=True) for status in PRE_ISSUED_STATUSES]
+            )
+        ]
+        if certifier_id is not None:
+            criteria.append(CertificateEntity.certifier_id == str(certifier_id))
+        return await self._find_page(sa.and_(*criteria), after_id, limit)
+
+    async def find_by_id(self, certificate_id: UUID) -> Optional[Certificate]:
+        certificate = self._unit_of_work.find(Certificate, certificate_id)
+        if certificate is not None:
+            return certificate
         try:
-            certificate_entities = self._db_session.query(CertificateEntity).all()
-            return [entity.to_domain() for entity in certificate_entities]
+            certificate_entity: Optional[CertificateEntity] = await self._db_session.scalar(
+                sa.select(CertificateEntity).filter_by(id=str(certificate_id))
+            )
+            if certificate_entity:
+                certificate = certificate_entity.to_domain()
+                self._unit_of_work.track(certificate)
+                return certificate
+            return None
         except:
-            self._db_session.rollback()
+            await self._db_session.rollback()
             raise
 
-    def find_by_id(self, certificate_id: UUID) -> Optional[Certificate]:
+    async def find_by_ids(self, certificate_ids: List[UUID]) -> List[Certificate]:
+        certificates, missing_ids = self._unit_of_work.find_many(Certificate, certificate_ids)
+        if not missing_ids:
+            return certificates
         try:
-            certificate_entity = self._db_session.query(CertificateEntity).filter_by(id=str(certificate_id)).first()
-            if certificate_entity:
-                return certificate_entity.to_domain()
-            return None
+            certificate_entities = (
+                await self._db_session.scalars(
+                    sa.select(CertificateEntity).where(
+                        CertificateEntity.id.in_([str(certificate_id) for certificate_id in missing_ids])
+                    )
+                )
+            ).all()
+            for certificate_entity in certificate_entities:
+                certificate = certificate_entity.to_domain()
+                self._unit_of_work.track(certificate)
+                certificates.append(certificate)
+            return certificates
         except:
-            self._db_session.rollback()
+            await self._db_session.rollback()
             raise
 
-    def find_by_canonical_hash(self, canonical_hash: str) -> Optional[Certificate]:
+    async def find_by_canonical_hash(self, canonical_hash: str) -> Optional[Certificate]:
+        certificate = self._unit_of_work.find_first(
+            Certificate, lambda certificate: certificate.canonical_hash == canonical_hash
+        )
+        if certificate is not None:
+            return certificate
         try:
-            certificate_entity = (
-                self._db_session.query(CertificateEntity).filter_by(canonical_hash=canonical_hash).first()
+            certificate_entity: Optional[CertificateEntity] = await self._db_session.scalar(
+                sa.select(CertificateEntity).filter_by(canonical_hash=canonical_hash).limit(1)
+            )
+            if certificate_entity is None:
+                return None
+            certificate = certificate_entity.to_domain()
+            if self._unit_of_work.find(Certificate, certificate.id) is not None:
+                return None  # Changed in the scope since it was read: it no longer has this hash
+            self._unit_of_work.track(certificate)
+            return certificate
+        except:
+            await self._db_session.rollback()
+            raise
+
+    async def find_by_product_id(
+        self, product_id: UUID, after_id: Optional[UUID], limit: int, status: Optional[CertificateStatus] = None
+    ) -> List[Certificate]:
+        # Served by ix_certificates_product_id_id, which both filters and orders the page
+        criteria = [CertificateEntity.product_id == str(product_id)]
+        if status is not None:
+            criteria.append(CertificateEntity.status == str(status))
+        return await self._find_page(sa.and_(*criteria), after_id, limit)
+
+    async def find_by_producer_id(
+        self, producer_id: UUID, after_id: Optional[UUID], limit: int, status: Optional[CertificateStatus] = None
+    ) -> List[Certificate]:
+        # Served by ix_certificates_producer_id_id, which both filters and orders the page
+        criteria = [CertificateEntity.producer_id == str(producer_id)]
+        if status is not None:
+            criteria.append(CertificateEntity.status == str(status))
+        return await self._find_page(sa.and_(*criteria), after_id, limit)
+
+    async def find_by_certifier_id(
+        self, certifier_id: UUID, after_id: Optional[UUID], limit: int, status: Optional[CertificateStatus] = None
+    ) -> List[Certificate]:
+        # Served by ix_certificates_certifier_id_id, which both filters and orders the page
+        criteria = [CertificateEntity.certifier_id == str(certifier_id)]
+        if status is not None:
+            criteria.append(CertificateEntity.status == str(status))
+        return await self._find_page(sa.and_(*criteria), after_id, limit)
+
+    async def find_by_pdf_hash(self, pdf_hash: str) -> Optional[Certificate]:
+        try:
+            certificate_entity: Optional[CertificateEntity] = await self._db_session.scalar(
+                sa.select(CertificateEntity).filter_by(authenticity_pdf_hash=pdf_hash).limit(1)
             )
             if certificate_entity:
                 return certificate_entity.to_domain()
             return None
         except:
-            self._db_session.rollback()
+            await self._db_session.rollback()
             raise
 
-    def find_by_product_id(self, product_id: UUID) -> List[Certificate]:
+    async def list_signed(self, after_id: Optional[UUID], limit: int) -> List[Certificate]:
         try:
-            certificate_entities = self._db_session.query(CertificateEntity).filter_by(product_id=str(product_id)).all()
+            query = sa.select(CertificateEntity).where(CertificateEntity.authenticity_certifier_signature.isnot(None))
+            if after_id is not None:
+                query = query.where(CertificateEntity.id > str(after_id))
+            certificate_entities = (
+                await self._db_session.scalars(query.order_by(CertificateEntity.id).limit(limit))
+            ).all()
             return [entity.to_domain() for entity in certificate_entities]
         except:
-            self._db_session.rollback()
+            await self._db_session.rollback()
             raise
 
-    def find_by_producer_id(self, producer_id: UUID) -> List[Certificate]:
+    async def stream(
+        self,
+        chunk_size: int,
+        status: Optional[CertificateStatus] = None,
+        certifier_id: Optional[UUID] = None,
+        norm: Optional[Norm] = None,
+        issued_from: Optional[datetime] = None,
+        issued_until: Optional[datetime] = None,
+    ) -> AsyncIterator[List[Certificate]]:
+        query = sa.select(CertificateEntity)
+        if status is not None:
+            query = query.where(CertificateEntity.status == str(status))
+        if certifier_id is not None:
+            query = query.where(CertificateEntity.certifier_id == str(certifier_id))
+        if norm is not None:
+            query = query.where(CertificateEntity.norms_complied.contains([str(norm)]))
+        if issued_from is not None:
+            query = query.where(CertificateEntity.issued_at >= self._as_utc(issued_from))
+        if issued_until is not None:
+            query = query.where(CertificateEntity.issued_at < self._as_utc(issued_until))
         try:
-            certificate_entities = (
-                self._db_session.query(CertificateEntity).filter_by(producer_id=str(producer_id)).all()
+            # A server-side cursor: only one chunk of rows is held in memory at a time
+            result = await self._db_session.stream_scalars(
+                query.order_by(CertificateEntity.id).execution_options(yield_per=chunk_size)
             )
-            return [entity.to_domain() for entity in certificate_entities]
+            async for certificate_entities in result.partitions():
+                yield [entity.to_domain() for entity in certificate_entities]
         except:
-            self._db_session.rollback()
+            await self._db_session.rollback()
             raise
 
-    def find_by_certifier_id(self, certifier_id: UUID) -> List[Certificate]:
+    async def find_by_expiry_window(
+        self,
+        expires_from: datetime,
+        expires_until: datetime,
+        after: Optional[Tuple[datetime, UUID]],
+        limit: int,
+        status: Optional[CertificateStatus] = None,
+    ) -> List[Certificate]:
+        # Served by ix_certificates_valid_until_id, which only holds the certificates with a validity date
+        criteria: List[sa.ColumnElement[bool]] = [
+            CertificateEntity.valid_until >= self._as_utc(expires_from),
+            CertificateEntity.valid_until < self._as_utc(expires_until),
+        ]
+        if status is not None:
+            criteria.append(CertificateEntity.status == str(status))
+        return await self._find_date_page(CertificateEntity.valid_until, sa.and_(*criteria), after, limit)
+
+    async def find_by_issuance_window(
+        self,
+        issued_from: datetime,
+        issued_until: datetime,
+        after: Optional[Tuple[datetime, UUID]],
+        limit: int,
+        status: Optional[CertificateStatus] = None,
+    ) -> List[Certificate]:
+        # Served by ix_certificates_issued_at_id, which only holds the certificates with an issuance date
+        criteria: List[sa.ColumnElement[bool]] = [
+            CertificateEntity.issued_at >= self._as_utc(issued_from),
+            CertificateEntity.issued_at < self._as_utc(issued_until),
+        ]
+        if status is not None:
+            criteria.append(CertificateEntity.status == str(status))
+        return await self._find_date_page(CertificateEntity.issued_at, sa.and_(*criteria), after, limit)
+
+    async def find_by_blockchain_id_range(
+        self, first_id: int, last_id: Optional[int], registry_address: str
+    ) -> List[Certificate]:
+        # Blockchain IDs are stored as strings: compare them as numbers, served by ix_certificates_blockchain_id
+        blockchain_id = sa.cast(CertificateEntity.blockchain_id, sa.BigInteger)
         try:
-            certificate_entities = (
-                self._db_session.query(CertificateEntity).filter_by(certifier_id=str(certifier_id)).all()
+            query = sa.select(CertificateEntity).where(
+                CertificateEntity.blockchain_id.isnot(None),
+                blockchain_id >= first_id,
+                sa.or_(
+                    CertificateEntity.registry_address == registry_address,
+                    CertificateEntity.registry_address.is_(None),
+                ),
             )
+            if last_id is not None:
+                query = query.where(blockchain_id <= last_id)
+            certificate_entities = (await self._db_session.scalars(query.order_by(blockchain_id))).all()
             return [entity.to_domain() for entity in certificate_entities]
         except:
-            self._db_session.rollback()
+            await self._db_session.rollback()
             raise
 
-    def find_by_pdf_hash(self, pdf_hash: str) -> Optional[Certificate]:
-        try:
-            certificate_entity = (
-                self._db_session.query(CertificateEntity).filter_by(authenticity_pdf_hash=pdf_hash).first()
+    async def save(self, certificate: Certificate) -> None:
+        self._unit_of_work.stage(
+            CertificateEntity.from_domain(certificate),
+            (
+                f"Integrity error while saving certificate with ID {certificate.id}: "
+                "possible duplicate or constraint violation."
+            ),
+        )
+        self._unit_of_work.track(certificate)
+
+    async def save_all(self, certificates: List[Certificate]) -> None:
+        for certificate in certificates:
+            self._unit_of_work.stage(
+                CertificateEntity.from_domain(certificate),
+                f"Integrity error while saving {len(certificates)} certificates: possible constraint violation.",
             )
-            if certificate_entity:
-                return certificate_entity.to_domain()
-            return None
+            self._unit_of_work.track(certificate)
+
+    async def _find_page(
+        self, criteria: sa.ColumnElement[bool], after_id: Optional[UUID], limit: int
+    ) -> List[Certificate]:
+        try:
+            query = sa.select(CertificateEntity).where(criteria)
+            if after_id is not None:
+                query = query.where(CertificateEntity.id > str(after_id))
+            certificate_entities = (
+                await self._db_session.scalars(query.order_by(CertificateEntity.id).limit(limit))
+            ).all()
+            return [entity.to_domain() for entity in certificate_entities]
         except:
-            self._db_session.rollback()
+            await self._db_session.rollback()
             raise
 
-    def save(self, certificate: Certificate) -> None:
-        certificate_entity = CertificateEntity.from_domain(certificate)
+    async def _find_date_page(
+        self,
+        date_column: InstrumentedAttribute[Optional[datetime]],
+        criteria: sa.ColumnElement[bool],
+        after: Optional[Tuple[datetime, UUID]],
+        limit: int,
+    ) -> List[Certificate]:
+        # Ordered by the date first: a page seeks the (date, id) index of the window, instead of reading every
+        # certificate of the window to sort them by ID
         try:
-            self._db_session.merge(certificate_entity)  # Use merge to handle both insert and update
-            self._db_session.commit()
-        except IntegrityError as integrity_error:
-            self._db_session.rollback()
-            raise DomainException(
-                (
-                    f"Integrity error while saving certificate with ID {certificate.id}: "
-                    "possible duplicate or constraint violation."
-                ),
-                code=409,  # Conflict
-            ) from integrity_error
+            query = sa.select(CertificateEntity).where(criteria)
+            if after is not None:
+                after_date, after_id = after
+                query = query.where(
+                    sa.tuple_(date_column, CertificateEntity.id) > (self._as_utc(after_date), str(after_id))
+                )
+            certificate_entities = (
+                await self._db_session.scalars(query.order_by(date_column, CertificateEntity.id).limit(limit))
+            ).all()
+            return [entity.to_domain() for entity in certificate_entities]
         except:
-            # In case of an error, rollback the session
-            self._db_session.rollback()
+            await self._db_session.rollback()
             raise
+
+    @staticmethod
+    def _as_utc(instant: datetime) -> datetime:
+        """The instant to compare the lifecycle dates with, a naive datetime being taken as UTC."""
+        if instant.tzinfo is None:
+            return instant.replace(tzinfo=timezone.utc)
+        return instant
@@ -0,0 +1,258 @@
+from datetime import datetime, timezone
+from typing import List, Optional
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession as DatabaseSession
+
+from ....configuration import IndexerConfig
+from ....shared.sql import SqlUnitOfWork
+from ...domain import (
+    AnchoredRoot,
+    ChainCertificate,
+    ChainCursor,
+    ChainEvent,
+    ChainEventType,
+    IChainCertificateRepository,
+)
+from .chain_anchored_root_entity import ChainAnchoredRootEntity
+from .chain_block_entity import ChainBlockEntity
+from .chain_certificate_entity import ChainCertificateEntity
+from .chain_cursor_entity import ChainCursorEntity
+from .chain_event_entity import ChainEventEntity
+
+
+class SqlChainCertificateRepository(IChainCertificateRepository):
+    def __init__(self, database_session: DatabaseSession, config: IndexerConfig, unit_of_work: SqlUnitOfWork):
+        self._db_session = database_session
+        self._keep_blocks = config.reorg_lookback_blocks
+        self._unit_of_work = unit_of_work
+
+    async def find_by_data_hash(self, data_hash: str) -> Optional[ChainCertificate]:
+        try:
+            # The contract accepts the same hash more than once, the first anchor is the authoritative one
+            certificate_entity: Optional[ChainCertificateEntity] = await self._db_session.scalar(
+                sa.select(ChainCertificateEntity)
+                .filter_by(data_hash=data_hash)
+                .order_by(ChainCertificateEntity.block_number)
+                .limit(1)
+            )
+            if certificate_entity:
+                return certificate_entity.to_domain()
+            return None
+        except:
+            await self._db_session.rollback()
+            raise
+
+    async def find_by_blockchain_id(self, blockchain_id: str) -> Optional[ChainCertificate]:
+        try:
+            certificate_entity = await self._db_session.get(ChainCertificateEntity, blockchain_id)
+            if certificate_entity:
+                return certificate_entity.to_domain()
+            return None
+        except:
+            await self._db_session.rollback()
+            raise
+
+    async def find_anchored_root(self, epoch_id: str) -> Optional[AnchoredRoot]:
+        try:
+            anchored_root_entity = await self._db_session.get(ChainAnchoredRootEntity, epoch_id)
+            if anchored_root_entity:
+                return anchored_root_entity.to_domain()
+            return None
+        except:
+            await self._db_session.rollback()
+            raise
+
+    async def save_anchored_roots(self, anchored_roots: List[AnchoredRoot]) -> None:
+        for anchored_root in anchored_roots:
+            self._unit_of_work.stage(
+                ChainAnchoredRootEntity.from_domain(anchored_root),
+                "Integrity error while saving anchored roots.",
+            )
+
+    async def get_cursor(self, name: str) -> Optional[ChainCursor]:
+        try:
+            cursor_entity = await self._db_session.get(ChainCursorEntity, name)
+            if cursor_entity:
+                return cursor_entity.to_domain()
+            return None
+        except:
+            await self._db_session.rollback()
+            raise
+
+    async def list_recent_blocks(self, name: str, limit: int) -> List[ChainCursor]:
+        try:
+            block_entities = (
+                await self._db_session.scalars(
+                    sa.select(ChainBlockEntity)
+                    .filter_by(cursor_name=name)
+                    .order_by(ChainBlockEntity.block_number.desc())
+                    .limit(limit)
+                )
+            ).all()
+            return [entity.to_domain() for entity in block_entities]
+        except:
+            await self._db_session.rollback()
+            raise
+
+    async def save_events(self, name: str, events: List[ChainEvent], cursor: ChainCursor) -> None:
+        try:
+            await self._save_cursor(name, cursor)
+            if events:
+                # Passing the rows as parameters lets SQLAlchemy page them into multi-row INSERTs
+                await self._db_session.execute(
+                    insert(ChainEventEntity).on_conflict_do_nothing(),
+                    [ChainEventEntity.values_from_domain(event) for event in events],
+                )
+                await self._project_issued(
+                    [event for event in events if event.event_type == ChainEventType.CERTIFICATE_ISSUED]
+                )
+                await self._project_revoked(
+                    [event for event in events if event.event_type == ChainEventType.CERTIFICATE_REVOKED]
+                )
+                await self._project_anchored(
+                    [event for event in events if event.event_type == ChainEventType.ROOT_ANCHORED]
+                )
+            await self._db_session.commit()
+        except:
+            await self._db_session.rollback()
+            raise
+
+    async def rollback(self, name: str, from_block: int) -> None:
+        try:
+            await self._db_session.execute(
+                sa.delete(ChainCertificateEntity).where(ChainCertificateEntity.block_number >= from_block)
+            )
+            await self._db_session.execute(
+                sa.update(ChainCertificateEntity)
+                .where(ChainCertificateEntity.revoked_block_number >= from_block)
+                .values(revoked=False, revoked_at=None, revoked_block_number=None)
+            )
+            await self._db_session.execute(
+                sa.delete(ChainAnchoredRootEntity).where(ChainAnchoredRootEntity.block_number >= from_block)
+            )
+            await self._db_session.execute(
+                sa.delete(ChainEventEntity).where(ChainEventEntity.block_number >= from_block)
+            )
+            await self._db_session.execute(
+                sa.delete(ChainBlockEntity).where(
+                    ChainBlockEntity.cursor_name == name, ChainBlockEntity.block_number >= from_block
+                )
+            )
+
+            # Move the cursor back to the newest block that survived the reorg
+            last_block = await self._db_session.scalar(
+                sa.select(ChainBlockEntity)
+                .filter_by(cursor_name=name)
+                .order_by(ChainBlockEntity.block_number.desc())
+                .limit(1)
+            )
+            if last_block:
+                await self._save_cursor(name, last_block.to_domain(), record_block=False)
+            else:
+                await self._db_session.execute(sa.delete(ChainCursorEntity).where(ChainCursorEntity.name == name))
+            await self._db_session.commit()
+        except:
+            await self._db_session.rollback()
+            raise
+
+    async def _save_cursor(self, name: str, cursor: ChainCursor, record_block: bool = True) -> None:
+        values = {
+            "name": name,
+            "block_number": cursor.block_number,
+            "block_hash": cursor.block_hash,
+            "updated_at": datetime.now(timezone.utc),
+        }
+        await self._db_session.execute(
+            insert(ChainCursorEntity)
+            .values(values)
+            .on_conflict_do_update(index_elements=[ChainCursorEntity.name], set_=values)
+        )
+        if not record_block:
+            return
+
+        await self._db_session.execute(
+            insert(ChainBlockEntity)
+            .values(cursor_name=name, block_number=cursor.block_number, block_hash=cursor.block_hash)
+            .on_conflict_do_update(
+                index_elements=[ChainBlockEntity.cursor_name, ChainBlockEntity.block_number],
+                set_={"block_hash": cursor.block_hash},
+            )
+        )
+        # Only the newest blocks are needed to locate a fork point
+        oldest_kept = (
+            sa.select(ChainBlockEntity.block_number)
+            .where(ChainBlockEntity.cursor_name == name)
+            .order_by(ChainBlockEntity.block_number.desc())
+            .offset(self._keep_blocks)
+            .limit(1)
+            .scalar_subquery()
+        )
+        await self._db_session.execute(
+            sa.delete(ChainBlockEntity).where(
+                ChainBlockEntity.cursor_name == name, ChainBlockEntity.block_number <= oldest_kept
+            )
+        )
+
+    async def _project_issued(self, events: List[ChainEvent]) -> None:
+        if not events:
+            return
+        await self._db_session.execute(
+            insert(ChainCertificateEntity).on_conflict_do_nothing(
+                index_elements=[ChainCertificateEntity.blockchain_id]
+            ),
+            [
+                {
+                    "blockchain_id": event.blockchain_id,
+                    "data_hash": event.data_hash,
+                    "issuer": event.issuer,
+                    "owner": event.owner,
+                    "issued_at": event.timestamp,
+                    "block_number": event.block_number,
+                    "transaction_hash": event.transaction_hash,
+                    "revoked": False,
+                }
+                for event in events
+            ],
+        )
+
+    async def _project_revoked(self, events: List[ChainEvent]) -> None:
+        if not events:
+            return
+        table = ChainCertificateEntity.__table__
+        connection = await self._db_session.connection()
+        await connection.execute(
+            table.update()
+            .where(table.c.blockchain_id == sa.bindparam("target_id"))
+            .values(
+                revoked=True,
+                revoked_at=sa.bindparam("target_revoked_at"),
+                revoked_block_number=sa.bindparam("target_block_number"),
+            ),
+            [
+                {
+                    "target_id": event.blockchain_id,
+                    "target_revoked_at": event.timestamp,
+                    "target_block_number": event.block_number,
+                }
+                for event in events
+            ],
+        )
+
+    async def _project_anchored(self, events: List[ChainEvent]) -> None:
+        if not events:
+            return
+        # The issuance worker may have recorded the root from the receipt already, with the same values
+        await self._db_session.execute(
+            insert(ChainAnchoredRootEntity).on_conflict_do_nothing(index_elements=[ChainAnchoredRootEntity.epoch_id]),
+            [
+                {
+                    "epoch_id": event.blockchain_id,
+                    "root": event.data_hash,
+                    "block_number": event.block_number,
+                    "transaction_hash": event.transaction_hash,
+                }
+                for event in events
+            ],
+        )
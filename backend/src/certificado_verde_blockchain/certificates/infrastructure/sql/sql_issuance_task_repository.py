@@ -0,0 +1,83 @@
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession as DatabaseSession
+
+from ....shared.sql import SqlUnitOfWork
+from ...domain import Certificate, IIssuanceTaskRepository, IssuanceTask, IssuanceTaskStatus
+from .certificate_entity import CertificateEntity
+from .issuance_task_entity import IssuanceTaskEntity
+
+
+class SqlIssuanceTaskRepository(IIssuanceTaskRepository):
+    def __init__(self, database_session: DatabaseSession, unit_of_work: SqlUnitOfWork):
+        self._db_session = database_session
+        self._unit_of_work = unit_of_work
+
+    async def claim(self, status: IssuanceTaskStatus, limit: int, lease_seconds: int) -> List[IssuanceTask]:
+        now = datetime.now(timezone.utc)
+        try:
+            # SKIP LOCKED lets concurrent workers claim disjoint batches without waiting on each other
+            task_entities = (
+                await self._db_session.scalars(
+                    sa.select(IssuanceTaskEntity)
+                    .where(IssuanceTaskEntity.status == str(status), IssuanceTaskEntity.available_at <= now)
+                    .order_by(IssuanceTaskEntity.available_at)
+                    .limit(limit)
+                    .with_for_update(skip_locked=True)
+                )
+            ).all()
+            tasks = [entity.to_domain() for entity in task_entities]
+            for entity in task_entities:
+                entity.available_at = now + timedelta(seconds=lease_seconds)
+            await self._db_session.commit()
+            return tasks
+        except:
+            await self._db_session.rollback()
+            raise
+
+    async def due_backlog(self, status: IssuanceTaskStatus, limit: int) -> Tuple[int, Optional[datetime]]:
+        now = datetime.now(timezone.utc)
+        try:
+            due_tasks = (
+                sa.select(IssuanceTaskEntity.created_at)
+                .where(IssuanceTaskEntity.status == str(status), IssuanceTaskEntity.available_at <= now)
+                .limit(limit)
+                .subquery()
+            )
+            # Only the counted rows are scanned, so the oldest date is exact only while fewer than `limit` are due
+            result = await self._db_session.execute(
+                sa.select(sa.func.count(), sa.func.min(due_tasks.c.created_at)).select_from(due_tasks)
+            )
+            count, oldest = result.one()
+            return count, oldest
+        except:
+            await self._db_session.rollback()
+            raise
+
+    async def find_latest_by_certificate_id(self, certificate_id: UUID) -> Optional[IssuanceTask]:
+        try:
+            task_entity: Optional[IssuanceTaskEntity] = await self._db_session.scalar(
+                sa.select(IssuanceTaskEntity)
+                .filter_by(certificate_id=str(certificate_id))
+                .order_by(IssuanceTaskEntity.created_at.desc())
+                .limit(1)
+            )
+            if task_entity:
+                return task_entity.to_domain()
+            return None
+        except:
+            await self._db_session.rollback()
+            raise
+
+    async def save(self, tasks: List[IssuanceTask], certificates: List[Certificate], delay_seconds: float = 0) -> None:
+        available_at = datetime.now(timezone.utc) + timedelta(seconds=delay_seconds)
+        conflict_message = "Integrity error while saving issuance tasks: the certificate may already be in issuance."
+        # Certificates first: their tasks reference them
+        for certificate in certificates:
+            self._unit_of_work.stage(CertificateEntity.from_domain(certificate), conflict_message)
+            self._unit_of_work.track(certificate)
+        for task in tasks:
+            self._unit_of_work.stage(IssuanceTaskEntity.from_domain(task, available_at), conflict_message)
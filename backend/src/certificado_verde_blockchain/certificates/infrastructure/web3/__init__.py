@@ -0,0 +1,23 @@
+from .contract_registry import ContractBinding, ContractRegistry, EventDecoder
+from .eip1559_fee_strategy import Eip1559FeeStrategy
+from .fee_strategy import FeeStrategy
+from .nonce_manager import NonceManager
+from .registry_adapter import RegistryAdapter, RegistryV1Adapter, RegistryV2Adapter
+from .signature_verifier import SignatureVerifier
+from .signer_pool import SignerPool
+from .web3_blockchain_service import Web3BlockchainService
+
+__all__ = [
+    "ContractBinding",
+    "ContractRegistry",
+    "Eip1559FeeStrategy",
+    "EventDecoder",
+    "FeeStrategy",
+    "NonceManager",
+    "RegistryAdapter",
+    "RegistryV1Adapter",
+    "RegistryV2Adapter",
+    "SignatureVerifier",
+    "SignerPool",
+    "Web3BlockchainService",
+]
@@ -0,0 +1,233 @@
+import json
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple, cast
+
+from eth_abi import decode as abi_decode
+from eth_account import Account
+from eth_typing import ABIEvent, ABIFunction
+from eth_utils import event_abi_to_log_topic, function_abi_to_4byte_selector
+from web3 import AsyncWeb3, Web3
+from web3.contract import AsyncContract
+
+from ....configuration import BlockchainConfig
+from ....shared.errors import DomainException
+from ....shared.web3 import InProcessChain
+from .registry_adapter import RegistryAdapter
+
+REQUIRED_FUNCTIONS = (
+    "issueCertificate",
+    "issueCertificates",
+    "revokeCertificates",
+    "getCertificate",
+    "getCertificates",
+    "nextId",
+)
+REQUIRED_EVENTS = ("CertificateIssued", "CertificateRevoked")
+
+
+def _value_decoder(abi_type: str) -> Callable[[Any], Any]:
+    """Post-processing of a decoded value: addresses are checksummed like web3's event processor does."""
+    if abi_type == "address":
+        return Web3.to_checksum_address
+    return lambda value: value
+
+
+def _topic_decoder(abi_type: str) -> Callable[[bytes], Any]:
+    """Decoder of an indexed argument, specialised for the static types the registry events use."""
+    if abi_type.startswith("uint"):
+        return lambda topic: int.from_bytes(topic, "big")
+    if abi_type == "address":
+        return lambda topic: Web3.to_checksum_address(topic[-20:])
+    if abi_type == "bytes32":
+        return bytes
+    if abi_type in ("string", "bytes") or abi_type.endswith("]") or abi_type.startswith("tuple"):
+        return bytes  # Indexed dynamic values are only available as their keccak256 hash
+    return lambda topic: abi_decode([abi_type], topic)[0]
+
+
+class EventDecoder:
+    """Decodes the raw logs of one contract event with types resolved once from the ABI.
+
+    It replaces `contract.events.<Event>().process_receipt`, which looks the event up, rebuilds its codecs
+    and formats an AttributeDict for every log it processes.
+    """
+
+    def __init__(self, event_abi: Mapping[str, Any]) -> None:
+        self.name: str = event_abi["name"]
+        self.topic: bytes = event_abi_to_log_topic(cast(ABIEvent, dict(event_abi)))
+        inputs = event_abi.get("inputs", [])
+        self._indexed = [(item["name"], _topic_decoder(item["type"])) for item in inputs if item.get("indexed")]
+        data_inputs = [item for item in inputs if not item.get("indexed")]
+        self._data_names = [item["name"] for item in data_inputs]
+        self._data_types = [item["type"] for item in data_inputs]
+        self._data_decoders = [_value_decoder(item["type"]) for item in data_inputs]
+
+    def matches(self, log: Mapping[str, Any]) -> bool:
+        topics = log["topics"]
+        return bool(topics) and bytes(topics[0]) == self.topic
+
+    def decode(self, log: Mapping[str, Any]) -> Dict[str, Any]:
+        """Decode the arguments of a log of this event.
+
+        Args:
+            log (Mapping[str, Any]): A log whose first topic is the topic of this event.
+        Returns:
+            Dict[str, Any]: The event arguments, keyed by name.
+        """
+        topics = log["topics"]
+        args = {name: decoder(bytes(topics[position])) for position, (name, decoder) in enumerate(self._indexed, 1)}
+        if self._data_types:
+            values = abi_decode(self._data_types, bytes(log["data"]))
+            args.update(
+                (name, decoder(value)) for name, decoder, value in zip(self._data_names, self._data_decoders, values)
+            )
+        return args
+
+
+class ContractBinding:
+    """A deployed registry contract: its web3 contract object, version adapter, selectors and event decoders.
+
+    Attributes:
+        address (str): The checksum address of the deployment.
+        abi_path (str): The path of the ABI file the binding was built from.
+        abi (List[Dict[str, Any]]): The contract ABI.
+        contract (AsyncContract): The web3 contract object bound to the address.
+        registry (RegistryAdapter): The adapter of the registry version the ABI describes.
+        selectors (Dict[str, bytes]): Four byte selector of every function, keyed by function name.
+        events (Dict[str, EventDecoder]): Decoder of every event, keyed by event name.
+    """
+
+    def __init__(self, address: str, abi_path: str, abi: List[Dict[str, Any]], web3_client: AsyncWeb3) -> None:
+        self.address = Web3.to_checksum_address(address)
+        self.abi_path = abi_path
+        self.abi = abi
+        self.contract: AsyncContract = web3_client.eth.contract(address=self.address, abi=abi)
+        self.registry = RegistryAdapter.for_abi(abi)
+        self.selectors: Dict[str, bytes] = {
+            entry["name"]: function_abi_to_4byte_selector(cast(ABIFunction, entry))
+            for entry in abi
+            if entry.get("type") == "function"
+        }
+        self.events: Dict[str, EventDecoder] = {
+            entry["name"]: EventDecoder(entry) for entry in abi if entry.get("type") == "event"
+        }
+
+    def decode_receipt(self, receipt: Mapping[str, Any], event_name: str) -> List[Dict[str, Any]]:
+        """Decode the logs of one event emitted by this deployment in a transaction receipt.
+
+        Args:
+            receipt (Mapping[str, Any]): The transaction receipt.
+            event_name (str): The name of the event.
+        Returns:
+            List[Dict[str, Any]]: The arguments of every matching log, in emission order (empty if the
+                ABI does not declare the event).
+        """
+        decoder = self.events.get(event_name)
+        if decoder is None:
+            return []
+        address = self.address.lower()
+        return [
+            decoder.decode(log)
+            for log in receipt["logs"]
+            if decoder.matches(log) and str(log["address"]).lower() == address
+        ]
+
+
+class ContractRegistry:
+    """Process-wide registry of the contract deployments the backend talks to.
+
+    ABI files are read and validated once, and the contract objects, selectors and event decoders built
+    from them are cached per deployment address and registry version, so resolving the blockchain
+    service or the log reader costs a dictionary lookup. Several deployments (for instance a v1 and a v2
+    registry) can be bound at the same time. The configured deployment and the earlier deployments listed in
+    `previous_contracts` are bound, and their ABIs validated, when the registry is created, so a wrong ABI
+    fails at startup instead of on the first request.
+
+    This object is meant to be shared process-wide (registered as a singleton).
+    """
+
+    def __init__(self, config: BlockchainConfig, web3_client: AsyncWeb3) -> None:
+        self.web3_client = web3_client
+        self._abis: Dict[str, List[Dict[str, Any]]] = {}
+        self._bindings: Dict[Tuple[str, int], ContractBinding] = {}
+        self._default_abi_path = config.abi_path
+        # ABI of each known deployment, so a certificate recorded on an earlier one is bound with its own ABI
+        self._abi_paths: Dict[str, str] = {
+            Web3.to_checksum_address(address): abi_path for address, abi_path in config.previous_deployments.items()
+        }
+        for address in self._abi_paths:
+            self.bind(address)
+        self.default = self.bind(config.contract, config.abi_path)
+
+    @classmethod
+    def deploy_in_process(
+        cls, config: BlockchainConfig, web3_client: AsyncWeb3, chain: InProcessChain
+    ) -> "ContractRegistry":
+        """Deploy the registry on an in-process chain, as the deploy script does on a node, and bind it.
+
+        The admin account deploys the contract from the artifact at `abi_path` and authorizes the extra
+        signers with `setIssuer`, so issuance works as soon as the backend starts.
+
+        Args:
+            config (BlockchainConfig): The blockchain configuration; `contract` is replaced by the deployment.
+            web3_client (AsyncWeb3): A client of the in-process chain.
+            chain (InProcessChain): The in-process chain.
+        Returns:
+            ContractRegistry: The registry bound to the new deployment.
+        """
+        address = chain.deploy(config.abi_path, config.private_key)
+        registry = cls(config.model_copy(update={"contract": address}), web3_client)
+        admin = Account.from_key(config.private_key).address
+        for private_key in config.signer_private_keys:
+            signer = Account.from_key(private_key).address
+            if signer != admin:
+                chain.transact(
+                    config.private_key, address, registry.default.contract.encode_abi("setIssuer", [signer, True])
+                )
+        return registry
+
+    @property
+    def bindings(self) -> Sequence[ContractBinding]:
+        """The deployments bound so far."""
+        return list(self._bindings.values())
+
+    def abi(self, abi_path: str) -> List[Dict[str, Any]]:
+        """Load and validate a contract ABI file, reading it only the first time.
+
+        Args:
+            abi_path (str): Path to a Hardhat artifact (or any JSON file with an `abi` key).
+        Returns:
+            List[Dict[str, Any]]: The contract ABI.
+        """
+        abi = self._abis.get(abi_path)
+        if abi is None:
+            with open(abi_path, "r", encoding="utf-8") as abi_file:
+                abi = json.load(abi_file).get("abi")
+            if abi is None:
+                raise DomainException("Invalid ABI file format: 'abi' key not found.")
+
+            names = {(entry.get("type"), entry.get("name")) for entry in abi}
+            missing = [name for name in REQUIRED_FUNCTIONS if ("function", name) not in names]
+            missing += [name for name in REQUIRED_EVENTS if ("event", name) not in names]
+            if missing:
+                raise DomainException(f"ABI {abi_path} is not a certificate registry, missing: {', '.join(missing)}.")
+            self._abis[abi_path] = abi
+        return abi
+
+    def bind(self, address: str, abi_path: Optional[str] = None) -> ContractBinding:
+        """Get the binding of a deployment, building it the first time the address is seen with that version.
+
+        Args:
+            address (str): The address of the deployment.
+            abi_path (Optional[str]): The ABI of the deployment; defaults to the ABI configured for the address
+                in `previous_contracts`, else to the configured ABI.
+        Returns:
+            ContractBinding: The cached binding.
+        """
+        address = Web3.to_checksum_address(address)
+        abi_path = abi_path or self._abi_paths.get(address) or self._default_abi_path
+        abi = self.abi(abi_path)
+        key = (address, RegistryAdapter.for_abi(abi).version)
+        binding = self._bindings.get(key)
+        if binding is None:
+            binding = self._bindings[key] = ContractBinding(address, abi_path, abi, self.web3_client)
+        return binding
@@ -0,0 +1,139 @@
+import asyncio
+import math
+import time
+from decimal import Decimal
+from typing import Dict, Optional, Tuple
+
+from web3 import AsyncWeb3, Web3
+from web3.contract.async_contract import AsyncContractFunction
+from web3.exceptions import Web3RPCError
+from web3.types import TxData, TxParams, Wei
+
+from ....configuration import BlockchainConfig
+from .fee_strategy import FeeStrategy
+
+CallShape = Tuple[str, str, Tuple[Optional[int], ...]]
+# Functions whose gas depends on contract state, not only on their batch size: revocations skip unknown and
+# already revoked certificates, and batch issuances the hashes issued before, which cost a fraction of the
+# write they skip, so an estimate reused for another batch could fall short. Every call is estimated again
+STATE_DEPENDENT_FUNCTIONS = frozenset({"revokeCertificate", "revokeCertificates", "issueCertificates"})
+
+
+def _call_shape(contract_function: AsyncContractFunction) -> CallShape:
+    """Key of the gas estimate cache: the function and the length of each of its array arguments.
+
+    Only used for the functions outside `STATE_DEPENDENT_FUNCTIONS`, which take addresses and fixed-length
+    hashes and do the same work for every item, so their gas depends on the batch size only.
+    """
+    lengths = tuple(len(arg) if isinstance(arg, (list, tuple)) else None for arg in contract_function.args)
+    return contract_function.address, contract_function.fn_name, lengths
+
+
+class Eip1559FeeStrategy(FeeStrategy):
+    """Prices transactions from the fees recently paid on chain and sends them as EIP-1559 (type 2).
+
+    `eth_feeHistory` is sampled over the last blocks and cached for a short time, so a burst of
+    transactions costs a single RPC call. The tip is the median, across non-empty blocks, of the
+    configured percentile of the priority fees, and `maxFeePerGas` leaves room for the base fee to
+    rise for a few blocks (the unused part is never charged). Chains without EIP-1559 fall back to
+    legacy transactions priced with `eth_gasPrice`.
+
+    Gas limits are estimated once per contract function and batch size and reused afterwards, except for
+    the functions whose gas depends on contract state (`STATE_DEPENDENT_FUNCTIONS`), estimated on every call.
+
+    This object is meant to be shared process-wide (registered as a singleton).
+    """
+
+    def __init__(self, config: BlockchainConfig, web3_client: AsyncWeb3) -> None:
+        self.config = config
+        self.web3_client = web3_client
+        self._max_fee_per_gas = Web3.to_wei(Decimal(str(config.max_fee_per_gas_gwei)), "gwei")
+        self._min_priority_fee = Web3.to_wei(Decimal(str(config.min_priority_fee_gwei)), "gwei")
+        self._fees: Optional[TxParams] = None
+        self._fees_expire_at = 0.0
+        self._fees_lock = asyncio.Lock()
+        self._gas_limits: Dict[CallShape, int] = {}
+
+    async def transaction_fields(self, contract_function: AsyncContractFunction, sender: str) -> TxParams:
+        fields: TxParams = {"gas": await self.gas_limit(contract_function, sender)}
+        fields.update(await self.fees())
+        return fields
+
+    async def replacement_fields(self, transaction: TxData) -> Optional[TxParams]:
+        current = await self.fees()
+        bump = 1 + self.config.fee_bump_percent / 100
+
+        if transaction.get("maxFeePerGas") is None:
+            gas_price = math.ceil(transaction["gasPrice"] * bump)
+            if gas_price > self._max_fee_per_gas:
+                return None
+            market_price = int(current.get("gasPrice", current.get("maxFeePerGas", 0)))
+            return {"gasPrice": Wei(min(max(gas_price, market_price), self._max_fee_per_gas))}
+
+        # Nodes only accept a replacement that raises both the fee cap and the tip by a minimum ratio
+        max_fee = math.ceil(transaction["maxFeePerGas"] * bump)
+        if max_fee > self._max_fee_per_gas:
+            return None
+        max_fee = min(max(max_fee, int(current.get("maxFeePerGas", 0))), self._max_fee_per_gas)
+        priority_fee = max(
+            math.ceil(transaction["maxPriorityFeePerGas"] * bump), int(current.get("maxPriorityFeePerGas", 0))
+        )
+        return {"maxFeePerGas": Wei(max_fee), "maxPriorityFeePerGas": Wei(min(priority_fee, max_fee)), "type": 2}
+
+    async def gas_limit(self, contract_function: AsyncContractFunction, sender: str) -> int:
+        """Return the gas limit of a contract call, estimating it only the first time its shape is seen
+        (every time for the functions in `STATE_DEPENDENT_FUNCTIONS`).
+
+        Args:
+            contract_function (AsyncContractFunction): The contract call being sent.
+            sender (str): The checksum address of the signing account.
+        Returns:
+            int: The estimated gas increased by the configured safety margin.
+        """
+        if contract_function.fn_name in STATE_DEPENDENT_FUNCTIONS:
+            estimate = await contract_function.estimate_gas({"from": sender})
+            return math.ceil(estimate * self.config.gas_limit_margin)
+
+        shape = _call_shape(contract_function)
+        gas_limit = self._gas_limits.get(shape)
+        if gas_limit is None:
+            estimate = await contract_function.estimate_gas({"from": sender})
+            gas_limit = self._gas_limits[shape] = math.ceil(estimate * self.config.gas_limit_margin)
+        return gas_limit
+
+    async def fees(self) -> TxParams:
+        """Return the fee fields of a new transaction, sampling the chain at most once per cache period.
+
+        Returns:
+            TxParams: `maxFeePerGas`, `maxPriorityFeePerGas` and `type`, or `gasPrice` on legacy chains.
+        """
+        async with self._fees_lock:
+            now = time.monotonic()
+            if self._fees is None or now >= self._fees_expire_at:
+                self._fees = await self._fetch_fees()
+                self._fees_expire_at = now + self.config.fee_cache_ms / 1000
+            return dict(self._fees)  # type: ignore[return-value]
+
+    async def _fetch_fees(self) -> TxParams:
+        try:
+            history = await self.web3_client.eth.fee_history(
+                self.config.fee_history_blocks, "latest", [self.config.fee_priority_percentile]
+            )
+        except Web3RPCError:
+            history = None  # The node does not implement eth_feeHistory
+
+        base_fees = history.get("baseFeePerGas") if history is not None else None
+        if history is None or not base_fees or base_fees[-1] is None:
+            gas_price = await self.web3_client.eth.gas_price
+            return {"gasPrice": Wei(min(gas_price, self._max_fee_per_gas))}
+
+        # Empty blocks report a zero reward, which says nothing about the tip needed to get in
+        rewards = sorted(
+            block_rewards[0]
+            for block_rewards, gas_used_ratio in zip(history.get("reward") or [], history.get("gasUsedRatio") or [])
+            if block_rewards and gas_used_ratio > 0
+        )
+        priority_fee = max(rewards[len(rewards) // 2] if rewards else 0, self._min_priority_fee)
+        # The last entry is the base fee of the next block
+        max_fee = min(math.ceil(base_fees[-1] * self.config.base_fee_multiplier) + priority_fee, self._max_fee_per_gas)
+        return {"maxFeePerGas": Wei(max_fee), "maxPriorityFeePerGas": Wei(min(priority_fee, max_fee)), "type": 2}
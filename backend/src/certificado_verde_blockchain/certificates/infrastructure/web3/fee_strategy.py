@@ -0,0 +1,30 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from web3.contract.async_contract import AsyncContractFunction
+from web3.types import TxData, TxParams
+
+
+class FeeStrategy(ABC):
+    """Decides the gas limit and fees of the transactions sent by the blockchain service."""
+
+    @abstractmethod
+    async def transaction_fields(self, contract_function: AsyncContractFunction, sender: str) -> TxParams:
+        """Build the gas and fee fields of a new transaction.
+
+        Args:
+            contract_function (AsyncContractFunction): The contract call being sent.
+            sender (str): The checksum address of the signing account.
+        Returns:
+            TxParams: The `gas` field together with the fee fields (and the transaction `type`).
+        """
+
+    @abstractmethod
+    async def replacement_fields(self, transaction: TxData) -> Optional[TxParams]:
+        """Build the fee fields of a transaction replacing a pending one under the same nonce.
+
+        Args:
+            transaction (TxData): The pending transaction, as returned by the node.
+        Returns:
+            Optional[TxParams]: The bumped fee fields, or None if the fees cannot be raised any further.
+        """
@@ -0,0 +1,83 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import Dict, Set, cast
+
+from eth_typing import ChecksumAddress
+from web3 import AsyncWeb3
+
+
+@dataclass
+class _AccountNonces:
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    next_nonce: int = -1  # -1 means the account has not been synced with the node yet
+    released: Set[int] = field(default_factory=set)
+
+
+class NonceManager:
+    """Allocates transaction nonces locally for each signing account.
+
+    The first allocation for an account (and any allocation after `resync`) reads the transaction count
+    at the `pending` block tag, so the allocator picks up transactions that were sent before a restart.
+    Afterwards nonces are handed out from memory, removing an RPC round trip per transaction and
+    letting concurrent transactions from the same account use distinct nonces.
+
+    Nonces of transactions that never reached the node are given back with `release` and are reused
+    before new ones, so a failed send does not leave a gap that would block later transactions.
+    When the node rejects a nonce or a transaction is dropped from the mempool, `resync` discards the
+    local state and the next allocation starts again from the node's view.
+
+    This object is meant to be shared process-wide (registered as a singleton).
+    """
+
+    def __init__(self, web3_client: AsyncWeb3) -> None:
+        self.web3_client = web3_client
+        self._accounts: Dict[str, _AccountNonces] = {}
+
+    def _account(self, address: str) -> _AccountNonces:
+        return self._accounts.setdefault(address, _AccountNonces())
+
+    async def allocate(self, address: str) -> int:
+        """Reserve the next nonce for the given account.
+
+        Args:
+            address (str): The checksum address of the signing account.
+        Returns:
+            int: The nonce to use in the account's next transaction.
+        """
+        account = self._account(address)
+        async with account.lock:
+            if account.next_nonce < 0:
+                account.next_nonce = await self.web3_client.eth.get_transaction_count(
+                    cast(ChecksumAddress, address), "pending"
+                )
+                account.released.clear()
+
+            if account.released:
+                nonce = min(account.released)
+                account.released.discard(nonce)
+                return nonce
+
+            nonce = account.next_nonce
+            account.next_nonce += 1
+            return nonce
+
+    def release(self, address: str, nonce: int) -> None:
+        """Give back a nonce whose transaction was never accepted by the node.
+
+        Args:
+            address (str): The checksum address of the signing account.
+            nonce (int): The nonce that was allocated but not used.
+        """
+        account = self._account(address)
+        if 0 <= nonce < account.next_nonce:
+            account.released.add(nonce)
+
+    def resync(self, address: str) -> None:
+        """Discard the local nonce state of an account so it is read from the node again.
+
+        Args:
+            address (str): The checksum address of the signing account.
+        """
+        account = self._account(address)
+        account.next_nonce = -1
+        account.released.clear()
@@ -0,0 +1,69 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List
+
+from hexbytes import HexBytes
+
+from ....shared.errors import DomainException
+
+
+class RegistryAdapter(ABC):
+    """Hides the differences between the CertificateRegistry versions from the service and the indexer.
+
+    Both versions share their functions and the layout of the Certificate struct. They differ in how the
+    data hash is stored: v1 keeps the hex string, v2 keeps a bytes32, indexes it in CertificateIssued and
+    looks it up with `getByHash`. Hashes always leave the adapter as hex strings without the 0x prefix,
+    the format of the canonical hashes, so the rest of the backend does not know which version it talks to.
+    The layout of the events is read from the ABI (see `ContractBinding`).
+    """
+
+    version: int
+
+    @staticmethod
+    def for_abi(abi: List[Dict[str, Any]]) -> "RegistryAdapter":
+        """Pick the adapter of the registry version described by a contract ABI.
+
+        Args:
+            abi (List[Dict[str, Any]]): The contract ABI.
+        Returns:
+            RegistryAdapter: The v2 adapter if the ABI has `getByHash`, the v1 adapter otherwise.
+        """
+        functions = {entry["name"] for entry in abi if entry.get("type") == "function"}
+        return RegistryV2Adapter() if "getByHash" in functions else RegistryV1Adapter()
+
+    @abstractmethod
+    def encode_hash(self, certificate_hash: str) -> Any:
+        """Convert a certificate hash into the argument type of the issuance functions."""
+
+    @abstractmethod
+    def decode_hash(self, data_hash: Any) -> str:
+        """Convert a data hash returned by the contract (call result or event argument) into a hex string."""
+
+
+class RegistryV1Adapter(RegistryAdapter):
+    """CertificateRegistry: string hashes, `CertificateIssued(id, issuer, owner, dataHash, timestamp)`."""
+
+    version = 1
+
+    def encode_hash(self, certificate_hash: str) -> Any:
+        return certificate_hash
+
+    def decode_hash(self, data_hash: Any) -> str:
+        return str(data_hash)
+
+
+class RegistryV2Adapter(RegistryAdapter):
+    """CertificateRegistryV2: bytes32 hashes, `CertificateIssued(id, dataHash, owner, issuer, timestamp)`."""
+
+    version = 2
+
+    def encode_hash(self, certificate_hash: str) -> Any:
+        try:
+            data_hash = HexBytes(certificate_hash)
+        except ValueError as e:
+            raise DomainException(f"Certificate hash {certificate_hash} is not hex encoded.") from e
+        if len(data_hash) != 32:
+            raise DomainException(f"Certificate hash {certificate_hash} is not 32 bytes long.")
+        return data_hash
+
+    def decode_hash(self, data_hash: Any) -> str:
+        return bytes(data_hash).hex()
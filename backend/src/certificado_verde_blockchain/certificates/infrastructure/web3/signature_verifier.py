@@ -0,0 +1,136 @@
+import asyncio
+import multiprocessing
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import aclosing
+from typing import AsyncGenerator, Dict, List, Optional, Sequence, Set, Tuple
+
+from ....shared.web3 import RecoveryResult, recover_signers
+
+SignedMessage = Tuple[str, str]
+
+
+class SignatureVerifier:
+    """Recovers signers of EIP-191 signatures off the event loop.
+
+    Recovery is CPU bound, so chunks of signatures are fanned out to a pool of worker processes (started
+    lazily, with the spawn method so they do not inherit the server's sockets and threads). Results are kept
+    in a bounded LRU cache keyed by (message hash, signature): re-verifying stored signatures during audits
+    only pays for the ones not seen recently.
+
+    This object is meant to be shared process-wide (registered as a singleton).
+    """
+
+    def __init__(self, workers: int, cache_size: int, chunk_size: int) -> None:
+        self._workers = workers or os.cpu_count() or 1
+        self._cache_size = cache_size
+        self._chunk_size = chunk_size
+        self._cache: "OrderedDict[SignedMessage, RecoveryResult]" = OrderedDict()
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def workers(self) -> int:
+        """Number of worker processes used for recovery."""
+        return self._workers
+
+    async def recover(self, message_hash: str, signature: str) -> RecoveryResult:
+        """Recover the signer of a single signature.
+
+        Args:
+            message_hash (str): The hex encoded hash that was signed.
+            signature (str): The hex encoded signature.
+        Returns:
+            RecoveryResult: The signer address and None, or None and the reason it could not be recovered.
+        """
+        async with aclosing(self.recover_many([(message_hash, signature)])) as results:
+            async for _, result in results:
+                return result
+        raise RuntimeError("No recovery result was produced.")
+
+    async def recover_many(self, messages: Sequence[SignedMessage]) -> AsyncGenerator[Tuple[int, RecoveryResult], None]:
+        """Recover the signers of many signatures, yielding each result as soon as its chunk completes.
+
+        At most two chunks per worker are in flight, so arbitrarily large inputs stream with bounded memory.
+
+        Args:
+            messages (Sequence[SignedMessage]): Pairs of hex encoded message hash and signature.
+        Returns:
+            AsyncGenerator[Tuple[int, RecoveryResult], None]: The position of each message in the input and its
+                result.
+        """
+        pending_indexes: Dict[SignedMessage, List[int]] = {}
+        for index, message in enumerate(messages):
+            cached = self._cache_get(message)
+            if cached is not None:
+                yield index, cached
+            else:
+                # Duplicates in the input are recovered once
+                pending_indexes.setdefault(message, []).append(index)
+
+        if not pending_indexes:
+            return
+
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        unique_messages = list(pending_indexes)
+        chunks = [
+            unique_messages[start : start + self._chunk_size]
+            for start in range(0, len(unique_messages), self._chunk_size)
+        ]
+        next_chunk = 0
+        in_flight: Dict["asyncio.Future[List[RecoveryResult]]", List[SignedMessage]] = {}
+        max_in_flight = self._workers * 2
+
+        try:
+            while next_chunk < len(chunks) or in_flight:
+                while next_chunk < len(chunks) and len(in_flight) < max_in_flight:
+                    chunk = chunks[next_chunk]
+                    next_chunk += 1
+                    in_flight[loop.run_in_executor(executor, recover_signers, chunk)] = chunk
+
+                done: Set["asyncio.Future[List[RecoveryResult]]"]
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    chunk = in_flight.pop(future)
+                    try:
+                        results = future.result()
+                    except BrokenProcessPool:
+                        # A crashed worker breaks the pool for good; start a new one on the next call
+                        self.shutdown()
+                        raise
+                    for message, result in zip(chunk, results):
+                        self._cache_put(message, result)
+                        for index in pending_indexes[message]:
+                            yield index, result
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+    def shutdown(self) -> None:
+        """Stop the worker processes; they are started again on the next recovery."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    def _cache_get(self, message: SignedMessage) -> Optional[RecoveryResult]:
+        result = self._cache.get(message)
+        if result is not None:
+            self._cache.move_to_end(message)
+        return result
+
+    def _cache_put(self, message: SignedMessage, result: RecoveryResult) -> None:
+        if self._cache_size <= 0:
+            return
+        self._cache[message] = result
+        self._cache.move_to_end(message)
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
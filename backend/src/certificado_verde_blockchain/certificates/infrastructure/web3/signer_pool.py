@@ -0,0 +1,63 @@
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+from eth_account import Account
+from eth_account.signers.local import LocalAccount
+
+from ....configuration import BlockchainConfig
+from ....shared.errors import DomainException
+
+
+class SignerPool:
+    """Spreads blockchain transactions across the configured signing accounts.
+
+    Each account has its own nonce sequence, so sending through several accounts lets transactions be
+    mined in parallel instead of queuing behind a single account. Every signer other than the admin
+    must be authorized in the contract with `setIssuer`.
+
+    This object is meant to be shared process-wide (registered as a singleton).
+    """
+
+    def __init__(self, config: BlockchainConfig) -> None:
+        self._signers: List[LocalAccount] = [Account.from_key(key) for key in config.all_private_keys]
+        if not self._signers:
+            raise DomainException("At least one signer private key must be configured.")
+        self._in_flight: Dict[str, int] = {signer.address: 0 for signer in self._signers}
+        self._next_index = 0
+
+    @property
+    def signers(self) -> List[LocalAccount]:
+        return list(self._signers)
+
+    @property
+    def admin(self) -> LocalAccount:
+        """The account of the contract admin, the only one allowed to revoke certificates."""
+        return self._signers[0]
+
+    def find(self, address: str) -> Optional[LocalAccount]:
+        """Return the pool's account with the given address, if any.
+
+        Args:
+            address (str): The address of the account.
+        Returns:
+            Optional[LocalAccount]: The matching account, or None if it is not one of the pool's signers.
+        """
+        return next((signer for signer in self._signers if signer.address.lower() == address.lower()), None)
+
+    @contextmanager
+    def acquire(self) -> Iterator[LocalAccount]:
+        """Pick the signer with the fewest transactions in flight, rotating between ties.
+
+        Yields:
+            LocalAccount: The account that should sign the next transaction.
+        """
+        count = len(self._signers)
+        candidates = [self._signers[(self._next_index + offset) % count] for offset in range(count)]
+        signer = min(candidates, key=lambda candidate: self._in_flight[candidate.address])
+        self._next_index = (self._signers.index(signer) + 1) % count
+
+        self._in_flight[signer.address] += 1
+        try:
+            yield signer
+        finally:
+            self._in_flight[signer.address] -= 1
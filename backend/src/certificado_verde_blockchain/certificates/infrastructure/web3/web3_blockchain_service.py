@@ -0,0 +1,641 @@
+import asyncio
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, List, Mapping, Optional, Tuple, cast
+
+from eth_account.datastructures import SignedTransaction
+from eth_account.signers.local import LocalAccount
+from hexbytes import HexBytes
+from web3 import AsyncWeb3, Web3
+from web3._utils.method_formatters import receipt_formatter
+from web3.contract import AsyncContract
+from web3.contract.async_contract import AsyncContractFunction
+from web3.exceptions import ContractLogicError, TransactionNotFound
+from web3.types import Nonce, RPCEndpoint, TxParams, TxReceipt
+
+from ....configuration import BlockchainConfig
+from ....shared.canonical import CanonicalEncoder, CanonicalEncoding
+from ....shared.errors import DomainException
+from ....shared.web3 import pinned_reads
+from ...domain import (
+    IBlockchainService,
+    IssuanceReceipt,
+    PreparedTransaction,
+    RegistryCertificate,
+    RevocationReceipt,
+    SignatureCheck,
+    SignatureVerification,
+)
+from .contract_registry import ContractBinding, ContractRegistry
+from .fee_strategy import FeeStrategy
+from .nonce_manager import NonceManager
+from .registry_adapter import RegistryAdapter
+from .signature_verifier import SignatureVerifier
+from .signer_pool import SignerPool
+
+MAX_SEND_ATTEMPTS = 3
+RECEIPT_POLL_SECONDS = 0.1
+NONCE_ERROR_MESSAGES = ("nonce too low", "nonce too high", "already known", "replacement transaction underpriced")
+
+
+def _is_nonce_error(error: Exception) -> bool:
+    message = str(error).lower()
+    return any(fragment in message for fragment in NONCE_ERROR_MESSAGES)
+
+
+class Web3BlockchainService(IBlockchainService):
+    def __init__(
+        self,
+        config: BlockchainConfig,
+        web3_client: AsyncWeb3,
+        contracts: ContractRegistry,
+        signer_pool: SignerPool,
+        nonce_manager: NonceManager,
+        signature_verifier: SignatureVerifier,
+        fee_strategy: FeeStrategy,
+    ):
+        self.config = config
+        self.web3_client = web3_client
+        self.signer_pool = signer_pool
+        self.nonce_manager = nonce_manager
+        self.signature_verifier = signature_verifier
+        self.fee_strategy = fee_strategy
+        # The contract is loaded once per process; the binding tells v1 and v2 deployments apart. Certificates
+        # recorded on an earlier deployment are revoked through the binding of their own registry
+        self.contracts = contracts
+        self.binding: ContractBinding = contracts.default
+        self.contract: Optional[AsyncContract] = self.binding.contract
+        self.registry: Optional[RegistryAdapter] = self.binding.registry
+
+    @property
+    def registry_address(self) -> str:
+        return self.binding.address
+
+    async def prepare_certificates(self, certificates: List[Tuple[str, str]]) -> PreparedTransaction:
+        """Sign a transaction recording the given certificates, without sending it.
+
+        Args:
+            certificates (List[Tuple[str, str]]): Pairs of certificate hash and certifier address.
+        Returns:
+            PreparedTransaction: The signed transaction.
+        """
+        try:
+            return await self._prepare(self._issuance_call(certificates))
+        except DomainException:
+            raise
+        except Exception as e:
+            raise DomainException(f"Failed to prepare certificates: {str(e)}") from e
+
+    async def prepare_anchor(self, root: str, leaf_count: int) -> PreparedTransaction:
+        """Sign a transaction anchoring the Merkle root of an epoch, without sending it.
+
+        Args:
+            root (str): The hex encoded Merkle root of the epoch.
+            leaf_count (int): The number of certificates in the epoch.
+        Returns:
+            PreparedTransaction: The signed transaction.
+        """
+        if self.contract is None:
+            raise DomainException("Blockchain contract is not initialized.")
+
+        try:
+            return await self._prepare(self.contract.functions.anchorRoot(HexBytes(root), leaf_count))
+        except DomainException:
+            raise
+        except Exception as e:
+            raise DomainException(f"Failed to prepare the anchoring of Merkle root {root}: {str(e)}") from e
+
+    async def broadcast_transaction(self, transaction: PreparedTransaction) -> None:
+        signer = self.signer_pool.find(transaction.sender)
+        if signer is None:
+            raise DomainException(f"Transaction {transaction.transaction_hash} was not signed by the signer pool.")
+        try:
+            await self._broadcast(HexBytes(transaction.raw_transaction), signer)
+        except Exception as e:
+            raise DomainException(f"Failed to send transaction {transaction.transaction_hash}: {str(e)}") from e
+
+    async def find_issued_certificates(self, certificate_hashes: List[str]) -> Optional[Dict[str, str]]:
+        """Look certificate hashes up with `getByHash`, concurrently, on the node that mined the issuances.
+
+        Args:
+            certificate_hashes (List[str]): The canonical hashes to look up.
+        Returns:
+            Optional[Dict[str, str]]: The blockchain IDs of the recorded hashes, or None on a v1 registry.
+        """
+        if self.contract is None or self.registry is None:
+            raise DomainException("Blockchain contract is not initialized.")
+        if self.registry.version < 2:
+            return None
+        contract, registry = self.contract, self.registry
+
+        async def find(certificate_hash: str) -> Optional[str]:
+            try:
+                with pinned_reads():
+                    certificate = await contract.functions.getByHash(registry.encode_hash(certificate_hash)).call()
+            except ContractLogicError:
+                return None  # getByHash reverts for unknown hashes
+            return str(certificate[0])
+
+        try:
+            certificate_ids = await asyncio.gather(*(find(certificate_hash) for certificate_hash in certificate_hashes))
+        except DomainException:
+            raise
+        except Exception as e:
+            raise DomainException(f"Failed to look up issued certificates: {str(e)}") from e
+        return {
+            certificate_hash: certificate_id
+            for certificate_hash, certificate_id in zip(certificate_hashes, certificate_ids)
+            if certificate_id is not None
+        }
+
+    async def get_issuance_receipts(self, transaction_hashes: List[str]) -> Dict[str, IssuanceReceipt]:
+        """Fetch the outcome of several issuance transactions with a single batched JSON-RPC call.
+
+        Args:
+            transaction_hashes (List[str]): The hashes of the transactions to check.
+        Returns:
+            Dict[str, IssuanceReceipt]: The receipts of the mined transactions, keyed by transaction hash.
+        """
+        if not transaction_hashes:
+            return {}
+
+        try:
+            # Raw batch request: a missing receipt is a null result, which would fail the whole web3 batch
+            responses = await self.web3_client.provider.make_batch_request(
+                [
+                    (RPCEndpoint("eth_getTransactionReceipt"), [transaction_hash])
+                    for transaction_hash in transaction_hashes
+                ]
+            )
+            if not isinstance(responses, list):
+                raise DomainException(f"Batch receipt request failed: {responses.get('error')}")
+
+            receipts: Dict[str, IssuanceReceipt] = {}
+            for transaction_hash, response in zip(transaction_hashes, responses):
+                if "error" in response:
+                    raise DomainException(f"Failed to fetch receipt of {transaction_hash}: {response['error']}")
+                if response.get("result") is None:
+                    continue  # Not mined yet
+
+                receipt = receipt_formatter(response["result"])
+                success = receipt["status"] == 1
+                receipts[transaction_hash] = IssuanceReceipt(
+                    transaction_hash=transaction_hash,
+                    success=success,
+                    block_number=receipt["blockNumber"],
+                    certificate_ids=dict(self._issued_certificates(receipt)) if success else {},
+                    anchored_epochs=self._anchored_epochs(receipt) if success else {},
+                )
+            return receipts
+        except DomainException:
+            raise
+        except Exception as e:
+            raise DomainException(f"Failed to fetch issuance receipts: {str(e)}") from e
+
+    async def revoke_certificates(
+        self, blockchain_ids: List[str], registry_address: Optional[str] = None
+    ) -> Dict[str, RevocationReceipt]:
+        """Revoke certificates in chunks of `revocation_batch_max_size`, sent concurrently by the admin account.
+
+        A chunk that fails is reported on each of its certificates without affecting the other chunks. The
+        contract skips certificates that are already revoked, so failed certificates can simply be sent again.
+
+        Args:
+            blockchain_ids (List[str]): The blockchain identifiers of the certificates to revoke.
+            registry_address (Optional[str]): The registry deployment that recorded them; defaults to the
+                configured one.
+        Returns:
+            Dict[str, RevocationReceipt]: The outcome of every certificate, keyed by blockchain identifier.
+        """
+        receipts: Dict[str, RevocationReceipt] = {}
+        valid_ids: List[str] = []
+        for blockchain_id in dict.fromkeys(blockchain_ids):
+            if blockchain_id.isdigit():
+                valid_ids.append(blockchain_id)
+            else:
+                receipts[blockchain_id] = RevocationReceipt(
+                    blockchain_id=blockchain_id, revoked=False, error="Invalid blockchain identifier."
+                )
+
+        binding = self.binding if registry_address is None else self.contracts.bind(registry_address)
+        size = self.config.revocation_batch_max_size
+        chunks = [valid_ids[start : start + size] for start in range(0, len(valid_ids), size)]
+        results = await asyncio.gather(
+            *(self._revoke_chunk(binding, chunk) for chunk in chunks), return_exceptions=True
+        )
+        for chunk, result in zip(chunks, results):
+            if isinstance(result, BaseException):
+                error = str(result) or type(result).__name__
+                receipts.update(
+                    {
+                        blockchain_id: RevocationReceipt(blockchain_id=blockchain_id, revoked=False, error=error)
+                        for blockchain_id in chunk
+                    }
+                )
+            else:
+                receipts.update(result)
+        return receipts
+
+    async def is_transaction_pending(self, transaction_hash: str) -> bool:
+        return not await self._was_dropped(HexBytes(transaction_hash))
+
+    async def replace_transaction(self, transaction_hash: str) -> Optional[str]:
+        """Resend a stalled transaction with the fees bumped by the fee strategy, under the same nonce.
+
+        Args:
+            transaction_hash (str): The hash of the pending transaction.
+        Returns:
+            Optional[str]: The hash of the replacement transaction, or None if the transaction is no longer
+                pending, was not signed by the pool or its fees cannot be raised any further.
+        """
+        try:
+            try:
+                transaction = await self.web3_client.eth.get_transaction(HexBytes(transaction_hash))
+            except TransactionNotFound:
+                return None
+            signer = self.signer_pool.find(transaction["from"])
+            if transaction.get("blockNumber") is not None or signer is None:
+                return None
+
+            fee_fields = await self.fee_strategy.replacement_fields(transaction)
+            if fee_fields is None:
+                return None
+
+            replacement: TxParams = {
+                "from": transaction["from"],
+                "to": transaction["to"],
+                "data": transaction["input"],
+                "value": transaction["value"],
+                "gas": transaction["gas"],
+                "nonce": transaction["nonce"],
+                "chainId": transaction["chainId"],
+            }
+            replacement.update(fee_fields)
+            signed_txn: SignedTransaction = signer.sign_transaction(cast(Dict[str, Any], replacement))
+            try:
+                return Web3.to_hex(await self.web3_client.eth.send_raw_transaction(signed_txn.raw_transaction))
+            except Exception as e:
+                if _is_nonce_error(e):
+                    # The original was mined meanwhile, or the node wants a larger bump: keep waiting for it
+                    return None
+                raise
+        except DomainException:
+            raise
+        except Exception as e:
+            raise DomainException(f"Failed to replace transaction {transaction_hash}: {str(e)}") from e
+
+    async def count_certificates(self) -> int:
+        if self.contract is None:
+            raise DomainException("Blockchain contract is not initialized.")
+        try:
+            next_id: int = await self.contract.functions.nextId().call()
+            return next_id - 1
+        except Exception as e:
+            raise DomainException(f"Failed to count certificates: {str(e)}") from e
+
+    async def read_certificates(self, first_id: int, last_id: int) -> AsyncIterator[List[RegistryCertificate]]:
+        """Read a range of certificates with `getCertificates`, `bulk_read_page_size` certificates per call.
+
+        Up to `bulk_read_concurrency` pages are requested ahead of the consumer, and pages are yielded in
+        identifier order as soon as the next one arrives, so memory stays bounded by the read-ahead window.
+
+        Args:
+            first_id (int): The identifier of the first certificate to read.
+            last_id (int): The identifier of the last certificate to read, inclusive.
+        Returns:
+            AsyncIterator[List[RegistryCertificate]]: Consecutive pages of certificates, in identifier order.
+        """
+        page_size = self.config.bulk_read_page_size
+        starts = iter(range(max(first_id, 1), last_id + 1, page_size))
+        pending: Deque["asyncio.Task[List[RegistryCertificate]]"] = deque()
+
+        def read_ahead() -> None:
+            start = next(starts, None)
+            if start is not None:
+                pending.append(asyncio.ensure_future(self._read_page(start, min(page_size, last_id - start + 1))))
+
+        try:
+            for _ in range(self.config.bulk_read_concurrency):
+                read_ahead()
+            while pending:
+                page = await pending.popleft()
+                if not page:
+                    break  # Past the last issued certificate, so are the following pages
+                read_ahead()
+                yield page
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _read_page(self, first_id: int, count: int) -> List[RegistryCertificate]:
+        if self.contract is None or self.registry is None:
+            raise DomainException("Blockchain contract is not initialized.")
+        try:
+            certificates = await self.contract.functions.getCertificates(first_id, count).call()
+        except Exception as e:
+            raise DomainException(f"Failed to read certificates {first_id} to {first_id + count - 1}: {str(e)}") from e
+        return [
+            RegistryCertificate(
+                blockchain_id=str(certificate_id),
+                data_hash=self.registry.decode_hash(data_hash),
+                issuer=issuer,
+                owner=owner,
+                issued_at=timestamp,
+                revoked=revoked,
+            )
+            for certificate_id, issuer, owner, data_hash, timestamp, revoked in certificates
+        ]
+
+    async def _revoke_chunk(self, binding: ContractBinding, blockchain_ids: List[str]) -> Dict[str, RevocationReceipt]:
+        """Revoke a chunk of certificates in a single transaction signed by the admin account.
+
+        Args:
+            binding (ContractBinding): The registry deployment that recorded the certificates.
+            blockchain_ids (List[str]): The blockchain identifiers of the certificates, all numeric.
+        Returns:
+            Dict[str, RevocationReceipt]: The outcome of every certificate in the chunk.
+        """
+        try:
+            contract_function = binding.contract.functions.revokeCertificates(
+                [int(blockchain_id) for blockchain_id in blockchain_ids]
+            )
+            receipt = await self._transact(contract_function, self.signer_pool.admin)
+            transaction_hash = receipt["transactionHash"].to_0x_hex()
+            if receipt["status"] != 1:
+                raise DomainException(f"Revocation transaction {transaction_hash} failed on the blockchain.")
+
+            revoked = {str(args["id"]) for args in binding.decode_receipt(receipt, "CertificateRevoked")}
+            # The contract skips certificates it does not know and those revoked earlier: tell them apart
+            skipped = [blockchain_id for blockchain_id in blockchain_ids if blockchain_id not in revoked]
+            skipped_states = await asyncio.gather(
+                *(self._is_revoked(binding, blockchain_id) for blockchain_id in skipped)
+            )
+        except DomainException:
+            raise
+        except Exception as e:
+            raise DomainException(f"Failed to revoke certificates: {str(e)}") from e
+
+        receipts = {
+            blockchain_id: RevocationReceipt(
+                blockchain_id=blockchain_id, revoked=True, transaction_hash=transaction_hash
+            )
+            for blockchain_id in revoked
+        }
+        for blockchain_id, revoked_before in zip(skipped, skipped_states):
+            receipts[blockchain_id] = RevocationReceipt(
+                blockchain_id=blockchain_id,
+                revoked=bool(revoked_before),
+                error=None if revoked_before else "Certificate does not exist on the blockchain.",
+            )
+        return receipts
+
+    async def _is_revoked(self, binding: ContractBinding, blockchain_id: str) -> Optional[bool]:
+        """Read the revoked flag of a certificate from the node that mined the revocation.
+
+        Returns:
+            Optional[bool]: The flag, or None if the contract does not know the certificate.
+        """
+        try:
+            with pinned_reads():
+                certificate = await binding.contract.functions.getCertificate(int(blockchain_id)).call()
+        except ContractLogicError:
+            return None
+        return bool(certificate[5])
+
+    def _issuance_call(self, certificates: List[Tuple[str, str]]) -> AsyncContractFunction:
+        if self.contract is None or self.registry is None:
+            raise DomainException("Blockchain contract is not initialized.")
+
+        owners = [Web3.to_checksum_address(certifier_address) for _, certifier_address in certificates]
+        hashes = [self.registry.encode_hash(certificate_hash) for certificate_hash, _ in certificates]
+        if len(certificates) == 1:
+            return self.contract.functions.issueCertificate(owners[0], hashes[0])
+        return self.contract.functions.issueCertificates(owners, hashes)
+
+    def _issued_certificates(self, receipt: TxReceipt) -> List[Tuple[str, str]]:
+        """Extract the CertificateIssued events from a receipt, one per issued certificate, followed by the
+        CertificateAlreadyIssued events of the hashes a batch skipped because they were issued before.
+
+        Args:
+            receipt (TxReceipt): The receipt of an issuance transaction.
+        Returns:
+            List[Tuple[str, str]]: Pairs of data hash and blockchain ID, in emission order for each event.
+        """
+        if self.contract is None or self.registry is None:
+            raise DomainException("Blockchain contract is not initialized.")
+
+        issued: List[Tuple[str, str]] = []
+        for args in self.binding.decode_receipt(receipt, "CertificateIssued") + self.binding.decode_receipt(
+            receipt, "CertificateAlreadyIssued"
+        ):
+            certificate_id = args.get("id")
+            if certificate_id is None:
+                raise DomainException("Certificate ID not found in the event arguments.")
+            issued.append((self.registry.decode_hash(args.get("dataHash")), str(certificate_id)))
+        return issued
+
+    def _anchored_epochs(self, receipt: TxReceipt) -> Dict[str, str]:
+        """Extract the RootAnchored events from a receipt.
+
+        Args:
+            receipt (TxReceipt): The receipt of an anchoring transaction.
+        Returns:
+            Dict[str, str]: Epoch IDs keyed by hex encoded Merkle root (always empty in registry mode).
+        """
+        if self.contract is None:
+            raise DomainException("Blockchain contract is not initialized.")
+        if self.config.anchoring_mode != "merkle":
+            return {}  # Registry deployments may predate the anchoring events in the ABI
+
+        return {
+            Web3.to_hex(args["root"]): str(args["epochId"])
+            for args in self.binding.decode_receipt(receipt, "RootAnchored")
+        }
+
+    async def _transact(self, contract_function: AsyncContractFunction, signer: LocalAccount) -> TxReceipt:
+        """Send a contract call and wait for its receipt, resending it if the node drops the transaction.
+
+        Args:
+            contract_function (AsyncContractFunction): The contract call to be sent.
+            signer (LocalAccount): The account that signs the transaction.
+        Returns:
+            TxReceipt: The receipt of the mined transaction.
+        """
+        for attempt in range(1, MAX_SEND_ATTEMPTS + 1):
+            tx_hashes = [await self._send(contract_function, signer)]
+            receipt = await self._wait_for_receipt(tx_hashes)
+            if receipt is not None:
+                return receipt
+            if not await self._was_dropped(tx_hashes[-1]) or attempt == MAX_SEND_ATTEMPTS:
+                raise DomainException(
+                    f"Transaction {tx_hashes[-1].to_0x_hex()} was not mined within "
+                    f"{self.config.transaction_timeout_seconds} seconds."
+                )
+            # The node forgot the transaction, so its nonce is free again: resend with a fresh nonce
+            self.nonce_manager.resync(signer.address)
+
+        raise DomainException("Failed to send the transaction to the blockchain.")
+
+    async def _wait_for_receipt(self, tx_hashes: List[HexBytes]) -> Optional[TxReceipt]:
+        """Wait for one of the transactions sharing a nonce to be mined, replacing the latest one with higher
+        fees every time it stalls for `replacement_after_seconds`.
+
+        Args:
+            tx_hashes (List[HexBytes]): The hash of the sent transaction; replacements are appended to it.
+        Returns:
+            Optional[TxReceipt]: The receipt of the mined transaction, or None after `transaction_timeout_seconds`.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.config.transaction_timeout_seconds
+        replace_at = loop.time() + self.config.replacement_after_seconds
+        while True:
+            for tx_hash in reversed(tx_hashes):
+                try:
+                    return await self.web3_client.eth.get_transaction_receipt(tx_hash)
+                except TransactionNotFound:
+                    pass
+
+            now = loop.time()
+            if now >= deadline:
+                return None
+            if now >= replace_at:
+                replacement = await self.replace_transaction(tx_hashes[-1].to_0x_hex())
+                if replacement is not None:
+                    tx_hashes.append(HexBytes(replacement))
+                replace_at = now + self.config.replacement_after_seconds
+            await asyncio.sleep(RECEIPT_POLL_SECONDS)
+
+    async def _send(self, contract_function: AsyncContractFunction, signer: LocalAccount) -> HexBytes:
+        """Sign and send a contract call with a locally allocated nonce, priced by the fee strategy.
+
+        Args:
+            contract_function (AsyncContractFunction): The contract call to be sent.
+            signer (LocalAccount): The account that signs the transaction.
+        Returns:
+            HexBytes: The hash of the transaction accepted by the node.
+        """
+        fee_fields = await self.fee_strategy.transaction_fields(contract_function, signer.address)
+
+        for attempt in range(1, MAX_SEND_ATTEMPTS + 1):
+            signed_txn = await self._sign(contract_function, signer, fee_fields)
+            try:
+                return await self._broadcast(signed_txn.raw_transaction, signer)
+            except Exception as e:
+                if not _is_nonce_error(e) or attempt == MAX_SEND_ATTEMPTS:
+                    raise
+
+        raise DomainException("Failed to send the transaction to the blockchain.")
+
+    async def _sign(
+        self, contract_function: AsyncContractFunction, signer: LocalAccount, fee_fields: TxParams
+    ) -> SignedTransaction:
+        """Build and sign a contract call under the next nonce of the signer.
+
+        Args:
+            contract_function (AsyncContractFunction): The contract call to be signed.
+            signer (LocalAccount): The account that signs the transaction.
+            fee_fields (TxParams): The gas limit and fees given by the fee strategy.
+        Returns:
+            SignedTransaction: The signed transaction, not sent yet.
+        """
+        nonce = await self.nonce_manager.allocate(signer.address)
+        try:
+            params: TxParams = {"from": signer.address, "nonce": Nonce(nonce)}
+            params.update(fee_fields)
+            txn = await contract_function.build_transaction(params)
+            return signer.sign_transaction(cast(Dict[str, Any], txn))
+        except Exception:
+            # Nothing left the process, so the nonce can be handed out again
+            self.nonce_manager.release(signer.address, nonce)
+            raise
+
+    async def _prepare(self, contract_function: AsyncContractFunction) -> PreparedTransaction:
+        with self.signer_pool.acquire() as signer:
+            fee_fields = await self.fee_strategy.transaction_fields(contract_function, signer.address)
+            signed_txn = await self._sign(contract_function, signer, fee_fields)
+        return PreparedTransaction(
+            transaction_hash=signed_txn.hash.to_0x_hex(),
+            raw_transaction=signed_txn.raw_transaction.to_0x_hex(),
+            sender=signer.address,
+        )
+
+    async def _broadcast(self, raw_transaction: bytes, signer: LocalAccount) -> HexBytes:
+        """Send a signed transaction to the node.
+
+        The nonce of a failed send is never handed out again: a timeout or a dropped connection does not
+        tell whether the node accepted the transaction, so the next nonce is read from the node instead.
+
+        Args:
+            raw_transaction (bytes): The transaction signed by `_sign`.
+            signer (LocalAccount): The account that signed the transaction.
+        Returns:
+            HexBytes: The hash of the transaction accepted by the node.
+        """
+        try:
+            return await self.web3_client.eth.send_raw_transaction(raw_transaction)
+        except Exception:
+            # A nonce error means another process used this account, or the node lost transactions; any other
+            # failure may have happened after the node took the transaction: start over from its view either way
+            self.nonce_manager.resync(signer.address)
+            raise
+
+    async def _was_dropped(self, tx_hash: HexBytes) -> bool:
+        try:
+            await self.web3_client.eth.get_transaction(tx_hash)
+        except TransactionNotFound:
+            return True
+        return False
+
+    async def hash_data(self, data: Mapping[str, Any], encoding: CanonicalEncoding = CanonicalEncoding.LEGACY) -> str:
+        """Generate the keccak256 hash of the canonical encoding of the given mapping data.
+
+        Args:
+            data (Mapping[str, Any]): The data to be hashed.
+            encoding (CanonicalEncoding): The canonical encoding the data is serialized with before hashing.
+        Returns:
+            str: The generated hash of the data.
+        """
+        try:
+            return CanonicalEncoder.hash(data, encoding)
+        except Exception as e:
+            raise DomainException(f"Failed to hash data: {str(e)}") from e
+
+    async def verify_signature(self, certificate_hash: str, signature: str, address: str) -> None:
+        """Verify the digital signature of the certificate hash.
+
+        Args:
+            certificate_hash (str): The original certificate hash that was signed (keccak256 hash).
+            signature (str): The digital signature to verify (in hex format).
+            address (str): The public key used for verification (string address).
+        """
+        try:
+            checksum_address = Web3.to_checksum_address(address)
+        except Exception as e:
+            raise DomainException(f"Failed to verify signature: {str(e)}") from e
+
+        recovered_address, error = await self.signature_verifier.recover(certificate_hash, signature)
+        if error is not None:
+            raise DomainException(f"Failed to verify signature: {error}")
+        if recovered_address != checksum_address:
+            raise DomainException("Invalid signature: recovered address does not match the provided address.")
+
+    async def verify_signatures(self, checks: List[SignatureCheck]) -> AsyncIterator[SignatureVerification]:
+        """Verify a batch of signatures, recovering the signers in the verifier's worker processes.
+
+        Args:
+            checks (List[SignatureCheck]): The signatures to verify.
+        Returns:
+            AsyncIterator[SignatureVerification]: The outcome of every check, as soon as it is known.
+        """
+        messages = [(check.message_hash, check.signature) for check in checks]
+        async for index, (recovered_address, error) in self.signature_verifier.recover_many(messages):
+            check = checks[index]
+            try:
+                expected_address = Web3.to_checksum_address(check.address)
+            except Exception as e:
+                expected_address, error = None, error or f"Invalid address: {str(e)}"
+            yield SignatureVerification(
+                key=check.key,
+                valid=error is None and recovered_address == expected_address,
+                recovered_address=recovered_address,
+                error=error,
+            )
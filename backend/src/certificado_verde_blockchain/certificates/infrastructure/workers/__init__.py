@@ -0,0 +1,3 @@
+from .issuance_worker_pool import IssuanceWorkerPool
+
+__all__ = ["IssuanceWorkerPool"]
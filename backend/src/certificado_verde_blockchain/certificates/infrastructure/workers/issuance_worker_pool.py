@@ -0,0 +1,73 @@
+import asyncio
+from typing import List, Optional
+
+from miraveja_di import DIContainer
+from sqlalchemy.ext.asyncio import AsyncSession as DatabaseSession
+
+from miraveja_log import IAsyncLogger
+
+from ....configuration import BlockchainConfig
+from ...application import ProcessIssuanceTasksHandler
+
+
+class IssuanceWorkerPool:
+    """Background workers that drain the issuance outbox.
+
+    Each worker loops over `ProcessIssuanceTasksHandler`, submitting pending certificates and confirming
+    submitted transactions. Every iteration runs in its own DI scope so it gets a dedicated database
+    session, and workers in this or other processes never claim the same outbox rows.
+    """
+
+    def __init__(self, container: DIContainer, config: BlockchainConfig, logger: IAsyncLogger) -> None:
+        self._container = container
+        self._config = config
+        self._logger = logger
+        self._stop_event: Optional[asyncio.Event] = None
+        self._workers: List["asyncio.Task[None]"] = []
+
+    def start(self) -> None:
+        """Start the configured number of workers on the running event loop."""
+        if self._workers:
+            return
+        self._stop_event = asyncio.Event()
+        self._workers = [
+            asyncio.create_task(self._run(index), name=f"issuance-worker-{index}")
+            for index in range(self._config.issuance_workers)
+        ]
+
+    async def stop(self) -> None:
+        """Ask the workers to stop and wait for their current iteration to finish."""
+        if self._stop_event is None:
+            return
+        self._stop_event.set()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._stop_event = None
+
+    async def _run(self, index: int) -> None:
+        assert self._stop_event is not None
+        await self._logger.info(f"Issuance worker {index} started.")
+        while not self._stop_event.is_set():
+            try:
+                processed = await self._run_once()
+            except Exception as e:
+                await self._logger.error(f"Issuance worker {index} failed: {e}")
+                processed = 0
+
+            if processed == 0:
+                try:
+                    await asyncio.wait_for(
+                        self._stop_event.wait(), timeout=self._config.issuance_poll_interval_ms / 1000
+                    )
+                except asyncio.TimeoutError:
+                    pass
+        await self._logger.info(f"Issuance worker {index} stopped.")
+
+    async def _run_once(self) -> int:
+        with self._container.create_scope() as scope:
+            database_session = scope.resolve(DatabaseSession)
+            try:
+                handler: ProcessIssuanceTasksHandler = scope.resolve(ProcessIssuanceTasksHandler)
+                return await handler.submit_pending() + await handler.confirm_submitted()
+            finally:
+                await database_session.close()
@@ -1,6 +1,7 @@
 from .app_config import AppConfig
 from .blockchain_config import BlockchainConfig
 from .database_config import DatabaseConfig
+from .indexer_config import IndexerConfig
 from .qr_code_config import QRCodeConfig
 from .storage_config import StorageConfig
 
@@ -8,6 +9,7 @@ __all__ = [
     "AppConfig",
     "DatabaseConfig",
     "BlockchainConfig",
+    "IndexerConfig",
     "StorageConfig",
     "QRCodeConfig",
 ]
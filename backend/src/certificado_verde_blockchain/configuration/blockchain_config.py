@@ -1,13 +1,179 @@
-from typing import Annotated
+from typing import Annotated, Any, Dict, List, Literal
 
-from pydantic import Field
+from pydantic import Field, field_validator
 
 from .base import BaseConfig
 
 
 class BlockchainConfig(BaseConfig):
-    contract: Annotated[str, Field(description="The blockchain contract address")]
+    backend: Annotated[
+        Literal["node", "in_process"],
+        Field(
+            description="Talk to the configured nodes, or to an in-process EVM (eth-tester) where the contract "
+            "is deployed at startup from the artifact at abi_path"
+        ),
+    ] = "node"
+    contract: Annotated[str, Field(description="The blockchain contract address (ignored by the in-process backend)")]
     abi_path: Annotated[str, Field(description="The file path to the contract ABI")]
-    provider_url: Annotated[str, Field(description="The URL of the blockchain provider")]
+    previous_contracts: Annotated[
+        List[str],
+        Field(
+            description="Comma separated address=abi_path of earlier registry deployments still holding certificates "
+            "to read and revoke"
+        ),
+    ] = []
+    provider_url: Annotated[str, Field(description="The URL of the blockchain provider, preferred for transactions")]
+    provider_urls: Annotated[
+        List[str],
+        Field(description="Comma separated URLs of extra providers of the same chain, for reads and failover"),
+    ] = []
     private_key: Annotated[str, Field(description="The private key for blockchain transactions")]
     admin_address: Annotated[str, Field(description="The admin address for blockchain transactions")]
+    signer_private_keys: Annotated[
+        List[str],
+        Field(description="Comma separated private keys of extra signers authorized as issuers in the contract"),
+    ] = []
+    issuance_batch_max_size: Annotated[
+        int, Field(description="Maximum number of certificates issued in a single transaction", ge=1)
+    ] = 25
+    issuance_workers: Annotated[
+        int, Field(description="Number of background workers processing the issuance outbox (0 disables them)", ge=0)
+    ] = 2
+    issuance_poll_interval_ms: Annotated[
+        int, Field(description="Milliseconds an idle issuance worker waits before polling the outbox again", ge=1)
+    ] = 1000
+    issuance_max_attempts: Annotated[
+        int, Field(description="Maximum number of transactions sent for a certificate before its issuance fails", ge=1)
+    ] = 5
+    issuance_lease_seconds: Annotated[
+        int, Field(description="Seconds an outbox entry stays reserved for the worker that claimed it", ge=1)
+    ] = 60
+    anchoring_mode: Annotated[
+        Literal["registry", "merkle"],
+        Field(description="Record each certificate in the registry, or only the Merkle root of epochs of certificates"),
+    ] = "registry"
+    anchoring_epoch_max_size: Annotated[
+        int, Field(description="Maximum number of certificates gathered into one anchored Merkle epoch", ge=1)
+    ] = 1024
+    anchoring_flush_interval_ms: Annotated[
+        int,
+        Field(description="Milliseconds a certificate waits for its epoch to fill before the epoch is anchored", ge=0),
+    ] = 60000
+    revocation_batch_max_size: Annotated[
+        int,
+        Field(description="Maximum number of certificates revoked in a single transaction (about 26k gas each)", ge=1),
+    ] = 200
+    bulk_read_page_size: Annotated[
+        int, Field(description="Number of certificates read from the contract in a single call", ge=1)
+    ] = 500
+    bulk_read_concurrency: Annotated[
+        int, Field(description="Maximum number of certificate pages read from the contract at the same time", ge=1)
+    ] = 8
+    http_pool_size: Annotated[
+        int, Field(description="Maximum number of simultaneous HTTP connections to the blockchain provider", ge=1)
+    ] = 20
+    http_keepalive_seconds: Annotated[
+        float, Field(description="Seconds an idle HTTP connection to the blockchain provider is kept open", ge=0)
+    ] = 30
+    http_timeout_seconds: Annotated[
+        float, Field(description="Timeout in seconds for a single JSON-RPC request to the blockchain provider", gt=0)
+    ] = 30
+    provider_health_interval_seconds: Annotated[
+        float, Field(description="Seconds between two health checks of the blockchain providers", gt=0)
+    ] = 5
+    provider_max_block_lag: Annotated[
+        int, Field(description="Blocks a provider may lag behind the others and still serve reads", ge=0)
+    ] = 3
+    provider_hedge_delay_ms: Annotated[
+        float,
+        Field(
+            description="Milliseconds before a latency-critical read is also sent to a second provider (0: never)", ge=0
+        ),
+    ] = 200
+    rpc_batch_window_ms: Annotated[
+        float, Field(description="Milliseconds a JSON-RPC request waits for concurrent ones to share a batch", ge=0)
+    ] = 0
+    rpc_batch_max_size: Annotated[
+        int, Field(description="Maximum number of JSON-RPC requests in a batch (1 disables batching)", ge=1)
+    ] = 100
+    rpc_cache_size: Annotated[
+        int, Field(description="Maximum number of immutable JSON-RPC responses cached (0 disables the cache)", ge=0)
+    ] = 10000
+    rpc_cache_confirmations: Annotated[
+        int, Field(description="Blocks a JSON-RPC response must be below the head to be cached", ge=0)
+    ] = 12
+    transaction_timeout_seconds: Annotated[
+        int, Field(description="Seconds to wait for a transaction receipt before checking if it was dropped", ge=1)
+    ] = 120
+    replacement_after_seconds: Annotated[
+        int, Field(description="Seconds a transaction may wait unmined before it is resent with higher fees", ge=1)
+    ] = 30
+
+    gas_limit_margin: Annotated[
+        float, Field(description="Multiplier applied to the estimated gas of a contract call", ge=1)
+    ] = 1.2
+    fee_history_blocks: Annotated[
+        int, Field(description="Number of recent blocks sampled with eth_feeHistory to price transactions", ge=1)
+    ] = 20
+    fee_priority_percentile: Annotated[
+        float, Field(description="Percentile of the priority fees paid in recent blocks used as tip", ge=0, le=100)
+    ] = 50
+    fee_cache_ms: Annotated[
+        int, Field(description="Milliseconds the sampled fee history is reused before it is fetched again", ge=0)
+    ] = 2000
+    base_fee_multiplier: Annotated[
+        float, Field(description="Multiplier of the next base fee kept as headroom in maxFeePerGas", ge=1)
+    ] = 2
+    min_priority_fee_gwei: Annotated[
+        float, Field(description="Lowest priority fee (tip) offered, in gwei, when recent blocks paid less", ge=0)
+    ] = 0.01
+    max_fee_per_gas_gwei: Annotated[
+        float, Field(description="Highest maxFeePerGas, in gwei, a transaction or its replacement may offer", gt=0)
+    ] = 500
+    fee_bump_percent: Annotated[
+        int, Field(description="Minimum fee increase, in percent, of a replacement transaction", ge=10)
+    ] = 15
+
+    signature_workers: Annotated[
+        int, Field(description="Worker processes used to verify signatures in batches (0 uses every core)", ge=0)
+    ] = 0
+    signature_cache_size: Annotated[
+        int, Field(description="Number of recovered signatures kept in memory (0 disables the cache)", ge=0)
+    ] = 100000
+    signature_chunk_size: Annotated[
+        int, Field(description="Number of signatures sent to a worker process at a time", ge=1)
+    ] = 128
+
+    @field_validator("signer_private_keys", "provider_urls", "previous_contracts", mode="before")
+    @classmethod
+    def split_comma_separated(cls, value: Any) -> Any:
+        if isinstance(value, str):
+            return [item.strip() for item in value.split(",") if item.strip()]
+        return value
+
+    @field_validator("previous_contracts")
+    @classmethod
+    def check_previous_contracts(cls, value: List[str]) -> List[str]:
+        for item in value:
+            address, _, abi_path = item.partition("=")
+            if not address.strip() or not abi_path.strip():
+                raise ValueError(f"Expected address=abi_path, got {item!r}")
+        return value
+
+    @property
+    def previous_deployments(self) -> Dict[str, str]:
+        """The ABI path of every earlier registry deployment, keyed by address."""
+        return {
+            address.strip(): abi_path.strip()
+            for address, _, abi_path in (item.partition("=") for item in self.previous_contracts)
+        }
+
+    @property
+    def all_private_keys(self) -> List[str]:
+        """The admin private key followed by the extra signer keys, without duplicates."""
+        return list(dict.fromkeys([self.private_key, *self.signer_private_keys]))
+
+    @property
+    def all_provider_urls(self) -> List[str]:
+        """The main provider URL followed by the extra provider URLs, without duplicates."""
+        return list(dict.fromkeys([self.provider_url, *self.provider_urls]))
@@ -1,6 +1,6 @@
-from typing import Annotated
+from typing import Annotated, Any, Dict, List
 
-from pydantic import Field
+from pydantic import Field, field_validator
 
 from .base import BaseConfig
 
@@ -14,9 +14,81 @@ class DatabaseConfig(BaseConfig):
     username: Annotated[str, Field(description="Username for database authentication")] = "user"
     password: Annotated[str, Field(description="Password for database authentication")] = "password"
     name: Annotated[str, Field(description="Name of the database to connect to")] = "certificado_verde_db"
-    max_connections: Annotated[int, Field(description="Maximum number of database connections", ge=1)] = 10
+    max_connections: Annotated[
+        int, Field(description="Connections kept open in the pool of each database (primary and replicas)", ge=1)
+    ] = 10
+    max_overflow: Annotated[
+        int, Field(description="Extra connections opened beyond the pool under load, closed once returned", ge=0)
+    ] = 10
+    pool_timeout_seconds: Annotated[
+        float, Field(description="Seconds to wait for a free connection before failing the request", gt=0)
+    ] = 30
+    pool_recycle_seconds: Annotated[
+        int, Field(description="Age in seconds after which a connection is replaced on checkout (-1: never)", ge=-1)
+    ] = 1800
+    pool_pre_ping: Annotated[
+        bool, Field(description="Test connections on checkout, replacing the ones closed by the server")
+    ] = True
+    connect_timeout_seconds: Annotated[float, Field(description="Seconds to wait for a new connection", gt=0)] = 10
+    statement_timeout_ms: Annotated[
+        int, Field(description="Milliseconds after which the server cancels a statement (0: no limit)", ge=0)
+    ] = 0
+    replica_urls: Annotated[
+        List[str],
+        Field(description="Comma separated URLs of read replicas of the database, serving the reads of GET requests"),
+    ] = []
+    replica_max_lag_seconds: Annotated[
+        float, Field(description="Replication lag above which a replica stops serving reads", gt=0)
+    ] = 5
+    replica_health_interval_seconds: Annotated[
+        float, Field(description="Seconds between two replication lag checks of the replicas", gt=0)
+    ] = 5
+
+    @field_validator("replica_urls", mode="before")
+    @classmethod
+    def split_comma_separated(cls, value: Any) -> Any:
+        if isinstance(value, str):
+            return [item.strip() for item in value.split(",") if item.strip()]
+        return value
 
     @property
     def database_url(self) -> str:
         """Construct the database connection URL."""
         return f"{self.db_type}://{self.username}:{self.password}@" f"{self.host}:{self.port}/{self.name}"
+
+    @property
+    def async_database_url(self) -> str:
+        """Construct the connection URL of the asyncpg driver, used by the application (Alembic uses `database_url`)."""
+        dialect = self.db_type.split("+", maxsplit=1)[0]
+        return f"{dialect}+asyncpg://{self.username}:{self.password}@{self.host}:{self.port}/{self.name}"
+
+    @property
+    def async_replica_urls(self) -> List[str]:
+        """The replica URLs with the asyncpg driver, whatever driver they were configured with."""
+        replica_urls: List[str] = []
+        for url in self.replica_urls:
+            scheme, address = url.split("://", 1)
+            replica_urls.append(f"{scheme.split('+')[0]}+asyncpg://{address}")
+        return replica_urls
+
+    @property
+    def read_your_writes_seconds(self) -> float:
+        """Seconds the reads of a client stay on the primary after it wrote.
+
+        A replica serves reads only while its lag, checked every health interval, is below the maximum, so
+        past this delay any replica serving reads has replayed the write.
+        """
+        return self.replica_max_lag_seconds + self.replica_health_interval_seconds
+
+    @property
+    def engine_options(self) -> Dict[str, Any]:
+        """Keyword arguments of `create_async_engine` for the pool and timeout settings."""
+        server_settings = {"statement_timeout": str(self.statement_timeout_ms)} if self.statement_timeout_ms else {}
+        return {
+            "pool_size": self.max_connections,
+            "max_overflow": self.max_overflow,
+            "pool_timeout": self.pool_timeout_seconds,
+            "pool_recycle": self.pool_recycle_seconds,
+            "pool_pre_ping": self.pool_pre_ping,
+            "connect_args": {"timeout": self.connect_timeout_seconds, "server_settings": server_settings},
+        }
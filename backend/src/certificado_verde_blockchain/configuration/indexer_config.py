@@ -0,0 +1,32 @@
+from typing import Annotated, Optional
+
+from pydantic import Field
+
+from .base import BaseConfig
+
+
+class IndexerConfig(BaseConfig):
+    """Configuration settings for the chain event indexer."""
+
+    enabled: Annotated[bool, Field(description="Whether the chain event indexer runs with the application")] = False
+    start_block: Annotated[
+        int, Field(description="Block where indexing starts (the contract deployment block)", ge=0)
+    ] = 0
+    confirmations: Annotated[
+        int, Field(description="Blocks behind the chain head an event must be before it is indexed", ge=0)
+    ] = 6
+    max_block_range: Annotated[
+        int, Field(description="Largest block range requested in one eth_getLogs call", ge=1)
+    ] = 5000
+    backfill_concurrency: Annotated[
+        int, Field(description="Number of block ranges fetched in parallel while catching up", ge=1)
+    ] = 4
+    poll_interval_ms: Annotated[
+        int, Field(description="Milliseconds between polls for new blocks once the indexer is caught up", ge=1)
+    ] = 2000
+    reorg_lookback_blocks: Annotated[
+        int, Field(description="How many indexed blocks are checked when searching for a reorg fork point", ge=1)
+    ] = 128
+    websocket_url: Annotated[
+        Optional[str], Field(description="WebSocket endpoint used to wake the indexer on new blocks instead of polling")
+    ] = None
@@ -11,19 +11,39 @@ from miraveja_auth import (
 from miraveja_auth.domain import IClaimsParser
 from miraveja_auth.infrastructure.providers import KeycloakClaimsParser
 from miraveja_di import DIContainer
-from sqlalchemy import create_engine
-from sqlalchemy.engine import Engine as DatabaseEngine
-from sqlalchemy.orm import Session as DatabaseSession
-from sqlalchemy.orm import sessionmaker
-from web3 import Web3
+from sqlalchemy.ext.asyncio import AsyncEngine as DatabaseEngine
+from sqlalchemy.ext.asyncio import AsyncSession as DatabaseSession
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from web3 import AsyncWeb3
+from web3.manager import RequestManager
+from web3.providers.async_base import AsyncBaseProvider
 
 from miraveja_log import IAsyncLogger, ILogger, LoggerConfig, LoggerFactory
 from miraveja_log.infrastructure import AsyncPythonLoggerAdapter, PythonLoggerAdapter
 
-from .configuration import AppConfig, BlockchainConfig, DatabaseConfig, QRCodeConfig, StorageConfig
+from .configuration import AppConfig, BlockchainConfig, DatabaseConfig, IndexerConfig, QRCodeConfig, StorageConfig
+from .shared.domain import IUnitOfWork
+from .shared.sql import DatabaseRouter, RoutingSession, SqlUnitOfWork
+from .shared.web3 import InProcessChain, RequestBatchingMiddleware, ResponseCacheMiddleware, RoutingAsyncProvider
 
 
 class AppDependencies:
+    @staticmethod
+    def _blockchain_provider(container: DIContainer) -> AsyncBaseProvider:
+        config = container.resolve(BlockchainConfig)
+        if config.backend == "in_process":
+            chain: InProcessChain = container.resolve(InProcessChain)
+            return chain.provider
+        return RoutingAsyncProvider.from_urls(
+            config.all_provider_urls,
+            pool_size=config.http_pool_size,
+            keepalive_seconds=config.http_keepalive_seconds,
+            timeout_seconds=config.http_timeout_seconds,
+            health_interval_seconds=config.provider_health_interval_seconds,
+            max_block_lag=config.provider_max_block_lag,
+            hedge_delay_ms=config.provider_hedge_delay_ms,
+        )
+
     @staticmethod
     def register_dependencies(container: DIContainer) -> None:
         container.register_singletons(
@@ -48,10 +68,33 @@ class AppDependencies:
                 IOAuth2Provider: lambda container: container.resolve(OAuth2Provider),
                 # Database
                 DatabaseConfig: lambda container: DatabaseConfig.from_env(),
-                DatabaseEngine: lambda container: create_engine(container.resolve(DatabaseConfig).database_url),
+                DatabaseRouter: lambda container: DatabaseRouter.from_config(container.resolve(DatabaseConfig)),
+                DatabaseEngine: lambda container: container.resolve(DatabaseRouter).primary,
                 # Blockchain
                 BlockchainConfig: lambda container: BlockchainConfig.from_env(),
-                Web3: lambda container: Web3(Web3.HTTPProvider(container.resolve(BlockchainConfig).provider_url)),
+                IndexerConfig: lambda container: IndexerConfig.from_env(),
+                InProcessChain: lambda container: InProcessChain(container.resolve(BlockchainConfig).all_private_keys),
+                AsyncWeb3: lambda container: AsyncWeb3(
+                    AppDependencies._blockchain_provider(container),
+                    # Innermost last: responses are cached before batching, batches go straight to the provider
+                    middleware=[
+                        *RequestManager.get_default_middleware(),
+                        (
+                            ResponseCacheMiddleware.build(
+                                container.resolve(BlockchainConfig).rpc_cache_size,
+                                container.resolve(BlockchainConfig).rpc_cache_confirmations,
+                            ),
+                            "response_cache",
+                        ),
+                        (
+                            RequestBatchingMiddleware.build(
+                                container.resolve(BlockchainConfig).rpc_batch_window_ms,
+                                container.resolve(BlockchainConfig).rpc_batch_max_size,
+                            ),
+                            "request_batching",
+                        ),
+                    ],
+                ),
                 # Storage
                 StorageConfig: lambda container: StorageConfig.from_env(),
                 Boto3Client: lambda container: Boto3Session().client(
@@ -73,10 +116,15 @@ class AppDependencies:
         container.register_scoped(
             {
                 # Database Session
-                DatabaseSession: lambda container: sessionmaker(
-                    bind=container.resolve(DatabaseEngine),
+                # Objects stay loaded after commit: an AsyncSession cannot lazy-load expired attributes
+                DatabaseSession: lambda container: async_sessionmaker(
+                    sync_session_class=RoutingSession,
+                    router=container.resolve(DatabaseRouter),
                     autoflush=False,
-                    autocommit=False,
+                    expire_on_commit=False,
                 )(),
+                # Unit of work of the scope, shared by the repositories of every bounded context
+                SqlUnitOfWork: lambda container: SqlUnitOfWork(container.resolve(DatabaseSession)),
+                IUnitOfWork: lambda container: container.resolve(SqlUnitOfWork),
             }
         )
@@ -1,4 +1,5 @@
-from typing import Union
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Union
 
 import dotenv
 import uvicorn
@@ -7,6 +8,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from miraveja_auth import FastAPIAuthenticator
 from miraveja_di import DIContainer
 from miraveja_di.infrastructure.fastapi_integration import ScopedContainerMiddleware
+from web3 import AsyncWeb3
 
 from miraveja_log import IAsyncLogger, ILogger
 
@@ -14,14 +16,18 @@ from .auditors_and_certifiers.infrastructure import AuditorsAndCertifiersDepende
 from .auditors_and_certifiers.infrastructure.http import AuditorsAndCertifiersRoutes
 from .certificates.infrastructure import CertificatesDependencies
 from .certificates.infrastructure.http import CertificatesRoutes
-from .configuration import AppConfig
+from .certificates.infrastructure.indexer import ChainEventIndexer
+from .certificates.infrastructure.web3 import ContractRegistry, SignatureVerifier
+from .certificates.infrastructure.workers import IssuanceWorkerPool
+from .configuration import AppConfig, DatabaseConfig
 from .dependencies import AppDependencies
 from .producers.infrastructure import ProducerDependencies
 from .producers.infrastructure.http import ProducerRoutes
 from .products.infrastructure import ProductDependencies
 from .products.infrastructure.http import ProductRoutes
 from .shared.errors import DomainException
-from .shared.middlewares import ErrorMiddleware, LoggingMiddleware
+from .shared.middlewares import DatabaseRoutingMiddleware, ErrorMiddleware, LoggingMiddleware
+from .shared.sql import DatabaseRouter
 
 # Load environment variables from a .env file
 dotenv.load_dotenv("./.env")
@@ -38,6 +44,25 @@ CertificatesDependencies.register_dependencies(container)
 
 logger: Union[ILogger, IAsyncLogger] = container.resolve(IAsyncLogger)
 
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    # Load and validate the contract ABI before serving, so a misconfigured deployment fails at startup
+    container.resolve(ContractRegistry)
+    issuance_worker_pool = container.resolve(IssuanceWorkerPool)
+    issuance_worker_pool.start()
+    chain_event_indexer = container.resolve(ChainEventIndexer)
+    chain_event_indexer.start()
+    yield
+    await chain_event_indexer.stop()
+    await issuance_worker_pool.stop()
+    container.resolve(SignatureVerifier).shutdown()
+    # Close the pooled connections to the blockchain provider
+    await container.resolve(AsyncWeb3).provider.disconnect()
+    # Close the pooled connections to the database and its replicas
+    await container.resolve(DatabaseRouter).dispose()
+
+
 # Initialize FastAPI app
 app_config: AppConfig = container.resolve(AppConfig)
 app = FastAPI(
@@ -47,6 +72,7 @@ app = FastAPI(
     debug=app_config.debug_mode,
     redirect_slashes=False,
     root_path=app_config.root_path,
+    lifespan=lifespan,
 )
 
 # Middlewares
@@ -60,6 +86,13 @@ app.add_middleware(
     logger=logger,
 )
 
+database_config: DatabaseConfig = container.resolve(DatabaseConfig)
+if database_config.replica_urls:
+    app.add_middleware(
+        DatabaseRoutingMiddleware,
+        read_your_writes_seconds=database_config.read_your_writes_seconds,
+    )
+
 app.add_middleware(
     ScopedContainerMiddleware,  # type: ignore
     container=container,
@@ -95,6 +128,13 @@ async def health_check():
     return {"status": "healthy"}
 
 
+# Connection pool and replication metrics of the database
+@api_version1_router.get("/health/database")
+async def database_health_check() -> Dict[str, Any]:
+    database_router: DatabaseRouter = container.resolve(DatabaseRouter)
+    return database_router.metrics()
+
+
 # Error raising endpoint for testing
 @api_version1_router.get("/error")
 async def raise_error():
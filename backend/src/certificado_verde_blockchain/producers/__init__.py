@@ -1,13 +1,19 @@
 from .application import (
+    ExportProducersHandler,
     FindProducerByIdHandler,
+    FindProducersByIdsHandler,
+    ImportProducersHandler,
     ListAllProducersHandler,
     RegisterProducerCommand,
     RegisterProducerHandler,
 )
 
 __all__ = [
+    "ExportProducersHandler",
+    "FindProducersByIdsHandler",
     "RegisterProducerCommand",
     "RegisterProducerHandler",
+    "ImportProducersHandler",
     "ListAllProducersHandler",
     "FindProducerByIdHandler",
 ]
@@ -1,10 +1,16 @@
+from .export_producers import ExportProducersHandler
 from .find_producer_by_id import FindProducerByIdHandler
+from .find_producers_by_ids import FindProducersByIdsHandler
+from .import_producers import ImportProducersHandler
 from .list_all_producers import ListAllProducersHandler
 from .register_producer import RegisterProducerCommand, RegisterProducerHandler
 
 __all__ = [
+    "ExportProducersHandler",
+    "FindProducersByIdsHandler",
     "FindProducerByIdHandler",
     "RegisterProducerCommand",
     "RegisterProducerHandler",
+    "ImportProducersHandler",
     "ListAllProducersHandler",
 ]
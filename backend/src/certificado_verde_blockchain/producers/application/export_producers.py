@@ -0,0 +1,30 @@
+from typing import Any, AsyncIterator, Dict
+
+from miraveja_log import IAsyncLogger
+
+from ..domain import IProducerRepository
+
+# Producers loaded from the database cursor at a time
+EXPORT_CHUNK_SIZE = 1000
+
+
+class ExportProducersHandler:
+    def __init__(self, producer_repository: IProducerRepository, logger: IAsyncLogger):
+        self._producer_repository = producer_repository
+        self._logger = logger
+
+    async def handle(self) -> AsyncIterator[Dict[str, Any]]:
+        """Handles the export of every producer, streamed from the database.
+
+        Returns:
+            AsyncIterator[Dict[str, Any]]: The producers, ordered by ID.
+        """
+        await self._logger.info("Exporting producers")
+
+        exported = 0
+        async for producers in self._producer_repository.stream(EXPORT_CHUNK_SIZE):
+            for producer in producers:
+                exported += 1
+                yield producer.model_dump()
+
+        await self._logger.info(f"Exported {exported} producers")
@@ -15,7 +15,7 @@ class FindProducerByIdHandler:
     async def handle(self, producer_id: UUID) -> Dict[str, Any]:
         await self._logger.info(f"Finding producer by ID: {producer_id}")
 
-        producer: Optional[Producer] = self._producer_repository.find_by_id(producer_id)
+        producer: Optional[Producer] = await self._producer_repository.find_by_id(producer_id)
 
         if producer:
             await self._logger.info(f"Producer found: {producer_id}")
@@ -0,0 +1,19 @@
+from typing import Any, Dict, List
+from uuid import UUID
+
+from miraveja_log import IAsyncLogger
+
+from ..domain import IProducerRepository
+
+
+class FindProducersByIdsHandler:
+    def __init__(self, producer_repository: IProducerRepository, logger: IAsyncLogger):
+        self._producer_repository = producer_repository
+        self._logger = logger
+
+    async def handle(self, producer_ids: List[UUID]) -> Dict[str, Any]:
+        await self._logger.info(f"Finding {len(producer_ids)} producers by ID")
+
+        producers = await self._producer_repository.find_by_ids(producer_ids)
+
+        return {"producers": [producer.model_dump() for producer in producers]}
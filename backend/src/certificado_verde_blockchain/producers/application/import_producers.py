@@ -0,0 +1,96 @@
+from typing import Any, AsyncIterator, Dict, List, Tuple, Union
+from uuid import UUID, uuid4
+
+from pydantic import ValidationError
+
+from miraveja_log import IAsyncLogger
+
+from ...shared.models import Document, ImportReport
+from ..domain import IProducerRepository, Producer
+from .register_producer import RegisterProducerCommand
+
+# Valid producers loaded into the database at a time
+IMPORT_BATCH_SIZE = 10_000
+
+ImportRow = Tuple[int, Union[str, Dict[str, Any]]]
+
+
+class ImportProducersHandler:
+    def __init__(self, producer_repository: IProducerRepository, logger: IAsyncLogger) -> None:
+        self._producer_repository = producer_repository
+        self._logger = logger
+
+    async def handle(self, rows: AsyncIterator[ImportRow]) -> Dict[str, Any]:
+        """Handles the registration of many producers at once, validating each row as it is read.
+
+        The valid rows are registered together, in a single transaction, and the others are reported with
+        why they were rejected. As with single registrations, a producer whose document number is already
+        registered, or appears on an earlier row of the upload, is rejected.
+
+        Args:
+            rows (AsyncIterator[ImportRow]): The line of each row in the upload, with the row as a JSON
+                document or as the fields of a `RegisterProducerCommand`.
+        Returns:
+            Dict[str, Any]: The import report, see `ImportReport`.
+        """
+        await self._logger.info("Importing producers")
+
+        report = ImportReport()
+        # Only the line and document of the staged producers are kept, to report the ones already registered
+        staged: Dict[UUID, Tuple[int, Document]] = {}
+        document_lines: Dict[str, int] = {}
+
+        async def valid_producers() -> AsyncIterator[List[Producer]]:
+            batch: List[Producer] = []
+            async for line, row in rows:
+                report.received += 1
+                try:
+                    if isinstance(row, str):
+                        command = RegisterProducerCommand.model_validate_json(row)
+                    else:
+                        command = RegisterProducerCommand.model_validate(row)
+                except ValidationError as validation_error:
+                    report.reject_invalid(line, validation_error)
+                    continue
+                if command.document.number in document_lines:
+                    report.reject(
+                        line,
+                        f"Duplicate document number, already on line {document_lines[command.document.number]}",
+                        "document.number",
+                    )
+                    continue
+                document_lines[command.document.number] = line
+
+                producer = Producer(
+                    id=uuid4(),
+                    name=command.name,
+                    document=command.document,
+                    address=command.address,
+                    car_code=command.car_code,
+                    contact=command.contact,
+                    metadata=command.metadata,
+                )
+                staged[producer.id] = (line, producer.document)
+                batch.append(producer)
+                if len(batch) == IMPORT_BATCH_SIZE:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+
+        imported_ids = set(await self._producer_repository.import_all(valid_producers()))
+        report.imported = len(imported_ids)
+        for producer_id, (line, document) in staged.items():
+            if producer_id not in imported_ids:
+                report.reject(
+                    line,
+                    f"Cannot save duplicate producer with document {document.document_type}, number {document.number}",
+                    "document.number",
+                )
+        report.rejected.sort(key=lambda row_error: row_error.line)
+
+        await self._logger.info(
+            f"Imported {report.imported} of {report.received} producers, {len(report.rejected)} rejected"
+        )
+
+        return report.model_dump()
@@ -1,8 +1,9 @@
-from typing import Any, Dict, List
+from typing import Any, Dict
 
 from miraveja_log import IAsyncLogger
 
-from ..domain import IProducerRepository, Producer
+from ...shared.models import PageRequest
+from ..domain import IProducerRepository
 
 
 class ListAllProducersHandler:
@@ -10,12 +11,11 @@ class ListAllProducersHandler:
         self._producer_repository = producer_repository
         self._logger = logger
 
-    async def handle(self) -> Dict[str, Any]:
+    async def handle(self, page: PageRequest) -> Dict[str, Any]:
+        await self._logger.info(f"Listing producers after {page.after_id}")
 
-        await self._logger.info("Listing all producers")
+        producers, next_cursor = page.page(await self._producer_repository.list_page(page.after_id, page.fetch_limit))
 
-        producers: List[Producer] = self._producer_repository.list_all()
+        await self._logger.info(f"Found {len(producers)} producers in the page")
 
-        await self._logger.info(f"Found {len(producers)} producers")
-
-        return {"producers": [producer.model_dump() for producer in producers]}
+        return {"producers": [producer.model_dump() for producer in producers], "next_cursor": next_cursor}
@@ -5,6 +5,7 @@ from pydantic import BaseModel, Field
 
 from miraveja_log import IAsyncLogger
 
+from ...shared.domain import IUnitOfWork
 from ...shared.models import ContactInfo, Document, Location
 from ..domain import IProducerRepository, Producer
 
@@ -24,8 +25,11 @@ class RegisterProducerCommand(BaseModel):
 
 
 class RegisterProducerHandler:
-    def __init__(self, producer_repository: IProducerRepository, logger: IAsyncLogger) -> None:
+    def __init__(
+        self, producer_repository: IProducerRepository, unit_of_work: IUnitOfWork, logger: IAsyncLogger
+    ) -> None:
         self._producer_repository = producer_repository
+        self._unit_of_work = unit_of_work
         self._logger = logger
 
     async def handle(self, command: RegisterProducerCommand) -> Dict[str, Any]:
@@ -41,7 +45,8 @@ class RegisterProducerHandler:
             metadata=command.metadata,
         )
 
-        self._producer_repository.save(producer)
+        await self._producer_repository.save(producer)
+        await self._unit_of_work.commit()
 
         await self._logger.info(f"Producer registered with ID: {producer.id}")
 
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 from uuid import UUID
 
 from .producer import Producer
@@ -7,13 +7,26 @@ from .producer import Producer
 
 class IProducerRepository(ABC):
     @abstractmethod
-    def list_all(self) -> List[Producer]:
+    async def list_page(self, after_id: Optional[UUID], limit: int) -> List[Producer]:
         pass
 
     @abstractmethod
-    def find_by_id(self, producer_id: UUID) -> Optional[Producer]:
+    async def find_by_id(self, producer_id: UUID) -> Optional[Producer]:
         pass
 
     @abstractmethod
-    def save(self, producer: Producer) -> None:
+    async def find_by_ids(self, producer_ids: List[UUID]) -> List[Producer]:
+        pass
+
+    @abstractmethod
+    async def stream(self, chunk_size: int) -> AsyncIterator[List[Producer]]:
+        raise NotImplementedError
+        yield  # pylint: disable=unreachable
+
+    @abstractmethod
+    async def save(self, producer: Producer) -> None:
+        pass
+
+    @abstractmethod
+    async def import_all(self, producers: AsyncIterator[List[Producer]]) -> List[UUID]:
         pass
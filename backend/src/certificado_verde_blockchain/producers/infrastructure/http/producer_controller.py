@@ -1,14 +1,24 @@
 import json
+from typing import Optional
 from uuid import UUID
 
-from fastapi import Response, status
+from fastapi import Request, Response, status
+from fastapi.responses import StreamingResponse
 
+from ....shared.enums import ExportFormat
+from ....shared.http import export_response, read_records, record_columns
+from ....shared.models import PageRequest
 from ...application import (
+    ExportProducersHandler,
     FindProducerByIdHandler,
+    ImportProducersHandler,
     ListAllProducersHandler,
     RegisterProducerCommand,
     RegisterProducerHandler,
 )
+from ...domain import Producer
+
+PRODUCER_EXPORT_COLUMNS = record_columns(Producer)
 
 
 class ProducerController:
@@ -17,15 +27,23 @@ class ProducerController:
         list_all_producers_handler: ListAllProducersHandler,
         find_producer_by_id_handler: FindProducerByIdHandler,
         register_producer_handler: RegisterProducerHandler,
+        export_producers_handler: ExportProducersHandler,
+        import_producers_handler: ImportProducersHandler,
     ) -> None:
         self._list_all_producers_handler = list_all_producers_handler
         self._find_producer_by_id_handler = find_producer_by_id_handler
         self._register_producer_handler = register_producer_handler
+        self._export_producers_handler = export_producers_handler
+        self._import_producers_handler = import_producers_handler
 
-    async def list_all_producers(self) -> Response:
-        producers = await self._list_all_producers_handler.handle()
+    async def list_all_producers(self, cursor: Optional[str], limit: int) -> Response:
+        producers = await self._list_all_producers_handler.handle(PageRequest.from_cursor(cursor, limit))
         return Response(content=json.dumps(producers), media_type="application/json")
 
+    async def export_producers(self, export_format: ExportFormat) -> StreamingResponse:
+        producers = self._export_producers_handler.handle()
+        return export_response(producers, export_format, "producers", PRODUCER_EXPORT_COLUMNS)
+
     async def find_producer_by_id(self, producer_id: str) -> Response:
         producer = await self._find_producer_by_id_handler.handle(UUID(producer_id))
         return Response(content=json.dumps(producer), media_type="application/json")
@@ -35,3 +53,7 @@ class ProducerController:
         return Response(
             content=json.dumps(producer), media_type="application/json", status_code=status.HTTP_201_CREATED
         )
+
+    async def import_producers(self, request: Request) -> Response:
+        report = await self._import_producers_handler.handle(read_records(request, RegisterProducerCommand))
+        return Response(content=json.dumps(report), media_type="application/json")
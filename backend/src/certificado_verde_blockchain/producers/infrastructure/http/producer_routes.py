@@ -1,6 +1,12 @@
-from fastapi import APIRouter
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from miraveja_di import DIContainer
 
+from ....shared.enums import ExportFormat
+from ....shared.http import request_scoped
+from ....shared.models import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from ...application import RegisterProducerCommand
 from .producer_controller import ProducerController
 
@@ -14,16 +20,37 @@ class ProducerRoutes:
             router (APIRouter): The FastAPI router to register routes on.
             container (DIContainer): The dependency injection container.
         """
-        producer_controller = container.resolve(ProducerController)
+        get_producer_controller = request_scoped(container, ProducerController)
 
         @router.get("/producers/")
-        async def list_all_producers():
-            return await producer_controller.list_all_producers()
+        async def list_all_producers(
+            cursor: Optional[str] = None,
+            limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+            producer_controller: ProducerController = Depends(get_producer_controller),
+        ):
+            return await producer_controller.list_all_producers(cursor, limit)
+
+        @router.get("/producers/export")
+        async def export_producers(
+            export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
+            producer_controller: ProducerController = Depends(get_producer_controller),
+        ) -> StreamingResponse:
+            return await producer_controller.export_producers(export_format)
 
         @router.get("/producers/{producer_id}")
-        async def find_producer_by_id(producer_id: str):
+        async def find_producer_by_id(
+            producer_id: str, producer_controller: ProducerController = Depends(get_producer_controller)
+        ):
             return await producer_controller.find_producer_by_id(producer_id)
 
         @router.post("/producers/", status_code=201)
-        async def register_producer(command: RegisterProducerCommand):
+        async def register_producer(
+            command: RegisterProducerCommand, producer_controller: ProducerController = Depends(get_producer_controller)
+        ):
             return await producer_controller.register_producer(command)
+
+        @router.post("/producers/import")
+        async def import_producers(
+            request: Request, producer_controller: ProducerController = Depends(get_producer_controller)
+        ) -> Response:
+            return await producer_controller.import_producers(request)
@@ -37,7 +37,7 @@ class ProducerEntity(Base):
 
     id: Mapped[str] = mapped_column(PG_UUID(as_uuid=False), primary_key=True, default=sa.text("gen_random_uuid()"))
     name: Mapped[str] = mapped_column(sa.String(255), nullable=False)
-    document_type: Mapped[DocumentType] = mapped_column(sa.Enum(DocumentType), nullable=False)
+    document_type: Mapped[DocumentType] = mapped_column(sa.Enum(DocumentType, name="document_type"), nullable=False)
     document_number: Mapped[str] = mapped_column(sa.String(100), nullable=False)
     address_country: Mapped[str] = mapped_column(sa.String(100), nullable=False)
     address_state: Mapped[Optional[str]] = mapped_column(sa.String(100), nullable=True)
@@ -1,51 +1,102 @@
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 from uuid import UUID
 
-from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session as DatabaseSession
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession as DatabaseSession
 
-from ....shared.errors import DomainException
+from ....shared.sql import SqlUnitOfWork, StagingTable
 from ...domain import IProducerRepository, Producer
 from .producer_entity import ProducerEntity
 
 
 class SqlProducerRepository(IProducerRepository):
-    def __init__(self, database_session: DatabaseSession):
+    def __init__(self, database_session: DatabaseSession, unit_of_work: SqlUnitOfWork):
         self._db_session = database_session
+        self._unit_of_work = unit_of_work
 
-    def list_all(self) -> List[Producer]:
+    async def list_page(self, after_id: Optional[UUID], limit: int) -> List[Producer]:
         try:
-            producer_entities = self._db_session.query(ProducerEntity).all()
+            query = sa.select(ProducerEntity)
+            if after_id is not None:
+                query = query.where(ProducerEntity.id > str(after_id))
+            producer_entities = (await self._db_session.scalars(query.order_by(ProducerEntity.id).limit(limit))).all()
             return [entity.to_domain() for entity in producer_entities]
         except:
-            self._db_session.rollback()
+            await self._db_session.rollback()
             raise
 
-    def find_by_id(self, producer_id: UUID) -> Optional[Producer]:
+    async def find_by_id(self, producer_id: UUID) -> Optional[Producer]:
+        producer = self._unit_of_work.find(Producer, producer_id)
+        if producer is not None:
+            return producer
         try:
-            producer_entity = self._db_session.query(ProducerEntity).filter_by(id=str(producer_id)).first()
+            producer_entity: Optional[ProducerEntity] = await self._db_session.scalar(
+                sa.select(ProducerEntity).filter_by(id=str(producer_id))
+            )
             if producer_entity:
-                return producer_entity.to_domain()
+                producer = producer_entity.to_domain()
+                self._unit_of_work.track(producer)
+                return producer
             return None
         except:
-            self._db_session.rollback()
+            await self._db_session.rollback()
             raise
 
-    def save(self, producer: Producer) -> None:
-        producer_entity = ProducerEntity.from_domain(producer)
+    async def find_by_ids(self, producer_ids: List[UUID]) -> List[Producer]:
+        producers, missing_ids = self._unit_of_work.find_many(Producer, producer_ids)
+        if not missing_ids:
+            return producers
         try:
-            self._db_session.merge(producer_entity)  # Use merge to handle both insert and update
-            self._db_session.commit()
-        except IntegrityError as integrity_error:
-            self._db_session.rollback()
-            raise DomainException(
-                (
-                    f"Cannot save duplicate producer with document {producer.document.document_type}, "
-                    f"number {producer.document.number}"
-                ),
-                code=409,  # Conflict
-            ) from integrity_error
+            producer_entities = (
+                await self._db_session.scalars(
+                    sa.select(ProducerEntity).where(
+                        ProducerEntity.id.in_([str(producer_id) for producer_id in missing_ids])
+                    )
+                )
+            ).all()
+            for producer_entity in producer_entities:
+                producer = producer_entity.to_domain()
+                self._unit_of_work.track(producer)
+                producers.append(producer)
+            return producers
         except:
-            # In case of an error, rollback the session
-            self._db_session.rollback()
+            await self._db_session.rollback()
+            raise
+
+    async def stream(self, chunk_size: int) -> AsyncIterator[List[Producer]]:
+        try:
+            # A server-side cursor: only one chunk of rows is held in memory at a time
+            result = await self._db_session.stream_scalars(
+                sa.select(ProducerEntity).order_by(ProducerEntity.id).execution_options(yield_per=chunk_size)
+            )
+            async for producer_entities in result.partitions():
+                yield [entity.to_domain() for entity in producer_entities]
+        except:
+            await self._db_session.rollback()
+            raise
+
+    async def save(self, producer: Producer) -> None:
+        self._unit_of_work.stage(
+            ProducerEntity.from_domain(producer),
+            (
+                f"Cannot save duplicate producer with document {producer.document.document_type}, "
+                f"number {producer.document.number}"
+            ),
+        )
+        self._unit_of_work.track(producer)
+
+    async def import_all(self, producers: AsyncIterator[List[Producer]]) -> List[UUID]:
+        staging_table = StagingTable(ProducerEntity)
+        try:
+            await staging_table.create(self._db_session)
+            async for batch in producers:
+                await staging_table.copy(self._db_session, [ProducerEntity.from_domain(producer) for producer in batch])
+            # A single set-wise insert of every staged producer, in the transaction of the COPYs; the producers
+            # whose document is already registered are left out rather than failing the whole import
+            insert = staging_table.insert().on_conflict_do_nothing(index_elements=["document_number"])
+            producer_ids = (await self._db_session.scalars(insert.returning(staging_table.target.c.id))).all()
+            await self._db_session.commit()
+            return [UUID(producer_id) for producer_id in producer_ids]
+        except:
+            await self._db_session.rollback()
             raise
@@ -1,13 +1,19 @@
 from .application import (
+    ExportProductsHandler,
     FindProductByIdHandler,
+    FindProductsByIdsHandler,
+    ImportProductsHandler,
     ListAllProductsHandler,
     RegisterProductCommand,
     RegisterProductHandler,
 )
 
 __all__ = [
+    "ExportProductsHandler",
+    "FindProductsByIdsHandler",
     "RegisterProductCommand",
     "RegisterProductHandler",
+    "ImportProductsHandler",
     "ListAllProductsHandler",
     "FindProductByIdHandler",
 ]
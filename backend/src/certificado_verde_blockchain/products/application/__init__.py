@@ -1,9 +1,15 @@
+from .export_products import ExportProductsHandler
 from .find_product_by_id import FindProductByIdHandler
+from .find_products_by_ids import FindProductsByIdsHandler
+from .import_products import ImportProductsHandler
 from .list_all_products import ListAllProductsHandler
 from .register_product import RegisterProductCommand, RegisterProductHandler
 
 __all__ = [
+    "ExportProductsHandler",
+    "FindProductsByIdsHandler",
     "FindProductByIdHandler",
+    "ImportProductsHandler",
     "ListAllProductsHandler",
     "RegisterProductCommand",
     "RegisterProductHandler",
@@ -0,0 +1,30 @@
+from typing import Any, AsyncIterator, Dict
+
+from miraveja_log import IAsyncLogger
+
+from ..domain import IProductRepository
+
+# Products loaded from the database cursor at a time
+EXPORT_CHUNK_SIZE = 1000
+
+
+class ExportProductsHandler:
+    def __init__(self, repository: IProductRepository, logger: IAsyncLogger):
+        self._repository = repository
+        self._logger = logger
+
+    async def handle(self) -> AsyncIterator[Dict[str, Any]]:
+        """Handles the export of every product, streamed from the database.
+
+        Returns:
+            AsyncIterator[Dict[str, Any]]: The products, ordered by ID.
+        """
+        await self._logger.info("Exporting products")
+
+        exported = 0
+        async for products in self._repository.stream(EXPORT_CHUNK_SIZE):
+            for product in products:
+                exported += 1
+                yield product.model_dump()
+
+        await self._logger.info(f"Exported {exported} products")
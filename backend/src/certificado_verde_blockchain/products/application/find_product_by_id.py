@@ -15,7 +15,7 @@ class FindProductByIdHandler:
     async def handle(self, product_id: UUID) -> Dict[str, Any]:
         await self._logger.info(f"Finding product with ID: {product_id}")
 
-        product: Optional[Product] = self._repository.find_by_id(product_id)
+        product: Optional[Product] = await self._repository.find_by_id(product_id)
 
         if product:
             await self._logger.info(f"Product found: {product}")
@@ -0,0 +1,19 @@
+from typing import Any, Dict, List
+from uuid import UUID
+
+from miraveja_log import IAsyncLogger
+
+from ..domain import IProductRepository
+
+
+class FindProductsByIdsHandler:
+    def __init__(self, repository: IProductRepository, logger: IAsyncLogger):
+        self._repository = repository
+        self._logger = logger
+
+    async def handle(self, product_ids: List[UUID]) -> Dict[str, Any]:
+        await self._logger.info(f"Finding {len(product_ids)} products by ID")
+
+        products = await self._repository.find_by_ids(product_ids)
+
+        return {"products": [product.model_dump() for product in products]}
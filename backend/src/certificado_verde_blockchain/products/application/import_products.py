@@ -0,0 +1,77 @@
+from typing import Any, AsyncIterator, Dict, List, Tuple, Union
+from uuid import uuid4
+
+from pydantic import ValidationError
+
+from miraveja_log import IAsyncLogger
+
+from ...shared.models import ImportReport
+from ..domain import IProductRepository, Product
+from .register_product import RegisterProductCommand
+
+# Valid products loaded into the database at a time
+IMPORT_BATCH_SIZE = 10_000
+
+ImportRow = Tuple[int, Union[str, Dict[str, Any]]]
+
+
+class ImportProductsHandler:
+    def __init__(self, repository: IProductRepository, logger: IAsyncLogger):
+        self._repository = repository
+        self._logger = logger
+
+    async def handle(self, rows: AsyncIterator[ImportRow]) -> Dict[str, Any]:
+        """Handles the registration of many products at once, validating each row as it is read.
+
+        The valid rows are registered together, in a single transaction, and the others are reported with
+        why they were rejected.
+
+        Args:
+            rows (AsyncIterator[ImportRow]): The line of each row in the upload, with the row as a JSON
+                document or as the fields of a `RegisterProductCommand`.
+        Returns:
+            Dict[str, Any]: The import report, see `ImportReport`.
+        """
+        await self._logger.info("Importing products")
+
+        report = ImportReport()
+
+        async def valid_products() -> AsyncIterator[List[Product]]:
+            batch: List[Product] = []
+            async for line, row in rows:
+                report.received += 1
+                try:
+                    if isinstance(row, str):
+                        command = RegisterProductCommand.model_validate_json(row)
+                    else:
+                        command = RegisterProductCommand.model_validate(row)
+                except ValidationError as validation_error:
+                    report.reject_invalid(line, validation_error)
+                    continue
+                batch.append(
+                    Product(
+                        id=uuid4(),
+                        name=command.name,
+                        description=command.description,
+                        category=command.category,
+                        quantity=command.quantity,
+                        origin=command.origin,
+                        lot_number=command.lot_number,
+                        carbon_emission=command.carbon_emission,
+                        metadata=command.metadata,
+                        tags=command.tags,
+                    )
+                )
+                if len(batch) == IMPORT_BATCH_SIZE:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+
+        report.imported = len(await self._repository.import_all(valid_products()))
+
+        await self._logger.info(
+            f"Imported {report.imported} of {report.received} products, {len(report.rejected)} rejected"
+        )
+
+        return report.model_dump()
@@ -1,8 +1,9 @@
-from typing import Any, Dict, List
+from typing import Any, Dict
 
 from miraveja_log import IAsyncLogger
 
-from ..domain import IProductRepository, Product
+from ...shared.models import PageRequest
+from ..domain import IProductRepository
 
 
 class ListAllProductsHandler:
@@ -10,11 +11,11 @@ class ListAllProductsHandler:
         self._repository = repository
         self._logger = logger
 
-    async def handle(self) -> Dict[str, Any]:
-        await self._logger.info("Listing all products")
+    async def handle(self, page: PageRequest) -> Dict[str, Any]:
+        await self._logger.info(f"Listing products after {page.after_id}")
 
-        products: List[Product] = self._repository.list_all()
+        products, next_cursor = page.page(await self._repository.list_page(page.after_id, page.fetch_limit))
 
-        await self._logger.info(f"Found {len(products)} products")
+        await self._logger.info(f"Found {len(products)} products in the page")
 
-        return {"products": [product.model_dump() for product in products]}
+        return {"products": [product.model_dump() for product in products], "next_cursor": next_cursor}
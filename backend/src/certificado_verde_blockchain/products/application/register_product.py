@@ -5,6 +5,7 @@ from pydantic import BaseModel, Field
 
 from miraveja_log import IAsyncLogger
 
+from ...shared.domain import IUnitOfWork
 from ...shared.models import Location
 from ..domain import IProductRepository, Product, ProductCategory, Quantity
 
@@ -24,8 +25,9 @@ class RegisterProductCommand(BaseModel):
 
 
 class RegisterProductHandler:
-    def __init__(self, repository: IProductRepository, logger: IAsyncLogger):
+    def __init__(self, repository: IProductRepository, unit_of_work: IUnitOfWork, logger: IAsyncLogger):
         self._repository = repository
+        self._unit_of_work = unit_of_work
         self._logger = logger
 
     async def handle(self, command: RegisterProductCommand) -> Dict[str, Any]:
@@ -44,7 +46,8 @@ class RegisterProductHandler:
             tags=command.tags,
         )
 
-        self._repository.save(product)
+        await self._repository.save(product)
+        await self._unit_of_work.commit()
 
         await self._logger.info(f"Product registered with ID: {product.id}")
 
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 from uuid import UUID
 
 from .product import Product
@@ -7,13 +7,26 @@ from .product import Product
 
 class IProductRepository(ABC):
     @abstractmethod
-    def list_all(self) -> List[Product]:
+    async def list_page(self, after_id: Optional[UUID], limit: int) -> List[Product]:
         pass
 
     @abstractmethod
-    def find_by_id(self, product_id: UUID) -> Optional[Product]:
+    async def find_by_id(self, product_id: UUID) -> Optional[Product]:
         pass
 
     @abstractmethod
-    def save(self, product: Product) -> None:
+    async def find_by_ids(self, product_ids: List[UUID]) -> List[Product]:
+        pass
+
+    @abstractmethod
+    async def stream(self, chunk_size: int) -> AsyncIterator[List[Product]]:
+        raise NotImplementedError
+        yield  # pylint: disable=unreachable
+
+    @abstractmethod
+    async def save(self, product: Product) -> None:
+        pass
+
+    @abstractmethod
+    async def import_all(self, products: AsyncIterator[List[Product]]) -> List[UUID]:
         pass
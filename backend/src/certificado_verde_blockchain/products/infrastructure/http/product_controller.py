@@ -1,14 +1,24 @@
 import json
+from typing import Optional
 from uuid import UUID
 
-from fastapi import Response, status
+from fastapi import Request, Response, status
+from fastapi.responses import StreamingResponse
 
+from ....shared.enums import ExportFormat
+from ....shared.http import export_response, read_records, record_columns
+from ....shared.models import PageRequest
 from ...application import (
+    ExportProductsHandler,
     FindProductByIdHandler,
+    ImportProductsHandler,
     ListAllProductsHandler,
     RegisterProductCommand,
     RegisterProductHandler,
 )
+from ...domain import Product
+
+PRODUCT_EXPORT_COLUMNS = record_columns(Product)
 
 
 class ProductController:
@@ -17,15 +27,23 @@ class ProductController:
         list_all_products_handler: ListAllProductsHandler,
         find_product_by_id_handler: FindProductByIdHandler,
         register_product_handler: RegisterProductHandler,
+        export_products_handler: ExportProductsHandler,
+        import_products_handler: ImportProductsHandler,
     ) -> None:
         self._list_all_products_handler = list_all_products_handler
         self._find_product_by_id_handler = find_product_by_id_handler
         self._register_product_handler = register_product_handler
+        self._export_products_handler = export_products_handler
+        self._import_products_handler = import_products_handler
 
-    async def list_all_products(self) -> Response:
-        products = await self._list_all_products_handler.handle()
+    async def list_all_products(self, cursor: Optional[str], limit: int) -> Response:
+        products = await self._list_all_products_handler.handle(PageRequest.from_cursor(cursor, limit))
         return Response(content=json.dumps(products), media_type="application/json")
 
+    async def export_products(self, export_format: ExportFormat) -> StreamingResponse:
+        products = self._export_products_handler.handle()
+        return export_response(products, export_format, "products", PRODUCT_EXPORT_COLUMNS)
+
     async def find_product_by_id(self, product_id: str) -> Response:
         product = await self._find_product_by_id_handler.handle(UUID(product_id))
         return Response(content=json.dumps(product), media_type="application/json")
@@ -33,3 +51,7 @@ class ProductController:
     async def register_product(self, command: RegisterProductCommand) -> Response:
         product = await self._register_product_handler.handle(command)
         return Response(content=json.dumps(product), media_type="application/json", status_code=status.HTTP_201_CREATED)
+
+    async def import_products(self, request: Request) -> Response:
+        report = await self._import_products_handler.handle(read_records(request, RegisterProductCommand))
+        return Response(content=json.dumps(report), media_type="application/json")
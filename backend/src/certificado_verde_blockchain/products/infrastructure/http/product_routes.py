@@ -1,6 +1,12 @@
-from fastapi import APIRouter
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from miraveja_di import DIContainer
 
+from ....shared.enums import ExportFormat
+from ....shared.http import request_scoped
+from ....shared.models import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from ...application import RegisterProductCommand
 from .product_controller import ProductController
 
@@ -14,16 +20,37 @@ class ProductRoutes:
             router (APIRouter): The FastAPI router to register routes on.
             container (DIContainer): The dependency injection container.
         """
-        product_controller = container.resolve(ProductController)
+        get_product_controller = request_scoped(container, ProductController)
 
         @router.get("/products/")
-        async def list_all_products():
-            return await product_controller.list_all_products()
+        async def list_all_products(
+            cursor: Optional[str] = None,
+            limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+            product_controller: ProductController = Depends(get_product_controller),
+        ):
+            return await product_controller.list_all_products(cursor, limit)
+
+        @router.get("/products/export")
+        async def export_products(
+            export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
+            product_controller: ProductController = Depends(get_product_controller),
+        ) -> StreamingResponse:
+            return await product_controller.export_products(export_format)
 
         @router.get("/products/{product_id}")
-        async def find_product_by_id(product_id: str):
+        async def find_product_by_id(
+            product_id: str, product_controller: ProductController = Depends(get_product_controller)
+        ):
             return await product_controller.find_product_by_id(product_id)
 
         @router.post("/products/", status_code=201)
-        async def register_product(command: RegisterProductCommand):
+        async def register_product(
+            command: RegisterProductCommand, product_controller: ProductController = Depends(get_product_controller)
+        ):
             return await product_controller.register_product(command)
+
+        @router.post("/products/import")
+        async def import_products(
+            request: Request, product_controller: ProductController = Depends(get_product_controller)
+        ) -> Response:
+            return await product_controller.import_products(request)
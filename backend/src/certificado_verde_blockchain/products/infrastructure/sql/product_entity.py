@@ -44,9 +44,11 @@ class ProductEntity(Base):
     id: Mapped[str] = mapped_column(PG_UUID(as_uuid=False), primary_key=True, default=sa.text("gen_random_uuid()"))
     name: Mapped[str] = mapped_column(sa.String(255), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(sa.Text, nullable=True)
-    category: Mapped[ProductCategory] = mapped_column(sa.Enum(ProductCategory), nullable=False)
+    category: Mapped[ProductCategory] = mapped_column(sa.Enum(ProductCategory, name="product_category"), nullable=False)
     quantity_value: Mapped[float] = mapped_column(sa.Float, nullable=False)
-    quantity_unit: Mapped[MeasurementUnit] = mapped_column(sa.Enum(MeasurementUnit), nullable=False)
+    quantity_unit: Mapped[MeasurementUnit] = mapped_column(
+        sa.Enum(MeasurementUnit, name="quantity_unit"), nullable=False
+    )
     origin_country: Mapped[str] = mapped_column(sa.String(100), nullable=False)
     origin_state: Mapped[Optional[str]] = mapped_column(sa.String(100), nullable=True)
     origin_city: Mapped[Optional[str]] = mapped_column(sa.String(100), nullable=True)
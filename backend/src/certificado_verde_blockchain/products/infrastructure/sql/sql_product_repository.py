@@ -1,48 +1,99 @@
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 from uuid import UUID
 
-from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session as DatabaseSession
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession as DatabaseSession
 
-from ....shared.errors import DomainException
+from ....shared.sql import SqlUnitOfWork, StagingTable
 from ...domain import IProductRepository, Product
 from .product_entity import ProductEntity
 
 
 class SqlProductRepository(IProductRepository):
-    def __init__(self, database_session: DatabaseSession):
+    def __init__(self, database_session: DatabaseSession, unit_of_work: SqlUnitOfWork):
         self._db_session = database_session
+        self._unit_of_work = unit_of_work
 
-    def list_all(self) -> List[Product]:
+    async def list_page(self, after_id: Optional[UUID], limit: int) -> List[Product]:
         try:
-            product_entities = self._db_session.query(ProductEntity).all()
+            query = sa.select(ProductEntity)
+            if after_id is not None:
+                query = query.where(ProductEntity.id > str(after_id))
+            product_entities = (await self._db_session.scalars(query.order_by(ProductEntity.id).limit(limit))).all()
             return [entity.to_domain() for entity in product_entities]
         except:
-            self._db_session.rollback()
+            await self._db_session.rollback()
             raise
 
-    def find_by_id(self, product_id: UUID) -> Optional[Product]:
+    async def find_by_id(self, product_id: UUID) -> Optional[Product]:
+        product = self._unit_of_work.find(Product, product_id)
+        if product is not None:
+            return product
         try:
-            product_entity = self._db_session.query(ProductEntity).filter_by(id=str(product_id)).first()
+            product_entity: Optional[ProductEntity] = await self._db_session.scalar(
+                sa.select(ProductEntity).filter_by(id=str(product_id))
+            )
             if product_entity:
-                return product_entity.to_domain()
+                product = product_entity.to_domain()
+                self._unit_of_work.track(product)
+                return product
             return None
         except:
-            self._db_session.rollback()
+            await self._db_session.rollback()
             raise
 
-    def save(self, product: Product) -> None:
-        product_entity = ProductEntity.from_domain(product)
+    async def find_by_ids(self, product_ids: List[UUID]) -> List[Product]:
+        products, missing_ids = self._unit_of_work.find_many(Product, product_ids)
+        if not missing_ids:
+            return products
         try:
-            self._db_session.merge(product_entity)  # Use merge to handle both insert and update
-            self._db_session.commit()
-        except IntegrityError as integrity_error:
-            self._db_session.rollback()
-            raise DomainException(
-                "Cannot save duplicate product with the same defining attributes",
-                code=409,  # Conflict
-            ) from integrity_error
+            product_entities = (
+                await self._db_session.scalars(
+                    sa.select(ProductEntity).where(
+                        ProductEntity.id.in_([str(product_id) for product_id in missing_ids])
+                    )
+                )
+            ).all()
+            for product_entity in product_entities:
+                product = product_entity.to_domain()
+                self._unit_of_work.track(product)
+                products.append(product)
+            return products
         except:
-            # In case of an error, rollback the session
-            self._db_session.rollback()
+            await self._db_session.rollback()
+            raise
+
+    async def stream(self, chunk_size: int) -> AsyncIterator[List[Product]]:
+        try:
+            # A server-side cursor: only one chunk of rows is held in memory at a time
+            result = await self._db_session.stream_scalars(
+                sa.select(ProductEntity).order_by(ProductEntity.id).execution_options(yield_per=chunk_size)
+            )
+            async for product_entities in result.partitions():
+                yield [entity.to_domain() for entity in product_entities]
+        except:
+            await self._db_session.rollback()
+            raise
+
+    async def save(self, product: Product) -> None:
+        self._unit_of_work.stage(
+            ProductEntity.from_domain(product),
+            "Cannot save duplicate product with the same defining attributes",
+        )
+        self._unit_of_work.track(product)
+
+    async def import_all(self, products: AsyncIterator[List[Product]]) -> List[UUID]:
+        staging_table = StagingTable(ProductEntity)
+        try:
+            await staging_table.create(self._db_session)
+            async for batch in products:
+                await staging_table.copy(self._db_session, [ProductEntity.from_domain(product) for product in batch])
+            # A single set-wise insert of every staged product, in the transaction of the COPYs
+            product_ids = (
+                await self._db_session.scalars(staging_table.insert().returning(staging_table.target.c.id))
+            ).all()
+            await self._db_session.commit()
+            return [UUID(product_id) for product_id in product_ids]
+        except:
+            await self._db_session.rollback()
             raise
@@ -0,0 +1,4 @@
+from .canonical_encoder import CanonicalEncoder
+from .canonical_encoding import CanonicalEncoding
+
+__all__ = ["CanonicalEncoder", "CanonicalEncoding"]
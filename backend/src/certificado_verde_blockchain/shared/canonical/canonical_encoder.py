@@ -0,0 +1,132 @@
+import json
+import unicodedata
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Mapping
+from uuid import UUID
+
+from eth_hash.auto import keccak
+from pydantic import BaseModel
+
+from .canonical_encoding import CanonicalEncoding
+
+# Largest integer a float represents exactly; integral floats below it are written as integers in V2
+MAX_EXACT_FLOAT_INTEGER = 2**53
+
+
+def _normalize_text(value: str) -> str:
+    return value if value.isascii() else unicodedata.normalize("NFC", value)
+
+
+def _normalize_key(key: Any) -> str:
+    # Exact check on purpose: str subclasses (str enums) are written by value below
+    if type(key) is str:  # pylint: disable=unidiomatic-typecheck
+        return _normalize_text(key)
+    if isinstance(key, Enum):
+        key = key.value
+    if isinstance(key, UUID):
+        key = str(key)
+    if not isinstance(key, str):
+        raise TypeError(f"Canonical keys must be strings, not {type(key).__name__}")
+    return _normalize_text(str.__str__(key))
+
+
+def _normalize(value: Any) -> Any:
+    """Convert a value to the JSON native types written by the V2 encoding."""
+    # Exact type checks first: they cover nearly every value of a certificate document
+    value_type = type(value)
+    if value_type is str:
+        return value if value.isascii() else unicodedata.normalize("NFC", value)
+    if value_type is dict:
+        return {_normalize_key(key): _normalize(item) for key, item in value.items()}
+    if value_type is list or value_type is tuple:
+        return [_normalize(item) for item in value]
+    if value_type is float:
+        if value.is_integer() and abs(value) < MAX_EXACT_FLOAT_INTEGER:
+            return int(value)
+        return value
+    if value is None or value_type is int or value_type is bool:
+        return value
+
+    if isinstance(value, Enum):
+        return _normalize(value.value)
+    if isinstance(value, str):
+        return _normalize_text(str.__str__(value))
+    if isinstance(value, Mapping):
+        return _normalize(dict(value))
+    if isinstance(value, (list, tuple)):
+        return _normalize(list(value))
+    if isinstance(value, bool):
+        return bool(value)
+    if isinstance(value, int):
+        return int(value)
+    if isinstance(value, float):
+        return _normalize(float(value))
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc).replace(tzinfo=None).isoformat() + "Z"
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        if not value.is_finite():
+            raise ValueError(f"Non-finite number {value} has no canonical encoding")
+        return format(value.normalize(), "f")
+    if isinstance(value, (bytes, bytearray)):
+        return "0x" + value.hex()
+    if isinstance(value, BaseModel):
+        return _normalize(value.model_dump())
+    raise TypeError(f"Object of type {value_type.__name__} has no canonical encoding")
+
+
+class CanonicalEncoder:
+    """Deterministic JSON encoder used to hash certificate data.
+
+    Serialization is done by the C accelerated `json` encoder configured with sorted keys and compact
+    separators, and the UTF-8 text is hashed with keccak256 directly, without going through web3.
+
+    LEGACY output is byte-for-byte what `json.dumps(data, sort_keys=True).replace(" ", "")` produced:
+    keys sorted, ASCII escaping, `repr` floats and every space removed, including spaces inside values.
+    As the separators are already compact, the remaining `replace` only touches the spaces in values.
+
+    V2 output is compact UTF-8 JSON with keys sorted by code point and values kept as they are, except:
+    strings are NFC normalized, integral floats are written as integers, non-finite numbers are rejected,
+    UUIDs are lowercase strings, enums are their values, datetimes are UTC ISO 8601 with a `Z` suffix
+    (naive datetimes are taken as UTC), decimals are fixed-point strings, bytes are 0x-prefixed hex and
+    pydantic models are dumped.
+    """
+
+    _legacy_encoder = json.JSONEncoder(sort_keys=True, separators=(",", ":"))
+    _v2_encoder = json.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=False, allow_nan=False)
+
+    @classmethod
+    def hash(cls, data: Any, encoding: CanonicalEncoding = CanonicalEncoding.LEGACY) -> str:
+        """Compute the keccak256 hash of the canonical encoding of the data.
+
+        Args:
+            data (Any): The data to be hashed.
+            encoding (CanonicalEncoding): The canonical encoding to be used.
+        Returns:
+            str: The hex encoded hash, without 0x prefix.
+        Raises:
+            TypeError: If the data contains a value that the encoding does not support.
+            ValueError: If the data contains a number that the encoding does not support.
+        """
+        return keccak(cls.encode(data, encoding).encode("utf-8")).hex()
+
+    @classmethod
+    def encode(cls, data: Any, encoding: CanonicalEncoding = CanonicalEncoding.LEGACY) -> str:
+        """Build the canonical encoding of the data, as hashed by `hash`.
+
+        Args:
+            data (Any): The data to be encoded.
+            encoding (CanonicalEncoding): The canonical encoding to be used.
+        Returns:
+            str: The canonical JSON text.
+        """
+        if encoding == CanonicalEncoding.V2:
+            return cls._v2_encoder.encode(_normalize(data))
+        return cls._legacy_encoder.encode(data).replace(" ", "")
@@ -0,0 +1,30 @@
+from enum import Enum
+
+
+class CanonicalEncoding(str, Enum):
+    """Canonical JSON encodings used to hash certificate data.
+
+    LEGACY reproduces the original `json.dumps(sort_keys=True).replace(" ", "")` hashes, including the
+    removal of spaces inside values. V2 keeps values intact, writes compact UTF-8 and normalizes numbers,
+    UUIDs, enums and datetimes.
+    """
+
+    LEGACY = "legacy"
+    V2 = "v2"
+
+    def __str__(self) -> str:
+        return self.value
+
+    @classmethod
+    def for_schema_version(cls, version: str) -> "CanonicalEncoding":
+        """Select the encoding for a certificate schema version: major version 2 and above use V2.
+
+        Args:
+            version (str): The certificate schema version, such as "1.0" or "v2".
+        Returns:
+            CanonicalEncoding: The encoding used to hash certificates of that version.
+        """
+        major = version.strip().lstrip("vV").split(".", 1)[0]
+        if major.isdigit() and int(major) >= 2:
+            return cls.V2
+        return cls.LEGACY
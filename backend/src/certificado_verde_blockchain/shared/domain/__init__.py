@@ -0,0 +1,3 @@
+from .i_unit_of_work import IUnitOfWork
+
+__all__ = ["IUnitOfWork"]
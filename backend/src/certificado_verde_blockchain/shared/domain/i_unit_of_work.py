@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+
+
+class IUnitOfWork(ABC):
+    """The writes of a use case, shared by the repositories of every bounded context.
+
+    Repositories stage what they save in the unit of work of the current scope; nothing is written until the
+    use case commits it, once, when it is done.
+    """
+
+    @abstractmethod
+    async def commit(self) -> None:
+        pass
@@ -1,3 +1,4 @@
 from .document_type import DocumentType
+from .export_format import ExportFormat
 
-__all__ = ["DocumentType"]
+__all__ = ["DocumentType", "ExportFormat"]
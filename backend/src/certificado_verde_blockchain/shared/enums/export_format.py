@@ -0,0 +1,9 @@
+from enum import Enum
+
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+    def __str__(self) -> str:
+        return self.value
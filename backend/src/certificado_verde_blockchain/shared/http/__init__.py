@@ -0,0 +1,5 @@
+from .record_export import export_response, record_columns
+from .record_import import read_records
+from .request_scoped import request_scoped
+
+__all__ = ["export_response", "read_records", "record_columns", "request_scoped"]
@@ -0,0 +1,137 @@
+import csv
+import io
+import json
+import types
+import typing
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from ..enums import ExportFormat
+
+# Encoded records are sent in chunks of about this many characters, rather than one body message per record
+EXPORT_BUFFER_SIZE = 64 * 1024
+
+MEDIA_TYPES: Dict[ExportFormat, str] = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+}
+
+
+def record_columns(record_type: Any, prefix: str = "") -> List[str]:
+    """The CSV columns of the records of a pydantic model or a TypedDict.
+
+    Fields holding another model or TypedDict, optional or not, are flattened into one column per nested
+    field, named `<field>.<nested field>`; any other field is one column.
+
+    Args:
+        record_type (Any): The pydantic model or TypedDict the records are dumped from.
+        prefix (str): The prefix of the column names, the path of the field holding the records.
+    Returns:
+        List[str]: The column names, in the order the fields are declared.
+    """
+    if isinstance(record_type, type) and issubclass(record_type, BaseModel):
+        fields = {name: field.annotation for name, field in record_type.model_fields.items()}
+    else:
+        fields = typing.get_type_hints(record_type)
+
+    columns: List[str] = []
+    for name, annotation in fields.items():
+        nested_type = nested_record_type(annotation)
+        if nested_type is None:
+            columns.append(f"{prefix}{name}")
+        else:
+            columns.extend(record_columns(nested_type, f"{prefix}{name}."))
+    return columns
+
+
+def export_response(
+    records: AsyncIterator[Dict[str, Any]],
+    export_format: ExportFormat,
+    filename: str,
+    columns: Sequence[str],
+) -> StreamingResponse:
+    """Stream records as NDJSON, one JSON object per line, or as CSV, one row per record after a header.
+
+    The records are encoded as they come, so the response holds no more than a buffer of them in memory.
+
+    Args:
+        records (AsyncIterator[Dict[str, Any]]): The records, JSON serializable.
+        export_format (ExportFormat): The format to encode them in.
+        filename (str): The name of the downloaded file, without its extension.
+        columns (Sequence[str]): The CSV columns, see `record_columns`; ignored for NDJSON.
+    Returns:
+        StreamingResponse: The response, downloaded as `<filename>.<format>`.
+    """
+    encoded = _ndjson_lines(records) if export_format == ExportFormat.NDJSON else _csv_lines(records, columns)
+    return StreamingResponse(
+        _buffered(encoded),
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{export_format}"'},
+    )
+
+
+async def _ndjson_lines(records: AsyncIterator[Dict[str, Any]]) -> AsyncIterator[str]:
+    async for record in records:
+        yield json.dumps(record) + "\n"
+
+
+async def _csv_lines(records: AsyncIterator[Dict[str, Any]], columns: Sequence[str]) -> AsyncIterator[str]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns, extrasaction="ignore")
+    writer.writeheader()
+    async for record in records:
+        writer.writerow(_flatten(record, set(columns)))
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    yield buffer.getvalue()
+
+
+async def _buffered(lines: AsyncIterator[str]) -> AsyncIterator[str]:
+    chunk: List[str] = []
+    size = 0
+    async for line in lines:
+        chunk.append(line)
+        size += len(line)
+        if size >= EXPORT_BUFFER_SIZE:
+            yield "".join(chunk)
+            chunk, size = [], 0
+    if chunk:
+        yield "".join(chunk)
+
+
+def _flatten(record: Dict[str, Any], columns: typing.AbstractSet[str], prefix: str = "") -> Dict[str, Any]:
+    """The CSV row of a record: nested records spread over their columns, lists joined with `;`, and any other
+    dictionary or list (free-form metadata) kept whole as JSON."""
+    row: Dict[str, Any] = {}
+    for key, value in record.items():
+        column = f"{prefix}{key}"
+        if isinstance(value, dict) and column not in columns:
+            row.update(_flatten(value, columns, f"{column}."))
+        elif isinstance(value, list) and all(isinstance(item, (str, int, float)) for item in value):
+            row[column] = ";".join(str(item) for item in value)
+        elif isinstance(value, (dict, list)):
+            row[column] = json.dumps(value)
+        else:
+            row[column] = value
+    return row
+
+
+def unwrap_optional(annotation: Any) -> Any:
+    """The type an `Optional` annotation allows besides None, or the annotation itself when not optional."""
+    arguments = [argument for argument in typing.get_args(annotation) if argument is not types.NoneType]
+    if typing.get_origin(annotation) in (typing.Union, types.UnionType) and len(arguments) == 1:
+        return arguments[0]
+    return annotation
+
+
+def nested_record_type(annotation: Any) -> Optional[Any]:
+    """The model or TypedDict a field annotation holds, unwrapping `Optional`, or None for any other field."""
+    annotation = unwrap_optional(annotation)
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    if typing.is_typeddict(annotation):
+        return annotation
+    return None
@@ -0,0 +1,30 @@
+from typing import AsyncIterator, Callable, Type, TypeVar
+
+from miraveja_di import DIContainer
+from sqlalchemy.ext.asyncio import AsyncSession as DatabaseSession
+
+T = TypeVar("T")
+
+
+def request_scoped(container: DIContainer, dependency_type: Type[T]) -> Callable[[], AsyncIterator[T]]:
+    """Create a FastAPI dependency resolving `dependency_type` in a new scope for every request.
+
+    Each request gets its own database session, which cannot be shared by concurrent requests. The session
+    is closed once the response has been sent, returning its connection to the pool.
+
+    Args:
+        container (DIContainer): The dependency injection container.
+        dependency_type (Type[T]): The type to resolve, usually a controller.
+
+    Returns:
+        Callable[[], AsyncIterator[T]]: The dependency, to be used with `Depends`.
+    """
+
+    async def dependency() -> AsyncIterator[T]:
+        with container.create_scope() as scope:
+            try:
+                yield scope.resolve(dependency_type)
+            finally:
+                await scope.resolve(DatabaseSession).close()
+
+    return dependency
@@ -0,0 +1,3 @@
+from .merkle_tree import MerkleTree
+
+__all__ = ["MerkleTree"]
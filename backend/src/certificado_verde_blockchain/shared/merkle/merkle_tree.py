@@ -0,0 +1,99 @@
+from typing import Iterable, List, Sequence
+
+from eth_hash.auto import keccak
+
+
+def _hash_pair(left: bytes, right: bytes) -> bytes:
+    return keccak(left + right) if left <= right else keccak(right + left)
+
+
+class MerkleTree:
+    """Binary keccak256 Merkle tree over certificate hashes, as anchored by `CertificateRegistry.anchorRoot`.
+
+    Leaves are the keccak256 of each 32-byte certificate hash and every pair of nodes is hashed in sorted
+    order, so a proof is only the list of sibling hashes, without left/right flags. A node left without a
+    sibling is promoted to the next level unchanged. `verify` mirrors `CertificateRegistry.verifyInclusion`.
+    """
+
+    def __init__(self, leaves: Sequence[bytes]) -> None:
+        if not leaves:
+            raise ValueError("A Merkle tree needs at least one leaf.")
+
+        level = list(leaves)
+        self._levels: List[List[bytes]] = [level]
+        while len(level) > 1:
+            parents = [_hash_pair(left, right) for left, right in zip(level[0::2], level[1::2])]
+            if len(level) % 2:
+                parents.append(level[-1])
+            level = parents
+            self._levels.append(level)
+
+    @classmethod
+    def from_hashes(cls, certificate_hashes: Iterable[str]) -> "MerkleTree":
+        """Build the tree of a list of certificate hashes, in the given order.
+
+        Args:
+            certificate_hashes (Iterable[str]): The hex encoded 32-byte hashes, with or without 0x prefix.
+        Returns:
+            MerkleTree: The tree whose leaf i is the leaf of the i-th hash.
+        """
+        return cls([cls.leaf(certificate_hash) for certificate_hash in certificate_hashes])
+
+    @staticmethod
+    def leaf(certificate_hash: str) -> bytes:
+        """Compute the leaf of a certificate hash.
+
+        Args:
+            certificate_hash (str): The hex encoded 32-byte hash, with or without 0x prefix.
+        Returns:
+            bytes: The keccak256 of the hash bytes.
+        Raises:
+            ValueError: If the hash is not 32 bytes of hex.
+        """
+        value = bytes.fromhex(certificate_hash.removeprefix("0x"))
+        if len(value) != 32:
+            raise ValueError(f"Certificate hashes must be 32 bytes long, got {len(value)}.")
+        return keccak(value)
+
+    @staticmethod
+    def verify(leaf: bytes, proof: Sequence[bytes], root: bytes) -> bool:
+        """Check that a proof leads from a leaf to a root.
+
+        Args:
+            leaf (bytes): The leaf being proven.
+            proof (Sequence[bytes]): The sibling hashes from the leaf up to the root.
+            root (bytes): The expected root.
+        Returns:
+            bool: True if hashing the leaf with the proof yields the root.
+        """
+        node = leaf
+        for sibling in proof:
+            node = _hash_pair(node, sibling)
+        return node == root
+
+    @property
+    def root(self) -> bytes:
+        """The root of the tree."""
+        return self._levels[-1][0]
+
+    def __len__(self) -> int:
+        return len(self._levels[0])
+
+    def proof(self, index: int) -> List[bytes]:
+        """Build the inclusion proof of a leaf.
+
+        Args:
+            index (int): The position of the leaf.
+        Returns:
+            List[bytes]: The sibling hashes from the leaf up to the root (empty for a single leaf tree).
+        """
+        if not 0 <= index < len(self):
+            raise IndexError(f"Leaf index {index} out of range for a tree of {len(self)} leaves.")
+
+        proof: List[bytes] = []
+        for level in self._levels[:-1]:
+            sibling = index ^ 1
+            if sibling < len(level):
+                proof.append(level[sibling])
+            index //= 2
+        return proof
@@ -1,4 +1,5 @@
+from .database_routing_middleware import DatabaseRoutingMiddleware
 from .error_middleware import ErrorMiddleware
 from .logging_middleware import LoggingMiddleware
 
-__all__ = ["LoggingMiddleware", "ErrorMiddleware"]
+__all__ = ["LoggingMiddleware", "ErrorMiddleware", "DatabaseRoutingMiddleware"]
@@ -0,0 +1,33 @@
+import math
+
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp
+
+from ..sql import read_routing
+
+# Set on the clients that wrote, keeping their reads on the primary until the replicas replayed the write
+READ_YOUR_WRITES_COOKIE = "db_primary"
+
+
+class DatabaseRoutingMiddleware(BaseHTTPMiddleware):
+    """Lets the database reads of GET and HEAD requests go to the replicas, except for clients that just wrote."""
+
+    def __init__(self, app: ASGIApp, read_your_writes_seconds: float) -> None:
+        super().__init__(app)
+        self.read_your_writes_seconds = read_your_writes_seconds
+
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        replicas = request.method in ("GET", "HEAD") and READ_YOUR_WRITES_COOKIE not in request.cookies
+        with read_routing(replicas) as routing:
+            response = await call_next(request)
+        if routing.wrote:
+            response.set_cookie(
+                READ_YOUR_WRITES_COOKIE,
+                "1",
+                max_age=math.ceil(self.read_your_writes_seconds),
+                httponly=True,
+                samesite="lax",
+            )
+        return response
@@ -1,6 +1,19 @@
 from .contact_info import ContactInfo
 from .coordinates import Coordinates
 from .document import Document
+from .import_report import FieldError, ImportReport, RowError
 from .location import Location
+from .page_request import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, PageRequest
 
-__all__ = ["Coordinates", "Location", "ContactInfo", "Document"]
+__all__ = [
+    "Coordinates",
+    "Location",
+    "ContactInfo",
+    "Document",
+    "FieldError",
+    "ImportReport",
+    "RowError",
+    "PageRequest",
+    "DEFAULT_PAGE_SIZE",
+    "MAX_PAGE_SIZE",
+]
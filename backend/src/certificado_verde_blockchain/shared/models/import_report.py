@@ -0,0 +1,53 @@
+from typing import Annotated, List, Optional
+
+from pydantic import BaseModel, Field, ValidationError
+
+
+class FieldError(BaseModel):
+    """Model that represents why the value of a field of an imported row was rejected.
+
+    Attributes:
+        field (Optional[str]): Dotted path of the field, None when the whole row is at fault.
+        message (str): Why the value was rejected.
+    """
+
+    field: Annotated[Optional[str], Field(description="Dotted path of the field, None for the whole row.")] = None
+    message: Annotated[str, Field(description="Why the value was rejected.")]
+
+
+class RowError(BaseModel):
+    """Model that represents an imported row that was rejected.
+
+    Attributes:
+        line (int): Line of the row in the upload (for CSV, the last line of the row, the header being line 1).
+        errors (List[FieldError]): Why the row was rejected.
+    """
+
+    line: Annotated[int, Field(description="Line of the row in the upload.", ge=1)]
+    errors: Annotated[List[FieldError], Field(description="Why the row was rejected.")]
+
+
+class ImportReport(BaseModel):
+    """Model that represents the outcome of a bulk import, row by row.
+
+    Attributes:
+        received (int): Number of rows in the upload.
+        imported (int): Number of rows registered.
+        rejected (List[RowError]): The rows not registered, ordered by line, with why.
+    """
+
+    received: Annotated[int, Field(description="Number of rows in the upload.", ge=0)] = 0
+    imported: Annotated[int, Field(description="Number of rows registered.", ge=0)] = 0
+    rejected: Annotated[List[RowError], Field(description="The rows not registered, with why.")] = []
+
+    def reject(self, line: int, message: str, field: Optional[str] = None) -> None:
+        """Record that the row at `line` was rejected for a single reason."""
+        self.rejected.append(RowError(line=line, errors=[FieldError(field=field, message=message)]))
+
+    def reject_invalid(self, line: int, validation_error: ValidationError) -> None:
+        """Record that the row at `line` failed the validation of its command, with every failing field."""
+        errors = [
+            FieldError(field=".".join(str(part) for part in error["loc"]) or None, message=error["msg"])
+            for error in validation_error.errors(include_url=False)
+        ]
+        self.rejected.append(RowError(line=line, errors=errors))
@@ -0,0 +1,102 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Annotated, Callable, ClassVar, List, Optional, Protocol, Sequence, Tuple, TypeVar
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from ..errors import DomainException
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+class _Identified(Protocol):
+    @property
+    def id(self) -> UUID: ...
+
+
+T = TypeVar("T", bound=_Identified)
+
+
+class PageRequest(BaseModel):
+    """Value object that represents a page of a list ordered by ID, fetched by keyset rather than by offset.
+
+    Each page starts after the ID its cursor carries, so the database seeks the primary key (or a composite
+    index ending with it) instead of skipping the rows of the previous pages, and rows inserted meanwhile
+    never shift a page. Lists ordered by a date, then by ID, carry the date of the last item in the cursor too.
+
+    Attributes:
+        after_id (Optional[UUID]): Only items with a greater ID are listed; None starts from the first.
+        after_date (Optional[datetime]): In lists ordered by date, the date of the item `after_id` refers to.
+        limit (int): Maximum number of items in the page.
+    """
+
+    model_config: ClassVar[ConfigDict] = ConfigDict(frozen=True)
+
+    after_id: Annotated[Optional[UUID], Field(description="Only items with a greater ID are listed.")] = None
+    after_date: Annotated[
+        Optional[datetime], Field(description="In lists ordered by date, the date of the item after_id refers to.")
+    ] = None
+    limit: Annotated[int, Field(description="Maximum number of items in the page.", ge=1, le=MAX_PAGE_SIZE)] = (
+        DEFAULT_PAGE_SIZE
+    )
+
+    @classmethod
+    def from_cursor(cls, cursor: Optional[str], limit: int = DEFAULT_PAGE_SIZE) -> "PageRequest":
+        """Creates the request of the page following an opaque cursor.
+
+        Args:
+            cursor (Optional[str]): The `next_cursor` of the previous page, None for the first page.
+            limit (int): Maximum number of items in the page.
+        Returns:
+            PageRequest: The page request.
+        Raises:
+            DomainException: If the cursor was not issued by `page`.
+        """
+        if not cursor:
+            return cls(limit=limit)
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+            after, after_date = payload["after"], payload.get("after_date")
+            if not isinstance(after, str) or not (after_date is None or isinstance(after_date, str)):
+                raise TypeError(f"Cursor position is not a string: {after!r}, {after_date!r}")
+            after_id = UUID(after)
+            after_datetime = datetime.fromisoformat(after_date) if after_date is not None else None
+        except (binascii.Error, UnicodeDecodeError, ValueError, TypeError, KeyError) as error:
+            raise DomainException("Invalid page cursor", code=400) from error
+        return cls(after_id=after_id, after_date=after_datetime, limit=limit)
+
+    @property
+    def after(self) -> Optional[Tuple[datetime, UUID]]:
+        """The (date, ID) of the last item of the previous page of a list ordered by date, None on the first page."""
+        if self.after_id is None or self.after_date is None:
+            return None
+        return self.after_date, self.after_id
+
+    @property
+    def fetch_limit(self) -> int:
+        """Items to fetch from the repository: one more than the page holds, telling whether another page follows."""
+        return self.limit + 1
+
+    def page(
+        self, items: Sequence[T], date_of: Optional[Callable[[T], datetime]] = None
+    ) -> Tuple[List[T], Optional[str]]:
+        """Splits the items fetched with `fetch_limit` into the page and the cursor of the next one.
+
+        Args:
+            items (Sequence[T]): The items fetched, ordered by ID (or by date, then by ID).
+            date_of (Optional[Callable[[T], datetime]]): The date the items are ordered by, if any.
+        Returns:
+            Tuple[List[T], Optional[str]]: The items of the page and the cursor of the next page, None on the last.
+        """
+        page_items = list(items[: self.limit])
+        if len(items) <= self.limit:
+            return page_items, None
+        position = {"after": str(page_items[-1].id)}
+        if date_of is not None:
+            position["after_date"] = date_of(page_items[-1]).isoformat()
+        payload = json.dumps(position).encode()
+        return page_items, base64.urlsafe_b64encode(payload).decode().rstrip("=")
@@ -1,3 +1,18 @@
 from .base import Base
+from .database_router import DatabaseReplica, DatabaseRouter, ReadRouting, read_routing
+from .measured_async_queue_pool import MeasuredAsyncQueuePool
+from .routing_session import RoutingSession
+from .sql_unit_of_work import SqlUnitOfWork
+from .staging_table import StagingTable
 
-__all__ = ["Base"]
+__all__ = [
+    "Base",
+    "DatabaseReplica",
+    "DatabaseRouter",
+    "MeasuredAsyncQueuePool",
+    "ReadRouting",
+    "RoutingSession",
+    "SqlUnitOfWork",
+    "StagingTable",
+    "read_routing",
+]
@@ -0,0 +1,217 @@
+import asyncio
+import contextvars
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+import sqlalchemy as sa
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, ExceptionContext
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.dml import UpdateBase
+
+from ...configuration import DatabaseConfig
+from .measured_async_queue_pool import MeasuredAsyncQueuePool
+
+# Seconds since the last transaction replayed by a replica, 0 when it replayed everything it received
+REPLICATION_LAG_QUERY = sa.text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+
+
+@dataclass
+class ReadRouting:
+    """How the database sessions of the current request route their reads.
+
+    Attributes:
+        replicas (bool): Whether reads may go to a replica.
+        wrote (bool): Set once a session of the request sent a write to the primary.
+    """
+
+    replicas: bool
+    wrote: bool = False
+
+
+_read_routing: contextvars.ContextVar[Optional[ReadRouting]] = contextvars.ContextVar(
+    "database_read_routing", default=None
+)
+
+
+@contextmanager
+def read_routing(replicas: bool) -> Iterator[ReadRouting]:
+    """Route the reads of the sessions used inside the block (including by the tasks it starts).
+
+    Outside such a block, as in the workers and the indexer, every statement goes to the primary.
+
+    Args:
+        replicas (bool): Whether reads may go to a replica, for requests that do not write.
+    Returns:
+        Iterator[ReadRouting]: The routing, telling afterwards whether the block wrote.
+    """
+    routing = ReadRouting(replicas)
+    token = _read_routing.set(routing)
+    try:
+        yield routing
+    finally:
+        _read_routing.reset(token)
+
+
+@dataclass
+class DatabaseReplica:
+    """A read replica behind the router, with what the router knows of its replication.
+
+    Attributes:
+        engine (AsyncEngine): The engine connecting to the replica.
+        lag_seconds (Optional[float]): The replication lag at the last check, None until checked.
+        healthy (bool): False from a connection failure until a check succeeds again.
+    """
+
+    engine: AsyncEngine
+    lag_seconds: Optional[float] = None
+    healthy: bool = True
+
+    @property
+    def url(self) -> str:
+        return self.engine.url.render_as_string(hide_password=True)
+
+
+class DatabaseRouter:
+    """Sends each statement of the database sessions to the primary or to one of its read replicas.
+
+    - Writes, flushes, and every statement made outside `read_routing(replicas=True)` go to the primary.
+    - Other SELECTs go to the healthy replica with the fewest connections in use among those whose
+      replication lag is at most `max_lag_seconds`, or to the primary when there is none.
+
+    The lag of the replicas is checked at most every `health_interval_seconds`, from the reads themselves,
+    so no background task outlives the event loop; a replica serves no read before its first check.
+    """
+
+    def __init__(
+        self,
+        primary: AsyncEngine,
+        replicas: Sequence[AsyncEngine] = (),
+        max_lag_seconds: float = 5,
+        health_interval_seconds: float = 5,
+    ) -> None:
+        self.primary = primary
+        self.replicas = [DatabaseReplica(engine) for engine in replicas]
+        self.max_lag_seconds = max_lag_seconds
+        self.health_interval_seconds = health_interval_seconds
+        self._health_checked_at = float("-inf")
+        self._health_check: Optional["asyncio.Task[None]"] = None
+        for replica in self.replicas:
+            self._watch_disconnects(replica)
+
+    @classmethod
+    def from_config(cls, config: DatabaseConfig) -> "DatabaseRouter":
+        """Route over one pooled engine for the primary and for each replica of the configuration.
+
+        Args:
+            config (DatabaseConfig): The database configuration.
+        Returns:
+            DatabaseRouter: The router.
+        """
+
+        def create_engine(url: str) -> AsyncEngine:
+            return create_async_engine(url, poolclass=MeasuredAsyncQueuePool, **config.engine_options)
+
+        return cls(
+            create_engine(config.async_database_url),
+            [create_engine(url) for url in config.async_replica_urls],
+            config.replica_max_lag_seconds,
+            config.replica_health_interval_seconds,
+        )
+
+    def bind_for(self, clause: Optional[Any], flushing: bool) -> Engine:
+        """The engine a session runs `clause` on.
+
+        Args:
+            clause (Optional[Any]): The statement, None when the session asks for a connection.
+            flushing (bool): Whether the session is flushing its pending changes.
+        Returns:
+            Engine: The synchronous engine of the primary or of a replica.
+        """
+        routing = _read_routing.get()
+        if routing is not None and routing.replicas and not flushing and isinstance(clause, Select):
+            replica = self._read_replica()
+            if replica is not None:
+                return replica.engine.sync_engine
+        elif routing is not None and (flushing or isinstance(clause, UpdateBase)):
+            routing.wrote = True
+        return self.primary.sync_engine
+
+    def metrics(self) -> Dict[str, Any]:
+        """The pool metrics of the primary and of every replica, with the replication state of the replicas."""
+        replicas: List[Dict[str, Any]] = [
+            {
+                "url": replica.url,
+                "healthy": replica.healthy,
+                "lag_seconds": replica.lag_seconds,
+                "pool": self._pool_metrics(replica.engine),
+            }
+            for replica in self.replicas
+        ]
+        return {"primary": self._pool_metrics(self.primary), "replicas": replicas}
+
+    async def dispose(self) -> None:
+        """Close the connections of every pool."""
+        if self._health_check is not None:
+            self._health_check.cancel()
+            self._health_check = None
+        for engine in [self.primary, *(replica.engine for replica in self.replicas)]:
+            await engine.dispose()
+
+    def _read_replica(self) -> Optional[DatabaseReplica]:
+        self._schedule_health_check()
+        candidates = [
+            replica
+            for replica in self.replicas
+            if replica.healthy and replica.lag_seconds is not None and replica.lag_seconds <= self.max_lag_seconds
+        ]
+        return min(candidates, key=lambda replica: self._checked_out(replica.engine), default=None)
+
+    def _schedule_health_check(self) -> None:
+        loop = asyncio.get_running_loop()
+        if not self.replicas or loop.time() - self._health_checked_at < self.health_interval_seconds:
+            return
+        if self._health_check is not None and not self._health_check.done():
+            return
+        self._health_checked_at = loop.time()
+        # A fresh context: the checks must not inherit the read routing of the request that started them
+        self._health_check = contextvars.Context().run(asyncio.ensure_future, self._check_health())
+
+    async def _check_health(self) -> None:
+        await asyncio.gather(*(self._check_replica(replica) for replica in self.replicas))
+
+    async def _check_replica(self, replica: DatabaseReplica) -> None:
+        try:
+            async with replica.engine.connect() as connection:
+                replica.lag_seconds = float(await connection.scalar(REPLICATION_LAG_QUERY))
+        except (SQLAlchemyError, OSError, asyncio.TimeoutError):
+            replica.healthy = False
+            return
+        replica.healthy = True
+
+    @staticmethod
+    def _watch_disconnects(replica: DatabaseReplica) -> None:
+        """Stop reading from a replica as soon as one of its connections is lost, until the next check."""
+
+        @event.listens_for(replica.engine.sync_engine, "handle_error")
+        def on_error(context: ExceptionContext) -> None:
+            if context.is_disconnect:
+                replica.healthy = False
+
+    @staticmethod
+    def _pool_metrics(engine: AsyncEngine) -> Dict[str, Any]:
+        pool = engine.pool
+        if isinstance(pool, MeasuredAsyncQueuePool):
+            return pool.metrics()
+        return {"status": pool.status()}
+
+    @staticmethod
+    def _checked_out(engine: AsyncEngine) -> int:
+        pool = engine.pool
+        return pool.checkedout() if isinstance(pool, MeasuredAsyncQueuePool) else 0
@@ -0,0 +1,58 @@
+import math
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+# Checkout waits kept for the percentiles, the most recent ones
+WAIT_SAMPLES = 1000
+
+
+class MeasuredAsyncQueuePool(AsyncAdaptedQueuePool):
+    """The asyncio queue pool of SQLAlchemy, recording how long each checkout waited for a connection.
+
+    The wait includes opening a new connection when the pool was not full yet, and the pre-ping.
+    """
+
+    def __init__(self, creator: Callable[..., Any], pool_size: int = 5, max_overflow: int = 10, **kwargs: Any):
+        super().__init__(creator, pool_size=pool_size, max_overflow=max_overflow, **kwargs)
+        self.capacity = pool_size + max(max_overflow, 0)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.peak_checked_out = 0
+        self.waits: Deque[float] = deque(maxlen=WAIT_SAMPLES)
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.timeouts += 1
+            raise
+        self.waits.append(time.perf_counter() - start)
+        self.checkouts += 1
+        self.peak_checked_out = max(self.peak_checked_out, self.checkedout())
+        return connection
+
+    def metrics(self) -> Dict[str, Any]:
+        """Size, utilization and checkout waits of the pool, the waits in milliseconds."""
+        waits = sorted(wait * 1000 for wait in self.waits)
+
+        def percentile(fraction: float) -> float:
+            return round(waits[max(0, math.ceil(fraction * len(waits)) - 1)], 3) if waits else 0.0
+
+        return {
+            "size": self.size(),
+            "capacity": self.capacity,
+            "checked_out": self.checkedout(),
+            "idle": self.checkedin(),
+            "utilization": round(self.checkedout() / self.capacity, 3),
+            "peak_utilization": round(self.peak_checked_out / self.capacity, 3),
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "checkout_wait_p50_ms": percentile(0.5),
+            "checkout_wait_p99_ms": percentile(0.99),
+            "checkout_wait_max_ms": round(waits[-1], 3) if waits else 0.0,
+        }
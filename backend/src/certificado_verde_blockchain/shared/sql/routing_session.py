@@ -0,0 +1,20 @@
+from typing import Any, Optional, Union
+
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+from .database_router import DatabaseRouter
+
+
+class RoutingSession(Session):
+    """The session behind the `AsyncSession` of the application, taking the engine of each statement from a router."""
+
+    def __init__(self, router: DatabaseRouter, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.router = router
+
+    # SQLAlchemy passes mapper and clause by keyword; the router only needs the statement
+    def get_bind(  # pylint: disable=unused-argument
+        self, mapper: Optional[Any] = None, clause: Optional[Any] = None, **kw: Any
+    ) -> Union[Engine, Connection]:
+        return self.router.bind_for(clause, self._flushing)
@@ -0,0 +1,154 @@
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type, TypeVar, cast
+from uuid import UUID
+
+import sqlalchemy as sa
+from pydantic import BaseModel
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession as DatabaseSession
+
+from ..domain import IUnitOfWork
+from ..errors import DomainException
+from .base import Base
+
+T = TypeVar("T", bound=BaseModel)
+
+
+class SqlUnitOfWork(IUnitOfWork):
+    """Unit of work over the database session of a scope, shared by the repositories of every bounded context.
+
+    Domain objects found or saved through a repository are kept in an identity map, so finding one again in the
+    same scope is served from memory. Saved entities are staged rather than merged: `commit` writes each table
+    with a single `INSERT ... ON CONFLICT DO UPDATE`, in the order the tables were first staged, and commits
+    them in one transaction.
+    """
+
+    def __init__(self, database_session: DatabaseSession):
+        self._db_session = database_session
+        self._identity_map: Dict[Tuple[type, UUID], BaseModel] = {}
+        # Rows staged per table, by primary key: saving the same row again replaces it
+        self._staged: Dict[sa.Table, Dict[Tuple[Any, ...], Dict[str, Any]]] = {}
+        self._conflict_messages: Dict[sa.Table, str] = {}
+
+    def find(self, domain_type: Type[T], object_id: UUID) -> Optional[T]:
+        """A copy of the domain object of this type and ID found or saved earlier in the scope.
+
+        Args:
+            domain_type (Type[T]): The type of the domain object.
+            object_id (UUID): Its unique identifier.
+        Returns:
+            Optional[T]: The domain object, or None if it was not found or saved in the scope.
+        """
+        domain_object = self._identity_map.get((domain_type, object_id))
+        if domain_object is None:
+            return None
+        # Callers change their copy freely, as they would one loaded from the database
+        return domain_object.model_copy(deep=True)  # type: ignore[return-value]
+
+    def find_many(self, domain_type: Type[T], object_ids: Sequence[UUID]) -> Tuple[List[T], List[UUID]]:
+        """Copies of the domain objects of this type found or saved earlier in the scope, see `find`.
+
+        Args:
+            domain_type (Type[T]): The type of the domain objects.
+            object_ids (Sequence[UUID]): Their unique identifiers; repeated ones are looked up once.
+        Returns:
+            Tuple[List[T], List[UUID]]: The domain objects of the scope, and the IDs left to load from the database.
+        """
+        found: List[T] = []
+        missing: List[UUID] = []
+        for object_id in dict.fromkeys(object_ids):
+            domain_object = self.find(domain_type, object_id)
+            if domain_object is None:
+                missing.append(object_id)
+            else:
+                found.append(domain_object)
+        return found, missing
+
+    def find_first(self, domain_type: Type[T], predicate: Callable[[T], bool]) -> Optional[T]:
+        """A copy of a domain object of this type found or saved earlier in the scope that matches a predicate.
+
+        Args:
+            domain_type (Type[T]): The type of the domain object.
+            predicate (Callable[[T], bool]): Whether a domain object is the one looked for.
+        Returns:
+            Optional[T]: The first matching domain object, or None if none in the scope matches.
+        """
+        for (object_type, _), domain_object in self._identity_map.items():
+            if object_type is domain_type and predicate(cast(T, domain_object)):
+                return cast(T, domain_object.model_copy(deep=True))
+        return None
+
+    def track(self, domain_object: BaseModel) -> None:
+        """Keep a copy of a domain object found or saved by a repository, for `find` to serve.
+
+        Args:
+            domain_object (BaseModel): The domain object, identified by its `id`.
+        """
+        self._identity_map[(type(domain_object), getattr(domain_object, "id"))] = domain_object.model_copy(deep=True)
+
+    def stage(self, entity: Base, conflict_message: str) -> None:
+        """Stage an entity to be inserted, or updated if its primary key exists, when the unit of work commits.
+
+        Args:
+            entity (Base): The entity, with every column set.
+            conflict_message (str): The message of the 409 error raised if the write breaks a constraint.
+        """
+        row = {
+            attribute.columns[0].key: getattr(entity, attribute.key)
+            for attribute in sa.inspect(type(entity)).column_attrs
+        }
+        self.stage_row(entity.__table__, row, conflict_message)
+
+    def stage_row(self, table: sa.Table, row: Dict[str, Any], conflict_message: str) -> None:
+        """Stage a row of a table without an entity, such as an association table, see `stage`.
+
+        Args:
+            table (sa.Table): The table.
+            row (Dict[str, Any]): The value of every column, by column key.
+            conflict_message (str): The message of the 409 error raised if the write breaks a constraint.
+        """
+        primary_key = tuple(row[column.key] for column in table.primary_key.columns)
+        self._staged.setdefault(table, {})[primary_key] = row
+        self._conflict_messages[table] = conflict_message
+
+    async def commit(self) -> None:
+        """Write every staged row and commit, ending the transaction of the session.
+
+        Raises:
+            DomainException: With the conflict message of the table written, if a row breaks a constraint.
+        """
+        staged, self._staged = self._staged, {}
+        conflict_messages, self._conflict_messages = self._conflict_messages, {}
+        table: Optional[sa.Table] = None
+        try:
+            for table, rows in staged.items():
+                await self._upsert(table, list(rows.values()))
+            await self._db_session.commit()
+        except IntegrityError as integrity_error:
+            await self._rollback()
+            raise DomainException(
+                conflict_messages[table] if table is not None else "Integrity error while saving",
+                code=409,  # Conflict
+            ) from integrity_error
+        except:
+            await self._rollback()
+            raise
+
+    async def _upsert(self, table: sa.Table, rows: List[Dict[str, Any]]) -> None:
+        statement = insert(table)
+        updated_columns = {
+            column.key: statement.excluded[column.key] for column in table.columns if not column.primary_key
+        }
+        if updated_columns:
+            statement = statement.on_conflict_do_update(
+                index_elements=list(table.primary_key.columns), set_=updated_columns
+            )
+        else:
+            statement = statement.on_conflict_do_nothing()
+        # A single statement for the table, executed with every row in one batch
+        await self._db_session.execute(statement, rows)
+
+    async def _rollback(self) -> None:
+        await self._db_session.rollback()
+        # Objects saved in the scope may not have been written: find them in the database again
+        self._identity_map.clear()
@@ -0,0 +1,63 @@
+import json
+from typing import Any, List, Sequence, Tuple, Type
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import Insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession as DatabaseSession
+
+from .base import Base
+
+
+class StagingTable:
+    """A temporary copy of the table of an entity, to load rows in bulk with `COPY` and insert them set-wise.
+
+    The staging table lives in the transaction of the session and is dropped when it commits or rolls back,
+    so the rows are merged into the entity table, with `insert()`, before committing.
+    """
+
+    def __init__(self, entity_type: Type[Base]):
+        self.target: sa.Table = entity_type.__table__
+        self.name = f"staging_{self.target.name}"
+        self._attributes: List[Tuple[str, sa.Column]] = [
+            (attribute.key, attribute.columns[0]) for attribute in sa.inspect(entity_type).column_attrs
+        ]
+        self.columns = [column.name for _, column in self._attributes]
+        self.table = sa.table(self.name, *(sa.column(column) for column in self.columns))
+
+    async def create(self, database_session: DatabaseSession) -> None:
+        """Create the staging table, empty, in the transaction of the session."""
+        await database_session.execute(
+            sa.text(f"CREATE TEMPORARY TABLE {self.name} (LIKE {self.target.name} INCLUDING DEFAULTS) ON COMMIT DROP")
+        )
+
+    async def copy(self, database_session: DatabaseSession, entities: Sequence[Base]) -> None:
+        """Load entities into the staging table with a binary `COPY`, in a single round trip.
+
+        Args:
+            database_session (DatabaseSession): The session the staging table was created in.
+            entities (Sequence[Base]): The entities to load, of the type of the staging table.
+        """
+        if not entities:
+            return
+        connection = await database_session.connection()
+        driver_connection = (await connection.get_raw_connection()).driver_connection
+        assert driver_connection is not None  # Set as long as the connection is checked out
+        await driver_connection.copy_records_to_table(
+            self.name, records=[self._record(entity) for entity in entities], columns=self.columns
+        )
+
+    def insert(self) -> Insert:
+        """The `INSERT ... SELECT` of every staged row into the entity table, to complete with `ON CONFLICT`
+        or `RETURNING` clauses."""
+        return pg_insert(self.target).from_select(self.columns, sa.select(*self.table.columns))
+
+    def _record(self, entity: Base) -> Tuple[Any, ...]:
+        values: List[Any] = []
+        for key, column in self._attributes:
+            value = getattr(entity, key)
+            # The JSON codecs SQLAlchemy sets on asyncpg connections take the already serialized document
+            if isinstance(column.type, sa.JSON) and value is not None:
+                value = json.dumps(value)
+            values.append(value)
+        return tuple(values)
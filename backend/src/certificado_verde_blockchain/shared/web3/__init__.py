@@ -0,0 +1,21 @@
+from .in_process_chain import InProcessAsyncProvider, InProcessChain
+from .pooled_async_http_provider import PooledAsyncHTTPProvider
+from .request_batching_middleware import RequestBatchingMiddleware
+from .response_cache_middleware import ResponseCacheMiddleware
+from .routing_async_provider import ProviderEndpoint, RoutingAsyncProvider, hedged_reads, pinned_reads, read_routing
+from .signature_recovery import RecoveryResult, recover_signers
+
+__all__ = [
+    "InProcessAsyncProvider",
+    "InProcessChain",
+    "PooledAsyncHTTPProvider",
+    "ProviderEndpoint",
+    "RecoveryResult",
+    "RequestBatchingMiddleware",
+    "ResponseCacheMiddleware",
+    "RoutingAsyncProvider",
+    "hedged_reads",
+    "pinned_reads",
+    "read_routing",
+    "recover_signers",
+]
@@ -0,0 +1,138 @@
+import json
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from eth_account import Account
+from web3.providers.async_base import AsyncBaseProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+from ..errors import DomainException
+
+# Ether given to every configured account; the default eth-tester accounts hold 1,000,000 each
+ACCOUNT_BALANCE_WEI = 10_000 * 10**18
+# eth_call and eth_estimateGas without a sender run as the first account, as Hardhat does
+CALLS_WITH_SENDER = frozenset({"eth_call", "eth_estimateGas"})
+
+
+class InProcessAsyncProvider(AsyncBaseProvider):
+    """AsyncWeb3 provider answering JSON-RPC requests from an in-process eth-tester chain.
+
+    Unlike web3's `AsyncEthereumTesterProvider`, requests and results are converted to and from the
+    JSON-RPC format inside `make_request` instead of in a middleware appended after the configured ones,
+    so middleware calling the provider directly (such as request batching) and raw batch requests get
+    the same responses as from a node. Batch requests are answered one request after the other.
+    """
+
+    def __init__(self, ethereum_tester: Any) -> None:
+        super().__init__()
+        # Not a default dependency of web3: only imported when an in-process chain is created
+        from web3.providers.eth_tester.defaults import API_ENDPOINTS
+        from web3.providers.eth_tester.main import _make_request
+        from web3.providers.eth_tester.middleware import request_formatters, result_formatters
+
+        self.ethereum_tester = ethereum_tester
+        self._api_endpoints = API_ENDPOINTS
+        self._handle = _make_request
+        self._request_formatters = request_formatters
+        self._result_formatters = result_formatters or {}
+        self._request_id = 0
+
+    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        params = list(params or [])
+        if method in CALLS_WITH_SENDER and params and "from" not in params[0]:
+            params[0] = {**params[0], "from": self.ethereum_tester.get_accounts()[0]}
+        if method in self._request_formatters:
+            params = self._request_formatters[method](params)
+
+        self._request_id += 1
+        response = self._handle(method, params, self._api_endpoints, self.ethereum_tester, repr(self._request_id))
+        if "result" in response and method in self._result_formatters:
+            response = {**response, "result": self._result_formatters[method](response["result"])}
+        return response
+
+    async def make_batch_request(
+        self, requests: List[Tuple[RPCEndpoint, Any]]
+    ) -> Union[List[RPCResponse], RPCResponse]:
+        return [await self.make_request(method, params) for method, params in requests]
+
+    async def is_connected(self, show_traceback: bool = False) -> bool:
+        return True
+
+    async def connect(self) -> None:
+        pass  # Nothing to open: the chain runs in this process
+
+    async def disconnect(self) -> None:
+        pass  # Nothing to close: the chain lives as long as the process
+
+
+class InProcessChain:
+    """An Ethereum chain running inside the process (eth-tester on py-evm), for local runs and tests.
+
+    Every transaction is mined as soon as it is sent. The configured accounts are funded at creation,
+    so the backend signs and sends transactions exactly as it does against a node, and contracts are
+    deployed from their Hardhat artifacts. The chain lives in memory: it starts empty on every run.
+
+    Requires the optional `in-process` extra (`eth-tester[py-evm]`).
+    """
+
+    def __init__(self, private_keys: Sequence[str]) -> None:
+        try:
+            from eth_tester import EthereumTester, PyEVMBackend
+        except ImportError as e:
+            raise DomainException(
+                "The in-process blockchain requires eth-tester: "
+                "install the `in-process` extra with `poetry install --extras in-process`."
+            ) from e
+
+        self.ethereum_tester = EthereumTester(PyEVMBackend())
+        funder = self.ethereum_tester.get_accounts()[0]
+        for private_key in private_keys:
+            address = self.ethereum_tester.add_account(private_key)
+            self.ethereum_tester.send_transaction(
+                {"from": funder, "to": address, "value": ACCOUNT_BALANCE_WEI, "gas": 21000}
+            )
+        self._provider: Optional[InProcessAsyncProvider] = None
+
+    @property
+    def provider(self) -> InProcessAsyncProvider:
+        """The AsyncWeb3 provider of the chain, shared by every client."""
+        if self._provider is None:
+            self._provider = InProcessAsyncProvider(self.ethereum_tester)
+        return self._provider
+
+    def deploy(self, artifact_path: str, private_key: str) -> str:
+        """Deploy a contract without constructor arguments from its Hardhat artifact.
+
+        Args:
+            artifact_path (str): Path to the artifact, with the `bytecode` key Hardhat writes next to the ABI.
+            private_key (str): The key of the deployer, one of the funded accounts.
+        Returns:
+            str: The checksum address of the deployed contract.
+        """
+        with open(artifact_path, "r", encoding="utf-8") as artifact_file:
+            bytecode = json.load(artifact_file).get("bytecode")
+        if not bytecode or bytecode == "0x":
+            raise DomainException(f"Artifact {artifact_path} has no bytecode to deploy: compile the contracts first.")
+
+        receipt = self.transact(private_key, None, bytecode)
+        return str(receipt["contract_address"])
+
+    def transact(self, private_key: str, to: Optional[str], data: str) -> Dict[str, Any]:
+        """Send a transaction from one of the funded accounts, mined right away.
+
+        Args:
+            private_key (str): The key of the sender.
+            to (Optional[str]): The recipient, None to create a contract.
+            data (str): The hex encoded call data or creation code.
+        Returns:
+            Dict[str, Any]: The receipt, in eth-tester format.
+        """
+        transaction: Dict[str, Any] = {"from": Account.from_key(private_key).address, "data": data}
+        if to is not None:
+            transaction["to"] = to
+        transaction["gas"] = self.ethereum_tester.estimate_gas(transaction)
+        receipt: Dict[str, Any] = self.ethereum_tester.get_transaction_receipt(
+            self.ethereum_tester.send_transaction(transaction)
+        )
+        if receipt.get("status") == 0:
+            raise DomainException(f"Transaction {receipt['transaction_hash']} of the in-process chain failed.")
+        return receipt
@@ -0,0 +1,71 @@
+import asyncio
+from typing import Any, List, Optional, Tuple, Union
+
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+from web3 import AsyncHTTPProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+
+class PooledAsyncHTTPProvider(AsyncHTTPProvider):
+    """AsyncHTTPProvider backed by a shared keep-alive connection pool.
+
+    The stock provider opens its aiohttp session with `force_close=True`, paying a new TCP (and TLS)
+    handshake for every JSON-RPC call. This provider caches one session per event loop whose connector
+    keeps connections alive and caps how many are open to the node at the same time.
+
+    It also counts the HTTP round trips and the JSON-RPC calls they carried, for benchmarks and diagnostics.
+    """
+
+    def __init__(
+        self,
+        endpoint_uri: str,
+        pool_size: int,
+        keepalive_seconds: float,
+        timeout_seconds: float,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(endpoint_uri, request_kwargs={"timeout": ClientTimeout(total=timeout_seconds)}, **kwargs)
+        self.pool_size = pool_size
+        self.keepalive_seconds = keepalive_seconds
+        self._session: Optional[ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.http_requests = 0
+        self.rpc_calls = 0
+
+    async def _ensure_session(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._session is not None and not self._session.closed and self._session_loop is loop:
+            return
+
+        session = ClientSession(
+            raise_for_status=True,
+            connector=TCPConnector(limit=self.pool_size, keepalive_timeout=self.keepalive_seconds),
+        )
+        self._session = await self.cache_async_session(session)
+        self._session_loop = loop
+        if self._session is not session:
+            # A session was already cached for this loop, keep using it
+            await session.close()
+
+    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        await self._ensure_session()
+        self.http_requests += 1
+        self.rpc_calls += 1
+        return await super().make_request(method, params)
+
+    async def make_batch_request(
+        self, batch_requests: List[Tuple[RPCEndpoint, Any]]
+    ) -> Union[List[RPCResponse], RPCResponse]:
+        await self._ensure_session()
+        self.http_requests += 1
+        self.rpc_calls += len(batch_requests)
+        return await super().make_batch_request(batch_requests)
+
+    async def connect(self) -> None:
+        """Open the pooled session of the running event loop ahead of the first request."""
+        await self._ensure_session()
+
+    async def disconnect(self) -> None:
+        await super().disconnect()
+        self._session = None
+        self._session_loop = None
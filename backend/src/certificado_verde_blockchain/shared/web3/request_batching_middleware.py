@@ -0,0 +1,108 @@
+import asyncio
+import contextvars
+from typing import Any, Callable, List, Optional, Set, Tuple, cast
+
+from web3 import AsyncWeb3
+from web3.middleware.base import Web3Middleware
+from web3.providers.async_base import AsyncBaseProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+from .routing_async_provider import read_routing
+
+# Sends keep their own round trip: some nodes process batch items concurrently, which could reorder nonces
+UNBATCHED_METHODS = frozenset({"eth_sendRawTransaction", "eth_sendTransaction"})
+
+PendingRequest = Tuple[RPCEndpoint, Any, "asyncio.Future[RPCResponse]"]
+
+
+class RequestBatchingMiddleware(Web3Middleware):
+    """Combines the JSON-RPC requests issued concurrently on an AsyncWeb3 into batch payloads.
+
+    A request waits for the batch window (by default, until the other tasks of the current event loop
+    iteration had their turn) and is then sent in a single `make_batch_request` with every request that
+    arrived meanwhile, up to `max_size`. Callers still get their own response, so it is transparent to
+    web3's formatters and to the contract API. A lone request is sent as a plain request, so sequential
+    code pays nothing but the window.
+
+    Reads with their own routing (`hedged_reads`, `pinned_reads`) are not batched, since a batch is sent
+    to a single endpoint. It must be the innermost middleware: batched requests go straight to the provider.
+    """
+
+    def __init__(self, w3: AsyncWeb3, window_ms: float = 0, max_size: int = 100) -> None:
+        super().__init__(w3)
+        self.window_seconds = window_ms / 1000
+        self.max_size = max_size
+        self._pending: List[PendingRequest] = []
+        self._flush_task: Optional["asyncio.Task[None]"] = None
+        self._sending: Set["asyncio.Task[None]"] = set()
+
+    @classmethod
+    def build(cls, window_ms: float, max_size: int) -> Callable[[AsyncWeb3], "RequestBatchingMiddleware"]:
+        """Configure the middleware for `AsyncWeb3(middleware=...)` or `middleware_onion.add`.
+
+        Args:
+            window_ms (float): Milliseconds a request waits for others to share its batch.
+            max_size (int): Maximum number of requests in a batch (1 disables batching).
+        Returns:
+            Callable[[AsyncWeb3], RequestBatchingMiddleware]: The middleware factory.
+        """
+        return lambda w3: cls(w3, window_ms, max_size)
+
+    async def async_wrap_make_request(self, make_request: Callable[..., Any]) -> Callable[..., Any]:
+        async def middleware(method: RPCEndpoint, params: Any) -> RPCResponse:
+            if self.max_size <= 1 or method in UNBATCHED_METHODS or read_routing() is not None:
+                response: RPCResponse = await make_request(method, params)
+                return response
+
+            loop = asyncio.get_running_loop()
+            future: "asyncio.Future[RPCResponse]" = loop.create_future()
+            self._pending.append((method, params, future))
+            if len(self._pending) >= self.max_size:
+                self._flush(make_request)
+            elif self._flush_task is None or self._flush_task.done():
+                # A fresh context: the batch must not inherit the context of the request that started it
+                self._flush_task = contextvars.Context().run(loop.create_task, self._flush_later(make_request))
+            return await future
+
+        return middleware
+
+    async def _flush_later(self, make_request: Callable[..., Any]) -> None:
+        await asyncio.sleep(self.window_seconds)
+        self._flush_task = None
+        while self._pending:
+            self._flush(make_request)
+
+    def _flush(self, make_request: Callable[..., Any]) -> None:
+        batch, self._pending = self._pending[: self.max_size], self._pending[self.max_size :]
+        task = contextvars.Context().run(asyncio.ensure_future, self._send(batch, make_request))
+        # The event loop only keeps weak references to tasks
+        self._sending.add(task)
+        task.add_done_callback(self._sending.discard)
+
+    async def _send(self, batch: List[PendingRequest], make_request: Callable[..., Any]) -> None:
+        try:
+            if len(batch) == 1:
+                method, params, _ = batch[0]
+                responses: Any = [await make_request(method, params)]
+            else:
+                # The middleware is only installed on AsyncWeb3 clients
+                responses = await cast(AsyncBaseProvider, self._w3.provider).make_batch_request(
+                    [(method, params) for method, params, _ in batch]
+                )
+                if not isinstance(responses, list):
+                    responses = [responses] * len(batch)  # The node rejected the whole batch
+                elif len(responses) != len(batch):
+                    raise ValueError(f"Batch of {len(batch)} requests got {len(responses)} responses.")
+        except asyncio.CancelledError:
+            for _, _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, _, future), response in zip(batch, responses):
+            if not future.done():
+                future.set_result(response)
@@ -0,0 +1,148 @@
+import asyncio
+import copy
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple
+
+from hexbytes import HexBytes
+from web3 import AsyncWeb3
+from web3.middleware.base import Web3Middleware
+from web3.types import RPCEndpoint, RPCResponse
+
+# Responses that never change, whatever the block
+ALWAYS_IMMUTABLE_METHODS = frozenset({"eth_chainId", "eth_getBlockByHash"})
+# Responses that never change once the block they come from is deep enough below the head
+CONFIRMED_METHODS = frozenset(
+    {"eth_getTransactionReceipt", "eth_getTransactionByHash", "eth_getBlockByNumber", "eth_call"}
+)
+# A response too close to the head is checked against a fresh head at most this often
+HEAD_REFRESH_SECONDS = 1.0
+
+CacheKey = Tuple[str, str]
+
+
+def _json_default(value: Any) -> str:
+    if isinstance(value, (bytes, bytearray)):
+        return HexBytes(value).to_0x_hex()
+    return str(value)
+
+
+def _block_number(value: Any) -> Optional[int]:
+    """The block number of a block parameter or response field, None for tags such as "latest"."""
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str) and value.startswith("0x"):
+        return int(value, 16)
+    return None
+
+
+class ResponseCacheMiddleware(Web3Middleware):
+    """Keeps the JSON-RPC responses that can no longer change in a bounded LRU cache.
+
+    `eth_chainId` and blocks by hash are cached as soon as they are seen. Receipts and transactions by
+    hash, blocks by number and `eth_call` at a block number are only cached once their block is at least
+    `confirmations` blocks below the head, so a reorg can never serve a stale answer; calls at a tag
+    such as "latest" and pending transactions are never cached. The head is learnt from the
+    `eth_blockNumber` calls going through the middleware, and fetched when a response is too recent
+    for the last head seen (at most once per second).
+
+    A cache size of 0 disables it.
+    """
+
+    def __init__(self, w3: AsyncWeb3, max_entries: int = 10000, confirmations: int = 12) -> None:
+        super().__init__(w3)
+        self.max_entries = max_entries
+        self.confirmations = confirmations
+        self._entries: "OrderedDict[CacheKey, Any]" = OrderedDict()
+        self._head: Optional[int] = None
+        self._head_checked_at = float("-inf")
+        self._head_request: Optional["asyncio.Future[RPCResponse]"] = None
+
+    @classmethod
+    def build(cls, max_entries: int, confirmations: int) -> Callable[[AsyncWeb3], "ResponseCacheMiddleware"]:
+        """Configure the middleware for `AsyncWeb3(middleware=...)` or `middleware_onion.add`.
+
+        Args:
+            max_entries (int): Maximum number of cached responses (0 disables the cache).
+            confirmations (int): Blocks a response must be below the head to be cached.
+        Returns:
+            Callable[[AsyncWeb3], ResponseCacheMiddleware]: The middleware factory.
+        """
+        return lambda w3: cls(w3, max_entries, confirmations)
+
+    async def async_wrap_make_request(self, make_request: Callable[..., Any]) -> Callable[..., Any]:
+        async def middleware(method: RPCEndpoint, params: Any) -> RPCResponse:
+            key = self._key(method, params)
+            if key is None:
+                response: RPCResponse = await make_request(method, params)
+                if method == "eth_blockNumber":
+                    self._observe_head(response.get("result"))
+                return response
+
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return {"jsonrpc": "2.0", "id": 0, "result": copy.deepcopy(self._entries[key])}
+
+            response = await make_request(method, params)
+            if await self._is_immutable(method, params, response, make_request):
+                self._entries[key] = copy.deepcopy(response["result"])
+                if len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+            return response
+
+        return middleware
+
+    def _key(self, method: RPCEndpoint, params: Any) -> Optional[CacheKey]:
+        if self.max_entries <= 0:
+            return None
+        if method in ("eth_getBlockByNumber", "eth_call"):
+            block = params[0] if method == "eth_getBlockByNumber" else (params[1] if len(params) > 1 else None)
+            if _block_number(block) is None:
+                return None
+        elif method not in ALWAYS_IMMUTABLE_METHODS and method not in CONFIRMED_METHODS:
+            return None
+        return method, json.dumps(params, sort_keys=True, default=_json_default)
+
+    async def _is_immutable(
+        self, method: RPCEndpoint, params: Any, response: RPCResponse, make_request: Callable[..., Any]
+    ) -> bool:
+        result = response.get("result")
+        if "error" in response or result is None:
+            return False
+        if method in ALWAYS_IMMUTABLE_METHODS:
+            return True
+
+        if method == "eth_getBlockByNumber":
+            block_number = _block_number(params[0])
+        elif method == "eth_call":
+            block_number = _block_number(params[1])
+        else:
+            block_number = _block_number(result.get("blockNumber"))
+        if block_number is None:
+            return False  # Pending transaction
+
+        if not self._is_confirmed(block_number):
+            await self._refresh_head(make_request)
+        return self._is_confirmed(block_number)
+
+    async def _refresh_head(self, make_request: Callable[..., Any]) -> None:
+        """Fetch the head, sharing a single request between the responses waiting for it."""
+        if self._head_request is None or self._head_request.done():
+            if time.monotonic() - self._head_checked_at < HEAD_REFRESH_SECONDS:
+                return
+            self._head_checked_at = time.monotonic()
+            self._head_request = asyncio.ensure_future(make_request(RPCEndpoint("eth_blockNumber"), []))
+        try:
+            response = await asyncio.shield(self._head_request)
+        except Exception:
+            return  # Not knowing the head only means not caching this response
+        self._observe_head(response.get("result"))
+
+    def _is_confirmed(self, block_number: int) -> bool:
+        return self._head is not None and block_number <= self._head - self.confirmations
+
+    def _observe_head(self, result: Any) -> None:
+        head = _block_number(result)
+        if head is not None and (self._head is None or head > self._head):
+            self._head = head
@@ -0,0 +1,350 @@
+import asyncio
+import contextvars
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    ContextManager,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from aiohttp import ClientError
+from web3.providers.async_base import AsyncBaseProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+from .pooled_async_http_provider import PooledAsyncHTTPProvider
+
+# Reads any node in sync can answer; every other method (sends, nonces, transaction lookups, receipts,
+# gas estimates, node specific methods) goes to the pinned write endpoint, which saw the transactions sent
+ROUTED_READ_METHODS = frozenset(
+    {
+        "eth_blockNumber",
+        "eth_call",
+        "eth_chainId",
+        "eth_feeHistory",
+        "eth_gasPrice",
+        "eth_getBalance",
+        "eth_getBlockByHash",
+        "eth_getBlockByNumber",
+        "eth_getCode",
+        "eth_getLogs",
+        "eth_maxPriorityFeePerGas",
+        "net_version",
+    }
+)
+# Weight of the latest latency sample in the moving average of an endpoint
+LATENCY_EWMA_ALPHA = 0.3
+# Errors of the transport, after which a request is retried on another endpoint; JSON-RPC errors are answers
+FAILOVER_ERRORS = (ClientError, asyncio.TimeoutError, OSError)
+
+_read_routing: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("read_routing", default=None)
+
+T = TypeVar("T")
+
+
+@contextmanager
+def _routing(mode: str) -> Iterator[None]:
+    token = _read_routing.set(mode)
+    try:
+        yield
+    finally:
+        _read_routing.reset(token)
+
+
+def hedged_reads() -> ContextManager[None]:
+    """Hedge the routed reads made inside the block (including by the tasks it starts).
+
+    A hedged read goes to the fastest endpoint and, if it has not answered within the hedge delay, to the
+    next fastest as well; the first answer wins. Use it for the few latency-critical calls only, since
+    every slow read costs a second request.
+    """
+    return _routing("hedged")
+
+
+def pinned_reads() -> ContextManager[None]:
+    """Send the reads made inside the block to the pinned write endpoint.
+
+    Use it to read the effects of a transaction right after its receipt: another endpoint may still be
+    a few blocks behind.
+    """
+    return _routing("pinned")
+
+
+def read_routing() -> Optional[str]:
+    """The routing the current context asked for its reads ("hedged" or "pinned"), None for the default."""
+    return _read_routing.get()
+
+
+@dataclass
+class ProviderEndpoint:
+    """A node behind the router, with what the router knows of its health.
+
+    Attributes:
+        provider (PooledAsyncHTTPProvider): The provider sending the requests to the node.
+        latency (Optional[float]): Moving average of the request latency in seconds, None until measured.
+        block_number (Optional[int]): The last head reported by the node.
+        healthy (bool): False from a transport failure until a request or health check succeeds again.
+    """
+
+    provider: PooledAsyncHTTPProvider
+    latency: Optional[float] = None
+    block_number: Optional[int] = None
+    healthy: bool = True
+
+    @property
+    def url(self) -> str:
+        return str(self.provider.endpoint_uri)
+
+    def observe(self, seconds: float) -> None:
+        if self.latency is None:
+            self.latency = seconds
+        else:
+            self.latency += LATENCY_EWMA_ALPHA * (seconds - self.latency)
+
+
+class RoutingAsyncProvider(AsyncBaseProvider):
+    """Spreads JSON-RPC requests over several nodes of the same chain, failing over between them.
+
+    - Reads (`ROUTED_READ_METHODS`) go to the healthy endpoint with the lowest moving average latency
+      among those at most `max_block_lag` blocks behind the highest head seen.
+    - Everything else, transaction sends and nonce queries first, is pinned to one endpoint, so the
+      nonces and pending transactions seen by the backend stay consistent. The pin only moves when its
+      endpoint fails, to the first healthy endpoint in configuration order.
+    - A request failing in transport marks its endpoint unhealthy and is retried on the next candidate;
+      if every endpoint is unhealthy, all of them are still tried in order.
+    - Reads made under `hedged_reads()` are hedged after `hedge_delay_ms`, reads made under
+      `pinned_reads()` go to the pinned endpoint.
+
+    Endpoints are probed with `eth_blockNumber` at most every `health_interval_seconds`, from the
+    requests themselves, so no background task outlives the event loop.
+    """
+
+    def __init__(
+        self,
+        providers: Sequence[PooledAsyncHTTPProvider],
+        health_interval_seconds: float = 5,
+        max_block_lag: int = 3,
+        hedge_delay_ms: float = 0,
+    ) -> None:
+        if not providers:
+            raise ValueError("At least one provider is required.")
+        super().__init__()
+        self.endpoints = [ProviderEndpoint(provider) for provider in providers]
+        self.health_interval_seconds = health_interval_seconds
+        self.max_block_lag = max_block_lag
+        self.hedge_delay_seconds = hedge_delay_ms / 1000
+        self._write_endpoint = self.endpoints[0]
+        self._health_checked_at = float("-inf")
+        self._health_check: Optional["asyncio.Task[None]"] = None
+
+    @classmethod
+    def from_urls(
+        cls,
+        urls: Sequence[str],
+        pool_size: int,
+        keepalive_seconds: float,
+        timeout_seconds: float,
+        health_interval_seconds: float = 5,
+        max_block_lag: int = 3,
+        hedge_delay_ms: float = 0,
+    ) -> "RoutingAsyncProvider":
+        """Route over one pooled HTTP provider per URL, the first URL being preferred for transactions.
+
+        Args:
+            urls (Sequence[str]): The URLs of the nodes.
+            pool_size (int): Maximum number of simultaneous connections to each node.
+            keepalive_seconds (float): Seconds an idle connection is kept open.
+            timeout_seconds (float): Timeout of a single request, after which it fails over.
+            health_interval_seconds (float): Minimum seconds between two health checks.
+            max_block_lag (int): Blocks a node may lag behind the others and still serve reads.
+            hedge_delay_ms (float): Milliseconds before a hedged read is sent to a second node (0: never).
+        Returns:
+            RoutingAsyncProvider: The routing provider.
+        """
+        providers = [
+            PooledAsyncHTTPProvider(
+                url, pool_size=pool_size, keepalive_seconds=keepalive_seconds, timeout_seconds=timeout_seconds
+            )
+            for url in urls
+        ]
+        return cls(providers, health_interval_seconds, max_block_lag, hedge_delay_ms)
+
+    @property
+    def write_endpoint(self) -> ProviderEndpoint:
+        """The endpoint transactions and nonce queries are currently pinned to."""
+        return self._write_endpoint
+
+    @property
+    def http_requests(self) -> int:
+        return sum(endpoint.provider.http_requests for endpoint in self.endpoints)
+
+    @property
+    def rpc_calls(self) -> int:
+        return sum(endpoint.provider.rpc_calls for endpoint in self.endpoints)
+
+    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        self._schedule_health_check()
+
+        def send(provider: PooledAsyncHTTPProvider) -> Awaitable[RPCResponse]:
+            return provider.make_request(method, params)
+
+        routing = read_routing()
+        if method not in ROUTED_READ_METHODS or routing == "pinned":
+            return await self._pinned(send)
+        if routing == "hedged" and self.hedge_delay_seconds > 0 and len(self.endpoints) > 1:
+            return await self._hedged(send)
+        return await self._failover(self._read_candidates(), send)
+
+    async def make_batch_request(
+        self, requests: List[Tuple[RPCEndpoint, Any]]
+    ) -> Union[List[RPCResponse], RPCResponse]:
+        self._schedule_health_check()
+
+        def send(provider: PooledAsyncHTTPProvider) -> Awaitable[Union[List[RPCResponse], RPCResponse]]:
+            return provider.make_batch_request(requests)
+
+        if read_routing() != "pinned" and all(method in ROUTED_READ_METHODS for method, _ in requests):
+            return await self._failover(self._read_candidates(), send)
+        return await self._pinned(send)
+
+    async def is_connected(self, show_traceback: bool = False) -> bool:
+        for endpoint in self.endpoints:
+            if await endpoint.provider.is_connected(show_traceback):
+                return True
+        return False
+
+    async def connect(self) -> None:
+        for endpoint in self.endpoints:
+            await endpoint.provider.connect()
+
+    async def disconnect(self) -> None:
+        if self._health_check is not None:
+            self._health_check.cancel()
+            self._health_check = None
+        for endpoint in self.endpoints:
+            await endpoint.provider.disconnect()
+
+    def _read_candidates(self) -> List[ProviderEndpoint]:
+        """Endpoints in the order reads try them: in sync and healthy by latency, then the others."""
+        heads = [endpoint.block_number for endpoint in self.endpoints if endpoint.block_number is not None]
+        highest = max(heads, default=None)
+
+        def in_sync(endpoint: ProviderEndpoint) -> bool:
+            if highest is None or endpoint.block_number is None:
+                return True
+            return highest - endpoint.block_number <= self.max_block_lag
+
+        def rank(endpoint: ProviderEndpoint) -> Tuple[bool, float]:
+            # Endpoints never measured go first, so every endpoint gets a latency quickly
+            return not (endpoint.healthy and in_sync(endpoint)), endpoint.latency or 0.0
+
+        return sorted(self.endpoints, key=rank)
+
+    async def _pinned(self, send: Callable[[PooledAsyncHTTPProvider], Awaitable[T]]) -> T:
+        if not self._write_endpoint.healthy:
+            self._write_endpoint = next(
+                (endpoint for endpoint in self.endpoints if endpoint.healthy), self._write_endpoint
+            )
+        # Healthy endpoints first; the pin itself is unhealthy only if all the others are too
+        candidates = [self._write_endpoint] + [
+            endpoint
+            for endpoint in sorted(self.endpoints, key=lambda endpoint: not endpoint.healthy)
+            if endpoint is not self._write_endpoint
+        ]
+        return await self._failover(candidates, send, pin=True)
+
+    async def _failover(
+        self,
+        candidates: List[ProviderEndpoint],
+        send: Callable[[PooledAsyncHTTPProvider], Awaitable[T]],
+        pin: bool = False,
+    ) -> T:
+        error: Optional[BaseException] = None
+        for endpoint in candidates:
+            try:
+                result = await self._send(endpoint, send)
+            except FAILOVER_ERRORS as e:
+                error = e
+                continue
+            if pin:
+                self._write_endpoint = endpoint
+            return result
+        assert error is not None
+        raise error
+
+    async def _hedged(self, send: Callable[[PooledAsyncHTTPProvider], Awaitable[T]]) -> T:
+        attempts: Set["asyncio.Task[T]"] = set()
+        error: Optional[BaseException] = None
+        try:
+            for endpoint in self._read_candidates():
+                attempts.add(asyncio.ensure_future(self._send(endpoint, send)))
+                # Wait for an answer until the hedge delay, then add the next endpoint to the race
+                while attempts:
+                    done, attempts = await asyncio.wait(
+                        attempts, timeout=self.hedge_delay_seconds, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    if not done:
+                        break
+                    for attempt in done:
+                        error = attempt.exception()
+                        if error is None:
+                            return attempt.result()
+                        if not isinstance(error, FAILOVER_ERRORS):
+                            raise error
+            while attempts:
+                done, attempts = await asyncio.wait(attempts, return_when=asyncio.FIRST_COMPLETED)
+                for attempt in done:
+                    error = attempt.exception()
+                    if error is None:
+                        return attempt.result()
+        finally:
+            for attempt in attempts:
+                attempt.cancel()
+        assert error is not None
+        raise error
+
+    async def _send(self, endpoint: ProviderEndpoint, send: Callable[[PooledAsyncHTTPProvider], Awaitable[T]]) -> T:
+        start = time.perf_counter()
+        try:
+            result = await send(endpoint.provider)
+        except FAILOVER_ERRORS:
+            endpoint.healthy = False
+            raise
+        endpoint.observe(time.perf_counter() - start)
+        endpoint.healthy = True
+        return result
+
+    def _schedule_health_check(self) -> None:
+        if len(self.endpoints) == 1 or time.monotonic() - self._health_checked_at < self.health_interval_seconds:
+            return
+        if self._health_check is not None and not self._health_check.done():
+            return
+        self._health_checked_at = time.monotonic()
+        # A fresh context: the probes must not inherit the read routing of the request that started them
+        self._health_check = contextvars.Context().run(asyncio.ensure_future, self._check_health())
+
+    async def _check_health(self) -> None:
+        await asyncio.gather(*(self._probe(endpoint) for endpoint in self.endpoints))
+
+    async def _probe(self, endpoint: ProviderEndpoint) -> None:
+        start = time.perf_counter()
+        try:
+            response = await endpoint.provider.make_request(RPCEndpoint("eth_blockNumber"), [])
+        except FAILOVER_ERRORS:
+            endpoint.healthy = False
+            return
+        endpoint.observe(time.perf_counter() - start)
+        result = response.get("result")
+        if isinstance(result, str):
+            endpoint.block_number = int(result, 16)
+        endpoint.healthy = "error" not in response
@@ -0,0 +1,27 @@
+from typing import List, Optional, Sequence, Tuple
+
+from eth_account import Account
+from eth_account.messages import encode_defunct
+
+RecoveryResult = Tuple[Optional[str], Optional[str]]
+
+
+def recover_signers(pairs: Sequence[Tuple[str, str]]) -> List[RecoveryResult]:
+    """Recover the signer of each (message hash, signature) pair, signed as an EIP-191 personal message.
+
+    Kept free of application state so it can run in worker processes.
+
+    Args:
+        pairs (Sequence[Tuple[str, str]]): Message hashes and signatures, both hex encoded.
+    Returns:
+        List[RecoveryResult]: For each pair, the checksummed signer address and None, or None and the error.
+    """
+    results: List[RecoveryResult] = []
+    for message_hash, signature in pairs:
+        try:
+            signature_bytes = bytes.fromhex(signature[2:] if signature.startswith("0x") else signature)
+            address = Account.recover_message(encode_defunct(hexstr=message_hash), signature=signature_bytes)
+            results.append((address, None))
+        except Exception as e:
+            results.append((None, str(e) or type(e).__name__))
+    return results
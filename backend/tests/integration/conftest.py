@@ -0,0 +1,40 @@
+from typing import AsyncIterator
+
+import pytest
+import sqlalchemy as sa
+from dotenv import load_dotenv
+from miraveja_di import DIContainer
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncEngine as DatabaseEngine
+
+from certificado_verde_blockchain.certificates.infrastructure import CertificatesDependencies
+from certificado_verde_blockchain.configuration import DatabaseConfig
+from tests.support.container import build_container
+
+
+@pytest.fixture
+async def container() -> AsyncIterator[DIContainer]:
+    """A container wired like the application, against the PostgreSQL database of the `DATABASE_*` variables.
+
+    The test is skipped when the variables are not set, the database cannot be reached or its migrations
+    have not been applied.
+    """
+    load_dotenv()
+    try:
+        DatabaseConfig.from_env()
+    except ValidationError:
+        pytest.skip("The DATABASE_* variables are not set.")
+    container = build_container()
+    CertificatesDependencies.register_dependencies(container)
+    engine = container.resolve(DatabaseEngine)
+    try:
+        async with engine.connect() as connection:
+            migrated = await connection.scalar(sa.text("SELECT to_regclass('certificates') IS NOT NULL"))
+    except (OSError, sa.exc.SQLAlchemyError) as error:
+        await engine.dispose()
+        pytest.skip(f"PostgreSQL is not reachable: {error}")
+    if not migrated:
+        await engine.dispose()
+        pytest.skip("The migrations have not been applied.")
+    yield container
+    await engine.dispose()
@@ -0,0 +1,32 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from certificado_verde_blockchain.shared.enums import ExportFormat
+from tests.support.export import export
+from tests.support.seeding import (
+    delete_synthetic_certificates,
+    insert_synthetic_certificates,
+    seed_entities,
+)
+
+ROWS = 1_000_000
+# Resident memory an export may grow by while streaming, in MiB: far less than the rows would take at once
+RSS_BUDGET_MB = 100
+
+pytestmark = [pytest.mark.integration, pytest.mark.slow]
+
+
+async def test_exports_a_million_certificates_in_flat_memory(container):
+    run_id = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
+    version = f"test-export-{run_id}"
+    entities = await seed_entities(container, run_id, 20)
+    await insert_synthetic_certificates(container, entities, ROWS, version)
+    try:
+        for export_format in ExportFormat:
+            result = await export(container, export_format)
+
+            assert result["rows"] >= ROWS, export_format
+            assert result["growth_mb"] <= RSS_BUDGET_MB, export_format
+    finally:
+        await delete_synthetic_certificates(container, version)
@@ -0,0 +1,20 @@
+from miraveja_di import DIContainer
+
+from certificado_verde_blockchain.auditors_and_certifiers.infrastructure import AuditorsAndCertifiersDependencies
+from certificado_verde_blockchain.dependencies import AppDependencies
+from certificado_verde_blockchain.producers.infrastructure import ProducerDependencies
+from certificado_verde_blockchain.products.infrastructure import ProductDependencies
+
+
+def build_container() -> DIContainer:
+    """A container with the application, product, producer and certifier dependencies, as the API wires them.
+
+    Returns:
+        DIContainer: The container; contexts needing more register their dependencies on it.
+    """
+    container = DIContainer()
+    AppDependencies.register_dependencies(container)
+    ProductDependencies.register_dependencies(container)
+    ProducerDependencies.register_dependencies(container)
+    AuditorsAndCertifiersDependencies.register_dependencies(container)
+    return container
@@ -0,0 +1,65 @@
+import gc
+import os
+import time
+from typing import Dict
+
+from miraveja_di import DIContainer
+from sqlalchemy.ext.asyncio import AsyncSession as DatabaseSession
+
+from certificado_verde_blockchain.certificates.application import ExportCertificatesHandler
+from certificado_verde_blockchain.certificates.domain import CertificateStatus, Norm
+from certificado_verde_blockchain.certificates.infrastructure.http.certificates_controller import (
+    CERTIFICATE_EXPORT_COLUMNS,
+)
+from certificado_verde_blockchain.shared.enums import ExportFormat
+from certificado_verde_blockchain.shared.http import export_response
+
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+
+
+def rss_mb() -> float:
+    """The resident memory of the process, in MiB."""
+    with open("/proc/self/statm", encoding="utf-8") as statm:
+        return int(statm.read().split()[1]) * PAGE_SIZE / 2**20
+
+
+async def export(container: DIContainer, export_format: ExportFormat) -> Dict[str, float]:
+    """Export the issued FSC certificates as `GET /certificates/export` builds its response, sampling the
+    resident memory after every body chunk.
+
+    Args:
+        container (DIContainer): The container the handler is resolved from.
+        export_format (ExportFormat): The format of the export.
+    Returns:
+        Dict[str, float]: The rows, seconds and megabytes of the export, with the baseline and peak growth of
+            the resident memory in MiB.
+    """
+    gc.collect()
+    baseline = rss_mb()
+    peak = baseline
+    rows = 0
+    size = 0
+    with container.create_scope() as scope:
+        try:
+            start = time.perf_counter()
+            certificates = scope.resolve(ExportCertificatesHandler).handle(
+                CertificateStatus.ISSUED, None, Norm.FSC, None, None
+            )
+            response = export_response(certificates, export_format, "certificates", CERTIFICATE_EXPORT_COLUMNS)
+            async for chunk in response.body_iterator:
+                assert isinstance(chunk, str)
+                rows += chunk.count("\n")
+                size += len(chunk.encode())
+                peak = max(peak, rss_mb())
+            duration = time.perf_counter() - start
+        finally:
+            await scope.resolve(DatabaseSession).close()
+    if export_format == ExportFormat.CSV:
+        rows -= 1  # The header
+    return {
+        "rows": rows,
+        "seconds": duration,
+        "megabytes": size / 2**20,
+        "baseline_mb": baseline,
+        "growth_mb": peak - baseline,
+    }
@@ -0,0 +1,6 @@
+from pathlib import Path
+
+# ABIs of both CertificateRegistry versions, limited to the functions and events the backend uses
+ABI_DIRECTORY = Path(__file__).parent / "abi"
+REGISTRY_V1_ABI_PATH = str(ABI_DIRECTORY / "CertificateRegistry.json")
+REGISTRY_V2_ABI_PATH = str(ABI_DIRECTORY / "CertificateRegistryV2.json")
@@ -0,0 +1,229 @@
+import random
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple, Type, TypeVar
+from uuid import UUID
+
+import sqlalchemy as sa
+from eth_account import Account
+from eth_account.messages import encode_defunct
+from eth_account.signers.local import LocalAccount
+from miraveja_di import DIContainer
+from sqlalchemy.ext.asyncio import AsyncEngine as DatabaseEngine
+from sqlalchemy.ext.asyncio import AsyncSession as DatabaseSession
+
+from certificado_verde_blockchain.auditors_and_certifiers.application import (
+    RegisterCertifierCommand,
+    RegisterCertifierHandler,
+)
+from certificado_verde_blockchain.certificates.application import (
+    RegisterPreCertificateCommand,
+    RegisterPreCertificateHandler,
+)
+from certificado_verde_blockchain.certificates.domain import (
+    CertificateStatus,
+    ICertificateRepository,
+    Norm,
+    SustainabilityCriteria,
+)
+from certificado_verde_blockchain.certificates.infrastructure.web3 import Web3BlockchainService
+from certificado_verde_blockchain.producers.application import RegisterProducerCommand, RegisterProducerHandler
+from certificado_verde_blockchain.products.application import RegisterProductCommand, RegisterProductHandler
+from certificado_verde_blockchain.products.domain import MeasurementUnit, ProductCategory, Quantity
+from certificado_verde_blockchain.shared.enums import DocumentType
+from certificado_verde_blockchain.shared.models import ContactInfo, Coordinates, Document, Location
+
+T = TypeVar("T")
+
+# Rows inserted per statement by insert_synthetic_certificates
+SYNTHETIC_BATCH_SIZE = 100_000
+
+ORIGIN = Location(country="Brasil", state="AM", city="Manaus", coordinates=Coordinates(latitude=-3.1, longitude=-60.0))
+
+
+@dataclass
+class SignedPreCertificate:
+    """A pre-certificate and the signature of its certifier, as `examples/sign_certificate.js` produces it."""
+
+    certificate_id: UUID
+    certifier_address: str
+    certifier_signature: str
+
+
+async def _in_scope(container: DIContainer, handler_type: Type[T], run: Callable[[T], Awaitable[Any]]) -> Any:
+    with container.create_scope() as scope:
+        try:
+            return await run(scope.resolve(handler_type))
+        finally:
+            await scope.resolve(DatabaseSession).close()
+
+
+async def seed_entities(container: DIContainer, run_id: str, count: int) -> Dict[str, List[UUID]]:
+    """Register `count` products, producers and certifiers through their application handlers.
+
+    Returns:
+        Dict[str, List[UUID]]: The identifiers of the registered entities, by kind.
+    """
+    entities: Dict[str, List[UUID]] = {"products": [], "producers": [], "certifiers": []}
+    for index in range(count):
+        product = await _in_scope(
+            container,
+            RegisterProductHandler,
+            lambda handler: handler.handle(
+                RegisterProductCommand(
+                    name=f"Castanha {run_id}-{index}",
+                    description="Benchmark product",
+                    category=ProductCategory.FRUIT,
+                    quantity=Quantity(value=100 + index, unit=MeasurementUnit.KG),
+                    origin=ORIGIN,
+                    lot_number=f"LOT-{run_id}-{index}",
+                    carbon_emission=1.5,
+                    metadata={"benchmark": run_id},
+                    tags=["benchmark"],
+                )
+            ),
+        )
+        producer = await _in_scope(
+            container,
+            RegisterProducerHandler,
+            lambda handler: handler.handle(
+                RegisterProducerCommand(
+                    name=f"Produtor {run_id}-{index}",
+                    document=Document(document_type=DocumentType.CPF, number=f"{run_id}{index:04d}"),
+                    address=ORIGIN,
+                    car_code=f"AM-{run_id}-{index}",
+                    contact=ContactInfo(email=f"produtor{index}@example.com"),
+                    metadata={"benchmark": run_id},
+                )
+            ),
+        )
+        certifier = await _in_scope(
+            container,
+            RegisterCertifierHandler,
+            lambda handler: handler.handle(
+                RegisterCertifierCommand(
+                    name=f"Certificadora {run_id}-{index}",
+                    document=Document(document_type=DocumentType.CNPJ, number=f"{run_id}{index:04d}"),
+                    auditors=[],
+                )
+            ),
+        )
+        entities["products"].append(UUID(product["product"]["id"]))
+        entities["producers"].append(UUID(producer["producer"]["id"]))
+        entities["certifiers"].append(UUID(certifier["certifier"]["id"]))
+    return entities
+
+
+async def seed_pre_certificates(
+    container: DIContainer, entities: Dict[str, List[UUID]], count: int, version: str
+) -> List[UUID]:
+    """Register `count` pre-certificates over random products, producers and certifiers."""
+    pre_certificate_ids: List[UUID] = []
+    for _ in range(count):
+        registered = await _in_scope(
+            container,
+            RegisterPreCertificateHandler,
+            lambda handler: handler.handle(
+                RegisterPreCertificateCommand(
+                    product_id=random.choice(entities["products"]),
+                    version=version,
+                    producer_id=random.choice(entities["producers"]),
+                    certifier_id=random.choice(entities["certifiers"]),
+                    norms_complied=[Norm.FSC],
+                    sustainability_criteria=[SustainabilityCriteria.LEGAL_ORIGIN],
+                    notes="Benchmark pre-certificate",
+                )
+            ),
+        )
+        pre_certificate_ids.append(UUID(registered["pre_certificate"]["id"]))
+    return pre_certificate_ids
+
+
+async def insert_synthetic_certificates(
+    container: DIContainer,
+    entities: Dict[str, List[UUID]],
+    count: int,
+    version: str,
+    statuses: Sequence[CertificateStatus] = (CertificateStatus.ISSUED,),
+    issued_between: Optional[Tuple[datetime, datetime]] = None,
+) -> None:
+    """Insert `count` certificates straight into the table, server-side, for benchmarks over millions of rows.
+
+    The rows cycle over the given products, producers, certifiers and statuses; they carry no proof, hash or
+    blockchain data, and are told apart from real certificates by their `version`. With `issued_between`, they
+    are issued one after the other over that window, in insertion order, and valid for 5 years as
+    `IssueCertificateHandler` makes them; without it they have no dates.
+    """
+    date_columns, date_values = "", ""
+    if issued_between is not None:
+        date_columns = ", issued_at, valid_until"
+        date_values = (
+            ", to_timestamp(CAST(:issued_from AS float8) + n * CAST(:issued_step AS float8)), "
+            "to_timestamp(CAST(:issued_from AS float8) + n * CAST(:issued_step AS float8)) + interval '5 years'"
+        )
+    insert = sa.text(
+        "INSERT INTO certificates "
+        "(id, version, product_id, producer_id, certifier_id, norms_complied, sustainability_criteria, status"
+        f"{date_columns}) "
+        "SELECT gen_random_uuid(), :version, "
+        "CAST((CAST(:products AS text[]))[1 + n % cardinality(CAST(:products AS text[]))] AS uuid), "
+        "CAST((CAST(:producers AS text[]))[1 + n % cardinality(CAST(:producers AS text[]))] AS uuid), "
+        "CAST((CAST(:certifiers AS text[]))[1 + n % cardinality(CAST(:certifiers AS text[]))] AS uuid), "
+        "CAST(:norms AS varchar[]), CAST(:criteria AS varchar[]), "
+        "(CAST(:statuses AS text[]))[1 + n % cardinality(CAST(:statuses AS text[]))]"
+        f"{date_values} "
+        "FROM generate_series(CAST(:first AS bigint), CAST(:last AS bigint)) AS n"
+    )
+    parameters: Dict[str, Any] = {
+        "version": version,
+        "products": [str(entity_id) for entity_id in entities["products"]],
+        "producers": [str(entity_id) for entity_id in entities["producers"]],
+        "certifiers": [str(entity_id) for entity_id in entities["certifiers"]],
+        "norms": [str(Norm.FSC)],
+        "criteria": [str(SustainabilityCriteria.LEGAL_ORIGIN)],
+        "statuses": [str(status) for status in statuses],
+    }
+    if issued_between is not None:
+        issued_from, issued_until = issued_between
+        parameters["issued_from"] = issued_from.timestamp()
+        parameters["issued_step"] = (issued_until - issued_from).total_seconds() / max(count, 1)
+    engine = container.resolve(DatabaseEngine)
+    for first in range(0, count, SYNTHETIC_BATCH_SIZE):
+        last = min(first + SYNTHETIC_BATCH_SIZE, count) - 1
+        async with engine.begin() as connection:
+            await connection.execute(insert, {**parameters, "first": first, "last": last})
+    async with engine.connect() as connection:
+        await connection.execute(sa.text("ANALYZE certificates"))
+        await connection.commit()
+
+
+async def delete_synthetic_certificates(container: DIContainer, version: str) -> None:
+    """Delete the certificates inserted by `insert_synthetic_certificates` with this version."""
+    async with container.resolve(DatabaseEngine).begin() as connection:
+        await connection.execute(sa.text("DELETE FROM certificates WHERE version = :version"), {"version": version})
+
+
+async def sign_pre_certificates(
+    container: DIContainer, pre_certificate_ids: List[UUID], keys: int
+) -> List[SignedPreCertificate]:
+    """Sign the pre-issued hash of every pre-certificate with one of `keys` generated certifier keys.
+
+    The hash is computed from the stored certificate as `GET /certificates/{id}` reports it, and signed as
+    an EIP-191 personal message over its bytes, as `examples/sign_certificate.js` does with `wallet.signMessage`.
+    """
+    with container.create_scope() as scope:
+        pre_certificates = await scope.resolve(ICertificateRepository).find_by_ids(pre_certificate_ids)
+        await scope.resolve(DatabaseSession).close()
+
+    blockchain_service = container.resolve(Web3BlockchainService)
+    accounts: Dict[UUID, LocalAccount] = {}
+    generated = [Account.create() for _ in range(keys)]
+    signed: List[SignedPreCertificate] = []
+    for pre_certificate in pre_certificates:
+        account = accounts.setdefault(pre_certificate.certifier_id, generated[len(accounts) % keys])
+        pre_issued_hash = await blockchain_service.hash_data(
+            pre_certificate.signable_payload(), pre_certificate.canonical_encoding
+        )
+        signature = account.sign_message(encode_defunct(hexstr=pre_issued_hash)).signature.to_0x_hex()
+        signed.append(SignedPreCertificate(pre_certificate.id, account.address, signature))
+    return signed
@@ -0,0 +1,165 @@
+from typing import List
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
+
+from certificado_verde_blockchain.auditors_and_certifiers.domain import Auditor, Certifier
+from certificado_verde_blockchain.auditors_and_certifiers.infrastructure.sql import SqlCertifierRepository
+from certificado_verde_blockchain.auditors_and_certifiers.infrastructure.sql.certifier_entity import CertifierEntity
+from certificado_verde_blockchain.shared.errors import DomainException
+from certificado_verde_blockchain.shared.sql import SqlUnitOfWork
+
+
+def certifier(number: str = "111", auditors: int = 0) -> Certifier:
+    return Certifier(
+        name=f"Certificadora {number}",
+        document={"document_type": "CNPJ", "number": number},
+        auditors=[
+            Auditor(name=f"Auditor {index}", document={"document_type": "CREA", "number": f"{number}-{index}"})
+            for index in range(auditors)
+        ],
+    )
+
+
+@pytest.fixture
+def database_session() -> MagicMock:
+    database_session = MagicMock()
+    database_session.scalar = AsyncMock(return_value=None)
+    database_session.scalars = AsyncMock()
+    database_session.rollback = AsyncMock()
+    return database_session
+
+
+@pytest.fixture
+def unit_of_work(database_session: MagicMock) -> SqlUnitOfWork:
+    return SqlUnitOfWork(database_session)
+
+
+@pytest.fixture
+def repository(database_session: MagicMock, unit_of_work: SqlUnitOfWork) -> SqlCertifierRepository:
+    return SqlCertifierRepository(database_session, unit_of_work)
+
+
+def returns_rows(database_session: MagicMock, certifiers: List[Certifier]) -> None:
+    database_session.scalars.return_value = MagicMock()
+    database_session.scalars.return_value.all.return_value = [CertifierEntity.from_domain(item) for item in certifiers]
+
+
+def filtered_by(database_session: MagicMock) -> str:
+    """The WHERE, ORDER BY and LIMIT clauses of the last query, with its values inlined."""
+    statement = database_session.scalars.await_args.args[0]
+    sql = str(statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+    return " ".join(sql.split("FROM certifiers", 1)[1].split())
+
+
+class TestListPage:
+    async def test_pages_seek_past_the_last_id(self, repository: SqlCertifierRepository, database_session: MagicMock):
+        page = [certifier("111", auditors=1), certifier("222")]
+        returns_rows(database_session, page)
+        after_id = UUID(int=7)
+
+        listed = await repository.list_page(after_id, 2)
+
+        assert listed == page
+        assert filtered_by(database_session) == f"WHERE certifiers.id > '{after_id.hex}' ORDER BY certifiers.id LIMIT 2"
+
+    async def test_the_first_page_starts_at_the_lowest_id(
+        self, repository: SqlCertifierRepository, database_session: MagicMock
+    ):
+        returns_rows(database_session, [])
+
+        assert await repository.list_page(None, 50) == []
+        assert filtered_by(database_session) == "ORDER BY certifiers.id LIMIT 50"
+
+    async def test_a_failed_page_rolls_the_session_back(
+        self, repository: SqlCertifierRepository, database_session: MagicMock
+    ):
+        database_session.scalars.side_effect = RuntimeError("connection lost")
+
+        with pytest.raises(RuntimeError):
+            await repository.list_page(None, 50)
+
+        database_session.rollback.assert_awaited_once()
+
+
+class TestFind:
+    async def test_find_by_id_serves_the_scope_first(
+        self, repository: SqlCertifierRepository, unit_of_work: SqlUnitOfWork, database_session: MagicMock
+    ):
+        in_scope = certifier()
+        unit_of_work.track(in_scope)
+
+        assert await repository.find_by_id(in_scope.id) == in_scope
+        database_session.scalar.assert_not_awaited()
+
+    async def test_find_by_id_keeps_the_loaded_certifier_in_the_scope(
+        self, repository: SqlCertifierRepository, unit_of_work: SqlUnitOfWork, database_session: MagicMock
+    ):
+        loaded = certifier(auditors=2)
+        database_session.scalar.return_value = CertifierEntity.from_domain(loaded)
+
+        assert await repository.find_by_id(loaded.id) == loaded
+        assert unit_of_work.find(Certifier, loaded.id) == loaded
+
+    async def test_find_by_id_of_an_unknown_certifier_is_none(self, repository: SqlCertifierRepository):
+        assert await repository.find_by_id(UUID(int=1)) is None
+
+    async def test_a_failed_find_rolls_the_session_back(
+        self, repository: SqlCertifierRepository, database_session: MagicMock
+    ):
+        database_session.scalar.side_effect = RuntimeError("connection lost")
+
+        with pytest.raises(RuntimeError):
+            await repository.find_by_id(UUID(int=1))
+
+        database_session.rollback.assert_awaited_once()
+
+
+class TestSave:
+    async def test_auditors_are_written_before_the_certifier_and_its_links(
+        self, repository: SqlCertifierRepository, unit_of_work: SqlUnitOfWork, database_session: MagicMock
+    ):
+        saved = certifier(auditors=2)
+        database_session.execute = AsyncMock()
+        database_session.commit = AsyncMock()
+
+        await repository.save(saved)
+        await unit_of_work.commit()
+
+        statements = [call.args for call in database_session.execute.await_args_list]
+        assert [str(statement.compile(dialect=postgresql.dialect())).split()[2] for statement, _ in statements] == [
+            "auditors",
+            "certifiers",
+            "certifier_auditors",
+        ]
+        assert statements[2][1] == [{"certifier_id": saved.id, "auditor_id": auditor.id} for auditor in saved.auditors]
+        assert unit_of_work.find(Certifier, saved.id) == saved
+
+    async def test_links_are_only_ever_added(
+        self, repository: SqlCertifierRepository, unit_of_work: SqlUnitOfWork, database_session: MagicMock
+    ):
+        database_session.execute = AsyncMock()
+        database_session.commit = AsyncMock()
+
+        await repository.save(certifier(auditors=1))
+        await unit_of_work.commit()
+
+        links = database_session.execute.await_args_list[-1].args[0]
+        assert str(links.compile(dialect=postgresql.dialect())).endswith("ON CONFLICT DO NOTHING")
+
+    async def test_a_duplicate_certifier_is_a_conflict(
+        self, repository: SqlCertifierRepository, unit_of_work: SqlUnitOfWork, database_session: MagicMock
+    ):
+        database_session.execute = AsyncMock(side_effect=IntegrityError("INSERT", {}, Exception("unique")))
+
+        await repository.save(certifier("333"))
+        with pytest.raises(DomainException) as error:
+            await unit_of_work.commit()
+
+        assert (error.value.message, error.value.code) == (
+            "Cannot save duplicate certifier with document CNPJ, number 333",
+            409,
+        )
@@ -0,0 +1,147 @@
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, List
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from certificado_verde_blockchain.certificates.application import (
+    AuditCertifierSignaturesHandler,
+    audit_certifier_signatures,
+)
+from certificado_verde_blockchain.certificates.domain import (
+    AuthenticityProof,
+    Certificate,
+    CertificateStatus,
+    SignatureCheck,
+    SignatureVerification,
+)
+from certificado_verde_blockchain.shared.canonical import CanonicalEncoding
+
+CERTIFIER_ADDRESS = "0x70997970C51812dc3A010C7d01b50e0d17dc79C8"
+
+
+def signed_certificate(version: str = "2.0") -> Certificate:
+    return Certificate(
+        version=version,
+        product_id=uuid4(),
+        producer_id=uuid4(),
+        certifier_id=uuid4(),
+        status=CertificateStatus.ISSUED,
+        valid_until=datetime.now(timezone.utc) + timedelta(days=30),
+        authenticity_proof=AuthenticityProof(
+            serial_code="CV-1", certifier_signature="0x" + "11" * 65, certifier_address=CERTIFIER_ADDRESS
+        ),
+    )
+
+
+@pytest.fixture
+def pages() -> List[List[Certificate]]:
+    return [[signed_certificate(), signed_certificate("1.0")], [signed_certificate()], []]
+
+
+@pytest.fixture
+def repository(pages: List[List[Certificate]]) -> MagicMock:
+    repository = MagicMock()
+    repository.list_signed = AsyncMock(side_effect=pages)
+    return repository
+
+
+@pytest.fixture
+def checks() -> List[SignatureCheck]:
+    return []
+
+
+@pytest.fixture
+def blockchain_service(checks: List[SignatureCheck]) -> MagicMock:
+    async def verify_signatures(page: List[SignatureCheck]) -> AsyncIterator[SignatureVerification]:
+        checks.extend(page)
+        # The last certificate of each page is found forged, and results come back out of order
+        for check in reversed(page):
+            forged = check is page[-1]
+            yield SignatureVerification(
+                key=check.key,
+                valid=not forged,
+                recovered_address=None if forged else check.address,
+                error="Invalid signature" if forged else None,
+            )
+
+    blockchain_service = MagicMock()
+    blockchain_service.hash_data = AsyncMock(side_effect=lambda payload, encoding: f"0x{encoding.value}")
+    blockchain_service.verify_signatures = verify_signatures
+    return blockchain_service
+
+
+@pytest.fixture
+def logger() -> MagicMock:
+    logger = MagicMock()
+    logger.info = AsyncMock()
+    return logger
+
+
+@pytest.fixture
+def handler(repository: MagicMock, blockchain_service: MagicMock, logger: MagicMock) -> AuditCertifierSignaturesHandler:
+    return AuditCertifierSignaturesHandler(repository, blockchain_service, logger)
+
+
+async def audit(handler: AuditCertifierSignaturesHandler) -> List[Any]:
+    return [result async for result in handler.handle()]
+
+
+class TestAuditCertifierSignatures:
+    async def test_every_signed_certificate_is_verified_page_by_page(
+        self, handler: AuditCertifierSignaturesHandler, repository: MagicMock, pages: List[List[Certificate]]
+    ):
+        first, second, third = pages[0][0], pages[0][1], pages[1][0]
+        results = await audit(handler)
+
+        assert [(result["certificate_id"], result["valid"]) for result in results] == [
+            (str(second.id), False),
+            (str(first.id), True),
+            (str(third.id), False),
+        ]
+        assert [call.args for call in repository.list_signed.await_args_list] == [
+            (None, audit_certifier_signatures.AUDIT_PAGE_SIZE),
+            (second.id, audit_certifier_signatures.AUDIT_PAGE_SIZE),
+            (third.id, audit_certifier_signatures.AUDIT_PAGE_SIZE),
+        ]
+
+    async def test_results_carry_the_stored_and_recovered_addresses(self, handler: AuditCertifierSignaturesHandler):
+        forged, valid, _ = await audit(handler)
+
+        assert forged["certifier_address"] == CERTIFIER_ADDRESS
+        assert forged["recovered_address"] is None
+        assert forged["error"] == "Invalid signature"
+        assert valid["recovered_address"] == CERTIFIER_ADDRESS
+        assert valid["error"] is None
+
+    async def test_signatures_are_checked_against_the_hash_of_the_signed_payload(
+        self,
+        handler: AuditCertifierSignaturesHandler,
+        blockchain_service: MagicMock,
+        checks: List[SignatureCheck],
+        pages: List[List[Certificate]],
+    ):
+        await audit(handler)
+
+        certificate = pages[0][1]
+        blockchain_service.hash_data.assert_any_await(certificate.signed_payload(), CanonicalEncoding.LEGACY)
+        assert checks[1] == SignatureCheck(
+            key=str(certificate.id),
+            message_hash=f"0x{CanonicalEncoding.LEGACY.value}",
+            signature="0x" + "11" * 65,
+            address=CERTIFIER_ADDRESS,
+        )
+
+    async def test_the_totals_are_logged(self, handler: AuditCertifierSignaturesHandler, logger: MagicMock):
+        await audit(handler)
+
+        logger.info.assert_awaited_with("Audited 3 certifier signatures, 2 invalid.")
+
+    async def test_nothing_signed_yields_nothing(
+        self, handler: AuditCertifierSignaturesHandler, pages: List[List[Certificate]], logger: MagicMock
+    ):
+        pages[:] = [[]]
+
+        assert await audit(handler) == []
+        logger.info.assert_awaited_with("Audited 0 certifier signatures, 0 invalid.")
@@ -0,0 +1,107 @@
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, List
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID, uuid4
+
+import pytest
+
+from certificado_verde_blockchain.certificates.application import ExportCertificatesHandler
+from certificado_verde_blockchain.certificates.application.export_certificates import EXPORT_CHUNK_SIZE
+from certificado_verde_blockchain.certificates.domain import Certificate, CertificateStatus, Norm
+
+PRODUCT_ID = uuid4()
+PRODUCER_ID = uuid4()
+
+
+def certificate(product_id: UUID = PRODUCT_ID, producer_id: UUID = PRODUCER_ID) -> Certificate:
+    return Certificate(
+        version="1.0",
+        product_id=product_id,
+        producer_id=producer_id,
+        certifier_id=uuid4(),
+        status=CertificateStatus.ISSUED,
+    )
+
+
+def chunks(*certificate_chunks: List[Certificate]) -> MagicMock:
+    """A `stream` method yielding the given chunks of certificates."""
+
+    async def stream(*_: Any) -> AsyncIterator[List[Certificate]]:
+        for chunk in certificate_chunks:
+            yield chunk
+
+    return MagicMock(side_effect=stream)
+
+
+def canonical_service(found: Any) -> MagicMock:
+    service = MagicMock()
+    service.find_canonical_by_ids = AsyncMock(side_effect=lambda ids: {id: found(id) for id in ids})
+    return service
+
+
+@pytest.fixture
+def repository() -> MagicMock:
+    return MagicMock()
+
+
+@pytest.fixture
+def product_service() -> MagicMock:
+    return canonical_service(lambda product_id: {"name": f"product {product_id}"})
+
+
+@pytest.fixture
+def producer_service() -> MagicMock:
+    # The producer of PRODUCER_ID was deleted
+    return canonical_service(lambda producer_id: None if producer_id == PRODUCER_ID else {"name": "producer"})
+
+
+@pytest.fixture
+def handler(repository, product_service, producer_service) -> ExportCertificatesHandler:
+    return ExportCertificatesHandler(repository, product_service, producer_service, AsyncMock())
+
+
+class TestExportCertificates:
+    async def test_certificates_are_exported_with_their_product_and_producer(
+        self, handler: ExportCertificatesHandler, repository: MagicMock
+    ):
+        other_producer = uuid4()
+        first, second, third = certificate(), certificate(producer_id=other_producer), certificate()
+        repository.stream = chunks([first, second], [third])
+
+        records = [record async for record in handler.handle(None, None, None, None, None)]
+
+        assert [record["id"] for record in records] == [str(first.id), str(second.id), str(third.id)]
+        assert records[0]["product"] == {"name": f"product {PRODUCT_ID}"}
+        assert [record["producer"] for record in records] == [None, {"name": "producer"}, None]
+
+    async def test_products_and_producers_are_found_once_per_chunk(
+        self, handler: ExportCertificatesHandler, repository: MagicMock, product_service, producer_service
+    ):
+        other_producer = uuid4()
+        repository.stream = chunks([certificate(), certificate(), certificate(producer_id=other_producer)])
+
+        records = [record async for record in handler.handle(None, None, None, None, None)]
+
+        assert len(records) == 3
+
+        product_service.find_canonical_by_ids.assert_awaited_once_with([PRODUCT_ID])
+        assert sorted(producer_service.find_canonical_by_ids.await_args.args[0]) == sorted(
+            [PRODUCER_ID, other_producer]
+        )
+
+    async def test_filters_are_passed_to_the_stream(self, handler: ExportCertificatesHandler, repository: MagicMock):
+        certifier_id = uuid4()
+        issued_from = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        issued_until = datetime(2026, 7, 1, tzinfo=timezone.utc)
+        repository.stream = chunks()
+        norm = next(iter(Norm))
+
+        records = [
+            record
+            async for record in handler.handle(CertificateStatus.REVOKED, certifier_id, norm, issued_from, issued_until)
+        ]
+
+        assert records == []
+        repository.stream.assert_called_once_with(
+            EXPORT_CHUNK_SIZE, CertificateStatus.REVOKED, certifier_id, norm, issued_from, issued_until
+        )
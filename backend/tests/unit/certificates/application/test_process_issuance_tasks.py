@@ -0,0 +1,466 @@
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from certificado_verde_blockchain.certificates.application import ProcessIssuanceTasksHandler
+from certificado_verde_blockchain.certificates.domain import (
+    AnchoredRoot,
+    Certificate,
+    CertificateStatus,
+    ChainCertificate,
+    IssuanceReceipt,
+    IssuanceTask,
+    IssuanceTaskStatus,
+    PreparedTransaction,
+)
+from certificado_verde_blockchain.configuration import BlockchainConfig
+
+TRANSACTION = PreparedTransaction(
+    transaction_hash="0x" + "ab" * 32,
+    raw_transaction="0x02f8",
+    sender="0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266",
+)
+REGISTRY_ADDRESS = "0x5FbDB2315678afecb367f032d93F642f64180aa3"
+REPLACEMENT = "0x" + "cd" * 32
+
+
+def submitted(index: int, seconds_ago: float = 0) -> IssuanceTask:
+    submitted_task = task(index)
+    submitted_task.mark_submitted(TRANSACTION.transaction_hash)
+    submitted_task.submitted_at = datetime.now(timezone.utc) - timedelta(seconds=seconds_ago)
+    return submitted_task
+
+
+def receipt(success: bool = True, **fields) -> IssuanceReceipt:
+    return IssuanceReceipt(transaction_hash=TRANSACTION.transaction_hash, success=success, block_number=12, **fields)
+
+
+def issuing_certificate(canonical_hash: str) -> Certificate:
+    return Certificate(
+        id=uuid4(),
+        version="1.0",
+        product_id=uuid4(),
+        producer_id=uuid4(),
+        certifier_id=uuid4(),
+        status=CertificateStatus.ISSUING,
+        canonical_hash=canonical_hash,
+    )
+
+
+def task(index: int, transaction_hash: Optional[str] = None) -> IssuanceTask:
+    return IssuanceTask(
+        certificate_id=uuid4(),
+        canonical_hash=f"{index:064x}",
+        certifier_address=f"0x{index:040x}",
+        transaction_hash=transaction_hash,
+        attempts=1 if transaction_hash else 0,
+    )
+
+
+@pytest.fixture
+def calls() -> MagicMock:
+    """Records the calls of the collaborators in the order they happen."""
+    return MagicMock()
+
+
+@pytest.fixture
+def task_repository(calls) -> MagicMock:
+    repository = MagicMock()
+    repository.claim = AsyncMock(return_value=[])
+    repository.due_backlog = AsyncMock(return_value=(0, None))
+    repository.save = AsyncMock()
+    calls.attach_mock(repository.save, "save")
+    return repository
+
+
+@pytest.fixture
+def certificate_repository() -> MagicMock:
+    repository = MagicMock()
+    repository.find_by_id = AsyncMock(return_value=MagicMock(is_issuing=True))
+    repository.find_by_ids = AsyncMock(return_value=[])
+    return repository
+
+
+@pytest.fixture
+def chain_certificate_repository() -> MagicMock:
+    repository = MagicMock()
+    repository.find_by_data_hash = AsyncMock(return_value=None)
+    repository.save_anchored_roots = AsyncMock()
+    return repository
+
+
+@pytest.fixture
+def blockchain_service(calls) -> MagicMock:
+    service = MagicMock()
+    service.prepare_certificates = AsyncMock(return_value=TRANSACTION)
+    service.prepare_anchor = AsyncMock(return_value=TRANSACTION)
+    service.replace_transaction = AsyncMock(return_value=REPLACEMENT)
+    service.broadcast_transaction = AsyncMock()
+    service.is_transaction_pending = AsyncMock(return_value=False)
+    service.find_issued_certificates = AsyncMock(return_value={})
+    service.get_issuance_receipts = AsyncMock(return_value={})
+    service.registry_address = REGISTRY_ADDRESS
+    calls.attach_mock(service.broadcast_transaction, "broadcast_transaction")
+    return service
+
+
+@pytest.fixture
+def unit_of_work(calls) -> MagicMock:
+    unit_of_work = MagicMock()
+    unit_of_work.commit = AsyncMock()
+    calls.attach_mock(unit_of_work.commit, "commit")
+    return unit_of_work
+
+
+@pytest.fixture
+def config(blockchain_config) -> BlockchainConfig:
+    return blockchain_config(issuance_max_attempts=2)
+
+
+@pytest.fixture
+def handler(
+    config,
+    task_repository,
+    certificate_repository,
+    chain_certificate_repository,
+    blockchain_service,
+    unit_of_work,
+) -> ProcessIssuanceTasksHandler:
+    logger = MagicMock()
+    for level in ("info", "warning", "error"):
+        setattr(logger, level, AsyncMock())
+    return ProcessIssuanceTasksHandler(
+        config,
+        task_repository,
+        certificate_repository,
+        chain_certificate_repository,
+        blockchain_service,
+        unit_of_work,
+        logger,
+    )
+
+
+class TestSubmitPending:
+    async def test_does_nothing_without_pending_tasks(self, handler, blockchain_service, unit_of_work):
+        assert await handler.submit_pending() == 0
+
+        blockchain_service.prepare_certificates.assert_not_awaited()
+        unit_of_work.commit.assert_not_awaited()
+
+    async def test_sends_tasks_back_when_the_transaction_cannot_be_prepared(
+        self, handler, task_repository, blockchain_service, calls
+    ):
+        tasks = [task(1), task(2)]
+        task_repository.claim.return_value = tasks
+        blockchain_service.prepare_certificates.side_effect = ValueError("gas estimation failed")
+
+        assert await handler.submit_pending() == 2
+
+        assert all(item.status == IssuanceTaskStatus.PENDING for item in tasks)
+        assert all(item.last_error == "gas estimation failed" for item in tasks)
+        assert [name for name, _, _ in calls.mock_calls] == ["save", "commit"]
+
+    async def test_fails_the_certificates_out_of_attempts(
+        self, handler, task_repository, certificate_repository, blockchain_service
+    ):
+        exhausted = task(1)
+        exhausted.attempts = 1
+        task_repository.claim.return_value = [exhausted]
+        blockchain_service.prepare_certificates.side_effect = ValueError("gas estimation failed")
+        certificate = certificate_repository.find_by_id.return_value
+
+        await handler.submit_pending()
+
+        assert exhausted.status == IssuanceTaskStatus.FAILED
+        certificate.fail_issuance.assert_called_once_with("gas estimation failed")
+        task_repository.save.assert_awaited_once_with([exhausted], [certificate], delay_seconds=4)
+
+    async def test_commits_the_transaction_hash_before_sending_the_transaction(self, handler, task_repository, calls):
+        tasks = [task(1), task(2)]
+        task_repository.claim.return_value = tasks
+
+        assert await handler.submit_pending() == 2
+
+        assert [name for name, _, _ in calls.mock_calls] == ["save", "commit", "broadcast_transaction"]
+        assert all(item.status == IssuanceTaskStatus.SUBMITTED for item in tasks)
+        assert all(item.transaction_hash == TRANSACTION.transaction_hash for item in tasks)
+
+    async def test_sends_tasks_back_when_the_node_does_not_know_the_failed_transaction(
+        self, handler, task_repository, blockchain_service
+    ):
+        tasks = [task(1)]
+        task_repository.claim.return_value = tasks
+        blockchain_service.broadcast_transaction.side_effect = TimeoutError("read timed out")
+
+        await handler.submit_pending()
+
+        assert tasks[0].status == IssuanceTaskStatus.PENDING
+        assert tasks[0].last_error == "read timed out"
+
+    async def test_keeps_tasks_submitted_when_the_node_took_the_failed_transaction(
+        self, handler, task_repository, blockchain_service
+    ):
+        tasks = [task(1)]
+        task_repository.claim.return_value = tasks
+        blockchain_service.broadcast_transaction.side_effect = TimeoutError("read timed out")
+        blockchain_service.is_transaction_pending.return_value = True
+
+        await handler.submit_pending()
+
+        assert tasks[0].status == IssuanceTaskStatus.SUBMITTED
+
+    async def test_keeps_tasks_submitted_when_the_failed_transaction_cannot_be_checked(
+        self, handler, task_repository, blockchain_service
+    ):
+        tasks = [task(1)]
+        task_repository.claim.return_value = tasks
+        blockchain_service.broadcast_transaction.side_effect = TimeoutError("read timed out")
+        blockchain_service.is_transaction_pending.side_effect = ConnectionError("node unreachable")
+
+        await handler.submit_pending()
+
+        assert tasks[0].status == IssuanceTaskStatus.SUBMITTED
+
+    async def test_does_not_look_up_tasks_that_were_never_sent(self, handler, task_repository, blockchain_service):
+        task_repository.claim.return_value = [task(1)]
+
+        await handler.submit_pending()
+
+        blockchain_service.find_issued_certificates.assert_not_awaited()
+
+    async def test_confirms_resent_tasks_recorded_by_an_earlier_transaction(
+        self, handler, task_repository, certificate_repository, blockchain_service
+    ):
+        resent, fresh = task(1, transaction_hash="0x" + "cd" * 32), task(2)
+        task_repository.claim.return_value = [resent, fresh]
+        blockchain_service.find_issued_certificates.return_value = {resent.canonical_hash: "7"}
+        certificate = certificate_repository.find_by_id.return_value
+
+        await handler.submit_pending()
+
+        assert resent.status == IssuanceTaskStatus.CONFIRMED
+        certificate.confirm_issuance.assert_called_once_with("7", REGISTRY_ADDRESS)
+        blockchain_service.prepare_certificates.assert_awaited_once_with(
+            [(fresh.canonical_hash, fresh.certifier_address)]
+        )
+
+    async def test_looks_resent_tasks_up_in_the_indexed_events_without_lookup_by_hash(
+        self, handler, task_repository, chain_certificate_repository, blockchain_service
+    ):
+        resent = task(1, transaction_hash="0x" + "cd" * 32)
+        task_repository.claim.return_value = [resent]
+        blockchain_service.find_issued_certificates.return_value = None
+        chain_certificate_repository.find_by_data_hash.return_value = ChainCertificate(
+            blockchain_id="3",
+            data_hash=resent.canonical_hash,
+            issuer=resent.certifier_address,
+            owner=resent.certifier_address,
+            issued_at=0,
+            block_number=1,
+            transaction_hash=resent.transaction_hash,
+        )
+
+        await handler.submit_pending()
+
+        assert resent.status == IssuanceTaskStatus.CONFIRMED
+        blockchain_service.prepare_certificates.assert_not_awaited()
+        blockchain_service.broadcast_transaction.assert_not_awaited()
+
+    async def test_holds_resent_tasks_back_when_the_chain_cannot_be_checked(
+        self, handler, task_repository, blockchain_service
+    ):
+        resent = task(1, transaction_hash="0x" + "cd" * 32)
+        task_repository.claim.return_value = [resent]
+        blockchain_service.find_issued_certificates.side_effect = ConnectionError("node unreachable")
+
+        await handler.submit_pending()
+
+        assert resent.status == IssuanceTaskStatus.PENDING
+        blockchain_service.prepare_certificates.assert_not_awaited()
+
+
+class TestConfirmSubmitted:
+    async def test_records_the_root_anchored_by_the_confirmed_transaction(
+        self, handler, task_repository, chain_certificate_repository, blockchain_service
+    ):
+        root = "0x" + "ef" * 32
+        anchored = task(1)
+        anchored.mark_submitted(TRANSACTION.transaction_hash, merkle_root=root)
+        task_repository.claim.return_value = [anchored]
+        blockchain_service.get_issuance_receipts.return_value = {
+            TRANSACTION.transaction_hash: IssuanceReceipt(
+                transaction_hash=TRANSACTION.transaction_hash,
+                success=True,
+                block_number=12,
+                anchored_epochs={root: "4"},
+            )
+        }
+
+        assert await handler.confirm_submitted() == 1
+
+        assert anchored.status == IssuanceTaskStatus.CONFIRMED
+        chain_certificate_repository.save_anchored_roots.assert_awaited_once_with(
+            [AnchoredRoot(epoch_id="4", root=root, block_number=12, transaction_hash=TRANSACTION.transaction_hash)]
+        )
+
+    async def test_does_nothing_without_submitted_tasks(self, handler, blockchain_service):
+        assert await handler.confirm_submitted() == 0
+
+        blockchain_service.get_issuance_receipts.assert_not_awaited()
+
+    async def test_confirms_the_certificates_recorded_by_the_mined_transaction(
+        self, handler, task_repository, certificate_repository, blockchain_service
+    ):
+        tasks = [submitted(1), submitted(2)]
+        certificates = {item.certificate_id: issuing_certificate(item.canonical_hash) for item in tasks}
+        task_repository.claim.return_value = tasks
+        certificate_repository.find_by_id.side_effect = lambda certificate_id: certificates[certificate_id]
+        blockchain_service.get_issuance_receipts.return_value = {
+            TRANSACTION.transaction_hash: receipt(
+                certificate_ids={tasks[0].canonical_hash: "1", tasks[1].canonical_hash: "2"}
+            )
+        }
+
+        assert await handler.confirm_submitted() == 2
+
+        assert all(item.status == IssuanceTaskStatus.CONFIRMED for item in tasks)
+        assert [certificates[item.certificate_id].blockchain_id for item in tasks] == ["1", "2"]
+        assert all(certificate.registry_address == REGISTRY_ADDRESS for certificate in certificates.values())
+        task_repository.save.assert_awaited_once_with(tasks, list(certificates.values()))
+
+    async def test_confirms_a_task_mined_by_the_transaction_it_replaced(
+        self, handler, task_repository, blockchain_service
+    ):
+        replaced = submitted(1)
+        replaced.mark_replaced(REPLACEMENT)
+        task_repository.claim.return_value = [replaced]
+        blockchain_service.get_issuance_receipts.return_value = {
+            TRANSACTION.transaction_hash: receipt(certificate_ids={replaced.canonical_hash: "1"})
+        }
+
+        await handler.confirm_submitted()
+
+        blockchain_service.get_issuance_receipts.assert_awaited_once_with([REPLACEMENT, TRANSACTION.transaction_hash])
+        assert replaced.status == IssuanceTaskStatus.CONFIRMED
+
+    async def test_retries_the_tasks_of_a_reverted_transaction(self, handler, task_repository, blockchain_service):
+        reverted = submitted(1)
+        task_repository.claim.return_value = [reverted]
+        blockchain_service.get_issuance_receipts.return_value = {TRANSACTION.transaction_hash: receipt(success=False)}
+
+        assert await handler.confirm_submitted() == 1
+
+        assert reverted.status == IssuanceTaskStatus.PENDING
+        assert reverted.last_error == "Issuance transaction failed on the blockchain."
+
+    async def test_waits_for_a_recent_transaction(self, handler, task_repository, blockchain_service):
+        recent = submitted(1)
+        task_repository.claim.return_value = [recent]
+
+        assert await handler.confirm_submitted() == 0
+
+        assert recent.status == IssuanceTaskStatus.SUBMITTED
+        blockchain_service.replace_transaction.assert_not_awaited()
+        task_repository.save.assert_awaited_once_with([recent], [], delay_seconds=1)
+
+    async def test_replaces_a_stalled_transaction(self, handler, task_repository, blockchain_service):
+        stalled = submitted(1, seconds_ago=60)
+        task_repository.claim.return_value = [stalled]
+
+        assert await handler.confirm_submitted() == 0
+
+        blockchain_service.replace_transaction.assert_awaited_once_with(TRANSACTION.transaction_hash)
+        assert stalled.transaction_hashes == [REPLACEMENT, TRANSACTION.transaction_hash]
+
+    async def test_keeps_waiting_when_a_stalled_transaction_cannot_be_replaced(
+        self, handler, task_repository, blockchain_service
+    ):
+        stalled = submitted(1, seconds_ago=60)
+        task_repository.claim.return_value = [stalled]
+        blockchain_service.replace_transaction.side_effect = ValueError("replacement underpriced")
+
+        assert await handler.confirm_submitted() == 0
+
+        assert stalled.transaction_hashes == [TRANSACTION.transaction_hash]
+        assert stalled.status == IssuanceTaskStatus.SUBMITTED
+
+    async def test_retries_an_overdue_transaction_dropped_by_the_node(
+        self, handler, task_repository, blockchain_service
+    ):
+        overdue = submitted(1, seconds_ago=600)
+        task_repository.claim.return_value = [overdue]
+
+        assert await handler.confirm_submitted() == 1
+
+        assert overdue.status == IssuanceTaskStatus.PENDING
+        assert overdue.last_error == f"Transaction {TRANSACTION.transaction_hash} was dropped by the node."
+
+    async def test_keeps_waiting_for_an_overdue_transaction_still_pending(
+        self, handler, task_repository, blockchain_service
+    ):
+        overdue = submitted(1, seconds_ago=600)
+        task_repository.claim.return_value = [overdue]
+        blockchain_service.is_transaction_pending.return_value = True
+
+        assert await handler.confirm_submitted() == 0
+
+        assert overdue.status == IssuanceTaskStatus.SUBMITTED
+
+
+class TestAnchorPending:
+    @pytest.fixture
+    def config(self, blockchain_config) -> BlockchainConfig:
+        return blockchain_config(anchoring_mode="merkle", anchoring_epoch_max_size=2, anchoring_flush_interval_ms=1000)
+
+    async def test_waits_for_the_epoch_to_fill(self, handler, task_repository):
+        task_repository.due_backlog.return_value = (1, datetime.now(timezone.utc))
+
+        assert await handler.submit_pending() == 0
+
+        task_repository.claim.assert_not_awaited()
+
+    async def test_flushes_an_epoch_whose_oldest_certificate_waited_long_enough(
+        self, handler, task_repository, blockchain_service
+    ):
+        task_repository.due_backlog.return_value = (1, datetime.now(timezone.utc) - timedelta(seconds=2))
+        task_repository.claim.return_value = [task(1)]
+
+        assert await handler.submit_pending() == 1
+
+        blockchain_service.prepare_anchor.assert_awaited_once()
+
+    async def test_attaches_the_inclusion_proof_of_every_certificate_of_the_epoch(
+        self, handler, task_repository, certificate_repository, blockchain_service, calls
+    ):
+        tasks = [task(1), task(2)]
+        certificates = [issuing_certificate(item.canonical_hash) for item in tasks]
+        for item, certificate in zip(tasks, certificates):
+            certificate.id = item.certificate_id
+        task_repository.due_backlog.return_value = (2, datetime.now(timezone.utc))
+        task_repository.claim.return_value = tasks
+        certificate_repository.find_by_ids.return_value = certificates
+
+        assert await handler.submit_pending() == 2
+
+        root = blockchain_service.prepare_anchor.await_args.args[0]
+        blockchain_service.prepare_anchor.assert_awaited_once_with(root, 2)
+        assert all(item.merkle_root == root and item.status == IssuanceTaskStatus.SUBMITTED for item in tasks)
+        for item, certificate in zip(tasks, certificates):
+            assert certificate.merkle_proof.root == root
+            assert certificate.merkle_proof.includes(item.canonical_hash)
+        assert [name for name, _, _ in calls.mock_calls] == ["save", "commit", "broadcast_transaction"]
+
+    async def test_sends_the_epoch_back_when_the_anchor_cannot_be_prepared(
+        self, handler, task_repository, blockchain_service
+    ):
+        tasks = [task(1), task(2)]
+        task_repository.due_backlog.return_value = (2, None)
+        task_repository.claim.return_value = tasks
+        blockchain_service.prepare_anchor.side_effect = ValueError("gas estimation failed")
+
+        assert await handler.submit_pending() == 2
+
+        assert all(item.status == IssuanceTaskStatus.PENDING for item in tasks)
@@ -0,0 +1,197 @@
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, List, Optional
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from certificado_verde_blockchain.certificates.application import ReconcileChainCertificatesHandler
+from certificado_verde_blockchain.certificates.domain import Certificate, CertificateStatus, RegistryCertificate
+
+REGISTRY_ADDRESS = "0x5FbDB2315678afecb367f032d93F642f64180aa3"
+ISSUER = "0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266"
+
+
+def data_hash(blockchain_id: int) -> str:
+    return f"{blockchain_id:064x}"
+
+
+def chain_certificate(blockchain_id: int, revoked: bool = False) -> RegistryCertificate:
+    return RegistryCertificate(
+        blockchain_id=str(blockchain_id),
+        data_hash=data_hash(blockchain_id),
+        issuer=ISSUER,
+        owner=ISSUER,
+        issued_at=1700000000,
+        revoked=revoked,
+    )
+
+
+def stored_certificate(
+    blockchain_id: int, status: CertificateStatus = CertificateStatus.ISSUED, canonical_hash: Optional[str] = None
+) -> Certificate:
+    return Certificate(
+        version="2.0",
+        product_id=uuid4(),
+        producer_id=uuid4(),
+        certifier_id=uuid4(),
+        status=status,
+        valid_until=datetime.now(timezone.utc) + timedelta(days=30),
+        blockchain_id=str(blockchain_id),
+        registry_address=REGISTRY_ADDRESS,
+        canonical_hash=canonical_hash or data_hash(blockchain_id),
+    )
+
+
+@pytest.fixture
+def on_chain() -> List[RegistryCertificate]:
+    return [chain_certificate(blockchain_id) for blockchain_id in range(1, 6)]
+
+
+@pytest.fixture
+def stored() -> List[Certificate]:
+    return [stored_certificate(blockchain_id) for blockchain_id in range(1, 6)]
+
+
+@pytest.fixture
+def blockchain_service(on_chain: List[RegistryCertificate]) -> MagicMock:
+    async def read_certificates(first_id: int, last_id: int) -> AsyncIterator[List[RegistryCertificate]]:
+        certificates = on_chain[first_id - 1 : last_id]
+        for start in range(0, len(certificates), 2):
+            yield certificates[start : start + 2]
+
+    blockchain_service = MagicMock()
+    blockchain_service.registry_address = REGISTRY_ADDRESS
+    blockchain_service.count_certificates = AsyncMock(side_effect=lambda: len(on_chain))
+    blockchain_service.read_certificates = read_certificates
+    return blockchain_service
+
+
+@pytest.fixture
+def repository(stored: List[Certificate]) -> MagicMock:
+    async def find_by_blockchain_id_range(first_id: int, last_id: Optional[int], registry_address: str) -> Any:
+        assert registry_address == REGISTRY_ADDRESS
+        return [
+            certificate
+            for certificate in stored
+            if first_id <= int(certificate.blockchain_id or 0)
+            and (last_id is None or int(certificate.blockchain_id or 0) <= last_id)
+        ]
+
+    repository = MagicMock()
+    repository.find_by_blockchain_id_range = AsyncMock(side_effect=find_by_blockchain_id_range)
+    return repository
+
+
+@pytest.fixture
+def logger() -> MagicMock:
+    logger = MagicMock()
+    logger.info = AsyncMock()
+    logger.warning = AsyncMock()
+    return logger
+
+
+@pytest.fixture
+def handler(
+    repository: MagicMock, blockchain_service: MagicMock, logger: MagicMock
+) -> ReconcileChainCertificatesHandler:
+    return ReconcileChainCertificatesHandler(repository, blockchain_service, logger)
+
+
+async def reconcile(handler: ReconcileChainCertificatesHandler) -> List[Any]:
+    return [item async for item in handler.handle()]
+
+
+class TestReconcileChainCertificates:
+    async def test_matching_sides_only_report_the_summary(
+        self, handler: ReconcileChainCertificatesHandler, repository: MagicMock, logger: MagicMock
+    ):
+        assert await reconcile(handler) == [{"kind": "summary", "checked": 5, "drifts": {}}]
+        # One lookup per page of the contract, then the certificates beyond its last ID
+        assert [call.args[:2] for call in repository.find_by_blockchain_id_range.await_args_list] == [
+            (1, 2),
+            (3, 4),
+            (5, 5),
+            (6, None),
+        ]
+        logger.warning.assert_not_awaited()
+
+    async def test_every_kind_of_drift_is_reported(
+        self,
+        handler: ReconcileChainCertificatesHandler,
+        on_chain: List[RegistryCertificate],
+        stored: List[Certificate],
+        logger: MagicMock,
+    ):
+        duplicate = stored_certificate(1)
+        stored[:] = [
+            stored[0],
+            duplicate,
+            stored_certificate(3, canonical_hash="ff" * 32),
+            stored_certificate(4, CertificateStatus.REVOKED),
+            stored_certificate(5, CertificateStatus.REVOKING),
+            stored_certificate(9),
+        ]
+        on_chain[4] = chain_certificate(5, revoked=True)
+
+        drifts = await reconcile(handler)
+
+        assert [(drift["kind"], drift["blockchain_id"]) for drift in drifts[:-1]] == [
+            ("duplicate_in_database", "1"),
+            ("duplicate_in_database", "1"),
+            ("missing_in_database", "2"),
+            ("hash_mismatch", "3"),
+            ("revocation_mismatch", "4"),
+            ("missing_on_chain", "9"),
+        ]
+        assert drifts[-1] == {
+            "kind": "summary",
+            "checked": 5,
+            "drifts": {
+                "duplicate_in_database": 2,
+                "missing_in_database": 1,
+                "hash_mismatch": 1,
+                "revocation_mismatch": 1,
+                "missing_on_chain": 1,
+            },
+        }
+        logger.warning.assert_awaited_once()
+
+    async def test_drifts_describe_both_sides(
+        self, handler: ReconcileChainCertificatesHandler, stored: List[Certificate]
+    ):
+        mismatched = stored[3] = stored_certificate(4, CertificateStatus.REVOKED)
+
+        drift, _ = await reconcile(handler)
+
+        assert drift == {
+            "kind": "revocation_mismatch",
+            "blockchain_id": "4",
+            "certificate_id": str(mismatched.id),
+            "status": "revoked",
+            "canonical_hash": data_hash(4),
+            "chain_data_hash": data_hash(4),
+            "chain_revoked": False,
+        }
+
+    async def test_a_missing_certificate_has_no_database_side(
+        self, handler: ReconcileChainCertificatesHandler, stored: List[Certificate]
+    ):
+        del stored[0]
+
+        drift, _ = await reconcile(handler)
+
+        assert drift["kind"] == "missing_in_database"
+        assert drift["certificate_id"] is None
+        assert drift["status"] is None
+        assert drift["chain_data_hash"] == data_hash(1)
+
+    async def test_an_empty_contract_reports_every_stored_certificate_missing_on_chain(
+        self, handler: ReconcileChainCertificatesHandler, on_chain: List[RegistryCertificate]
+    ):
+        on_chain.clear()
+
+        drifts = await reconcile(handler)
+
+        assert [drift["kind"] for drift in drifts] == ["missing_on_chain"] * 5 + ["summary"]
+        assert drifts[0]["chain_data_hash"] is None
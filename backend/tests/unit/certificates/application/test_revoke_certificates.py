@@ -0,0 +1,131 @@
+from typing import Optional
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from certificado_verde_blockchain.certificates.application import (
+    RevokeCertificatesCommand,
+    RevokeCertificatesHandler,
+)
+from certificado_verde_blockchain.certificates.domain import (
+    Certificate,
+    CertificateStatus,
+    MerkleInclusionProof,
+    RevocationReceipt,
+)
+
+
+def certificate(
+    status: CertificateStatus = CertificateStatus.ISSUED,
+    blockchain_id: Optional[str] = None,
+    registry_address: Optional[str] = None,
+    merkle_proof: Optional[MerkleInclusionProof] = None,
+) -> Certificate:
+    return Certificate(
+        version="1.0",
+        product_id=uuid4(),
+        producer_id=uuid4(),
+        certifier_id=uuid4(),
+        status=status,
+        blockchain_id=blockchain_id,
+        registry_address=registry_address,
+        merkle_proof=merkle_proof,
+    )
+
+
+PREVIOUS_REGISTRY = "0x5FbDB2315678afecb367f032d93F642f64180aa3"
+CURRENT_REGISTRY = "0xe7f1725E7734CE288F8367e1Bb143E90bb3F0512"
+ANCHORED_PROOF = MerkleInclusionProof(root="0x" + "cd" * 32, leaf_index=0, epoch_id="3")
+
+
+@pytest.fixture
+def repository() -> MagicMock:
+    repository = MagicMock()
+    repository.find_by_ids = AsyncMock(return_value=[])
+    repository.save_all = AsyncMock()
+    return repository
+
+
+@pytest.fixture
+def blockchain_service() -> MagicMock:
+    service = MagicMock()
+    service.revoke_certificates = AsyncMock(return_value={})
+    return service
+
+
+@pytest.fixture
+def handler(repository, blockchain_service) -> RevokeCertificatesHandler:
+    unit_of_work = MagicMock()
+    unit_of_work.commit = AsyncMock()
+    logger = MagicMock()
+    for level in ("info", "warning", "error"):
+        setattr(logger, level, AsyncMock())
+    return RevokeCertificatesHandler(repository, blockchain_service, unit_of_work, logger)
+
+
+async def test_revokes_anchored_certificates_without_a_transaction(handler, repository, blockchain_service):
+    issued = certificate(merkle_proof=ANCHORED_PROOF)
+    stuck = certificate(CertificateStatus.REVOKING, merkle_proof=ANCHORED_PROOF)
+    repository.find_by_ids.return_value = [issued, stuck]
+
+    response = await handler.handle(RevokeCertificatesCommand(certificate_ids=[issued.id, stuck.id]))
+
+    assert [result["status"] for result in response["results"]] == ["revoked", "revoked"]
+    assert issued.is_revoked and stuck.is_revoked
+    assert issued.revoked_at is not None
+    blockchain_service.revoke_certificates.assert_not_awaited()
+
+
+async def test_rejects_certificates_without_a_blockchain_identifier_before_revoking_them(
+    handler, repository, blockchain_service
+):
+    unidentified = certificate()
+    repository.find_by_ids.return_value = [unidentified]
+
+    response = await handler.handle(RevokeCertificatesCommand(certificate_ids=[unidentified.id]))
+
+    assert response["results"][0]["status"] == "failed"
+    assert response["results"][0]["error"] == "Certificate has no blockchain identifier."
+    assert unidentified.is_issued
+    blockchain_service.revoke_certificates.assert_not_awaited()
+
+
+async def test_revokes_certificates_with_a_blockchain_identifier_on_the_chain(handler, repository, blockchain_service):
+    recorded = certificate(blockchain_id="7")
+    repository.find_by_ids.return_value = [recorded]
+    blockchain_service.revoke_certificates.return_value = {
+        "7": RevocationReceipt(blockchain_id="7", revoked=True, transaction_hash="0x" + "ab" * 32)
+    }
+
+    response = await handler.handle(RevokeCertificatesCommand(certificate_ids=[recorded.id]))
+
+    assert response["results"][0]["status"] == "revoked"
+    assert response["results"][0]["transaction_hash"] == "0x" + "ab" * 32
+    assert recorded.is_revoked
+    blockchain_service.revoke_certificates.assert_awaited_once_with(["7"], None)
+
+
+async def test_revokes_certificates_on_the_registry_deployment_that_recorded_them(
+    handler, repository, blockchain_service
+):
+    # The same blockchain ID on two deployments refers to two different certificates
+    previous = certificate(blockchain_id="7", registry_address=PREVIOUS_REGISTRY)
+    current = certificate(blockchain_id="7", registry_address=CURRENT_REGISTRY)
+    repository.find_by_ids.return_value = [previous, current]
+    receipts = {
+        PREVIOUS_REGISTRY: RevocationReceipt(blockchain_id="7", revoked=True, transaction_hash="0x" + "01" * 32),
+        CURRENT_REGISTRY: RevocationReceipt(blockchain_id="7", revoked=False, error="execution reverted"),
+    }
+    blockchain_service.revoke_certificates.side_effect = lambda blockchain_ids, registry_address: {
+        "7": receipts[registry_address]
+    }
+
+    response = await handler.handle(RevokeCertificatesCommand(certificate_ids=[previous.id, current.id]))
+
+    assert [result["status"] for result in response["results"]] == ["revoked", "failed"]
+    assert response["results"][0]["transaction_hash"] == "0x" + "01" * 32
+    assert previous.is_revoked and current.is_revoking
+    assert sorted(call.args[1] for call in blockchain_service.revoke_certificates.await_args_list) == sorted(
+        [PREVIOUS_REGISTRY, CURRENT_REGISTRY]
+    )
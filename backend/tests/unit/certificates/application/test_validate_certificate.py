@@ -0,0 +1,131 @@
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from certificado_verde_blockchain.certificates.application import ValidateCertificateHandler
+from certificado_verde_blockchain.certificates.domain import (
+    AnchoredRoot,
+    Certificate,
+    CertificateStatus,
+    MerkleInclusionProof,
+)
+from certificado_verde_blockchain.shared.merkle import MerkleTree
+
+HASHES = [f"{index:064x}" for index in range(1, 4)]
+TREE = MerkleTree.from_hashes(HASHES)
+ROOT = "0x" + TREE.root.hex()
+
+
+def anchored_certificate(root: str = ROOT, valid_until: Optional[datetime] = None) -> Certificate:
+    return Certificate(
+        version="1.0",
+        product_id=uuid4(),
+        producer_id=uuid4(),
+        certifier_id=uuid4(),
+        status=CertificateStatus.ISSUED,
+        valid_until=valid_until or datetime.now(timezone.utc) + timedelta(days=30),
+        canonical_hash=HASHES[1],
+        merkle_proof=MerkleInclusionProof(
+            root=root, leaf_index=1, path=["0x" + node.hex() for node in TREE.proof(1)], epoch_id="4"
+        ),
+    )
+
+
+def anchored_root(root: str = ROOT) -> AnchoredRoot:
+    return AnchoredRoot(epoch_id="4", root=root, block_number=12, transaction_hash="0x" + "ab" * 32)
+
+
+@pytest.fixture
+def repository() -> MagicMock:
+    repository = MagicMock()
+    repository.find_by_canonical_hash = AsyncMock(return_value=anchored_certificate())
+    return repository
+
+
+@pytest.fixture
+def chain_certificate_repository() -> MagicMock:
+    repository = MagicMock()
+    repository.find_anchored_root = AsyncMock(return_value=anchored_root())
+    return repository
+
+
+@pytest.fixture
+def handler(repository, chain_certificate_repository) -> ValidateCertificateHandler:
+    logger = MagicMock()
+    for level in ("info", "warning", "error"):
+        setattr(logger, level, AsyncMock())
+    return ValidateCertificateHandler(repository, MagicMock(), chain_certificate_repository, logger)
+
+
+async def test_validates_a_proof_leading_to_the_root_anchored_for_its_epoch(handler, chain_certificate_repository):
+    result = await handler.handle(HASHES[1])
+
+    assert result["is_valid"] is True
+    assert result["invalid_reason"] is None
+    assert result["merkle_anchor"]["included"] is True
+    chain_certificate_repository.find_anchored_root.assert_awaited_once_with("4")
+
+
+async def test_rejects_a_proof_whose_stored_root_differs_from_the_anchored_one(handler, repository):
+    # A consistent proof and root, both rewritten in the database, do not match what the chain recorded
+    forged_tree = MerkleTree.from_hashes([HASHES[1], HASHES[1]])
+    forged = anchored_certificate("0x" + forged_tree.root.hex())
+    forged.merkle_proof.path = ["0x" + node.hex() for node in forged_tree.proof(0)]
+    forged.merkle_proof.leaf_index = 0
+    assert forged.merkle_proof.includes(HASHES[1])
+    repository.find_by_canonical_hash.return_value = forged
+
+    result = await handler.handle(HASHES[1])
+
+    assert result["is_valid"] is False
+    assert result["invalid_reason"] == "proof_mismatch"
+    assert result["merkle_anchor"]["root"] == ROOT
+
+
+async def test_rejects_a_proof_of_an_epoch_without_a_recorded_root(handler, chain_certificate_repository):
+    chain_certificate_repository.find_anchored_root.return_value = None
+
+    result = await handler.handle(HASHES[1])
+
+    assert result["is_valid"] is False
+    assert result["merkle_anchor"]["included"] is False
+
+
+async def test_rejects_an_expired_certificate(handler, repository):
+    repository.find_by_canonical_hash.return_value = anchored_certificate(
+        valid_until=datetime.now(timezone.utc) - timedelta(days=1)
+    )
+
+    result = await handler.handle(HASHES[1])
+
+    assert result["is_valid"] is False
+    assert result["invalid_reason"] == "expired"
+
+
+@pytest.mark.parametrize("confirmed", [False, True])
+async def test_rejects_a_revoked_certificate_even_once_expired(handler, repository, confirmed):
+    certificate = anchored_certificate()
+    certificate.start_revocation()
+    if confirmed:
+        certificate.confirm_revocation()
+    certificate.valid_until = datetime.now(timezone.utc) - timedelta(days=1)
+    repository.find_by_canonical_hash.return_value = certificate
+
+    result = await handler.handle(HASHES[1])
+
+    assert result["is_valid"] is False
+    assert result["invalid_reason"] == "revoked"
+
+
+def test_a_revoked_certificate_expires_with_its_validity_period():
+    certificate = anchored_certificate()
+    certificate.start_revocation()
+    certificate.confirm_revocation()
+    assert not certificate.has_expired()
+
+    certificate.valid_until = datetime.now(timezone.utc) - timedelta(days=1)
+
+    assert certificate.has_expired()
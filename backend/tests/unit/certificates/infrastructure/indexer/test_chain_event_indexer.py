@@ -0,0 +1,279 @@
+import asyncio
+from typing import AsyncIterator, Callable, Dict, List, Optional
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession as DatabaseSession
+
+from certificado_verde_blockchain.certificates.domain import (
+    ChainCursor,
+    ChainEvent,
+    ChainEventType,
+    IChainCertificateRepository,
+)
+from certificado_verde_blockchain.certificates.infrastructure.indexer import ChainEventIndexer, chain_event_indexer
+from certificado_verde_blockchain.configuration import IndexerConfig
+from certificado_verde_blockchain.shared.errors import DomainException
+
+REGISTRY_ADDRESS = "0x5FbDB2315678afecb367f032d93F642f64180aa3"
+
+
+def block_hash(block_number: int, fork: str = "a") -> str:
+    return "0x" + f"{fork}{block_number:063x}"
+
+
+def event(block_number: int, fork: str = "a") -> ChainEvent:
+    return ChainEvent(
+        event_type=ChainEventType.CERTIFICATE_ISSUED,
+        blockchain_id=str(block_number),
+        block_number=block_number,
+        block_hash=block_hash(block_number, fork),
+        transaction_hash="0x" + "ab" * 32,
+        log_index=0,
+        timestamp=1_700_000_000,
+    )
+
+
+class InMemoryChainRepository:
+    """Keeps the cursor and the indexed blocks of one indexer."""
+
+    def __init__(self) -> None:
+        self.blocks: List[ChainCursor] = []
+        self.events: List[ChainEvent] = []
+
+    async def get_cursor(self, name: str) -> Optional[ChainCursor]:
+        return self.blocks[-1] if self.blocks else None
+
+    async def list_recent_blocks(self, name: str, limit: int) -> List[ChainCursor]:
+        return list(reversed(self.blocks))[:limit]
+
+    async def save_events(self, name: str, events: List[ChainEvent], cursor: ChainCursor) -> None:
+        self.events.extend(events)
+        self.blocks.append(cursor)
+
+    async def rollback(self, name: str, from_block: int) -> None:
+        self.events = [indexed for indexed in self.events if indexed.block_number < from_block]
+        self.blocks = [block for block in self.blocks if block.block_number < from_block]
+
+
+class Chain:
+    """A chain whose blocks carry one registry event each, and can be reorganized from a block on."""
+
+    def __init__(self, head: int) -> None:
+        self.head = head
+        self.forks: Dict[int, str] = {}
+
+    def fork_of(self, block_number: int) -> str:
+        return self.forks.get(block_number, "a")
+
+    def reorganize(self, from_block: int, fork: str = "b") -> None:
+        for block_number in range(from_block, self.head + 1):
+            self.forks[block_number] = fork
+
+
+@pytest.fixture
+def chain() -> Chain:
+    return Chain(head=26)
+
+
+@pytest.fixture
+def reader(chain) -> MagicMock:
+    reader = MagicMock()
+    reader.contract_address = REGISTRY_ADDRESS
+    reader.block_range = 5
+    reader.head = AsyncMock(side_effect=lambda: chain.head)
+    reader.block_hash = AsyncMock(
+        side_effect=lambda block_number: block_hash(block_number, chain.fork_of(block_number))
+    )
+    reader.get_events = AsyncMock(
+        side_effect=lambda from_block, to_block: [
+            event(block_number, chain.fork_of(block_number)) for block_number in range(from_block, to_block + 1)
+        ]
+    )
+    return reader
+
+
+@pytest.fixture
+def repository() -> InMemoryChainRepository:
+    return InMemoryChainRepository()
+
+
+@pytest.fixture
+def container(repository) -> MagicMock:
+    session = MagicMock()
+    session.close = AsyncMock()
+    scope = MagicMock()
+    scope.resolve.side_effect = {DatabaseSession: session, IChainCertificateRepository: repository}.get
+    container = MagicMock()
+    container.create_scope.return_value.__enter__.return_value = scope
+    return container
+
+
+@pytest.fixture
+def logger() -> MagicMock:
+    logger = MagicMock()
+    for level in ("info", "warning", "error"):
+        setattr(logger, level, AsyncMock())
+    return logger
+
+
+@pytest.fixture
+def config() -> IndexerConfig:
+    return IndexerConfig(start_block=1, confirmations=6, backfill_concurrency=2, reorg_lookback_blocks=8)
+
+
+@pytest.fixture
+def indexer(container, config, reader, logger) -> ChainEventIndexer:
+    return ChainEventIndexer(container, config, reader, logger)
+
+
+async def test_indexes_confirmed_ranges_in_order_up_to_the_confirmed_head(indexer, repository):
+    assert await indexer.sync_once() == (10, False)
+    assert await indexer.sync_once() == (10, True)
+
+    assert [indexed.block_number for indexed in repository.events] == list(range(1, 21))
+    assert repository.blocks[-1] == ChainCursor(block_number=20, block_hash=block_hash(20))
+    assert await indexer.sync_once() == (0, True)
+
+
+async def test_rejects_a_range_whose_last_block_changed_while_its_logs_were_read(indexer, repository, reader, chain):
+    read_events = reader.get_events.side_effect
+
+    def reorganized_during_read(from_block: int, to_block: int) -> List[ChainEvent]:
+        events = read_events(from_block, to_block)
+        chain.reorganize(from_block)
+        return events
+
+    reader.get_events.side_effect = reorganized_during_read
+
+    with pytest.raises(DomainException):
+        await indexer.sync_once()
+
+    assert not repository.blocks and not repository.events
+
+
+async def test_rejects_a_range_whose_logs_come_from_another_fork_of_its_last_block(indexer, repository, reader):
+    reader.get_events.side_effect = lambda from_block, to_block: [event(to_block, fork="b")]
+
+    with pytest.raises(DomainException):
+        await indexer.sync_once()
+
+    assert not repository.blocks
+
+
+async def test_rolls_back_to_the_fork_point_and_reindexes_the_new_fork(indexer, repository, chain):
+    await indexer.sync_once()
+    chain.reorganize(8)
+
+    await indexer.sync_once()
+
+    # Block 10 is on the old fork, block 5 is not: blocks 6 on are indexed again from the new fork
+    assert [(indexed.block_number, indexed.block_hash) for indexed in repository.events] == [
+        (block_number, block_hash(block_number, chain.fork_of(block_number))) for block_number in range(1, 16)
+    ]
+
+
+async def test_reindexes_from_the_start_block_when_the_fork_is_deeper_than_the_lookback(indexer, repository, chain):
+    await indexer.sync_once()
+    await indexer.sync_once()
+    chain.reorganize(1)
+
+    await indexer.sync_once()
+
+    assert [indexed.block_hash for indexed in repository.events] == [
+        block_hash(block_number, "b") for block_number in range(1, 11)
+    ]
+
+
+async def until(condition: Callable[[], bool], timeout: float = 1) -> None:
+    async def wait() -> None:
+        while not condition():
+            await asyncio.sleep(0.001)
+
+    await asyncio.wait_for(wait(), timeout)
+
+
+class TestBackground:
+    @pytest.fixture
+    def config(self) -> IndexerConfig:
+        return IndexerConfig(enabled=True, start_block=1, confirmations=6, backfill_concurrency=2, poll_interval_ms=10)
+
+    async def test_indexes_new_blocks_until_stopped(self, indexer, repository, chain):
+        indexer.start()
+        await until(lambda: len(repository.events) == 20)
+        chain.head = 30
+        await until(lambda: len(repository.events) == 24)
+        await indexer.stop()
+
+        chain.head = 40
+        await asyncio.sleep(0.03)
+        assert len(repository.events) == 24
+
+    async def test_does_not_start_when_disabled(self, container, config, reader, logger):
+        indexer = ChainEventIndexer(container, config.model_copy(update={"enabled": False}), reader, logger)
+
+        indexer.start()
+        await indexer.stop()
+
+        container.create_scope.assert_not_called()
+
+    async def test_keeps_indexing_after_a_failed_step(self, indexer, repository, reader, logger):
+        reader.head.side_effect = [ConnectionError("node unreachable"), 26, 26, 26, 26]
+
+        indexer.start()
+        await until(lambda: len(repository.events) == 20)
+        await indexer.stop()
+
+        logger.error.assert_awaited_once_with("Chain event indexer failed: node unreachable")
+
+    async def test_wakes_up_on_the_new_heads_of_the_subscription(
+        self, container, config, reader, repository, logger, chain, monkeypatch
+    ):
+        new_heads = asyncio.Queue()
+
+        class Subscription:
+            def __init__(self, provider) -> None:
+                self.eth = MagicMock(subscribe=AsyncMock())
+                self.socket = MagicMock(process_subscriptions=self.process_subscriptions)
+
+            async def __aenter__(self) -> "Subscription":
+                return self
+
+            async def __aexit__(self, *exc_info) -> None:
+                return None
+
+            async def process_subscriptions(self) -> AsyncIterator[int]:
+                while True:
+                    yield await new_heads.get()
+
+        monkeypatch.setattr(chain_event_indexer, "AsyncWeb3", Subscription)
+        monkeypatch.setattr(chain_event_indexer, "WebSocketProvider", MagicMock())
+        # Without the subscription the indexer would only poll again after a minute
+        indexer = ChainEventIndexer(
+            container,
+            config.model_copy(update={"poll_interval_ms": 60_000, "websocket_url": "ws://127.0.0.1:8545"}),
+            reader,
+            logger,
+        )
+
+        indexer.start()
+        await until(lambda: len(repository.events) == 20)
+        chain.head = 30
+        await new_heads.put(30)
+        await until(lambda: len(repository.events) == 24)
+        await indexer.stop()
+
+    async def test_keeps_polling_while_the_subscription_fails(
+        self, container, config, reader, repository, logger, monkeypatch
+    ):
+        monkeypatch.setattr(chain_event_indexer, "WebSocketProvider", MagicMock(side_effect=OSError("refused")))
+        indexer = ChainEventIndexer(
+            container, config.model_copy(update={"websocket_url": "ws://127.0.0.1:8545"}), reader, logger
+        )
+
+        indexer.start()
+        await until(lambda: logger.warning.await_count >= 2)
+        await until(lambda: len(repository.events) == 20)
+        await indexer.stop()
+
+        logger.warning.assert_awaited_with("Chain event indexer subscription failed: refused")
@@ -0,0 +1,189 @@
+import json
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from eth_abi import encode
+from hexbytes import HexBytes
+from web3 import AsyncWeb3, Web3
+
+from certificado_verde_blockchain.certificates.domain import ChainEventType
+from certificado_verde_blockchain.certificates.infrastructure.indexer import ChainLogReader
+from certificado_verde_blockchain.certificates.infrastructure.web3 import ContractBinding
+from certificado_verde_blockchain.configuration import IndexerConfig
+from certificado_verde_blockchain.shared.errors import DomainException
+from tests.support.registry import REGISTRY_V1_ABI_PATH, REGISTRY_V2_ABI_PATH
+
+REGISTRY_ADDRESS = "0x5FbDB2315678afecb367f032d93F642f64180aa3"
+ISSUER = "0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266"
+OWNER = Web3.to_checksum_address("0x70997970c51812dc3a731c8b2f3f5d8bbe7e8bf4")
+DATA_HASH = "ab" * 32
+
+
+def load_abi(abi_path: str) -> List[Dict[str, Any]]:
+    with open(abi_path, "r", encoding="utf-8") as abi_file:
+        return json.load(abi_file)["abi"]
+
+
+def binding(abi_path: str) -> ContractBinding:
+    return ContractBinding(REGISTRY_ADDRESS, abi_path, load_abi(abi_path), AsyncWeb3())
+
+
+def log(topics: List[bytes], data: bytes, block_number: int = 7, log_index: int = 0) -> Dict[str, Any]:
+    return {
+        "address": REGISTRY_ADDRESS,
+        "topics": [HexBytes(topic) for topic in topics],
+        "data": HexBytes(data),
+        "blockNumber": block_number,
+        "blockHash": HexBytes(block_number.to_bytes(32, "big")),
+        "transactionHash": HexBytes("cd" * 32),
+        "logIndex": log_index,
+    }
+
+
+def uint(value: int) -> bytes:
+    return value.to_bytes(32, "big")
+
+
+def address(value: str) -> bytes:
+    return bytes(12) + bytes(HexBytes(value))
+
+
+def topic(signature: str) -> bytes:
+    return bytes(Web3.keccak(text=signature))
+
+
+@pytest.fixture
+def web3_client() -> MagicMock:
+    web3_client = MagicMock()
+    web3_client.eth.get_logs = AsyncMock(return_value=[])
+    return web3_client
+
+
+def reader(abi_path: str, web3_client: MagicMock, max_block_range: int = 100) -> ChainLogReader:
+    return ChainLogReader(binding(abi_path), IndexerConfig(max_block_range=max_block_range), web3_client)
+
+
+async def test_decodes_the_events_of_a_v2_registry(web3_client):
+    root = "0x" + "ef" * 32
+    web3_client.eth.get_logs.return_value = [
+        log(
+            [topic("CertificateIssued(uint256,bytes32,address,address,uint256)"), uint(1), bytes.fromhex(DATA_HASH)]
+            + [address(OWNER)],
+            encode(["address", "uint256"], [ISSUER, 1_700_000_000]),
+        ),
+        log(
+            [topic("RootAnchored(uint256,bytes32,address,uint256,uint256)"), uint(4), HexBytes(root), address(ISSUER)],
+            encode(["uint256", "uint256"], [2, 1_700_000_001]),
+            log_index=1,
+        ),
+        log([topic("CertificateRevoked(uint256,uint256)"), uint(1)], encode(["uint256"], [1_700_000_002]), log_index=2),
+    ]
+
+    issued, anchored, revoked = await reader(REGISTRY_V2_ABI_PATH, web3_client).get_events(1, 10)
+
+    assert (issued.event_type, issued.blockchain_id, issued.data_hash) == (
+        ChainEventType.CERTIFICATE_ISSUED,
+        "1",
+        DATA_HASH,
+    )
+    assert (issued.issuer, issued.owner, issued.timestamp) == (ISSUER, OWNER, 1_700_000_000)
+    assert issued.block_hash == "0x" + uint(7).hex()
+    assert (anchored.event_type, anchored.blockchain_id, anchored.data_hash) == (
+        ChainEventType.ROOT_ANCHORED,
+        "4",
+        root,
+    )
+    assert anchored.issuer == ISSUER
+    assert (revoked.event_type, revoked.blockchain_id, revoked.log_index) == (
+        ChainEventType.CERTIFICATE_REVOKED,
+        "1",
+        2,
+    )
+
+
+async def test_decodes_the_string_hash_of_a_v1_registry(web3_client):
+    web3_client.eth.get_logs.return_value = [
+        log(
+            [topic("CertificateIssued(uint256,address,address,string,uint256)"), uint(3), address(ISSUER)]
+            + [address(OWNER)],
+            encode(["string", "uint256"], [DATA_HASH, 1_700_000_000]),
+        )
+    ]
+
+    (issued,) = await reader(REGISTRY_V1_ABI_PATH, web3_client).get_events(1, 10)
+
+    assert (issued.blockchain_id, issued.data_hash, issued.issuer, issued.owner) == ("3", DATA_HASH, ISSUER, OWNER)
+
+
+async def test_requests_the_registry_events_of_the_range(web3_client):
+    await reader(REGISTRY_V2_ABI_PATH, web3_client).get_events(5, 9)
+
+    (request,) = web3_client.eth.get_logs.await_args.args
+    assert (request["address"], request["fromBlock"], request["toBlock"]) == (REGISTRY_ADDRESS, 5, 9)
+    assert set(request["topics"][0]) == {
+        HexBytes(topic("CertificateIssued(uint256,bytes32,address,address,uint256)")),
+        HexBytes(topic("CertificateRevoked(uint256,uint256)")),
+        HexBytes(topic("RootAnchored(uint256,bytes32,address,uint256,uint256)")),
+    }
+
+
+def rejecting_ranges_over(web3_client: MagicMock, max_blocks: float) -> None:
+    def get_logs(request: Dict[str, Any]) -> List[Dict[str, Any]]:
+        if request["toBlock"] - request["fromBlock"] + 1 > max_blocks:
+            raise ValueError("query returned more than 10000 results")
+        return []
+
+    web3_client.eth.get_logs.side_effect = get_logs
+
+
+async def test_splits_a_rejected_range_in_halves(web3_client):
+    rejecting_ranges_over(web3_client, 25)
+
+    assert await reader(REGISTRY_V2_ABI_PATH, web3_client).get_events(1, 100) == []
+
+    ranges = [(call.args[0]["fromBlock"], call.args[0]["toBlock"]) for call in web3_client.eth.get_logs.await_args_list]
+    assert [block_range for block_range in ranges if block_range[1] - block_range[0] < 25] == [
+        (1, 25),
+        (26, 50),
+        (51, 75),
+        (76, 100),
+    ]
+
+
+async def test_keeps_the_smaller_size_and_grows_it_back_while_ranges_come_back_small(web3_client):
+    rejecting_ranges_over(web3_client, 10)
+    log_reader = reader(REGISTRY_V2_ABI_PATH, web3_client, max_block_range=40)
+
+    await log_reader.get_events(1, 40)
+
+    # Shrunk to 10 blocks, then doubled by the nearly empty ranges of that size
+    assert log_reader.block_range == 20
+    rejecting_ranges_over(web3_client, float("inf"))
+    await log_reader.get_events(41, 60)
+    assert log_reader.block_range == 40
+
+
+async def test_fails_when_a_single_block_is_rejected(web3_client):
+    web3_client.eth.get_logs.side_effect = TimeoutError("read timed out")
+
+    with pytest.raises(DomainException, match="block 8"):
+        await reader(REGISTRY_V2_ABI_PATH, web3_client).get_events(8, 8)
+
+
+async def test_reads_the_head_and_block_hashes(web3_client):
+    web3_client.eth.block_number = AsyncMock(return_value=42)()
+    web3_client.eth.get_block = AsyncMock(return_value={"hash": HexBytes(uint(9))})
+    log_reader = reader(REGISTRY_V2_ABI_PATH, web3_client)
+
+    assert await log_reader.head() == 42
+    assert await log_reader.block_hash(9) == "0x" + uint(9).hex()
+
+
+def test_rejects_an_abi_without_the_registry_events(web3_client):
+    abi = [entry for entry in load_abi(REGISTRY_V2_ABI_PATH) if entry.get("name") != "CertificateRevoked"]
+
+    with pytest.raises(DomainException, match="CertificateRevoked"):
+        ChainLogReader(
+            ContractBinding(REGISTRY_ADDRESS, REGISTRY_V2_ABI_PATH, abi, AsyncWeb3()), IndexerConfig(), web3_client
+        )
@@ -0,0 +1,154 @@
+from typing import Any, Dict
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID, uuid4
+
+import pytest
+
+from certificado_verde_blockchain.certificates.infrastructure.internal.internal_producer_service import (
+    InternalProducerService,
+)
+from certificado_verde_blockchain.shared.errors import DomainException
+
+
+def producer(**overrides: Any) -> Dict[str, Any]:
+    return {
+        "id": str(uuid4()),
+        "name": "Fazenda Boa Vista",
+        "document": {"document_type": "CNPJ", "number": "111"},
+        "address": {
+            "country": "Brasil",
+            "state": "GO",
+            "city": "Rio Verde",
+            "coordinates": {"latitude": -15, "longitude": -47.9},
+        },
+        "car_code": "GO-1",
+        **overrides,
+    }
+
+
+def document(**overrides: Any) -> Dict[str, Any]:
+    return {**producer()["document"], **overrides}
+
+
+def address(**overrides: Any) -> Dict[str, Any]:
+    return {**producer()["address"], **overrides}
+
+
+@pytest.fixture
+def find_by_id() -> MagicMock:
+    handler = MagicMock()
+    handler.handle = AsyncMock()
+    return handler
+
+
+@pytest.fixture
+def find_by_ids() -> MagicMock:
+    handler = MagicMock()
+    handler.handle = AsyncMock()
+    return handler
+
+
+@pytest.fixture
+def service(find_by_id: MagicMock, find_by_ids: MagicMock) -> InternalProducerService:
+    return InternalProducerService(find_by_id, find_by_ids)
+
+
+class TestFindCanonical:
+    async def test_a_producer_is_flattened_into_its_canonical_form(
+        self, service: InternalProducerService, find_by_id: MagicMock
+    ):
+        found = producer()
+        find_by_id.handle.return_value = found
+
+        canonical = await service.find_canonical_by_id(UUID(found["id"]))
+
+        assert canonical == {
+            "id": found["id"],
+            "name": "Fazenda Boa Vista",
+            "document_type": "CNPJ",
+            "document_number": "111",
+            "car_code": "GO-1",
+            "address_country": "Brasil",
+            "address_state": "GO",
+            "address_city": "Rio Verde",
+            "address_latitude": -15.0,
+            "address_longitude": -47.9,
+        }
+        assert isinstance(canonical["address_latitude"], float)
+
+    async def test_producers_found_together_are_keyed_by_their_id(
+        self, service: InternalProducerService, find_by_ids: MagicMock
+    ):
+        first, second = producer(), producer(name="Sítio Novo", document=document(number="222"))
+        find_by_ids.handle.return_value = {"producers": [first, second]}
+
+        canonical = await service.find_canonical_by_ids([UUID(first["id"]), UUID(second["id"])])
+
+        assert {id: producer["document_number"] for id, producer in canonical.items()} == {
+            UUID(first["id"]): "111",
+            UUID(second["id"]): "222",
+        }
+
+    @pytest.mark.parametrize(
+        "found, message",
+        [
+            ("Fazenda", "Invalid producer data format."),
+            ({"id": str(uuid4()), "name": "Fazenda"}, "Missing required producer fields."),
+            (producer(document="111"), "Invalid producer document format."),
+            (producer(address="Rio Verde"), "Invalid producer address format."),
+            (producer(document={"number": "111"}), "Missing required producer document fields."),
+            (producer(address={"country": "Brasil"}), "Missing required producer address fields."),
+            (producer(address=address(coordinates=None)), "Invalid producer address coordinates format."),
+            (
+                producer(address=address(coordinates={"latitude": -15})),
+                "Missing required producer address coordinates fields.",
+            ),
+            (producer(id=None), "Invalid producer ID format."),
+            (producer(name=1), "Invalid producer name format."),
+            (producer(document=document(document_type=None)), "Invalid producer document type format."),
+            (producer(document=document(number=111)), "Invalid producer document number format."),
+            (producer(car_code=1), "Invalid producer car code format."),
+            (producer(address=address(country=None)), "Invalid producer address country format."),
+            (producer(address=address(state=52)), "Invalid producer address state format."),
+            (producer(address=address(city=5218805)), "Invalid producer address city format."),
+            (
+                producer(address=address(coordinates={"latitude": None, "longitude": -47.9})),
+                "Invalid producer address coordinates latitude format.",
+            ),
+            (
+                producer(address=address(coordinates={"latitude": -15, "longitude": "-47.9"})),
+                "Invalid producer address coordinates longitude format.",
+            ),
+        ],
+    )
+    async def test_malformed_producers_are_rejected(
+        self, service: InternalProducerService, find_by_id: MagicMock, found: Any, message: str
+    ):
+        find_by_id.handle.return_value = found
+
+        with pytest.raises(DomainException) as error:
+            await service.find_canonical_by_id(uuid4())
+
+        assert error.value.message == message
+
+
+class TestProducerExists:
+    async def test_a_found_producer_exists(self, service: InternalProducerService, find_by_id: MagicMock):
+        find_by_id.handle.return_value = producer()
+
+        assert await service.producer_exists(uuid4()) is True
+
+    async def test_a_producer_that_is_not_found_does_not_exist(
+        self, service: InternalProducerService, find_by_id: MagicMock
+    ):
+        find_by_id.handle.side_effect = DomainException("Producer not found", 404)
+
+        assert await service.producer_exists(uuid4()) is False
+
+    async def test_other_failures_are_raised(self, service: InternalProducerService, find_by_id: MagicMock):
+        find_by_id.handle.side_effect = DomainException("Invalid producer id")
+
+        with pytest.raises(DomainException) as error:
+            await service.producer_exists(uuid4())
+
+        assert error.value.code == 400
@@ -0,0 +1,149 @@
+from typing import Any, Dict
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID, uuid4
+
+import pytest
+
+from certificado_verde_blockchain.certificates.infrastructure.internal.internal_product_service import (
+    InternalProductService,
+)
+from certificado_verde_blockchain.shared.errors import DomainException
+
+
+def product(**overrides: Any) -> Dict[str, Any]:
+    return {
+        "id": str(uuid4()),
+        "name": "Soja",
+        "category": "GRAIN",
+        "quantity": {"value": 1200, "unit": "KG"},
+        "origin": {
+            "country": "Brasil",
+            "state": "MT",
+            "city": None,
+            "coordinates": {"latitude": -12, "longitude": -55.7},
+        },
+        "lot_number": "L-42",
+        **overrides,
+    }
+
+
+def origin(**overrides: Any) -> Dict[str, Any]:
+    return {**product()["origin"], **overrides}
+
+
+@pytest.fixture
+def find_by_id() -> MagicMock:
+    handler = MagicMock()
+    handler.handle = AsyncMock()
+    return handler
+
+
+@pytest.fixture
+def find_by_ids() -> MagicMock:
+    handler = MagicMock()
+    handler.handle = AsyncMock()
+    return handler
+
+
+@pytest.fixture
+def service(find_by_id: MagicMock, find_by_ids: MagicMock) -> InternalProductService:
+    return InternalProductService(find_by_id, find_by_ids)
+
+
+class TestFindCanonical:
+    async def test_a_product_is_flattened_into_its_canonical_form(
+        self, service: InternalProductService, find_by_id: MagicMock
+    ):
+        found = product()
+        find_by_id.handle.return_value = found
+
+        canonical = await service.find_canonical_by_id(UUID(found["id"]))
+
+        assert canonical == {
+            "id": found["id"],
+            "name": "Soja",
+            "category": "GRAIN",
+            "quantity_value": 1200.0,
+            "quantity_unit": "KG",
+            "origin_country": "Brasil",
+            "origin_state": "MT",
+            "origin_city": None,
+            "origin_latitude": -12.0,
+            "origin_longitude": -55.7,
+            "lot_number": "L-42",
+        }
+        assert isinstance(canonical["quantity_value"], float)
+
+    async def test_products_found_together_are_keyed_by_their_id(
+        self, service: InternalProductService, find_by_ids: MagicMock
+    ):
+        soja, milho = product(), product(name="Milho", lot_number=None)
+        find_by_ids.handle.return_value = {"products": [soja, milho]}
+
+        canonical = await service.find_canonical_by_ids([UUID(soja["id"]), UUID(milho["id"])])
+
+        assert {id: product["name"] for id, product in canonical.items()} == {
+            UUID(soja["id"]): "Soja",
+            UUID(milho["id"]): "Milho",
+        }
+        assert canonical[UUID(milho["id"])]["lot_number"] is None
+
+    @pytest.mark.parametrize(
+        "found, message",
+        [
+            (["Soja"], "Invalid product data format."),
+            ({"id": str(uuid4()), "name": "Soja"}, "Missing required product fields."),
+            (product(origin="Brasil"), "Invalid product origin format."),
+            (product(origin={"country": "Brasil"}), "Missing required product origin coordinates fields."),
+            (product(origin=origin(coordinates=[-12, -55.7])), "Invalid product origin coordinates format."),
+            (product(quantity=1200), "Invalid product quantity format."),
+            (product(id=42), "Invalid product ID format."),
+            (product(name=None), "Invalid product name format."),
+            (product(category=1), "Invalid product category format."),
+            (product(origin=origin(country=None)), "Invalid product origin country format."),
+            (product(origin=origin(state=1)), "Invalid product origin state format."),
+            (product(origin=origin(city=1)), "Invalid product origin city format."),
+            (
+                product(origin=origin(coordinates={"latitude": "-12", "longitude": -55.7})),
+                "Invalid product origin coordinates latitude format.",
+            ),
+            (
+                product(origin=origin(coordinates={"latitude": -12})),
+                "Invalid product origin coordinates longitude format.",
+            ),
+            (product(quantity={"value": "1200", "unit": "KG"}), "Invalid product quantity value format."),
+            (product(quantity={"value": 1200}), "Invalid product quantity unit format."),
+            (product(lot_number=42), "Invalid product lot number format."),
+        ],
+    )
+    async def test_malformed_products_are_rejected(
+        self, service: InternalProductService, find_by_id: MagicMock, found: Any, message: str
+    ):
+        find_by_id.handle.return_value = found
+
+        with pytest.raises(DomainException) as error:
+            await service.find_canonical_by_id(uuid4())
+
+        assert error.value.message == message
+
+
+class TestProductExists:
+    async def test_a_found_product_exists(self, service: InternalProductService, find_by_id: MagicMock):
+        find_by_id.handle.return_value = product()
+
+        assert await service.product_exists(uuid4()) is True
+
+    async def test_a_product_that_is_not_found_does_not_exist(
+        self, service: InternalProductService, find_by_id: MagicMock
+    ):
+        find_by_id.handle.side_effect = DomainException("Product not found", 404)
+
+        assert await service.product_exists(uuid4()) is False
+
+    async def test_other_failures_are_raised(self, service: InternalProductService, find_by_id: MagicMock):
+        find_by_id.handle.side_effect = DomainException("Invalid product id")
+
+        with pytest.raises(DomainException) as error:
+            await service.product_exists(uuid4())
+
+        assert error.value.code == 400
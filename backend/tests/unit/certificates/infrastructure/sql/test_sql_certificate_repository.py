@@ -0,0 +1,435 @@
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, List, Optional
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
+
+from certificado_verde_blockchain.certificates.domain import Certificate, CertificateStatus, Norm
+from certificado_verde_blockchain.certificates.infrastructure.sql import SqlCertificateRepository
+from certificado_verde_blockchain.shared.errors import DomainException
+from certificado_verde_blockchain.shared.sql import SqlUnitOfWork
+
+
+def certificate(canonical_hash: Optional[str] = None) -> Certificate:
+    return Certificate(
+        id=uuid4(),
+        version="1.0",
+        product_id=uuid4(),
+        producer_id=uuid4(),
+        certifier_id=uuid4(),
+        canonical_hash=canonical_hash,
+    )
+
+
+def entity(domain_object: Certificate) -> MagicMock:
+    certificate_entity = MagicMock()
+    certificate_entity.to_domain.side_effect = lambda: domain_object.model_copy(deep=True)
+    return certificate_entity
+
+
+@pytest.fixture
+def database_session() -> MagicMock:
+    database_session = MagicMock()
+    database_session.scalar = AsyncMock(return_value=None)
+    database_session.scalars = AsyncMock()
+    database_session.rollback = AsyncMock()
+    return database_session
+
+
+@pytest.fixture
+def unit_of_work(database_session) -> SqlUnitOfWork:
+    return SqlUnitOfWork(database_session)
+
+
+@pytest.fixture
+def repository(database_session, unit_of_work) -> SqlCertificateRepository:
+    return SqlCertificateRepository(database_session, unit_of_work)
+
+
+def returns_rows(database_session: MagicMock, certificates: List[Certificate]) -> None:
+    database_session.scalars.return_value = MagicMock()
+    database_session.scalars.return_value.all.return_value = [entity(item) for item in certificates]
+
+
+def filtered_by(database_session: MagicMock) -> str:
+    """The WHERE, ORDER BY and LIMIT clauses of the last query, with its values inlined."""
+    statement = database_session.scalars.await_args.args[0]
+    sql = str(statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+    return " ".join(sql.split("FROM certificates", 1)[1].split())
+
+
+async def test_find_by_id_serves_the_scope_first(repository, unit_of_work, database_session):
+    in_scope = certificate()
+    unit_of_work.track(in_scope)
+
+    assert await repository.find_by_id(in_scope.id) == in_scope
+    database_session.scalar.assert_not_awaited()
+
+
+async def test_find_by_id_keeps_the_loaded_certificate_in_the_scope(repository, unit_of_work, database_session):
+    loaded = certificate()
+    database_session.scalar.return_value = entity(loaded)
+
+    assert await repository.find_by_id(loaded.id) == loaded
+    assert unit_of_work.find(Certificate, loaded.id) == loaded
+
+
+async def test_find_by_id_of_an_unknown_certificate_is_none(repository, unit_of_work):
+    unknown = uuid4()
+
+    assert await repository.find_by_id(unknown) is None
+    assert unit_of_work.find(Certificate, unknown) is None
+
+
+async def test_a_failed_find_by_id_rolls_the_session_back(repository, database_session):
+    database_session.scalar.side_effect = RuntimeError("connection lost")
+
+    with pytest.raises(RuntimeError):
+        await repository.find_by_id(uuid4())
+
+    database_session.rollback.assert_awaited_once()
+
+
+async def test_find_by_ids_only_loads_the_certificates_missing_from_the_scope(
+    repository, unit_of_work, database_session
+):
+    in_scope, in_database = certificate(), certificate()
+    unit_of_work.track(in_scope)
+    returns_rows(database_session, [in_database])
+
+    found = await repository.find_by_ids([in_scope.id, in_database.id])
+
+    assert {item.id for item in found} == {in_scope.id, in_database.id}
+    statement = database_session.scalars.await_args.args[0]
+    assert list(statement.compile().params.values()) == [[str(in_database.id)]]
+
+
+async def test_find_by_ids_keeps_the_loaded_certificates_in_the_scope(repository, database_session):
+    loaded = certificate()
+    returns_rows(database_session, [loaded])
+    await repository.find_by_ids([loaded.id])
+    database_session.scalars.reset_mock()
+
+    found = await repository.find_by_ids([loaded.id, loaded.id])
+
+    assert [item.id for item in found] == [loaded.id]
+    database_session.scalars.assert_not_awaited()
+
+
+async def test_find_by_ids_returns_copies_of_the_scope(repository, unit_of_work):
+    in_scope = certificate()
+    unit_of_work.track(in_scope)
+
+    (found,) = await repository.find_by_ids([in_scope.id])
+    found.notes = "changed"
+
+    assert unit_of_work.find(Certificate, in_scope.id).notes != "changed"
+
+
+async def test_find_by_canonical_hash_serves_a_certificate_saved_in_the_scope(
+    repository, unit_of_work, database_session
+):
+    saved = certificate(canonical_hash="0x" + "ab" * 32)
+    unit_of_work.track(saved)
+
+    found = await repository.find_by_canonical_hash(saved.canonical_hash)
+
+    assert found is not None and found.id == saved.id
+    database_session.scalar.assert_not_awaited()
+
+
+async def test_find_by_canonical_hash_keeps_the_loaded_certificate_in_the_scope(
+    repository, unit_of_work, database_session
+):
+    loaded = certificate(canonical_hash="0x" + "ab" * 32)
+    database_session.scalar.return_value = entity(loaded)
+
+    found = await repository.find_by_canonical_hash(loaded.canonical_hash)
+
+    assert found is not None and found.id == loaded.id
+    assert unit_of_work.find(Certificate, loaded.id) == loaded
+
+
+async def test_find_by_canonical_hash_ignores_a_row_changed_in_the_scope(repository, unit_of_work, database_session):
+    stored = certificate(canonical_hash="0x" + "ab" * 32)
+    unit_of_work.track(stored.model_copy(update={"canonical_hash": "0x" + "cd" * 32}))
+    database_session.scalar.return_value = entity(stored)
+
+    assert await repository.find_by_canonical_hash(stored.canonical_hash) is None
+
+
+@pytest.mark.parametrize(
+    "method, column",
+    [
+        ("find_by_product_id", "product_id"),
+        ("find_by_producer_id", "producer_id"),
+        ("find_by_certifier_id", "certifier_id"),
+    ],
+)
+async def test_pages_by_owner_seek_past_the_last_id(repository, database_session, method: str, column: str):
+    owner_id, after_id = UUID(int=1), UUID(int=2)
+    page = [certificate(), certificate()]
+    returns_rows(database_session, page)
+
+    found = await getattr(repository, method)(owner_id, after_id, 2, CertificateStatus.ISSUED)
+
+    assert [item.id for item in found] == [item.id for item in page]
+    assert filtered_by(database_session) == (
+        f"WHERE certificates.{column} = '{owner_id.hex}' AND certificates.status = 'issued' "
+        f"AND certificates.id > '{after_id.hex}' ORDER BY certificates.id LIMIT 2"
+    )
+
+
+async def test_the_first_page_by_owner_starts_at_the_lowest_id(repository, database_session):
+    returns_rows(database_session, [])
+
+    assert await repository.find_by_product_id(UUID(int=1), None, 10) == []
+    assert filtered_by(database_session) == (
+        f"WHERE certificates.product_id = '{UUID(int=1).hex}' ORDER BY certificates.id LIMIT 10"
+    )
+
+
+async def test_a_failed_page_rolls_the_session_back(repository, database_session):
+    database_session.scalars.side_effect = ConnectionError("server closed the connection")
+
+    with pytest.raises(ConnectionError):
+        await repository.find_by_certifier_id(UUID(int=1), None, 10)
+
+    database_session.rollback.assert_awaited_once()
+
+
+async def test_pre_issued_certificates_are_listed_with_the_partial_index_predicate(repository, database_session):
+    returns_rows(database_session, [])
+
+    await repository.list_pre_issued(UUID(int=1), None, 50)
+
+    # The statuses are inlined, as in the predicate of ix_certificates_pre_issued_*
+    assert filtered_by(database_session) == (
+        "WHERE certificates.status IN ('pre_issued', 'failed') "
+        f"AND certificates.certifier_id = '{UUID(int=1).hex}' ORDER BY certificates.id LIMIT 50"
+    )
+    statement = database_session.scalars.await_args.args[0]
+    statuses = [bind for bind in statement.compile().binds.values() if bind.value in ("pre_issued", "failed")]
+    assert {bind.value for bind in statuses} == {"pre_issued", "failed"}
+    assert all(bind.literal_execute for bind in statuses)
+
+
+async def test_pre_issued_certificates_of_every_certifier_are_paged_by_id(repository, database_session):
+    returns_rows(database_session, [])
+
+    await repository.list_pre_issued(None, UUID(int=2), 50)
+
+    assert filtered_by(database_session) == (
+        "WHERE certificates.status IN ('pre_issued', 'failed') "
+        f"AND certificates.id > '{UUID(int=2).hex}' ORDER BY certificates.id LIMIT 50"
+    )
+
+
+@pytest.mark.parametrize(
+    "method, column",
+    [("find_by_expiry_window", "valid_until"), ("find_by_issuance_window", "issued_at")],
+)
+async def test_date_windows_are_paged_by_date_then_id(repository, database_session, method: str, column: str):
+    returns_rows(database_session, [])
+    after = (datetime(2026, 1, 5, tzinfo=timezone(timedelta(hours=-3))), UUID(int=3))
+
+    await getattr(repository, method)(
+        datetime(2026, 1, 1, tzinfo=timezone.utc), datetime(2026, 2, 1), after, 5, CertificateStatus.ISSUED
+    )
+
+    # A naive bound is taken as UTC, an aware one keeps its offset
+    assert filtered_by(database_session) == (
+        f"WHERE certificates.{column} >= '2026-01-01 00:00:00+00:00' "
+        f"AND certificates.{column} < '2026-02-01 00:00:00+00:00' AND certificates.status = 'issued' "
+        f"AND (certificates.{column}, certificates.id) > ('2026-01-05 00:00:00-03:00', '{UUID(int=3).hex}') "
+        f"ORDER BY certificates.{column}, certificates.id LIMIT 5"
+    )
+
+
+async def test_the_first_page_of_a_date_window_starts_at_its_beginning(repository, database_session):
+    page = [certificate()]
+    returns_rows(database_session, page)
+
+    found = await repository.find_by_expiry_window(datetime(2026, 1, 1), datetime(2026, 2, 1), None, 5)
+
+    assert [item.id for item in found] == [page[0].id]
+    assert filtered_by(database_session) == (
+        "WHERE certificates.valid_until >= '2026-01-01 00:00:00+00:00' "
+        "AND certificates.valid_until < '2026-02-01 00:00:00+00:00' "
+        "ORDER BY certificates.valid_until, certificates.id LIMIT 5"
+    )
+
+
+async def test_a_failed_date_window_rolls_the_session_back(repository, database_session):
+    database_session.scalars.side_effect = ConnectionError("server closed the connection")
+
+    with pytest.raises(ConnectionError):
+        await repository.find_by_issuance_window(datetime(2026, 1, 1), datetime(2026, 2, 1), None, 5)
+
+    database_session.rollback.assert_awaited_once()
+
+
+async def test_blockchain_id_ranges_compare_the_ids_as_numbers(repository, database_session):
+    returns_rows(database_session, [])
+
+    await repository.find_by_blockchain_id_range(3, 9, "0x5FbDB2315678afecb367f032d93F642f64180aa3")
+
+    # Certificates without a recorded deployment are taken as recorded on the current one
+    assert filtered_by(database_session) == (
+        "WHERE certificates.blockchain_id IS NOT NULL AND CAST(certificates.blockchain_id AS BIGINT) >= 3 "
+        "AND (certificates.registry_address = '0x5FbDB2315678afecb367f032d93F642f64180aa3' "
+        "OR certificates.registry_address IS NULL) AND CAST(certificates.blockchain_id AS BIGINT) <= 9 "
+        "ORDER BY CAST(certificates.blockchain_id AS BIGINT)"
+    )
+
+
+async def test_an_open_blockchain_id_range_has_no_upper_bound(repository, database_session):
+    beyond = [certificate()]
+    returns_rows(database_session, beyond)
+
+    found = await repository.find_by_blockchain_id_range(10, None, "0x5FbDB2315678afecb367f032d93F642f64180aa3")
+
+    assert [item.id for item in found] == [beyond[0].id]
+    assert "<=" not in filtered_by(database_session)
+
+
+async def test_a_failed_blockchain_id_range_rolls_the_session_back(repository, database_session):
+    database_session.scalars.side_effect = ConnectionError("server closed the connection")
+
+    with pytest.raises(ConnectionError):
+        await repository.find_by_blockchain_id_range(1, 5, "0x5FbDB2315678afecb367f032d93F642f64180aa3")
+
+    database_session.rollback.assert_awaited_once()
+
+
+async def test_signed_certificates_are_paged_by_id(repository, database_session):
+    signed = [certificate(), certificate()]
+    returns_rows(database_session, signed)
+
+    found = await repository.list_signed(UUID(int=3), 1000)
+
+    assert [item.id for item in found] == [item.id for item in signed]
+    assert filtered_by(database_session) == (
+        "WHERE certificates.authenticity_certifier_signature IS NOT NULL "
+        f"AND certificates.id > '{UUID(int=3).hex}' ORDER BY certificates.id LIMIT 1000"
+    )
+
+
+async def test_the_first_page_of_signed_certificates_starts_at_the_lowest_id(repository, database_session):
+    returns_rows(database_session, [])
+
+    await repository.list_signed(None, 1000)
+
+    assert filtered_by(database_session) == (
+        "WHERE certificates.authenticity_certifier_signature IS NOT NULL ORDER BY certificates.id LIMIT 1000"
+    )
+
+
+async def test_a_failed_page_of_signed_certificates_rolls_the_session_back(repository, database_session):
+    database_session.scalars.side_effect = ConnectionError("server closed the connection")
+
+    with pytest.raises(ConnectionError):
+        await repository.list_signed(None, 1000)
+
+    database_session.rollback.assert_awaited_once()
+
+
+def streams_rows(database_session: MagicMock, chunks: List[List[Certificate]]) -> None:
+    async def partitions() -> AsyncIterator[List[MagicMock]]:
+        for chunk in chunks:
+            yield [entity(item) for item in chunk]
+
+    database_session.stream_scalars = AsyncMock(return_value=MagicMock(partitions=partitions))
+
+
+async def test_stream_yields_the_certificates_chunk_by_chunk_from_a_server_side_cursor(repository, database_session):
+    chunks = [[certificate(), certificate()], [certificate()]]
+    streams_rows(database_session, chunks)
+
+    streamed = [chunk async for chunk in repository.stream(2)]
+
+    assert [[item.id for item in chunk] for chunk in streamed] == [[item.id for item in chunk] for chunk in chunks]
+    statement = database_session.stream_scalars.await_args.args[0]
+    assert statement.get_execution_options()["yield_per"] == 2
+    assert "WHERE" not in str(statement)
+
+
+async def test_stream_applies_every_filter(repository, database_session):
+    streams_rows(database_session, [])
+
+    stream = repository.stream(
+        500,
+        status=CertificateStatus.ISSUED,
+        certifier_id=UUID(int=1),
+        norm=Norm.FSC,
+        issued_from=datetime(2026, 1, 1),
+        issued_until=datetime(2026, 2, 1, tzinfo=timezone.utc),
+    )
+    assert [chunk async for chunk in stream] == []
+
+    statement = database_session.stream_scalars.await_args.args[0]
+    sql = " ".join(str(statement.compile(dialect=postgresql.dialect())).split("FROM certificates", 1)[1].split())
+    assert sql == (
+        "WHERE certificates.status = %(status_1)s::VARCHAR AND certificates.certifier_id = %(certifier_id_1)s::UUID "
+        "AND certificates.norms_complied @> %(norms_complied_1)s::VARCHAR[] "
+        "AND certificates.issued_at >= %(issued_at_1)s::TIMESTAMP WITH TIME ZONE "
+        "AND certificates.issued_at < %(issued_at_2)s::TIMESTAMP WITH TIME ZONE ORDER BY certificates.id"
+    )
+    assert statement.compile().params["norms_complied_1"] == ["FSC"]
+    assert statement.compile().params["issued_at_1"] == datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+async def test_a_failed_stream_rolls_the_session_back(repository, database_session):
+    database_session.stream_scalars = AsyncMock(side_effect=ConnectionError("server closed the connection"))
+
+    with pytest.raises(ConnectionError):
+        [chunk async for chunk in repository.stream(2)]
+
+    database_session.rollback.assert_awaited_once()
+
+
+async def test_saved_certificates_are_upserted_on_commit(repository, unit_of_work, database_session):
+    saved = certificate()
+    database_session.execute = AsyncMock()
+    database_session.commit = AsyncMock()
+
+    await repository.save(saved)
+
+    assert unit_of_work.find(Certificate, saved.id) == saved
+    database_session.execute.assert_not_awaited()
+    await unit_of_work.commit()
+    upsert = str(database_session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+    assert upsert.startswith("INSERT INTO certificates")
+    assert "ON CONFLICT (id) DO UPDATE" in upsert
+    assert [row["id"] for row in database_session.execute.await_args.args[1]] == [str(saved.id)]
+
+
+async def test_certificates_saved_together_are_written_in_one_statement(repository, unit_of_work, database_session):
+    saved = [certificate(), certificate()]
+    database_session.execute = AsyncMock()
+    database_session.commit = AsyncMock()
+
+    await repository.save_all(saved)
+    await unit_of_work.commit()
+
+    database_session.execute.assert_awaited_once()
+    assert [row["id"] for row in database_session.execute.await_args.args[1]] == [str(item.id) for item in saved]
+
+
+async def test_a_conflicting_batch_of_certificates_is_reported_with_its_size(
+    repository, unit_of_work, database_session
+):
+    database_session.execute = AsyncMock(side_effect=IntegrityError("INSERT", {}, Exception("unique")))
+
+    await repository.save_all([certificate(), certificate(), certificate()])
+    with pytest.raises(DomainException) as error:
+        await unit_of_work.commit()
+
+    assert (error.value.message, error.value.code) == (
+        "Integrity error while saving 3 certificates: possible constraint violation.",
+        409,
+    )
+    database_session.rollback.assert_awaited_once()
@@ -0,0 +1,239 @@
+from typing import List, Tuple
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from certificado_verde_blockchain.certificates.domain import AnchoredRoot, ChainCursor, ChainEvent, ChainEventType
+from certificado_verde_blockchain.certificates.infrastructure.sql import SqlChainCertificateRepository
+from certificado_verde_blockchain.certificates.infrastructure.sql.chain_anchored_root_entity import (
+    ChainAnchoredRootEntity,
+)
+from certificado_verde_blockchain.certificates.infrastructure.sql.chain_block_entity import ChainBlockEntity
+from certificado_verde_blockchain.certificates.infrastructure.sql.chain_certificate_entity import (
+    ChainCertificateEntity,
+)
+from certificado_verde_blockchain.certificates.infrastructure.sql.chain_cursor_entity import ChainCursorEntity
+from certificado_verde_blockchain.configuration import IndexerConfig
+from certificado_verde_blockchain.shared.sql import SqlUnitOfWork
+
+CURSOR_NAME = "CertificateRegistry:0x5fbdb2315678afecb367f032d93f642f64180aa3"
+ISSUER = "0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266"
+
+
+def event(event_type: ChainEventType, blockchain_id: str, block_number: int = 7, **fields) -> ChainEvent:
+    return ChainEvent(
+        event_type=event_type,
+        blockchain_id=blockchain_id,
+        block_number=block_number,
+        block_hash="0x" + f"{block_number:064x}",
+        transaction_hash="0x" + "ab" * 32,
+        log_index=0,
+        timestamp=1_700_000_000,
+        **fields,
+    )
+
+
+def cursor(block_number: int) -> ChainCursor:
+    return ChainCursor(block_number=block_number, block_hash="0x" + f"{block_number:064x}")
+
+
+@pytest.fixture
+def connection() -> MagicMock:
+    connection = MagicMock()
+    connection.execute = AsyncMock()
+    return connection
+
+
+@pytest.fixture
+def database_session(connection) -> MagicMock:
+    database_session = MagicMock()
+    for method in ("get", "scalar", "scalars", "execute", "commit", "rollback"):
+        setattr(database_session, method, AsyncMock())
+    database_session.scalar.return_value = None
+    database_session.connection = AsyncMock(return_value=connection)
+    return database_session
+
+
+@pytest.fixture
+def unit_of_work(database_session) -> SqlUnitOfWork:
+    return SqlUnitOfWork(database_session)
+
+
+@pytest.fixture
+def repository(database_session, unit_of_work) -> SqlChainCertificateRepository:
+    return SqlChainCertificateRepository(database_session, IndexerConfig(reorg_lookback_blocks=8), unit_of_work)
+
+
+def statements(executor: MagicMock) -> List[Tuple[str, str]]:
+    """The kind of every statement executed and the table it writes, in order."""
+    executed = []
+    for call in executor.await_args_list:
+        statement = call.args[0]
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+        executed.append((sql.split()[0], statement.table.name))
+    return executed
+
+
+class TestSaveEvents:
+    async def test_projects_every_event_type_into_its_table_with_the_cursor(
+        self, repository, database_session, connection
+    ):
+        events = [
+            event(ChainEventType.CERTIFICATE_ISSUED, "1", data_hash="ab" * 32, issuer=ISSUER, owner=ISSUER),
+            event(ChainEventType.CERTIFICATE_REVOKED, "1", block_number=8),
+            event(ChainEventType.ROOT_ANCHORED, "4", data_hash="0x" + "ef" * 32, issuer=ISSUER),
+        ]
+
+        await repository.save_events(CURSOR_NAME, events, cursor(10))
+
+        assert statements(database_session.execute) == [
+            ("INSERT", "chain_cursors"),
+            ("INSERT", "chain_blocks"),
+            ("DELETE", "chain_blocks"),
+            ("INSERT", "chain_events"),
+            ("INSERT", "chain_certificates"),
+            ("INSERT", "chain_anchored_roots"),
+        ]
+        assert statements(connection.execute) == [("UPDATE", "chain_certificates")]
+        database_session.commit.assert_awaited_once()
+
+        issued_rows = database_session.execute.await_args_list[4].args[1]
+        assert issued_rows == [
+            {
+                "blockchain_id": "1",
+                "data_hash": "ab" * 32,
+                "issuer": ISSUER,
+                "owner": ISSUER,
+                "issued_at": 1_700_000_000,
+                "block_number": 7,
+                "transaction_hash": "0x" + "ab" * 32,
+                "revoked": False,
+            }
+        ]
+        (revoked_row,) = connection.execute.await_args.args[1]
+        assert revoked_row == {"target_id": "1", "target_revoked_at": 1_700_000_000, "target_block_number": 8}
+        (anchored_row,) = database_session.execute.await_args_list[5].args[1]
+        assert (anchored_row["epoch_id"], anchored_row["root"]) == ("4", "0x" + "ef" * 32)
+
+    async def test_only_moves_the_cursor_over_a_range_without_events(self, repository, database_session):
+        await repository.save_events(CURSOR_NAME, [], cursor(10))
+
+        assert statements(database_session.execute) == [
+            ("INSERT", "chain_cursors"),
+            ("INSERT", "chain_blocks"),
+            ("DELETE", "chain_blocks"),
+        ]
+        database_session.commit.assert_awaited_once()
+
+    async def test_rolls_back_a_failed_write(self, repository, database_session):
+        database_session.execute.side_effect = [None, ConnectionError("connection reset")]
+
+        with pytest.raises(ConnectionError):
+            await repository.save_events(CURSOR_NAME, [], cursor(10))
+
+        database_session.rollback.assert_awaited_once()
+        database_session.commit.assert_not_awaited()
+
+
+class TestRollback:
+    async def test_removes_what_was_indexed_from_the_fork_and_moves_the_cursor_back(self, repository, database_session):
+        database_session.scalar.return_value = ChainBlockEntity(
+            cursor_name=CURSOR_NAME, block_number=7, block_hash=cursor(7).block_hash
+        )
+
+        await repository.rollback(CURSOR_NAME, 8)
+
+        assert statements(database_session.execute) == [
+            ("DELETE", "chain_certificates"),
+            ("UPDATE", "chain_certificates"),
+            ("DELETE", "chain_anchored_roots"),
+            ("DELETE", "chain_events"),
+            ("DELETE", "chain_blocks"),
+            ("INSERT", "chain_cursors"),
+        ]
+        cursor_values = database_session.execute.await_args_list[-1].args[0].compile().params
+        assert (cursor_values["block_number"], cursor_values["block_hash"]) == (7, cursor(7).block_hash)
+        database_session.commit.assert_awaited_once()
+
+    async def test_removes_the_cursor_when_no_block_survived(self, repository, database_session):
+        await repository.rollback(CURSOR_NAME, 1)
+
+        assert statements(database_session.execute)[-1] == ("DELETE", "chain_cursors")
+
+    async def test_rolls_back_a_failed_write(self, repository, database_session):
+        database_session.execute.side_effect = ConnectionError("connection reset")
+
+        with pytest.raises(ConnectionError):
+            await repository.rollback(CURSOR_NAME, 1)
+
+        database_session.rollback.assert_awaited_once()
+
+
+class TestQueries:
+    async def test_finds_certificates_by_data_hash_and_blockchain_id(self, repository, database_session):
+        entity = ChainCertificateEntity(
+            blockchain_id="1",
+            data_hash="ab" * 32,
+            issuer=ISSUER,
+            owner=ISSUER,
+            issued_at=1_700_000_000,
+            block_number=7,
+            transaction_hash="0x" + "ab" * 32,
+            revoked=False,
+        )
+        database_session.scalar.return_value = entity
+        database_session.get.return_value = entity
+
+        by_hash = await repository.find_by_data_hash("ab" * 32)
+        by_id = await repository.find_by_blockchain_id("1")
+
+        assert by_hash == by_id and by_hash.blockchain_id == "1" and not by_hash.revoked
+        database_session.scalar.return_value = database_session.get.return_value = None
+        assert await repository.find_by_data_hash("cd" * 32) is None
+        assert await repository.find_by_blockchain_id("2") is None
+
+    async def test_gets_the_cursor_and_the_recent_blocks(self, repository, database_session):
+        database_session.get.return_value = ChainCursorEntity(
+            name=CURSOR_NAME, block_number=10, block_hash=cursor(10).block_hash
+        )
+        database_session.scalars.return_value = MagicMock()
+        database_session.scalars.return_value.all.return_value = [
+            ChainBlockEntity(cursor_name=CURSOR_NAME, block_number=number, block_hash=cursor(number).block_hash)
+            for number in (10, 9)
+        ]
+
+        assert await repository.get_cursor(CURSOR_NAME) == cursor(10)
+        assert await repository.list_recent_blocks(CURSOR_NAME, 2) == [cursor(10), cursor(9)]
+        database_session.get.return_value = None
+        assert await repository.get_cursor(CURSOR_NAME) is None
+
+    async def test_saves_and_finds_anchored_roots(self, repository, unit_of_work, database_session):
+        anchored_root = AnchoredRoot(
+            epoch_id="4", root="0x" + "ef" * 32, block_number=12, transaction_hash="0x" + "ab" * 32
+        )
+
+        await repository.save_anchored_roots([anchored_root])
+        await unit_of_work.commit()
+        database_session.get.return_value = ChainAnchoredRootEntity.from_domain(anchored_root)
+
+        assert statements(database_session.execute) == [("INSERT", "chain_anchored_roots")]
+        assert await repository.find_anchored_root("4") == anchored_root
+        database_session.get.return_value = None
+        assert await repository.find_anchored_root("5") is None
+
+    async def test_rolls_back_failed_reads(self, repository, database_session):
+        database_session.get.side_effect = database_session.scalar.side_effect = ConnectionError("connection reset")
+        database_session.scalars.side_effect = ConnectionError("connection reset")
+
+        for query in (
+            repository.find_by_data_hash("ab" * 32),
+            repository.find_by_blockchain_id("1"),
+            repository.find_anchored_root("4"),
+            repository.get_cursor(CURSOR_NAME),
+            repository.list_recent_blocks(CURSOR_NAME, 2),
+        ):
+            with pytest.raises(ConnectionError):
+                await query
+
+        assert database_session.rollback.await_count == 5
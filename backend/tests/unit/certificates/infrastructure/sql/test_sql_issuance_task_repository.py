@@ -0,0 +1,107 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from certificado_verde_blockchain.certificates.domain import (
+    Certificate,
+    CertificateStatus,
+    IssuanceTask,
+    IssuanceTaskStatus,
+)
+from certificado_verde_blockchain.certificates.infrastructure.sql import SqlIssuanceTaskRepository
+from certificado_verde_blockchain.certificates.infrastructure.sql.issuance_task_entity import IssuanceTaskEntity
+from certificado_verde_blockchain.shared.sql import SqlUnitOfWork
+
+
+def task() -> IssuanceTask:
+    return IssuanceTask(
+        certificate_id=uuid4(), canonical_hash="ab" * 32, certifier_address="0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266"
+    )
+
+
+@pytest.fixture
+def database_session() -> MagicMock:
+    database_session = MagicMock()
+    for method in ("scalar", "scalars", "execute", "commit", "rollback"):
+        setattr(database_session, method, AsyncMock())
+    return database_session
+
+
+@pytest.fixture
+def unit_of_work(database_session) -> SqlUnitOfWork:
+    return SqlUnitOfWork(database_session)
+
+
+@pytest.fixture
+def repository(database_session, unit_of_work) -> SqlIssuanceTaskRepository:
+    return SqlIssuanceTaskRepository(database_session, unit_of_work)
+
+
+async def test_claim_leases_the_rows_it_returns(repository, database_session):
+    tasks = [task(), task()]
+    entities = [IssuanceTaskEntity.from_domain(item, datetime.now(timezone.utc)) for item in tasks]
+    database_session.scalars.return_value = MagicMock()
+    database_session.scalars.return_value.all.return_value = entities
+
+    claimed = await repository.claim(IssuanceTaskStatus.PENDING, 25, lease_seconds=60)
+
+    assert [item.id for item in claimed] == [item.id for item in tasks]
+    assert all(entity.available_at > datetime.now(timezone.utc) + timedelta(seconds=55) for entity in entities)
+    database_session.commit.assert_awaited_once()
+    statement = str(database_session.scalars.await_args.args[0].compile(dialect=postgresql.dialect()))
+    assert statement.endswith("FOR UPDATE SKIP LOCKED")
+
+
+async def test_claim_rolls_back_a_failed_read(repository, database_session):
+    database_session.scalars.side_effect = ConnectionError("connection reset")
+
+    with pytest.raises(ConnectionError):
+        await repository.claim(IssuanceTaskStatus.PENDING, 25, lease_seconds=60)
+
+    database_session.rollback.assert_awaited_once()
+
+
+async def test_due_backlog_counts_the_due_tasks_and_finds_the_oldest(repository, database_session):
+    oldest = datetime.now(timezone.utc) - timedelta(minutes=5)
+    database_session.execute.return_value.one = MagicMock(return_value=(3, oldest))
+
+    assert await repository.due_backlog(IssuanceTaskStatus.PENDING, 1024) == (3, oldest)
+
+
+async def test_find_latest_by_certificate_id_returns_the_latest_task(repository, database_session):
+    latest = task()
+    database_session.scalar.return_value = IssuanceTaskEntity.from_domain(latest, datetime.now(timezone.utc))
+
+    found = await repository.find_latest_by_certificate_id(latest.certificate_id)
+
+    assert found is not None and found.id == latest.id
+    database_session.scalar.return_value = None
+    assert await repository.find_latest_by_certificate_id(uuid4()) is None
+
+
+async def test_save_writes_the_certificates_before_the_tasks_referencing_them(
+    repository, unit_of_work, database_session
+):
+    certificate = Certificate(
+        id=uuid4(),
+        version="1.0",
+        product_id=uuid4(),
+        producer_id=uuid4(),
+        certifier_id=uuid4(),
+        status=CertificateStatus.ISSUING,
+    )
+    saved = task()
+    saved.certificate_id = certificate.id
+
+    await repository.save([saved], [certificate], delay_seconds=30)
+    await unit_of_work.commit()
+
+    (certificates_table, certificate_rows), (tasks_table, task_rows) = [
+        (call.args[0].table.name, call.args[1]) for call in database_session.execute.await_args_list
+    ]
+    assert (certificates_table, tasks_table) == ("certificates", "certificate_issuance_tasks")
+    assert certificate_rows[0]["id"] == str(certificate.id)
+    assert task_rows[0]["available_at"] > datetime.now(timezone.utc) + timedelta(seconds=25)
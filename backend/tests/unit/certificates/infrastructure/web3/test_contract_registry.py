@@ -0,0 +1,179 @@
+import json
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+from unittest.mock import MagicMock
+
+import pytest
+from eth_abi import encode as abi_encode
+from eth_account import Account
+from web3 import AsyncWeb3
+
+from certificado_verde_blockchain.certificates.infrastructure.web3 import ContractRegistry, EventDecoder
+from certificado_verde_blockchain.configuration import BlockchainConfig
+from certificado_verde_blockchain.shared.errors import DomainException
+from tests.support.registry import REGISTRY_V1_ABI_PATH, REGISTRY_V2_ABI_PATH
+
+from ....conftest import ADMIN_ADDRESS, ADMIN_PRIVATE_KEY
+
+REGISTRY_ADDRESS = "0x5FbDB2315678afecb367f032d93F642f64180aa3"
+PREVIOUS_REGISTRY_ADDRESS = "0xe7f1725E7734CE288F8367e1Bb143E90bb3F0512"
+SIGNER_PRIVATE_KEY = "0x59c6995e998f97a5a0044966f0945389dc9e86dae88c7a8412f4603b6b78690d"
+DATA_HASH = bytes(range(32))
+
+
+@pytest.fixture
+def config(blockchain_config: Callable[..., BlockchainConfig]) -> BlockchainConfig:
+    return blockchain_config(
+        contract=REGISTRY_ADDRESS,
+        abi_path=REGISTRY_V2_ABI_PATH,
+        previous_contracts=[f"{PREVIOUS_REGISTRY_ADDRESS.lower()}={REGISTRY_V1_ABI_PATH}"],
+    )
+
+
+@pytest.fixture
+def contracts(config: BlockchainConfig) -> ContractRegistry:
+    return ContractRegistry(config, AsyncWeb3())
+
+
+def issued_log(address: str, certificate_id: int, owner: str = ADMIN_ADDRESS) -> Dict[str, Any]:
+    decoder = EventDecoder(
+        next(entry for entry in abi(REGISTRY_V2_ABI_PATH) if entry.get("name") == "CertificateIssued")
+    )
+    return {
+        "address": address,
+        "topics": [
+            decoder.topic,
+            certificate_id.to_bytes(32, "big"),
+            DATA_HASH,
+            bytes(12) + bytes.fromhex(owner[2:]),
+        ],
+        "data": abi_encode(["address", "uint256"], [ADMIN_ADDRESS, 1700000000]),
+    }
+
+
+def abi(path: str) -> List[Dict[str, Any]]:
+    with open(path, "r", encoding="utf-8") as abi_file:
+        return json.load(abi_file)["abi"]
+
+
+def write_abi(tmp_path: Path, content: Dict[str, Any]) -> str:
+    path = tmp_path / "Registry.json"
+    path.write_text(json.dumps(content))
+    return str(path)
+
+
+class TestContractRegistry:
+    def test_the_configured_and_previous_deployments_are_bound_at_creation(self, contracts: ContractRegistry):
+        assert [(binding.address, binding.registry.version) for binding in contracts.bindings] == [
+            (PREVIOUS_REGISTRY_ADDRESS, 1),
+            (REGISTRY_ADDRESS, 2),
+        ]
+        assert contracts.default.address == REGISTRY_ADDRESS
+
+    def test_bindings_are_cached_per_address_and_version(self, contracts: ContractRegistry):
+        assert contracts.bind(REGISTRY_ADDRESS.lower()) is contracts.default
+        assert contracts.bind(PREVIOUS_REGISTRY_ADDRESS).abi_path == REGISTRY_V1_ABI_PATH
+
+        v1_binding = contracts.bind(REGISTRY_ADDRESS, REGISTRY_V1_ABI_PATH)
+        assert v1_binding is not contracts.default
+        assert v1_binding.registry.version == 1
+        assert len(contracts.bindings) == 3
+
+    def test_unknown_addresses_are_bound_with_the_configured_abi(self, contracts: ContractRegistry):
+        binding = contracts.bind("0x9fE46736679d2D9a65F0992F2272dE9f3c7fa6e0")
+
+        assert binding.abi_path == REGISTRY_V2_ABI_PATH
+
+    def test_abi_files_are_read_once(self, contracts: ContractRegistry, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr("builtins.open", MagicMock(side_effect=AssertionError("read again")))
+
+        assert contracts.abi(REGISTRY_V2_ABI_PATH) == contracts.default.abi
+
+    def test_selectors_are_computed_from_the_abi(self, contracts: ContractRegistry):
+        assert contracts.default.selectors["nextId"] == bytes.fromhex("61b8ce8c")
+
+    def test_files_without_an_abi_are_rejected(self, contracts: ContractRegistry, tmp_path: Path):
+        with pytest.raises(DomainException, match="'abi' key not found"):
+            contracts.abi(write_abi(tmp_path, {"bytecode": "0x"}))
+
+    def test_abis_that_are_not_a_registry_are_rejected(self, contracts: ContractRegistry, tmp_path: Path):
+        registry_abi = [
+            entry for entry in abi(REGISTRY_V2_ABI_PATH) if entry.get("name") not in ("nextId", "CertificateRevoked")
+        ]
+
+        with pytest.raises(DomainException, match="missing: nextId, CertificateRevoked"):
+            contracts.abi(write_abi(tmp_path, {"abi": registry_abi}))
+
+    def test_deploy_in_process_authorizes_the_extra_signers(self, config: BlockchainConfig):
+        chain = MagicMock()
+        chain.deploy.return_value = "0x9fE46736679d2D9a65F0992F2272dE9f3c7fa6e0"
+        config = config.model_copy(update={"signer_private_keys": [ADMIN_PRIVATE_KEY, SIGNER_PRIVATE_KEY]})
+
+        contracts = ContractRegistry.deploy_in_process(config, AsyncWeb3(), chain)
+
+        assert contracts.default.address == "0x9fE46736679d2D9a65F0992F2272dE9f3c7fa6e0"
+        chain.deploy.assert_called_once_with(REGISTRY_V2_ABI_PATH, ADMIN_PRIVATE_KEY)
+        signer = Account.from_key(SIGNER_PRIVATE_KEY).address
+        chain.transact.assert_called_once_with(
+            ADMIN_PRIVATE_KEY,
+            contracts.default.address,
+            contracts.default.contract.encode_abi("setIssuer", [signer, True]),
+        )
+
+
+class TestContractBinding:
+    def test_receipts_are_decoded_for_the_logs_of_the_deployment(self, contracts: ContractRegistry):
+        other = contracts.bind(PREVIOUS_REGISTRY_ADDRESS)
+        receipt = {
+            "logs": [
+                issued_log(REGISTRY_ADDRESS.lower(), 7),
+                issued_log(other.address, 8),
+                {"address": REGISTRY_ADDRESS, "topics": [], "data": b""},
+                issued_log(REGISTRY_ADDRESS, 9),
+            ]
+        }
+
+        events = contracts.default.decode_receipt(receipt, "CertificateIssued")
+
+        assert events == [
+            {"id": 7, "dataHash": DATA_HASH, "owner": ADMIN_ADDRESS, "issuer": ADMIN_ADDRESS, "timestamp": 1700000000},
+            {"id": 9, "dataHash": DATA_HASH, "owner": ADMIN_ADDRESS, "issuer": ADMIN_ADDRESS, "timestamp": 1700000000},
+        ]
+
+    def test_events_the_abi_does_not_declare_decode_to_nothing(self, contracts: ContractRegistry):
+        receipt = {"logs": [issued_log(REGISTRY_ADDRESS, 1)]}
+
+        assert contracts.default.decode_receipt(receipt, "Paused") == []
+
+
+class TestEventDecoder:
+    def test_indexed_values_are_decoded_by_type(self):
+        decoder = EventDecoder(
+            {
+                "name": "Labelled",
+                "type": "event",
+                "inputs": [
+                    {"name": "label", "type": "string", "indexed": True},
+                    {"name": "flag", "type": "bool", "indexed": True},
+                    {"name": "amount", "type": "int128", "indexed": False},
+                ],
+            }
+        )
+        label_hash = bytes(31) + b"\x01"
+
+        args = decoder.decode(
+            {
+                "topics": [decoder.topic, label_hash, abi_encode(["bool"], [True])],
+                "data": abi_encode(["int128"], [-5]),
+            }
+        )
+
+        # Indexed strings are only available as their hash
+        assert args == {"label": label_hash, "flag": True, "amount": -5}
+
+    def test_events_without_data_only_decode_their_topics(self):
+        decoder = EventDecoder(
+            {"name": "Pinged", "type": "event", "inputs": [{"name": "id", "type": "uint64", "indexed": True}]}
+        )
+
+        assert decoder.decode({"topics": [decoder.topic, (3).to_bytes(32, "big")], "data": b"\x00"}) == {"id": 3}
@@ -0,0 +1,146 @@
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, PropertyMock
+
+import pytest
+from web3.exceptions import Web3RPCError
+
+from certificado_verde_blockchain.certificates.infrastructure.web3 import Eip1559FeeStrategy
+
+SENDER = "0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266"
+GWEI = 10**9
+FEE_HISTORY = {
+    # One more base fee than blocks: the last one is the base fee of the next block
+    "baseFeePerGas": [10 * GWEI, 11 * GWEI, 12 * GWEI, 12 * GWEI],
+    "reward": [[1 * GWEI], [0], [3 * GWEI]],
+    "gasUsedRatio": [0.5, 0.0, 0.9],
+}
+
+
+def contract_call(fn_name: str, *args, estimate: int = 100_000) -> MagicMock:
+    contract_function = MagicMock(address="0x5FbDB2315678afecb367f032d93F642f64180aa3", fn_name=fn_name, args=args)
+    contract_function.estimate_gas = AsyncMock(return_value=estimate)
+    return contract_function
+
+
+def legacy_transaction(gas_price: int) -> Any:
+    return {"gasPrice": gas_price, "maxFeePerGas": None}
+
+
+@pytest.fixture
+def web3_client() -> MagicMock:
+    async def gas_price() -> int:
+        return 8 * GWEI
+
+    web3_client = MagicMock()
+    web3_client.eth.fee_history = AsyncMock(return_value=FEE_HISTORY)
+    type(web3_client.eth).gas_price = PropertyMock(side_effect=gas_price)
+    return web3_client
+
+
+@pytest.fixture
+def fee_strategy(blockchain_config, web3_client) -> Eip1559FeeStrategy:
+    return Eip1559FeeStrategy(blockchain_config(gas_limit_margin=1.5), web3_client)
+
+
+class TestGasLimit:
+    async def test_reuses_the_estimate_of_a_call_of_the_same_shape(self, fee_strategy):
+        first = contract_call("issueCertificate", "0x1", "a")
+        second = contract_call("issueCertificate", "0x2", "b", estimate=1)
+
+        assert await fee_strategy.gas_limit(first, SENDER) == 150_000
+        assert await fee_strategy.gas_limit(second, SENDER) == 150_000
+        second.estimate_gas.assert_not_awaited()
+
+    async def test_estimates_every_issuance_batch(self, fee_strategy):
+        # Hashes issued before are skipped: a batch of new ones of the same size needs its own estimate
+        skipped = contract_call("issueCertificates", ["0x1", "0x2"], ["a", "b"], estimate=50_000)
+        fresh = contract_call("issueCertificates", ["0x3", "0x4"], ["c", "d"], estimate=180_000)
+
+        assert await fee_strategy.gas_limit(skipped, SENDER) == 75_000
+        assert await fee_strategy.gas_limit(fresh, SENDER) == 270_000
+
+    async def test_estimates_every_revocation_chunk(self, fee_strategy):
+        # Skipped certificates cost a fraction of a revocation: a chunk of fresh ones needs its own estimate
+        skipped = contract_call("revokeCertificates", [1, 2, 3], estimate=40_000)
+        fresh = contract_call("revokeCertificates", [4, 5, 6], estimate=200_000)
+
+        assert await fee_strategy.gas_limit(skipped, SENDER) == 60_000
+        assert await fee_strategy.gas_limit(fresh, SENDER) == 300_000
+
+
+class TestFees:
+    async def test_the_tip_is_the_median_paid_by_non_empty_blocks(self, fee_strategy, web3_client):
+        fees = await fee_strategy.fees()
+
+        # Tip of 3 gwei (median of 1 and 3, the empty block left out) over twice the next base fee
+        assert fees == {"maxFeePerGas": 27 * GWEI, "maxPriorityFeePerGas": 3 * GWEI, "type": 2}
+        web3_client.eth.fee_history.assert_awaited_once_with(20, "latest", [50])
+
+    async def test_the_minimum_tip_is_offered_when_recent_blocks_were_empty(self, fee_strategy, web3_client):
+        web3_client.eth.fee_history.return_value = {**FEE_HISTORY, "gasUsedRatio": [0.0, 0.0, 0.0]}
+
+        fees = await fee_strategy.fees()
+
+        assert fees["maxPriorityFeePerGas"] == GWEI // 100
+        assert fees["maxFeePerGas"] == 24 * GWEI + GWEI // 100
+
+    async def test_fees_are_capped(self, blockchain_config, web3_client):
+        fee_strategy = Eip1559FeeStrategy(blockchain_config(max_fee_per_gas_gwei=2), web3_client)
+
+        assert await fee_strategy.fees() == {"maxFeePerGas": 2 * GWEI, "maxPriorityFeePerGas": 2 * GWEI, "type": 2}
+
+    async def test_the_fee_history_is_reused_for_the_cache_period(self, fee_strategy, web3_client):
+        fees = await fee_strategy.fees()
+        fees["maxFeePerGas"] = 0
+
+        assert (await fee_strategy.fees())["maxFeePerGas"] == 27 * GWEI
+        web3_client.eth.fee_history.assert_awaited_once()
+
+    async def test_the_fee_history_is_fetched_again_without_a_cache_period(self, blockchain_config, web3_client):
+        fee_strategy = Eip1559FeeStrategy(blockchain_config(fee_cache_ms=0), web3_client)
+
+        await fee_strategy.fees()
+        await fee_strategy.fees()
+
+        assert web3_client.eth.fee_history.await_count == 2
+
+    async def test_chains_without_fee_history_are_priced_with_the_gas_price(self, fee_strategy, web3_client):
+        web3_client.eth.fee_history.side_effect = Web3RPCError("the method eth_feeHistory does not exist")
+
+        assert await fee_strategy.fees() == {"gasPrice": 8 * GWEI}
+
+    async def test_chains_without_base_fee_are_priced_with_the_gas_price(self, blockchain_config, web3_client):
+        web3_client.eth.fee_history.return_value = {**FEE_HISTORY, "baseFeePerGas": [None]}
+        fee_strategy = Eip1559FeeStrategy(blockchain_config(max_fee_per_gas_gwei=5), web3_client)
+
+        assert await fee_strategy.fees() == {"gasPrice": 5 * GWEI}
+
+    async def test_transaction_fields_combine_the_gas_limit_and_the_fees(self, fee_strategy):
+        fields = await fee_strategy.transaction_fields(contract_call("issueCertificate", "0x1", "a"), SENDER)
+
+        assert fields == {"gas": 150_000, "maxFeePerGas": 27 * GWEI, "maxPriorityFeePerGas": 3 * GWEI, "type": 2}
+
+
+class TestReplacementFields:
+    async def test_both_fees_are_bumped_at_least_to_the_current_ones(self, fee_strategy):
+        transaction = {"maxFeePerGas": 40 * GWEI, "maxPriorityFeePerGas": 2 * GWEI}
+
+        fields = await fee_strategy.replacement_fields(transaction)
+
+        # A 15% bump of the fee cap, and the current tip, above a 15% bump of the old one
+        assert fields == {"maxFeePerGas": 46 * GWEI, "maxPriorityFeePerGas": 3 * GWEI, "type": 2}
+
+    async def test_a_bump_beyond_the_fee_cap_gives_up(self, fee_strategy):
+        transaction = {"maxFeePerGas": 450 * GWEI, "maxPriorityFeePerGas": 2 * GWEI}
+
+        assert await fee_strategy.replacement_fields(transaction) is None
+
+    async def test_legacy_transactions_are_bumped_to_the_market_price(self, fee_strategy, web3_client):
+        web3_client.eth.fee_history.side_effect = Web3RPCError("the method eth_feeHistory does not exist")
+
+        assert await fee_strategy.replacement_fields(legacy_transaction(4 * GWEI)) == {"gasPrice": 8 * GWEI}
+        assert await fee_strategy.replacement_fields(legacy_transaction(10 * GWEI)) == {"gasPrice": 11_500_000_000}
+
+    async def test_legacy_transactions_are_compared_with_the_current_fee_cap(self, fee_strategy):
+        assert await fee_strategy.replacement_fields(legacy_transaction(10 * GWEI)) == {"gasPrice": 27 * GWEI}
+        assert await fee_strategy.replacement_fields(legacy_transaction(450 * GWEI)) is None
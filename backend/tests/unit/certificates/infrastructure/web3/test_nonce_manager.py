@@ -0,0 +1,61 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from certificado_verde_blockchain.certificates.infrastructure.web3 import NonceManager
+
+ADDRESS = "0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266"
+
+
+@pytest.fixture
+def web3_client() -> MagicMock:
+    client = MagicMock()
+    client.eth.get_transaction_count = AsyncMock(side_effect=[7, 12])
+    return client
+
+
+class TestNonceManager:
+    async def test_allocates_sequential_nonces_from_the_pending_count(self, web3_client):
+        nonce_manager = NonceManager(web3_client)
+
+        nonces = [await nonce_manager.allocate(ADDRESS) for _ in range(3)]
+
+        assert nonces == [7, 8, 9]
+        web3_client.eth.get_transaction_count.assert_awaited_once_with(ADDRESS, "pending")
+
+    async def test_tracks_accounts_separately(self, web3_client):
+        nonce_manager = NonceManager(web3_client)
+
+        assert await nonce_manager.allocate(ADDRESS) == 7
+        assert await nonce_manager.allocate("0x70997970C51812dc3A010C7d01b50e0d17dc79C8") == 12
+        assert await nonce_manager.allocate(ADDRESS) == 8
+
+    async def test_reuses_the_lowest_released_nonce_first(self, web3_client):
+        nonce_manager = NonceManager(web3_client)
+        for _ in range(4):
+            await nonce_manager.allocate(ADDRESS)
+
+        nonce_manager.release(ADDRESS, 9)
+        nonce_manager.release(ADDRESS, 8)
+
+        assert [await nonce_manager.allocate(ADDRESS) for _ in range(3)] == [8, 9, 11]
+
+    async def test_ignores_nonces_it_did_not_hand_out(self, web3_client):
+        nonce_manager = NonceManager(web3_client)
+        await nonce_manager.allocate(ADDRESS)
+
+        nonce_manager.release(ADDRESS, 8)
+        nonce_manager.release(ADDRESS, -1)
+
+        assert await nonce_manager.allocate(ADDRESS) == 8
+
+    async def test_resync_reads_the_nonce_from_the_node_again(self, web3_client):
+        nonce_manager = NonceManager(web3_client)
+        await nonce_manager.allocate(ADDRESS)
+        await nonce_manager.allocate(ADDRESS)
+        nonce_manager.release(ADDRESS, 8)
+
+        nonce_manager.resync(ADDRESS)
+
+        assert await nonce_manager.allocate(ADDRESS) == 12
+        assert web3_client.eth.get_transaction_count.await_count == 2
@@ -0,0 +1,154 @@
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Iterator, List, Tuple
+from unittest.mock import MagicMock
+
+import pytest
+from eth_account import Account
+from eth_account.messages import encode_defunct
+
+from certificado_verde_blockchain.certificates.infrastructure.web3 import SignatureVerifier, signature_verifier
+
+from ....conftest import ADMIN_ADDRESS, ADMIN_PRIVATE_KEY
+
+
+def signed(number: int) -> Tuple[str, str]:
+    message_hash = "0x" + f"{number:064x}"
+    signature = Account.sign_message(encode_defunct(hexstr=message_hash), ADMIN_PRIVATE_KEY).signature
+    return message_hash, signature.to_0x_hex()
+
+
+@pytest.fixture
+def executors(monkeypatch: pytest.MonkeyPatch) -> List[ThreadPoolExecutor]:
+    """The worker pools started by the verifier, threads instead of spawned processes."""
+    executors: List[ThreadPoolExecutor] = []
+
+    def executor(max_workers: int, mp_context: Any) -> ThreadPoolExecutor:
+        executors.append(ThreadPoolExecutor(max_workers))
+        return executors[-1]
+
+    monkeypatch.setattr(signature_verifier, "ProcessPoolExecutor", executor)
+    return executors
+
+
+@pytest.fixture
+def recoveries(monkeypatch: pytest.MonkeyPatch) -> List[int]:
+    """Size of each chunk sent to the workers."""
+    recoveries: List[int] = []
+    recover_signers = signature_verifier.recover_signers
+
+    def counted(pairs: List[Tuple[str, str]]) -> Any:
+        recoveries.append(len(pairs))
+        return recover_signers(pairs)
+
+    monkeypatch.setattr(signature_verifier, "recover_signers", counted)
+    return recoveries
+
+
+@pytest.fixture
+def verifier(executors: List[ThreadPoolExecutor]) -> Iterator[SignatureVerifier]:
+    verifier = SignatureVerifier(workers=2, cache_size=10, chunk_size=2)
+    yield verifier
+    verifier.shutdown()
+
+
+async def recover_all(verifier: SignatureVerifier, messages: List[Tuple[str, str]]) -> List[Any]:
+    results = [result async for result in verifier.recover_many(messages)]
+    return [result for _, result in sorted(results)]
+
+
+class TestSignatureVerifier:
+    async def test_recover_returns_the_signer(self, verifier: SignatureVerifier):
+        assert await verifier.recover(*signed(1)) == (ADMIN_ADDRESS, None)
+
+    async def test_invalid_signatures_are_reported_with_their_error(self, verifier: SignatureVerifier):
+        address, error = await verifier.recover(signed(1)[0], "0x1234")
+
+        assert address is None
+        assert error
+
+    async def test_messages_are_recovered_in_chunks_and_yielded_with_their_position(
+        self, verifier: SignatureVerifier, recoveries: List[int]
+    ):
+        messages = [signed(number) for number in range(5)]
+
+        results = [result async for result in verifier.recover_many(messages)]
+
+        assert sorted(index for index, _ in results) == [0, 1, 2, 3, 4]
+        assert {result for _, result in results} == {(ADMIN_ADDRESS, None)}
+        assert sorted(recoveries) == [1, 2, 2]
+
+    async def test_duplicates_are_recovered_once(self, verifier: SignatureVerifier, recoveries: List[int]):
+        message = signed(1)
+
+        assert await recover_all(verifier, [message, signed(2), message]) == [(ADMIN_ADDRESS, None)] * 3
+        assert recoveries == [2]
+
+    async def test_recent_results_are_served_from_the_cache(
+        self, verifier: SignatureVerifier, recoveries: List[int], executors: List[ThreadPoolExecutor]
+    ):
+        messages = [signed(1), signed(2)]
+        await recover_all(verifier, messages)
+
+        assert await recover_all(verifier, messages) == [(ADMIN_ADDRESS, None)] * 2
+        assert recoveries == [2]
+        assert len(executors) == 1
+
+    async def test_the_least_recently_used_result_is_evicted(
+        self, executors: List[ThreadPoolExecutor], recoveries: List[int]
+    ):
+        verifier = SignatureVerifier(workers=1, cache_size=2, chunk_size=10)
+
+        for numbers in [[1, 2], [1], [3], [1, 2]]:
+            await recover_all(verifier, [signed(number) for number in numbers])
+
+        # 2 was evicted by 3, 1 was used since
+        assert recoveries == [2, 1, 1]
+        verifier.shutdown()
+
+    async def test_a_cache_size_of_zero_disables_the_cache(
+        self, executors: List[ThreadPoolExecutor], recoveries: List[int]
+    ):
+        verifier = SignatureVerifier(workers=1, cache_size=0, chunk_size=10)
+
+        await verifier.recover(*signed(1))
+        await verifier.recover(*signed(1))
+
+        assert recoveries == [1, 1]
+        verifier.shutdown()
+
+    def test_workers_default_to_the_cpu_count(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(signature_verifier.os, "cpu_count", lambda: 6)
+
+        assert SignatureVerifier(workers=0, cache_size=0, chunk_size=1).workers == 6
+
+    async def test_a_broken_pool_is_replaced_on_the_next_call(
+        self, verifier: SignatureVerifier, executors: List[ThreadPoolExecutor], monkeypatch: pytest.MonkeyPatch
+    ):
+        broken = MagicMock()
+
+        def submit(*args: Any) -> Future:
+            future: Future = Future()
+            future.set_exception(BrokenProcessPool("A child process terminated abruptly"))
+            return future
+
+        broken.submit.side_effect = submit
+        thread_pool = signature_verifier.ProcessPoolExecutor
+        monkeypatch.setattr(signature_verifier, "ProcessPoolExecutor", lambda max_workers, mp_context: broken)
+
+        with pytest.raises(BrokenProcessPool):
+            await verifier.recover(*signed(1))
+        broken.shutdown.assert_called_once_with(wait=False, cancel_futures=True)
+
+        monkeypatch.setattr(signature_verifier, "ProcessPoolExecutor", thread_pool)
+        assert await verifier.recover(*signed(1)) == (ADMIN_ADDRESS, None)
+        assert len(executors) == 1
+
+    async def test_closing_the_stream_early_leaves_the_verifier_usable(self, verifier: SignatureVerifier):
+        stream = verifier.recover_many([signed(number) for number in range(8)])
+
+        await stream.__anext__()
+        await stream.aclose()
+
+        assert await asyncio.wait_for(verifier.recover(*signed(7)), 5) == (ADMIN_ADDRESS, None)
@@ -0,0 +1,49 @@
+import pytest
+
+from certificado_verde_blockchain.certificates.infrastructure.web3 import SignerPool
+
+from ....conftest import ADMIN_ADDRESS, ADMIN_PRIVATE_KEY
+
+# Second and third accounts of the Hardhat and eth-tester development chains
+SIGNER_PRIVATE_KEYS = [
+    "0x59c6995e998f97a5a0044966f0945389dc9e86dae88c7a8412f4603b6b78690d",
+    "0x5de4111afa1a4b94908f83103eb1f1706367c2e68ca870fc3fb9a804cdab365a",
+]
+SIGNER_ADDRESSES = ["0x70997970C51812dc3A010C7d01b50e0d17dc79C8", "0x3C44CdDdB6a900fa2b585dd299e03d12FA4293BC"]
+
+
+@pytest.fixture
+def signer_pool(blockchain_config) -> SignerPool:
+    return SignerPool(blockchain_config(signer_private_keys=[ADMIN_PRIVATE_KEY, *SIGNER_PRIVATE_KEYS]))
+
+
+class TestSignerPool:
+    def test_the_admin_comes_first_and_keys_are_not_repeated(self, signer_pool):
+        assert [signer.address for signer in signer_pool.signers] == [ADMIN_ADDRESS, *SIGNER_ADDRESSES]
+        assert signer_pool.admin.address == ADMIN_ADDRESS
+
+    def test_signers_are_found_by_address_in_any_case(self, signer_pool):
+        assert signer_pool.find(SIGNER_ADDRESSES[1].lower()).address == SIGNER_ADDRESSES[1]
+        assert signer_pool.find("0x90F79bf6EB2c4f870365E785982E1f101E93b906") is None
+
+    def test_sequential_transactions_rotate_between_the_signers(self, signer_pool):
+        addresses = []
+        for _ in range(4):
+            with signer_pool.acquire() as signer:
+                addresses.append(signer.address)
+
+        assert addresses == [ADMIN_ADDRESS, *SIGNER_ADDRESSES, ADMIN_ADDRESS]
+
+    def test_the_signer_with_the_fewest_transactions_in_flight_is_picked(self, signer_pool):
+        with signer_pool.acquire() as first, signer_pool.acquire() as second:
+            with signer_pool.acquire() as third:
+                assert {first.address, second.address, third.address} == {ADMIN_ADDRESS, *SIGNER_ADDRESSES}
+            # Only the third signer is free again
+            with signer_pool.acquire() as fourth:
+                assert fourth.address == third.address
+
+    def test_a_single_key_signs_everything(self, blockchain_config):
+        signer_pool = SignerPool(blockchain_config())
+
+        with signer_pool.acquire() as first, signer_pool.acquire() as second:
+            assert first.address == second.address == ADMIN_ADDRESS
@@ -0,0 +1,683 @@
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from eth_abi import encode
+from eth_account import Account
+from hexbytes import HexBytes
+from web3 import AsyncWeb3, Web3
+from web3.exceptions import ContractLogicError, TransactionNotFound
+
+from certificado_verde_blockchain.certificates.domain import (
+    PreparedTransaction,
+    RegistryCertificate,
+    RevocationReceipt,
+    SignatureCheck,
+)
+from certificado_verde_blockchain.certificates.infrastructure.web3 import (
+    ContractRegistry,
+    NonceManager,
+    SignerPool,
+    Web3BlockchainService,
+    web3_blockchain_service,
+)
+from certificado_verde_blockchain.shared.errors import DomainException
+from tests.support.registry import REGISTRY_V1_ABI_PATH, REGISTRY_V2_ABI_PATH
+
+from ....conftest import ADMIN_ADDRESS, ADMIN_PRIVATE_KEY
+
+TX_HASH = HexBytes("0x" + "ab" * 32)
+REGISTRY_ADDRESS = "0x5FbDB2315678afecb367f032d93F642f64180aa3"
+PREVIOUS_REGISTRY_ADDRESS = "0xe7f1725E7734CE288F8367e1Bb143E90bb3F0512"
+OWNER = Web3.to_checksum_address("0x70997970c51812dc3a731c8b2f3f5d8bbe7e8bf4")
+HASHES = ["ab" * 32, "cd" * 32, "ef" * 32]
+
+
+def topic(signature: str) -> str:
+    return Web3.keccak(text=signature).to_0x_hex()
+
+
+def uint(value: int) -> str:
+    return "0x" + value.to_bytes(32, "big").hex()
+
+
+def raw_log(topics: List[str], data: bytes = b"", address: str = REGISTRY_ADDRESS) -> Dict[str, Any]:
+    """A log as the node returns it, before web3 formats it."""
+    return {"address": address.lower(), "topics": topics, "data": "0x" + data.hex(), "logIndex": "0x0"}
+
+
+def issued_log(certificate_id: int, certificate_hash: str, address: str = REGISTRY_ADDRESS) -> Dict[str, Any]:
+    return raw_log(
+        [
+            topic("CertificateIssued(uint256,bytes32,address,address,uint256)"),
+            uint(certificate_id),
+            "0x" + certificate_hash,
+            "0x" + OWNER[2:].lower().rjust(64, "0"),
+        ],
+        encode(["address", "uint256"], [ADMIN_ADDRESS, 1_700_000_000]),
+        address,
+    )
+
+
+def already_issued_log(certificate_id: int, certificate_hash: str) -> Dict[str, Any]:
+    return raw_log([topic("CertificateAlreadyIssued(uint256,bytes32)"), uint(certificate_id), "0x" + certificate_hash])
+
+
+def anchored_log(epoch_id: int, root: str) -> Dict[str, Any]:
+    return raw_log(
+        [
+            topic("RootAnchored(uint256,bytes32,address,uint256,uint256)"),
+            uint(epoch_id),
+            root,
+            "0x" + ADMIN_ADDRESS[2:].lower().rjust(64, "0"),
+        ],
+        encode(["uint256", "uint256"], [3, 1_700_000_000]),
+    )
+
+
+def revoked_log(certificate_id: int, address: str = REGISTRY_ADDRESS) -> Dict[str, Any]:
+    return raw_log(
+        [topic("CertificateRevoked(uint256,uint256)"), uint(certificate_id)], encode(["uint256"], [1]), address
+    )
+
+
+def raw_receipt(transaction_hash: str, logs: Sequence[Dict[str, Any]] = (), status: int = 1) -> Dict[str, Any]:
+    return {"transactionHash": transaction_hash, "blockNumber": "0x7", "status": hex(status), "logs": list(logs)}
+
+
+def formatted_receipt(logs: Sequence[Dict[str, Any]] = (), status: int = 1) -> Dict[str, Any]:
+    """A receipt as `get_transaction_receipt` returns it."""
+    return {
+        "transactionHash": TX_HASH,
+        "status": status,
+        "logs": [
+            {**log, "topics": [HexBytes(item) for item in log["topics"]], "data": HexBytes(log["data"])} for log in logs
+        ],
+    }
+
+
+def contract_function() -> MagicMock:
+    function = MagicMock()
+    function.build_transaction = AsyncMock(
+        side_effect=lambda params: {**params, "to": REGISTRY_ADDRESS, "data": "0x", "value": 0, "chainId": 31337}
+    )
+    return function
+
+
+def call(result: Any = None, error: Optional[Exception] = None) -> MagicMock:
+    """A contract function whose `call` returns the result or raises the error."""
+    function = MagicMock()
+    function.call = AsyncMock(return_value=result, side_effect=error)
+    return function
+
+
+@pytest.fixture
+def signer():
+    return Account.from_key(ADMIN_PRIVATE_KEY)
+
+
+@pytest.fixture
+def web3_client() -> MagicMock:
+    client = MagicMock()
+    client.eth.get_transaction_count = AsyncMock(return_value=3)
+    client.eth.send_raw_transaction = AsyncMock(return_value=TX_HASH)
+    client.eth.get_transaction_receipt = AsyncMock(return_value=formatted_receipt())
+    client.eth.get_transaction = AsyncMock(return_value={"blockNumber": None})
+    client.provider.make_batch_request = AsyncMock(return_value=[])
+    return client
+
+
+@pytest.fixture
+def abi_path() -> str:
+    return REGISTRY_V2_ABI_PATH
+
+
+@pytest.fixture
+def config(blockchain_config, abi_path):
+    return blockchain_config(
+        contract=REGISTRY_ADDRESS,
+        abi_path=abi_path,
+        previous_contracts=[f"{PREVIOUS_REGISTRY_ADDRESS}={REGISTRY_V1_ABI_PATH}"],
+        revocation_batch_max_size=2,
+    )
+
+
+@pytest.fixture
+def contracts(config) -> ContractRegistry:
+    return ContractRegistry(config, AsyncWeb3())
+
+
+@pytest.fixture
+def contract(contracts: ContractRegistry) -> MagicMock:
+    """The calls of the configured deployment, answered by the tests; its events are decoded from its ABI."""
+    contract = MagicMock()
+    contracts.default.contract = contract
+    return contract
+
+
+@pytest.fixture
+def fee_strategy() -> MagicMock:
+    fee_strategy = MagicMock()
+    fee_strategy.transaction_fields = AsyncMock(return_value={"gas": 100_000, "gasPrice": 1})
+    fee_strategy.replacement_fields = AsyncMock(return_value={"gasPrice": 2})
+    return fee_strategy
+
+
+@pytest.fixture
+def signature_verifier() -> MagicMock:
+    return MagicMock()
+
+
+@pytest.fixture
+def service(config, web3_client, contracts, contract, fee_strategy, signature_verifier) -> Web3BlockchainService:
+    return Web3BlockchainService(
+        config,
+        web3_client,
+        contracts,
+        SignerPool(config),
+        NonceManager(web3_client),
+        signature_verifier,
+        fee_strategy,
+    )
+
+
+@pytest.fixture(autouse=True)
+def fast_polling(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(web3_blockchain_service, "RECEIPT_POLL_SECONDS", 0)
+
+
+class TestSend:
+    async def test_releases_the_nonce_when_signing_fails(self, service, signer):
+        function = contract_function()
+        function.build_transaction.side_effect = ValueError("execution reverted")
+
+        with pytest.raises(ValueError):
+            await service._send(function, signer)
+
+        assert await service.nonce_manager.allocate(signer.address) == 3
+
+    async def test_resyncs_the_nonce_when_the_send_fails_ambiguously(self, service, web3_client, signer):
+        web3_client.eth.get_transaction_count.side_effect = [3, 5]
+        web3_client.eth.send_raw_transaction.side_effect = TimeoutError("read timed out")
+
+        with pytest.raises(TimeoutError):
+            await service._send(contract_function(), signer)
+
+        # The node may have taken nonce 3: the next one comes from its pending count, not from the pool
+        assert await service.nonce_manager.allocate(signer.address) == 5
+        web3_client.eth.send_raw_transaction.assert_awaited_once()
+
+    async def test_resends_with_a_fresh_nonce_after_a_nonce_error(self, service, web3_client, signer):
+        web3_client.eth.get_transaction_count.side_effect = [3, 5]
+        web3_client.eth.send_raw_transaction.side_effect = [ValueError("nonce too low"), TX_HASH]
+        function = contract_function()
+
+        assert await service._send(function, signer) == TX_HASH
+
+        nonces = [call.args[0]["nonce"] for call in function.build_transaction.await_args_list]
+        assert nonces == [3, 5]
+
+    async def test_gives_up_after_repeated_nonce_errors(self, service, web3_client, signer):
+        web3_client.eth.send_raw_transaction.side_effect = ValueError("nonce too low")
+
+        with pytest.raises(ValueError):
+            await service._send(contract_function(), signer)
+
+        assert web3_client.eth.send_raw_transaction.await_count == web3_blockchain_service.MAX_SEND_ATTEMPTS
+
+
+class TestPrepare:
+    async def test_a_single_certificate_is_issued_with_issue_certificate(self, service, contract):
+        contract.functions.issueCertificate.return_value = contract_function()
+
+        transaction = await service.prepare_certificates([(HASHES[0], OWNER.lower())])
+
+        contract.functions.issueCertificate.assert_called_once_with(OWNER, HexBytes(HASHES[0]))
+        assert transaction.sender == ADMIN_ADDRESS
+        # The hash is known before the transaction is sent
+        assert transaction.transaction_hash == Web3.keccak(HexBytes(transaction.raw_transaction)).to_0x_hex()
+
+    async def test_several_certificates_are_issued_in_one_transaction(self, service, contract):
+        contract.functions.issueCertificates.return_value = contract_function()
+
+        await service.prepare_certificates([(HASHES[0], OWNER), (HASHES[1], OWNER)])
+
+        contract.functions.issueCertificates.assert_called_once_with(
+            [OWNER, OWNER], [HexBytes(HASHES[0]), HexBytes(HASHES[1])]
+        )
+
+    async def test_an_invalid_hash_is_reported_as_is(self, service):
+        with pytest.raises(DomainException, match="is not 32 bytes long"):
+            await service.prepare_certificates([("abcd", OWNER)])
+
+    async def test_other_failures_are_domain_errors(self, service, contract):
+        contract.functions.issueCertificate.return_value.build_transaction = AsyncMock(side_effect=ValueError("boom"))
+
+        with pytest.raises(DomainException, match="Failed to prepare certificates: boom"):
+            await service.prepare_certificates([(HASHES[0], OWNER)])
+
+    async def test_an_anchor_records_the_root_and_its_leaf_count(self, service, contract):
+        contract.functions.anchorRoot.return_value = contract_function()
+        root = "0x" + HASHES[2]
+
+        transaction = await service.prepare_anchor(root, 3)
+
+        contract.functions.anchorRoot.assert_called_once_with(HexBytes(root), 3)
+        assert isinstance(transaction, PreparedTransaction)
+
+    async def test_a_failed_anchor_is_a_domain_error(self, service, contract):
+        contract.functions.anchorRoot.return_value.build_transaction = AsyncMock(side_effect=ValueError("boom"))
+
+        with pytest.raises(DomainException, match="Failed to prepare the anchoring of Merkle root"):
+            await service.prepare_anchor("0x" + HASHES[2], 3)
+
+
+class TestBroadcast:
+    def prepared(self, sender: str = ADMIN_ADDRESS) -> PreparedTransaction:
+        return PreparedTransaction(transaction_hash=TX_HASH.to_0x_hex(), raw_transaction="0x1234", sender=sender)
+
+    async def test_the_signed_transaction_is_sent(self, service, web3_client):
+        await service.broadcast_transaction(self.prepared())
+
+        web3_client.eth.send_raw_transaction.assert_awaited_once_with(HexBytes("0x1234"))
+
+    async def test_only_transactions_of_the_pool_are_sent(self, service, web3_client):
+        with pytest.raises(DomainException, match="was not signed by the signer pool"):
+            await service.broadcast_transaction(self.prepared(OWNER))
+
+        web3_client.eth.send_raw_transaction.assert_not_awaited()
+
+    async def test_a_failed_send_is_a_domain_error(self, service, web3_client):
+        web3_client.eth.send_raw_transaction.side_effect = ConnectionError("reset")
+
+        with pytest.raises(DomainException, match="Failed to send transaction"):
+            await service.broadcast_transaction(self.prepared())
+
+
+class TestFindIssuedCertificates:
+    async def test_recorded_hashes_are_found_by_hash(self, service, contract):
+        contract.functions.getByHash.side_effect = lambda data_hash: (
+            call((7, ADMIN_ADDRESS)) if data_hash == HexBytes(HASHES[0]) else call(error=ContractLogicError("revert"))
+        )
+
+        assert await service.find_issued_certificates(HASHES[:2]) == {HASHES[0]: "7"}
+
+    async def test_lookup_failures_are_domain_errors(self, service, contract):
+        contract.functions.getByHash.return_value = call(error=ConnectionError("reset"))
+
+        with pytest.raises(DomainException, match="Failed to look up issued certificates"):
+            await service.find_issued_certificates(HASHES[:1])
+
+    @pytest.mark.parametrize("abi_path", [REGISTRY_V1_ABI_PATH])
+    async def test_a_v1_registry_cannot_look_hashes_up(self, service):
+        assert await service.find_issued_certificates(HASHES[:1]) is None
+
+
+class TestIssuanceReceipts:
+    async def test_no_transaction_needs_no_request(self, service, web3_client):
+        assert await service.get_issuance_receipts([]) == {}
+
+        web3_client.provider.make_batch_request.assert_not_awaited()
+
+    async def test_receipts_of_mined_transactions_carry_the_issued_certificates(self, service, web3_client):
+        mined, pending, failed = ("0x" + character * 64 for character in "123")
+        web3_client.provider.make_batch_request.return_value = [
+            {"result": raw_receipt(mined, [issued_log(8, HASHES[0]), already_issued_log(5, HASHES[1])])},
+            {"result": None},
+            {"result": raw_receipt(failed, [issued_log(9, HASHES[2])], status=0)},
+        ]
+
+        receipts = await service.get_issuance_receipts([mined, pending, failed])
+
+        assert list(receipts) == [mined, failed]
+        assert receipts[mined].success
+        assert receipts[mined].block_number == 7
+        assert receipts[mined].certificate_ids == {HASHES[0]: "8", HASHES[1]: "5"}
+        assert receipts[mined].anchored_epochs == {}
+        assert not receipts[failed].success
+        assert receipts[failed].certificate_ids == {}
+        (requests,) = web3_client.provider.make_batch_request.await_args.args
+        assert requests == [("eth_getTransactionReceipt", [tx_hash]) for tx_hash in (mined, pending, failed)]
+
+    async def test_events_of_other_contracts_are_ignored(self, service, web3_client):
+        web3_client.provider.make_batch_request.return_value = [
+            {"result": raw_receipt(TX_HASH.to_0x_hex(), [issued_log(8, HASHES[0], PREVIOUS_REGISTRY_ADDRESS)])}
+        ]
+
+        receipts = await service.get_issuance_receipts([TX_HASH.to_0x_hex()])
+
+        assert receipts[TX_HASH.to_0x_hex()].certificate_ids == {}
+
+    async def test_in_merkle_mode_receipts_carry_the_anchored_epochs(self, service, web3_client):
+        service.config = service.config.model_copy(update={"anchoring_mode": "merkle"})
+        root = "0x" + HASHES[2]
+        web3_client.provider.make_batch_request.return_value = [
+            {"result": raw_receipt(TX_HASH.to_0x_hex(), [anchored_log(4, root)])}
+        ]
+
+        receipts = await service.get_issuance_receipts([TX_HASH.to_0x_hex()])
+
+        assert receipts[TX_HASH.to_0x_hex()].anchored_epochs == {root: "4"}
+
+    @pytest.mark.parametrize(
+        "response, message",
+        [
+            ({"error": {"code": -32000, "message": "overloaded"}}, "Batch receipt request failed"),
+            ([{"error": {"code": -32000, "message": "missing trie node"}}], "Failed to fetch receipt of"),
+        ],
+        ids=["batch", "request"],
+    )
+    async def test_errors_are_domain_errors(self, service, web3_client, response, message):
+        web3_client.provider.make_batch_request.return_value = response
+
+        with pytest.raises(DomainException, match=message):
+            await service.get_issuance_receipts([TX_HASH.to_0x_hex()])
+
+    async def test_transport_failures_are_domain_errors(self, service, web3_client):
+        web3_client.provider.make_batch_request.side_effect = ConnectionError("reset")
+
+        with pytest.raises(DomainException, match="Failed to fetch issuance receipts: reset"):
+            await service.get_issuance_receipts([TX_HASH.to_0x_hex()])
+
+
+class TestRevokeCertificates:
+    @pytest.fixture
+    def revoke(self, contract: MagicMock) -> MagicMock:
+        contract.functions.revokeCertificates.side_effect = lambda ids: contract_function()
+        return contract.functions.revokeCertificates
+
+    async def test_certificates_are_revoked_in_chunks_by_the_admin(self, service, web3_client, contract, revoke):
+        web3_client.eth.get_transaction_receipt.side_effect = [
+            formatted_receipt([revoked_log(1), revoked_log(2)]),
+            formatted_receipt([revoked_log(3)]),
+        ]
+
+        receipts = await service.revoke_certificates(["1", "2", "3", "1"])
+
+        assert [call.args for call in revoke.call_args_list] == [([1, 2],), ([3],)]
+        assert receipts == {
+            blockchain_id: RevocationReceipt(
+                blockchain_id=blockchain_id, revoked=True, transaction_hash=TX_HASH.to_0x_hex()
+            )
+            for blockchain_id in ("1", "2", "3")
+        }
+        signed = [call.args[0] for call in web3_client.eth.send_raw_transaction.await_args_list]
+        assert {Account.recover_transaction(raw) for raw in signed} == {ADMIN_ADDRESS}
+
+    async def test_skipped_certificates_are_told_apart(self, service, web3_client, contract, revoke):
+        web3_client.eth.get_transaction_receipt.return_value = formatted_receipt([revoked_log(1)])
+        contract.functions.getCertificate.side_effect = lambda certificate_id: (
+            call((2, ADMIN_ADDRESS, OWNER, HexBytes(HASHES[0]), 1, True))
+            if certificate_id == 2
+            else call(error=ContractLogicError("unknown"))
+        )
+        service.config = service.config.model_copy(update={"revocation_batch_max_size": 3})
+
+        receipts = await service.revoke_certificates(["1", "2", "99", "x1"])
+
+        assert receipts["1"].revoked
+        assert receipts["2"] == RevocationReceipt(blockchain_id="2", revoked=True)
+        assert receipts["99"] == RevocationReceipt(
+            blockchain_id="99", revoked=False, error="Certificate does not exist on the blockchain."
+        )
+        assert receipts["x1"] == RevocationReceipt(
+            blockchain_id="x1", revoked=False, error="Invalid blockchain identifier."
+        )
+
+    async def test_a_failed_chunk_is_reported_on_its_certificates_only(self, service, web3_client, revoke):
+        web3_client.eth.get_transaction_receipt.side_effect = [
+            formatted_receipt(status=0),
+            formatted_receipt([revoked_log(3)]),
+        ]
+
+        receipts = await service.revoke_certificates(["1", "2", "3"])
+
+        assert receipts["1"].error == f"Revocation transaction {TX_HASH.to_0x_hex()} failed on the blockchain."
+        assert not receipts["2"].revoked
+        assert receipts["3"].revoked
+
+    async def test_certificates_of_an_earlier_deployment_are_revoked_there(
+        self, service, contracts, web3_client, revoke
+    ):
+        previous = contracts.bind(PREVIOUS_REGISTRY_ADDRESS)
+        previous.contract = MagicMock()
+        previous.contract.functions.revokeCertificates.side_effect = lambda ids: contract_function()
+        web3_client.eth.get_transaction_receipt.return_value = formatted_receipt(
+            [
+                raw_log(
+                    [topic("CertificateRevoked(uint256,uint256)"), uint(4)],
+                    encode(["uint256"], [1]),
+                    PREVIOUS_REGISTRY_ADDRESS,
+                )
+            ]
+        )
+
+        receipts = await service.revoke_certificates(["4"], PREVIOUS_REGISTRY_ADDRESS)
+
+        assert receipts["4"].revoked
+        previous.contract.functions.revokeCertificates.assert_called_once_with([4])
+        revoke.assert_not_called()
+
+
+class TestTransact:
+    @pytest.fixture(autouse=True)
+    def short_timeouts(self, service: Web3BlockchainService) -> None:
+        # Below the one second minimum of the configuration, so the tests wait for milliseconds only
+        service.config = service.config.model_copy(
+            update={"transaction_timeout_seconds": 0.05, "replacement_after_seconds": 0.01}
+        )
+
+    async def test_a_dropped_transaction_is_resent_with_a_fresh_nonce(self, service, web3_client, signer):
+        def get_transaction_receipt(tx_hash: HexBytes) -> Dict[str, Any]:
+            if web3_client.eth.send_raw_transaction.await_count < 2:
+                raise TransactionNotFound("pending")
+            return formatted_receipt()
+
+        web3_client.eth.get_transaction_receipt.side_effect = get_transaction_receipt
+        web3_client.eth.get_transaction.side_effect = TransactionNotFound("dropped")
+
+        receipt = await service._transact(contract_function(), signer)
+
+        assert receipt["status"] == 1
+        assert web3_client.eth.send_raw_transaction.await_count == 2
+        # The nonce of the dropped transaction was read again from the node
+        assert web3_client.eth.get_transaction_count.await_count == 2
+
+    async def test_a_pending_transaction_is_replaced_then_times_out(self, service, web3_client, signer, fee_strategy):
+        replacement = HexBytes("0x" + "ef" * 32)
+        sent = iter([TX_HASH])
+        web3_client.eth.send_raw_transaction.side_effect = lambda raw: next(sent, replacement)
+        web3_client.eth.get_transaction_receipt.side_effect = TransactionNotFound("pending")
+        web3_client.eth.get_transaction.return_value = {
+            "from": ADMIN_ADDRESS,
+            "to": REGISTRY_ADDRESS,
+            "input": "0x",
+            "value": 0,
+            "gas": 100_000,
+            "nonce": 3,
+            "chainId": 31337,
+            "blockNumber": None,
+        }
+
+        with pytest.raises(DomainException, match="was not mined within 0.05 seconds"):
+            await service._transact(contract_function(), signer)
+
+        fee_strategy.replacement_fields.assert_awaited()
+        polled = {call.args[0] for call in web3_client.eth.get_transaction_receipt.await_args_list}
+        assert polled == {TX_HASH, replacement}
+
+    async def test_a_transaction_dropped_every_time_fails_after_the_last_attempt(self, service, web3_client, signer):
+        web3_client.eth.get_transaction_receipt.side_effect = TransactionNotFound("pending")
+        web3_client.eth.get_transaction.side_effect = TransactionNotFound("dropped")
+
+        with pytest.raises(DomainException, match="was not mined"):
+            await service._transact(contract_function(), signer)
+
+        assert web3_client.eth.send_raw_transaction.await_count == web3_blockchain_service.MAX_SEND_ATTEMPTS
+
+    async def test_is_transaction_pending_asks_the_node(self, service, web3_client):
+        assert await service.is_transaction_pending(TX_HASH.to_0x_hex())
+
+        web3_client.eth.get_transaction.side_effect = TransactionNotFound("dropped")
+        assert not await service.is_transaction_pending(TX_HASH.to_0x_hex())
+
+
+class TestReplaceTransaction:
+    def pending(self, **overrides: Any) -> Dict[str, Any]:
+        return {
+            "from": ADMIN_ADDRESS,
+            "to": REGISTRY_ADDRESS,
+            "input": "0x1234",
+            "value": 0,
+            "gas": 100_000,
+            "nonce": 3,
+            "chainId": 31337,
+            "blockNumber": None,
+            **overrides,
+        }
+
+    async def test_the_replacement_reuses_the_nonce_with_higher_fees(self, service, web3_client):
+        web3_client.eth.get_transaction.return_value = self.pending()
+
+        assert await service.replace_transaction(TX_HASH.to_0x_hex()) == TX_HASH.to_0x_hex()
+
+        (raw,) = web3_client.eth.send_raw_transaction.await_args.args
+        assert Account.recover_transaction(raw) == ADMIN_ADDRESS
+
+    @pytest.mark.parametrize(
+        "transaction",
+        [{"blockNumber": 12}, {"from": OWNER}],
+        ids=["mined", "foreign"],
+    )
+    async def test_only_pending_transactions_of_the_pool_are_replaced(self, service, web3_client, transaction):
+        web3_client.eth.get_transaction.return_value = self.pending(**transaction)
+
+        assert await service.replace_transaction(TX_HASH.to_0x_hex()) is None
+        web3_client.eth.send_raw_transaction.assert_not_awaited()
+
+    async def test_a_forgotten_transaction_is_not_replaced(self, service, web3_client):
+        web3_client.eth.get_transaction.side_effect = TransactionNotFound("dropped")
+
+        assert await service.replace_transaction(TX_HASH.to_0x_hex()) is None
+
+    async def test_fees_that_cannot_be_raised_leave_the_transaction(self, service, web3_client, fee_strategy):
+        web3_client.eth.get_transaction.return_value = self.pending()
+        fee_strategy.replacement_fields.return_value = None
+
+        assert await service.replace_transaction(TX_HASH.to_0x_hex()) is None
+        web3_client.eth.send_raw_transaction.assert_not_awaited()
+
+    async def test_a_nonce_error_means_the_original_may_still_be_mined(self, service, web3_client):
+        web3_client.eth.get_transaction.return_value = self.pending()
+        web3_client.eth.send_raw_transaction.side_effect = ValueError("replacement transaction underpriced")
+
+        assert await service.replace_transaction(TX_HASH.to_0x_hex()) is None
+
+    async def test_other_failures_are_domain_errors(self, service, web3_client):
+        web3_client.eth.get_transaction.return_value = self.pending()
+        web3_client.eth.send_raw_transaction.side_effect = ConnectionError("reset")
+
+        with pytest.raises(DomainException, match="Failed to replace transaction"):
+            await service.replace_transaction(TX_HASH.to_0x_hex())
+
+
+class TestReadCertificates:
+    def registry_certificate(self, certificate_id: int) -> Tuple[Any, ...]:
+        return (certificate_id, ADMIN_ADDRESS, OWNER, HexBytes(HASHES[0]), 1_700_000_000 + certificate_id, False)
+
+    async def test_count_is_the_last_issued_id(self, service, contract):
+        contract.functions.nextId.return_value = call(43)
+
+        assert await service.count_certificates() == 42
+
+    async def test_a_failed_count_is_a_domain_error(self, service, contract):
+        contract.functions.nextId.return_value = call(error=ConnectionError("reset"))
+
+        with pytest.raises(DomainException, match="Failed to count certificates"):
+            await service.count_certificates()
+
+    async def test_pages_are_read_ahead_and_yielded_in_order(self, service, contract):
+        service.config = service.config.model_copy(update={"bulk_read_page_size": 2, "bulk_read_concurrency": 2})
+        issued = 5
+
+        def get_certificates(first_id: int, count: int) -> MagicMock:
+            ids = [certificate_id for certificate_id in range(first_id, first_id + count) if certificate_id <= issued]
+            return call([self.registry_certificate(certificate_id) for certificate_id in ids])
+
+        contract.functions.getCertificates.side_effect = get_certificates
+
+        pages = [page async for page in service.read_certificates(0, 10)]
+
+        assert [[certificate.blockchain_id for certificate in page] for page in pages] == [
+            ["1", "2"],
+            ["3", "4"],
+            ["5"],
+        ]
+        assert pages[0][0] == RegistryCertificate(
+            blockchain_id="1", data_hash=HASHES[0], issuer=ADMIN_ADDRESS, owner=OWNER, issued_at=1_700_000_001
+        )
+        # The page past the last issued certificate ends the read, whatever is still requested
+        requested = [call.args for call in contract.functions.getCertificates.call_args_list]
+        assert requested[:4] == [(1, 2), (3, 2), (5, 2), (7, 2)]
+
+    async def test_a_failed_page_is_a_domain_error(self, service, contract):
+        contract.functions.getCertificates.return_value = call(error=ConnectionError("reset"))
+
+        with pytest.raises(DomainException, match="Failed to read certificates 1 to 3"):
+            async for _ in service.read_certificates(1, 3):
+                pass
+
+
+class TestSignatures:
+    async def test_hash_data_hashes_the_canonical_encoding(self, service):
+        assert await service.hash_data({"b": 1, "a": 2}) == await service.hash_data({"a": 2, "b": 1})
+
+    async def test_data_that_cannot_be_encoded_is_a_domain_error(self, service):
+        with pytest.raises(DomainException, match="Failed to hash data"):
+            await service.hash_data({"value": object()})
+
+    async def test_a_signature_of_the_address_is_valid(self, service, signature_verifier):
+        signature_verifier.recover = AsyncMock(return_value=(ADMIN_ADDRESS, None))
+
+        await service.verify_signature(HASHES[0], "0x1234", ADMIN_ADDRESS.lower())
+
+    @pytest.mark.parametrize(
+        "recovered, address, message",
+        [
+            ((OWNER, None), ADMIN_ADDRESS, "recovered address does not match"),
+            ((None, "bad signature"), ADMIN_ADDRESS, "Failed to verify signature: bad signature"),
+            ((ADMIN_ADDRESS, None), "not an address", "Failed to verify signature"),
+        ],
+        ids=["other-signer", "unrecoverable", "invalid-address"],
+    )
+    async def test_invalid_signatures_are_domain_errors(self, service, signature_verifier, recovered, address, message):
+        signature_verifier.recover = AsyncMock(return_value=recovered)
+
+        with pytest.raises(DomainException, match=message):
+            await service.verify_signature(HASHES[0], "0x1234", address)
+
+    async def test_a_batch_of_signatures_is_verified_as_the_signers_are_recovered(self, service, signature_verifier):
+        async def recover_many(messages: List[Tuple[str, str]]) -> AsyncIterator[Tuple[int, Any]]:
+            assert messages == [(HASHES[0], "0x01"), (HASHES[1], "0x02"), (HASHES[2], "0x03")]
+            yield 2, (ADMIN_ADDRESS, None)
+            yield 0, (ADMIN_ADDRESS, None)
+            yield 1, (None, "bad signature")
+            await asyncio.sleep(0)
+
+        signature_verifier.recover_many = recover_many
+        checks = [
+            SignatureCheck(key="a", message_hash=HASHES[0], signature="0x01", address=ADMIN_ADDRESS),
+            SignatureCheck(key="b", message_hash=HASHES[1], signature="0x02", address=ADMIN_ADDRESS),
+            SignatureCheck(key="c", message_hash=HASHES[2], signature="0x03", address="not an address"),
+        ]
+
+        verifications = [verification async for verification in service.verify_signatures(checks)]
+
+        assert [(verification.key, verification.valid) for verification in verifications] == [
+            ("c", False),
+            ("a", True),
+            ("b", False),
+        ]
+        assert verifications[0].error.startswith("Invalid address")
+        assert verifications[2].error == "bad signature"
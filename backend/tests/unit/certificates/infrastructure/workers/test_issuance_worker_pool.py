@@ -0,0 +1,101 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession as DatabaseSession
+
+from certificado_verde_blockchain.certificates.application import ProcessIssuanceTasksHandler
+from certificado_verde_blockchain.certificates.infrastructure.workers import IssuanceWorkerPool
+
+
+@pytest.fixture
+def session() -> MagicMock:
+    session = MagicMock()
+    session.close = AsyncMock()
+    return session
+
+
+@pytest.fixture
+def handler() -> MagicMock:
+    handler = MagicMock()
+    handler.submit_pending = AsyncMock(return_value=0)
+    handler.confirm_submitted = AsyncMock(return_value=0)
+    return handler
+
+
+@pytest.fixture
+def container(session, handler) -> MagicMock:
+    scope = MagicMock()
+    scope.resolve.side_effect = {DatabaseSession: session, ProcessIssuanceTasksHandler: handler}.get
+    container = MagicMock()
+    container.create_scope.return_value.__enter__.return_value = scope
+    return container
+
+
+@pytest.fixture
+def logger() -> MagicMock:
+    logger = MagicMock()
+    for level in ("info", "warning", "error"):
+        setattr(logger, level, AsyncMock())
+    return logger
+
+
+@pytest.fixture
+def pool(container, blockchain_config, logger) -> IssuanceWorkerPool:
+    return IssuanceWorkerPool(container, blockchain_config(issuance_workers=2, issuance_poll_interval_ms=10), logger)
+
+
+async def until(condition, timeout: float = 1) -> None:
+    async def wait() -> None:
+        while not condition():
+            await asyncio.sleep(0.001)
+
+    await asyncio.wait_for(wait(), timeout)
+
+
+async def test_runs_every_iteration_in_its_own_scope_until_stopped(pool, container, session, handler):
+    pool.start()
+    await until(lambda: handler.confirm_submitted.await_count >= 4)
+    await pool.stop()
+
+    assert container.create_scope.call_count == handler.submit_pending.await_count
+    assert session.close.await_count == handler.submit_pending.await_count
+    iterations = handler.submit_pending.await_count
+    await asyncio.sleep(0.03)
+    assert handler.submit_pending.await_count == iterations
+
+
+async def test_starts_the_configured_number_of_workers_once(pool, logger):
+    pool.start()
+    pool.start()
+    await until(lambda: logger.info.await_count >= 2)
+    await pool.stop()
+
+    started = [call.args[0] for call in logger.info.await_args_list if call.args[0].endswith("started.")]
+    assert started == ["Issuance worker 0 started.", "Issuance worker 1 started."]
+
+
+async def test_polls_again_right_away_while_there_is_work(container, blockchain_config, logger, handler):
+    pool = IssuanceWorkerPool(container, blockchain_config(issuance_workers=1, issuance_poll_interval_ms=60000), logger)
+    handler.submit_pending.side_effect = [3, 2, 0]
+
+    pool.start()
+    await until(lambda: handler.submit_pending.await_count == 3)
+    await pool.stop()
+
+
+async def test_keeps_working_after_a_failed_iteration(pool, handler, session, logger):
+    handler.submit_pending.side_effect = [ConnectionError("database unreachable"), 0, 0, 0]
+
+    pool.start()
+    await until(lambda: handler.submit_pending.await_count >= 3)
+    await pool.stop()
+
+    assert any("failed: database unreachable" in call.args[0] for call in logger.error.await_args_list)
+    assert session.close.await_count == handler.submit_pending.await_count
+
+
+async def test_stopping_a_pool_that_was_not_started_does_nothing(pool, container):
+    await pool.stop()
+
+    container.create_scope.assert_not_called()
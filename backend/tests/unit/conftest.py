@@ -0,0 +1,28 @@
+from typing import Any, Callable
+
+import pytest
+
+from certificado_verde_blockchain.configuration import BlockchainConfig
+
+# First account of the Hardhat and eth-tester development chains
+ADMIN_ADDRESS = "0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266"
+ADMIN_PRIVATE_KEY = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+
+
+@pytest.fixture
+def blockchain_config() -> Callable[..., BlockchainConfig]:
+    """Build a BlockchainConfig for a local development chain, with the given fields overridden."""
+
+    def build(**overrides: Any) -> BlockchainConfig:
+        return BlockchainConfig(
+            **{
+                "contract": "0x5FbDB2315678afecb367f032d93F642f64180aa3",
+                "abi_path": "abi.json",
+                "provider_url": "http://127.0.0.1:8545",
+                "private_key": ADMIN_PRIVATE_KEY,
+                "admin_address": ADMIN_ADDRESS,
+                **overrides,
+            }
+        )
+
+    return build
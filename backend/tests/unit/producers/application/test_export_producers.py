@@ -0,0 +1,50 @@
+from typing import Any, AsyncIterator, List
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from certificado_verde_blockchain.producers.application import ExportProducersHandler, FindProducersByIdsHandler
+from certificado_verde_blockchain.producers.application.export_producers import EXPORT_CHUNK_SIZE
+from certificado_verde_blockchain.producers.domain import Producer
+
+
+def producer(number: str) -> Producer:
+    return Producer(
+        name=f"Fazenda {number}",
+        document={"document_type": "CPF", "number": number},
+        address={"country": "Brasil", "coordinates": {"latitude": -15.8, "longitude": -47.9}},
+        contact={"phone": "+55 61 99999-0000"},
+    )
+
+
+@pytest.fixture
+def repository() -> MagicMock:
+    return MagicMock()
+
+
+class TestExportProducers:
+    async def test_every_chunk_of_producers_is_exported(self, repository: MagicMock):
+        chunks = [[producer("111"), producer("222")], [producer("333")]]
+
+        async def stream(*_: Any) -> AsyncIterator[List[Producer]]:
+            for chunk in chunks:
+                yield chunk
+
+        repository.stream = MagicMock(side_effect=stream)
+
+        records = [record async for record in ExportProducersHandler(repository, AsyncMock()).handle()]
+
+        assert [record["document"]["number"] for record in records] == ["111", "222", "333"]
+        assert records[0] == chunks[0][0].model_dump()
+        repository.stream.assert_called_once_with(EXPORT_CHUNK_SIZE)
+
+
+class TestFindProducersByIds:
+    async def test_the_producers_are_found_in_one_call(self, repository: MagicMock):
+        producers = [producer("111"), producer("222")]
+        repository.find_by_ids = AsyncMock(return_value=producers)
+
+        result = await FindProducersByIdsHandler(repository, AsyncMock()).handle([item.id for item in producers])
+
+        assert result == {"producers": [item.model_dump() for item in producers]}
+        repository.find_by_ids.assert_awaited_once_with([item.id for item in producers])
@@ -0,0 +1,113 @@
+import json
+from typing import Any, AsyncIterator, Dict, List, Set, Union
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID
+
+import pytest
+
+from certificado_verde_blockchain.producers.application import ImportProducersHandler, import_producers
+from certificado_verde_blockchain.producers.domain import Producer
+
+
+def producer(number: str, **overrides: Any) -> Dict[str, Any]:
+    return {
+        "name": f"Fazenda {number}",
+        "document": {"document_type": "CNPJ", "number": number},
+        "address": {"country": "Brasil", "coordinates": {"latitude": -15.8, "longitude": -47.9}},
+        "car_code": None,
+        "contact": {"email": "contato@fazenda.com.br"},
+        "metadata": None,
+        **overrides,
+    }
+
+
+async def rows(*documents: Union[str, Dict[str, Any]]) -> AsyncIterator[Any]:
+    for line, document in enumerate(documents, start=1):
+        yield line, document
+
+
+@pytest.fixture
+def registered() -> Set[str]:
+    """Document numbers already in the database, left out by the set-wise insert."""
+    return set()
+
+
+@pytest.fixture
+def batches() -> List[List[Producer]]:
+    return []
+
+
+@pytest.fixture
+def repository(registered: Set[str], batches: List[List[Producer]]) -> MagicMock:
+    async def import_all(producers: AsyncIterator[List[Producer]]) -> List[UUID]:
+        async for batch in producers:
+            batches.append(batch)
+        return [producer.id for batch in batches for producer in batch if producer.document.number not in registered]
+
+    repository = MagicMock()
+    repository.import_all = AsyncMock(side_effect=import_all)
+    return repository
+
+
+@pytest.fixture
+def handler(repository: MagicMock) -> ImportProducersHandler:
+    return ImportProducersHandler(repository, AsyncMock())
+
+
+class TestImportProducers:
+    async def test_valid_rows_are_registered_together(
+        self, handler: ImportProducersHandler, batches: List[List[Producer]]
+    ):
+        report = await handler.handle(rows(json.dumps(producer("111")), producer("222", car_code="MT-1")))
+
+        assert report == {"received": 2, "imported": 2, "rejected": []}
+        assert [[producer.document.number for producer in batch] for batch in batches] == [["111", "222"]]
+        assert batches[0][1].car_code == "MT-1"
+
+    async def test_invalid_rows_are_reported_with_every_failing_field(self, handler: ImportProducersHandler):
+        invalid = producer("", contact={"email": "not an email"})
+
+        report = await handler.handle(rows(invalid))
+
+        assert report["imported"] == 0
+        assert [(row["line"], [error["field"] for error in row["errors"]]) for row in report["rejected"]] == [
+            (1, ["document.number", "contact.email"])
+        ]
+
+    async def test_a_document_repeated_in_the_upload_is_rejected(
+        self, handler: ImportProducersHandler, batches: List[List[Producer]]
+    ):
+        report = await handler.handle(rows(producer("111"), producer("222"), producer("111", name="Outra")))
+
+        assert report["imported"] == 2
+        assert report["rejected"] == [
+            {
+                "line": 3,
+                "errors": [{"field": "document.number", "message": "Duplicate document number, already on line 1"}],
+            }
+        ]
+        assert [producer.name for batch in batches for producer in batch] == ["Fazenda 111", "Fazenda 222"]
+
+    async def test_an_already_registered_document_is_rejected_in_line_order(
+        self, handler: ImportProducersHandler, registered: Set[str]
+    ):
+        registered.add("333")
+
+        report = await handler.handle(rows(producer("111"), producer("333"), {"name": ""}, producer("444")))
+
+        assert report["received"] == 4
+        assert report["imported"] == 2
+        assert [row["line"] for row in report["rejected"]] == [2, 3]
+        assert report["rejected"][0]["errors"] == [
+            {"field": "document.number", "message": "Cannot save duplicate producer with document CNPJ, number 333"}
+        ]
+
+    async def test_producers_are_loaded_in_batches(
+        self, handler: ImportProducersHandler, batches: List[List[Producer]], monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setattr(import_producers, "IMPORT_BATCH_SIZE", 2)
+
+        report = await handler.handle(rows(*(producer(str(number)) for number in range(5))))
+
+        assert report["imported"] == 5
+        assert [len(batch) for batch in batches] == [2, 2, 1]
@@ -0,0 +1,250 @@
+from typing import AsyncIterator, List
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
+
+from certificado_verde_blockchain.producers.domain import Producer
+from certificado_verde_blockchain.producers.infrastructure.sql import SqlProducerRepository
+from certificado_verde_blockchain.producers.infrastructure.sql.producer_entity import ProducerEntity
+from certificado_verde_blockchain.shared.errors import DomainException
+from certificado_verde_blockchain.shared.sql import SqlUnitOfWork
+
+
+def producer(number: str = "12345678000190") -> Producer:
+    return Producer(
+        name=f"Fazenda {number}",
+        document={"document_type": "CNPJ", "number": number},
+        address={"country": "Brasil", "coordinates": {"latitude": -15.8, "longitude": -47.9}},
+        contact={"email": "contato@fazenda.com.br"},
+        metadata={"certified": True},
+    )
+
+
+@pytest.fixture
+def database_session() -> MagicMock:
+    database_session = MagicMock()
+    database_session.scalar = AsyncMock(return_value=None)
+    database_session.scalars = AsyncMock()
+    database_session.rollback = AsyncMock()
+    return database_session
+
+
+@pytest.fixture
+def unit_of_work(database_session: MagicMock) -> SqlUnitOfWork:
+    return SqlUnitOfWork(database_session)
+
+
+@pytest.fixture
+def repository(database_session: MagicMock, unit_of_work: SqlUnitOfWork) -> SqlProducerRepository:
+    return SqlProducerRepository(database_session, unit_of_work)
+
+
+def returns_rows(database_session: MagicMock, producers: List[Producer]) -> None:
+    database_session.scalars.return_value = MagicMock()
+    database_session.scalars.return_value.all.return_value = [ProducerEntity.from_domain(item) for item in producers]
+
+
+def filtered_by(database_session: MagicMock) -> str:
+    """The WHERE, ORDER BY and LIMIT clauses of the last query, with its values inlined."""
+    statement = database_session.scalars.await_args.args[0]
+    sql = str(statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+    return " ".join(sql.split("FROM producers", 1)[1].split())
+
+
+class TestListPage:
+    async def test_pages_seek_past_the_last_id(self, repository: SqlProducerRepository, database_session: MagicMock):
+        page = [producer("111"), producer("222")]
+        returns_rows(database_session, page)
+
+        found = await repository.list_page(UUID(int=7), 2)
+
+        assert found == page
+        assert filtered_by(database_session) == (
+            f"WHERE producers.id > '{UUID(int=7).hex}' ORDER BY producers.id LIMIT 2"
+        )
+
+    async def test_the_first_page_starts_at_the_lowest_id(
+        self, repository: SqlProducerRepository, database_session: MagicMock
+    ):
+        returns_rows(database_session, [])
+
+        assert await repository.list_page(None, 20) == []
+        assert filtered_by(database_session) == "ORDER BY producers.id LIMIT 20"
+
+    async def test_a_failed_page_rolls_the_session_back(
+        self, repository: SqlProducerRepository, database_session: MagicMock
+    ):
+        database_session.scalars.side_effect = ConnectionError("server closed the connection")
+
+        with pytest.raises(ConnectionError):
+            await repository.list_page(None, 20)
+
+        database_session.rollback.assert_awaited_once()
+
+
+class TestFind:
+    async def test_find_by_id_serves_the_scope_first(
+        self, repository: SqlProducerRepository, unit_of_work: SqlUnitOfWork, database_session: MagicMock
+    ):
+        in_scope = producer()
+        unit_of_work.track(in_scope)
+
+        assert await repository.find_by_id(in_scope.id) == in_scope
+        database_session.scalar.assert_not_awaited()
+
+    async def test_find_by_id_keeps_the_loaded_producer_in_the_scope(
+        self, repository: SqlProducerRepository, unit_of_work: SqlUnitOfWork, database_session: MagicMock
+    ):
+        loaded = producer()
+        database_session.scalar.return_value = ProducerEntity.from_domain(loaded)
+
+        assert await repository.find_by_id(loaded.id) == loaded
+        assert unit_of_work.find(Producer, loaded.id) == loaded
+
+    async def test_find_by_id_of_an_unknown_producer_is_none(self, repository: SqlProducerRepository):
+        assert await repository.find_by_id(UUID(int=1)) is None
+
+    async def test_find_by_ids_only_loads_the_producers_missing_from_the_scope(
+        self, repository: SqlProducerRepository, unit_of_work: SqlUnitOfWork, database_session: MagicMock
+    ):
+        in_scope, in_database = producer(), producer()
+        unit_of_work.track(in_scope)
+        returns_rows(database_session, [in_database])
+
+        found = await repository.find_by_ids([in_scope.id, in_database.id])
+
+        assert {item.id for item in found} == {in_scope.id, in_database.id}
+        assert filtered_by(database_session) == f"WHERE producers.id IN ('{in_database.id.hex}')"
+        assert unit_of_work.find(Producer, in_database.id) == in_database
+
+    async def test_find_by_ids_of_the_scope_does_not_query(
+        self, repository: SqlProducerRepository, unit_of_work: SqlUnitOfWork, database_session: MagicMock
+    ):
+        in_scope = producer()
+        unit_of_work.track(in_scope)
+
+        assert await repository.find_by_ids([in_scope.id]) == [in_scope]
+        database_session.scalars.assert_not_awaited()
+
+    @pytest.mark.parametrize("method, query", [("find_by_id", "scalar"), ("find_by_ids", "scalars")])
+    async def test_a_failed_read_rolls_the_session_back(
+        self, repository: SqlProducerRepository, database_session: MagicMock, method: str, query: str
+    ):
+        getattr(database_session, query).side_effect = ConnectionError("server closed the connection")
+
+        with pytest.raises(ConnectionError):
+            await getattr(repository, method)(UUID(int=1) if method == "find_by_id" else [UUID(int=1)])
+
+        database_session.rollback.assert_awaited_once()
+
+
+class TestStream:
+    async def test_producers_are_streamed_chunk_by_chunk_from_a_server_side_cursor(
+        self, repository: SqlProducerRepository, database_session: MagicMock
+    ):
+        chunks = [[producer("1"), producer("2")], [producer("3")]]
+
+        async def partitions() -> AsyncIterator[List[ProducerEntity]]:
+            for chunk in chunks:
+                yield [ProducerEntity.from_domain(item) for item in chunk]
+
+        database_session.stream_scalars = AsyncMock(return_value=MagicMock(partitions=partitions))
+
+        assert [chunk async for chunk in repository.stream(2)] == chunks
+        statement = database_session.stream_scalars.await_args.args[0]
+        assert statement.get_execution_options()["yield_per"] == 2
+        assert str(statement).endswith("ORDER BY producers.id")
+
+    async def test_a_failed_stream_rolls_the_session_back(
+        self, repository: SqlProducerRepository, database_session: MagicMock
+    ):
+        database_session.stream_scalars = AsyncMock(side_effect=ConnectionError("server closed the connection"))
+
+        with pytest.raises(ConnectionError):
+            [chunk async for chunk in repository.stream(2)]
+
+        database_session.rollback.assert_awaited_once()
+
+
+async def batches(*chunks: List[Producer]) -> AsyncIterator[List[Producer]]:
+    for chunk in chunks:
+        yield chunk
+
+
+class TestImportAll:
+    @pytest.fixture
+    def driver_connection(self, database_session: MagicMock) -> MagicMock:
+        driver_connection = MagicMock()
+        driver_connection.copy_records_to_table = AsyncMock()
+        connection = MagicMock()
+        connection.get_raw_connection = AsyncMock(return_value=MagicMock(driver_connection=driver_connection))
+        database_session.connection = AsyncMock(return_value=connection)
+        database_session.execute = AsyncMock()
+        database_session.commit = AsyncMock()
+        return driver_connection
+
+    async def test_batches_are_copied_to_a_staging_table_and_inserted_at_once(
+        self, repository: SqlProducerRepository, database_session: MagicMock, driver_connection: MagicMock
+    ):
+        first, second, third = producer("1"), producer("2"), producer("3")
+        database_session.scalars.return_value = MagicMock()
+        database_session.scalars.return_value.all.return_value = [str(first.id), str(third.id)]
+
+        imported = await repository.import_all(batches([first, second], [third]))
+
+        assert imported == [first.id, third.id]
+        assert str(database_session.execute.await_args.args[0]).startswith("CREATE TEMPORARY TABLE staging_producers")
+        assert [len(call.kwargs["records"]) for call in driver_connection.copy_records_to_table.await_args_list] == [
+            2,
+            1,
+        ]
+        insert = str(database_session.scalars.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert insert.startswith("INSERT INTO producers")
+        assert insert.endswith("ON CONFLICT (document_number) DO NOTHING RETURNING producers.id")
+        database_session.commit.assert_awaited_once()
+
+    async def test_a_failed_import_rolls_everything_back(
+        self, repository: SqlProducerRepository, database_session: MagicMock, driver_connection: MagicMock
+    ):
+        driver_connection.copy_records_to_table.side_effect = ConnectionError("server closed the connection")
+
+        with pytest.raises(ConnectionError):
+            await repository.import_all(batches([producer("1")]))
+
+        database_session.rollback.assert_awaited_once()
+        database_session.commit.assert_not_awaited()
+
+
+class TestSave:
+    async def test_saved_producers_are_upserted_on_commit(
+        self, repository: SqlProducerRepository, unit_of_work: SqlUnitOfWork, database_session: MagicMock
+    ):
+        saved = producer()
+        database_session.execute = AsyncMock()
+        database_session.commit = AsyncMock()
+
+        await repository.save(saved)
+
+        assert unit_of_work.find(Producer, saved.id) == saved
+        database_session.execute.assert_not_awaited()
+        await unit_of_work.commit()
+        upsert = str(database_session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert upsert.startswith("INSERT INTO producers")
+        assert "ON CONFLICT (id) DO UPDATE" in upsert
+
+    async def test_a_duplicate_producer_is_a_conflict(
+        self, repository: SqlProducerRepository, unit_of_work: SqlUnitOfWork, database_session: MagicMock
+    ):
+        database_session.execute = AsyncMock(side_effect=IntegrityError("INSERT", {}, Exception("unique")))
+
+        await repository.save(producer())
+        with pytest.raises(DomainException) as error:
+            await unit_of_work.commit()
+
+        assert (error.value.message, error.value.code) == (
+            "Cannot save duplicate producer with document CNPJ, number 12345678000190",
+            409,
+        )
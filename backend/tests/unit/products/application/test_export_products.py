@@ -0,0 +1,55 @@
+from typing import Any, AsyncIterator, List
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from certificado_verde_blockchain.products.application import ExportProductsHandler, FindProductsByIdsHandler
+from certificado_verde_blockchain.products.application.export_products import EXPORT_CHUNK_SIZE
+from certificado_verde_blockchain.products.domain import Product
+
+
+def product(name: str) -> Product:
+    return Product(
+        name=name,
+        description=None,
+        category="GRAIN",
+        quantity={"value": 10, "unit": "TONS"},
+        origin={"country": "Brasil", "coordinates": {"latitude": -12.6, "longitude": -55.7}},
+        lot_number=None,
+        carbon_emission=None,
+        metadata=None,
+        tags=None,
+    )
+
+
+@pytest.fixture
+def repository() -> MagicMock:
+    return MagicMock()
+
+
+class TestExportProducts:
+    async def test_every_chunk_of_products_is_exported(self, repository: MagicMock):
+        chunks = [[product("Soja"), product("Milho")], [product("Trigo")]]
+
+        async def stream(*_: Any) -> AsyncIterator[List[Product]]:
+            for chunk in chunks:
+                yield chunk
+
+        repository.stream = MagicMock(side_effect=stream)
+
+        records = [record async for record in ExportProductsHandler(repository, AsyncMock()).handle()]
+
+        assert [record["name"] for record in records] == ["Soja", "Milho", "Trigo"]
+        assert records[0] == chunks[0][0].model_dump()
+        repository.stream.assert_called_once_with(EXPORT_CHUNK_SIZE)
+
+
+class TestFindProductsByIds:
+    async def test_the_products_are_found_in_one_call(self, repository: MagicMock):
+        products = [product("Soja"), product("Milho")]
+        repository.find_by_ids = AsyncMock(return_value=products)
+
+        result = await FindProductsByIdsHandler(repository, AsyncMock()).handle([item.id for item in products])
+
+        assert result == {"products": [item.model_dump() for item in products]}
+        repository.find_by_ids.assert_awaited_once_with([item.id for item in products])
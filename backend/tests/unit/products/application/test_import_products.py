@@ -0,0 +1,90 @@
+import json
+from typing import Any, AsyncIterator, Dict, List, Union
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from certificado_verde_blockchain.products.application import ImportProductsHandler, import_products
+from certificado_verde_blockchain.products.domain import Product
+
+PRODUCT = {
+    "name": "Soja",
+    "description": None,
+    "category": "GRAIN",
+    "quantity": {"value": 1200.5, "unit": "KG"},
+    "origin": {"country": "Brasil", "coordinates": {"latitude": -12.6, "longitude": -55.7}},
+    "lot_number": "L-42",
+    "carbon_emission": 3.2,
+    "metadata": {"organic": True},
+    "tags": ["soja"],
+}
+
+
+async def rows(*documents: Union[str, Dict[str, Any]]) -> AsyncIterator[Any]:
+    for line, document in enumerate(documents, start=1):
+        yield line, document
+
+
+@pytest.fixture
+def batches() -> List[List[Product]]:
+    return []
+
+
+@pytest.fixture
+def repository(batches: List[List[Product]]) -> MagicMock:
+    async def import_all(products: AsyncIterator[List[Product]]) -> List[Any]:
+        async for batch in products:
+            batches.append(batch)
+        return [product.id for batch in batches for product in batch]
+
+    repository = MagicMock()
+    repository.import_all = AsyncMock(side_effect=import_all)
+    return repository
+
+
+@pytest.fixture
+def handler(repository: MagicMock) -> ImportProductsHandler:
+    return ImportProductsHandler(repository, AsyncMock())
+
+
+class TestImportProducts:
+    async def test_valid_rows_are_registered_together(
+        self, handler: ImportProductsHandler, batches: List[List[Product]]
+    ):
+        report = await handler.handle(rows(json.dumps(PRODUCT), {**PRODUCT, "name": "Milho", "tags": None}))
+
+        assert report == {"received": 2, "imported": 2, "rejected": []}
+        assert [[product.name for product in batch] for batch in batches] == [["Soja", "Milho"]]
+        product = batches[0][0]
+        assert product.quantity.value == 1200.5
+        assert product.origin.coordinates.latitude == -12.6
+        assert product.metadata == {"organic": True}
+
+    async def test_invalid_rows_are_reported_with_every_failing_field(
+        self, handler: ImportProductsHandler, batches: List[List[Product]]
+    ):
+        invalid = {**PRODUCT, "name": "", "quantity": {"value": 0, "unit": "KG"}}
+
+        report = await handler.handle(rows(json.dumps(PRODUCT), invalid, "{not json"))
+
+        assert report["received"] == 3
+        assert report["imported"] == 1
+        assert [row["line"] for row in report["rejected"]] == [2, 3]
+        assert [error["field"] for error in report["rejected"][0]["errors"]] == ["name", "quantity.value"]
+        assert [product.name for batch in batches for product in batch] == ["Soja"]
+
+    async def test_products_are_loaded_in_batches(
+        self, handler: ImportProductsHandler, batches: List[List[Product]], monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setattr(import_products, "IMPORT_BATCH_SIZE", 2)
+
+        report = await handler.handle(rows(*(json.dumps({**PRODUCT, "name": f"Lote {index}"}) for index in range(5))))
+
+        assert report["imported"] == 5
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+
+    async def test_an_empty_upload_imports_nothing(self, handler: ImportProductsHandler, batches: List[List[Product]]):
+        report = await handler.handle(rows())
+
+        assert report == {"received": 0, "imported": 0, "rejected": []}
+        assert not batches
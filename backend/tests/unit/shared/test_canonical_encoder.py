@@ -0,0 +1,121 @@
+import json
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from enum import Enum
+from uuid import UUID
+
+import pytest
+from web3 import Web3
+
+from certificado_verde_blockchain.shared.canonical import CanonicalEncoder, CanonicalEncoding
+
+CERTIFICATE = {
+    "id": "5f0c2a4e-8d1b-4c3a-9e2f-1a2b3c4d5e6f",
+    "norm": {"name": "Norma de Sustentabilidade", "version": "2.1", "criteria": ["Água", "Solo", "Energia"]},
+    "product": {"name": "Café Orgânico  Especial", "weight_kg": 1.5, "quantity": 3, "price": 10.0},
+    "producer": {"name": "Fazenda São João", "location": {"lat": -22.9068, "lng": -43.1729}},
+    "issued_at": "2024-05-17T12:30:00+00:00",
+    "valid": True,
+    "revoked_at": None,
+    "scores": [0.1, 1e-7, 12345678901234567890, -0.0],
+}
+
+
+def baseline_hash(data):
+    """The hash the backend wrote before the canonical encoder, which LEGACY must keep producing."""
+    return Web3.keccak(text=json.dumps(data, sort_keys=True).replace(" ", "")).hex()
+
+
+class Color(str, Enum):
+    GREEN = "verde"
+
+
+class TestLegacyEncoding:
+    @pytest.mark.parametrize(
+        "data",
+        [
+            CERTIFICATE,
+            {},
+            {"b": 1, "a": [3, 2, 1], "c": {"z": None, "y": False}},
+            {"text": "  spaces  inside\tand\nbreaks "},
+            {"unicode": "ação ñ 日本 😀", "escaped": 'quote " backslash \\ slash /'},
+            {"floats": [1.0, 0.5, 1e16, 1.7976931348623157e308, 5e-324]},
+            {"nested": [[{"b": 2, "a": 1}], [], [[None]]]},
+        ],
+    )
+    def test_matches_the_baseline_hash(self, data):
+        assert CanonicalEncoder.hash(data) == baseline_hash(data)
+
+    def test_hash_is_pinned(self):
+        # Certificates already on chain were issued with these hashes: they must never change
+        assert CanonicalEncoder.hash({"a": 1}) == "25e7c2a96531eb50246780c1f25742e489bf55210e26981dc02992bb585feb97"
+        assert CanonicalEncoder.hash(CERTIFICATE) == "e51b3d2808b9928ea7a5e43ceb56eb884878ab63aeb28171ed44b7f9d47db6e8"
+
+    def test_is_the_default_encoding(self):
+        assert CanonicalEncoder.hash(CERTIFICATE) == CanonicalEncoder.hash(CERTIFICATE, CanonicalEncoding.LEGACY)
+
+    def test_removes_spaces_inside_values(self):
+        assert CanonicalEncoder.encode({"name": "Café Orgânico"}) == '{"name":"Caf\\u00e9Org\\u00e2nico"}'
+
+
+class TestV2Encoding:
+    def encode(self, data):
+        return CanonicalEncoder.encode(data, CanonicalEncoding.V2)
+
+    def test_round_trips_json_documents(self):
+        encoded = self.encode(CERTIFICATE)
+
+        assert json.loads(encoded) == {**CERTIFICATE, "product": {**CERTIFICATE["product"], "price": 10}}
+        assert self.encode(json.loads(encoded)) == encoded
+
+    def test_does_not_depend_on_key_order(self):
+        reordered = dict(reversed(list(CERTIFICATE.items())))
+
+        assert CanonicalEncoder.hash(reordered, CanonicalEncoding.V2) == CanonicalEncoder.hash(
+            CERTIFICATE, CanonicalEncoding.V2
+        )
+
+    def test_keeps_values_intact_in_compact_utf8(self):
+        assert self.encode({"name": "Café  Orgânico", "b": [1, 2]}) == '{"b":[1,2],"name":"Café  Orgânico"}'
+
+    def test_normalizes_strings_to_nfc(self):
+        decomposed = "Cafe\u0301"
+
+        assert self.encode({decomposed: decomposed}) == self.encode({"Café": "Café"})
+
+    def test_writes_integral_floats_as_integers(self):
+        assert self.encode([10.0, -0.0, 2.5, 2.0**53]) == "[10,0,2.5,9007199254740992.0]"
+
+    def test_normalizes_python_types(self):
+        data = {
+            "id": UUID("5F0C2A4E-8D1B-4C3A-9E2F-1A2B3C4D5E6F"),
+            "color": Color.GREEN,
+            "at": datetime(2024, 5, 17, 9, 30, tzinfo=timezone(timedelta(hours=-3))),
+            "naive": datetime(2024, 5, 17, 12, 30),
+            "amount": Decimal("12.500"),
+            "raw": b"\x01\xff",
+            "pair": (1, 2),
+        }
+
+        assert json.loads(self.encode(data)) == {
+            "id": "5f0c2a4e-8d1b-4c3a-9e2f-1a2b3c4d5e6f",
+            "color": "verde",
+            "at": "2024-05-17T12:30:00Z",
+            "naive": "2024-05-17T12:30:00Z",
+            "amount": "12.5",
+            "raw": "0x01ff",
+            "pair": [1, 2],
+        }
+
+    @pytest.mark.parametrize("value", [float("nan"), float("inf"), Decimal("NaN")])
+    def test_rejects_non_finite_numbers(self, value):
+        with pytest.raises(ValueError):
+            self.encode({"value": value})
+
+    @pytest.mark.parametrize("data", [{1: "a"}, {"value": object()}])
+    def test_rejects_values_without_encoding(self, data):
+        with pytest.raises(TypeError):
+            self.encode(data)
+
+    def test_differs_from_legacy(self):
+        assert CanonicalEncoder.hash(CERTIFICATE, CanonicalEncoding.V2) != CanonicalEncoder.hash(CERTIFICATE)
@@ -0,0 +1,97 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+from web3 import AsyncWeb3
+
+from certificado_verde_blockchain.shared.errors import DomainException
+from certificado_verde_blockchain.shared.web3 import InProcessChain, in_process_chain
+
+from ..conftest import ADMIN_ADDRESS, ADMIN_PRIVATE_KEY
+
+# Creation code of a contract answering 42 to any call
+ANSWER_CONTRACT_BYTECODE = "0x600a600c600039600a6000f3602a60005260206000f3"
+
+
+@pytest.fixture
+def chain() -> InProcessChain:
+    return InProcessChain([ADMIN_PRIVATE_KEY])
+
+
+@pytest.fixture
+def artifact(tmp_path: Path) -> Path:
+    path = tmp_path / "Answer.json"
+    path.write_text(json.dumps({"abi": [], "bytecode": ANSWER_CONTRACT_BYTECODE}))
+    return path
+
+
+class TestInProcessChain:
+    async def test_configured_accounts_are_funded(self, chain: InProcessChain):
+        w3 = AsyncWeb3(chain.provider)
+
+        assert await w3.eth.get_balance(ADMIN_ADDRESS) == in_process_chain.ACCOUNT_BALANCE_WEI
+
+    async def test_contracts_are_deployed_from_their_artifact_and_answer_calls(
+        self, chain: InProcessChain, artifact: Path
+    ):
+        address = chain.deploy(str(artifact), ADMIN_PRIVATE_KEY)
+
+        w3 = AsyncWeb3(chain.provider)
+        # Without a sender the call runs as the first account
+        assert int.from_bytes(await w3.eth.call({"to": address, "data": "0x"}), "big") == 42
+
+    @pytest.mark.parametrize("bytecode", [None, "0x"])
+    def test_artifacts_without_bytecode_are_rejected(self, chain: InProcessChain, tmp_path: Path, bytecode: str):
+        path = tmp_path / "Interface.json"
+        path.write_text(json.dumps({"abi": [], "bytecode": bytecode}))
+
+        with pytest.raises(DomainException, match="compile the contracts first"):
+            chain.deploy(str(path), ADMIN_PRIVATE_KEY)
+
+    def test_transactions_are_mined_right_away(self, chain: InProcessChain, artifact: Path):
+        address = chain.deploy(str(artifact), ADMIN_PRIVATE_KEY)
+
+        receipt = chain.transact(ADMIN_PRIVATE_KEY, address, "0x01")
+
+        assert receipt["status"] == 1
+        assert receipt["to"] == address
+
+    def test_the_provider_is_shared(self, chain: InProcessChain):
+        assert chain.provider is chain.provider
+
+    def test_a_missing_eth_tester_is_reported(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setitem(sys.modules, "eth_tester", None)
+
+        with pytest.raises(DomainException, match="in-process"):
+            InProcessChain([])
+
+
+class TestInProcessAsyncProvider:
+    async def test_responses_are_in_json_rpc_format(self, chain: InProcessChain):
+        response = await chain.provider.make_request("eth_getBalance", [ADMIN_ADDRESS, "latest"])
+
+        assert response["jsonrpc"] == "2.0"
+        assert response["result"] == in_process_chain.ACCOUNT_BALANCE_WEI
+
+    async def test_batch_requests_are_answered_in_order(self, chain: InProcessChain):
+        chain_id = (await chain.provider.make_request("eth_chainId", []))["result"]
+
+        responses = await chain.provider.make_batch_request(
+            [("eth_chainId", []), ("eth_getBalance", [ADMIN_ADDRESS, "latest"])]
+        )
+
+        assert [response["result"] for response in responses] == [  # type: ignore[index]
+            chain_id,
+            in_process_chain.ACCOUNT_BALANCE_WEI,
+        ]
+
+    async def test_unknown_methods_are_json_rpc_errors(self, chain: InProcessChain):
+        response = await chain.provider.make_request("eth_unknownMethod", [])
+
+        assert "error" in response
+
+    async def test_the_provider_is_always_connected(self, chain: InProcessChain):
+        await chain.provider.connect()
+        assert await chain.provider.is_connected()
+        await chain.provider.disconnect()
@@ -0,0 +1,83 @@
+import pytest
+from eth_hash.auto import keccak
+
+from certificado_verde_blockchain.shared.merkle import MerkleTree
+
+
+def hashes(count: int) -> list:
+    return [f"{index:064x}" for index in range(1, count + 1)]
+
+
+def pair(left: bytes, right: bytes) -> bytes:
+    return keccak(min(left, right) + max(left, right))
+
+
+class TestRoot:
+    def test_single_leaf_is_its_own_root(self):
+        tree = MerkleTree.from_hashes(hashes(1))
+
+        assert tree.root == MerkleTree.leaf(hashes(1)[0])
+        assert tree.proof(0) == []
+
+    def test_pairs_are_hashed_in_sorted_order(self):
+        first, second = (MerkleTree.leaf(value) for value in hashes(2))
+
+        assert MerkleTree.from_hashes(hashes(2)).root == pair(first, second)
+        assert MerkleTree.from_hashes(reversed(hashes(2))).root == pair(first, second)
+
+    @pytest.mark.parametrize("count", [3, 5])
+    def test_last_leaf_of_an_odd_level_is_promoted_unchanged(self, count):
+        leaves = [MerkleTree.leaf(value) for value in hashes(count)]
+        level = leaves
+        while len(level) > 1:
+            level = [pair(*level[i : i + 2]) if i + 1 < len(level) else level[i] for i in range(0, len(level), 2)]
+
+        assert MerkleTree.from_hashes(hashes(count)).root == level[0]
+
+    def test_accepts_hashes_with_and_without_prefix(self):
+        assert (
+            MerkleTree.from_hashes(["0x" + value for value in hashes(3)]).root == MerkleTree.from_hashes(hashes(3)).root
+        )
+
+    def test_rejects_an_empty_tree(self):
+        with pytest.raises(ValueError):
+            MerkleTree([])
+
+    @pytest.mark.parametrize("certificate_hash", ["ab" * 31, "ab" * 33, "not hex"])
+    def test_rejects_hashes_that_are_not_32_bytes_of_hex(self, certificate_hash):
+        with pytest.raises(ValueError):
+            MerkleTree.leaf(certificate_hash)
+
+
+class TestProof:
+    @pytest.mark.parametrize("count", [1, 2, 3, 4, 5, 6, 7, 9, 17])
+    def test_every_leaf_is_proven_to_the_root(self, count):
+        tree = MerkleTree.from_hashes(hashes(count))
+
+        for index, value in enumerate(hashes(count)):
+            assert MerkleTree.verify(MerkleTree.leaf(value), tree.proof(index), tree.root)
+
+    def test_promoted_leaf_skips_the_levels_without_a_sibling(self):
+        tree = MerkleTree.from_hashes(hashes(5))
+
+        # Leaf 4 is promoted twice before meeting the root of the first four leaves
+        assert len(tree.proof(4)) == 1
+        assert len(tree.proof(0)) == 3
+
+    @pytest.mark.parametrize("count", [3, 7])
+    def test_proof_does_not_hold_for_another_leaf(self, count):
+        tree = MerkleTree.from_hashes(hashes(count))
+
+        assert not MerkleTree.verify(MerkleTree.leaf(hashes(count)[0]), tree.proof(count - 1), tree.root)
+
+    def test_tampered_proof_does_not_hold(self):
+        tree = MerkleTree.from_hashes(hashes(5))
+        proof = tree.proof(2)
+        proof[-1] = keccak(proof[-1])
+
+        assert not MerkleTree.verify(MerkleTree.leaf(hashes(5)[2]), proof, tree.root)
+
+    @pytest.mark.parametrize("index", [-1, 3])
+    def test_rejects_indexes_out_of_range(self, index):
+        with pytest.raises(IndexError):
+            MerkleTree.from_hashes(hashes(3)).proof(index)
@@ -0,0 +1,81 @@
+import base64
+import json
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from uuid import UUID, uuid4
+
+import pytest
+
+from certificado_verde_blockchain.shared.errors import DomainException
+from certificado_verde_blockchain.shared.models import MAX_PAGE_SIZE, PageRequest
+
+
+@dataclass
+class Item:
+    id: UUID
+    date: datetime = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def encode(payload) -> str:
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+
+
+class TestFromCursor:
+    @pytest.mark.parametrize("cursor", [None, ""])
+    def test_missing_cursor_starts_from_the_first_page(self, cursor):
+        assert PageRequest.from_cursor(cursor, limit=10) == PageRequest(limit=10)
+
+    def test_round_trips_the_cursor_of_the_next_page(self):
+        items = [Item(uuid4()) for _ in range(3)]
+
+        page, cursor = PageRequest(limit=2).page(items)
+
+        assert page == items[:2]
+        assert PageRequest.from_cursor(cursor, limit=2).after_id == items[1].id
+
+    def test_round_trips_the_date_and_id_of_lists_ordered_by_date(self):
+        start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        items = [Item(uuid4(), start + timedelta(days=index)) for index in range(3)]
+
+        _, cursor = PageRequest(limit=2).page(items, lambda item: item.date)
+
+        assert PageRequest.from_cursor(cursor, limit=2).after == (items[1].date, items[1].id)
+
+    def test_lists_ordered_by_id_have_no_date_position(self):
+        _, cursor = PageRequest(limit=1).page([Item(uuid4()), Item(uuid4())])
+
+        assert PageRequest.from_cursor(cursor).after is None
+
+    def test_last_page_has_no_cursor(self):
+        assert PageRequest(limit=2).page([Item(uuid4()), Item(uuid4())])[1] is None
+
+    @pytest.mark.parametrize(
+        "cursor",
+        [
+            "not base64!",
+            "a",
+            base64.urlsafe_b64encode(b"\xff\xfe").decode(),
+            base64.urlsafe_b64encode(b"not json").decode(),
+            encode([]),
+            encode("after"),
+            encode(7),
+            encode({}),
+            encode({"before": str(uuid4())}),
+            encode({"after": "not a uuid"}),
+            encode({"after": 7}),
+            encode({"after": None}),
+            encode({"after": [str(uuid4())]}),
+            encode({"after": str(uuid4()), "after_date": "not a date"}),
+            encode({"after": str(uuid4()), "after_date": 1767225600}),
+        ],
+    )
+    def test_rejects_cursors_it_did_not_issue(self, cursor):
+        with pytest.raises(DomainException) as error:
+            PageRequest.from_cursor(cursor)
+
+        assert error.value.code == 400
+
+    @pytest.mark.parametrize("limit", [0, MAX_PAGE_SIZE + 1])
+    def test_rejects_limits_out_of_range(self, limit):
+        with pytest.raises(ValueError):
+            PageRequest.from_cursor(None, limit=limit)
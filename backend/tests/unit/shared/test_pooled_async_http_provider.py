@@ -0,0 +1,85 @@
+from typing import Any, AsyncIterator, Set
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from certificado_verde_blockchain.shared.web3 import PooledAsyncHTTPProvider
+
+
+class JsonRpcNode:
+    """A node answering eth_blockNumber, remembering the client connections it served."""
+
+    def __init__(self) -> None:
+        self.connections: Set[Any] = set()
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.connections.add(request.transport.get_extra_info("peername"))
+        payload = await request.json()
+        if isinstance(payload, list):
+            return web.json_response([self.answer(item) for item in payload])
+        return web.json_response(self.answer(payload))
+
+    @staticmethod
+    def answer(item: Any) -> Any:
+        return {"jsonrpc": "2.0", "id": item["id"], "result": "0x2a"}
+
+
+@pytest.fixture
+def node() -> JsonRpcNode:
+    return JsonRpcNode()
+
+
+@pytest.fixture
+async def server(node: JsonRpcNode) -> AsyncIterator[TestServer]:
+    app = web.Application()
+    app.router.add_post("/", node.handle)
+    server = TestServer(app)
+    await server.start_server()
+    yield server
+    await server.close()
+
+
+@pytest.fixture
+async def provider(server: TestServer) -> AsyncIterator[PooledAsyncHTTPProvider]:
+    provider = PooledAsyncHTTPProvider(str(server.make_url("/")), pool_size=2, keepalive_seconds=30, timeout_seconds=5)
+    yield provider
+    await provider.disconnect()
+
+
+class TestPooledAsyncHTTPProvider:
+    async def test_requests_reuse_a_kept_alive_connection(self, provider: PooledAsyncHTTPProvider, node: JsonRpcNode):
+        for _ in range(3):
+            response = await provider.make_request("eth_blockNumber", [])
+            assert response["result"] == "0x2a"
+
+        assert len(node.connections) == 1
+
+    async def test_round_trips_and_calls_are_counted(self, provider: PooledAsyncHTTPProvider):
+        await provider.make_request("eth_blockNumber", [])
+        responses = await provider.make_batch_request([("eth_blockNumber", []), ("eth_blockNumber", [])])
+
+        assert [response["result"] for response in responses] == ["0x2a", "0x2a"]  # type: ignore[index]
+        assert provider.http_requests == 2
+        assert provider.rpc_calls == 3
+
+    async def test_connect_opens_the_session_of_the_running_loop(self, provider: PooledAsyncHTTPProvider):
+        await provider.connect()
+        session = provider._session
+
+        await provider.make_request("eth_blockNumber", [])
+
+        assert session is not None and not session.closed
+        assert provider._session is session
+        assert session.connector.limit == 2
+
+    async def test_disconnect_closes_the_session(self, provider: PooledAsyncHTTPProvider):
+        await provider.connect()
+        session = provider._session
+
+        await provider.disconnect()
+
+        assert session is not None and session.closed
+        assert provider._session is None
+        await provider.make_request("eth_blockNumber", [])
+        assert provider._session is not session
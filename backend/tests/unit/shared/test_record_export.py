@@ -0,0 +1,114 @@
+import csv
+import io
+import json
+from typing import Any, AsyncIterator, Dict, List, Optional, TypedDict
+
+import pytest
+from pydantic import BaseModel
+
+from certificado_verde_blockchain.shared.enums import ExportFormat
+from certificado_verde_blockchain.shared.http import export_response, record_columns, record_export
+
+
+class Coordinates(BaseModel):
+    latitude: float
+    longitude: float
+
+
+class Origin(BaseModel):
+    country: str
+    coordinates: Coordinates
+
+
+class Point(TypedDict):
+    latitude: float
+    longitude: float
+
+
+class Position(TypedDict):
+    label: str
+    point: Optional[Point]
+
+
+class Lot(BaseModel):
+    name: str
+    origin: Optional[Origin]
+    tags: List[str]
+    metadata: Optional[Dict[str, Any]]
+
+
+LOT = {
+    "name": "Soja",
+    "origin": {"country": "Brasil", "coordinates": {"latitude": -12.6, "longitude": -55.7}},
+    "tags": ["soja", "safra"],
+    "metadata": {"organic": True, "lots": [{"id": 1}]},
+}
+
+
+async def records(*items: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+    for item in items:
+        yield item
+
+
+async def body_chunks(export_format: ExportFormat, *items: Dict[str, Any]) -> List[str]:
+    response = export_response(records(*items), export_format, "lots", record_columns(Lot))
+    return [chunk async for chunk in response.body_iterator]
+
+
+class TestRecordColumns:
+    def test_nested_models_and_typed_dicts_spread_over_dotted_columns(self):
+        assert record_columns(Lot) == [
+            "name",
+            "origin.country",
+            "origin.coordinates.latitude",
+            "origin.coordinates.longitude",
+            "tags",
+            "metadata",
+        ]
+
+    def test_typed_dicts_have_columns_too(self):
+        assert record_columns(Position, "position.") == [
+            "position.label",
+            "position.point.latitude",
+            "position.point.longitude",
+        ]
+
+
+class TestExportResponse:
+    async def test_ndjson_writes_one_document_per_line(self):
+        response = export_response(records(LOT, LOT), ExportFormat.NDJSON, "lots", record_columns(Lot))
+
+        body = "".join([chunk async for chunk in response.body_iterator])
+
+        assert response.media_type == "application/x-ndjson"
+        assert response.headers["content-disposition"] == 'attachment; filename="lots.ndjson"'
+        assert [json.loads(line) for line in body.splitlines()] == [LOT, LOT]
+
+    async def test_csv_flattens_nested_records_and_joins_lists(self):
+        body = "".join(await body_chunks(ExportFormat.CSV, LOT, {**LOT, "origin": None, "metadata": None}))
+
+        rows = list(csv.DictReader(io.StringIO(body)))
+        assert rows[0] == {
+            "name": "Soja",
+            "origin.country": "Brasil",
+            "origin.coordinates.latitude": "-12.6",
+            "origin.coordinates.longitude": "-55.7",
+            "tags": "soja;safra",
+            "metadata": json.dumps(LOT["metadata"]),
+        }
+        assert rows[1]["origin.country"] == ""
+        assert rows[1]["metadata"] == ""
+
+    async def test_lists_of_records_are_kept_whole_as_json(self):
+        body = "".join(await body_chunks(ExportFormat.CSV, {**LOT, "tags": [{"id": 1}]}))
+
+        assert next(csv.DictReader(io.StringIO(body)))["tags"] == '[{"id": 1}]'
+
+    async def test_records_are_sent_in_buffered_chunks(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(record_export, "EXPORT_BUFFER_SIZE", 200)
+
+        chunks = await body_chunks(ExportFormat.NDJSON, *([LOT] * 5))
+
+        line = json.dumps(LOT) + "\n"
+        assert len(line) < 200 <= 2 * len(line)
+        assert chunks == [line * 2, line * 2, line]
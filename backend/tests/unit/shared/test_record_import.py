@@ -0,0 +1,93 @@
+import codecs
+from typing import Any, AsyncIterator, Dict, List, Tuple, Union
+
+import pytest
+from fastapi import Request
+
+from certificado_verde_blockchain.products.application import RegisterProductCommand
+from certificado_verde_blockchain.shared.enums import ExportFormat
+from certificado_verde_blockchain.shared.errors import DomainException
+from certificado_verde_blockchain.shared.http import export_response, read_records, record_columns
+
+PRODUCT = {
+    "name": "Soja",
+    "description": None,
+    "category": "GRAIN",
+    "quantity": {"value": 1200.5, "unit": "KG"},
+    "origin": {
+        "country": "Brasil",
+        "state": "MT",
+        "city": None,
+        "coordinates": {"latitude": -12.6, "longitude": -55.7},
+    },
+    "lot_number": "L-42",
+    "carbon_emission": None,
+    "metadata": {"organic": True, "harvest": "2026"},
+    "tags": ["soja", "safra"],
+}
+
+
+def upload(content_type: str, *chunks: bytes) -> Request:
+    """A request whose body arrives in the given chunks."""
+    messages = [{"type": "http.request", "body": chunk, "more_body": True} for chunk in chunks]
+    messages.append({"type": "http.request", "body": b"", "more_body": False})
+
+    async def receive() -> Dict[str, Any]:
+        return messages.pop(0)
+
+    headers = [(b"content-type", content_type.encode())] if content_type else []
+    return Request({"type": "http", "method": "POST", "headers": headers}, receive)
+
+
+async def read_all(request: Request) -> List[Tuple[int, Union[str, Dict[str, Any]]]]:
+    return [row async for row in read_records(request, RegisterProductCommand)]
+
+
+async def exported_csv(records: List[Dict[str, Any]]) -> bytes:
+    async def each() -> AsyncIterator[Dict[str, Any]]:
+        for record in records:
+            yield record
+
+    response = export_response(each(), ExportFormat.CSV, "products", record_columns(RegisterProductCommand))
+    return b"".join([chunk.encode() async for chunk in response.body_iterator])
+
+
+class TestReadRecords:
+    async def test_ndjson_rows_are_left_as_documents_with_their_line(self):
+        request = upload("application/x-ndjson; charset=utf-8", b'{"name": "a"}\n\n{"na', b'me": "b"}\n')
+
+        assert await read_all(request) == [(1, '{"name": "a"}\n'), (3, '{"name": "b"}\n')]
+
+    async def test_csv_rows_are_read_back_into_the_exported_documents(self):
+        body = await exported_csv([PRODUCT, {**PRODUCT, "name": "Milho", "tags": None, "metadata": None}])
+
+        rows = await read_all(upload("text/csv", body))
+
+        assert [line for line, _ in rows] == [2, 3]
+        assert [RegisterProductCommand.model_validate(row) for _, row in rows] == [
+            RegisterProductCommand.model_validate(PRODUCT),
+            RegisterProductCommand.model_validate({**PRODUCT, "name": "Milho", "tags": None, "metadata": None}),
+        ]
+
+    async def test_csv_uploads_may_start_with_a_byte_order_mark(self):
+        rows = await read_all(upload("text/csv", codecs.BOM_UTF8 + b"name,tags\nSoja,a;b\n"))
+
+        assert rows == [(2, {"name": "Soja", "tags": ["a", "b"]})]
+
+    async def test_csv_cells_beyond_the_header_are_ignored_and_invalid_json_is_left_for_validation(self):
+        rows = await read_all(upload("text/csv", b"name,metadata\nSoja,{oops,extra\n"))
+
+        assert rows == [(2, {"name": "Soja", "metadata": "{oops"})]
+
+    @pytest.mark.parametrize("content_type", ["application/json", "text/plain", ""])
+    async def test_other_content_types_are_unsupported(self, content_type: str):
+        with pytest.raises(DomainException) as error:
+            await read_all(upload(content_type, b"{}"))
+
+        assert error.value.code == 415
+
+    async def test_uploads_that_are_not_utf8_are_rejected(self):
+        with pytest.raises(DomainException) as error:
+            await read_all(upload("text/csv", "name\nSão Paulo\n".encode("latin-1")))
+
+        assert error.value.code == 400
@@ -0,0 +1,148 @@
+import asyncio
+from typing import Any, List, Tuple
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from certificado_verde_blockchain.shared.web3 import RequestBatchingMiddleware, hedged_reads
+
+
+def answer(method: str, params: Any) -> Any:
+    return {"jsonrpc": "2.0", "id": 1, "result": [method, params]}
+
+
+@pytest.fixture
+def make_request() -> AsyncMock:
+    async def make_request(method: str, params: Any) -> Any:
+        return answer(method, params)
+
+    return AsyncMock(side_effect=make_request)
+
+
+@pytest.fixture
+def w3() -> MagicMock:
+    async def make_batch_request(requests: List[Tuple[str, Any]]) -> Any:
+        return [answer(method, params) for method, params in requests]
+
+    w3 = MagicMock()
+    w3.provider.make_batch_request = AsyncMock(side_effect=make_batch_request)
+    return w3
+
+
+async def wrap(middleware: RequestBatchingMiddleware, make_request: AsyncMock) -> Any:
+    return await middleware.async_wrap_make_request(make_request)
+
+
+class TestRequestBatchingMiddleware:
+    async def test_concurrent_requests_share_one_batch_and_get_their_own_response(
+        self, w3: MagicMock, make_request: AsyncMock
+    ):
+        send = await wrap(RequestBatchingMiddleware(w3), make_request)
+
+        responses = await asyncio.gather(send("eth_call", [1]), send("eth_getBalance", [2]), send("eth_call", [3]))
+
+        assert [response["result"] for response in responses] == [
+            ["eth_call", [1]],
+            ["eth_getBalance", [2]],
+            ["eth_call", [3]],
+        ]
+        w3.provider.make_batch_request.assert_awaited_once_with(
+            [("eth_call", [1]), ("eth_getBalance", [2]), ("eth_call", [3])]
+        )
+        make_request.assert_not_awaited()
+
+    async def test_a_lone_request_is_sent_as_a_plain_request(self, w3: MagicMock, make_request: AsyncMock):
+        send = await wrap(RequestBatchingMiddleware(w3), make_request)
+
+        response = await send("eth_chainId", [])
+
+        assert response["result"] == ["eth_chainId", []]
+        make_request.assert_awaited_once_with("eth_chainId", [])
+        w3.provider.make_batch_request.assert_not_awaited()
+
+    async def test_batches_are_split_at_the_maximum_size(self, w3: MagicMock, make_request: AsyncMock):
+        send = await wrap(RequestBatchingMiddleware(w3, max_size=2), make_request)
+
+        responses = await asyncio.gather(*(send("eth_call", [index]) for index in range(5)))
+
+        assert [response["result"][1] for response in responses] == [[0], [1], [2], [3], [4]]
+        assert [len(call.args[0]) for call in w3.provider.make_batch_request.await_args_list] == [2, 2]
+        make_request.assert_awaited_once_with("eth_call", [4])
+
+    async def test_requests_within_the_window_are_batched(self, w3: MagicMock, make_request: AsyncMock):
+        send = await wrap(RequestBatchingMiddleware.build(window_ms=20, max_size=10)(w3), make_request)
+
+        async def later() -> Any:
+            await asyncio.sleep(0.005)
+            return await send("eth_call", [2])
+
+        await asyncio.gather(send("eth_call", [1]), later())
+
+        w3.provider.make_batch_request.assert_awaited_once_with([("eth_call", [1]), ("eth_call", [2])])
+
+    @pytest.mark.parametrize("max_size", [1, 0])
+    async def test_a_maximum_size_of_one_disables_batching(self, w3: MagicMock, make_request: AsyncMock, max_size: int):
+        send = await wrap(RequestBatchingMiddleware(w3, max_size=max_size), make_request)
+
+        await asyncio.gather(send("eth_call", [1]), send("eth_call", [2]))
+
+        assert make_request.await_count == 2
+        w3.provider.make_batch_request.assert_not_awaited()
+
+    async def test_sends_and_reads_with_their_own_routing_are_not_batched(self, w3: MagicMock, make_request: AsyncMock):
+        send = await wrap(RequestBatchingMiddleware(w3), make_request)
+
+        async def hedged() -> Any:
+            with hedged_reads():
+                return await send("eth_call", [2])
+
+        await asyncio.gather(
+            send("eth_sendRawTransaction", ["0x01"]), hedged(), send("eth_sendRawTransaction", ["0x02"])
+        )
+
+        assert make_request.await_count == 3
+        w3.provider.make_batch_request.assert_not_awaited()
+
+    async def test_a_rejected_batch_is_the_answer_of_every_request(self, w3: MagicMock, make_request: AsyncMock):
+        rejection = {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "batch too large"}}
+        w3.provider.make_batch_request = AsyncMock(return_value=rejection)
+        send = await wrap(RequestBatchingMiddleware(w3), make_request)
+
+        responses = await asyncio.gather(send("eth_call", [1]), send("eth_call", [2]))
+
+        assert responses == [rejection, rejection]
+
+    async def test_a_failed_batch_fails_every_request(self, w3: MagicMock, make_request: AsyncMock):
+        w3.provider.make_batch_request = AsyncMock(side_effect=OSError("connection reset"))
+        send = await wrap(RequestBatchingMiddleware(w3), make_request)
+
+        results = await asyncio.gather(send("eth_call", [1]), send("eth_call", [2]), return_exceptions=True)
+
+        assert [type(result) for result in results] == [OSError, OSError]
+
+    async def test_a_batch_answered_with_missing_responses_fails(self, w3: MagicMock, make_request: AsyncMock):
+        w3.provider.make_batch_request = AsyncMock(return_value=[answer("eth_call", [1])])
+        send = await wrap(RequestBatchingMiddleware(w3), make_request)
+
+        results = await asyncio.gather(send("eth_call", [1]), send("eth_call", [2]), return_exceptions=True)
+
+        assert all(isinstance(result, ValueError) for result in results)
+        assert str(results[0]) == "Batch of 2 requests got 1 responses."
+
+    async def test_a_cancelled_batch_cancels_its_requests(self, w3: MagicMock, make_request: AsyncMock):
+        sent = asyncio.Event()
+
+        async def never_answered(requests: List[Tuple[str, Any]]) -> Any:
+            sent.set()
+            await asyncio.sleep(10)
+
+        w3.provider.make_batch_request = AsyncMock(side_effect=never_answered)
+        middleware = RequestBatchingMiddleware(w3)
+        send = await wrap(middleware, make_request)
+
+        requests = asyncio.gather(send("eth_call", [1]), send("eth_call", [2]), return_exceptions=True)
+        await sent.wait()
+        for task in list(middleware._sending):
+            task.cancel()
+
+        assert [type(result) for result in await requests] == [asyncio.CancelledError, asyncio.CancelledError]
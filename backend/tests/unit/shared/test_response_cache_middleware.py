@@ -0,0 +1,178 @@
+import asyncio
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from certificado_verde_blockchain.shared.web3 import ResponseCacheMiddleware, response_cache_middleware
+
+RECEIPT_HASH = "0x" + "ab" * 32
+
+
+class FakeNode:
+    """Answers with the head for eth_blockNumber and with the number of calls made for anything else."""
+
+    def __init__(self, head: int = 100) -> None:
+        self.head = head
+        self.calls: List[str] = []
+        self.responses: Dict[str, Any] = {}
+
+    async def make_request(self, method: str, params: Any) -> Any:
+        self.calls.append(method)
+        if method == "eth_blockNumber":
+            return {"jsonrpc": "2.0", "id": 1, "result": hex(self.head)}
+        if method in self.responses:
+            return self.responses[method]
+        return {"jsonrpc": "2.0", "id": 1, "result": {"call": len(self.calls)}}
+
+    def receipt(self, block_number: Any) -> None:
+        self.responses["eth_getTransactionReceipt"] = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "result": {"transactionHash": RECEIPT_HASH, "blockNumber": block_number},
+        }
+
+
+@pytest.fixture
+def node() -> FakeNode:
+    return FakeNode()
+
+
+@pytest.fixture(autouse=True)
+def no_head_refresh_interval(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(response_cache_middleware, "HEAD_REFRESH_SECONDS", 0)
+
+
+async def wrap(node: FakeNode, max_entries: int = 10, confirmations: int = 12) -> Any:
+    middleware = ResponseCacheMiddleware.build(max_entries, confirmations)(MagicMock())
+    return await middleware.async_wrap_make_request(node.make_request)
+
+
+class TestResponseCacheMiddleware:
+    async def test_immutable_responses_are_cached_as_soon_as_seen(self, node: FakeNode):
+        send = await wrap(node)
+
+        first = await send("eth_chainId", [])
+        first["result"]["call"] = "changed by the caller"
+        second = await send("eth_chainId", [])
+
+        assert second == {"jsonrpc": "2.0", "id": 0, "result": {"call": 1}}
+        assert node.calls == ["eth_chainId"]
+
+    async def test_calls_at_a_tag_are_never_cached(self, node: FakeNode):
+        send = await wrap(node)
+
+        await send("eth_call", [{"to": "0x01"}, "latest"])
+        await send("eth_call", [{"to": "0x01"}, "latest"])
+        await send("eth_call", [{"to": "0x01"}])
+
+        assert node.calls == ["eth_call"] * 3
+
+    async def test_calls_at_a_confirmed_block_are_cached(self, node: FakeNode):
+        send = await wrap(node)
+
+        await send("eth_blockNumber", [])
+        first = await send("eth_call", [{"data": b"\x01\x02"}, "0x58"])
+        second = await send("eth_call", [{"data": b"\x01\x02"}, "0x58"])
+
+        # 0x58 (88) is below the head (100) by the 12 confirmations
+        assert second["result"] == first["result"] == {"call": 2}
+        assert node.calls == ["eth_blockNumber", "eth_call"]
+
+    async def test_responses_too_close_to_the_head_fetch_a_fresh_head(self, node: FakeNode):
+        send = await wrap(node)
+
+        await send("eth_blockNumber", [])
+        node.head = 110
+        node.receipt("0x60")  # 96: unconfirmed at 100, confirmed at 110
+        await send("eth_getTransactionReceipt", [RECEIPT_HASH])
+        await send("eth_getTransactionReceipt", [RECEIPT_HASH])
+
+        assert node.calls == ["eth_blockNumber", "eth_getTransactionReceipt", "eth_blockNumber"]
+
+    async def test_unconfirmed_responses_are_not_cached(self, node: FakeNode):
+        send = await wrap(node)
+
+        await send("eth_getBlockByNumber", ["0x60", False])
+        await send("eth_getBlockByNumber", ["0x60", False])
+
+        assert node.calls == ["eth_getBlockByNumber", "eth_blockNumber"] * 2
+
+    async def test_the_head_is_fetched_at_most_once_per_interval(self, node: FakeNode, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(response_cache_middleware, "HEAD_REFRESH_SECONDS", 60)
+        send = await wrap(node)
+
+        await send("eth_getBlockByNumber", ["0x60", False])
+        await send("eth_getBlockByNumber", ["0x60", False])
+
+        assert node.calls == ["eth_getBlockByNumber", "eth_blockNumber", "eth_getBlockByNumber"]
+
+    async def test_concurrent_responses_share_one_head_request(self, node: FakeNode):
+        send = await wrap(node)
+
+        await asyncio.gather(*(send("eth_getBlockByNumber", [hex(number), False]) for number in (80, 81, 82)))
+
+        assert node.calls.count("eth_blockNumber") == 1
+        await send("eth_getBlockByNumber", ["0x50", False])
+        assert node.calls.count("eth_getBlockByNumber") == 3
+
+    async def test_not_knowing_the_head_only_skips_the_cache(self):
+        make_request = AsyncMock(
+            side_effect=[{"jsonrpc": "2.0", "id": 1, "result": {"number": "0x10"}}, OSError("connection reset")]
+        )
+        middleware = ResponseCacheMiddleware(MagicMock())
+        send = await middleware.async_wrap_make_request(make_request)
+
+        response = await send("eth_getBlockByNumber", ["0x10", False])
+
+        assert response["result"] == {"number": "0x10"}
+        assert not middleware._entries
+
+    @pytest.mark.parametrize(
+        "response",
+        [
+            {"jsonrpc": "2.0", "id": 1, "error": {"code": -32000, "message": "missing trie node"}},
+            {"jsonrpc": "2.0", "id": 1, "result": None},
+        ],
+    )
+    async def test_errors_and_empty_answers_are_not_cached(self, node: FakeNode, response: Dict[str, Any]):
+        node.responses["eth_getTransactionByHash"] = response
+        send = await wrap(node)
+
+        await send("eth_getTransactionByHash", [RECEIPT_HASH])
+        await send("eth_getTransactionByHash", [RECEIPT_HASH])
+
+        assert node.calls == ["eth_getTransactionByHash"] * 2
+
+    async def test_pending_transactions_are_not_cached(self, node: FakeNode):
+        node.receipt(None)
+        send = await wrap(node)
+
+        await send("eth_getTransactionReceipt", [RECEIPT_HASH])
+        await send("eth_getTransactionReceipt", [RECEIPT_HASH])
+
+        assert node.calls == ["eth_getTransactionReceipt"] * 2
+
+    async def test_the_least_recently_used_response_is_evicted(self, node: FakeNode):
+        send = await wrap(node, max_entries=2)
+
+        for block_hash in ["0x01", "0x02", "0x01", "0x03", "0x01", "0x02"]:
+            await send("eth_getBlockByHash", [block_hash, False])
+
+        assert node.calls == ["eth_getBlockByHash"] * 4
+
+    async def test_a_size_of_zero_disables_the_cache(self, node: FakeNode):
+        send = await wrap(node, max_entries=0)
+
+        await send("eth_chainId", [])
+        await send("eth_chainId", [])
+
+        assert node.calls == ["eth_chainId"] * 2
+
+    async def test_methods_that_can_change_are_never_cached(self, node: FakeNode):
+        send = await wrap(node)
+
+        await send("eth_getBalance", ["0x01", "0x10"])
+        await send("eth_getBalance", ["0x01", "0x10"])
+
+        assert node.calls == ["eth_getBalance"] * 2
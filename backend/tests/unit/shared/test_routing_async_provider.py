@@ -0,0 +1,411 @@
+import asyncio
+from typing import Any, List, Optional, Tuple
+
+import pytest
+from aiohttp import ClientError
+
+from certificado_verde_blockchain.shared.web3 import (
+    PooledAsyncHTTPProvider,
+    RoutingAsyncProvider,
+    hedged_reads,
+    pinned_reads,
+    read_routing,
+)
+
+
+class FakeProvider:
+    """A node answering every method with its own URL, after an optional delay or with an error."""
+
+    def __init__(self, url: str, block_number: int = 100) -> None:
+        self.endpoint_uri = url
+        self.block_number = block_number
+        self.delay = 0.0
+        self.error: Optional[BaseException] = None
+        self.requests: List[Tuple[str, Any]] = []
+        self.routings: List[Optional[str]] = []
+        self.http_requests = 0
+        self.rpc_calls = 0
+        self.connected = True
+        self.disconnected = False
+
+    async def make_request(self, method: str, params: Any) -> Any:
+        self.requests.append((method, params))
+        self.routings.append(read_routing())
+        self.http_requests += 1
+        self.rpc_calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        if method == "eth_blockNumber":
+            return {"jsonrpc": "2.0", "id": 1, "result": hex(self.block_number)}
+        return {"jsonrpc": "2.0", "id": 1, "result": self.endpoint_uri}
+
+    async def make_batch_request(self, requests: List[Tuple[str, Any]]) -> Any:
+        self.requests.extend(requests)
+        self.http_requests += 1
+        self.rpc_calls += len(requests)
+        if self.error is not None:
+            raise self.error
+        return [{"jsonrpc": "2.0", "id": index, "result": self.endpoint_uri} for index, _ in enumerate(requests)]
+
+    async def is_connected(self, show_traceback: bool = False) -> bool:
+        return self.connected
+
+    async def connect(self) -> None:
+        self.connected = True
+
+    async def disconnect(self) -> None:
+        self.disconnected = True
+
+    def methods(self) -> List[str]:
+        return [method for method, _ in self.requests if method != "eth_blockNumber"]
+
+
+@pytest.fixture
+def nodes() -> List[FakeProvider]:
+    return [FakeProvider("http://a"), FakeProvider("http://b"), FakeProvider("http://c")]
+
+
+@pytest.fixture
+def router(nodes: List[FakeProvider], monkeypatch: pytest.MonkeyPatch) -> RoutingAsyncProvider:
+    router = RoutingAsyncProvider(nodes, max_block_lag=3, hedge_delay_ms=20)  # type: ignore[arg-type]
+    # The routing tests set the health of the endpoints themselves
+    monkeypatch.setattr(router, "_schedule_health_check", lambda: None)
+    return router
+
+
+def answered_by(response: Any) -> str:
+    return response["result"]
+
+
+class TestReads:
+    async def test_reads_go_to_the_endpoint_with_the_lowest_latency(self, router: RoutingAsyncProvider):
+        for endpoint, latency in zip(router.endpoints, [0.3, 0.1, 0.2]):
+            endpoint.latency = latency
+
+        assert answered_by(await router.make_request("eth_call", [])) == "http://b"
+
+    async def test_endpoints_never_measured_are_tried_first(self, router: RoutingAsyncProvider):
+        router.endpoints[0].latency = 0.1
+        router.endpoints[1].latency = 0.2
+
+        assert answered_by(await router.make_request("eth_getLogs", [])) == "http://c"
+        assert router.endpoints[2].latency is not None
+
+    async def test_endpoints_behind_the_highest_head_are_avoided(self, router: RoutingAsyncProvider):
+        for endpoint, latency, block_number in zip(router.endpoints, [0.1, 0.2, 0.3], [90, 99, 100]):
+            endpoint.latency = latency
+            endpoint.block_number = block_number
+
+        # 10 blocks behind: out of sync, 1 block behind: within max_block_lag
+        assert answered_by(await router.make_request("eth_call", [])) == "http://b"
+
+    async def test_a_transport_failure_fails_over_and_marks_the_endpoint_unhealthy(
+        self, router: RoutingAsyncProvider, nodes: List[FakeProvider]
+    ):
+        nodes[0].error = ClientError("connection reset")
+
+        assert answered_by(await router.make_request("eth_call", [])) == "http://b"
+        assert not router.endpoints[0].healthy
+
+        # The unhealthy endpoint goes last until it answers again
+        nodes[0].error = None
+        assert answered_by(await router.make_request("eth_call", [])) != "http://a"
+
+    async def test_other_errors_are_raised_without_trying_another_endpoint(
+        self, router: RoutingAsyncProvider, nodes: List[FakeProvider]
+    ):
+        nodes[0].error = ValueError("bad params")
+
+        with pytest.raises(ValueError):
+            await router.make_request("eth_call", [])
+
+        assert router.endpoints[0].healthy
+        assert not nodes[1].requests
+
+    async def test_when_every_endpoint_fails_the_last_error_is_raised(
+        self, router: RoutingAsyncProvider, nodes: List[FakeProvider]
+    ):
+        for node in nodes:
+            node.error = asyncio.TimeoutError()
+        nodes[2].error = OSError("unreachable")
+
+        with pytest.raises(OSError):
+            await router.make_request("eth_call", [])
+
+        assert [len(node.requests) for node in nodes] == [1, 1, 1]
+        assert not any(endpoint.healthy for endpoint in router.endpoints)
+
+    async def test_reads_under_pinned_reads_go_to_the_write_endpoint(self, router: RoutingAsyncProvider):
+        router.endpoints[0].latency = 1.0
+        router.endpoints[1].latency = 0.1
+        router.endpoints[2].latency = 0.1
+
+        with pinned_reads():
+            assert answered_by(await router.make_request("eth_call", [])) == "http://a"
+
+        assert answered_by(await router.make_request("eth_call", [])) != "http://a"
+
+
+class TestWrites:
+    async def test_writes_are_pinned_to_the_first_endpoint(
+        self, router: RoutingAsyncProvider, nodes: List[FakeProvider]
+    ):
+        router.endpoints[0].latency = 1.0
+
+        for method in ["eth_sendRawTransaction", "eth_getTransactionCount", "eth_getTransactionReceipt"]:
+            assert answered_by(await router.make_request(method, [])) == "http://a"
+
+        assert router.write_endpoint is router.endpoints[0]
+        assert not nodes[1].requests
+
+    async def test_the_pin_moves_on_failure_and_stays_on_the_new_endpoint(
+        self, router: RoutingAsyncProvider, nodes: List[FakeProvider]
+    ):
+        nodes[0].error = ClientError("connection refused")
+
+        assert answered_by(await router.make_request("eth_sendRawTransaction", [])) == "http://b"
+        assert router.write_endpoint is router.endpoints[1]
+
+        nodes[0].error = None
+        router.endpoints[0].healthy = True
+        assert answered_by(await router.make_request("eth_getTransactionCount", [])) == "http://b"
+
+    async def test_an_unhealthy_pin_moves_to_the_first_healthy_endpoint_before_sending(
+        self, router: RoutingAsyncProvider, nodes: List[FakeProvider]
+    ):
+        router.endpoints[0].healthy = False
+        router.endpoints[1].healthy = False
+
+        assert answered_by(await router.make_request("eth_sendRawTransaction", [])) == "http://c"
+        assert not nodes[0].requests
+
+    async def test_with_every_endpoint_unhealthy_the_pin_is_still_tried(
+        self, router: RoutingAsyncProvider, nodes: List[FakeProvider]
+    ):
+        for endpoint in router.endpoints:
+            endpoint.healthy = False
+
+        assert answered_by(await router.make_request("eth_sendRawTransaction", [])) == "http://a"
+        assert router.endpoints[0].healthy
+
+
+class TestHedgedReads:
+    async def test_a_slow_endpoint_is_hedged_with_the_next_one(
+        self, router: RoutingAsyncProvider, nodes: List[FakeProvider]
+    ):
+        router.endpoints[0].latency = 0.01
+        router.endpoints[1].latency = 0.02
+        router.endpoints[2].latency = 0.03
+        nodes[0].delay = 5
+
+        with hedged_reads():
+            assert answered_by(await router.make_request("eth_call", [])) == "http://b"
+
+        assert nodes[0].methods() == ["eth_call"]
+        assert not nodes[2].requests
+
+    async def test_a_fast_answer_is_not_hedged(self, router: RoutingAsyncProvider, nodes: List[FakeProvider]):
+        with hedged_reads():
+            assert answered_by(await router.make_request("eth_call", [])) == "http://a"
+
+        assert not nodes[1].requests
+
+    async def test_a_transport_failure_moves_on_to_the_next_endpoint(
+        self, router: RoutingAsyncProvider, nodes: List[FakeProvider]
+    ):
+        nodes[0].error = ClientError("connection reset")
+
+        with hedged_reads():
+            assert answered_by(await router.make_request("eth_call", [])) == "http://b"
+
+        assert not router.endpoints[0].healthy
+
+    async def test_other_errors_are_raised(self, router: RoutingAsyncProvider, nodes: List[FakeProvider]):
+        nodes[0].error = ValueError("bad params")
+
+        with hedged_reads(), pytest.raises(ValueError):
+            await router.make_request("eth_call", [])
+
+    async def test_the_slow_attempts_are_awaited_when_every_endpoint_was_hedged(
+        self, router: RoutingAsyncProvider, nodes: List[FakeProvider]
+    ):
+        for node in nodes:
+            node.delay = 0.05
+        nodes[0].error = ClientError("connection reset")
+
+        with hedged_reads():
+            assert answered_by(await router.make_request("eth_call", [])) == "http://b"
+
+    async def test_when_every_hedged_attempt_fails_the_error_is_raised(
+        self, router: RoutingAsyncProvider, nodes: List[FakeProvider]
+    ):
+        for node in nodes:
+            node.delay = 0.05
+            node.error = asyncio.TimeoutError()
+
+        with hedged_reads(), pytest.raises(asyncio.TimeoutError):
+            await router.make_request("eth_call", [])
+
+    async def test_writes_are_never_hedged(self, router: RoutingAsyncProvider, nodes: List[FakeProvider]):
+        nodes[0].delay = 0.05
+
+        with hedged_reads():
+            assert answered_by(await router.make_request("eth_sendRawTransaction", [])) == "http://a"
+
+        assert not nodes[1].requests
+
+
+class TestBatches:
+    async def test_batches_of_reads_are_routed_like_reads(self, router: RoutingAsyncProvider):
+        router.endpoints[0].latency = 0.5
+        router.endpoints[1].latency = 0.1
+        router.endpoints[2].latency = 0.2
+
+        responses = await router.make_batch_request([("eth_call", []), ("eth_getBalance", [])])
+
+        assert [answered_by(response) for response in responses] == ["http://b", "http://b"]  # type: ignore[union-attr]
+
+    async def test_batches_with_a_write_are_pinned(self, router: RoutingAsyncProvider):
+        router.endpoints[0].latency = 0.5
+        router.endpoints[1].latency = 0.1
+
+        responses = await router.make_batch_request([("eth_call", []), ("eth_getTransactionCount", [])])
+
+        assert answered_by(responses[0]) == "http://a"  # type: ignore[index]
+
+    async def test_batches_under_pinned_reads_are_pinned(self, router: RoutingAsyncProvider, nodes: List[FakeProvider]):
+        router.endpoints[0].latency = 0.5
+
+        with pinned_reads():
+            await router.make_batch_request([("eth_call", [])])
+
+        assert nodes[0].methods() == ["eth_call"]
+
+    async def test_counters_add_up_the_endpoints(self, router: RoutingAsyncProvider):
+        await router.make_batch_request([("eth_call", []), ("eth_call", [])])
+        await router.make_request("eth_sendRawTransaction", [])
+
+        assert router.http_requests == 2
+        assert router.rpc_calls == 3
+
+
+class TestHealthChecks:
+    @pytest.fixture
+    def router(self, nodes: List[FakeProvider]) -> RoutingAsyncProvider:
+        return RoutingAsyncProvider(nodes, health_interval_seconds=60)  # type: ignore[arg-type]
+
+    async def test_probes_record_the_head_and_latency_of_every_endpoint(
+        self, router: RoutingAsyncProvider, nodes: List[FakeProvider]
+    ):
+        nodes[1].block_number = 98
+
+        await router.make_request("eth_sendRawTransaction", [])
+        await router._health_check  # type: ignore[misc]
+
+        assert [endpoint.block_number for endpoint in router.endpoints] == [100, 98, 100]
+        assert all(endpoint.latency is not None for endpoint in router.endpoints)
+
+    async def test_probes_run_at_most_once_per_interval(self, router: RoutingAsyncProvider, nodes: List[FakeProvider]):
+        await router.make_request("eth_sendRawTransaction", [])
+        await router._health_check  # type: ignore[misc]
+        await router.make_request("eth_sendRawTransaction", [])
+        await router.make_request("eth_sendRawTransaction", [])
+
+        assert [method for method, _ in nodes[1].requests] == ["eth_blockNumber"]
+
+    async def test_a_failing_probe_marks_the_endpoint_unhealthy_and_a_passing_one_healthy(
+        self, router: RoutingAsyncProvider, nodes: List[FakeProvider]
+    ):
+        router.endpoints[1].healthy = False
+        nodes[2].error = ClientError("connection refused")
+
+        await router.make_request("eth_sendRawTransaction", [])
+        await router._health_check  # type: ignore[misc]
+
+        assert [endpoint.healthy for endpoint in router.endpoints] == [True, True, False]
+
+    async def test_an_error_response_marks_the_endpoint_unhealthy(
+        self, router: RoutingAsyncProvider, nodes: List[FakeProvider], monkeypatch: pytest.MonkeyPatch
+    ):
+        async def error_response(method: str, params: Any) -> Any:
+            return {"jsonrpc": "2.0", "id": 1, "error": {"code": -32000, "message": "header not found"}}
+
+        monkeypatch.setattr(nodes[1], "make_request", error_response)
+
+        await router.make_request("eth_sendRawTransaction", [])
+        await router._health_check  # type: ignore[misc]
+
+        assert not router.endpoints[1].healthy
+        assert router.endpoints[1].block_number is None
+
+    async def test_probes_do_not_inherit_the_read_routing_of_the_request(
+        self, router: RoutingAsyncProvider, nodes: List[FakeProvider]
+    ):
+        with hedged_reads():
+            await router.make_request("eth_sendRawTransaction", [])
+        await router._health_check  # type: ignore[misc]
+
+        assert nodes[1].routings == [None]
+
+    async def test_a_single_endpoint_is_never_probed(self):
+        node = FakeProvider("http://a")
+        router = RoutingAsyncProvider([node])  # type: ignore[list-item]
+
+        await router.make_request("eth_call", [])
+
+        assert router._health_check is None
+        assert node.methods() == ["eth_call"]
+
+
+class TestLifecycle:
+    def test_at_least_one_provider_is_required(self):
+        with pytest.raises(ValueError):
+            RoutingAsyncProvider([])
+
+    def test_from_urls_creates_one_pooled_provider_per_url(self):
+        router = RoutingAsyncProvider.from_urls(
+            ["http://a:8545", "http://b:8545"], pool_size=4, keepalive_seconds=30, timeout_seconds=5, hedge_delay_ms=50
+        )
+
+        assert [endpoint.url for endpoint in router.endpoints] == ["http://a:8545", "http://b:8545"]
+        assert all(isinstance(endpoint.provider, PooledAsyncHTTPProvider) for endpoint in router.endpoints)
+        assert router.endpoints[0].provider.pool_size == 4
+        assert router.hedge_delay_seconds == 0.05
+
+    async def test_connected_while_any_endpoint_is(self, router: RoutingAsyncProvider, nodes: List[FakeProvider]):
+        nodes[0].connected = False
+
+        assert await router.is_connected()
+
+        for node in nodes:
+            node.connected = False
+        assert not await router.is_connected()
+
+        await router.connect()
+        assert all(node.connected for node in nodes)
+
+    async def test_disconnect_cancels_the_health_check_and_disconnects_every_endpoint(self, nodes: List[FakeProvider]):
+        router = RoutingAsyncProvider(nodes)  # type: ignore[arg-type]
+        for node in nodes:
+            node.delay = 5
+
+        task = asyncio.ensure_future(router.make_request("eth_sendRawTransaction", []))
+        await asyncio.sleep(0)
+        health_check = router._health_check
+        await router.disconnect()
+        task.cancel()
+
+        assert health_check is not None
+        with pytest.raises(asyncio.CancelledError):
+            await health_check
+        assert router._health_check is None
+        assert all(node.disconnected for node in nodes)
+
+    def test_latency_is_a_moving_average(self, router: RoutingAsyncProvider):
+        endpoint = router.endpoints[0]
+
+        endpoint.observe(1.0)
+        endpoint.observe(2.0)
+
+        assert endpoint.latency == pytest.approx(1.3)
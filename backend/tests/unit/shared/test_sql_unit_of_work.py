@@ -0,0 +1,170 @@
+from typing import List
+from unittest.mock import AsyncMock
+from uuid import UUID, uuid4
+
+import pytest
+import sqlalchemy as sa
+from pydantic import BaseModel
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
+
+from certificado_verde_blockchain.producers.infrastructure.sql.producer_entity import ProducerEntity
+from certificado_verde_blockchain.shared.enums import DocumentType
+from certificado_verde_blockchain.shared.errors import DomainException
+from certificado_verde_blockchain.shared.sql import SqlUnitOfWork
+
+metadata = sa.MetaData()
+lots = sa.Table("lots", metadata, sa.Column("id", sa.Integer, primary_key=True), sa.Column("name", sa.String))
+lot_tags = sa.Table(
+    "lot_tags",
+    metadata,
+    sa.Column("lot_id", sa.Integer, primary_key=True),
+    sa.Column("tag", sa.String, primary_key=True),
+)
+
+
+class Lot(BaseModel):
+    id: UUID
+    name: str
+    tags: List[str]
+
+
+def sql(statement: sa.Executable) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+@pytest.fixture
+def database_session() -> AsyncMock:
+    return AsyncMock()
+
+
+@pytest.fixture
+def unit_of_work(database_session: AsyncMock) -> SqlUnitOfWork:
+    return SqlUnitOfWork(database_session)
+
+
+class TestIdentityMap:
+    def test_tracked_objects_are_found_as_copies(self, unit_of_work: SqlUnitOfWork):
+        lot = Lot(id=uuid4(), name="Soja", tags=["safra"])
+        unit_of_work.track(lot)
+
+        found = unit_of_work.find(Lot, lot.id)
+        found.tags.append("changed")
+
+        assert found is not lot
+        assert unit_of_work.find(Lot, lot.id) == lot
+        assert unit_of_work.find(Lot, uuid4()) is None
+
+    def test_find_many_splits_the_tracked_objects_from_the_ids_to_load(self, unit_of_work: SqlUnitOfWork):
+        tracked = Lot(id=uuid4(), name="Soja", tags=[])
+        unit_of_work.track(tracked)
+        missing = uuid4()
+
+        found, to_load = unit_of_work.find_many(Lot, [tracked.id, missing, tracked.id, missing])
+
+        assert found == [tracked]
+        assert to_load == [missing]
+
+    def test_find_first_matches_the_objects_of_the_type(self, unit_of_work: SqlUnitOfWork):
+        soja, milho = Lot(id=uuid4(), name="Soja", tags=[]), Lot(id=uuid4(), name="Milho", tags=[])
+        unit_of_work.track(soja)
+        unit_of_work.track(milho)
+
+        assert unit_of_work.find_first(Lot, lambda lot: lot.name == "Milho") == milho
+        assert unit_of_work.find_first(Lot, lambda lot: lot.name == "Trigo") is None
+        assert unit_of_work.find_first(BaseModel, lambda _: True) is None
+
+
+class TestCommit:
+    async def test_staged_rows_are_upserted_per_table_in_the_order_staged(
+        self, unit_of_work: SqlUnitOfWork, database_session: AsyncMock
+    ):
+        unit_of_work.stage_row(lots, {"id": 1, "name": "Soja"}, "Duplicate lot")
+        unit_of_work.stage_row(lot_tags, {"lot_id": 1, "tag": "safra"}, "Duplicate tag")
+        unit_of_work.stage_row(lots, {"id": 2, "name": "Milho"}, "Duplicate lot")
+        # Saved again: replaces the row staged first
+        unit_of_work.stage_row(lots, {"id": 1, "name": "Soja orgânica"}, "Duplicate lot")
+
+        await unit_of_work.commit()
+
+        (lots_statement, lots_rows), (tags_statement, tags_rows) = [
+            call.args for call in database_session.execute.await_args_list
+        ]
+        assert sql(lots_statement).endswith("ON CONFLICT (id) DO UPDATE SET name = excluded.name")
+        assert lots_rows == [{"id": 1, "name": "Soja orgânica"}, {"id": 2, "name": "Milho"}]
+        # A table of primary key columns only has nothing to update
+        assert sql(tags_statement).endswith("ON CONFLICT DO NOTHING")
+        assert tags_rows == [{"lot_id": 1, "tag": "safra"}]
+        database_session.commit.assert_awaited_once()
+
+    async def test_entities_are_staged_by_column_name(self, unit_of_work: SqlUnitOfWork, database_session: AsyncMock):
+        entity = ProducerEntity(
+            id=str(uuid4()),
+            name="Fazenda Boa Vista",
+            document_type=DocumentType.CPF,
+            document_number="12345678900",
+            address_country="Brasil",
+            address_latitude=-15.8,
+            address_longitude=-47.9,
+            _metadata={"organic": True},
+        )
+
+        unit_of_work.stage(entity, "Duplicate producer")
+        await unit_of_work.commit()
+
+        statement, rows = database_session.execute.await_args.args
+        assert statement.table.name == "producers"
+        assert rows[0]["metadata"] == {"organic": True}
+        assert rows[0]["document_number"] == "12345678900"
+
+    async def test_a_commit_without_staged_rows_only_commits(
+        self, unit_of_work: SqlUnitOfWork, database_session: AsyncMock
+    ):
+        await unit_of_work.commit()
+
+        database_session.execute.assert_not_awaited()
+        database_session.commit.assert_awaited_once()
+
+    async def test_a_broken_constraint_is_a_conflict_of_the_table_written(
+        self, unit_of_work: SqlUnitOfWork, database_session: AsyncMock
+    ):
+        lot = Lot(id=uuid4(), name="Soja", tags=[])
+        unit_of_work.track(lot)
+        unit_of_work.stage_row(lots, {"id": 1, "name": "Soja"}, "Duplicate lot")
+        unit_of_work.stage_row(lot_tags, {"lot_id": 1, "tag": "safra"}, "Duplicate tag")
+        database_session.execute.side_effect = [None, IntegrityError("INSERT", {}, Exception("unique"))]
+
+        with pytest.raises(DomainException) as error:
+            await unit_of_work.commit()
+
+        assert (error.value.message, error.value.code) == ("Duplicate tag", 409)
+        database_session.rollback.assert_awaited_once()
+        database_session.commit.assert_not_awaited()
+        # The tracked objects may not have been written
+        assert unit_of_work.find(Lot, lot.id) is None
+
+    async def test_a_broken_constraint_on_commit_is_a_conflict(
+        self, unit_of_work: SqlUnitOfWork, database_session: AsyncMock
+    ):
+        database_session.commit.side_effect = IntegrityError("COMMIT", {}, Exception("deferred"))
+
+        with pytest.raises(DomainException) as error:
+            await unit_of_work.commit()
+
+        assert (error.value.message, error.value.code) == ("Integrity error while saving", 409)
+
+    async def test_any_other_failure_rolls_back_and_propagates(
+        self, unit_of_work: SqlUnitOfWork, database_session: AsyncMock
+    ):
+        unit_of_work.stage_row(lots, {"id": 1, "name": "Soja"}, "Duplicate lot")
+        database_session.execute.side_effect = ConnectionResetError()
+
+        with pytest.raises(ConnectionResetError):
+            await unit_of_work.commit()
+
+        database_session.rollback.assert_awaited_once()
+
+        # Nothing stays staged for the next commit
+        database_session.execute.side_effect = None
+        await unit_of_work.commit()
+        database_session.execute.assert_awaited_once()
@@ -0,0 +1,95 @@
+import json
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from certificado_verde_blockchain.producers.infrastructure.sql.producer_entity import ProducerEntity
+from certificado_verde_blockchain.shared.enums import DocumentType
+from certificado_verde_blockchain.shared.sql import StagingTable
+
+
+def producer_entity(**overrides: Any) -> ProducerEntity:
+    return ProducerEntity(
+        **{
+            "id": str(uuid4()),
+            "name": "Fazenda Boa Vista",
+            "document_type": DocumentType.CNPJ,
+            "document_number": "12345678000190",
+            "address_country": "Brasil",
+            "address_latitude": -15.8,
+            "address_longitude": -47.9,
+            "_metadata": {"certified": True},
+            **overrides,
+        }
+    )
+
+
+@pytest.fixture
+def staging_table() -> StagingTable:
+    return StagingTable(ProducerEntity)
+
+
+@pytest.fixture
+def driver_connection() -> MagicMock:
+    driver_connection = MagicMock()
+    driver_connection.copy_records_to_table = AsyncMock()
+    return driver_connection
+
+
+@pytest.fixture
+def database_session(driver_connection: MagicMock) -> AsyncMock:
+    connection = MagicMock()
+    connection.get_raw_connection = AsyncMock(return_value=MagicMock(driver_connection=driver_connection))
+    database_session = AsyncMock()
+    database_session.connection.return_value = connection
+    return database_session
+
+
+class TestStagingTable:
+    def test_columns_are_the_column_names_of_the_entity(self, staging_table: StagingTable):
+        assert staging_table.name == "staging_producers"
+        # The attribute is `_metadata`, the column `metadata`
+        assert "metadata" in staging_table.columns
+        assert "_metadata" not in staging_table.columns
+
+    async def test_create_copies_the_entity_table_for_the_transaction(
+        self, staging_table: StagingTable, database_session: AsyncMock
+    ):
+        await staging_table.create(database_session)
+
+        statement = str(database_session.execute.await_args.args[0])
+        assert statement == (
+            "CREATE TEMPORARY TABLE staging_producers (LIKE producers INCLUDING DEFAULTS) ON COMMIT DROP"
+        )
+
+    async def test_copy_loads_every_entity_in_one_copy(
+        self, staging_table: StagingTable, database_session: AsyncMock, driver_connection: MagicMock
+    ):
+        entities = [producer_entity(), producer_entity(document_number="98765432000110", _metadata=None)]
+
+        await staging_table.copy(database_session, entities)
+
+        driver_connection.copy_records_to_table.assert_awaited_once()
+        call = driver_connection.copy_records_to_table.await_args
+        assert call.args == ("staging_producers",)
+        assert call.kwargs["columns"] == staging_table.columns
+        records = [dict(zip(staging_table.columns, record)) for record in call.kwargs["records"]]
+        assert [record["document_number"] for record in records] == ["12345678000190", "98765432000110"]
+        # JSON columns go through the connection codecs as serialized documents
+        assert [record["metadata"] for record in records] == [json.dumps({"certified": True}), None]
+
+    async def test_copy_of_nothing_skips_the_round_trip(self, staging_table: StagingTable, database_session: AsyncMock):
+        await staging_table.copy(database_session, [])
+
+        database_session.connection.assert_not_awaited()
+
+    def test_insert_selects_every_staged_row_into_the_entity_table(self, staging_table: StagingTable):
+        insert = staging_table.insert().on_conflict_do_nothing(index_elements=["document_number"])
+
+        sql = str(insert.compile(dialect=postgresql.dialect()))
+        assert sql.startswith("INSERT INTO producers (id, name, document_type, document_number")
+        assert "FROM staging_producers" in sql
+        assert sql.endswith("ON CONFLICT (document_number) DO NOTHING")
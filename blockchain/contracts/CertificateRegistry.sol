@@ -15,7 +15,19 @@ contract CertificateRegistry
     mapping(uint256 => Certificate) private certificates;   // Mapping from certificate ID to Certificate struct
     uint256 public nextId;                                  // Next certificate ID to be issued
 
+    struct Anchor {
+        bytes32 root;                   // Merkle root of the certificate hashes of the epoch
+        uint256 leafCount;              // Number of certificates in the epoch
+        address issuer;                 // Who anchored the epoch
+        uint256 timestamp;              // When the epoch was anchored
+    }
+
+    mapping(uint256 => Anchor) private anchors;             // Mapping from epoch ID to its anchored Merkle root
+    mapping(bytes32 => uint256) public epochOfRoot;         // Epoch ID of each anchored root (0 if never anchored)
+    uint256 public nextEpochId;                             // Next epoch ID to be anchored
+
     address public admin;                                   // Address with administrative privileges
+    mapping(address => bool) public issuers;                // Additional addresses allowed to issue certificates
 
     event CertificateIssued(
         uint256 indexed id,
@@ -30,11 +42,29 @@ contract CertificateRegistry
         uint256 timestamp
     ); // Emitted when a certificate is revoked
 
+    event RootAnchored(
+        uint256 indexed epochId,
+        bytes32 indexed root,
+        address indexed issuer,
+        uint256 leafCount,
+        uint256 timestamp
+    ); // Emitted when the Merkle root of an epoch of certificates is anchored
+
+    event IssuerUpdated(
+        address indexed issuer,
+        bool allowed
+    ); // Emitted when an address is granted or denied issuing rights
+
     modifier onlyAdmin() {
         require(msg.sender == admin, "Only admin can perform this action");
         _;
     } // Restricts function access to the admin only
 
+    modifier onlyIssuer() {
+        require(msg.sender == admin || issuers[msg.sender], "Only admin or issuers can perform this action");
+        _;
+    } // Restricts function access to the admin and the authorized issuers
+
     /**
     * Initializes the contract setting the deployer as the initial admin.
     * This only happens once during contract deployment.
@@ -43,32 +73,60 @@ contract CertificateRegistry
     constructor() {
         admin = msg.sender; // Assign the contract deployer as the admin
         nextId = 1;         // Initialize the next certificate ID to 1
+        nextEpochId = 1;    // Initialize the next epoch ID to 1
     }
 
     /**
-    * Issues a new certificate and stores it in the registry.
+    * Grants or denies issuing rights to an address, allowing the backend to spread
+    * issuance transactions across several signing accounts.
     * Only the admin can call this function.
+    * @param issuer The address to update.
+    * @param allowed Whether the address is allowed to issue certificates.
+    */
+    function setIssuer(address issuer, bool allowed)
+        external
+        onlyAdmin
+    {
+        issuers[issuer] = allowed;
+
+        emit IssuerUpdated(issuer, allowed);
+    }
+
+    /**
+    * Issues a new certificate and stores it in the registry.
+    * Only the admin or an authorized issuer can call this function.
     * @param owner The address of the certificate owner.
     * @param dataHash The hash of the off-chain certificate data.
     * @return id The unique identifier of the issued certificate.
     */
     function issueCertificate(address owner, string calldata dataHash)
         external
-        onlyAdmin
+        onlyIssuer
         returns (uint256 id)
     {
-        id = nextId++; // Assign the current nextId to id, then increment nextId
+        id = _issue(owner, dataHash);
+    }
 
-        certificates[id] = Certificate({
-            id: id,
-            issuer: msg.sender,
-            owner: owner,
-            dataHash: dataHash,
-            timestamp: block.timestamp,
-            revoked: false
-        });
+    /**
+    * Issues a batch of certificates in a single transaction.
+    * One CertificateIssued event is emitted per item, in the same order as the input.
+    * Only the admin or an authorized issuer can call this function.
+    * @param owners The addresses of the certificate owners.
+    * @param dataHashes The hashes of the off-chain certificate data, aligned with owners.
+    * @return ids The unique identifiers of the issued certificates, in the same order as the input.
+    */
+    function issueCertificates(address[] calldata owners, string[] calldata dataHashes)
+        external
+        onlyIssuer
+        returns (uint256[] memory ids)
+    {
+        require(owners.length > 0, "Batch is empty");
+        require(owners.length == dataHashes.length, "Owners and hashes length mismatch");
 
-        emit CertificateIssued(id, msg.sender, owner, dataHash, block.timestamp);
+        ids = new uint256[](owners.length);
+        for (uint256 i = 0; i < owners.length; i++) {
+            ids[i] = _issue(owners[i], dataHashes[i]);
+        }
     }
 
     /**
@@ -88,6 +146,35 @@ contract CertificateRegistry
         emit CertificateRevoked(id, block.timestamp);
     }
 
+    /**
+    * Revokes a batch of certificates in a single transaction.
+    * Unknown and already revoked IDs are skipped instead of reverting, so a batch that was
+    * partially applied can be sent again. One CertificateRevoked event is emitted per certificate
+    * actually revoked, in the same order as the input.
+    * Only the admin can call this function.
+    * @param ids The unique identifiers of the certificates to revoke.
+    * @return revokedCount The number of certificates revoked by this call.
+    */
+    function revokeCertificates(uint256[] calldata ids)
+        external
+        onlyAdmin
+        returns (uint256 revokedCount)
+    {
+        require(ids.length > 0, "Batch is empty");
+
+        for (uint256 i = 0; i < ids.length; i++) {
+            Certificate storage certificate = certificates[ids[i]];
+            if (certificate.id == 0 || certificate.revoked) {
+                continue;
+            }
+
+            certificate.revoked = true;
+            revokedCount++;
+
+            emit CertificateRevoked(ids[i], block.timestamp);
+        }
+    }
+
     /**
     * Retrieves a certificate by its unique identifier.
     * @param id The unique identifier of the certificate to retrieve.
@@ -101,4 +188,127 @@ contract CertificateRegistry
         require(certificates[id].id != 0, "Certificate does not exist");
         certificate = certificates[id];
     }
+
+    /**
+    * Retrieves a page of consecutive certificates, so bulk readers need one call per page
+    * instead of one call per certificate. IDs past the last issued certificate are left out.
+    * @param fromId The first certificate ID of the page (0 is treated as 1).
+    * @param count The maximum number of certificates to return.
+    * @return page The certificates with IDs in [fromId, fromId + count), in ID order.
+    */
+    function getCertificates(uint256 fromId, uint256 count)
+        external
+        view
+        returns (Certificate[] memory page)
+    {
+        if (fromId == 0) {
+            fromId = 1;
+        }
+        if (fromId >= nextId) {
+            return new Certificate[](0);
+        }
+        if (count > nextId - fromId) {
+            count = nextId - fromId;
+        }
+
+        page = new Certificate[](count);
+        for (uint256 i = 0; i < count; i++) {
+            page[i] = certificates[fromId + i];
+        }
+    }
+
+    /**
+    * Anchors the Merkle root of an epoch of certificates, recording a whole epoch in a single storage entry.
+    * Leaves are the keccak256 of each 32-byte certificate hash and pairs are hashed in sorted order,
+    * so an inclusion proof is just the list of sibling hashes (see verifyInclusion).
+    * Only the admin or an authorized issuer can call this function.
+    * @param root The Merkle root of the epoch.
+    * @param leafCount The number of certificates in the epoch.
+    * @return epochId The unique identifier of the anchored epoch.
+    */
+    function anchorRoot(bytes32 root, uint256 leafCount)
+        external
+        onlyIssuer
+        returns (uint256 epochId)
+    {
+        require(root != bytes32(0), "Invalid root");
+        require(leafCount > 0, "Empty epoch");
+        require(epochOfRoot[root] == 0, "Root already anchored");
+
+        epochId = nextEpochId++;
+        anchors[epochId] = Anchor({
+            root: root,
+            leafCount: leafCount,
+            issuer: msg.sender,
+            timestamp: block.timestamp
+        });
+        epochOfRoot[root] = epochId;
+
+        emit RootAnchored(epochId, root, msg.sender, leafCount, block.timestamp);
+    }
+
+    /**
+    * Retrieves an anchored epoch by its unique identifier.
+    * @param epochId The unique identifier of the epoch to retrieve.
+    * @return anchor The Anchor struct associated with the given epoch.
+    */
+    function getAnchor(uint256 epochId)
+        external
+        view
+        returns (Anchor memory anchor)
+    {
+        require(anchors[epochId].root != bytes32(0), "Epoch does not exist");
+        anchor = anchors[epochId];
+    }
+
+    /**
+    * Checks that a certificate hash belongs to an anchored epoch.
+    * @param epochId The unique identifier of the epoch.
+    * @param certificateHash The 32-byte hash of the certificate data.
+    * @param proof The sibling hashes from the certificate leaf up to the root.
+    * @return included Whether the proof leads from the certificate hash to the root of the epoch.
+    */
+    function verifyInclusion(uint256 epochId, bytes32 certificateHash, bytes32[] calldata proof)
+        external
+        view
+        returns (bool included)
+    {
+        bytes32 root = anchors[epochId].root;
+        if (root == bytes32(0)) {
+            return false;
+        }
+
+        bytes32 node = keccak256(abi.encodePacked(certificateHash));
+        for (uint256 i = 0; i < proof.length; i++) {
+            bytes32 sibling = proof[i];
+            node = node < sibling
+                ? keccak256(abi.encodePacked(node, sibling))
+                : keccak256(abi.encodePacked(sibling, node));
+        }
+        included = node == root;
+    }
+
+    /**
+    * Stores a new certificate and emits its CertificateIssued event.
+    * @param owner The address of the certificate owner.
+    * @param dataHash The hash of the off-chain certificate data.
+    * @return id The unique identifier of the issued certificate.
+    */
+    function _issue(address owner, string calldata dataHash)
+        private
+        returns (uint256 id)
+    {
+        id = nextId++; // Assign the current nextId to id, then increment nextId
+
+        certificates[id] = Certificate({
+            id: id,
+            issuer: msg.sender,
+            owner: owner,
+            dataHash: dataHash,
+            timestamp: block.timestamp,
+            revoked: false
+        });
+
+        emit CertificateIssued(id, msg.sender, owner, dataHash, block.timestamp);
+    }
 }
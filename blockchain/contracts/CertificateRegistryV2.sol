@@ -0,0 +1,382 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.20;
+
+/**
+* Second version of the certificate registry. It keeps the interface of CertificateRegistry, but:
+* - data hashes are fixed-size bytes32 values instead of hex strings, so they cost one storage slot;
+* - certificates are stored packed in three slots, and the contract keeps a hash to ID index (getByHash);
+* - CertificateIssued indexes the data hash, so certificates can be found with a topic filter.
+* A data hash can only be issued once: issueCertificate reverts on a hash issued before, while issueCertificates
+* skips it and reports the ID it was issued with (CertificateAlreadyIssued).
+*/
+contract CertificateRegistryV2
+{
+    struct Certificate {
+        uint256 id;                     // Certificate's unique identifier
+        address issuer;                 // Who issued the certificate
+        address owner;                  // Who owns the certificate
+        bytes32 dataHash;               // Hash of the off-chain certificate data (IPFS, S3, DB, storage, etc.)
+        uint256 timestamp;              // When the certificate was issued
+        bool revoked;                   // Whether the certificate has been revoked
+    }
+
+    struct Record {
+        bytes32 dataHash;               // Slot 0: hash of the off-chain certificate data
+        address issuer;                 // Slot 1: who issued the certificate...
+        uint64 timestamp;               // ...when it was issued...
+        bool revoked;                   // ...and whether it has been revoked
+        address owner;                  // Slot 2: who owns the certificate
+    }
+
+    struct Anchor {
+        bytes32 root;                   // Merkle root of the certificate hashes of the epoch
+        uint256 leafCount;              // Number of certificates in the epoch
+        address issuer;                 // Who anchored the epoch
+        uint256 timestamp;              // When the epoch was anchored
+    }
+
+    mapping(uint256 => Record) private records;             // Mapping from certificate ID to its stored record
+    mapping(bytes32 => uint256) private certificateIds;     // Mapping from data hash to certificate ID
+    uint256 public nextId;                                  // Next certificate ID to be issued
+
+    mapping(uint256 => Anchor) private anchors;             // Mapping from epoch ID to its anchored Merkle root
+    mapping(bytes32 => uint256) public epochOfRoot;         // Epoch ID of each anchored root (0 if never anchored)
+    uint256 public nextEpochId;                             // Next epoch ID to be anchored
+
+    address public admin;                                   // Address with administrative privileges
+    mapping(address => bool) public issuers;                // Additional addresses allowed to issue certificates
+
+    event CertificateIssued(
+        uint256 indexed id,
+        bytes32 indexed dataHash,
+        address indexed owner,
+        address issuer,
+        uint256 timestamp
+    ); // Emitted when a new certificate is issued
+
+    event CertificateAlreadyIssued(
+        uint256 indexed id,
+        bytes32 indexed dataHash
+    ); // Emitted by a batch instead of CertificateIssued for a hash that was issued before
+
+    event CertificateRevoked(
+        uint256 indexed id,
+        uint256 timestamp
+    ); // Emitted when a certificate is revoked
+
+    event RootAnchored(
+        uint256 indexed epochId,
+        bytes32 indexed root,
+        address indexed issuer,
+        uint256 leafCount,
+        uint256 timestamp
+    ); // Emitted when the Merkle root of an epoch of certificates is anchored
+
+    event IssuerUpdated(
+        address indexed issuer,
+        bool allowed
+    ); // Emitted when an address is granted or denied issuing rights
+
+    modifier onlyAdmin() {
+        require(msg.sender == admin, "Only admin can perform this action");
+        _;
+    } // Restricts function access to the admin only
+
+    modifier onlyIssuer() {
+        require(msg.sender == admin || issuers[msg.sender], "Only admin or issuers can perform this action");
+        _;
+    } // Restricts function access to the admin and the authorized issuers
+
+    /**
+    * Initializes the contract setting the deployer as the initial admin.
+    */
+    constructor() {
+        admin = msg.sender; // Assign the contract deployer as the admin
+        nextId = 1;         // Initialize the next certificate ID to 1
+        nextEpochId = 1;    // Initialize the next epoch ID to 1
+    }
+
+    /**
+    * Grants or denies issuing rights to an address.
+    * Only the admin can call this function.
+    * @param issuer The address to update.
+    * @param allowed Whether the address is allowed to issue certificates.
+    */
+    function setIssuer(address issuer, bool allowed)
+        external
+        onlyAdmin
+    {
+        issuers[issuer] = allowed;
+
+        emit IssuerUpdated(issuer, allowed);
+    }
+
+    /**
+    * Issues a new certificate and stores it in the registry.
+    * Only the admin or an authorized issuer can call this function.
+    * @param owner The address of the certificate owner.
+    * @param dataHash The hash of the off-chain certificate data.
+    * @return id The unique identifier of the issued certificate.
+    */
+    function issueCertificate(address owner, bytes32 dataHash)
+        external
+        onlyIssuer
+        returns (uint256 id)
+    {
+        id = _issue(owner, dataHash);
+    }
+
+    /**
+    * Issues a batch of certificates in a single transaction.
+    * Hashes that were already issued, by an earlier transaction or earlier in the batch, are skipped
+    * instead of reverting, so a batch that was partially applied can be sent again. One event is emitted
+    * per item, in the same order as the input: CertificateIssued, or CertificateAlreadyIssued with the
+    * ID the hash was issued with.
+    * Only the admin or an authorized issuer can call this function.
+    * @param owners The addresses of the certificate owners.
+    * @param dataHashes The hashes of the off-chain certificate data, aligned with owners.
+    * @return ids The unique identifiers of the certificates, issued or existing, in the same order as the input.
+    */
+    function issueCertificates(address[] calldata owners, bytes32[] calldata dataHashes)
+        external
+        onlyIssuer
+        returns (uint256[] memory ids)
+    {
+        require(owners.length > 0, "Batch is empty");
+        require(owners.length == dataHashes.length, "Owners and hashes length mismatch");
+
+        ids = new uint256[](owners.length);
+        for (uint256 i = 0; i < owners.length; i++) {
+            uint256 existingId = certificateIds[dataHashes[i]];
+            if (existingId != 0) {
+                ids[i] = existingId;
+                emit CertificateAlreadyIssued(existingId, dataHashes[i]);
+                continue;
+            }
+
+            ids[i] = _issue(owners[i], dataHashes[i]);
+        }
+    }
+
+    /**
+    * Revokes an existing certificate.
+    * Only the admin can call this function.
+    * @param id The unique identifier of the certificate to revoke.
+    */
+    function revokeCertificate(uint256 id)
+        external
+        onlyAdmin
+    {
+        Record storage record = records[id];
+        require(record.dataHash != bytes32(0), "Certificate does not exist");
+        require(!record.revoked, "Certificate already revoked");
+
+        record.revoked = true;
+
+        emit CertificateRevoked(id, block.timestamp);
+    }
+
+    /**
+    * Revokes a batch of certificates in a single transaction.
+    * Unknown and already revoked IDs are skipped instead of reverting, so a batch that was
+    * partially applied can be sent again. One CertificateRevoked event is emitted per certificate
+    * actually revoked, in the same order as the input.
+    * Only the admin can call this function.
+    * @param ids The unique identifiers of the certificates to revoke.
+    * @return revokedCount The number of certificates revoked by this call.
+    */
+    function revokeCertificates(uint256[] calldata ids)
+        external
+        onlyAdmin
+        returns (uint256 revokedCount)
+    {
+        require(ids.length > 0, "Batch is empty");
+
+        for (uint256 i = 0; i < ids.length; i++) {
+            Record storage record = records[ids[i]];
+            if (record.dataHash == bytes32(0) || record.revoked) {
+                continue;
+            }
+
+            record.revoked = true;
+            revokedCount++;
+
+            emit CertificateRevoked(ids[i], block.timestamp);
+        }
+    }
+
+    /**
+    * Retrieves a certificate by its unique identifier.
+    * @param id The unique identifier of the certificate to retrieve.
+    * @return certificate The Certificate struct associated with the given id.
+    */
+    function getCertificate(uint256 id)
+        external
+        view
+        returns (Certificate memory certificate)
+    {
+        require(records[id].dataHash != bytes32(0), "Certificate does not exist");
+        certificate = _certificate(id);
+    }
+
+    /**
+    * Retrieves a certificate by the hash of its off-chain data.
+    * @param dataHash The hash of the off-chain certificate data.
+    * @return certificate The Certificate struct issued with the given hash.
+    */
+    function getByHash(bytes32 dataHash)
+        external
+        view
+        returns (Certificate memory certificate)
+    {
+        uint256 id = certificateIds[dataHash];
+        require(id != 0, "Certificate does not exist");
+        certificate = _certificate(id);
+    }
+
+    /**
+    * Retrieves a page of consecutive certificates, so bulk readers need one call per page
+    * instead of one call per certificate. IDs past the last issued certificate are left out.
+    * @param fromId The first certificate ID of the page (0 is treated as 1).
+    * @param count The maximum number of certificates to return.
+    * @return page The certificates with IDs in [fromId, fromId + count), in ID order.
+    */
+    function getCertificates(uint256 fromId, uint256 count)
+        external
+        view
+        returns (Certificate[] memory page)
+    {
+        if (fromId == 0) {
+            fromId = 1;
+        }
+        if (fromId >= nextId) {
+            return new Certificate[](0);
+        }
+        if (count > nextId - fromId) {
+            count = nextId - fromId;
+        }
+
+        page = new Certificate[](count);
+        for (uint256 i = 0; i < count; i++) {
+            page[i] = _certificate(fromId + i);
+        }
+    }
+
+    /**
+    * Anchors the Merkle root of an epoch of certificates, recording a whole epoch in a single storage entry.
+    * Leaves are the keccak256 of each 32-byte certificate hash and pairs are hashed in sorted order.
+    * Only the admin or an authorized issuer can call this function.
+    * @param root The Merkle root of the epoch.
+    * @param leafCount The number of certificates in the epoch.
+    * @return epochId The unique identifier of the anchored epoch.
+    */
+    function anchorRoot(bytes32 root, uint256 leafCount)
+        external
+        onlyIssuer
+        returns (uint256 epochId)
+    {
+        require(root != bytes32(0), "Invalid root");
+        require(leafCount > 0, "Empty epoch");
+        require(epochOfRoot[root] == 0, "Root already anchored");
+
+        epochId = nextEpochId++;
+        anchors[epochId] = Anchor({
+            root: root,
+            leafCount: leafCount,
+            issuer: msg.sender,
+            timestamp: block.timestamp
+        });
+        epochOfRoot[root] = epochId;
+
+        emit RootAnchored(epochId, root, msg.sender, leafCount, block.timestamp);
+    }
+
+    /**
+    * Retrieves an anchored epoch by its unique identifier.
+    * @param epochId The unique identifier of the epoch to retrieve.
+    * @return anchor The Anchor struct associated with the given epoch.
+    */
+    function getAnchor(uint256 epochId)
+        external
+        view
+        returns (Anchor memory anchor)
+    {
+        require(anchors[epochId].root != bytes32(0), "Epoch does not exist");
+        anchor = anchors[epochId];
+    }
+
+    /**
+    * Checks that a certificate hash belongs to an anchored epoch.
+    * @param epochId The unique identifier of the epoch.
+    * @param certificateHash The 32-byte hash of the certificate data.
+    * @param proof The sibling hashes from the certificate leaf up to the root.
+    * @return included Whether the proof leads from the certificate hash to the root of the epoch.
+    */
+    function verifyInclusion(uint256 epochId, bytes32 certificateHash, bytes32[] calldata proof)
+        external
+        view
+        returns (bool included)
+    {
+        bytes32 root = anchors[epochId].root;
+        if (root == bytes32(0)) {
+            return false;
+        }
+
+        bytes32 node = keccak256(abi.encodePacked(certificateHash));
+        for (uint256 i = 0; i < proof.length; i++) {
+            bytes32 sibling = proof[i];
+            node = node < sibling
+                ? keccak256(abi.encodePacked(node, sibling))
+                : keccak256(abi.encodePacked(sibling, node));
+        }
+        included = node == root;
+    }
+
+    /**
+    * Stores a new certificate, indexes its hash and emits its CertificateIssued event.
+    * @param owner The address of the certificate owner.
+    * @param dataHash The hash of the off-chain certificate data.
+    * @return id The unique identifier of the issued certificate.
+    */
+    function _issue(address owner, bytes32 dataHash)
+        private
+        returns (uint256 id)
+    {
+        require(dataHash != bytes32(0), "Invalid data hash");
+        require(certificateIds[dataHash] == 0, "Certificate hash already issued");
+
+        id = nextId++; // Assign the current nextId to id, then increment nextId
+
+        records[id] = Record({
+            dataHash: dataHash,
+            issuer: msg.sender,
+            timestamp: uint64(block.timestamp),
+            revoked: false,
+            owner: owner
+        });
+        certificateIds[dataHash] = id;
+
+        emit CertificateIssued(id, dataHash, owner, msg.sender, block.timestamp);
+    }
+
+    /**
+    * Expands a stored record into the Certificate struct returned by the views.
+    * @param id The unique identifier of an issued certificate.
+    * @return certificate The Certificate struct of the record.
+    */
+    function _certificate(uint256 id)
+        private
+        view
+        returns (Certificate memory certificate)
+    {
+        Record storage record = records[id];
+        certificate = Certificate({
+            id: id,
+            issuer: record.issuer,
+            owner: record.owner,
+            dataHash: record.dataHash,
+            timestamp: record.timestamp,
+            revoked: record.revoked
+        });
+    }
+}
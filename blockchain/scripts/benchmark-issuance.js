@@ -0,0 +1,100 @@
+// Compares certificates per second for single vs. batched issuance on a local Hardhat network.
+//
+// Usage:
+//   npx hardhat run scripts/benchmark-issuance.js
+//
+// Environment variables:
+//   BENCH_CERTIFICATES  Number of certificates issued per scenario (default: 200)
+//   BENCH_BATCH_SIZES   Comma separated batch sizes to measure (default: 10,25,50)
+//   BENCH_BLOCK_TIME_MS Interval mining block time; 0 keeps automine (default: 1000)
+
+const CERTIFICATES = parseInt(process.env.BENCH_CERTIFICATES || "200", 10);
+const BATCH_SIZES = (process.env.BENCH_BATCH_SIZES || "10,25,50").split(",").map((size) => parseInt(size, 10));
+const BLOCK_TIME_MS = parseInt(process.env.BENCH_BLOCK_TIME_MS || "1000", 10);
+
+function fakeHash(index) {
+  return ethers.keccak256(ethers.toUtf8Bytes(`certificate-${index}`)).slice(2);
+}
+
+async function deployRegistry() {
+  const Contract = await ethers.getContractFactory("CertificateRegistry");
+  const contract = await Contract.deploy();
+  await contract.waitForDeployment();
+  return contract;
+}
+
+async function configureMining() {
+  if (BLOCK_TIME_MS > 0) {
+    await network.provider.send("evm_setAutomine", [false]);
+    await network.provider.send("evm_setIntervalMining", [BLOCK_TIME_MS]);
+  }
+}
+
+async function restoreMining() {
+  if (BLOCK_TIME_MS > 0) {
+    await network.provider.send("evm_setIntervalMining", [0]);
+    await network.provider.send("evm_setAutomine", [true]);
+  }
+}
+
+// Mirrors the backend's original behaviour: one transaction per certificate, waiting for each receipt.
+async function benchmarkSingle(contract, owner) {
+  let gasUsed = 0n;
+  const start = performance.now();
+  for (let index = 0; index < CERTIFICATES; index++) {
+    const tx = await contract.issueCertificate(owner, fakeHash(index));
+    const receipt = await tx.wait();
+    gasUsed += receipt.gasUsed;
+  }
+  const seconds = (performance.now() - start) / 1000;
+  return { mode: "single", batchSize: 1, seconds, gasUsed };
+}
+
+async function benchmarkBatched(contract, owner, batchSize) {
+  let gasUsed = 0n;
+  const start = performance.now();
+  for (let offset = 0; offset < CERTIFICATES; offset += batchSize) {
+    const size = Math.min(batchSize, CERTIFICATES - offset);
+    const owners = Array(size).fill(owner);
+    const hashes = Array.from({ length: size }, (_, index) => fakeHash(offset + index));
+    const tx = await contract.issueCertificates(owners, hashes);
+    const receipt = await tx.wait();
+    gasUsed += receipt.gasUsed;
+  }
+  const seconds = (performance.now() - start) / 1000;
+  return { mode: "batched", batchSize, seconds, gasUsed };
+}
+
+function report(result) {
+  const perSecond = CERTIFICATES / result.seconds;
+  const gasPerCertificate = result.gasUsed / BigInt(CERTIFICATES);
+  console.log(
+    `${result.mode.padEnd(8)} batch=${String(result.batchSize).padEnd(4)} ` +
+      `time=${result.seconds.toFixed(2)}s certs/s=${perSecond.toFixed(2)} gas/cert=${gasPerCertificate}`
+  );
+}
+
+async function main() {
+  const [admin] = await ethers.getSigners();
+  const owner = await admin.getAddress();
+
+  console.log(
+    `Issuing ${CERTIFICATES} certificates per scenario` +
+      (BLOCK_TIME_MS > 0 ? ` with ${BLOCK_TIME_MS}ms blocks` : " with automine")
+  );
+
+  await configureMining();
+  try {
+    report(await benchmarkSingle(await deployRegistry(), owner));
+    for (const batchSize of BATCH_SIZES) {
+      report(await benchmarkBatched(await deployRegistry(), owner, batchSize));
+    }
+  } finally {
+    await restoreMining();
+  }
+}
+
+main().catch((err) => {
+  console.error(err);
+  process.exit(1);
+});
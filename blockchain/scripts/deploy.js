@@ -1,7 +1,20 @@
 async function main() {
-  const Contract = await ethers.getContractFactory("CertificateRegistry");
+  // CertificateRegistry (v1, string hashes) or CertificateRegistryV2 (bytes32 hashes indexed by getByHash)
+  const Contract = await ethers.getContractFactory(process.env.REGISTRY_CONTRACT || "CertificateRegistry");
   const contract = await Contract.deploy();
   console.log("Deployed at:", contract.target);
+
+  // Optional comma separated list of extra signer addresses allowed to issue certificates
+  const issuers = (process.env.ISSUER_ADDRESSES || "")
+    .split(",")
+    .map((address) => address.trim())
+    .filter((address) => address.length > 0);
+
+  for (const issuer of issuers) {
+    const tx = await contract.setIssuer(issuer, true);
+    await tx.wait();
+    console.log("Authorized issuer:", issuer);
+  }
 }
 
 main().catch((err) => {
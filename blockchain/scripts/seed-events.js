@@ -0,0 +1,79 @@
+// Seeds a CertificateRegistry with a large number of events, for benchmarking the backend chain indexer.
+//
+// Usage:
+//   npx hardhat run --network localhost scripts/seed-events.js
+//
+// Environment variables:
+//   SEED_CONTRACT_ADDRESS Registry to seed; a new one is deployed when unset
+//   SEED_EVENTS           Number of CertificateIssued events (default: 100000)
+//   SEED_BATCH_SIZE       Certificates per issueCertificates transaction (default: 250)
+//   SEED_REVOKE_EVERY     Revoke one certificate out of every N issued, 0 disables (default: 10)
+
+const EVENTS = parseInt(process.env.SEED_EVENTS || "100000", 10);
+const BATCH_SIZE = parseInt(process.env.SEED_BATCH_SIZE || "250", 10);
+const REVOKE_EVERY = parseInt(process.env.SEED_REVOKE_EVERY || "10", 10);
+// Transactions sent before waiting for their receipts
+const PIPELINE_DEPTH = 32;
+
+function fakeHash(index) {
+  return ethers.keccak256(ethers.toUtf8Bytes(`seed-certificate-${index}`)).slice(2);
+}
+
+async function registry() {
+  const Contract = await ethers.getContractFactory("CertificateRegistry");
+  if (process.env.SEED_CONTRACT_ADDRESS) {
+    return Contract.attach(process.env.SEED_CONTRACT_ADDRESS);
+  }
+  const contract = await Contract.deploy();
+  await contract.waitForDeployment();
+  return contract;
+}
+
+async function sendPipelined(admin, transactions) {
+  let nonce = await admin.getNonce("pending");
+  let pending = [];
+  for (const populate of transactions) {
+    pending.push(await admin.sendTransaction({ ...(await populate()), nonce: nonce++ }));
+    if (pending.length >= PIPELINE_DEPTH) {
+      await Promise.all(pending.map((tx) => tx.wait()));
+      pending = [];
+    }
+  }
+  await Promise.all(pending.map((tx) => tx.wait()));
+}
+
+async function main() {
+  const [admin] = await ethers.getSigners();
+  const owner = await admin.getAddress();
+  const contract = await registry();
+  const firstId = await contract.nextId();
+  const startBlock = await ethers.provider.getBlockNumber();
+  const start = performance.now();
+
+  const issuances = [];
+  for (let offset = 0; offset < EVENTS; offset += BATCH_SIZE) {
+    const size = Math.min(BATCH_SIZE, EVENTS - offset);
+    const hashes = Array.from({ length: size }, (_, index) => fakeHash(offset + index));
+    issuances.push(() => contract.issueCertificates.populateTransaction(Array(size).fill(owner), hashes));
+  }
+  await sendPipelined(admin, issuances);
+
+  const revocations = [];
+  if (REVOKE_EVERY > 0) {
+    for (let index = 0; index < EVENTS; index += REVOKE_EVERY) {
+      const id = firstId + BigInt(index);
+      revocations.push(() => contract.revokeCertificate.populateTransaction(id));
+    }
+  }
+  await sendPipelined(admin, revocations);
+
+  const seconds = (performance.now() - start) / 1000;
+  console.log(`Registry: ${contract.target}`);
+  console.log(`Blocks: ${startBlock}..${await ethers.provider.getBlockNumber()}`);
+  console.log(`Seeded ${EVENTS} issuances and ${revocations.length} revocations in ${seconds.toFixed(1)}s`);
+}
+
+main().catch((err) => {
+  console.error(err);
+  process.exit(1);
+});
@@ -63,6 +63,99 @@ describe("CertificateRegistry", function () {
       await expect(
         // @ts-ignore
         certificateRegistry.connect(user1).issueCertificate(await user2.getAddress(), "hash") 
+      ).to.be.revertedWith("Only admin or issuers can perform this action");
+    });
+  });
+
+  describe("Batch Issuing Certificates", function () {
+    it("should issue every certificate in the batch with sequential IDs", async function () {
+      const owners = [await user1.getAddress(), await user2.getAddress(), await user1.getAddress()];
+      const hashes = ["h1", "h2", "h3"];
+
+      const tx = await certificateRegistry.issueCertificates(owners, hashes);
+      const receipt = await tx.wait();
+
+      const events = receipt!.logs
+        .map((log) => certificateRegistry.interface.parseLog(log))
+        .filter((ev) => ev?.name === "CertificateIssued");
+
+      expect(events.length).to.equal(3);
+      events.forEach((event, index) => {
+        expect(event!.args.id).to.equal(BigInt(index + 1));
+        expect(event!.args.owner).to.equal(owners[index]);
+        expect(event!.args.dataHash).to.equal(hashes[index]);
+      });
+
+      for (let index = 0; index < hashes.length; index++) {
+        const cert = await certificateRegistry.getCertificate(index + 1);
+        expect(cert.owner).to.equal(owners[index]);
+        expect(cert.dataHash).to.equal(hashes[index]);
+      }
+      expect(await certificateRegistry.nextId()).to.equal(4n);
+    });
+
+    it("should continue IDs after single issuances", async function () {
+      await certificateRegistry.issueCertificate(await user1.getAddress(), "single");
+      await certificateRegistry.issueCertificates([await user2.getAddress()], ["batched"]);
+
+      const cert = await certificateRegistry.getCertificate(2);
+      expect(cert.dataHash).to.equal("batched");
+    });
+
+    it("should revert on mismatched input lengths", async function () {
+      await expect(
+        certificateRegistry.issueCertificates([await user1.getAddress()], ["h1", "h2"])
+      ).to.be.revertedWith("Owners and hashes length mismatch");
+    });
+
+    it("should revert on an empty batch", async function () {
+      await expect(certificateRegistry.issueCertificates([], [])).to.be.revertedWith("Batch is empty");
+    });
+
+    it("should revert if non-admin tries to batch issue", async function () {
+      await expect(
+        // @ts-ignore
+        certificateRegistry.connect(user1).issueCertificates([await user2.getAddress()], ["hash"])
+      ).to.be.revertedWith("Only admin or issuers can perform this action");
+    });
+  });
+
+  describe("Issuers", function () {
+    it("should allow an authorized issuer to issue certificates", async function () {
+      await expect(certificateRegistry.setIssuer(await user1.getAddress(), true))
+        .to.emit(certificateRegistry, "IssuerUpdated")
+        .withArgs(await user1.getAddress(), true);
+
+      // @ts-ignore
+      await certificateRegistry.connect(user1).issueCertificates([await user2.getAddress()], ["hash"]);
+
+      const cert = await certificateRegistry.getCertificate(1);
+      expect(cert.issuer).to.equal(await user1.getAddress());
+    });
+
+    it("should stop a revoked issuer from issuing certificates", async function () {
+      await certificateRegistry.setIssuer(await user1.getAddress(), true);
+      await certificateRegistry.setIssuer(await user1.getAddress(), false);
+
+      await expect(
+        // @ts-ignore
+        certificateRegistry.connect(user1).issueCertificate(await user2.getAddress(), "hash")
+      ).to.be.revertedWith("Only admin or issuers can perform this action");
+    });
+
+    it("should not allow issuers to revoke certificates", async function () {
+      await certificateRegistry.setIssuer(await user1.getAddress(), true);
+      await certificateRegistry.issueCertificate(await user2.getAddress(), "hash");
+
+      // @ts-ignore
+      await expect(certificateRegistry.connect(user1).revokeCertificate(1))
+        .to.be.revertedWith("Only admin can perform this action");
+    });
+
+    it("should not allow non-admin to manage issuers", async function () {
+      await expect(
+        // @ts-ignore
+        certificateRegistry.connect(user1).setIssuer(await user1.getAddress(), true)
       ).to.be.revertedWith("Only admin can perform this action");
     });
   });
@@ -98,11 +191,153 @@ describe("CertificateRegistry", function () {
     });
   });
 
+  describe("Batch Revoking Certificates", function () {
+    beforeEach(async function () {
+      await certificateRegistry.issueCertificates(
+        [await user1.getAddress(), await user1.getAddress(), await user2.getAddress()],
+        ["h1", "h2", "h3"]
+      );
+    });
+
+    it("should revoke every certificate in the batch", async function () {
+      const tx = await certificateRegistry.revokeCertificates([1, 3]);
+      const receipt = await tx.wait();
+
+      const events = receipt!.logs
+        .map((log) => certificateRegistry.interface.parseLog(log))
+        .filter((ev) => ev?.name === "CertificateRevoked");
+
+      expect(events.map((event) => event!.args.id)).to.deep.equal([1n, 3n]);
+      expect((await certificateRegistry.getCertificate(1)).revoked).to.equal(true);
+      expect((await certificateRegistry.getCertificate(2)).revoked).to.equal(false);
+      expect((await certificateRegistry.getCertificate(3)).revoked).to.equal(true);
+    });
+
+    it("should skip already revoked and unknown certificates", async function () {
+      await certificateRegistry.revokeCertificate(2);
+
+      expect(await certificateRegistry.revokeCertificates.staticCall([1, 2, 999])).to.equal(1n);
+
+      const tx = await certificateRegistry.revokeCertificates([1, 2, 999]);
+      const receipt = await tx.wait();
+      const events = receipt!.logs
+        .map((log) => certificateRegistry.interface.parseLog(log))
+        .filter((ev) => ev?.name === "CertificateRevoked");
+
+      expect(events.map((event) => event!.args.id)).to.deep.equal([1n]);
+    });
+
+    it("should be safe to send the same batch again", async function () {
+      await certificateRegistry.revokeCertificates([1, 2]);
+
+      await expect(certificateRegistry.revokeCertificates([1, 2, 3]))
+        .to.emit(certificateRegistry, "CertificateRevoked")
+        .withArgs(3n, anyUint());
+      expect(await certificateRegistry.revokeCertificates.staticCall([1, 2, 3])).to.equal(0n);
+    });
+
+    it("should revert on an empty batch", async function () {
+      await expect(certificateRegistry.revokeCertificates([])).to.be.revertedWith("Batch is empty");
+    });
+
+    it("should not allow non-admin to batch revoke", async function () {
+      await certificateRegistry.setIssuer(await user1.getAddress(), true);
+
+      // @ts-ignore
+      await expect(certificateRegistry.connect(user1).revokeCertificates([1]))
+        .to.be.revertedWith("Only admin can perform this action");
+    });
+  });
+
   describe("Reading Certificates", function () {
     it("should revert if certificate does not exist", async function () {
       await expect(certificateRegistry.getCertificate(123))
         .to.be.revertedWith("Certificate does not exist");
     });
+
+    it("should read a page of consecutive certificates", async function () {
+      await certificateRegistry.issueCertificates(
+        [await user1.getAddress(), await user2.getAddress(), await user1.getAddress()],
+        ["h1", "h2", "h3"]
+      );
+      await certificateRegistry.revokeCertificate(2);
+
+      const page = await certificateRegistry.getCertificates(2, 2);
+      expect(page.length).to.equal(2);
+      expect(page[0].id).to.equal(2n);
+      expect(page[0].owner).to.equal(await user2.getAddress());
+      expect(page[0].dataHash).to.equal("h2");
+      expect(page[0].revoked).to.equal(true);
+      expect(page[1].id).to.equal(3n);
+      expect(page[1].revoked).to.equal(false);
+    });
+
+    it("should truncate pages at the last issued certificate", async function () {
+      await certificateRegistry.issueCertificates([await user1.getAddress(), await user1.getAddress()], ["h1", "h2"]);
+
+      expect((await certificateRegistry.getCertificates(0, 100)).map((cert: any) => cert.id)).to.deep.equal([1n, 2n]);
+      expect((await certificateRegistry.getCertificates(2, 100)).length).to.equal(1);
+      expect((await certificateRegistry.getCertificates(3, 100)).length).to.equal(0);
+      expect((await certificateRegistry.getCertificates(1, ethers.MaxUint256)).length).to.equal(2);
+    });
+  });
+
+  describe("Anchoring Merkle Roots", function () {
+    const certificateHashes = ["a1", "b2", "c3", "d4", "e5"].map((seed) => ethers.id(seed));
+
+    it("should anchor a root and store its epoch", async function () {
+      const { root } = buildTree(certificateHashes);
+
+      await expect(certificateRegistry.anchorRoot(root, certificateHashes.length))
+        .to.emit(certificateRegistry, "RootAnchored")
+        .withArgs(1n, root, await owner.getAddress(), 5n, anyUint());
+
+      const anchor = await certificateRegistry.getAnchor(1);
+      expect(anchor.root).to.equal(root);
+      expect(anchor.leafCount).to.equal(5n);
+      expect(anchor.issuer).to.equal(await owner.getAddress());
+      expect(await certificateRegistry.epochOfRoot(root)).to.equal(1n);
+      expect(await certificateRegistry.nextEpochId()).to.equal(2n);
+      expect(await certificateRegistry.nextId()).to.equal(1n);
+    });
+
+    it("should verify the inclusion proof of every certificate of an epoch", async function () {
+      const { root, proofs } = buildTree(certificateHashes);
+      await certificateRegistry.anchorRoot(root, certificateHashes.length);
+
+      for (let i = 0; i < certificateHashes.length; i++) {
+        expect(await certificateRegistry.verifyInclusion(1, certificateHashes[i], proofs[i])).to.equal(true);
+      }
+      expect(await certificateRegistry.verifyInclusion(1, ethers.id("other"), proofs[0])).to.equal(false);
+      expect(await certificateRegistry.verifyInclusion(1, certificateHashes[0], proofs[1])).to.equal(false);
+      expect(await certificateRegistry.verifyInclusion(2, certificateHashes[0], proofs[0])).to.equal(false);
+    });
+
+    it("should verify a single certificate epoch with an empty proof", async function () {
+      const { root } = buildTree([certificateHashes[0]]);
+      await certificateRegistry.anchorRoot(root, 1);
+
+      expect(await certificateRegistry.verifyInclusion(1, certificateHashes[0], [])).to.equal(true);
+    });
+
+    it("should reject duplicate, empty and zero roots", async function () {
+      const { root } = buildTree(certificateHashes);
+      await certificateRegistry.anchorRoot(root, certificateHashes.length);
+
+      await expect(certificateRegistry.anchorRoot(root, 5)).to.be.revertedWith("Root already anchored");
+      await expect(certificateRegistry.anchorRoot(ethers.ZeroHash, 5)).to.be.revertedWith("Invalid root");
+      await expect(certificateRegistry.anchorRoot(ethers.id("root"), 0)).to.be.revertedWith("Empty epoch");
+      await expect(certificateRegistry.getAnchor(2)).to.be.revertedWith("Epoch does not exist");
+    });
+
+    it("should only allow the admin or issuers to anchor roots", async function () {
+      await expect(certificateRegistry.connect(user1).anchorRoot(ethers.id("root"), 1))
+        .to.be.revertedWith("Only admin or issuers can perform this action");
+
+      await certificateRegistry.setIssuer(await user1.getAddress(), true);
+      await expect(certificateRegistry.connect(user1).anchorRoot(ethers.id("root"), 1))
+        .to.emit(certificateRegistry, "RootAnchored");
+    });
   });
 
   describe("Events", function () {
@@ -120,6 +355,39 @@ describe("CertificateRegistry", function () {
   });
 });
 
+// Builds the Merkle tree anchored by the backend: keccak256 leaves, sorted pairs, odd nodes promoted
+function buildTree(certificateHashes: string[]) {
+  let level = certificateHashes.map((hash) => ethers.keccak256(hash));
+  const levels = [level];
+  while (level.length > 1) {
+    const parents: string[] = [];
+    for (let i = 0; i < level.length; i += 2) {
+      if (i + 1 === level.length) {
+        parents.push(level[i]);
+      } else {
+        const [left, right] = BigInt(level[i]) < BigInt(level[i + 1]) ? [level[i], level[i + 1]] : [level[i + 1], level[i]];
+        parents.push(ethers.keccak256(ethers.concat([left, right])));
+      }
+    }
+    level = parents;
+    levels.push(level);
+  }
+
+  const proofs = certificateHashes.map((_, leafIndex) => {
+    const proof: string[] = [];
+    let index = leafIndex;
+    for (const nodes of levels.slice(0, -1)) {
+      const sibling = index ^ 1;
+      if (sibling < nodes.length) {
+        proof.push(nodes[sibling]);
+      }
+      index = Math.floor(index / 2);
+    }
+    return proof;
+  });
+  return { root: level[0], proofs };
+}
+
 // Helper for timestamp matching (Hardhat's `anyValue` doesn't support uint)
 function anyUint() {
   return (value: any) => {
@@ -0,0 +1,208 @@
+import { expect } from "chai";
+import { ethers } from "hardhat";
+import { Contract, Signer } from "ethers";
+
+describe("CertificateRegistryV2", function () {
+  let certificateRegistry: Contract;
+  let owner: Signer;
+  let user1: Signer;
+  let user2: Signer;
+
+  const h1 = ethers.id("h1");
+  const h2 = ethers.id("h2");
+  const h3 = ethers.id("h3");
+
+  beforeEach(async function () {
+    [owner, user1, user2] = await ethers.getSigners();
+    const CertificateRegistryFactory = await ethers.getContractFactory("CertificateRegistryV2", owner);
+    certificateRegistry = await CertificateRegistryFactory.deploy();
+    await certificateRegistry.waitForDeployment();
+  });
+
+  describe("Issuing Certificates", function () {
+    it("should issue a certificate and index its hash", async function () {
+      const tx = await certificateRegistry.issueCertificate(user1.getAddress(), h1);
+      const receipt = await tx.wait();
+
+      const event = receipt!.logs
+        .map((log) => certificateRegistry.interface.parseLog(log))
+        .find((ev) => ev?.name === "CertificateIssued");
+
+      expect(event!.args.id).to.equal(1n);
+      expect(event!.args.dataHash).to.equal(h1);
+      expect(event!.args.owner).to.equal(await user1.getAddress());
+      expect(event!.args.issuer).to.equal(await owner.getAddress());
+
+      const cert = await certificateRegistry.getCertificate(1);
+      expect(cert.id).to.equal(1n);
+      expect(cert.owner).to.equal(await user1.getAddress());
+      expect(cert.issuer).to.equal(await owner.getAddress());
+      expect(cert.dataHash).to.equal(h1);
+      expect(cert.revoked).to.equal(false);
+
+      const byHash = await certificateRegistry.getByHash(h1);
+      expect(byHash.id).to.equal(1n);
+      expect(byHash.timestamp).to.equal(cert.timestamp);
+    });
+
+    it("should issue a batch with sequential IDs", async function () {
+      const owners = [await user1.getAddress(), await user2.getAddress(), await user1.getAddress()];
+      await certificateRegistry.issueCertificates(owners, [h1, h2, h3]);
+
+      expect((await certificateRegistry.getByHash(h2)).id).to.equal(2n);
+      expect((await certificateRegistry.getByHash(h3)).owner).to.equal(owners[2]);
+      expect(await certificateRegistry.nextId()).to.equal(4n);
+    });
+
+    it("should filter CertificateIssued logs by data hash", async function () {
+      await certificateRegistry.issueCertificates([await user1.getAddress(), await user2.getAddress()], [h1, h2]);
+
+      const events = await certificateRegistry.queryFilter(certificateRegistry.filters.CertificateIssued(null, h2));
+      expect(events.length).to.equal(1);
+      // @ts-ignore
+      expect(events[0].args.id).to.equal(2n);
+    });
+
+    it("should reject zero and already issued hashes", async function () {
+      await certificateRegistry.issueCertificate(await user1.getAddress(), h1);
+
+      await expect(certificateRegistry.issueCertificate(await user1.getAddress(), h1))
+        .to.be.revertedWith("Certificate hash already issued");
+      await expect(certificateRegistry.issueCertificate(await user1.getAddress(), ethers.ZeroHash))
+        .to.be.revertedWith("Invalid data hash");
+      await expect(certificateRegistry.issueCertificates([await user1.getAddress()], [ethers.ZeroHash]))
+        .to.be.revertedWith("Invalid data hash");
+    });
+
+    it("should skip already issued hashes in a batch and report their IDs", async function () {
+      await certificateRegistry.issueCertificate(await user1.getAddress(), h1);
+      const owners = [await user1.getAddress(), await user2.getAddress(), await user2.getAddress()];
+
+      const ids = await certificateRegistry.issueCertificates.staticCall(owners, [h1, h2, h2]);
+      expect(ids).to.deep.equal([1n, 2n, 2n]);
+
+      const tx = await certificateRegistry.issueCertificates(owners, [h1, h2, h2]);
+      const events = (await tx.wait())!.logs.map((log: any) => certificateRegistry.interface.parseLog(log));
+      expect(events.map((ev: any) => [ev.name, ev.args.id, ev.args.dataHash])).to.deep.equal([
+        ["CertificateAlreadyIssued", 1n, h1],
+        ["CertificateIssued", 2n, h2],
+        ["CertificateAlreadyIssued", 2n, h2],
+      ]);
+      expect((await certificateRegistry.getByHash(h1)).owner).to.equal(await user1.getAddress());
+      expect(await certificateRegistry.nextId()).to.equal(3n);
+    });
+
+    it("should revert on mismatched input lengths and empty batches", async function () {
+      await expect(certificateRegistry.issueCertificates([await user1.getAddress()], [h1, h2]))
+        .to.be.revertedWith("Owners and hashes length mismatch");
+      await expect(certificateRegistry.issueCertificates([], [])).to.be.revertedWith("Batch is empty");
+    });
+
+    it("should only allow the admin or issuers to issue", async function () {
+      await expect(
+        // @ts-ignore
+        certificateRegistry.connect(user1).issueCertificate(await user2.getAddress(), h1)
+      ).to.be.revertedWith("Only admin or issuers can perform this action");
+
+      await certificateRegistry.setIssuer(await user1.getAddress(), true);
+      // @ts-ignore
+      await certificateRegistry.connect(user1).issueCertificate(await user2.getAddress(), h1);
+      expect((await certificateRegistry.getByHash(h1)).issuer).to.equal(await user1.getAddress());
+    });
+  });
+
+  describe("Reading Certificates", function () {
+    it("should revert on unknown IDs and hashes", async function () {
+      await expect(certificateRegistry.getCertificate(1)).to.be.revertedWith("Certificate does not exist");
+      await expect(certificateRegistry.getByHash(h1)).to.be.revertedWith("Certificate does not exist");
+    });
+
+    it("should read a page of consecutive certificates", async function () {
+      await certificateRegistry.issueCertificates(
+        [await user1.getAddress(), await user2.getAddress(), await user1.getAddress()],
+        [h1, h2, h3]
+      );
+      await certificateRegistry.revokeCertificate(2);
+
+      const page = await certificateRegistry.getCertificates(0, 100);
+      expect(page.map((cert: any) => cert.id)).to.deep.equal([1n, 2n, 3n]);
+      expect(page[1].dataHash).to.equal(h2);
+      expect(page[1].revoked).to.equal(true);
+      expect((await certificateRegistry.getCertificates(4, 100)).length).to.equal(0);
+    });
+  });
+
+  describe("Revoking Certificates", function () {
+    beforeEach(async function () {
+      await certificateRegistry.issueCertificates([await user1.getAddress(), await user2.getAddress()], [h1, h2]);
+    });
+
+    it("should revoke a certificate and keep its hash indexed", async function () {
+      await expect(certificateRegistry.revokeCertificate(1)).to.emit(certificateRegistry, "CertificateRevoked");
+
+      expect((await certificateRegistry.getByHash(h1)).revoked).to.equal(true);
+      await expect(certificateRegistry.revokeCertificate(1)).to.be.revertedWith("Certificate already revoked");
+      await expect(certificateRegistry.revokeCertificate(9)).to.be.revertedWith("Certificate does not exist");
+    });
+
+    it("should skip already revoked and unknown certificates in batches", async function () {
+      await certificateRegistry.revokeCertificate(1);
+
+      const receipt = await (await certificateRegistry.revokeCertificates([1, 2, 9])).wait();
+      const revoked = receipt!.logs
+        .map((log) => certificateRegistry.interface.parseLog(log))
+        .filter((ev) => ev?.name === "CertificateRevoked")
+        .map((ev) => ev!.args.id);
+      expect(revoked).to.deep.equal([2n]);
+    });
+
+    it("should not allow issuers to revoke certificates", async function () {
+      await certificateRegistry.setIssuer(await user1.getAddress(), true);
+      // @ts-ignore
+      await expect(certificateRegistry.connect(user1).revokeCertificates([1]))
+        .to.be.revertedWith("Only admin can perform this action");
+    });
+  });
+
+  describe("Anchoring Merkle Roots", function () {
+    it("should anchor roots and verify inclusion like the first version", async function () {
+      const [left, right] = [ethers.keccak256(h1), ethers.keccak256(h2)].sort((a, b) => (BigInt(a) < BigInt(b) ? -1 : 1));
+      const root = ethers.keccak256(ethers.concat([left, right]));
+
+      await expect(certificateRegistry.anchorRoot(root, 2)).to.emit(certificateRegistry, "RootAnchored");
+      expect(await certificateRegistry.verifyInclusion(1, h1, [ethers.keccak256(h2)])).to.equal(true);
+      expect(await certificateRegistry.verifyInclusion(1, h3, [ethers.keccak256(h2)])).to.equal(false);
+    });
+  });
+
+  describe("Gas", function () {
+    const BATCH_SIZE = 25;
+
+    // The backend sends the canonical hash: 64 hex characters without the 0x prefix to v1, 32 bytes to v2
+    const hashes = Array.from({ length: BATCH_SIZE + 1 }, (_, index) => ethers.id(`certificate-${index}`));
+
+    async function gasPerCertificate(registry: Contract, toHash: (hash: string) => string) {
+      const holder = await user1.getAddress();
+      const single = await (await registry.issueCertificate(holder, toHash(hashes[0]))).wait();
+      const batched = await (
+        await registry.issueCertificates(Array(BATCH_SIZE).fill(holder), hashes.slice(1).map(toHash))
+      ).wait();
+      return { single: single!.gasUsed, batched: batched!.gasUsed / BigInt(BATCH_SIZE) };
+    }
+
+    it("should issue certificates for less gas than the first version", async function () {
+      const V1Factory = await ethers.getContractFactory("CertificateRegistry", owner);
+      const v1 = await V1Factory.deploy();
+      await v1.waitForDeployment();
+
+      const v1Gas = await gasPerCertificate(v1 as unknown as Contract, (hash) => hash.slice(2));
+      const v2Gas = await gasPerCertificate(certificateRegistry, (hash) => hash);
+
+      console.log(`      gas/cert single:     v1=${v1Gas.single} v2=${v2Gas.single}`);
+      console.log(`      gas/cert batch=${BATCH_SIZE}: v1=${v1Gas.batched} v2=${v2Gas.batched}`);
+
+      expect(v2Gas.single < v1Gas.single).to.equal(true);
+      expect(v2Gas.batched < v1Gas.batched).to.equal(true);
+    });
+  });
+});
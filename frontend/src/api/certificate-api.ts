@@ -66,6 +66,7 @@ export interface RegisterPDFHashResponse {
 
 export interface ValidateCertificateResponse {
     is_valid: boolean;
+    invalid_reason: "revoked" | "not_issued" | "expired" | "proof_mismatch" | null;
     certificate: Certificate;
 }
 